@@ -0,0 +1,53 @@
+import numpy as np
+class Adjacency(object):
+
+    # Compressed sparse row adjacency: the sorted neighbours of Keys[i] are
+    # Values[Offsets[i]:Offsets[i+1]]. Keys are sorted node or element IDs,
+    # Values node or element IDs. Built by the Topology kernels and cached
+    # by Mesh.getNodeElems, getElemNeighbours and getNodeNeighbours.
+
+    def __init__(self, Keys, Offsets, Values):
+        self.Keys=Keys
+        self.Offsets=Offsets
+        self.Values=Values
+
+    def __len__(self):
+        return len(self.Keys)
+
+    def __contains__(self, key):
+        return self.getPos(key)>=0
+
+    def getKeys(self):
+        return self.Keys
+
+    def getOffsets(self):
+        return self.Offsets
+
+    def getValues(self):
+        return self.Values
+
+    def getCounts(self):
+        # Number of neighbours of every key
+        return np.diff(self.Offsets)
+
+    def getPos(self, key):
+        pos=int(np.searchsorted(self.Keys, key))
+        if pos==len(self.Keys) or self.Keys[pos]!=key:
+            return -1
+        return pos
+
+    def getRow(self, key):
+        # Neighbours of key, empty for unknown keys
+        pos=self.getPos(key)
+        if pos<0:
+            return self.Values[0:0]
+        return self.Values[self.Offsets[pos]:self.Offsets[pos+1]]
+
+    def getRows(self, keys):
+        # Union of the neighbours of keys (sorted, unique)
+        keys=np.asarray(keys, dtype=np.int64).ravel()
+        pos=np.minimum(np.searchsorted(self.Keys, keys), max(len(self.Keys)-1, 0))
+        pos=pos[(len(self.Keys)>0)&(self.Keys[pos]==keys)]
+        counts=self.Offsets[pos+1]-self.Offsets[pos]
+        starts=np.repeat(self.Offsets[pos]-np.cumsum(counts)+counts, counts)
+        return np.unique(self.Values[starts+np.arange(counts.sum())])
@@ -0,0 +1,130 @@
+import numpy as np
+class BatchCollector(object):
+
+    # Stands in for the Mesh in the section parsers of the streaming reader.
+    # The add methods of Mesh collect the parsed entities, getBatches returns
+    # them as typed batches (kind, dictionary of arrays) and empties the
+    # collector:
+    #   "Nodes": NodeIDs, Coords
+    #   "Shells": ElemIDs, PartIDs, Conn (n, 4), NumNodes, Thickness
+    #             (elemental thickness of the shell, 0.0 if not defined)
+    #   "NodalThickness": NodalThicknessIDs, NodalThickness
+    #   "ElementalThickness": ElementalThicknessIDs, ElementalThickness
+    #             (only thicknesses which do not belong to the collected shells)
+    #   "Parts": PartIDs, Titles, PropIDs, MatIDs
+    #   "Materials": MatIDs, Rho, E
+    #   "Properties": PropIDs, Thickness
+
+    def __init__(self, _Meshformat):
+        self.Meshformat=_Meshformat
+        self.clear()
+
+    def clear(self):
+        self.Nodes=[]
+        self.Elems=[]
+        self.NodeRows=[]
+        self.ElemRows=[]
+        self.Nodalthickness=[]
+        self.Elementalthickness=[]
+        self.Parts=[]
+        self.Mats=[]
+        self.Props=[]
+
+    def getMeshFormat(self):
+        return self.Meshformat
+
+    def addNode(self, NodeID, x, y, z):
+        self.NodeRows.append((NodeID, x, y, z))
+
+    def addElem(self, ElemID, PartID, *Nodes):
+        if len(Nodes)==3:
+            self.ElemRows.append((ElemID, PartID, Nodes[0], Nodes[1], Nodes[2], Nodes[2], 3))
+        else:
+            self.ElemRows.append((ElemID, PartID, Nodes[0], Nodes[1], Nodes[2], Nodes[3], 4))
+
+    def addNodes(self, NodeIDs, Coords):
+        self.Nodes.append((np.asarray(NodeIDs, dtype=np.int64), np.asarray(Coords, dtype=np.float64)))
+
+    def addElems(self, ElemIDs, PartIDs, Conn, NumNodes=None):
+        Conn=np.asarray(Conn, dtype=np.int64)
+        if NumNodes is None:
+            NumNodes=Conn.shape[1]
+        if Conn.shape[1]==3:
+            Conn=Conn[:, [0, 1, 2, 2]]
+        NumNodes=np.zeros(len(Conn), dtype=np.int8)+NumNodes
+        self.Elems.append((np.asarray(ElemIDs, dtype=np.int64), np.zeros(len(Conn), dtype=np.int64)+PartIDs, Conn, NumNodes))
+
+    def addNodalThickness(self, NodeID, thickness):
+        self.addNodalThicknesses([NodeID], [thickness])
+
+    def addNodalThicknesses(self, NodeIDs, thickness):
+        self.Nodalthickness.append((np.asarray(NodeIDs, dtype=np.int64), np.asarray(thickness, dtype=np.float64)))
+
+    def addElementalThickness(self, ElemID, thickness):
+        self.addElementalThicknesses([ElemID], [thickness])
+
+    def addElementalThicknesses(self, ElemIDs, thickness):
+        self.Elementalthickness.append((np.asarray(ElemIDs, dtype=np.int64), np.asarray(thickness, dtype=np.float64)))
+
+    def addPart(self, PartID, title, PropID, MatID):
+        self.Parts.append((PartID, title, PropID, MatID))
+
+    def addMat(self, MatID, Rho, E):
+        self.Mats.append((MatID, Rho, E))
+
+    def addProp(self, PropID, Thickness):
+        self.Props.append((PropID, Thickness))
+
+    def flushRows(self):
+        # Moves the entities added one by one into array blocks
+        if len(self.NodeRows)>0:
+            rows=np.array(self.NodeRows, dtype=np.float64).reshape(-1, 4)
+            self.Nodes.append((np.array([row[0] for row in self.NodeRows], dtype=np.int64), rows[:, 1:]))
+        if len(self.ElemRows)>0:
+            rows=np.array(self.ElemRows, dtype=np.int64).reshape(-1, 7)
+            self.Elems.append((rows[:, 0], rows[:, 1], rows[:, 2:6], rows[:, 6].astype(np.int8)))
+        self.NodeRows=[]
+        self.ElemRows=[]
+
+    def getElementalThickness(self):
+        # Sorted element IDs and values of the elemental thicknesses, the
+        # last value of an element added wins
+        if len(self.Elementalthickness)==0:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float64)
+        ElemIDs=np.concatenate([block[0] for block in self.Elementalthickness])[::-1]
+        values=np.concatenate([block[1] for block in self.Elementalthickness])[::-1]
+        ElemIDs, last = np.unique(ElemIDs, return_index=True)
+        return ElemIDs, values[last]
+
+    def getBatches(self):
+        self.flushRows()
+        batches=[]
+        for NodeIDs, Coords in self.Nodes:
+            batches.append(("Nodes", {'NodeIDs': NodeIDs, 'Coords': Coords}))
+        ThickIDs, values = self.getElementalThickness()
+        used=np.zeros(len(ThickIDs), dtype=bool)
+        for ElemIDs, PartIDs, Conn, NumNodes in self.Elems:
+            thick=np.zeros(len(ElemIDs), dtype=np.float64)
+            if len(ThickIDs)>0:
+                # Each thickness goes to the first shell batch with its element
+                pos=np.minimum(np.searchsorted(ThickIDs, ElemIDs), len(ThickIDs)-1)
+                found=(ThickIDs[pos]==ElemIDs)&~used[pos]
+                thick[found]=values[pos[found]]
+                used[pos[found]]=True
+            batches.append(("Shells", {'ElemIDs': ElemIDs, 'PartIDs': PartIDs, 'Conn': Conn, 'NumNodes': NumNodes, 'Thickness': thick}))
+        for NodeIDs, thick in self.Nodalthickness:
+            batches.append(("NodalThickness", {'NodalThicknessIDs': NodeIDs, 'NodalThickness': thick}))
+        if not used.all():
+            batches.append(("ElementalThickness", {'ElementalThicknessIDs': ThickIDs[~used], 'ElementalThickness': values[~used]}))
+        if len(self.Parts)>0:
+            batches.append(("Parts", {'PartIDs': np.array([part[0] for part in self.Parts]), 'Titles': [part[1] for part in self.Parts],
+                                      'PropIDs': np.array([part[2] for part in self.Parts]), 'MatIDs': np.array([part[3] for part in self.Parts])}))
+        if len(self.Mats)>0:
+            batches.append(("Materials", {'MatIDs': np.array([mat[0] for mat in self.Mats]),
+                                          'Rho': np.array([mat[1] for mat in self.Mats], dtype=np.float64),
+                                          'E': np.array([mat[2] for mat in self.Mats], dtype=np.float64)}))
+        if len(self.Props)>0:
+            batches.append(("Properties", {'PropIDs': np.array([prop[0] for prop in self.Props]),
+                                           'Thickness': np.array([prop[1] for prop in self.Props], dtype=np.float64)}))
+        self.clear()
+        return batches
@@ -0,0 +1,192 @@
+from KeywordIndex import KeywordIndex as KeywordIndex
+import FixedWidth as FixedWidth
+import numpy as np
+from datetime import datetime
+from getpass import getuser
+
+# Block based writer of LS-Dyna decks, same output as the line by line
+# MeshReaders.writeDynaMeshLines except that keywords are matched case
+# insensitively like the readers do (a "*node" block is written with the
+# coordinates of the Mesh, the line writer copies it unchanged).
+# The source deck (Mesh.Meshfile) is gone through block by block with its
+# KeywordIndex. The data lines of *NODE blocks are formatted from the node
+# arrays in bulk, *ELEMENT_SHELL lines of parts in NUTProps are moved to
+# *ELEMENT_SHELL_THICKNESS blocks with their nodal thicknesses (part
+# membership is checked for whole blocks with np.in1d), everything else is
+# copied unchanged. Output is collected and written in large chunks.
+
+BUFSIZE=1<<24 # Bytes collected before they are written
+NODEFORMAT="%8i%16.10f%16.10f%16.10f\n"
+THICKFORMAT="%16.8f%16.8f%16.8f%16.8f\n"
+
+class Output(object):
+
+    # Buffered output file, writes once BUFSIZE bytes are collected
+
+    def __init__(self, file):
+        self.file=open(file, "wb")
+        self.pieces=[]
+        self.size=0
+
+    def write(self, text):
+        self.pieces.append(text)
+        self.size=self.size+len(text)
+        if self.size>=BUFSIZE:
+            self.flush()
+
+    def flush(self):
+        self.file.write("".join(self.pieces))
+        self.pieces=[]
+        self.size=0
+
+    def close(self):
+        self.flush()
+        self.file.close()
+
+def sourceIndex(_Mesh, keychar, commentchar):
+    # KeywordIndex of the source deck, the one of the Mesh if it is up to date
+    index=_Mesh.getKeywordIndex()
+    if index is None or index.file!=_Mesh.getMeshFile() or index.keychar!=keychar:
+        index=KeywordIndex(_Mesh.getMeshFile(), keychar, commentchar).build()
+    return index
+
+def blockLines(data, start, end):
+    # Line offsets of the byte range [start, end): starts, ends (without line
+    # break) and the start of the next line, and a mask of the data lines
+    # (not empty, neither '$' nor '*' in the line like the line writer checks)
+    starts, ends = FixedWidth.lineOffsets(data[start:end])
+    starts=starts+start
+    ends=ends+start
+    nexts=np.append(starts[1:], end)
+    marks=np.flatnonzero((data[start:end]==ord('$'))|(data[start:end]==ord('*')))+start
+    marked=np.searchsorted(marks, ends)>np.searchsorted(marks, starts)
+    return starts, ends, nexts, (ends>starts)&~marked
+
+def formatRows(fmt, rows):
+    return (fmt*len(rows)) % tuple(rows.ravel().tolist())
+
+def sortedTable(table):
+    # Sorted ID and value arrays of an {ID: value} dictionary
+    IDs=np.array(table.keys(), dtype=np.int64)
+    values=np.array(table.values(), dtype=np.float64)
+    order=np.argsort(IDs)
+    return IDs[order], values[order]
+
+def lookup(IDs, values, keys, default=None):
+    # values of keys, default (KeyError if None) for missing keys
+    if len(IDs)==0:
+        found=np.zeros(keys.shape, dtype=bool)
+    else:
+        pos=np.minimum(np.searchsorted(IDs, keys), len(IDs)-1)
+        found=IDs[pos]==keys
+        if found.all():
+            return values[pos]
+    if default is None:
+        raise KeyError(int(keys[~found][0]))
+    if len(IDs)==0:
+        return np.full(keys.shape, default, dtype=np.float64)
+    return np.where(found, values[pos], default)
+
+def runs(mask):
+    # (start, end) of the runs of equal values in mask
+    bounds=np.concatenate(([0], np.flatnonzero(np.diff(mask))+1, [len(mask)]))
+    return zip(bounds[:-1].tolist(), bounds[1:].tolist())
+
+def writeNodes(out, Nodes, data, start, end):
+    # Data lines of a *NODE block with the coordinates of the Mesh
+    starts, ends, nexts, isdata = blockLines(data, start, end)
+    for i in xrange(0, len(starts), FixedWidth.CHUNK):
+        d=isdata[i:i+FixedWidth.CHUNK]
+        for a, b in runs(d.astype(np.int8)):
+            if d[a]:
+                writeNodeRows(out, Nodes, data, starts[i+a:i+b], ends[i+a:i+b])
+            else:
+                out.write(data[starts[i+a]:nexts[i+b-1]].tostring())
+
+def writeNodeRows(out, Nodes, data, starts, ends):
+    NodeIDs=FixedWidth.parseInts(FixedWidth.charMatrix(data, starts, ends, 8))
+    NodeRows=Nodes.getRows(NodeIDs)
+    if (NodeRows<0).any():
+        raise KeyError(int(NodeIDs[NodeRows<0][0]))
+    out.write(formatRows(NODEFORMAT, np.column_stack((NodeIDs, Nodes.getCoords()[NodeRows]))))
+
+def writeElementShell(out, NUTParts, Thickness, line, data, start, end):
+    # Keyword line, then the element lines, switching between *ELEMENT_SHELL
+    # and *ELEMENT_SHELL_THICKNESS (with nodal thickness card) by part
+    out.write(line)
+    starts, ends, nexts, isdata = blockLines(data, start, end)
+    rows=np.flatnonzero(isdata)
+    chars=FixedWidth.charMatrix(data, starts[rows], ends[rows], 48)
+    nut=np.zeros(len(starts), dtype=bool)
+    nut[rows]=np.in1d(FixedWidth.parseInts(chars[:, 8:16]), NUTParts)
+    Conn=np.zeros((len(starts), 4), dtype=np.int64)
+    if nut.any():
+        chars=chars[nut[rows]]
+        Conn[nut]=np.column_stack([FixedWidth.parseInts(chars[:, i:i+8]) for i in xrange(16, 48, 8)])
+    # Segments of lines in which all data lines belong to the same keyword,
+    # other lines stay with the data line before them (lines before the
+    # first data line with the *ELEMENT_SHELL keyword line)
+    state=np.where(isdata, nut, -1)
+    known=np.flatnonzero(state>=0)
+    current=np.zeros(len(state), dtype=np.int64)
+    previous=np.searchsorted(known, np.arange(len(state)), side='right')-1
+    current[previous>=0]=state[known][previous[previous>=0]]
+    thick=False
+    for a, b in runs(current):
+        if current[a]==1:
+            if not thick:
+                out.write("*ELEMENT_SHELL_THICKNESS\n")
+                thick=True
+            writeThicknessRows(out, Thickness, data, starts[a:b], nexts[a:b], isdata[a:b], Conn[a:b])
+        else:
+            if thick and isdata[a:b].any():
+                out.write("*ELEMENT_SHELL\n")
+                thick=False
+            out.write(data[starts[a]:nexts[b-1]].tostring())
+
+def writeThicknessRows(out, Thickness, data, starts, nexts, isdata, Conn):
+    # Lines unchanged, element lines followed by their nodal thickness card
+    for i in xrange(0, len(starts), FixedWidth.CHUNK):
+        s=starts[i:i+FixedWidth.CHUNK]
+        n=nexts[i:i+FixedWidth.CHUNK]
+        d=isdata[i:i+FixedWidth.CHUNK]
+        thick=lookup(Thickness[0], Thickness[1], Conn[i:i+FixedWidth.CHUNK][d], 0.0).tolist()
+        values=[]
+        k=0
+        for j in xrange(len(s)):
+            values.append(data[s[j]:n[j]].tostring())
+            if d[j]:
+                values.extend(thick[k])
+                k=k+1
+        fmt="".join(np.where(d, "%s"+THICKFORMAT, "%s").tolist())
+        out.write(fmt % tuple(values))
+
+def writeDynaMesh(_Mesh, file):
+    index=sourceIndex(_Mesh, "*", "$")
+    data=index.map()
+    # Nodelist may have been modified directly: a fresh table, the cached
+    # arrays of the Mesh are left alone
+    Nodes=_Mesh.buildNodeTable()
+    NUTParts=np.array(sorted(set(_Mesh.NUTProps)), dtype=np.int64)
+    Thickness=sortedTable(_Mesh.Nodalthickness) if len(NUTParts)>0 else None
+
+    out=Output(file)
+    out.write("$ - Mubea TRB CAE - FE_Mesh_Handlers - writeDynaMesh\n")
+    out.write("$ - Date/Time: "+datetime.now().strftime('%Y/%m/%d %H:%M:%S')+"\n")
+    out.write("$ - User: "+getuser()+"\n")
+    if len(index)==0:
+        out.write(data.tostring())
+    else:
+        out.write(data[0:index.starts[0]].tostring())
+    for i in xrange(len(index)):
+        line=data[index.starts[i]:index.dataStarts[i]].tostring()
+        start, end = index.getRange(i)
+        keyword=index.getKeywords()[i]
+        if keyword=="*NODE":
+            out.write(line)
+            writeNodes(out, Nodes, data, start, end)
+        elif keyword=="*ELEMENT_SHELL" and len(NUTParts)>0:
+            writeElementShell(out, NUTParts, Thickness, line, data, start, end)
+        else:
+            out.write(data[index.starts[i]:end].tostring())
+    out.close()
@@ -0,0 +1,186 @@
+import BulkWriter as BulkWriter
+import FixedWidth as FixedWidth
+import ParallelReader as ParallelReader
+import numpy as np
+from datetime import datetime
+from getpass import getuser
+
+# Delta writers for LS-Dyna and Radioss decks.
+# The source deck (Mesh.Meshfile) is copied byte range by byte range, only
+# the lines of the entities in the dirty sets of the Mesh (Mesh.setNodes,
+# setElem, setNodalThicknesses, setElementalThicknesses) are regenerated:
+# node lines, element lines, *ELEMENT_SHELL_THICKNESS cards and the Radioss
+# thickness column. The lines of every entity are looked up in line tables
+# which are built on the first delta write and kept on the KeywordIndex of
+# the source deck, so later writes only depend on the number of changes.
+# The block structure of the source is kept (NUTProps is not applied).
+
+EntityBlocks={
+    # Entity blocks: [(keyword without ID, ID field, lines per entity, number of nodes)]
+    "LS-Dyna": {"Nodes": [("*NODE", (0, 8), 1, 0)],
+                "Elems": [("*ELEMENT_SHELL", (0, 8), 1, 4), ("*ELEMENT_SHELL_THICKNESS", (0, 8), 2, 4)]},
+    "Radioss": {"Nodes": [("/NODE", (0, 10), 1, 0)],
+                "Elems": [("/SHELL", (0, 10), 1, 4), ("/SH3N", (0, 10), 1, 3)]},
+}
+
+def lineTable(index, data, Meshformat, kind):
+    # Sorted entity IDs of kind with the offsets of their first line and of
+    # their second card (-1 if there is none), the number of nodes of the
+    # block and the node IDs of the second card entities. Entities defined
+    # twice refer to the last definition like the readers do.
+    if kind in index.LineTables:
+        return index.LineTables[kind]
+    IDs=[]
+    starts=[]
+    ends=[]
+    cardStarts=[]
+    cardEnds=[]
+    numnodes=[]
+    for i, keyword in enumerate(index.getKeywords()):
+        name=ParallelReader.baseKeyword(Meshformat, keyword)
+        for block, field, step, nodes in EntityBlocks[Meshformat][kind]:
+            if name!=block:
+                continue
+            s, e = index.getDataLines(data, i, False)
+            n=len(s)//step*step
+            IDs.append(FixedWidth.parseInts(FixedWidth.charMatrix(data, s[0:n:step], e[0:n:step], field[1])[:, field[0]:field[1]]))
+            starts.append(s[0:n:step])
+            ends.append(e[0:n:step])
+            if step==2:
+                cardStarts.append(s[1:n:2])
+                cardEnds.append(e[1:n:2])
+            else:
+                cardStarts.append(np.full(n, -1, dtype=np.int64))
+                cardEnds.append(np.full(n, -1, dtype=np.int64))
+            numnodes.append(np.full(n//step, nodes, dtype=np.int8))
+    columns=[IDs, starts, ends, cardStarts, cardEnds, numnodes]
+    if len(IDs)==0:
+        table=[np.zeros(0, dtype=np.int64)]*5+[np.zeros(0, dtype=np.int8)]
+    else:
+        table=[np.concatenate(column) for column in columns]
+    unique, last = np.unique(table[0][::-1], return_index=True)
+    rows=len(table[0])-1-last
+    table=[column[rows] for column in table]
+    hascard=table[3]>=0
+    Conn=np.zeros((len(table[0]), 4), dtype=np.int64)
+    if hascard.any():
+        chars=FixedWidth.charMatrix(data, table[1][hascard], table[2][hascard], 48)
+        Conn[hascard]=np.column_stack([FixedWidth.parseInts(chars[:, i:i+8]) for i in xrange(16, 48, 8)])
+    index.LineTables[kind]=table+[Conn]
+    return index.LineTables[kind]
+
+def findLines(table, IDs, kind):
+    # Line table rows of IDs, ValueError for entities not in the source deck
+    pos=np.minimum(np.searchsorted(table[0], IDs), max(len(table[0])-1, 0))
+    found=(len(table[0])>0)&(table[0][pos]==IDs)
+    if not found.all():
+        raise ValueError(kind+" "+str(int(IDs[~found][0]))+" is not defined in "+"the source deck, use a full write")
+    return pos
+
+def getCoords(_Mesh, NodeIDs):
+    if _Mesh.isColumnar():
+        Nodes=_Mesh.getNodeTable()
+        rows=Nodes.getRows(NodeIDs)
+        if (rows<0).any():
+            raise KeyError(int(NodeIDs[rows<0][0]))
+        return Nodes.getCoords()[rows].tolist()
+    return [_Mesh.Nodelist[NodeID] for NodeID in NodeIDs.tolist()]
+
+def getElems(_Mesh, ElemIDs):
+    # [PartID, n1, n2, n3, n4] of the elements, trias repeat n3
+    elems=[list(_Mesh.Elemlist[ElemID]) for ElemID in ElemIDs.tolist()]
+    return [elem if len(elem)==5 else elem+elem[3:4] for elem in elems]
+
+def lineText(data, start, end):
+    return data[start:end].tostring()
+
+def nodeEdits(_Mesh, index, data, nodeformat):
+    NodeIDs=_Mesh.getDirty("Nodes")
+    if len(NodeIDs)==0:
+        return []
+    table=lineTable(index, data, _Mesh.getMeshFormat(), "Nodes")
+    rows=findLines(table, NodeIDs, "Node")
+    coords=getCoords(_Mesh, NodeIDs)
+    return [(int(table[1][row]), int(table[2][row]), nodeformat % (NodeID, coord[0], coord[1], coord[2]))
+            for row, NodeID, coord in zip(rows.tolist(), NodeIDs.tolist(), coords)]
+
+def dynaElemEdits(_Mesh, index, data):
+    edits=[]
+    ElemIDs=_Mesh.getDirty("Elems")
+    ThickNodes=_Mesh.getDirty("NodalThickness")
+    if len(ElemIDs)==0 and len(ThickNodes)==0:
+        return edits
+    table=lineTable(index, data, "LS-Dyna", "Elems")
+    cards=np.zeros(len(table[0]), dtype=bool)
+    if len(ElemIDs)>0:
+        rows=findLines(table, ElemIDs, "Element")
+        for row, elem in zip(rows.tolist(), getElems(_Mesh, ElemIDs)):
+            start=int(table[1][row])
+            end=int(table[2][row])
+            edits.append((start, end, "%8i%8i%8i%8i%8i%8i" % tuple([table[0][row]]+elem)+lineText(data, start+48, end)))
+        cards[rows]=True
+    if len(ThickNodes)>0:
+        cards=cards|np.in1d(table[6], ThickNodes).reshape(-1, 4).any(axis=1)
+    rows=np.flatnonzero(cards&(table[3]>=0))
+    if len(rows)>0:
+        for row, elem in zip(rows.tolist(), getElems(_Mesh, table[0][rows])):
+            edits.append((int(table[3][row]), int(table[4][row]), BulkWriter.THICKFORMAT[:-1] % tuple([_Mesh.getNodalThickness(NodeID) for NodeID in elem[1:]])))
+    return edits
+
+def radiossElemEdits(_Mesh, index, data):
+    edits=[]
+    ElemIDs=_Mesh.getDirty("Elems")
+    ThickElems=_Mesh.getDirty("ElementalThickness")
+    ElemIDs=np.union1d(ElemIDs, ThickElems)
+    if len(ElemIDs)==0:
+        return edits
+    table=lineTable(index, data, "Radioss", "Elems")
+    rows=findLines(table, ElemIDs, "Element")
+    dirty=set(_Mesh.getDirty("Elems").tolist())
+    for row, ElemID in zip(rows.tolist(), ElemIDs.tolist()):
+        start=int(table[1][row])
+        end=int(table[2][row])
+        text=lineText(data, start, end)
+        if ElemID in dirty:
+            nodes=int(table[5][row])
+            elem=getElems(_Mesh, np.array([ElemID]))[0]
+            head=("%10i"*(1+nodes)) % tuple([ElemID]+elem[1:1+nodes])
+            text=head+text[len(head):]
+        if ElemID in _Mesh.Elementalthickness:
+            text=text[0:90].ljust(90)+"%10.8f" % _Mesh.Elementalthickness[ElemID]+text[100:]
+        edits.append((start, end, text))
+    return edits
+
+def writeEdits(out, data, edits):
+    # Source bytes with the byte ranges of edits replaced
+    pos=0
+    for start, end, text in sorted(edits):
+        out.write(data[pos:start].tostring())
+        out.write(text)
+        pos=end
+    out.write(data[pos:].tostring())
+
+def writeDynaMesh(_Mesh, file):
+    index=BulkWriter.sourceIndex(_Mesh, "*", "$")
+    data=index.map()
+    edits=nodeEdits(_Mesh, index, data, BulkWriter.NODEFORMAT[:-1])+dynaElemEdits(_Mesh, index, data)
+    out=BulkWriter.Output(file)
+    out.write("$ - Mubea TRB CAE - FE_Mesh_Handlers - writeDynaMesh\n")
+    out.write("$ - Date/Time: "+datetime.now().strftime('%Y/%m/%d %H:%M:%S')+"\n")
+    out.write("$ - User: "+getuser()+"\n")
+    writeEdits(out, data, edits)
+    out.close()
+
+def writeRadiossMesh(_Mesh, file):
+    index=BulkWriter.sourceIndex(_Mesh, "/", "#")
+    data=index.map()
+    edits=nodeEdits(_Mesh, index, data, "%10i%20.14f%20.14f%20.14f")+radiossElemEdits(_Mesh, index, data)
+    header=data[0:1<<16].tostring().find("#RADIOSS STARTER")
+    if header>=0:
+        header=FixedWidth.nextLine(data, header, len(data))
+        edits.append((header, header, "## - Mubea TRB CAE - FE_Mesh_Handlers - writeRadiossMesh\n"+
+                      "## - Date/Time: "+datetime.now().strftime('%Y/%m/%d %H:%M:%S')+"\n"+
+                      "## - User: "+getuser()+"\n"))
+    out=BulkWriter.Output(file)
+    writeEdits(out, data, edits)
+    out.close()
@@ -1,4 +1,6 @@
-class Element:
+class Element(object):
+    __slots__ = ('thickness', 'ElemID', 'PartID', 'Nodes')
+
     def __init__(self, ElemID, PartID, *Nodes):
         self.thickness= 0.0
         self.ElemID = ElemID
@@ -0,0 +1,62 @@
+from scipy.spatial import ConvexHull
+import numpy as np
+
+# Vectorized geometry kernels working on whole coordinate/connectivity arrays.
+# Connectivity always has four columns, trias repeat their third node.
+
+def shellCorners(Coords, Rows):
+    # Corner coordinates (n, 4, 3) of shells given as node rows (n, 4)
+    return Coords[Rows]
+
+def shellAreas(Corners):
+    # Same formula as Quad.getArea: half the norm of the diagonal cross
+    # product. For trias (d == c) this is the triangle area.
+    a=Corners[:, 0]
+    b=Corners[:, 1]
+    c=Corners[:, 2]
+    d=Corners[:, 3]
+    n=np.cross(c-a, d-b)
+    return 0.5*np.sqrt(np.einsum('ij,ij->i', n, n))
+
+def bestFitPlane(Points):
+    # Centroid and orthonormal axes (3, 3) of a point cloud, rows sorted by
+    # decreasing spread: the first two span the best fit plane, the last one
+    # is its normal
+    center=Points.mean(axis=0)
+    u, s, axes = np.linalg.svd(Points-center, full_matrices=False)
+    if len(axes)<3:
+        axes=np.linalg.svd(np.vstack((axes, np.eye(3))), full_matrices=False)[2]
+    return center, axes
+
+def convexHull(Points):
+    # Corner points (k, 2) of the convex hull of 2D points, counterclockwise.
+    # Degenerate (collinear) input gives the two extreme points.
+    Points=np.unique(Points, axis=0) if len(Points)>0 else Points.reshape(0, 2)
+    if len(Points)>2:
+        try:
+            return Points[ConvexHull(Points).vertices]
+        except Exception:
+            pass
+    if len(Points)<2:
+        return Points
+    direction=Points[-1]-Points[0]
+    t=Points.dot(direction)
+    return Points[[np.argmin(t), np.argmax(t)]]
+
+def minAreaRectangle(Hull):
+    # Minimum area rectangle around a convex hull (k, 2): one edge of it lies
+    # on a hull edge, so all edge directions are checked at once.
+    # Returns the unit direction (2,) of its first side, the limits
+    # [umin, umax, vmin, vmax] along that direction and its normal and the area.
+    edges=np.roll(Hull, -1, axis=0)-Hull
+    length=np.sqrt((edges**2).sum(axis=1))
+    dirs=edges[length>0.0]/length[length>0.0, None]
+    if len(dirs)==0:
+        dirs=np.array([[1.0, 0.0]])
+    normals=np.column_stack((-dirs[:, 1], dirs[:, 0]))
+    u=Hull.dot(dirs.T)
+    v=Hull.dot(normals.T)
+    limits=np.vstack((u.min(axis=0), u.max(axis=0), v.min(axis=0), v.max(axis=0)))
+    area=(limits[1]-limits[0])*(limits[3]-limits[2])
+    i=int(np.argmin(area))
+    return dirs[i], limits[:, i], float(area[i])
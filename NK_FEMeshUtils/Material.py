@@ -1,4 +1,6 @@
-class Material:
+class Material(object):
+    __slots__ = ('MatID', 'Rho', 'E')
+
     def __init__(self, MatID, Rho, E):
         self.MatID=MatID
         self.Rho=Rho
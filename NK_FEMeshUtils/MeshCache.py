@@ -0,0 +1,140 @@
+from Mesh import Mesh as Mesh
+import hashlib
+import json
+import os
+import zipfile
+import numpy as np
+
+# Binary sidecar cache of parsed meshes.
+# The content of a Mesh (Mesh.getArrays plus the part, material and property
+# tables) is stored as uncompressed .npz file next to the deck, all of it
+# as plain arrays (the key as JSON text) which are loaded without pickle
+# support, so a cache file can not run code in the reader. The cache is
+# keyed on the deck path, size, mtime and MD5 hash of its content: a size
+# change invalidates it directly, a changed mtime only if the content hash
+# differs as well (e.g. the file was only touched). For decks with *INCLUDE
+# files every include file is part of the key.
+
+VERSION=3
+SUFFIX=".nkcache"
+HASHCHUNK=1<<24 # Bytes hashed per step
+
+def cacheFile(file):
+    return file+SUFFIX
+
+def contentHash(file):
+    md5=hashlib.md5()
+    with open(file, "rb") as f:
+        while True:
+            data=f.read(HASHCHUNK)
+            if not data:
+                break
+            md5.update(data)
+    return md5.hexdigest()
+
+def deckKey(file, Meshformat, hash=None):
+    if hash is None:
+        hash=contentHash(file)
+    return {'version': VERSION, 'file': os.path.abspath(file), 'format': Meshformat,
+            'size': os.path.getsize(file), 'mtime': os.path.getmtime(file), 'hash': hash}
+
+def packTables(_Mesh):
+    # Part, material and property tables, NUTProps, Includes and Sources as arrays
+    Parts=_Mesh.Partlist.items()
+    Mats=_Mesh.Matlist.items()
+    Props=_Mesh.Proplist.items()
+    arrays={'PartlistIDs': np.array([part[0] for part in Parts], dtype=np.int64),
+            'PartlistTitles': np.array([part[1][0] for part in Parts], dtype=np.str_),
+            'PartlistPropIDs': np.array([part[1][1] for part in Parts]),
+            'PartlistMatIDs': np.array([part[1][2] for part in Parts]),
+            'MatlistIDs': np.array([mat[0] for mat in Mats]),
+            'MatlistValues': np.array([mat[1] for mat in Mats], dtype=np.float64).reshape(-1, 2),
+            'ProplistIDs': np.array([prop[0] for prop in Props]),
+            'ProplistThickness': np.array([prop[1][0] for prop in Props], dtype=np.float64),
+            'NUTProps': np.array(_Mesh.NUTProps, dtype=np.int64),
+            'Includes': np.array(_Mesh.Includes, dtype=np.str_)}
+    for kind, blocks in _Mesh.Sources.items():
+        arrays['SourceIDs_'+kind]=np.concatenate([block[0] for block in blocks])
+        arrays['SourceFiles_'+kind]=np.concatenate([block[1] for block in blocks])
+    return arrays
+
+def unpackTables(_Mesh, arrays):
+    Titles=arrays['PartlistTitles'].tolist()
+    PropIDs=arrays['PartlistPropIDs'].tolist()
+    MatIDs=arrays['PartlistMatIDs'].tolist()
+    for i, PartID in enumerate(arrays['PartlistIDs'].tolist()):
+        _Mesh.Partlist[PartID]=[Titles[i], PropIDs[i], MatIDs[i]]
+    for MatID, values in zip(arrays['MatlistIDs'].tolist(), arrays['MatlistValues'].tolist()):
+        _Mesh.Matlist[MatID]=values
+    for PropID, thickness in zip(arrays['ProplistIDs'].tolist(), arrays['ProplistThickness'].tolist()):
+        _Mesh.Proplist[PropID]=[thickness]
+    _Mesh.NUTProps=arrays['NUTProps'].tolist()
+    _Mesh.Includes=arrays['Includes'].tolist()
+    for name in arrays.files:
+        if name.startswith('SourceIDs_'):
+            kind=name[len('SourceIDs_'):]
+            _Mesh.Sources[kind]=[(arrays[name], arrays['SourceFiles_'+kind])]
+
+def isValid(key, file, Meshformat):
+    if key.get('version')!=VERSION or key.get('format')!=Meshformat:
+        return False
+    if not os.path.isfile(file):
+        return False
+    if key.get('file')!=os.path.abspath(file) or key.get('size')!=os.path.getsize(file):
+        return False
+    if key.get('mtime')==os.path.getmtime(file):
+        return True
+    return key.get('hash')==contentHash(file)
+
+def isValidKeys(keys, file, Meshformat):
+    # Keys of the deck and its include files
+    if len(keys)==0 or keys[0].get('file')!=os.path.abspath(file):
+        return False
+    for key in keys:
+        if not isValid(key, key.get('file'), Meshformat):
+            return False
+    return True
+
+def save(_Mesh):
+    # Writes the cache of _Mesh.Meshfile, returns False if it could not be written
+    file=_Mesh.getMeshFile()
+    arrays=_Mesh.getArrays()
+    if not _Mesh.isColumnar():
+        # Store the elements grouped like PartElemlist so its per part order survives
+        ElemIDs=[ElemID for PartID in _Mesh.PartElemlist for ElemID in _Mesh.PartElemlist[PartID]]
+        rows=_Mesh.getElemTable().getRows(np.array(ElemIDs, dtype=np.int64))
+        for name in ('ElemIDs', 'PartIDs', 'Conn', 'NumNodes'):
+            arrays[name]=arrays[name][rows]
+    arrays.update(packTables(_Mesh))
+    files=[file]+_Mesh.Includes[1:]
+    arrays['Key']=np.array(json.dumps([deckKey(include, _Mesh.getMeshFormat()) for include in files]))
+    tmp=cacheFile(file)+".tmp"+str(os.getpid())
+    try:
+        with open(tmp, "wb") as f:
+            np.savez(f, **arrays)
+        os.rename(tmp, cacheFile(file))
+    except (IOError, OSError):
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        return False
+    return True
+
+def load(file, Meshformat, columnar=False):
+    # Mesh from the cache of file, None if there is no valid cache
+    if not os.path.exists(cacheFile(file)):
+        return None
+    try:
+        with open(cacheFile(file), "rb") as f:
+            arrays=np.load(f, allow_pickle=False)
+            if not isValidKeys(json.loads(arrays['Key'].tolist()), file, Meshformat):
+                return None
+            _Mesh=Mesh(file, Meshformat, columnar)
+            _Mesh.addArrays(arrays)
+            unpackTables(_Mesh, arrays)
+    except (IOError, ValueError, KeyError, TypeError, AttributeError, zipfile.BadZipfile):
+        return None
+    return _Mesh
+
+def remove(file):
+    if os.path.exists(cacheFile(file)):
+        os.remove(cacheFile(file))
@@ -1,7 +1,19 @@
 import subprocess
 # import logging
 from Mesh import Mesh as Mesh
+from KeywordIndex import KeywordIndex as KeywordIndex
+import DynaSections as DynaSections
+import RadiossSections as RadiossSections
+import ParallelReader as ParallelReader
+import MeshCache as MeshCache
+import PartialReader as PartialReader
+import StreamReader as StreamReader
+import IncludeReader as IncludeReader
+import BulkWriter as BulkWriter
+import DeltaWriter as DeltaWriter
+import Instrumentation as Instrumentation
 import os
+import time
 import numpy as np
 from datetime import datetime
 from numpy import cross, eye, dot
@@ -9,7 +21,79 @@ from scipy.linalg import expm3, norm
 from getpass import getuser
 
 class MeshReaders:
-    def readDynaMesh(self, file):
+    def readDynaMesh(self, file, columnar=False, engine="block", mapped=True, workers=1, cache=False, parts=None, includes=True):
+        # engine="block" indexes all keywords once (KeywordIndex) and converts
+        # every keyword block in bulk through the DynaSections dispatch table,
+        # engine="line" is the original line by line reader.
+        # With mapped=True the file is memory mapped and parsed in place,
+        # otherwise it is read into memory first (include files and the
+        # ranges of parallel workers as well).
+        # With workers > 1 the node and shell blocks are parsed in a process
+        # pool (ParallelReader).
+        # With cache=True the mesh is loaded from the binary sidecar file of
+        # the deck (MeshCache) if it is up to date, otherwise the deck is
+        # parsed and the cache written.
+        # parts=[PartIDs] only reads the shells of these parts and the nodes
+        # they reference (PartialReader), with includes=True in the include
+        # files as well. The other options are ignored then.
+        # With includes=True the files of *INCLUDE keywords are read as well
+        # (IncludeReader), with workers > 1 concurrently.
+        # With Instrumentation callbacks registered the read is reported as
+        # "operation" event, every keyword block parsed by the block engine
+        # as "section" event.
+        if not Instrumentation.Callbacks:
+            return self.parseDynaMesh(file, columnar, engine, mapped, workers, cache, parts, includes)
+        start_time=time.time()
+        _Mesh=self.parseDynaMesh(file, columnar, engine, mapped, workers, cache, parts, includes)
+        Instrumentation.operation("readDynaMesh", file, start_time, Instrumentation.entityCounts(_Mesh),
+                                  Instrumentation.deckSize(_Mesh))
+        return _Mesh
+
+    def parseDynaMesh(self, file, columnar=False, engine="block", mapped=True, workers=1, cache=False, parts=None, includes=True):
+        if not engine in ("block", "line"):
+            raise ValueError("Unknown engine: "+str(engine))
+        if parts is not None:
+            return PartialReader.readMesh(file, "LS-Dyna", parts, columnar, mapped, includes)
+        if cache:
+            _Mesh=MeshCache.load(file, "LS-Dyna", columnar)
+            if _Mesh is None:
+                _Mesh=self.parseDynaMesh(file, columnar, engine, mapped, workers)
+                MeshCache.save(_Mesh)
+            return _Mesh
+        if engine=="line":
+            return self.readDynaMeshLines(file, columnar)
+        # self.logger.info("LS-Dyna Reader Started: "+file)
+
+        index=KeywordIndex(file, "*", "$")
+        data=index.map() if mapped else np.fromfile(file, dtype=np.uint8)
+        index.build(data)
+        if includes and IncludeReader.hasIncludes(index):
+            return IncludeReader.readMesh(file, columnar, workers, index, data, mapped)
+        if workers>1:
+            return ParallelReader.readMesh(file, "LS-Dyna", columnar, workers, index, data, mapped)
+
+        _Mesh=Mesh(file,"LS-Dyna",columnar)
+        instrumented=len(Instrumentation.Callbacks)>0
+        for i, keyword in enumerate(index.getKeywords()):
+            parser=DynaSections.getParser(keyword)
+            if parser is not None:
+                if instrumented:
+                    start_time=time.time()
+                starts, ends = index.getDataLines(data, i, ParallelReader.blockType("LS-Dyna", keyword) is None)
+                parser(_Mesh, data, starts, ends)
+                if instrumented:
+                    start, end = index.getRange(i)
+                    Instrumentation.section("readDynaMesh", file, keyword, len(starts), start, end, start_time)
+        _Mesh.setKeywordIndex(index)
+        return _Mesh
+
+    def iterDynaMesh(self, file):
+        # Generator of typed batches (kind, dictionary of arrays, see
+        # BatchCollector) in file order, no Mesh is built. Use the functions
+        # of Reducers to aggregate them.
+        return StreamReader.iterMesh(file, "LS-Dyna")
+
+    def readDynaMeshLines(self, file, columnar=False):
         nodesection = False
         elemsection = False
         elemthicksection = False
@@ -22,7 +106,7 @@ class MeshReaders:
         i=0
         # self.logger.info("LS-Dyna Reader Started: "+file)
 
-        _Mesh=Mesh(file,"LS-Dyna")
+        _Mesh=Mesh(file,"LS-Dyna",columnar)
 
         with open(file, "r") as f:
             for line in f:
@@ -161,120 +245,61 @@ class MeshReaders:
         # self.logger.info("Number of NThck: "+str(len(_Mesh.Nodalthickness)))
         return _Mesh
 
-    def readRadiossMesh(self, file):
-        nodesection = False
-        SH3Nsection = False
-        SHELLsection = False
-        partsection = False
-        matsection = False
-        propsection = False
+    def readRadiossMesh(self, file, columnar=False, workers=1, cache=False, parts=None, engine="block", mapped=True):
+        # engine="block" converts every keyword block in bulk through the
+        # RadiossSections dispatch table, engine="line" is the original line
+        # by line reader. workers, cache, parts, mapped and instrumentation as
+        # for readDynaMesh.
+        if not Instrumentation.Callbacks:
+            return self.parseRadiossMesh(file, columnar, workers, cache, parts, engine, mapped)
+        start_time=time.time()
+        _Mesh=self.parseRadiossMesh(file, columnar, workers, cache, parts, engine, mapped)
+        Instrumentation.operation("readRadiossMesh", file, start_time, Instrumentation.entityCounts(_Mesh),
+                                  Instrumentation.deckSize(_Mesh))
+        return _Mesh
 
-        i=0
+    def parseRadiossMesh(self, file, columnar=False, workers=1, cache=False, parts=None, engine="block", mapped=True):
+        if not engine in ("block", "line"):
+            raise ValueError("Unknown engine: "+str(engine))
+        if parts is not None:
+            return PartialReader.readMesh(file, "Radioss", parts, columnar, mapped)
+        if cache:
+            _Mesh=MeshCache.load(file, "Radioss", columnar)
+            if _Mesh is None:
+                _Mesh=self.parseRadiossMesh(file, columnar, workers, False, None, engine, mapped)
+                MeshCache.save(_Mesh)
+            return _Mesh
+        if engine=="line":
+            return self.readRadiossMeshLines(file, columnar)
         # self.logger.info("Radioss Reader Started: "+file)
 
-        _Mesh=Mesh(file,"Radioss")
-
-        with open(file, "r") as f:
-            for line in f:
-                # if "#RADIOSS STARTER" in line:
-                    # self.logger.debug("#RADIOSS STARTER found")
-
-                if "/NODE" in line[0:5]:
-                    # self.logger.debug("/NODE keyword found")
-                    nodesection = True
-                elif (nodesection == True) and (not("#" in line or "/" in line)):
-                    _nodeID = int(line[0:10])
-                    _x = float(line[11:30])
-                    _y = float(line[31:50])
-                    _z = float(line[51:70])
-                    _Mesh.addNode(_nodeID, _x, _y, _z)
-                elif nodesection and "/" in line:
-                    nodesection = False
-
-                if "/SH3N" in line[0:5]:
-                    # self.logger.debug("/SH3N keyword found")
-                    _partid=int(line.strip().split("/")[-1])
-                    SH3Nsection = True
-                elif (SH3Nsection == True) and (not("#" in line or "/" in line)):
-                    #print [line[0:10], partid, line[11:20], line[21:30], line[31:40]]
-                    _elID = int(line[0:10])
-                    _n1 = int(line[11:20])
-                    _n2 = int(line[21:30])
-                    _n3 = int(line[31:40])
-                    _Mesh.addElem(_elID, _partid, _n1, _n2, _n3)
-                    if line[91:100].strip() != "": _Mesh.addElementalThickness(line[0:10],line[91:100])
-                elif SH3Nsection and "/" in line:
-                    SH3Nsection = False
-
-                if "/SHELL" in line[0:6]:
-                    # self.logger.debug("/SHELL keyword found")
-                    _partid=int(line.strip().split("/")[-1])
-                    SHELLsection = True
-                elif (SHELLsection == True) and (not("#" in line or "/" in line)):
-                    #print [line[0:10], partid, line[11:20], line[21:30], line[31:40], line[41:50]]
-
-                    _elID = int(line[0:10])
-                    _n1 = int(line[11:20])
-                    _n2 = int(line[21:30])
-                    _n3 = int(line[31:40])
-                    _n4 = int(line[41:50])
-                    _Mesh.addElem(_elID, _partid, _n1, _n2, _n3, _n4)
-
-                    try:
-                        _elthick = float(line[91:100].strip())
-                        if _elthick != 0.0 :
-                            _Mesh.addElementalThickness(_elID,_elthick)
-                    except:
-                        pass
-                elif SHELLsection and "/" in line:
-                    SHELLsection = False
-
-                if "/PART" in line[0:5]:
-                    # self.logger.debug("/PART Keyword Found")
-                    _partid=int(line.strip().split("/")[-1])
-                    partsection = True
-                    i=0
-                elif (partsection == True) and (not("#" in line or "/" in line)):
-                    if i == 0: _title=line.strip()
-                    elif i == 1:
-                        _propID=int(line[0:10])
-                        _matID=int(line[11:20])
-                        _Mesh.addPart(_partid, _title, _propID, _matID)
-                    i=i+1
-                elif partsection and "/" in line:
-                    partsection = False
+        index=KeywordIndex(file, "/", "#")
+        data=index.map() if mapped else np.fromfile(file, dtype=np.uint8)
+        index.build(data)
+        if workers>1:
+            return ParallelReader.readMesh(file, "Radioss", columnar, workers, index, data, mapped)
+
+        _Mesh=Mesh(file,"Radioss",columnar)
+        instrumented=len(Instrumentation.Callbacks)>0
+        for i, keyword in enumerate(index.getKeywords()):
+            name, ID = RadiossSections.splitKeyword(keyword)
+            parser=RadiossSections.Parsers.get(name)
+            if parser is not None:
+                if instrumented:
+                    start_time=time.time()
+                starts, ends = index.getDataLines(data, i, ParallelReader.blockType("Radioss", keyword) is None)
+                parser(_Mesh, ID, data, starts, ends)
+                if instrumented:
+                    start, end = index.getRange(i)
+                    Instrumentation.section("readRadiossMesh", file, name, len(starts), start, end, start_time)
+        _Mesh.setKeywordIndex(index)
+        return _Mesh
 
-                if "/MAT/PLAS_TAB" in line[0:13]:
-                    # self.logger.debug("/MAT/PLAS_TAB Keyword Found")
-                    _matID=int(line.strip().split("/")[-1])
-                    matsection = True
-                    i=0
-                elif (matsection == True) and (not("#" in line or "/" in line)):
-                    if i == 0:
-                        _title=line.strip()
-                    elif i == 1:
-                        _rho=float(line[0:20])
-                    elif i == 2:
-                        _E=float(line[0:20])
-                        _Mesh.addMat(_matID, _rho, _E)
-                    i=i+1
-                elif matsection and "/" in line:
-                    matsection = False
+    def readRadiossMeshLines(self, file, columnar=False):
+        _Mesh=Mesh(file,"Radioss",columnar)
 
-                if "/PROP/SHELL" in line[0:11]:
-                    # self.logger.debug("/PROP/SHELL Keyword Found")
-                    _propID=float(line.strip().split("/")[-1])
-                    propsection = True
-                    i=0
-                elif (propsection == True) and (not("#" in line or "/" in line)):
-                    if i == 0:
-                        _title=line.strip()
-                    elif i == 3:
-                        _thick=float(line[21:40])
-                        _Mesh.addProp(_propID, _thick)
-                    i=i+1
-                elif propsection and "/" in line:
-                    propsection = False
+        with open(file, "r") as f:
+            self.parseRadiossLines(_Mesh, f)
 
         # self.logger.info("Radioss Mesh successfully read")
         # self.logger.info("Number of Nodes: "+str(len(_Mesh.Nodelist)))
@@ -287,7 +312,141 @@ class MeshReaders:
 
         return _Mesh
 
-    def writeDynaMesh(self, _Mesh, file):
+    def iterRadiossMesh(self, file):
+        return StreamReader.iterMesh(file, "Radioss")
+
+    def parseRadiossLines(self, _Mesh, lines):
+        # Adds the content of Radioss starter lines to _Mesh
+        nodesection = False
+        SH3Nsection = False
+        SHELLsection = False
+        partsection = False
+        matsection = False
+        propsection = False
+
+        i=0
+
+        for line in lines:
+            # if "#RADIOSS STARTER" in line:
+                # self.logger.debug("#RADIOSS STARTER found")
+
+            if "/NODE" in line[0:5]:
+                # self.logger.debug("/NODE keyword found")
+                nodesection = True
+            elif (nodesection == True) and (not("#" in line or "/" in line)):
+                _nodeID = int(line[0:10])
+                _x = float(line[11:30])
+                _y = float(line[31:50])
+                _z = float(line[51:70])
+                _Mesh.addNode(_nodeID, _x, _y, _z)
+            elif nodesection and "/" in line:
+                nodesection = False
+
+            if "/SH3N" in line[0:5]:
+                # self.logger.debug("/SH3N keyword found")
+                _partid=int(line.strip().split("/")[-1])
+                SH3Nsection = True
+            elif (SH3Nsection == True) and (not("#" in line or "/" in line)):
+                #print [line[0:10], partid, line[11:20], line[21:30], line[31:40]]
+                _elID = int(line[0:10])
+                _n1 = int(line[11:20])
+                _n2 = int(line[21:30])
+                _n3 = int(line[31:40])
+                _Mesh.addElem(_elID, _partid, _n1, _n2, _n3)
+                if line[91:100].strip() != "" and float(line[91:100]) != 0.0: _Mesh.addElementalThickness(_elID,float(line[91:100]))
+            elif SH3Nsection and "/" in line:
+                SH3Nsection = False
+
+            if "/SHELL" in line[0:6]:
+                # self.logger.debug("/SHELL keyword found")
+                _partid=int(line.strip().split("/")[-1])
+                SHELLsection = True
+            elif (SHELLsection == True) and (not("#" in line or "/" in line)):
+                #print [line[0:10], partid, line[11:20], line[21:30], line[31:40], line[41:50]]
+
+                _elID = int(line[0:10])
+                _n1 = int(line[11:20])
+                _n2 = int(line[21:30])
+                _n3 = int(line[31:40])
+                _n4 = int(line[41:50])
+                _Mesh.addElem(_elID, _partid, _n1, _n2, _n3, _n4)
+
+                try:
+                    _elthick = float(line[91:100].strip())
+                    if _elthick != 0.0 :
+                        _Mesh.addElementalThickness(_elID,_elthick)
+                except:
+                    pass
+            elif SHELLsection and "/" in line:
+                SHELLsection = False
+
+            if "/PART" in line[0:5]:
+                # self.logger.debug("/PART Keyword Found")
+                _partid=int(line.strip().split("/")[-1])
+                partsection = True
+                i=0
+            elif (partsection == True) and (not("#" in line or "/" in line)):
+                if i == 0: _title=line.strip()
+                elif i == 1:
+                    _propID=int(line[0:10])
+                    _matID=int(line[11:20])
+                    _Mesh.addPart(_partid, _title, _propID, _matID)
+                i=i+1
+            elif partsection and "/" in line:
+                partsection = False
+
+            if "/MAT/PLAS_TAB" in line[0:13]:
+                # self.logger.debug("/MAT/PLAS_TAB Keyword Found")
+                _matID=int(line.strip().split("/")[-1])
+                matsection = True
+                i=0
+            elif (matsection == True) and (not("#" in line or "/" in line)):
+                if i == 0:
+                    _title=line.strip()
+                elif i == 1:
+                    _rho=float(line[0:20])
+                elif i == 2:
+                    _E=float(line[0:20])
+                    _Mesh.addMat(_matID, _rho, _E)
+                i=i+1
+            elif matsection and "/" in line:
+                matsection = False
+
+            if "/PROP/SHELL" in line[0:11]:
+                # self.logger.debug("/PROP/SHELL Keyword Found")
+                _propID=float(line.strip().split("/")[-1])
+                propsection = True
+                i=0
+            elif (propsection == True) and (not("#" in line or "/" in line)):
+                if i == 0:
+                    _title=line.strip()
+                elif i == 3:
+                    _thick=float(line[21:40])
+                    _Mesh.addProp(_propID, _thick)
+                i=i+1
+            elif propsection and "/" in line:
+                propsection = False
+
+    def writeDynaMesh(self, _Mesh, file, engine="block", delta=False):
+        # Writes the source deck of _Mesh with the nodes of the Mesh, shells
+        # of parts in NUTProps are written as *ELEMENT_SHELL_THICKNESS with
+        # their nodal thickness. engine="block" formats whole blocks from the
+        # mesh arrays (BulkWriter), engine="line" is the original line by
+        # line writer. delta=True copies the source deck and only rewrites
+        # the lines of the entities changed through the Mesh set methods
+        # (DeltaWriter). With Instrumentation callbacks registered the write
+        # is reported as "operation" event.
+        start_time=time.time() if Instrumentation.Callbacks else None
+        if delta:
+            DeltaWriter.writeDynaMesh(_Mesh, file)
+        elif engine=="line":
+            self.writeDynaMeshLines(_Mesh, file)
+        else:
+            BulkWriter.writeDynaMesh(_Mesh, file)
+        if start_time is not None:
+            Instrumentation.operation("writeDynaMesh", file, start_time, Instrumentation.entityCounts(_Mesh))
+
+    def writeDynaMeshLines(self, _Mesh, file):
         elemsection = False
         elemthicksection = False
         elemshellthicknesswritten = False
@@ -376,7 +535,18 @@ class MeshReaders:
         ofile.close
         # self.logger.info('Writing to LS-Dyna Mesh file completed')
 
-    def writeRadiossMesh(self, _Mesh, file):
+    def writeRadiossMesh(self, _Mesh, file, delta=False):
+        # delta=True only rewrites the lines of changed entities (DeltaWriter),
+        # instrumentation as for writeDynaMesh
+        start_time=time.time() if Instrumentation.Callbacks else None
+        if delta:
+            DeltaWriter.writeRadiossMesh(_Mesh, file)
+        else:
+            self.writeRadiossMeshLines(_Mesh, file)
+        if start_time is not None:
+            Instrumentation.operation("writeRadiossMesh", file, start_time, Instrumentation.entityCounts(_Mesh))
+
+    def writeRadiossMeshLines(self, _Mesh, file):
         nodesection = False
         SH3Nsection = False
         SHELLsection = False
@@ -0,0 +1,69 @@
+import Instrumentation as Instrumentation
+class Metrics(object):
+
+    # Collector of the Instrumentation events of readers, writers and
+    # InitAllObj: the operations in order and per operation and keyword the
+    # number of blocks, data lines, bytes and parse time.
+    #   with Metrics() as metrics:
+    #       MeshReaders().readDynaMesh(file)
+    #   print metrics.report()
+
+    def __init__(self):
+        self.Operations=[]
+        self.Sections={} # (operation, keyword): [blocks, lines, bytes, seconds]
+
+    def __call__(self, event, data):
+        if event=="operation":
+            self.Operations.append(data)
+        elif event=="section":
+            key=(data['operation'], data['keyword'])
+            if not key in self.Sections:
+                self.Sections[key]=[0, 0, 0, 0.0]
+            values=self.Sections[key]
+            values[0]=values[0]+1
+            values[1]=values[1]+data['lines']
+            values[2]=values[2]+data['bytes']
+            values[3]=values[3]+data['seconds']
+
+    def enable(self):
+        Instrumentation.addCallback(self)
+        return self
+
+    def disable(self):
+        Instrumentation.removeCallback(self)
+
+    def __enter__(self):
+        return self.enable()
+
+    def __exit__(self, *args):
+        self.disable()
+
+    def clear(self):
+        self.Operations=[]
+        self.Sections={}
+
+    def getOperations(self):
+        return self.Operations
+
+    def getSections(self):
+        # Per operation and keyword: 'operation', 'keyword', 'blocks', 'lines',
+        # 'bytes', 'seconds' and 'lines/s'
+        sections=[]
+        for key in sorted(self.Sections.keys()):
+            blocks, lines, size, seconds = self.Sections[key]
+            sections.append({'operation': key[0], 'keyword': key[1], 'blocks': blocks, 'lines': lines,
+                             'bytes': size, 'seconds': seconds, 'lines/s': lines/seconds if seconds>0 else 0.0})
+        return sections
+
+    def report(self):
+        lines=["{0:<18}{1:>10}{2:>10}{3:>10}{4:>14}".format("Operation", "Time [s]", "MB", "MB/s", "Entities/s")]
+        for data in self.Operations:
+            lines.append("{0:<18}{1:>10.3f}{2:>10.2f}{3:>10.1f}{4:>14.0f}".format(
+                data['operation'], data['seconds'], data['bytes']/1e6, data['MB/s'], data['entities/s']))
+        if len(self.Sections)>0:
+            lines.append("")
+            lines.append("{0:<18}{1:<32}{2:>8}{3:>12}{4:>10}".format("Operation", "Keyword", "Blocks", "Lines", "Time [s]"))
+            for section in self.getSections():
+                lines.append("{0:<18}{1:<32}{2:>8}{3:>12}{4:>10.3f}".format(
+                    section['operation'], section['keyword'], section['blocks'], section['lines'], section['seconds']))
+        return "\n".join(lines)
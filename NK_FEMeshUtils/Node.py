@@ -1,4 +1,6 @@
-class Node:
+class Node(object):
+    __slots__ = ('NodeID', 'thickness', 'x', 'y', 'z')
+
     def __init__(self, NodeID, x, y, z):
         self.NodeID = NodeID
         self.thickness = 0.0
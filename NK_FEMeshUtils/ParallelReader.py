@@ -0,0 +1,154 @@
+from Mesh import Mesh as Mesh
+from KeywordIndex import KeywordIndex as KeywordIndex
+import DynaSections as DynaSections
+import RadiossSections as RadiossSections
+import FixedWidth as FixedWidth
+import Instrumentation as Instrumentation
+import multiprocessing
+import numpy as np
+import time
+
+# Multi process reading of LS-Dyna and Radioss decks.
+# The large node and shell blocks are split into line aligned byte ranges
+# which a process pool parses into temporary columnar meshes. Their arrays
+# are merged into the result in file order together with the small blocks
+# parsed by the main process, so the Mesh is the same for any number of
+# workers. Every parsed block is reported as Instrumentation "section"
+# event by the main process, for split blocks with the data lines and
+# parse time summed over the workers.
+
+MINCHUNK=1<<16 # Minimum number of lines per task
+
+Formats={
+    # Meshformat: (keyword character, comment character, large blocks, lines per entity)
+    "LS-Dyna": ("*", "$", {"*NODE": 1, "*ELEMENT_SHELL": 1, "*ELEMENT_SHELL_THICKNESS": 2}),
+    "Radioss": ("/", "#", {"/NODE": 1, "/SHELL": 1, "/SH3N": 1}),
+}
+
+Operations={"LS-Dyna": "readDynaMesh", "Radioss": "readRadiossMesh"} # Operation of the section events
+
+def baseKeyword(Meshformat, keyword):
+    # Keyword without the ID of Radioss keywords (/SHELL/3 -> /SHELL)
+    if Meshformat=="Radioss":
+        return "/"+keyword.split("/")[1]
+    return keyword
+
+def blockType(Meshformat, keyword):
+    # Key of keyword in the large block table, None for small blocks
+    keyword=baseKeyword(Meshformat, keyword)
+    if keyword in Formats[Meshformat][2]:
+        return keyword
+    return None
+
+def sectionKeyword(Meshformat, keyword):
+    # Keyword of the section events of a block, None if it is not parsed
+    if Meshformat=="LS-Dyna":
+        if DynaSections.getParser(keyword) is not None:
+            return keyword
+        return None
+    name, ID = RadiossSections.splitKeyword(keyword)
+    if name in RadiossSections.Parsers:
+        return name
+    return None
+
+def parseLines(_Mesh, index, data, line, start, end):
+    # Parses the data of one block (or part of it) in the byte range
+    # [start, end), returns the number of data lines
+    keyword=index.keyword(line)
+    starts, ends = FixedWidth.dataLines(data, start, end, index.commentchar, blockType(_Mesh.getMeshFormat(), keyword) is None)
+    parseDataLines(_Mesh, index, data, line, starts, ends)
+    return len(starts)
+
+def parseDataLines(_Mesh, index, data, line, starts, ends):
+    # Parses the given data lines of a block
+    if _Mesh.getMeshFormat()=="LS-Dyna":
+        parser=DynaSections.getParser(index.keyword(line))
+        if parser is not None:
+            parser(_Mesh, data, starts, ends)
+    else:
+        name, ID = RadiossSections.splitKeyword(index.keyword(line))
+        parser=RadiossSections.Parsers.get(name)
+        if parser is not None:
+            parser(_Mesh, ID, data, starts, ends)
+
+def readRange(file, start, end):
+    # Bytes [start, end) of file as uint8 array
+    with open(file, "rb") as f:
+        f.seek(start)
+        return np.fromfile(f, dtype=np.uint8, count=end-start)
+
+def parseChunk(task):
+    # Worker: parses a byte range of a large block, returns the mesh arrays,
+    # the number of data lines and the parse time.
+    # Without mapped only the range is read into memory.
+    file, Meshformat, line, start, end, mapped = task
+    keychar, commentchar, large = Formats[Meshformat]
+    index=KeywordIndex(file, keychar, commentchar)
+    _Mesh=Mesh(file, Meshformat, True)
+    start_time=time.time()
+    if mapped:
+        lines=parseLines(_Mesh, index, index.map(), line, start, end)
+    else:
+        lines=parseLines(_Mesh, index, readRange(file, start, end), line, 0, end-start)
+    return _Mesh.getArrays(), lines, time.time()-start_time
+
+def splitBlock(index, data, i, step, workers):
+    # Line aligned byte ranges of block i, groups of step lines stay together
+    starts, ends = index.getDataLines(data, i, False)
+    start, end = index.getRange(i)
+    size=max(MINCHUNK, -(-len(starts)//(4*workers)))
+    size=-(-size//step)*step
+    bounds=[start]+starts[size::size].tolist()+[end]
+    return [(bounds[k], bounds[k+1]) for k in xrange(len(bounds)-1)]
+
+def readMesh(file, Meshformat, columnar=False, workers=None, index=None, data=None, mapped=True):
+    # data is the content of file for index, mapped=False reads it (and the
+    # ranges parsed by the workers) into memory instead of memory mapping it
+    if workers is None:
+        workers=multiprocessing.cpu_count()
+    keychar, commentchar, large = Formats[Meshformat]
+    _Mesh=Mesh(file, Meshformat, columnar)
+    if index is None:
+        index=KeywordIndex(file, keychar, commentchar)
+    if data is None:
+        data=index.map() if mapped else np.fromfile(file, dtype=np.uint8)
+    if len(index)==0:
+        index.build(data)
+
+    tasks=[]
+    plan=[]
+    for i, keyword in enumerate(index.getKeywords()):
+        block=blockType(Meshformat, keyword)
+        if block is None:
+            plan.append((i, 0))
+        else:
+            ranges=splitBlock(index, data, i, large[block], workers)
+            tasks.extend([(file, Meshformat, index.getLine(i), start, end, mapped) for start, end in ranges])
+            plan.append((i, len(ranges)))
+
+    instrumented=len(Instrumentation.Callbacks)>0
+    pool=multiprocessing.Pool(workers)
+    try:
+        results=pool.imap(parseChunk, tasks)
+        for i, ntasks in plan:
+            start, end = index.getRange(i)
+            start_time=time.time()
+            seconds=None
+            if ntasks==0:
+                lines=parseLines(_Mesh, index, data, index.getLine(i), start, end)
+            else:
+                lines=0
+                seconds=0.0
+            for k in xrange(ntasks):
+                arrays, ChunkLines, ChunkSeconds = results.next()
+                _Mesh.addArrays(arrays)
+                lines=lines+ChunkLines
+                seconds=seconds+ChunkSeconds
+            keyword=sectionKeyword(Meshformat, index.getKeywords()[i])
+            if instrumented and keyword is not None:
+                Instrumentation.section(Operations[Meshformat], file, keyword, lines, start, end, start_time, seconds)
+    finally:
+        pool.close()
+        pool.join()
+    _Mesh.setKeywordIndex(index)
+    return _Mesh
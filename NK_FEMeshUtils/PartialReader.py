@@ -0,0 +1,109 @@
+from Mesh import Mesh as Mesh
+from KeywordIndex import KeywordIndex as KeywordIndex
+import FixedWidth as FixedWidth
+import ParallelReader as ParallelReader
+import RadiossSections as RadiossSections
+import IncludeReader as IncludeReader
+import numpy as np
+
+# Reading of selected parts of LS-Dyna and Radioss decks.
+# Two passes over the keyword index: the first one parses the small blocks
+# and only those shells which belong to the requested parts (only the part
+# ID field is converted for the other lines, Radioss shell blocks of other
+# parts are skipped entirely), the second one parses only the nodes
+# referenced by these shells.
+
+Formats={
+    # Meshformat: (keyword character, comment character)
+    "LS-Dyna": ("*", "$"),
+    "Radioss": ("/", "#"),
+}
+
+ElemBlocks={
+    # Shell blocks: (part ID field or None if the part ID is in the keyword, lines per element)
+    "LS-Dyna": {"*ELEMENT_SHELL": ((8, 16), 1), "*ELEMENT_SHELL_THICKNESS": ((8, 16), 2)},
+    "Radioss": {"/SHELL": (None, 1), "/SH3N": (None, 1)},
+}
+
+NodeBlocks={
+    # Node blocks: node ID field
+    "LS-Dyna": {"*NODE": (0, 8)},
+    "Radioss": {"/NODE": (0, 10)},
+}
+
+def readShells(_Mesh, index, data, Meshformat, PartIDs):
+    # First pass: small blocks and the shells of PartIDs, returns the node blocks
+    nodeblocks=[]
+    for i, keyword in enumerate(index.getKeywords()):
+        block=ParallelReader.baseKeyword(Meshformat, keyword)
+        if block in NodeBlocks[Meshformat]:
+            nodeblocks.append(i)
+        elif block in ElemBlocks[Meshformat]:
+            field, step = ElemBlocks[Meshformat][block]
+            if field is None:
+                # Part ID in the keyword, blocks without one are skipped like
+                # the full read does
+                PartID=RadiossSections.splitKeyword(keyword)[1]
+                if PartID is None or not PartID in PartIDs:
+                    continue
+            starts, ends = index.getDataLines(data, i, False)
+            if field is not None:
+                starts, ends = FixedWidth.selectLines(data, starts, ends, field, PartIDs, step)
+            ParallelReader.parseDataLines(_Mesh, index, data, index.getLine(i), starts, ends)
+        else:
+            start, end = index.getRange(i)
+            ParallelReader.parseLines(_Mesh, index, data, index.getLine(i), start, end)
+    return nodeblocks
+
+def readNodes(_Mesh, index, data, Meshformat, nodeblocks, NodeIDs):
+    # Second pass: the nodes of NodeIDs
+    for i in nodeblocks:
+        field=NodeBlocks[Meshformat][ParallelReader.baseKeyword(Meshformat, index.getKeywords()[i])]
+        starts, ends = index.getDataLines(data, i, False)
+        starts, ends = FixedWidth.selectLines(data, starts, ends, field, NodeIDs)
+        ParallelReader.parseDataLines(_Mesh, index, data, index.getLine(i), starts, ends)
+
+def selectParts(_Mesh, PartIDs):
+    for PartID in _Mesh.Partlist.keys():
+        if not PartID in PartIDs:
+            del _Mesh.Partlist[PartID]
+
+def readMesh(file, Meshformat, parts, columnar=False, mapped=True, includes=False):
+    # includes=True reads the *INCLUDE files of LS-Dyna decks as well: the
+    # shells are selected in all files first, then their nodes are read from
+    # all files, the files are merged like IncludeReader does
+    keychar, commentchar = Formats[Meshformat]
+    index=KeywordIndex(file, keychar, commentchar)
+    data=index.map() if mapped else np.fromfile(file, dtype=np.uint8)
+    index.build(data)
+    PartIDs=np.unique(np.asarray(list(parts), dtype=np.int64))
+    files=[file]
+    if includes and Meshformat=="LS-Dyna" and IncludeReader.hasIncludes(index):
+        files=IncludeReader.resolveFiles(file, index, data, mapped)
+
+    if len(files)==1:
+        _Mesh=Mesh(file, Meshformat, columnar)
+        nodeblocks=readShells(_Mesh, index, data, Meshformat, PartIDs)
+        readNodes(_Mesh, index, data, Meshformat, nodeblocks, np.unique(_Mesh.getElemTable().getConn()))
+        selectParts(_Mesh, PartIDs)
+        _Mesh.setKeywordIndex(index)
+        return _Mesh
+
+    blocks=[]
+    for k in xrange(len(files)):
+        if k>0:
+            index=KeywordIndex(files[k], keychar, commentchar)
+            data=index.map() if mapped else np.fromfile(files[k], dtype=np.uint8)
+            index.build(data)
+        content=Mesh(files[k], Meshformat, True)
+        blocks.append((content, index, data, readShells(content, index, data, Meshformat, PartIDs)))
+    NodeIDs=np.unique(np.concatenate([content.getElemTable().getConn().ravel() for content, index, data, nodeblocks in blocks]))
+    _Mesh=Mesh(file, Meshformat, columnar)
+    for k in xrange(len(files)):
+        content, index, data, nodeblocks = blocks[k]
+        readNodes(content, index, data, Meshformat, nodeblocks, NodeIDs)
+        selectParts(content, PartIDs)
+        IncludeReader.addFile(_Mesh, k, content.getArrays(), content.Partlist, content.Matlist, content.Proplist)
+    _Mesh.Includes=files
+    _Mesh.setKeywordIndex(blocks[0][1])
+    return _Mesh
@@ -0,0 +1,88 @@
+import FixedWidth as FixedWidth
+import numpy as np
+
+# Section parsers of the block based Radioss reader, the counterpart of
+# DynaSections. Every parser gets the Mesh, the ID of the keyword
+# (/SHELL/<PartID>, /PROP/SHELL/<PropID>, ... None if there is none), the
+# file content and the offsets of the data lines of one keyword block
+# (comment lines removed) and converts the whole block in bulk.
+# Parsers is the dispatch table, keys are the keywords without the ID.
+
+def splitKeyword(keyword):
+    # /SHELL/3 -> ("/SHELL", 3), /NODE -> ("/NODE", None)
+    fields=keyword.split("/")
+    if len(fields)>2 and fields[-1].isdigit():
+        return "/".join(fields[:-1]), int(fields[-1])
+    return keyword, None
+
+def parseThickness(chars):
+    # Elemental thickness column (91-100), blanks and fields which are no
+    # numbers are read as zero (no elemental thickness)
+    try:
+        return FixedWidth.parseFloats(chars)
+    except ValueError:
+        values=[]
+        for field in FixedWidth.fieldStrings(chars).tolist():
+            try:
+                values.append(float(field))
+            except ValueError:
+                values.append(0.0)
+        return np.array(values, dtype=np.float64)
+
+def parseNode(_Mesh, ID, data, starts, ends):
+    for s, e in FixedWidth.chunks(starts, ends):
+        chars=FixedWidth.charMatrix(data, s, e, 70)
+        coords=np.column_stack((FixedWidth.parseFloats(chars[:, 10:30]),
+                                FixedWidth.parseFloats(chars[:, 30:50]),
+                                FixedWidth.parseFloats(chars[:, 50:70])))
+        _Mesh.addNodes(FixedWidth.parseInts(chars[:, 0:10]), coords)
+
+def parseShells(_Mesh, PartID, data, starts, ends, numnodes):
+    # Element ID, numnodes node IDs and the thickness column of /SHELL and /SH3N
+    if PartID is None:
+        return
+    for s, e in FixedWidth.chunks(starts, ends):
+        chars=FixedWidth.charMatrix(data, s, e, 100)
+        ElemIDs=FixedWidth.parseInts(chars[:, 0:10])
+        Conn=np.column_stack([FixedWidth.parseInts(chars[:, i:i+10]) for i in xrange(10, 10+10*numnodes, 10)])
+        _Mesh.addElems(ElemIDs, np.full(len(ElemIDs), PartID, dtype=np.int64), Conn)
+        thick=parseThickness(chars[:, 90:100])
+        if (thick!=0.0).any():
+            _Mesh.addElementalThicknesses(ElemIDs[thick!=0.0], thick[thick!=0.0])
+
+def parseShell(_Mesh, PartID, data, starts, ends):
+    parseShells(_Mesh, PartID, data, starts, ends, 4)
+
+def parseSH3N(_Mesh, PartID, data, starts, ends):
+    parseShells(_Mesh, PartID, data, starts, ends, 3)
+
+def cards(data, starts, ends):
+    return FixedWidth.lineStrings(data, starts, ends)
+
+def parsePart(_Mesh, PartID, data, starts, ends):
+    # Title and card with property and material ID
+    lines=cards(data, starts, ends)
+    if PartID is not None and len(lines)>1:
+        _Mesh.addPart(PartID, lines[0].strip(), int(lines[1][0:10]), int(lines[1][10:20]))
+
+def parseMatPlasTab(_Mesh, MatID, data, starts, ends):
+    # Title, density card and Young's modulus card
+    lines=cards(data, starts, ends)
+    if MatID is not None and len(lines)>2:
+        _Mesh.addMat(MatID, float(lines[1][0:20]), float(lines[2][0:20]))
+
+def parsePropShell(_Mesh, PropID, data, starts, ends):
+    # Title, two cards, thickness in the second field of the fourth card.
+    # Property IDs are stored as float like the line reader does.
+    lines=cards(data, starts, ends)
+    if PropID is not None and len(lines)>3:
+        _Mesh.addProp(float(PropID), float(lines[3][20:40]))
+
+Parsers={
+    "/NODE": parseNode,
+    "/SHELL": parseShell,
+    "/SH3N": parseSH3N,
+    "/PART": parsePart,
+    "/MAT/PLAS_TAB": parseMatPlasTab,
+    "/PROP/SHELL": parsePropShell,
+}
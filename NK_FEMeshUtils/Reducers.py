@@ -0,0 +1,103 @@
+from Mesh import Mesh as Mesh
+from NodeTable import NodeTable as NodeTable
+from ColumnTable import ColumnTable as ColumnTable
+import Geometry as Geometry
+import Thickness as Thickness
+import numpy as np
+
+# Reducers over the typed batches of MeshReaders.iterDynaMesh /
+# iterRadiossMesh. They keep per part sums instead of the elements, so the
+# memory used only depends on the number of nodes and parts.
+
+def shellSums(Nodes, Nodal, batch):
+    # Parts of a Shells batch and their sums: area, area of the shells with
+    # property thickness, volume of the others, number of shells
+    NodeRows=Nodes.getRows(batch['Conn'])
+    if (NodeRows<0).any():
+        raise KeyError(int(batch['Conn'][NodeRows<0][0]))
+    area=Geometry.shellAreas(Geometry.shellCorners(Nodes.getCoords(), NodeRows))
+    thick=batch['Thickness']
+    if len(Nodal)>0:
+        rows=Nodal.getRows(batch['Conn'])
+        nodal=np.where(rows>=0, Nodal.getColumn("Thickness")[rows], 0.0)
+        thick=np.where(thick>0.0, thick, Thickness.applyNodal(np.zeros(len(thick)), nodal, batch['NumNodes']))
+    Parts, inverse = np.unique(batch['PartIDs'], return_inverse=True)
+    return Parts, np.column_stack((np.bincount(inverse, weights=area, minlength=len(Parts)),
+                                   np.bincount(inverse, weights=area*(thick<=0.0), minlength=len(Parts)),
+                                   np.bincount(inverse, weights=area*np.maximum(thick, 0.0), minlength=len(Parts)),
+                                   np.bincount(inverse, minlength=len(Parts))))
+
+def addShells(sums, Nodes, Nodal, pending):
+    for batch in pending:
+        Parts, partsums = shellSums(Nodes, Nodal, batch)
+        for PartID, values in zip(Parts.tolist(), partsums):
+            if PartID in sums:
+                sums[PartID]=sums[PartID]+values
+            else:
+                sums[PartID]=values
+
+def partMassProperties(batches):
+    # Per part 'PartID', 'PartArea', 'PartVolume', 'PartMass' and
+    # 'PartNumElem' like Mesh.getMassProperties. The node block has to come
+    # before the shells, part cards may follow them: the property thickness
+    # and density are applied at the end. The thickness of a shell is
+    # resolved like in Mesh.getElemThicknesses once the nodal thicknesses
+    # following its batch (the *ELEMENT_SHELL_THICKNESS cards) are read:
+    # elemental, else nodal if all its nodes have one by then, else the
+    # property thickness. Elemental thicknesses which are not part of a shell
+    # batch are ignored.
+    Nodes=NodeTable()
+    Nodal=ColumnTable([("Thickness", np.float64, 0)]) # Nodal thicknesses read so far
+    Cards=Mesh("", "") # Part, material and property cards for getPartData
+    sums={} # PartID: [area, area with property thickness, volume of the others, number of shells]
+    pending=[] # Shells batches waiting for the nodal thicknesses which follow them
+    nodal=False # Nodal thicknesses read since the pending batches
+    for kind, batch in batches:
+        if kind=="NodalThickness":
+            rows=Nodal.newRows(batch['NodalThicknessIDs'])
+            Nodal.Thickness[rows]=batch['NodalThickness']
+            nodal=True
+            continue
+        if kind!="Shells" or nodal:
+            addShells(sums, Nodes, Nodal, pending)
+            pending=[]
+            nodal=False
+        if kind=="Nodes":
+            Nodes.extend(batch['NodeIDs'], batch['Coords'])
+        elif kind=="Shells":
+            pending.append(batch)
+        elif kind=="Parts":
+            for PartID, title, PropID, MatID in zip(batch['PartIDs'].tolist(), batch['Titles'], batch['PropIDs'].tolist(), batch['MatIDs'].tolist()):
+                Cards.addPart(PartID, title, PropID, MatID)
+        elif kind=="Materials":
+            for MatID, Rho, E in zip(batch['MatIDs'].tolist(), batch['Rho'].tolist(), batch['E'].tolist()):
+                Cards.addMat(MatID, Rho, E)
+        elif kind=="Properties":
+            for PropID, thickness in zip(batch['PropIDs'].tolist(), batch['Thickness'].tolist()):
+                Cards.addProp(PropID, thickness)
+    addShells(sums, Nodes, Nodal, pending)
+
+    PartIDs=np.array(sorted(sums.keys()), dtype=np.int64)
+    values=np.array([sums[PartID] for PartID in PartIDs.tolist()], dtype=np.float64).reshape(-1, 4)
+    data=[Cards.getPartData(PartID) for PartID in PartIDs.tolist()]
+    thick=np.array([part[2] for part in data], dtype=np.float64)
+    rho=np.array([part[4] for part in data], dtype=np.float64)
+    volume=values[:, 2]+values[:, 1]*thick
+    return {'PartID': PartIDs, 'PartArea': values[:, 0], 'PartVolume': volume,
+            'PartMass': volume*rho, 'PartNumElem': values[:, 3].astype(np.int64)}
+
+def partAreas(batches):
+    # {PartID: area}
+    props=partMassProperties(batches)
+    return dict(zip(props['PartID'].tolist(), props['PartArea'].tolist()))
+
+def countNodesInBox(batches, lower, upper):
+    # Number of nodes inside the axis aligned box [lower, upper]
+    lower=np.asarray(lower, dtype=np.float64)
+    upper=np.asarray(upper, dtype=np.float64)
+    count=0
+    for kind, batch in batches:
+        if kind=="Nodes":
+            Coords=batch['Coords']
+            count=count+int(((Coords>=lower)&(Coords<=upper)).all(axis=1).sum())
+    return count
@@ -0,0 +1,67 @@
+import numpy as np
+class RowIndex(object):
+
+    # Maps entity IDs to row numbers of a columnar table.
+    # Compact ID ranges use a dense lookup array, sparse ones fall back to a
+    # sorted copy of the IDs and a binary search.
+
+    def __init__(self):
+        self.lookup=np.zeros(0, dtype=np.int64)
+        self.sortedIDs=None
+        self.sortedRows=None
+
+    def isDense(self, IDmax, size):
+        return IDmax < 4*size+1024
+
+    def build(self, IDs):
+        IDs=np.asarray(IDs, dtype=np.int64)
+        self.lookup=None
+        self.sortedIDs=None
+        self.sortedRows=None
+        if len(IDs)==0:
+            self.lookup=np.zeros(0, dtype=np.int64)
+        elif IDs.min()>=0 and self.isDense(IDs.max(), len(IDs)):
+            self.lookup=np.full(IDs.max()+1, -1, dtype=np.int64)
+            self.lookup[IDs]=np.arange(len(IDs), dtype=np.int64)
+        else:
+            order=np.argsort(IDs, kind='mergesort')
+            self.sortedIDs=IDs[order]
+            self.sortedRows=order
+
+    def add(self, ID, row, size):
+        # Registers a single new row. Returns False if the index can not be
+        # updated in place and has to be rebuilt.
+        if self.lookup is None or ID<0:
+            return False
+        if ID>=len(self.lookup):
+            if not self.isDense(ID, size):
+                return False
+            lookup=np.full(max(ID+1, 2*len(self.lookup)), -1, dtype=np.int64)
+            lookup[:len(self.lookup)]=self.lookup
+            self.lookup=lookup
+        self.lookup[ID]=row
+        return True
+
+    def getRow(self, ID):
+        if self.lookup is not None:
+            if 0<=ID<len(self.lookup):
+                return int(self.lookup[ID])
+            return -1
+        pos=np.searchsorted(self.sortedIDs, ID)
+        if pos<len(self.sortedIDs) and self.sortedIDs[pos]==ID:
+            return int(self.sortedRows[pos])
+        return -1
+
+    def getRows(self, IDs):
+        # Vectorized lookup, missing IDs are returned as row -1
+        IDs=np.asarray(IDs, dtype=np.int64)
+        rows=np.full(IDs.shape, -1, dtype=np.int64)
+        if self.lookup is not None:
+            valid=(IDs>=0)&(IDs<len(self.lookup))
+            rows[valid]=self.lookup[IDs[valid]]
+        elif len(self.sortedIDs)>0:
+            pos=np.searchsorted(self.sortedIDs, IDs)
+            pos[pos>=len(self.sortedIDs)]=len(self.sortedIDs)-1
+            found=self.sortedIDs[pos]==IDs
+            rows[found]=self.sortedRows[pos[found]]
+        return rows
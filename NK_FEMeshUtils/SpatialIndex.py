@@ -0,0 +1,82 @@
+from scipy.spatial import cKDTree
+import numpy as np
+class SpatialIndex(object):
+
+    # Spatial index over node coordinates for nearest node, k nearest,
+    # radius and axis aligned box queries. Queries take one point (3,) or a
+    # batch of points (n, 3) and return node ID arrays, -1 where no node was
+    # found. The KD-tree and the x sorted order used for box queries are
+    # built on first use. Returned by Mesh.getSpatialIndex, which builds a
+    # new index once nodes were added or moved.
+
+    def __init__(self, NodeIDs, Coords):
+        self.NodeIDs=np.asarray(NodeIDs, dtype=np.int64)
+        self.Coords=np.asarray(Coords, dtype=np.float64).reshape(-1, 3)
+        self.Tree=None
+        self.XOrder=None # Node rows sorted by x
+        self.XSorted=None
+
+    def __len__(self):
+        return len(self.NodeIDs)
+
+    def getTree(self):
+        if self.Tree is None:
+            self.Tree=cKDTree(self.Coords)
+        return self.Tree
+
+    def getIDs(self, rows):
+        # Node IDs of KD-tree rows, -1 for the row len(self) used for misses
+        return np.append(self.NodeIDs, -1)[rows]
+
+    def getNearest(self, points, maxdist=None):
+        # ID of the nearest node of every point, -1 if there is none within maxdist
+        return self.getKNearest(points, 1, maxdist)[:, 0]
+
+    def getKNearest(self, points, k, maxdist=None):
+        # (n, k) IDs of the k nearest nodes of every point sorted by distance,
+        # -1 where there are less than k nodes (within maxdist)
+        points=np.asarray(points, dtype=np.float64).reshape(-1, 3)
+        if len(self)==0:
+            return np.full((len(points), k), -1, dtype=np.int64)
+        bound=np.inf if maxdist is None else maxdist
+        dist, rows = self.getTree().query(points, k, distance_upper_bound=bound)
+        return self.getIDs(np.asarray(rows).reshape(len(points), k))
+
+    def getDistances(self, points):
+        # Distance of every point to its nearest node
+        points=np.asarray(points, dtype=np.float64).reshape(-1, 3)
+        if len(self)==0:
+            return np.full(len(points), np.inf)
+        return self.getTree().query(points, 1)[0]
+
+    def getInRadius(self, points, radius):
+        # Sorted IDs of the nodes within radius of a point (3,),
+        # a list of them for a batch of points (n, 3)
+        points=np.asarray(points, dtype=np.float64)
+        batch=points.ndim==2
+        points=points.reshape(-1, 3)
+        if len(self)==0:
+            result=[np.zeros(0, dtype=np.int64) for point in points]
+        else:
+            rows=self.getTree().query_ball_point(points, radius)
+            result=[np.sort(self.NodeIDs[np.array(row, dtype=np.int64)]) for row in rows]
+        return result if batch else result[0]
+
+    def getInBox(self, lower, upper):
+        # Sorted IDs of the nodes inside the box [lower, upper] (bounds
+        # included), a list of them for batches of boxes (n, 3)
+        lower=np.asarray(lower, dtype=np.float64)
+        upper=np.asarray(upper, dtype=np.float64)
+        batch=lower.ndim==2
+        if self.XOrder is None:
+            self.XOrder=np.argsort(self.Coords[:, 0], kind='mergesort')
+            self.XSorted=self.Coords[self.XOrder, 0]
+        first=np.searchsorted(self.XSorted, lower.reshape(-1, 3)[:, 0], side='left')
+        last=np.searchsorted(self.XSorted, upper.reshape(-1, 3)[:, 0], side='right')
+        result=[]
+        for a, b, low, up in zip(first.tolist(), last.tolist(), lower.reshape(-1, 3), upper.reshape(-1, 3)):
+            rows=self.XOrder[a:b]
+            Coords=self.Coords[rows]
+            inside=(Coords[:, 1]>=low[1])&(Coords[:, 1]<=up[1])&(Coords[:, 2]>=low[2])&(Coords[:, 2]<=up[2])
+            result.append(np.sort(self.NodeIDs[rows[inside]]))
+        return result if batch else result[0]
@@ -0,0 +1,39 @@
+import numpy as np
+
+# Effective shell thickness, one resolution for Mesh.getElemThicknesses,
+# the Part objects (through the element thickness set by InitPartObjs) and
+# the stream Reducers: the elemental thickness where defined, else the
+# average of the nodal thicknesses (TRB) if all nodes have one > 0, else
+# the property thickness. The elemental thickness is applied by the
+# callers, they store it differently.
+
+def sortedNodal(Nodalthickness):
+    # Sorted node IDs and values of an {NodeID: thickness} dictionary
+    NodeIDs=np.array(Nodalthickness.keys(), dtype=np.int64)
+    values=np.array(Nodalthickness.values(), dtype=np.float64)
+    order=np.argsort(NodeIDs)
+    return NodeIDs[order], values[order]
+
+def nodalValues(NodeIDs, values, Conn):
+    # (n, 4) thicknesses of the nodes in Conn from sorted node IDs and their
+    # values, 0.0 for nodes without one
+    if len(NodeIDs)==0:
+        return np.zeros(Conn.shape, dtype=np.float64)
+    pos=np.minimum(np.searchsorted(NodeIDs, Conn), len(NodeIDs)-1)
+    return np.where(NodeIDs[pos]==Conn, values[pos], 0.0)
+
+def nodalAverage(nodal, NumNodes):
+    # Average of the nodal thicknesses (trias over their three nodes, nodes
+    # without one count 0) and the mask of the elements whose nodes all have
+    # one > 0
+    tria=NumNodes==3
+    nodal=np.array(nodal, dtype=np.float64)
+    nodal[tria, 3]=0.0
+    valid=(nodal[:, 0:3]>0.0).all(axis=1)&(tria|(nodal[:, 3]>0.0))
+    return nodal.sum(axis=1)/np.where(tria, 3.0, 4.0), valid
+
+def applyNodal(thick, nodal, NumNodes):
+    # thick (property thickness per element) with the nodal average where
+    # it is valid
+    average, valid = nodalAverage(nodal, NumNodes)
+    return np.where(valid, average, thick)
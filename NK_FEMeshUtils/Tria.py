@@ -1,6 +1,8 @@
 from Element import Element
 import numpy as np
 class Tria(Element):
+    __slots__ = ()
+
     def __init__(self, ElemID, PartID, Node1, Node2, Node3):
         self.thickness = 0.0
         self.ElemID = ElemID
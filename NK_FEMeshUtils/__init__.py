@@ -5,5 +5,13 @@ from Quad import Quad
 from Material import Material
 from Property import Property
 from Part import Part
+from PartView import PartView
+from NodeTable import NodeTable
+from ElemTable import ElemTable
 from Mesh import Mesh
+from KeywordIndex import KeywordIndex
+from SpatialIndex import SpatialIndex
+from Adjacency import Adjacency
+from Metrics import Metrics
+from BatchCollector import BatchCollector
 from MeshReaders import MeshReaders
\ No newline at end of file
@@ -0,0 +1,160 @@
+# End to end benchmark of NK_FEMeshUtils and cNK_FEMeshUtils on synthetic decks.
+# Generates an LS-Dyna and a Radioss deck (benchmarks.synthetic) and times
+# every stage: read, InitAllObj, area/mass, bounds, writeDynaMesh and
+# writeRadiossMesh. Results are printed and written to a JSON file, runs of
+# different versions (or of both packages) are compared with --compare.
+#
+# Usage: python -m benchmarks.end_to_end [--packages NK_FEMeshUtils,cNK_FEMeshUtils]
+#            [--parts 20] [--nx 200] [--ny 100] [--triaevery 7] [--trbparts 2,3]
+#            [--columnar] [--repeat 1] [--output end_to_end.json]
+#        python -m benchmarks.end_to_end --compare old.json new.json
+
+import argparse
+import datetime
+import importlib
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import numpy as np
+from benchmarks import synthetic
+
+def timed(stages, name, function, repeat=1):
+    # Best time of repeat calls of function in stages[name], returns its result
+    times=[]
+    for i in xrange(repeat):
+        start_time=time.time()
+        result=function()
+        times.append(time.time()-start_time)
+    stages[name]=min(times)
+    return result
+
+def bounds(_Mesh):
+    # Bounds from scratch: the cached boxes are dropped first
+    _Mesh.Bounds=None
+    _Mesh.getBounds()
+    return _Mesh.getRectangleBounds()
+
+def orientedBounds(_Mesh):
+    _Mesh.OrientedBounds={}
+    return [_Mesh.getOrientedBounds(PartID) for PartID in _Mesh.getElemTable().getPartGroups()[0].tolist()]
+
+def objectMasses(_Mesh):
+    # Part masses through the object structure (needs InitAllObj)
+    return [part.getPartMass() for part in _Mesh.getPartlistObj().values()]
+
+def counts(_Mesh):
+    Elems=_Mesh.getElemTable()
+    Conn=Elems.getConn()
+    trias=int(((Elems.getNumNodes()==3)|(Conn[:, 2]==Conn[:, 3])).sum())
+    return {'Nodes': len(_Mesh.Nodelist), 'Shells': len(Elems), 'Trias': trias, 'Parts': len(_Mesh.Partlist),
+            'NodalThickness': len(_Mesh.Nodalthickness), 'ElementalThickness': len(_Mesh.Elementalthickness)}
+
+def run(package, dyna, radioss, trbparts, columnar=False, repeat=1):
+    # Stage times [s] and entity counts of one package
+    module=importlib.import_module(package)
+    Reader=module.MeshReaders()
+    out=tempfile.mkdtemp()
+    stages={}
+    try:
+        _Mesh=timed(stages, 'readDynaMesh', lambda: Reader.readDynaMesh(dyna, columnar), repeat)
+        dynacounts=counts(_Mesh)
+        timed(stages, 'InitAllObj', _Mesh.InitAllObj, repeat)
+        timed(stages, 'getMassProperties', _Mesh.getMassProperties, repeat)
+        timed(stages, 'objectMasses', lambda: objectMasses(_Mesh), repeat)
+        timed(stages, 'getBounds', lambda: bounds(_Mesh), repeat)
+        timed(stages, 'getOrientedBounds', lambda: orientedBounds(_Mesh), repeat)
+        _Mesh.NUTProps=list(trbparts)
+        timed(stages, 'writeDynaMesh', lambda: Reader.writeDynaMesh(_Mesh, os.path.join(out, "out.k")), repeat)
+        _Mesh=None
+        _Mesh=timed(stages, 'readRadiossMesh', lambda: Reader.readRadiossMesh(radioss, columnar), repeat)
+        radiosscounts=counts(_Mesh)
+        _Mesh.NUTProps=list(trbparts)
+        timed(stages, 'writeRadiossMesh', lambda: Reader.writeRadiossMesh(_Mesh, os.path.join(out, "out.rad")), repeat)
+    finally:
+        shutil.rmtree(out)
+    throughput={'readDynaMesh MB/s': os.path.getsize(dyna)/1e6/stages['readDynaMesh'],
+                'readRadiossMesh MB/s': os.path.getsize(radioss)/1e6/stages['readRadiossMesh'],
+                'readDynaMesh shells/s': dynacounts['Shells']/stages['readDynaMesh'],
+                'InitAllObj shells/s': dynacounts['Shells']/stages['InitAllObj']}
+    return {'package': package, 'module': os.path.dirname(module.__file__), 'stages': stages,
+            'throughput': throughput, 'counts': {'LS-Dyna': dynacounts, 'Radioss': radiosscounts}}
+
+def revision():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], stderr=subprocess.STDOUT,
+                                       cwd=os.path.dirname(os.path.abspath(__file__))).strip()
+    except Exception:
+        return None
+
+def main(packages, nparts=20, nx=200, ny=100, triaevery=7, trbparts=(2,), columnar=False, repeat=1, output=None):
+    directory=tempfile.mkdtemp()
+    dyna=os.path.join(directory, "end_to_end.k")
+    radioss=os.path.join(directory, "end_to_end.rad")
+    try:
+        synthetic.writeDynaDeck(dyna, nparts, nx, ny, triaevery, trbparts)
+        synthetic.writeRadiossDeck(radioss, nparts, nx, ny, triaevery, trbparts)
+        deck={'parts': nparts, 'nx': nx, 'ny': ny, 'triaevery': triaevery, 'trbparts': list(trbparts),
+              'LS-Dyna MB': os.path.getsize(dyna)/1e6, 'Radioss MB': os.path.getsize(radioss)/1e6}
+        results=[run(package, dyna, radioss, trbparts, columnar, repeat) for package in packages]
+    finally:
+        shutil.rmtree(directory)
+    report={'date': datetime.datetime.now().strftime('%Y/%m/%d %H:%M:%S'), 'revision': revision(),
+            'python': platform.python_version(), 'numpy': np.__version__, 'columnar': columnar,
+            'repeat': repeat, 'deck': deck, 'results': results}
+    printReport(report)
+    if output is not None:
+        with open(output, "w") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+    return report
+
+def printReport(report):
+    print "Deck: {0} parts x {1} shells, LS-Dyna {2:.1f} MB, Radioss {3:.1f} MB".format(
+        report['deck']['parts'], report['deck']['nx']*report['deck']['ny'],
+        report['deck']['LS-Dyna MB'], report['deck']['Radioss MB'])
+    results=report['results']
+    print "{0:<20}".format("Stage [s]")+"".join("{0:>18}".format(result['package']) for result in results)
+    for stage in sorted(results[0]['stages'].keys()):
+        print "{0:<20}".format(stage)+"".join("{0:>18.3f}".format(result['stages'][stage]) for result in results)
+
+def compare(old, new):
+    # Stage times of two JSON reports side by side, ratio new/old per package
+    with open(old) as f:
+        old=json.load(f)
+    with open(new) as f:
+        new=json.load(f)
+    for result in new['results']:
+        before=[r for r in old['results'] if r['package']==result['package']]
+        if len(before)==0:
+            continue
+        print result['package']
+        print "{0:<20}{1:>10}{2:>10}{3:>8}".format("Stage [s]", "old", "new", "ratio")
+        for stage in sorted(result['stages'].keys()):
+            if stage in before[0]['stages']:
+                a=before[0]['stages'][stage]
+                b=result['stages'][stage]
+                print "{0:<20}{1:>10.3f}{2:>10.3f}{3:>8.2f}".format(stage, a, b, b/a if a>0 else float('nan'))
+
+if __name__ == "__main__":
+    parser=argparse.ArgumentParser(description="End to end benchmark on synthetic decks")
+    parser.add_argument("--packages", default="NK_FEMeshUtils", help="comma separated packages to benchmark")
+    parser.add_argument("--parts", type=int, default=20)
+    parser.add_argument("--nx", type=int, default=200, help="shells per part in x")
+    parser.add_argument("--ny", type=int, default=100, help="shells per part in y")
+    parser.add_argument("--triaevery", type=int, default=7, help="every n-th shell is a tria, 0 for none")
+    parser.add_argument("--trbparts", default="2", help="comma separated parts with nodal thickness")
+    parser.add_argument("--columnar", action="store_true")
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--output", default="end_to_end.json")
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"))
+    args=parser.parse_args()
+    if args.compare:
+        compare(*args.compare)
+        sys.exit(0)
+    trbparts=tuple(int(PartID) for PartID in args.trbparts.split(",") if PartID.strip())
+    main(args.packages.split(","), args.parts, args.nx, args.ny, args.triaevery, trbparts, args.columnar,
+         args.repeat, args.output)
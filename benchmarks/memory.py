@@ -0,0 +1,64 @@
+# Memory benchmark for the object structure.
+# Compares the bytes per entity of the slotted classes with the previous
+# layout (old-style classes with a per instance __dict__). Sizes are the
+# shallow object sizes (instance + attribute dictionary), attribute values
+# are shared between both variants and therefore not counted.
+#
+# Usage: python -m benchmarks.memory [NumEntities]
+
+import sys
+import types
+import NK_FEMeshUtils
+
+def unslotted(cls, bases=()):
+    # Old-style copy of a slotted class, i.e. the layout before __slots__
+    attrs={}
+    for name, value in cls.__dict__.items():
+        if name not in cls.__slots__ and name not in ('__slots__', '__dict__', '__weakref__'):
+            attrs[name]=value
+    return types.ClassType(cls.__name__, bases, attrs)
+
+def sizeOf(obj):
+    size=sys.getsizeof(obj)
+    if hasattr(obj, '__dict__'):
+        size=size+sys.getsizeof(obj.__dict__)
+    return size
+
+def bytesPerEntity(factory, n):
+    objs=[factory(i) for i in xrange(n)]
+    return sum(sizeOf(obj) for obj in objs)/float(n)
+
+def classes(slotted):
+    if slotted:
+        return {'Node': NK_FEMeshUtils.Node, 'Tria': NK_FEMeshUtils.Tria, 'Quad': NK_FEMeshUtils.Quad,
+                'Material': NK_FEMeshUtils.Material, 'Property': NK_FEMeshUtils.Property, 'Part': NK_FEMeshUtils.Part}
+    Element=unslotted(NK_FEMeshUtils.Element)
+    return {'Node': unslotted(NK_FEMeshUtils.Node), 'Tria': unslotted(NK_FEMeshUtils.Tria, (Element,)),
+            'Quad': unslotted(NK_FEMeshUtils.Quad, (Element,)), 'Material': unslotted(NK_FEMeshUtils.Material),
+            'Property': unslotted(NK_FEMeshUtils.Property), 'Part': unslotted(NK_FEMeshUtils.Part)}
+
+def measure(slotted, n):
+    c=classes(slotted)
+    nodes=[c['Node'](i, 0.0, 0.0, 0.0) for i in xrange(4)]
+    mat=c['Material'](1, 7.9E-6, 210)
+    prop=c['Property'](1, 1.0)
+    return {'Node': bytesPerEntity(lambda i: c['Node'](i, 0.0, 0.0, 0.0), n),
+            'Tria': bytesPerEntity(lambda i: c['Tria'](i, 1, *nodes[:3]), n),
+            'Quad': bytesPerEntity(lambda i: c['Quad'](i, 1, *nodes), n),
+            'Material': bytesPerEntity(lambda i: c['Material'](i, 7.9E-6, 210), n),
+            'Property': bytesPerEntity(lambda i: c['Property'](i, 1.0), n),
+            'Part': bytesPerEntity(lambda i: c['Part'](i, "Part", mat, prop), n)}
+
+def main(n=100000):
+    before=measure(False, n)
+    after=measure(True, n)
+    print "{0:<10}{1:>12}{2:>12}{3:>10}".format("Class", "before [B]", "after [B]", "saving")
+    for name in ('Node', 'Tria', 'Quad', 'Material', 'Property', 'Part'):
+        print "{0:<10}{1:>12.1f}{2:>12.1f}{3:>9.0f}%".format(name, before[name], after[name], 100*(1-after[name]/before[name]))
+    return before, after
+
+if __name__ == "__main__":
+    if len(sys.argv)>1:
+        main(int(sys.argv[1]))
+    else:
+        main()
@@ -0,0 +1,47 @@
+# Scaling of the parallel readers with the number of worker processes.
+# Reads a deck (a synthetic one if no file is given) with 1 to N workers and
+# prints the read time and speedup for each worker count.
+#
+# Usage: python -m benchmarks.parallel_read [MaxWorkers] [Deck]
+
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+import NK_FEMeshUtils
+from benchmarks import synthetic
+
+def timeRead(file, workers, repeat=3):
+    Reader=NK_FEMeshUtils.MeshReaders()
+    times=[]
+    for i in xrange(repeat):
+        start_time=time.time()
+        if file.endswith(".rad"):
+            Reader.readRadiossMesh(file, True, workers)
+        else:
+            Reader.readDynaMesh(file, True, workers=workers)
+        times.append(time.time()-start_time)
+    return min(times)
+
+def main(maxworkers=None, file=None):
+    if maxworkers is None:
+        maxworkers=multiprocessing.cpu_count()
+    generated=file is None
+    if generated:
+        file=os.path.join(tempfile.mkdtemp(), "parallel_read.k")
+        synthetic.writeDynaDeck(file, nparts=40, nx=200, ny=100)
+    print "Deck: {0} ({1:.1f} MB)".format(file, os.path.getsize(file)/1e6)
+    print "{0:>8}{1:>12}{2:>10}".format("Workers", "Time [s]", "Speedup")
+    results={}
+    workers=1
+    while workers<=maxworkers:
+        results[workers]=timeRead(file, workers)
+        print "{0:>8}{1:>12.3f}{2:>10.2f}".format(workers, results[workers], results[1]/results[workers])
+        workers=workers*2
+    if generated:
+        os.remove(file)
+    return results
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv)>1 else None, sys.argv[2] if len(sys.argv)>2 else None)
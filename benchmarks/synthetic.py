@@ -0,0 +1,86 @@
+# Synthetic LS-Dyna and Radioss decks for benchmarking.
+# Every part is a flat, slightly waved patch of nx x ny shells. Every
+# triaevery-th shell is a degenerated quad (tria), the shells of the parts
+# in trbparts are written as *ELEMENT_SHELL_THICKNESS with nodal thickness.
+
+import numpy as np
+
+def partPatch(nx, ny, offset, firstNode, firstElem, triaevery=0):
+    # Node IDs, coordinates, element IDs and connectivity (n, 4) of one part
+    x, y = np.meshgrid(np.arange(nx+1)*1.5, np.arange(ny+1)*1.25)
+    NodeIDs=firstNode+np.arange((nx+1)*(ny+1)).reshape(ny+1, nx+1)
+    Coords=np.column_stack((x.ravel()+offset, y.ravel(), 0.1*np.sin(x.ravel())))
+    Conn=np.column_stack((NodeIDs[:-1, :-1].ravel(), NodeIDs[:-1, 1:].ravel(), NodeIDs[1:, 1:].ravel(), NodeIDs[1:, :-1].ravel()))
+    if triaevery>0:
+        Conn[::triaevery, 3]=Conn[::triaevery, 2]
+    ElemIDs=firstElem+np.arange(len(Conn))
+    return NodeIDs.ravel(), Coords, ElemIDs, Conn
+
+def patches(nparts, nx, ny, triaevery):
+    result=[]
+    firstNode=1
+    firstElem=1
+    for PartID in xrange(1, nparts+1):
+        NodeIDs, Coords, ElemIDs, Conn = partPatch(nx, ny, PartID*(nx+10)*1.5, firstNode, firstElem, triaevery)
+        result.append((PartID, NodeIDs, Coords, ElemIDs, Conn))
+        firstNode=NodeIDs[-1]+1
+        firstElem=ElemIDs[-1]+1
+    return result
+
+def writeRows(f, fmt, rows):
+    for i in xrange(0, len(rows), 100000):
+        chunk=rows[i:i+100000]
+        f.write((fmt*len(chunk)) % tuple(chunk.ravel().tolist()))
+
+def writeDynaDeck(file, nparts=10, nx=100, ny=50, triaevery=7, trbparts=(2,)):
+    parts=patches(nparts, nx, ny, triaevery)
+    with open(file, "w") as f:
+        f.write("*KEYWORD\n$ Synthetic deck, "+str(nparts)+" parts with "+str(nx*ny)+" shells each\n")
+        f.write("*NODE\n$#   nid               x               y               z\n")
+        for PartID, NodeIDs, Coords, ElemIDs, Conn in parts:
+            writeRows(f, "%8i%16.6f%16.6f%16.6f\n", np.column_stack((NodeIDs, Coords)))
+        f.write("*ELEMENT_SHELL\n$#   eid     pid      n1      n2      n3      n4\n")
+        for PartID, NodeIDs, Coords, ElemIDs, Conn in parts:
+            if PartID not in trbparts:
+                writeRows(f, "%8i%8i%8i%8i%8i%8i\n", np.column_stack((ElemIDs, np.full(len(ElemIDs), PartID), Conn)))
+        if len(trbparts)>0:
+            f.write("*ELEMENT_SHELL_THICKNESS\n")
+        for PartID, NodeIDs, Coords, ElemIDs, Conn in parts:
+            if PartID in trbparts:
+                thick=1.0+0.001*(Conn%13)
+                rows=np.column_stack((ElemIDs, np.full(len(ElemIDs), PartID), Conn, thick))
+                writeRows(f, "%8i%8i%8i%8i%8i%8i\n%16.8f%16.8f%16.8f%16.8f\n", rows)
+        for PartID in xrange(1, nparts+1):
+            f.write("*PART\nPart "+str(PartID)+"\n%10i%10i%10i\n" % (PartID, PartID, 1000+PartID))
+            f.write("*SECTION_SHELL\n%10i\n%10.3f\n" % (PartID, 0.8+0.1*PartID))
+            f.write("*MAT_PIECEWISE_LINEAR_PLASTICITY\n%10i%10.3e%10.1f\n" % (1000+PartID, 7.85e-9, 210000.0))
+        f.write("*END\n")
+
+def writeRadiossDeck(file, nparts=10, nx=100, ny=50, triaevery=7, thickparts=(2,)):
+    # Trias are written as /SH3N, the shells of thickparts carry an
+    # elemental thickness in column 91-100
+    parts=patches(nparts, nx, ny, triaevery)
+    with open(file, "w") as f:
+        f.write("#RADIOSS STARTER\n/BEGIN\nSynthetic deck\n")
+        f.write("/NODE\n#   NODID                   X                   Y                   Z\n")
+        for PartID, NodeIDs, Coords, ElemIDs, Conn in parts:
+            writeRows(f, "%10i%20.6f%20.6f%20.6f\n", np.column_stack((NodeIDs, Coords)))
+        for PartID, NodeIDs, Coords, ElemIDs, Conn in parts:
+            quads=Conn[:, 2]!=Conn[:, 3]
+            thick=np.zeros(len(ElemIDs))
+            if PartID in thickparts:
+                thick=1.0+0.01*(ElemIDs%5)
+            f.write("/SHELL/"+str(PartID)+"\n#  shell_ID     node_ID1  node_ID2  node_ID3  node_ID4\n")
+            rows=np.column_stack((ElemIDs[quads], Conn[quads], thick[quads]))
+            writeRows(f, "%10i%10i%10i%10i%10i"+" "*40+"%10.4f\n", rows)
+            f.write("/SH3N/"+str(PartID)+"\n")
+            if PartID in thickparts:
+                rows=np.column_stack((ElemIDs[~quads], Conn[~quads, :3], thick[~quads]))
+                writeRows(f, "%10i%10i%10i%10i"+" "*50+"%10.4f\n", rows)
+            else:
+                writeRows(f, "%10i%10i%10i%10i\n", np.column_stack((ElemIDs[~quads], Conn[~quads, :3])))
+        for PartID in xrange(1, nparts+1):
+            f.write("/PART/"+str(PartID)+"\nPart "+str(PartID)+"\n%10i%10i\n" % (PartID, 1000+PartID))
+            f.write("/PROP/SHELL/"+str(PartID)+"\nProperty\n#\n         0         0\n                   0\n%20s%20.4f\n" % ("", 0.8+0.1*PartID))
+            f.write("/MAT/PLAS_TAB/"+str(1000+PartID)+"\nMaterial\n%20.6e\n%20.6e\n" % (7.85e-9, 210000.0))
+        f.write("/END\n")
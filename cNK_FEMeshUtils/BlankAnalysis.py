@@ -0,0 +1,84 @@
+import Geometry as Geometry
+import numpy as np
+
+# Blank sizing and scrap estimation for sheet parts.
+# The nodes of a part are projected onto its best fit plane, the smallest
+# rectangle around their convex hull is the blank. Rectangles are evaluated
+# for all hull edge directions (the exact minimum) or for any number of given
+# orientations at once. The part area comes from Mesh.getMassProperties.
+
+def projectPart(_Mesh, PartID):
+    # 2D coordinates (n, 2) of the nodes of a part in its best fit plane,
+    # the plane center and axes (see Geometry.bestFitPlane)
+    rows=_Mesh.getElemTable().getPartRows(PartID)
+    if len(rows)==0:
+        raise KeyError(PartID)
+    Points=_Mesh.getNodeTable().getCoords()[np.unique(_Mesh.getNodeRowsOfElems(rows))]
+    center, axes = Geometry.bestFitPlane(Points)
+    return (Points-center).dot(axes[0:2].T), center, axes
+
+def hullArea(Hull):
+    # Area of a counterclockwise polygon (k, 2)
+    x=Hull[:, 0]
+    y=Hull[:, 1]
+    return 0.5*abs(float((x*np.roll(y, -1)-np.roll(x, -1)*y).sum()))
+
+def rectangleAreas(Hull, angles):
+    # Length, width and area of the rectangles around Hull with their first
+    # side in the directions angles (radians), all angles at once
+    angles=np.asarray(angles, dtype=np.float64).ravel()
+    c=np.cos(angles)
+    s=np.sin(angles)
+    u=np.outer(Hull[:, 0], c)+np.outer(Hull[:, 1], s)
+    v=np.outer(Hull[:, 1], c)-np.outer(Hull[:, 0], s)
+    length=u.max(axis=0)-u.min(axis=0)
+    width=v.max(axis=0)-v.min(axis=0)
+    return length, width, length*width
+
+def analyzeHull(Hull, angles=None, margin=0.0):
+    # Blank of a hull: [angle, length, width, area], margin added on every side.
+    # angles=None finds the exact minimum, otherwise the best of the angles.
+    if angles is None:
+        direction, limits, area = Geometry.minAreaRectangle(Hull)
+        angles=[np.arctan2(direction[1], direction[0])]
+    length, width, area = rectangleAreas(Hull, angles)
+    length=length+2*margin
+    width=width+2*margin
+    i=int(np.argmin(length*width))
+    return [float(np.asarray(angles).ravel()[i]), float(length[i]), float(width[i]), float(length[i]*width[i])]
+
+def analyzePart(_Mesh, PartID, angles=None, margin=0.0):
+    # Blank of one part, see analyzeParts
+    result=analyzeParts(_Mesh, [PartID], angles, margin)
+    return dict([(key, value[0]) for key, value in result.items()])
+
+def analyzeParts(_Mesh, PartIDs=None, angles=None, margin=0.0):
+    # Blank size and scrap of all parts (or the given ones) as dictionary of
+    # arrays: 'PartID', 'PartArea', 'HullArea' (projected convex hull),
+    # 'BlankAngle' (direction of the blank length in the plane, radians from
+    # the first plane axis), 'BlankLength', 'BlankWidth', 'BlankArea',
+    # 'Scrap' (BlankArea-PartArea) and 'Utilization' (PartArea/BlankArea)
+    props=_Mesh.getMassProperties()
+    if PartIDs is None:
+        PartIDs=props['PartID']
+    PartIDs=np.asarray(PartIDs, dtype=np.int64).ravel()
+    pos=np.minimum(np.searchsorted(props['PartID'], PartIDs), max(len(props['PartID'])-1, 0))
+    found=(len(props['PartID'])>0)&(props['PartID'][pos]==PartIDs)
+    if not found.all():
+        raise KeyError(int(PartIDs[~found][0]))
+    PartArea=props['PartArea'][pos]
+    blanks=[]
+    hulls=[]
+    for PartID in PartIDs.tolist():
+        Hull=Geometry.convexHull(projectPart(_Mesh, PartID)[0])
+        hulls.append(hullArea(Hull))
+        blank=analyzeHull(Hull, angles, margin)
+        if blank[2]>blank[1]:
+            blank=[blank[0]+np.pi/2, blank[2], blank[1], blank[3]]
+        blanks.append(blank)
+    blanks=np.array(blanks, dtype=np.float64).reshape(-1, 4)
+    BlankArea=blanks[:, 3]
+    return {'PartID': PartIDs, 'PartArea': PartArea, 'HullArea': np.array(hulls, dtype=np.float64),
+            'BlankAngle': np.mod(blanks[:, 0], np.pi), 'BlankLength': blanks[:, 1], 'BlankWidth': blanks[:, 2],
+            'BlankArea': BlankArea, 'Scrap': BlankArea-PartArea,
+            'Utilization': np.where(BlankArea>0.0, PartArea/np.where(BlankArea>0.0, BlankArea, 1.0), 0.0)}
@@ -0,0 +1,142 @@
+from RowIndex import RowIndex as RowIndex
+import numpy as np
+class ColumnTable(object):
+
+    # Base class of the columnar node and element storage.
+    # Every entity is one row over a set of contiguous NumPy columns. The IDs
+    # column is mandatory, subclasses add their own columns in self.columns.
+    # Rows are appended to preallocated buffers which grow by doubling.
+    # The ID -> row index is updated in place where possible and rebuilt
+    # lazily otherwise. Adding an existing ID overwrites its row, so the
+    # table behaves like the ID keyed dictionaries it replaces.
+
+    def __init__(self, columns):
+        # columns: list of (name, dtype, width) tuples, width 0 for 1D columns
+        self.columns=[("IDs", np.int64, 0)]+columns
+        for name, dtype, width in self.columns:
+            if width==0:
+                setattr(self, name, np.zeros(0, dtype=dtype))
+            else:
+                setattr(self, name, np.zeros((0, width), dtype=dtype))
+        self.size=0
+        self.Index=RowIndex()
+        self.indexValid=True
+
+    def reserve(self, capacity):
+        if capacity<=len(self.IDs):
+            return
+        capacity=max(capacity, 2*len(self.IDs), 1024)
+        for name, dtype, width in self.columns:
+            old=getattr(self, name)
+            if width==0:
+                new=np.zeros(capacity, dtype=dtype)
+            else:
+                new=np.zeros((capacity, width), dtype=dtype)
+            new[:self.size]=old[:self.size]
+            setattr(self, name, new)
+
+    def newRow(self, ID):
+        # Returns the row for ID, a new one if the ID is not stored yet
+        if self.indexValid:
+            row=self.Index.getRow(ID)
+            if row>=0:
+                return row
+        self.reserve(self.size+1)
+        row=self.size
+        self.IDs[row]=ID
+        self.size=self.size+1
+        if self.indexValid:
+            self.indexValid=self.Index.add(ID, row, self.size)
+        return row
+
+    def newRows(self, IDs):
+        # Appends a block of rows and returns the slice they occupy.
+        # Duplicates are resolved on the next index update.
+        n=len(IDs)
+        self.reserve(self.size+n)
+        rows=slice(self.size, self.size+n)
+        self.IDs[rows]=IDs
+        self.size=self.size+n
+        self.indexValid=False
+        return rows
+
+    def update(self):
+        # Removes overwritten rows (the last one wins) and rebuilds the index
+        if self.indexValid:
+            return
+        IDs=self.IDs[:self.size]
+        unique, lastpos=np.unique(IDs[::-1], return_index=True)
+        if len(unique)!=self.size:
+            keep=np.sort(self.size-1-lastpos)
+            for name, dtype, width in self.columns:
+                col=getattr(self, name)
+                col[:len(keep)]=col[keep]
+            self.size=len(keep)
+        self.Index.build(self.IDs[:self.size])
+        self.indexValid=True
+
+    def getColumn(self, name):
+        self.update()
+        return getattr(self, name)[:self.size]
+
+    def getIDs(self):
+        return self.getColumn("IDs")
+
+    def getRow(self, ID):
+        self.update()
+        return self.Index.getRow(ID)
+
+    def getRows(self, IDs):
+        self.update()
+        return self.Index.getRows(IDs)
+
+    def getExistingRow(self, ID):
+        row=self.getRow(ID)
+        if row<0:
+            raise KeyError(ID)
+        return row
+
+    # Dictionary interface
+
+    def __len__(self):
+        self.update()
+        return self.size
+
+    def __contains__(self, ID):
+        return self.getRow(ID)>=0
+
+    def has_key(self, ID):
+        return ID in self
+
+    def __getitem__(self, ID):
+        return self.getValue(self.getExistingRow(ID))
+
+    def get(self, ID, default=None):
+        row=self.getRow(ID)
+        if row<0:
+            return default
+        return self.getValue(row)
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def iterkeys(self):
+        return iter(self.keys())
+
+    def keys(self):
+        return self.getIDs().tolist()
+
+    def itervalues(self):
+        for row in xrange(len(self)):
+            yield self.getValue(row)
+
+    def values(self):
+        return list(self.itervalues())
+
+    def iteritems(self):
+        IDs=self.getIDs().tolist()
+        for row in xrange(len(IDs)):
+            yield IDs[row], self.getValue(row)
+
+    def items(self):
+        return list(self.iteritems())
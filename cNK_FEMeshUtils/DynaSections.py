@@ -0,0 +1,89 @@
+import FixedWidth as FixedWidth
+import numpy as np
+
+# Section parsers of the block based LS-Dyna reader.
+# Every parser gets the Mesh, the file content and the offsets of the data
+# lines of one keyword block (comment lines removed) and converts the whole
+# block in bulk. Parsers is the keyword dispatch table used by
+# MeshReaders.readDynaMesh, keys are the keyword names of KeywordIndex.
+
+def parseNode(_Mesh, data, starts, ends):
+    for s, e in FixedWidth.chunks(starts, ends):
+        chars=FixedWidth.charMatrix(data, s, e, 56)
+        coords=np.column_stack((FixedWidth.parseFloats(chars[:, 8:24]),
+                                FixedWidth.parseFloats(chars[:, 24:40]),
+                                FixedWidth.parseFloats(chars[:, 40:56])))
+        _Mesh.addNodes(FixedWidth.parseInts(chars[:, 0:8]), coords)
+
+def shellColumns(chars):
+    # Element ID, part ID and the four nodes of *ELEMENT_SHELL cards
+    cols=[FixedWidth.parseInts(chars[:, i:i+8]) for i in xrange(0, 48, 8)]
+    return cols[0], cols[1], np.column_stack(cols[2:])
+
+def parseElementShell(_Mesh, data, starts, ends):
+    for s, e in FixedWidth.chunks(starts, ends):
+        ElemIDs, PartIDs, Conn = shellColumns(FixedWidth.charMatrix(data, s, e, 48))
+        _Mesh.addElems(ElemIDs, PartIDs, Conn)
+
+def parseElementShellThickness(_Mesh, data, starts, ends):
+    # Element card followed by a card with the four nodal thicknesses
+    for s, e in FixedWidth.chunks(starts, ends, 2):
+        n=len(s)//2
+        ElemIDs, PartIDs, Conn = shellColumns(FixedWidth.charMatrix(data, s[0:2*n:2], e[0:2*n:2], 48))
+        chars=FixedWidth.charMatrix(data, s[1:2*n:2], e[1:2*n:2], 64)
+        thick=np.column_stack([FixedWidth.parseFloats(chars[:, i:i+16]) for i in xrange(0, 64, 16)])
+        _Mesh.addElems(ElemIDs, PartIDs, Conn)
+        _Mesh.addNodalThicknesses(Conn.ravel(), thick.ravel())
+
+def cards(data, starts, ends):
+    return FixedWidth.lineStrings(data, starts, ends)
+
+def parsePart(_Mesh, data, starts, ends):
+    # Pairs of title and part card
+    lines=cards(data, starts, ends)
+    for i in xrange(0, len(lines)-1, 2):
+        _title=lines[i].strip()
+        _Mesh.addPart(int(lines[i+1][0:10]), _title, int(lines[i+1][10:20]), int(lines[i+1][20:30]))
+
+def parseMatCard(_Mesh, line):
+    _Mesh.addMat(int(line[0:10]), float(line[10:20]), float(line[20:30]))
+
+def parseMatPiecewiseLinearPlasticity(_Mesh, data, starts, ends):
+    lines=cards(data, starts, ends)
+    if len(lines)>0:
+        parseMatCard(_Mesh, lines[0])
+
+def parseMatPiecewiseLinearPlasticityTitle(_Mesh, data, starts, ends):
+    lines=cards(data, starts, ends)
+    if len(lines)>1:
+        parseMatCard(_Mesh, lines[1])
+
+def parseSectionShell(_Mesh, data, starts, ends):
+    lines=cards(data, starts, ends)
+    if len(lines)>1:
+        _Mesh.addProp(int(lines[0][0:10]), float(lines[1][0:10]))
+
+def parseSectionShellTitle(_Mesh, data, starts, ends):
+    lines=cards(data, starts, ends)
+    if len(lines)>2:
+        _Mesh.addProp(int(lines[1][0:10]), float(lines[2][0:10]))
+
+def getParser(keyword):
+    # Parser of a keyword, None for keywords which are not read. Blocks in
+    # long (+) or large ID (%) format have other field widths and are
+    # rejected instead of being read with the standard ones.
+    parser=Parsers.get(keyword)
+    if parser is None and keyword.split(" ")[0] in Parsers:
+        raise ValueError(keyword+": LS-Dyna long (+) and large ID (%) formats are not supported, use the standard format")
+    return parser
+
+Parsers={
+    "*NODE": parseNode,
+    "*ELEMENT_SHELL": parseElementShell,
+    "*ELEMENT_SHELL_THICKNESS": parseElementShellThickness,
+    "*PART": parsePart,
+    "*MAT_PIECEWISE_LINEAR_PLASTICITY": parseMatPiecewiseLinearPlasticity,
+    "*MAT_PIECEWISE_LINEAR_PLASTICITY_TITLE": parseMatPiecewiseLinearPlasticityTitle,
+    "*SECTION_SHELL": parseSectionShell,
+    "*SECTION_SHELL_TITLE": parseSectionShellTitle,
+}
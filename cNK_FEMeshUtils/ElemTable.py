@@ -0,0 +1,119 @@
+from ColumnTable import ColumnTable as ColumnTable
+import numpy as np
+class ElemTable(ColumnTable):
+
+    # Columnar shell element storage, stands in for the Elemlist dictionary
+    # {ElemID: [PartID, n1, n2, n3(, n4)]}.
+    # Connectivity is stored with four columns, for trias the third node is
+    # repeated (like LS-Dyna does) and NumNodes keeps the original count.
+
+    def __init__(self, ElemIDs=None, PartIDs=None, Conn=None, NumNodes=None):
+        ColumnTable.__init__(self, [("PartIDs", np.int64, 0), ("Conn", np.int64, 4), ("NumNodes", np.int8, 0)])
+        self.PartGroups=None
+        if ElemIDs is not None:
+            self.extend(ElemIDs, PartIDs, Conn, NumNodes)
+
+    def append(self, ElemID, PartID, *Nodes):
+        row=self.newRow(ElemID)
+        self.PartIDs[row]=PartID
+        self.Conn[row, :len(Nodes)]=Nodes
+        if len(Nodes)==3:
+            self.Conn[row, 3]=Nodes[2]
+        self.NumNodes[row]=len(Nodes)
+        self.PartGroups=None
+
+    def extend(self, ElemIDs, PartIDs, Conn, NumNodes=None):
+        Conn=np.asarray(Conn)
+        rows=self.newRows(ElemIDs)
+        self.PartIDs[rows]=PartIDs
+        self.Conn[rows, :Conn.shape[1]]=Conn
+        if Conn.shape[1]==3:
+            self.Conn[rows, 3]=Conn[:, 2]
+        if NumNodes is None:
+            NumNodes=Conn.shape[1]
+        self.NumNodes[rows]=NumNodes
+        self.PartGroups=None
+
+    def getPartIDs(self):
+        return self.getColumn("PartIDs")
+
+    def getConn(self):
+        return self.getColumn("Conn")
+
+    def getNumNodes(self):
+        return self.getColumn("NumNodes")
+
+    def getPartGroups(self):
+        # Rows grouped by part: (PartIDs, start offsets, rows sorted by part)
+        self.update()
+        if self.PartGroups is None:
+            order=np.argsort(self.PartIDs[:self.size], kind='mergesort')
+            parts, starts=np.unique(self.PartIDs[:self.size][order], return_index=True)
+            self.PartGroups=(parts, np.append(starts, self.size), order)
+        return self.PartGroups
+
+    def getPartRows(self, PartID):
+        parts, starts, order=self.getPartGroups()
+        pos=np.searchsorted(parts, PartID)
+        if pos==len(parts) or parts[pos]!=PartID:
+            return order[0:0]
+        return order[starts[pos]:starts[pos+1]]
+
+    def update(self):
+        if not self.indexValid:
+            self.PartGroups=None
+        ColumnTable.update(self)
+
+    def getValue(self, row):
+        return [int(self.PartIDs[row])]+self.Conn[row, :self.NumNodes[row]].tolist()
+
+    def __setitem__(self, ElemID, data):
+        self.append(ElemID, *data)
+
+
+class PartElemView(object):
+
+    # Read only stand in for the PartElemlist dictionary {PartID: [ElemIDs]}
+    # of a columnar mesh, computed from the part column of an ElemTable.
+
+    def __init__(self, Elems):
+        self.Elems=Elems
+
+    def __len__(self):
+        return len(self.Elems.getPartGroups()[0])
+
+    def __contains__(self, PartID):
+        return len(self.Elems.getPartRows(PartID))>0
+
+    def has_key(self, PartID):
+        return PartID in self
+
+    def __getitem__(self, PartID):
+        rows=self.Elems.getPartRows(PartID)
+        if len(rows)==0:
+            raise KeyError(PartID)
+        return self.Elems.getIDs()[rows].tolist()
+
+    def get(self, PartID, default=None):
+        if PartID in self:
+            return self[PartID]
+        return default
+
+    def keys(self):
+        return self.Elems.getPartGroups()[0].tolist()
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def iterkeys(self):
+        return iter(self.keys())
+
+    def iteritems(self):
+        for PartID in self.keys():
+            yield PartID, self[PartID]
+
+    def items(self):
+        return list(self.iteritems())
+
+    def values(self):
+        return [self[PartID] for PartID in self.keys()]
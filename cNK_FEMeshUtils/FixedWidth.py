@@ -0,0 +1,153 @@
+import numpy as np
+
+# Bulk parsing of fixed width text blocks.
+# The file content is handled as one uint8 array, lines are described by
+# their start/end offsets (end excludes the line break). Fields are cut
+# column wise out of a (lines x width) character matrix and converted for
+# all lines of a block at once.
+
+NEWLINE=10
+CR=13
+SPACE=32
+TAB=9
+CHUNK=1<<17 # Lines converted per step, bounds the size of temporary arrays
+STREAMBYTES=1<<23 # Bytes per piece of iterDataLines
+INTCHARS=np.zeros(256, dtype=bool) # Characters of plain integer fields
+INTCHARS[[SPACE, ord('+'), ord('-')]+range(ord('0'), ord('9')+1)]=True
+
+def lineOffsets(data):
+    # Start and end offsets of all lines of data
+    nl=np.flatnonzero(data==NEWLINE)
+    starts=np.concatenate(([0], nl+1))
+    ends=np.concatenate((nl, [len(data)]))
+    if starts[-1]==len(data):
+        starts=starts[:-1]
+        ends=ends[:-1]
+    cr=ends>starts
+    cr[cr]=data[ends[cr]-1]==CR
+    ends[cr]=ends[cr]-1
+    return starts, ends
+
+def blankLines(data, starts, ends):
+    # Mask of the (not empty) lines which only contain blanks and tabs. Only
+    # lines ending with a blank are candidates, they are checked column by
+    # column until a character which is no blank is found.
+    blank=np.zeros(len(starts), dtype=bool)
+    last=data[ends-1] if len(starts)>0 else np.zeros(0, dtype=np.uint8)
+    rows=np.flatnonzero((last==SPACE)|(last==TAB))
+    blank[rows]=True
+    pos=starts[rows]
+    while len(rows)>0:
+        chars=data[pos]
+        white=(chars==SPACE)|(chars==TAB)
+        blank[rows[~white]]=False
+        pos=pos[white]+1
+        rows=rows[white]
+        inside=pos<ends[rows]
+        pos=pos[inside]
+        rows=rows[inside]
+    return blank
+
+def dataLines(data, start, end, commentchar, blanks=True):
+    # Line offsets in the byte range [start, end) without comment and empty
+    # lines. blanks=False also drops lines which only contain blanks: in node
+    # and element blocks every line is an entity and a blank line would be
+    # read as ID 0, card blocks keep them as cards with default values.
+    starts, ends = lineOffsets(data[start:end])
+    starts=starts+start
+    ends=ends+start
+    first=np.full(len(starts), SPACE, dtype=np.uint8)
+    nonempty=ends>starts
+    first[nonempty]=data[starts[nonempty]]
+    keep=nonempty&(first!=ord(commentchar))
+    if not blanks:
+        keep[keep]=~blankLines(data, starts[keep], ends[keep])
+    return starts[keep], ends[keep]
+
+def nextLine(data, pos, end):
+    # Offset of the line following position pos (end if there is none)
+    while pos<end:
+        nl=np.flatnonzero(data[pos:min(pos+4096, end)]==NEWLINE)
+        if len(nl)>0:
+            return pos+int(nl[0])+1
+        pos=pos+4096
+    return end
+
+def iterDataLines(data, start, end, commentchar, step=1, size=None, blanks=True):
+    # dataLines of the byte range [start, end) in pieces of about size bytes
+    # (STREAMBYTES by default), groups of step consecutive lines stay together
+    if size is None:
+        size=STREAMBYTES
+    while start<end:
+        stop=nextLine(data, min(start+size, end)-1, end)
+        starts, ends = dataLines(data, start, stop, commentchar, blanks)
+        n=len(starts)//step*step
+        if stop<end and 0<n<len(starts):
+            stop=int(starts[n])
+            starts=starts[:n]
+            ends=ends[:n]
+        yield starts, ends
+        start=stop
+
+def lineStrings(data, starts, ends):
+    return [data[starts[i]:ends[i]].tostring() for i in xrange(len(starts))]
+
+def chunks(starts, ends, step=1):
+    # Splits line offsets into pieces of about CHUNK lines, keeping groups of
+    # step consecutive lines (cards of one entity) together
+    size=max(CHUNK//step, 1)*step
+    for i in xrange(0, len(starts), size):
+        yield starts[i:i+size], ends[i:i+size]
+
+def selectLines(data, starts, ends, field, values, step=1):
+    # Lines of the groups of step lines whose integer field (start, end) in
+    # the first line is one of values
+    n=len(starts)//step
+    keep=np.zeros(n, dtype=bool)
+    for i in xrange(0, n, CHUNK):
+        s=starts[i*step:(i+CHUNK)*step:step]
+        e=ends[i*step:(i+CHUNK)*step:step]
+        chars=charMatrix(data, s, e, field[1])[:, field[0]:field[1]]
+        keep[i:i+CHUNK]=np.in1d(parseInts(chars), values)
+    keep=np.repeat(keep, step)
+    return starts[:n*step][keep], ends[:n*step][keep]
+
+def charMatrix(data, starts, ends, width):
+    # (n, width) matrix of the first width characters of the given lines.
+    # Equally spaced lines which are long enough are viewed in place,
+    # otherwise the characters are gathered and short lines padded with blanks.
+    n=len(starts)
+    if n==0:
+        return np.zeros((0, width), dtype=np.uint8)
+    stride=starts[1]-starts[0] if n>1 else width
+    if (ends-starts).min()>=width and (n==1 or (np.diff(starts)==stride).all()):
+        return np.lib.stride_tricks.as_strided(data[starts[0]:], shape=(n, width), strides=(stride, 1))
+    idx=starts[:, None]+np.arange(width)
+    valid=idx<ends[:, None]
+    chars=data[np.where(valid, idx, 0)]
+    chars[~valid]=SPACE
+    return chars
+
+def fieldStrings(chars):
+    # Fields as fixed length byte strings, blank fields are read as zero.
+    # Always a copy: chars may be a view of the (read only) file content.
+    chars=np.array(chars)
+    blank=(chars==SPACE).all(axis=1)
+    if blank.any():
+        chars[blank, -1]=ord('0')
+    return chars.view('S%i' % chars.shape[1]).ravel()
+
+def parseFloats(chars):
+    return fieldStrings(chars).astype(np.float64)
+
+def parseInts(chars):
+    # Integer fields from digits, blanks and sign characters, evaluated
+    # column by column without going through Python strings
+    if not INTCHARS[chars].all():
+        return fieldStrings(chars).astype(np.float64).astype(np.int64)
+    values=np.zeros(len(chars), dtype=np.int64)
+    for j in xrange(chars.shape[1]):
+        digit=chars[:, j].astype(np.int64)-48
+        values=np.where((digit>=0)&(digit<=9), values*10+digit, values)
+    values[(chars==ord('-')).any(axis=1)]*=-1
+    return values
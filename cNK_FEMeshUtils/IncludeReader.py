@@ -0,0 +1,121 @@
+from Mesh import Mesh as Mesh
+from KeywordIndex import KeywordIndex as KeywordIndex
+import multiprocessing
+import numpy as np
+import os
+
+# Reading of LS-Dyna decks with *INCLUDE files.
+# The include tree is resolved first (*INCLUDE, *INCLUDE_PATH and
+# *INCLUDE_PATH_RELATIVE, recursively), then every file is parsed on its own
+# with the block reader, in a process pool for workers > 1. The results are
+# merged in depth first order (a file, then the files it includes) and the
+# file every node, element, part, material and property came from is
+# recorded in the Mesh (Mesh.Includes, Mesh.getSources).
+
+def dataLines(index, data, i):
+    # Data lines of block i as strings, lines ending with " +" are continued
+    # on the next line (long file names)
+    lines=[]
+    continued=False
+    for line in index.getBlock(i, data).splitlines():
+        line=line.rstrip()
+        if line=="" or line.startswith(index.commentchar):
+            continue
+        if continued:
+            lines[-1]=lines[-1]+line.strip()
+        else:
+            lines.append(line.strip())
+        continued=lines[-1].endswith(" +")
+        if continued:
+            lines[-1]=lines[-1][:-2].rstrip()
+    return lines
+
+def findFile(name, directories):
+    if os.path.isabs(name):
+        candidates=[name]
+    else:
+        candidates=[os.path.join(directory, name) for directory in directories]
+    for candidate in candidates:
+        if os.path.isfile(candidate):
+            return os.path.abspath(candidate)
+    raise IOError("Include file not found: "+name)
+
+def loadFile(file, mapped=True):
+    # Built keyword index and content of file
+    index=KeywordIndex(file, "*", "$")
+    data=index.map() if mapped else np.fromfile(file, dtype=np.uint8)
+    return index.build(data), data
+
+def resolve(file, index, data, files, paths, masterdir, mapped):
+    # Appends file and (recursively) its include files to files
+    files.append(os.path.abspath(file))
+    for i in index.findPrefix("*INCLUDE"):
+        keyword=index.getKeywords()[i]
+        if keyword=="*INCLUDE_PATH":
+            paths.extend([os.path.join(os.path.dirname(file), path) for path in dataLines(index, data, i)])
+        elif keyword=="*INCLUDE_PATH_RELATIVE":
+            paths.extend([os.path.join(masterdir, path) for path in dataLines(index, data, i)])
+        elif keyword=="*INCLUDE":
+            for name in dataLines(index, data, i):
+                include=findFile(name, [os.path.dirname(file)]+paths+[masterdir])
+                if not include in files:
+                    IncludeIndex, IncludeData = loadFile(include, mapped)
+                    resolve(include, IncludeIndex, IncludeData, files, paths, masterdir, mapped)
+
+def resolveFiles(file, index=None, data=None, mapped=True):
+    # The deck and all its include files in depth first order. data is the
+    # content of file for index, mapped=False reads the files into memory.
+    if index is None or data is None:
+        index, data = loadFile(file, mapped)
+    files=[]
+    resolve(file, index, data, files, [], os.path.dirname(os.path.abspath(file)), mapped)
+    return files
+
+def hasIncludes(index):
+    return len(index.find("*INCLUDE"))>0
+
+def parseFile(task):
+    # Worker: content of one file without following its includes
+    from MeshReaders import MeshReaders as MeshReaders
+    file, mapped = task
+    _Mesh=MeshReaders().parseDynaMesh(file, True, mapped=mapped, includes=False)
+    return _Mesh.getArrays(), _Mesh.Partlist, _Mesh.Matlist, _Mesh.Proplist
+
+def addFile(_Mesh, k, arrays, Partlist, Matlist, Proplist):
+    # Merges the content of Includes[k] into _Mesh and records its sources
+    _Mesh.addArrays(arrays)
+    _Mesh.Partlist.update(Partlist)
+    _Mesh.Matlist.update(Matlist)
+    _Mesh.Proplist.update(Proplist)
+    _Mesh.addSources("Nodes", arrays['NodeIDs'], k)
+    _Mesh.addSources("Elems", arrays['ElemIDs'], k)
+    _Mesh.addSources("Parts", Partlist.keys(), k)
+    _Mesh.addSources("Materials", Matlist.keys(), k)
+    _Mesh.addSources("Properties", Proplist.keys(), k)
+
+def readMesh(file, columnar=False, workers=1, index=None, data=None, mapped=True):
+    # index and data of file as for resolveFiles, every file is parsed
+    # memory mapped or read into memory according to mapped
+    if index is None or data is None:
+        index, data = loadFile(file, mapped)
+    files=resolveFiles(file, index, data, mapped)
+    tasks=[(include, mapped) for include in files]
+
+    _Mesh=Mesh(file, "LS-Dyna", columnar)
+    pool=None
+    if workers>1 and len(files)>1:
+        pool=multiprocessing.Pool(min(workers, len(files)))
+        results=pool.imap(parseFile, tasks)
+    else:
+        results=(parseFile(task) for task in tasks)
+    try:
+        for k in xrange(len(files)):
+            arrays, Partlist, Matlist, Proplist = results.next()
+            addFile(_Mesh, k, arrays, Partlist, Matlist, Proplist)
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+    _Mesh.Includes=files
+    _Mesh.setKeywordIndex(index)
+    return _Mesh
@@ -0,0 +1,56 @@
+import os
+import time
+
+# Instrumentation hooks of the readers, writers and InitAllObj.
+# Callbacks registered with addCallback are called as callback(event, data):
+# "section" after the block readers parsed one keyword block ('operation',
+# 'file', 'keyword', 'lines', 'bytes', 'seconds', for blocks split between
+# parallel workers the summed parse time of the workers) and "operation" after a
+# read, write or InitAllObj ('operation', 'file', 'bytes', 'seconds',
+# 'counts', 'MB/s', 'entities/s'). Without callbacks the instrumented code
+# only checks the Callbacks list once per operation and keyword block,
+# nothing is timed or counted. See Metrics for a collector.
+
+Callbacks=[]
+
+def addCallback(callback):
+    Callbacks.append(callback)
+
+def removeCallback(callback):
+    if callback in Callbacks:
+        Callbacks.remove(callback)
+
+def isEnabled():
+    return len(Callbacks)>0
+
+def emit(event, data):
+    for callback in list(Callbacks):
+        callback(event, data)
+
+def entityCounts(_Mesh):
+    return {'Nodes': len(_Mesh.Nodelist), 'Elems': len(_Mesh.Elemlist), 'Parts': len(_Mesh.Partlist),
+            'Materials': len(_Mesh.Matlist), 'Properties': len(_Mesh.Proplist),
+            'NodalThickness': len(_Mesh.Nodalthickness), 'ElementalThickness': len(_Mesh.Elementalthickness)}
+
+def deckSize(_Mesh):
+    # Bytes of the deck of _Mesh including the files of its *INCLUDEs
+    files=_Mesh.Includes if len(_Mesh.Includes)>0 else [_Mesh.Meshfile]
+    return sum([os.path.getsize(file) for file in files])
+
+def section(operation, file, keyword, lines, start, end, start_time, seconds=None):
+    # Keyword block with lines data lines in the byte range [start, end),
+    # seconds defaults to the time since start_time
+    if seconds is None:
+        seconds=time.time()-start_time
+    emit("section", {'operation': operation, 'file': file, 'keyword': keyword, 'lines': lines,
+                     'bytes': end-start, 'seconds': seconds})
+
+def operation(name, file, start_time, counts, size=None):
+    # size defaults to the size of file (bytes read or written)
+    seconds=time.time()-start_time
+    if size is None:
+        size=os.path.getsize(file) if file is not None and os.path.isfile(file) else 0
+    entities=counts.get('Nodes', 0)+counts.get('Elems', 0)
+    emit("operation", {'operation': name, 'file': file, 'bytes': size, 'seconds': seconds, 'counts': counts,
+                       'MB/s': size/1e6/seconds if seconds>0 else 0.0,
+                       'entities/s': entities/seconds if seconds>0 else 0.0})
@@ -0,0 +1,121 @@
+import FixedWidth as FixedWidth
+import numpy as np
+import os
+class KeywordIndex(object):
+
+    # Byte offset index of the keyword blocks of a deck (*NODE, *PART, ...
+    # for LS-Dyna, /NODE, /SHELL/<id>, ... for Radioss).
+    # It is built with one vectorized scan over the memory mapped file and
+    # stored on the Mesh, so later operations can jump straight to a block
+    # without reading the rest of the file.
+    # Block i covers the keyword line at starts[i], its data from
+    # dataStarts[i] up to ends[i] (the next keyword line or the end of file).
+
+    SCANSIZE=1<<26 # Bytes searched for keyword characters per step
+
+    def __init__(self, file, keychar, commentchar):
+        self.file=file
+        self.keychar=keychar
+        self.commentchar=commentchar
+        self.lines=[]
+        self.keywords=[]
+        self.starts=np.zeros(0, dtype=np.int64)
+        self.dataStarts=np.zeros(0, dtype=np.int64)
+        self.ends=np.zeros(0, dtype=np.int64)
+        self.filesize=-1
+        self.mtime=-1
+        self.LineTables={} # Per entity line offsets derived from the file (DeltaWriter)
+
+    def map(self):
+        # Read only memory map of the file as uint8 array
+        if os.path.getsize(self.file)==0:
+            return np.zeros(0, dtype=np.uint8)
+        return np.memmap(self.file, dtype=np.uint8, mode='r').view(np.ndarray)
+
+    def build(self, data=None):
+        if data is None:
+            data=self.map()
+        keypos=[]
+        for start in xrange(0, len(data), self.SCANSIZE):
+            pos=np.flatnonzero(data[start:start+self.SCANSIZE]==ord(self.keychar))+start
+            if len(pos)>0 and pos[0]==0:
+                keypos.append(pos[:1])
+                pos=pos[1:]
+            keypos.append(pos[data[pos-1]==FixedWidth.NEWLINE])
+        starts=np.concatenate(keypos) if keypos else np.zeros(0, dtype=np.int64)
+        self.lines=[]
+        self.keywords=[]
+        dataStarts=np.zeros(len(starts), dtype=np.int64)
+        for i, start in enumerate(starts.tolist()):
+            end=start
+            while True:
+                eol=data[end:end+1024].tostring().find("\n")
+                if eol>=0 or end+1024>=len(data):
+                    end=end+eol if eol>=0 else len(data)
+                    break
+                end=end+1024
+            line=data[start:end].tostring().rstrip("\r")
+            self.lines.append(line)
+            self.keywords.append(self.keyword(line))
+            dataStarts[i]=min(end+1, len(data))
+        self.starts=starts.astype(np.int64)
+        self.dataStarts=dataStarts
+        self.ends=np.append(self.starts[1:], len(data)).astype(np.int64)
+        self.filesize=os.path.getsize(self.file)
+        self.mtime=os.path.getmtime(self.file)
+        self.LineTables={}
+        return self
+
+    def keyword(self, line):
+        # Keyword name of a keyword line, options after blanks are ignored
+        # except the LS-Dyna format flags which change the field widths:
+        # "*NODE +" (long format) and "*NODE %" (large IDs) stay "*NODE +"
+        # and "*NODE %"
+        fields=line.split()
+        if len(fields)==0:
+            return ""
+        name=fields[0].upper()
+        if len(name)>1 and name[-1] in "+%":
+            return name[:-1]+" "+name[-1]
+        if len(fields)>1 and fields[1] in ("+", "%"):
+            return name+" "+fields[1]
+        return name
+
+    def isValid(self):
+        # False if the file has changed since the index was built
+        return os.path.getsize(self.file)==self.filesize and os.path.getmtime(self.file)==self.mtime
+
+    def __len__(self):
+        return len(self.keywords)
+
+    def getKeywords(self):
+        return self.keywords
+
+    def getLine(self, i):
+        return self.lines[i]
+
+    def find(self, keyword):
+        # Indices of all blocks of a keyword
+        keyword=keyword.upper()
+        return [i for i in xrange(len(self.keywords)) if self.keywords[i]==keyword]
+
+    def findPrefix(self, prefix):
+        prefix=prefix.upper()
+        return [i for i in xrange(len(self.keywords)) if self.keywords[i].startswith(prefix)]
+
+    def getRange(self, i):
+        # Byte range of the data of block i
+        return int(self.dataStarts[i]), int(self.ends[i])
+
+    def getDataLines(self, data, i, blanks=True):
+        # Start/end offsets of the data lines of block i, comment and empty
+        # lines removed (and blank lines for blanks=False, see FixedWidth.dataLines)
+        start, end = self.getRange(i)
+        return FixedWidth.dataLines(data, start, end, self.commentchar, blanks)
+
+    def getBlock(self, i, data=None):
+        # Text of the data of block i
+        if data is None:
+            data=self.map()
+        start, end = self.getRange(i)
+        return data[start:end].tostring()
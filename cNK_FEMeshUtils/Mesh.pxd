@@ -2,8 +2,11 @@ from Element cimport Element
 from Node cimport Node
 from Part cimport Part
 cdef class Mesh:
-    cdef public dict Nodelist, Nodalthickness, Elementalthickness, Elemlist, PartElemlist, Partlist, Matlist, Proplist, PartObjList
-    cdef public list NUTProps
+    cdef public object Nodelist, Elemlist, PartElemlist, NodeArrays, ElemArrays, KeywordIndex, SpatialIndex, ElemThicknesses, Bounds
+    cdef public dict Nodalthickness, Elementalthickness, Partlist, Matlist, Proplist, PartObjList, NodeObjList, ElemObjList
+    cdef public bint columnar
+    cdef public list NUTProps, Includes
+    cdef public dict Sources, Dirty, Adjacencies, OrientedBounds
     cdef public str Meshfile, Meshformat
 
     cpdef addNode(self, int NodeID, double x, double y, double z)
@@ -25,8 +28,13 @@ cdef class Mesh:
     cpdef str getMeshFormat(self)
     cpdef str getMeshFile(self)
 
-    cpdef list getNodelist(self)
-    cpdef list getElemlist(self)
+    cpdef object getNodelist(self)
+    cpdef object getElemlist(self)
+    cpdef bint isColumnar(self)
+    cpdef object getNodeTable(self)
+    cpdef object buildNodeTable(self)
+    cpdef object getElemTable(self)
+    cpdef updateArrays(self)
     cpdef double getMassByPartID(self, int PartID)
     cpdef double getVolumeByPartID(self, int PartID)
     cpdef double getAreaByPartID(self, int PartID)
@@ -41,5 +49,5 @@ cdef class Mesh:
     cpdef list getElemByID(self, int ElemID)
 
     cpdef dict getPartlistObj(self)
-    cpdef Part getPartByID(self, int PartID)
+    cpdef object getPartByID(self, int PartID)
     cpdef list getRectangleBounds(self)
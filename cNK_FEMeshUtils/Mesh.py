@@ -5,33 +5,80 @@ from Quad import Quad as Quad
 from Material import Material as Material
 from Property import Property as Property
 from Part import Part as Part
+from PartView import PartView as PartView
+from NodeTable import NodeTable as NodeTable
+from SpatialIndex import SpatialIndex as SpatialIndex
+from ElemTable import ElemTable as ElemTable
+from ElemTable import PartElemView as PartElemView
+import Geometry as Geometry
+import Thickness as Thickness
+import Topology as Topology
+import Instrumentation as Instrumentation
+import time
 import numpy as np
 class Mesh:
 
     # This Class is handling FE Meshes
 
-    def __init__(self, _Meshfile, _Meshformat):
+    def __init__(self, _Meshfile, _Meshformat, _columnar=False):
         # Variables for Mesh Import
-        self.Nodelist={}
+        # In columnar mode nodes and elements are stored in NumPy arrays
+        # (NodeTable/ElemTable) instead of dictionaries of lists. Nodelist,
+        # Elemlist and PartElemlist then are views with the same interface.
+        self.columnar=_columnar
+        if _columnar:
+            self.Nodelist=NodeTable()
+            self.Elemlist=ElemTable()
+            self.PartElemlist=PartElemView(self.Elemlist)
+        else:
+            self.Nodelist={}
+            self.Elemlist={}
+            self.PartElemlist={}
+        self.NodeArrays=None # Array copies of the dictionaries, built on demand
+        self.ElemArrays=None
+        self.SpatialIndex=None # Built on demand, dropped when nodes change
+        self.Adjacencies={} # (kind, parts): Adjacency, dropped when elements change
+        self.ElemThicknesses=None # Resolved thickness per element table row, see getElemThicknesses
+        self.Bounds=None # Bounding boxes of mesh, parts and elements, see getBounds
+        self.OrientedBounds={} # PartID: oriented minimum area box, see getOrientedBounds
         self.Nodalthickness={}
         self.Elementalthickness={}
-        self.Elemlist={}
-        self.PartElemlist={}
         self.Partlist={}
         self.Matlist={}
         self.Proplist={}
         self.PartObjList={}
+        self.NodeObjList={} # One shared Node object per NodeID
+        self.ElemObjList={} # Element objects of the initialized parts by ElemID
         self.NUTProps=[] # Parts with non UniformThickness
         self.Meshfile=_Meshfile
         self.Meshformat=_Meshformat
+        self.KeywordIndex=None # Byte offsets of the keyword blocks of Meshfile
+        self.Includes=[] # Files of a deck with *INCLUDEs, Meshfile first
+        self.Sources={} # Entity kind: [(IDs, index in Includes)] in read order
+        self.Dirty={} # Entity kind: set of IDs changed through the set methods
 
         # self.logger=logging.getLogger('Mesh')
         # self.logger.info('Mesh Object initialized')
 
     def addNode(self, NodeID, x, y, z):
-        self.Nodelist[NodeID]=[x, y, z]
+        self.SpatialIndex=None
+        self.Bounds=None
+        self.OrientedBounds={}
+        if self.columnar:
+            self.Nodelist.append(NodeID, x, y, z)
+        else:
+            self.Nodelist[NodeID]=[x, y, z]
+            self.NodeArrays=None
 
     def addElem(self, ElemID, PartID, *Nodes):
+        self.Adjacencies={}
+        self.ElemThicknesses=None
+        self.Bounds=None
+        self.OrientedBounds={}
+        if self.columnar:
+            self.Elemlist.append(ElemID, PartID, *Nodes)
+            return
+        self.ElemArrays=None
         if len(Nodes)==3:
             self.Elemlist[ElemID]=[PartID, Nodes[0], Nodes[1], Nodes[2]]
         elif len(Nodes)==4:
@@ -42,148 +89,564 @@ class Mesh:
         else:
             self.PartElemlist[PartID].append(ElemID)
 
+    def addNodes(self, NodeIDs, Coords):
+        # Bulk version of addNode for arrays of IDs and (n, 3) coordinates
+        self.SpatialIndex=None
+        self.Bounds=None
+        self.OrientedBounds={}
+        if self.columnar:
+            self.Nodelist.extend(NodeIDs, Coords)
+        else:
+            self.Nodelist.update(zip(np.asarray(NodeIDs).tolist(), np.asarray(Coords).tolist()))
+            self.NodeArrays=None
+
+    def addElems(self, ElemIDs, PartIDs, Conn, NumNodes=None):
+        # Bulk version of addElem, Conn is a (n, 3) or (n, 4) array of node IDs.
+        # NumNodes marks trias in a (n, 4) array (third node repeated).
+        self.Adjacencies={}
+        self.ElemThicknesses=None
+        self.Bounds=None
+        self.OrientedBounds={}
+        if self.columnar:
+            self.Elemlist.extend(ElemIDs, PartIDs, Conn, NumNodes)
+            return
+        self.ElemArrays=None
+        ElemIDs=np.asarray(ElemIDs)
+        PartIDs=np.asarray(PartIDs)
+        data=np.column_stack((PartIDs, Conn)).tolist()
+        if NumNodes is not None:
+            for i in np.flatnonzero(np.asarray(NumNodes)==3).tolist():
+                del data[i][4:]
+        self.Elemlist.update(zip(ElemIDs.tolist(), data))
+        order=np.argsort(PartIDs, kind='mergesort')
+        Parts, first = np.unique(PartIDs[order], return_index=True)
+        first=np.append(first, len(order))
+        for i, PartID in enumerate(Parts.tolist()):
+            IDs=ElemIDs[order[first[i]:first[i+1]]].tolist()
+            if not PartID in self.PartElemlist:
+                self.PartElemlist[PartID]=IDs
+            else:
+                self.PartElemlist[PartID].extend(IDs)
+
+    def addNodalThicknesses(self, NodeIDs, thickness):
+        self.ElemThicknesses=None
+        self.Nodalthickness.update(zip(np.asarray(NodeIDs).tolist(), np.asarray(thickness).tolist()))
+
+    def addElementalThicknesses(self, ElemIDs, thickness):
+        self.ElemThicknesses=None
+        self.Elementalthickness.update(zip(np.asarray(ElemIDs).tolist(), np.asarray(thickness).tolist()))
+
+    def getArrays(self):
+        # Nodes, elements and thickness tables as a dictionary of arrays
+        Nodes=self.getNodeTable()
+        Elems=self.getElemTable()
+        return {'NodeIDs': Nodes.getIDs(), 'Coords': Nodes.getCoords(),
+                'ElemIDs': Elems.getIDs(), 'PartIDs': Elems.getPartIDs(), 'Conn': Elems.getConn(), 'NumNodes': Elems.getNumNodes(),
+                'NodalThicknessIDs': np.array(self.Nodalthickness.keys(), dtype=np.int64),
+                'NodalThickness': np.array(self.Nodalthickness.values(), dtype=np.float64),
+                'ElementalThicknessIDs': np.array(self.Elementalthickness.keys(), dtype=np.int64),
+                'ElementalThickness': np.array(self.Elementalthickness.values(), dtype=np.float64)}
+
+    def addArrays(self, arrays):
+        # Adds the content of a getArrays dictionary
+        self.addNodes(arrays['NodeIDs'], arrays['Coords'])
+        self.addElems(arrays['ElemIDs'], arrays['PartIDs'], arrays['Conn'], arrays['NumNodes'])
+        self.addNodalThicknesses(arrays['NodalThicknessIDs'], arrays['NodalThickness'])
+        self.addElementalThicknesses(arrays['ElementalThicknessIDs'], arrays['ElementalThickness'])
+
+    def setNodes(self, NodeIDs, Coords):
+        # Moves existing nodes (Nodelist, cached node table and Node objects)
+        # and marks them dirty for the delta writers
+        NodeIDs=np.asarray(NodeIDs, dtype=np.int64).ravel()
+        Coords=np.asarray(Coords, dtype=np.float64).reshape(-1, 3)
+        self.SpatialIndex=None
+        self.OrientedBounds={}
+        if self.Bounds is not None:
+            Nodes=self.getNodeTable()
+            rows=Nodes.getRows(NodeIDs)
+            OldCoords=Nodes.getCoords()[rows[rows>=0]]
+        if self.columnar:
+            self.Nodelist.setCoords(NodeIDs, Coords)
+        else:
+            self.Nodelist.update(zip(NodeIDs.tolist(), Coords.tolist()))
+            if self.NodeArrays is not None:
+                self.NodeArrays.setCoords(NodeIDs, Coords)
+        if self.Bounds is not None:
+            self.updateBounds(NodeIDs, OldCoords, Coords)
+        if len(self.NodeObjList)>0:
+            for NodeID, coord in zip(NodeIDs.tolist(), Coords.tolist()):
+                if NodeID in self.NodeObjList:
+                    self.NodeObjList[NodeID].setCoord(coord[0], coord[1], coord[2])
+        self.markDirty("Nodes", NodeIDs)
+
+    def setNode(self, NodeID, x, y, z):
+        self.setNodes([NodeID], [[x, y, z]])
+
+    def setElem(self, ElemID, PartID, *Nodes):
+        # Replaces part and nodes of an element and marks it dirty
+        if not self.columnar and ElemID in self.Elemlist:
+            OldPartID=self.Elemlist[ElemID][0]
+            if OldPartID!=PartID:
+                self.PartElemlist[OldPartID].remove(ElemID)
+                self.PartElemlist.setdefault(PartID, []).append(ElemID)
+            self.Elemlist[ElemID]=[PartID]+list(Nodes)
+            self.ElemArrays=None
+            self.Adjacencies={}
+            self.ElemThicknesses=None
+            self.Bounds=None
+            self.OrientedBounds={}
+        else:
+            self.addElem(ElemID, PartID, *Nodes)
+        self.markDirty("Elems", [ElemID])
+
+    def setNodalThicknesses(self, NodeIDs, thickness):
+        self.addNodalThicknesses(NodeIDs, thickness)
+        if len(self.NodeObjList)>0:
+            for NodeID, thick in zip(np.asarray(NodeIDs).tolist(), np.asarray(thickness).tolist()):
+                if NodeID in self.NodeObjList:
+                    self.NodeObjList[NodeID].setThickness(thick)
+        if len(self.ElemObjList)>0:
+            Conn=self.getElemTable().getConn()
+            self.updateElemObjThicknesses(np.flatnonzero(np.in1d(Conn, NodeIDs).reshape(Conn.shape).any(axis=1)))
+        self.markDirty("NodalThickness", NodeIDs)
+
+    def setElementalThicknesses(self, ElemIDs, thickness):
+        self.addElementalThicknesses(ElemIDs, thickness)
+        if len(self.ElemObjList)>0:
+            rows=self.getElemTable().getRows(ElemIDs)
+            self.updateElemObjThicknesses(rows[rows>=0])
+        self.markDirty("ElementalThickness", ElemIDs)
+
+    def updateElemObjThicknesses(self, rows):
+        # Resolved thickness (getElemThicknesses) into the initialized
+        # element objects of the element table rows
+        ElemIDs=self.getElemTable().getIDs()[rows].tolist()
+        for ElemID, thick in zip(ElemIDs, self.getElemThicknesses(rows).tolist()):
+            elem=self.ElemObjList.get(ElemID)
+            if elem is not None:
+                elem.thickness=thick
+
+    def markDirty(self, kind, IDs):
+        # kind: "Nodes", "Elems", "NodalThickness" or "ElementalThickness"
+        if not kind in self.Dirty:
+            self.Dirty[kind]=set()
+        self.Dirty[kind].update(np.asarray(IDs, dtype=np.int64).ravel().tolist())
+
+    def getDirty(self, kind):
+        # Sorted array of the dirty IDs of kind
+        return np.array(sorted(self.Dirty.get(kind, ())), dtype=np.int64)
+
+    def isDirty(self):
+        return any([len(IDs)>0 for IDs in self.Dirty.values()])
+
+    def clearDirty(self):
+        self.Dirty={}
+
+    def addSources(self, kind, IDs, fileindex):
+        # Records that the entities IDs of kind ("Nodes", "Elems", "Parts",
+        # "Materials", "Properties") were read from Includes[fileindex]
+        IDs=np.asarray(IDs, dtype=np.int64)
+        if not kind in self.Sources:
+            self.Sources[kind]=[]
+        self.Sources[kind].append((IDs, np.full(len(IDs), fileindex, dtype=np.int64)))
+
+    def getSources(self, kind, IDs):
+        # Index in Includes of the file each entity was read from, -1 if
+        # unknown. Entities defined in several files belong to the last one.
+        IDs=np.asarray(IDs, dtype=np.int64)
+        result=np.full(IDs.shape, -1, dtype=np.int64)
+        if not kind in self.Sources or len(self.Sources[kind])==0:
+            return result
+        known=np.concatenate([block[0] for block in self.Sources[kind]])
+        files=np.concatenate([block[1] for block in self.Sources[kind]])
+        known, last = np.unique(known[::-1], return_index=True)
+        files=files[::-1][last]
+        pos=np.minimum(np.searchsorted(known, IDs), max(len(known)-1, 0))
+        found=(len(known)>0)&(known[pos]==IDs)
+        result[found]=files[pos[found]]
+        return result
+
+    def getSourceFile(self, kind, ID):
+        # File an entity was read from, None if unknown
+        fileindex=int(self.getSources(kind, [ID])[0])
+        if fileindex<0:
+            return None
+        return self.Includes[fileindex]
+
+    def getIncludes(self):
+        return self.Includes
+
     def addNodalThickness(self, NodeID, thickness):
+        self.ElemThicknesses=None
         self.Nodalthickness[NodeID]=thickness
 
     def addElementalThickness(self, ElemID, thickness):
+        self.ElemThicknesses=None
         self.Elementalthickness[ElemID]=thickness
 
     def getNodalThickness(self, NodeID):
-        return self.Nodalthickness[NodeID]
+        # 0.0 for nodes without nodal thickness, like the Node objects
+        return self.Nodalthickness.get(NodeID, 0.0)
 
     def getElementalThickness(self, ElemID):
         return self.Elementalthickness[ElemID]
 
     def addPart(self, PartID, title, PropID, MatID):
+        self.ElemThicknesses=None
         self.Partlist[PartID]=[title, PropID, MatID]
 
     def addMat(self, MatID, Rho, E):
         self.Matlist[MatID]=[Rho, E]
 
     def addProp(self, PropID, Thickness):
+        self.ElemThicknesses=None
         self.Proplist[PropID]=[Thickness]
 
     def InitPartObj(self, PartID):
-        # self.logger.info('Initialize Part: '+str(PartID))
+        return self.InitPartObjs([PartID])[PartID]
 
-        if self.Nodelist=={}:
+    def InitPartObjs(self, PartIDs):
+        # Creates the Part objects of all given parts. The elements of each
+        # part are taken from the PartElemlist index, so every element is
+        # visited once and the cost grows linearly with the model size.
+        # Element objects get the resolved thickness of getElemThicknesses.
+        # self.logger.info('Initialize Parts: '+str(PartIDs))
+
+        if len(self.Nodelist)==0:
             # self.logger.error("Missing Nodes. Please check Input")
             raise Exception("Missing Nodes. Please check Input")
-        elif self.Elemlist=={}:
+        elif len(self.Elemlist)==0:
             # self.logger.error("Missing Elements. Please check Input")
             raise Exception("Missing Elements. Please check Input")
-        else:
-            matid = 0
-            rho = 7.9E-6
-            e = 210
-            propid = 0
-            thickness = 1.0
-            propid=0
-            matid=0
-            title="GenericPart"
-
-            # if self.Matlist=={} :
-                # self.logger.warning("Missing Material Definition. Please check Input. Steel Values in Ton mm s set as default")
-
-            # if self.Proplist=={}:
-                # self.logger.warning("Missing Property Definition. Please check Input. 1 mm constant used as default")
-
-            # if self.Partlist=={}:
-                # self.logger.warning("Missing Part Definition. Please check Input. Generic Part will be created")
-
-            if self.Matlist!={} and self.Proplist!={} and self.Partlist=={}:
-                matid=self.Partlist[PartID][2]
-                propid=self.Partlist[PartID][1]
-                title=self.Partlist[PartID][0]
-                rho=self.Matlist[matid][0]
-                e=self.Matlist[matid][1]
-                thickness=self.Proplist[propid][0]
 
+        # if self.Matlist=={} :
+            # self.logger.warning("Missing Material Definition. Please check Input. Steel Values in Ton mm s set as default")
+
+        # if self.Proplist=={}:
+            # self.logger.warning("Missing Property Definition. Please check Input. 1 mm constant used as default")
+
+        # if self.Partlist=={}:
+            # self.logger.warning("Missing Part Definition. Please check Input. Generic Part will be created")
+
+        parts={}
+        Elems=self.getElemTable()
+        ElemThick=self.getElemThicknesses()
+        for PartID in PartIDs:
+            if PartID in self.PartObjList:
+                for ElemID in self.PartObjList[PartID].getElemlist().keys():
+                    self.ElemObjList.pop(ElemID, None)
+            title, propid, thickness, matid, rho, e = self.getPartData(PartID)
             prop=Property(propid, thickness)
             mat=Material(matid, rho, e)
             part=Part(PartID, title, mat, prop)
 
-            for elem in self.Elemlist.iteritems():
-                # print elem[0]
-                if elem[1][0] == PartID:
-                    _elem = elem[1]
-                    partid = _elem[0]
-                    if len(elem[1])==5:
-                        nodeid = _elem[1]
-                        coord = self.Nodelist[nodeid]
-                        node1=Node(nodeid, coord[0], coord[1], coord[2])
-                        nodeid = _elem[2]
-                        coord = self.Nodelist[nodeid]
-                        node2=Node(nodeid, coord[0], coord[1], coord[2])
-                        nodeid = _elem[3]
-                        coord = self.Nodelist[nodeid]
-                        node3=Node(nodeid, coord[0], coord[1], coord[2])
-                        nodeid = _elem[4]
-                        coord = self.Nodelist[nodeid]
-                        node4=Node(nodeid, coord[0], coord[1], coord[2])
-
-                        quad=Quad(elem[0], partid, node1, node2, node3, node4)
-                        part.addElem(quad)
-                    elif len(elem[1])==4:
-                        nodeid = _elem[1]
-                        coord = self.Nodelist[nodeid]
-                        node1=Node(nodeid, coord[0], coord[1], coord[2])
-                        nodeid = _elem[2]
-                        coord = self.Nodelist[nodeid]
-                        node2=Node(nodeid, coord[0], coord[1], coord[2])
-                        nodeid = _elem[3]
-                        coord = self.Nodelist[nodeid]
-                        node3=Node(nodeid, coord[0], coord[1], coord[2])
-
-                        tria=Tria(elem[0], partid, node1, node2, node3)
-                        part.addElem(tria)
+            # Thickness of the elements in the order of iterPartElems
+            if self.columnar:
+                thick=ElemThick[Elems.getPartRows(PartID)].tolist()
+            else:
+                thick=ElemThick[Elems.getRows(self.PartElemlist.get(PartID, []))].tolist()
+            for k, (ElemID, _elem) in enumerate(self.iterPartElems(PartID)):
+                nodes=[self.getNodeObj(nodeid) for nodeid in _elem[1:]]
+                if len(nodes)==4:
+                    elem=Quad(ElemID, PartID, nodes[0], nodes[1], nodes[2], nodes[3])
+                elif len(nodes)==3:
+                    elem=Tria(ElemID, PartID, nodes[0], nodes[1], nodes[2])
+                else:
+                    continue
+                elem.thickness=thick[k]
+                part.addElem(elem)
+            self.ElemObjList.update(part.getElemlist())
             self.PartObjList[PartID]=part
+            parts[PartID]=part
             # self.logger.info("Part "+str(part.getPartID())+" initialized with "+str(part.getNumElem())+" Elements.")
-        return part
+        return parts
 
     def InitAllObj(self):
         # self.logger.info("Initall started")
-        for PartID in self.Partlist:
-            self.InitPartObj(PartID)
+        if not Instrumentation.Callbacks:
+            self.InitPartObjs(self.Partlist.keys())
+            return
+        start_time=time.time()
+        self.InitPartObjs(self.Partlist.keys())
+        Instrumentation.operation("InitAllObj", self.Meshfile, start_time,
+                                  {'Nodes': len(self.NodeObjList), 'Elems': len(self.ElemObjList), 'Parts': len(self.PartObjList)}, 0)
+
+    def getNodeObj(self, NodeID):
+        # Returns the Node object of NodeID, creating it on first use.
+        # Elements of all parts share these objects, so coordinate and
+        # thickness changes are seen by every element using the node.
+        node=self.NodeObjList.get(NodeID)
+        if node is None:
+            coord=self.Nodelist[NodeID]
+            node=Node(NodeID, coord[0], coord[1], coord[2])
+            if NodeID in self.Nodalthickness:
+                node.setThickness(self.Nodalthickness[NodeID])
+            self.NodeObjList[NodeID]=node
+        return node
+
+    def iterPartElems(self, PartID):
+        # Yields (ElemID, [PartID, n1, n2, n3(, n4)]) for the elements of a part
+        if self.columnar:
+            Elems=self.Elemlist
+            rows=Elems.getPartRows(PartID)
+            ElemIDs=Elems.getIDs()[rows].tolist()
+            Conn=Elems.getConn()[rows].tolist()
+            NumNodes=Elems.getNumNodes()[rows].tolist()
+            for i in xrange(len(ElemIDs)):
+                yield ElemIDs[i], [PartID]+Conn[i][:NumNodes[i]]
+        else:
+            for ElemID in self.PartElemlist.get(PartID, []):
+                yield ElemID, self.Elemlist[ElemID]
 
     def setMeshFile(self,_file):
         self.Meshfile=_file
 
     def setMeshFormat(self,_format):
-        self.MeshFormat=_format
+        self.Meshformat=_format
 
     def getMeshFormat(self):
-        return self.MeshFormat
+        return self.Meshformat
 
     def getMeshFile(self):
         return self.Meshfile
 
+    def setKeywordIndex(self, index):
+        self.KeywordIndex=index
+
+    def getKeywordIndex(self):
+        # KeywordIndex of Meshfile, rebuilt if the file has changed
+        if self.KeywordIndex is not None and not self.KeywordIndex.isValid():
+            self.KeywordIndex.build()
+        return self.KeywordIndex
+
     def getNodelist(self):
         return self.Nodelist
 
     def getElemlist(self):
         return self.Elemlist
 
+    def isColumnar(self):
+        return self.columnar
+
+    def getNodeTable(self):
+        # Nodes as NodeTable (contiguous ID and coordinate arrays + ID index).
+        # For dictionary based meshes the table is built once and cached
+        # until nodes are added through addNode. Call updateArrays after
+        # modifying Nodelist or Elemlist directly.
+        if self.columnar:
+            return self.Nodelist
+        if self.NodeArrays is None:
+            self.NodeArrays=self.buildNodeTable()
+        return self.NodeArrays
+
+    def buildNodeTable(self):
+        # NodeTable of the current content of Nodelist, not cached
+        if self.columnar:
+            return self.Nodelist
+        NodeIDs=np.fromiter(self.Nodelist.iterkeys(), dtype=np.int64, count=len(self.Nodelist))
+        Coords=np.array(self.Nodelist.values(), dtype=np.float64).reshape(-1, 3)
+        return NodeTable(NodeIDs, Coords)
+
+    def getElemTable(self):
+        # Elements as ElemTable (IDs, part IDs and connectivity arrays + ID index)
+        if self.columnar:
+            return self.Elemlist
+        if self.ElemArrays is None:
+            ElemIDs=np.fromiter(self.Elemlist.iterkeys(), dtype=np.int64, count=len(self.Elemlist))
+            data=[elem if len(elem)==5 else elem+elem[3:] for elem in self.Elemlist.itervalues()]
+            data=np.array(data, dtype=np.int64).reshape(-1, 5)
+            NumNodes=np.array([len(elem)-1 for elem in self.Elemlist.itervalues()], dtype=np.int8)
+            self.ElemArrays=ElemTable(ElemIDs, data[:, 0], data[:, 1:], NumNodes)
+        return self.ElemArrays
+
+    def updateArrays(self):
+        self.NodeArrays=None
+        self.ElemArrays=None
+        self.SpatialIndex=None
+        self.Adjacencies={}
+        self.ElemThicknesses=None
+        self.Bounds=None
+        self.OrientedBounds={}
+
+    def getSpatialIndex(self):
+        # SpatialIndex over the current node coordinates (nearest node, k
+        # nearest, radius and box queries), cached like the node table
+        if self.SpatialIndex is None:
+            Nodes=self.getNodeTable()
+            self.SpatialIndex=SpatialIndex(Nodes.getIDs(), Nodes.getCoords())
+        return self.SpatialIndex
+
+    def getTopology(self, kind, parts=None):
+        # Adjacency table of kind ("NodeElems", "ElemNeighbours" or
+        # "NodeNeighbours", see Topology) built from the elements of the
+        # given parts (a PartID or a list of them, all elements for None)
+        if parts is not None:
+            parts=tuple(np.unique(np.asarray(parts, dtype=np.int64)).tolist())
+        key=(kind, parts)
+        if not key in self.Adjacencies:
+            Elems=self.getElemTable()
+            ElemIDs=Elems.getIDs()
+            Conn=Elems.getConn()
+            if parts is not None:
+                rows=self.getRowsOfParts(parts)
+                ElemIDs=ElemIDs[rows]
+                Conn=Conn[rows]
+            self.Adjacencies[key]=Topology.Builders[kind](ElemIDs, Conn)
+        return self.Adjacencies[key]
+
+    def getNodeElems(self, parts=None):
+        # Node ID -> IDs of the elements using the node
+        return self.getTopology("NodeElems", parts)
+
+    def getElemNeighbours(self, parts=None):
+        # Element ID -> IDs of the elements sharing an edge
+        return self.getTopology("ElemNeighbours", parts)
+
+    def getNodeNeighbours(self, parts=None):
+        # Node ID -> IDs of the nodes sharing an element edge
+        return self.getTopology("NodeNeighbours", parts)
+
+    def getPartData(self, PartID):
+        # Returns [title, PropID, thickness, MatID, rho, E] of a part.
+        # Missing definitions fall back to 1 mm and steel in ton mm s.
+        title="GenericPart"
+        propid=0
+        thickness=1.0
+        matid=0
+        rho=7.9E-6
+        e=210
+        if PartID in self.Partlist:
+            title, propid, matid = self.Partlist[PartID]
+            if propid in self.Proplist:
+                thickness=self.Proplist[propid][0]
+            if matid in self.Matlist:
+                rho, e = self.Matlist[matid]
+        return [title, propid, thickness, matid, rho, e]
+
+    def getNodeRowsOfElems(self, rows=None):
+        # Node table rows of the element connectivity (n, 4)
+        Conn=self.getElemTable().getConn()
+        if rows is not None:
+            Conn=Conn[rows]
+        NodeRows=self.getNodeTable().getRows(Conn)
+        if (NodeRows<0).any():
+            raise KeyError(int(Conn[NodeRows<0][0]))
+        return NodeRows
+
+    def getElemAreas(self, rows=None):
+        # Areas of all elements (or of the given element table rows)
+        # in one vectorized pass
+        Corners=Geometry.shellCorners(self.getNodeTable().getCoords(), self.getNodeRowsOfElems(rows))
+        return Geometry.shellAreas(Corners)
+
+    def getElemThicknesses(self, rows=None):
+        # Effective thickness of all elements (or of the given element table
+        # rows): the elemental thickness where defined, else the average of
+        # the nodal thicknesses (TRB) if all nodes have one > 0, else the
+        # property thickness. Resolved for all elements at once and cached
+        # until a thickness, part or property table or the elements change
+        # through the Mesh methods (call updateArrays after direct changes).
+        if self.ElemThicknesses is None:
+            Elems=self.getElemTable()
+            PartIDs=Elems.getPartIDs()
+            Parts, inverse = np.unique(PartIDs, return_inverse=True)
+            thick=np.array([self.getPartData(PartID)[2] for PartID in Parts.tolist()], dtype=np.float64)[inverse]
+            if len(self.Nodalthickness)>0:
+                NodeIDs, values = Thickness.sortedNodal(self.Nodalthickness)
+                thick=Thickness.applyNodal(thick, Thickness.nodalValues(NodeIDs, values, Elems.getConn()), Elems.getNumNodes())
+            if len(self.Elementalthickness)>0:
+                ElemRows=Elems.getRows(self.Elementalthickness.keys())
+                values=np.array(self.Elementalthickness.values(), dtype=np.float64)
+                thick[ElemRows[ElemRows>=0]]=values[ElemRows>=0]
+            self.ElemThicknesses=thick
+        if rows is None:
+            return self.ElemThicknesses
+        return self.ElemThicknesses[rows]
+
+    def getRowsOfParts(self, parts=None):
+        # Element table rows of a PartID or a list of PartIDs, of the parts
+        # in NUTProps for None
+        if parts is None:
+            parts=self.NUTProps
+        return np.flatnonzero(np.in1d(self.getElemTable().getPartIDs(), np.asarray(parts, dtype=np.int64)))
+
+    def getThicknessFromNodes(self, parts=None):
+        # Element IDs and average nodal thickness of the elements of the
+        # given parts (NUTProps by default) for all of them at once, like
+        # Quad/Tria.UpdateThicknessFromNodes (nodes without thickness count 0)
+        Elems=self.getElemTable()
+        rows=self.getRowsOfParts(parts)
+        NodeIDs, values = Thickness.sortedNodal(self.Nodalthickness)
+        average, valid = Thickness.nodalAverage(Thickness.nodalValues(NodeIDs, values, Elems.getConn()[rows]), Elems.getNumNodes()[rows])
+        return Elems.getIDs()[rows], average
+
+    def UpdateThicknessFromNodes(self, parts=None):
+        # Stores getThicknessFromNodes as elemental thickness (marked dirty
+        # for the delta writers, the initialized element objects follow)
+        ElemIDs, thick = self.getThicknessFromNodes(parts)
+        self.setElementalThicknesses(ElemIDs, thick)
+        return ElemIDs, thick
+
+    def getNodalThicknessFromElems(self, parts=None):
+        # Node IDs and area weighted average of the thicknesses
+        # (getElemThicknesses) of the elements of the given parts (NUTProps
+        # by default) around every node. Nodes of elements without area get
+        # the plain average.
+        Elems=self.getElemTable()
+        rows=self.getRowsOfParts(parts)
+        Conn=Elems.getConn()[rows]
+        used=np.ones(Conn.shape, dtype=bool) # Repeated nodes (trias) count once
+        for i in xrange(1, 4):
+            used[:, i]=(Conn[:, i:i+1]!=Conn[:, 0:i]).all(axis=1)
+        NodeIDs, inverse = np.unique(Conn[used], return_inverse=True)
+        area=np.repeat(self.getElemAreas(rows), 4).reshape(-1, 4)[used]
+        thick=np.repeat(self.getElemThicknesses(rows), 4).reshape(-1, 4)[used]
+        weight=np.bincount(inverse, weights=area, minlength=len(NodeIDs))
+        plain=np.bincount(inverse, weights=thick, minlength=len(NodeIDs))/np.maximum(np.bincount(inverse, minlength=len(NodeIDs)), 1)
+        weighted=np.bincount(inverse, weights=area*thick, minlength=len(NodeIDs))/np.where(weight>0.0, weight, 1.0)
+        return NodeIDs, np.where(weight>0.0, weighted, plain)
+
+    def UpdateNodalThicknessFromElems(self, parts=None):
+        # Stores getNodalThicknessFromElems as nodal thickness (node objects
+        # included, marked dirty for the delta writers)
+        NodeIDs, thick = self.getNodalThicknessFromElems(parts)
+        self.setNodalThicknesses(NodeIDs, thick)
+        return NodeIDs, thick
+
+    def getMassProperties(self, rows=None):
+        # Area, volume and mass of every shell, reduced per part.
+        # Returns a dictionary of arrays: per element ('ElemID', 'ElemPartID',
+        # 'ElemArea', 'ElemThickness', 'ElemVolume', 'ElemMass') and per part
+        # ('PartID', 'PartArea', 'PartVolume', 'PartMass', 'PartNumElem').
+        Elems=self.getElemTable()
+        if rows is None:
+            rows=np.arange(len(Elems))
+        PartIDs=Elems.getPartIDs()[rows]
+        Parts, inverse = np.unique(PartIDs, return_inverse=True)
+        rho=np.array([self.getPartData(PartID)[4] for PartID in Parts.tolist()], dtype=np.float64)
+        area=self.getElemAreas(rows)
+        thick=self.getElemThicknesses(rows)
+        vol=area*thick
+        mass=vol*rho[inverse]
+        return {'ElemID': Elems.getIDs()[rows], 'ElemPartID': PartIDs,
+                'ElemArea': area, 'ElemThickness': thick, 'ElemVolume': vol, 'ElemMass': mass,
+                'PartID': Parts,
+                'PartArea': np.bincount(inverse, weights=area, minlength=len(Parts)),
+                'PartVolume': np.bincount(inverse, weights=vol, minlength=len(Parts)),
+                'PartMass': np.bincount(inverse, weights=mass, minlength=len(Parts)),
+                'PartNumElem': np.bincount(inverse, minlength=len(Parts))}
+
     def getMassByPartID(self,PartID):
-        MatID=self.Partlist[PartID][2]
-        density=self.Matlist[MatID][2]
-        return self.getVolumeByPartID(PartID)*density
+        rows=self.getElemTable().getPartRows(PartID)
+        return float(self.getMassProperties(rows)['ElemMass'].sum())
 
     def getVolumeByPartID(self,PartID):
-        # This Method is very slow compared to object strucutre!
-        vol = 0.0
-        #for ElemID, ElemData in self.getElemlist().iteritems():
-        #    if ElemData[0] == PartID:
-        for ElemID in self.PartElemlist[PartID]:
-            vol = vol + self.getVolumeByElemID(ElemID)
-        return vol
+        rows=self.getElemTable().getPartRows(PartID)
+        return float((self.getElemAreas(rows)*self.getElemThicknesses(rows)).sum())
 
     def getAreaByPartID(self,PartID):
-        area = 0.0
-        for ElemID, ElemData in self.getElemlist().iteritems():
-            if ElemData[0] == PartID:
-                area = area + self.getAreaByElemID(ElemID)
-        return area
+        rows=self.getElemTable().getPartRows(PartID)
+        return float(self.getElemAreas(rows).sum())
 
     def getAreaByElemID(self,ElemID):
         area = 0.0
@@ -200,24 +663,23 @@ class Mesh:
 
     def getVolumeByElemID(self,ElemID):
         area = self.getAreaByElemID(ElemID)
-        if ElemID in self.Elementalthickness.keys():
-            vol = area * self.getElementalThickness(ElemID)
-        else:
-            PartID=self.Elemlist[ElemID][0]
-            PropID=self.Partlist[PartID][1]
-            pthick=self.Proplist[PropID][0]
-            vol = area * pthick
-        return vol
+        row = self.getElemTable().getExistingRow(ElemID)
+        return area * float(self.getElemThicknesses()[row])
 
     def getNodeObjByID(self, NodeID):
-        for part in self.PartObjList.itervalues():
-            if NodeID in part.Nodelist.keys():
-                return part.Nodelist[NodeID]
+        # Node object of NodeID if it was created (None otherwise)
+        return self.NodeObjList.get(NodeID)
 
     def getElemObjByID(self, ElemID):
-        part=self.PartObjList[self.Elemlist[ElemID][0]]
-        if ElemID in part.Elemlist.keys():
-            return part.Elemlist[ElemID]
+        # Element object of ElemID if its part is initialized (None otherwise)
+        return self.ElemObjList.get(ElemID)
+
+    def getNodeObjsByID(self, NodeIDs):
+        # Batch version of getNodeObjByID for a list or array of IDs
+        return map(self.NodeObjList.get, np.asarray(NodeIDs).ravel().tolist())
+
+    def getElemObjsByID(self, ElemIDs):
+        return map(self.ElemObjList.get, np.asarray(ElemIDs).ravel().tolist())
 
     def getNodeByID(self, NodeID):
         return self.Nodelist[NodeID]
@@ -232,17 +694,127 @@ class Mesh:
         return self.PartObjList
 
     def getPartByID(self,PartID):
-        return self.PartObjList[PartID]
+        # Initialized parts are returned as Part objects, all others as a
+        # PartView which works on the mesh arrays without creating objects
+        if PartID in self.PartObjList:
+            return self.PartObjList[PartID]
+        return PartView(self, PartID)
 
     def getRectangleBounds(self):
         # This Method gives you the Edge Values of the sourrounding rectangle
         # It is created in order to help positioning a blank file or calculating scrap
-        Nodes = {'NodeId': np.array(self.Nodelist.keys(), dtype=int), 'coord': np.array(self.Nodelist.values(), dtype=float)}
-        xmin=np.amin(Nodes['coord'][:,0])
-        xmax=np.amax(Nodes['coord'][:,0])
-        ymin=np.amin(Nodes['coord'][:,1])
-        ymax=np.amax(Nodes['coord'][:,1])
-        zmin=np.amin(Nodes['coord'][:,2])
-        zmax=np.amax(Nodes['coord'][:,2])
+        Bounds=self.getMeshBounds()
+        xmin, ymin, zmin = Bounds['Lower'].tolist()
+        xmax, ymax, zmax = Bounds['Upper'].tolist()
         # self.logger.debug("Bounds of Outer Box: "+ str([xmin,xmax,ymin,ymax,zmin,zmax]))
-        return [xmin,xmax,ymin,ymax,zmin,zmax]
\ No newline at end of file
+        return [xmin,xmax,ymin,ymax,zmin,zmax]
+
+    def getMeshBounds(self):
+        # Box of all nodes ('Lower', 'Upper' (3,)), from the node coordinates
+        # alone. Starts the cached bounds, see getBounds.
+        if self.Bounds is None:
+            Coords=self.getNodeTable().getCoords()
+            if len(Coords)==0:
+                raise Exception("Missing Nodes. Please check Input")
+            self.Bounds={'Lower': Coords.min(axis=0), 'Upper': Coords.max(axis=0)}
+        return self.Bounds
+
+    def getElemBoxes(self, rows=None):
+        # Lower and upper corners (n, 3) of the element boxes (of all elements
+        # or the given element table rows), NaN for elements with missing nodes
+        Conn=self.getElemTable().getConn()
+        if rows is not None:
+            Conn=Conn[rows]
+        NodeRows=self.getNodeTable().getRows(Conn)
+        Corners=Geometry.shellCorners(self.getNodeTable().getCoords(), NodeRows)
+        Lower=Corners.min(axis=1)
+        Upper=Corners.max(axis=1)
+        missing=(NodeRows<0).any(axis=1)
+        Lower[missing]=np.nan
+        Upper[missing]=np.nan
+        return Lower, Upper
+
+    def getBounds(self):
+        # Axis aligned bounding boxes as dictionary of arrays: of all nodes
+        # ('Lower', 'Upper' (3,)), per part ('PartID', 'PartLower',
+        # 'PartUpper') and per element table row ('ElemLower', 'ElemUpper').
+        # Element and part boxes are added on first use and skip elements
+        # with missing nodes. Cached, setNodes updates them in place.
+        Bounds=self.getMeshBounds()
+        if not 'ElemLower' in Bounds:
+            Bounds['ElemLower'], Bounds['ElemUpper'] = self.getElemBoxes()
+            Parts, starts, order = self.getElemTable().getPartGroups()
+            Bounds['PartID']=Parts
+            if len(Parts)>0:
+                Bounds['PartLower']=np.fmin.reduceat(Bounds['ElemLower'][order], starts[:-1], axis=0)
+                Bounds['PartUpper']=np.fmax.reduceat(Bounds['ElemUpper'][order], starts[:-1], axis=0)
+            else:
+                Bounds['PartLower']=np.zeros((0, 3))
+                Bounds['PartUpper']=np.zeros((0, 3))
+        return Bounds
+
+    def updateBounds(self, NodeIDs, OldCoords, Coords):
+        # Updates the cached boxes after the nodes NodeIDs moved from
+        # OldCoords to Coords: boxes of the elements using them, of their
+        # parts and the mesh box (recomputed only if a node left its boundary)
+        Bounds=self.Bounds
+        Elems=self.getElemTable()
+        rows=Elems.getRows(self.getNodeElems().getRows(NodeIDs))
+        rows=rows[rows>=0]
+        if 'ElemLower' in Bounds and len(rows)>0:
+            Bounds['ElemLower'][rows], Bounds['ElemUpper'][rows] = self.getElemBoxes(rows)
+            for PartID in np.unique(Elems.getPartIDs()[rows]).tolist():
+                i=np.searchsorted(Bounds['PartID'], PartID)
+                PartRows=Elems.getPartRows(PartID)
+                Bounds['PartLower'][i]=np.fmin.reduce(Bounds['ElemLower'][PartRows], axis=0)
+                Bounds['PartUpper'][i]=np.fmax.reduce(Bounds['ElemUpper'][PartRows], axis=0)
+        if ((OldCoords<=Bounds['Lower'])|(OldCoords>=Bounds['Upper'])).any():
+            AllCoords=self.getNodeTable().getCoords()
+            Bounds['Lower']=AllCoords.min(axis=0)
+            Bounds['Upper']=AllCoords.max(axis=0)
+        else:
+            Bounds['Lower']=np.minimum(Bounds['Lower'], Coords.min(axis=0))
+            Bounds['Upper']=np.maximum(Bounds['Upper'], Coords.max(axis=0))
+
+    def getPartBounds(self, PartID):
+        # [xmin,xmax,ymin,ymax,zmin,zmax] of the nodes of a part
+        Bounds=self.getBounds()
+        i=np.searchsorted(Bounds['PartID'], PartID)
+        if i==len(Bounds['PartID']) or Bounds['PartID'][i]!=PartID:
+            raise KeyError(PartID)
+        xmin, ymin, zmin = Bounds['PartLower'][i].tolist()
+        xmax, ymax, zmax = Bounds['PartUpper'][i].tolist()
+        return [xmin,xmax,ymin,ymax,zmin,zmax]
+
+    def getElemBounds(self, rows=None):
+        # Lower and upper corners (n, 3) of the boxes of all elements (or of
+        # the given element table rows)
+        Bounds=self.getBounds()
+        if rows is None:
+            return Bounds['ElemLower'], Bounds['ElemUpper']
+        return Bounds['ElemLower'][rows], Bounds['ElemUpper'][rows]
+
+    def getOrientedBounds(self, PartID):
+        # Minimum area box of a part in its best fit plane (for blank sizing):
+        # 'Center' (3,), 'Axes' (3, 3) rows length, width and normal
+        # direction, 'Extents' (3,) length >= width and thickness of the box
+        # along them and 'Area' (length * width). Cached until nodes change.
+        if not PartID in self.OrientedBounds:
+            rows=self.getElemTable().getPartRows(PartID)
+            if len(rows)==0:
+                raise KeyError(PartID)
+            Points=self.getNodeTable().getCoords()[np.unique(self.getNodeRowsOfElems(rows))]
+            center, axes = Geometry.bestFitPlane(Points)
+            local=(Points-center).dot(axes.T)
+            direction, limits, area = Geometry.minAreaRectangle(Geometry.convexHull(local[:, 0:2]))
+            u=direction[0]*axes[0]+direction[1]*axes[1]
+            v=-direction[1]*axes[0]+direction[0]*axes[1]
+            w=local[:, 2]
+            Center=center+u*(limits[0]+limits[1])/2+v*(limits[2]+limits[3])/2+axes[2]*(w.min()+w.max())/2
+            Extents=np.array([limits[1]-limits[0], limits[3]-limits[2], w.max()-w.min()])
+            Axes=np.array([u, v, axes[2]])
+            if Extents[1]>Extents[0]:
+                Extents[[0, 1]]=Extents[[1, 0]]
+                Axes[[0, 1]]=Axes[[1, 0]]
+            self.OrientedBounds[PartID]={'Center': Center, 'Axes': Axes, 'Extents': Extents, 'Area': area}
+        return self.OrientedBounds[PartID]
\ No newline at end of file
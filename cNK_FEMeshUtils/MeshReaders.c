@@ -1,13100 +0,0 @@
-/* Generated by Cython 0.23.4 */
-
-/* BEGIN: Cython Metadata
-{
-    "distutils": {}
-}
-END: Cython Metadata */
-
-#define PY_SSIZE_T_CLEAN
-#include "Python.h"
-#ifndef Py_PYTHON_H
-    #error Python headers needed to compile C extensions, please install development version of Python.
-#elif PY_VERSION_HEX < 0x02060000 || (0x03000000 <= PY_VERSION_HEX && PY_VERSION_HEX < 0x03020000)
-    #error Cython requires Python 2.6+ or Python 3.2+.
-#else
-#define CYTHON_ABI "0_23_4"
-#include <stddef.h>
-#ifndef offsetof
-#define offsetof(type, member) ( (size_t) & ((type*)0) -> member )
-#endif
-#if !defined(WIN32) && !defined(MS_WINDOWS)
-  #ifndef __stdcall
-    #define __stdcall
-  #endif
-  #ifndef __cdecl
-    #define __cdecl
-  #endif
-  #ifndef __fastcall
-    #define __fastcall
-  #endif
-#endif
-#ifndef DL_IMPORT
-  #define DL_IMPORT(t) t
-#endif
-#ifndef DL_EXPORT
-  #define DL_EXPORT(t) t
-#endif
-#ifndef PY_LONG_LONG
-  #define PY_LONG_LONG LONG_LONG
-#endif
-#ifndef Py_HUGE_VAL
-  #define Py_HUGE_VAL HUGE_VAL
-#endif
-#ifdef PYPY_VERSION
-#define CYTHON_COMPILING_IN_PYPY 1
-#define CYTHON_COMPILING_IN_CPYTHON 0
-#else
-#define CYTHON_COMPILING_IN_PYPY 0
-#define CYTHON_COMPILING_IN_CPYTHON 1
-#endif
-#if !defined(CYTHON_USE_PYLONG_INTERNALS) && CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x02070000
-#define CYTHON_USE_PYLONG_INTERNALS 1
-#endif
-#if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX < 0x02070600 && !defined(Py_OptimizeFlag)
-#define Py_OptimizeFlag 0
-#endif
-#define __PYX_BUILD_PY_SSIZE_T "n"
-#define CYTHON_FORMAT_SSIZE_T "z"
-#if PY_MAJOR_VERSION < 3
-  #define __Pyx_BUILTIN_MODULE_NAME "__builtin__"
-  #define __Pyx_PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
-          PyCode_New(a+k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
-  #define __Pyx_DefaultClassType PyClass_Type
-#else
-  #define __Pyx_BUILTIN_MODULE_NAME "builtins"
-  #define __Pyx_PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
-          PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
-  #define __Pyx_DefaultClassType PyType_Type
-#endif
-#ifndef Py_TPFLAGS_CHECKTYPES
-  #define Py_TPFLAGS_CHECKTYPES 0
-#endif
-#ifndef Py_TPFLAGS_HAVE_INDEX
-  #define Py_TPFLAGS_HAVE_INDEX 0
-#endif
-#ifndef Py_TPFLAGS_HAVE_NEWBUFFER
-  #define Py_TPFLAGS_HAVE_NEWBUFFER 0
-#endif
-#ifndef Py_TPFLAGS_HAVE_FINALIZE
-  #define Py_TPFLAGS_HAVE_FINALIZE 0
-#endif
-#if PY_VERSION_HEX > 0x03030000 && defined(PyUnicode_KIND)
-  #define CYTHON_PEP393_ENABLED 1
-  #define __Pyx_PyUnicode_READY(op)       (likely(PyUnicode_IS_READY(op)) ?\
-                                              0 : _PyUnicode_Ready((PyObject *)(op)))
-  #define __Pyx_PyUnicode_GET_LENGTH(u)   PyUnicode_GET_LENGTH(u)
-  #define __Pyx_PyUnicode_READ_CHAR(u, i) PyUnicode_READ_CHAR(u, i)
-  #define __Pyx_PyUnicode_KIND(u)         PyUnicode_KIND(u)
-  #define __Pyx_PyUnicode_DATA(u)         PyUnicode_DATA(u)
-  #define __Pyx_PyUnicode_READ(k, d, i)   PyUnicode_READ(k, d, i)
-#else
-  #define CYTHON_PEP393_ENABLED 0
-  #define __Pyx_PyUnicode_READY(op)       (0)
-  #define __Pyx_PyUnicode_GET_LENGTH(u)   PyUnicode_GET_SIZE(u)
-  #define __Pyx_PyUnicode_READ_CHAR(u, i) ((Py_UCS4)(PyUnicode_AS_UNICODE(u)[i]))
-  #define __Pyx_PyUnicode_KIND(u)         (sizeof(Py_UNICODE))
-  #define __Pyx_PyUnicode_DATA(u)         ((void*)PyUnicode_AS_UNICODE(u))
-  #define __Pyx_PyUnicode_READ(k, d, i)   ((void)(k), (Py_UCS4)(((Py_UNICODE*)d)[i]))
-#endif
-#if CYTHON_COMPILING_IN_PYPY
-  #define __Pyx_PyUnicode_Concat(a, b)      PyNumber_Add(a, b)
-  #define __Pyx_PyUnicode_ConcatSafe(a, b)  PyNumber_Add(a, b)
-#else
-  #define __Pyx_PyUnicode_Concat(a, b)      PyUnicode_Concat(a, b)
-  #define __Pyx_PyUnicode_ConcatSafe(a, b)  ((unlikely((a) == Py_None) || unlikely((b) == Py_None)) ?\
-      PyNumber_Add(a, b) : __Pyx_PyUnicode_Concat(a, b))
-#endif
-#if CYTHON_COMPILING_IN_PYPY && !defined(PyUnicode_Contains)
-  #define PyUnicode_Contains(u, s)  PySequence_Contains(u, s)
-#endif
-#define __Pyx_PyString_FormatSafe(a, b)   ((unlikely((a) == Py_None)) ? PyNumber_Remainder(a, b) : __Pyx_PyString_Format(a, b))
-#define __Pyx_PyUnicode_FormatSafe(a, b)  ((unlikely((a) == Py_None)) ? PyNumber_Remainder(a, b) : PyUnicode_Format(a, b))
-#if PY_MAJOR_VERSION >= 3
-  #define __Pyx_PyString_Format(a, b)  PyUnicode_Format(a, b)
-#else
-  #define __Pyx_PyString_Format(a, b)  PyString_Format(a, b)
-#endif
-#if PY_MAJOR_VERSION >= 3
-  #define PyBaseString_Type            PyUnicode_Type
-  #define PyStringObject               PyUnicodeObject
-  #define PyString_Type                PyUnicode_Type
-  #define PyString_Check               PyUnicode_Check
-  #define PyString_CheckExact          PyUnicode_CheckExact
-#endif
-#if PY_MAJOR_VERSION >= 3
-  #define __Pyx_PyBaseString_Check(obj) PyUnicode_Check(obj)
-  #define __Pyx_PyBaseString_CheckExact(obj) PyUnicode_CheckExact(obj)
-#else
-  #define __Pyx_PyBaseString_Check(obj) (PyString_Check(obj) || PyUnicode_Check(obj))
-  #define __Pyx_PyBaseString_CheckExact(obj) (PyString_CheckExact(obj) || PyUnicode_CheckExact(obj))
-#endif
-#ifndef PySet_CheckExact
-  #define PySet_CheckExact(obj)        (Py_TYPE(obj) == &PySet_Type)
-#endif
-#define __Pyx_TypeCheck(obj, type) PyObject_TypeCheck(obj, (PyTypeObject *)type)
-#if PY_MAJOR_VERSION >= 3
-  #define PyIntObject                  PyLongObject
-  #define PyInt_Type                   PyLong_Type
-  #define PyInt_Check(op)              PyLong_Check(op)
-  #define PyInt_CheckExact(op)         PyLong_CheckExact(op)
-  #define PyInt_FromString             PyLong_FromString
-  #define PyInt_FromUnicode            PyLong_FromUnicode
-  #define PyInt_FromLong               PyLong_FromLong
-  #define PyInt_FromSize_t             PyLong_FromSize_t
-  #define PyInt_FromSsize_t            PyLong_FromSsize_t
-  #define PyInt_AsLong                 PyLong_AsLong
-  #define PyInt_AS_LONG                PyLong_AS_LONG
-  #define PyInt_AsSsize_t              PyLong_AsSsize_t
-  #define PyInt_AsUnsignedLongMask     PyLong_AsUnsignedLongMask
-  #define PyInt_AsUnsignedLongLongMask PyLong_AsUnsignedLongLongMask
-  #define PyNumber_Int                 PyNumber_Long
-#endif
-#if PY_MAJOR_VERSION >= 3
-  #define PyBoolObject                 PyLongObject
-#endif
-#if PY_MAJOR_VERSION >= 3 && CYTHON_COMPILING_IN_PYPY
-  #ifndef PyUnicode_InternFromString
-    #define PyUnicode_InternFromString(s) PyUnicode_FromString(s)
-  #endif
-#endif
-#if PY_VERSION_HEX < 0x030200A4
-  typedef long Py_hash_t;
-  #define __Pyx_PyInt_FromHash_t PyInt_FromLong
-  #define __Pyx_PyInt_AsHash_t   PyInt_AsLong
-#else
-  #define __Pyx_PyInt_FromHash_t PyInt_FromSsize_t
-  #define __Pyx_PyInt_AsHash_t   PyInt_AsSsize_t
-#endif
-#if PY_MAJOR_VERSION >= 3
-  #define __Pyx_PyMethod_New(func, self, klass) ((self) ? PyMethod_New(func, self) : PyInstanceMethod_New(func))
-#else
-  #define __Pyx_PyMethod_New(func, self, klass) PyMethod_New(func, self, klass)
-#endif
-#if PY_VERSION_HEX >= 0x030500B1
-#define __Pyx_PyAsyncMethodsStruct PyAsyncMethods
-#define __Pyx_PyType_AsAsync(obj) (Py_TYPE(obj)->tp_as_async)
-#elif CYTHON_COMPILING_IN_CPYTHON && PY_MAJOR_VERSION >= 3
-typedef struct {
-    unaryfunc am_await;
-    unaryfunc am_aiter;
-    unaryfunc am_anext;
-} __Pyx_PyAsyncMethodsStruct;
-#define __Pyx_PyType_AsAsync(obj) ((__Pyx_PyAsyncMethodsStruct*) (Py_TYPE(obj)->tp_reserved))
-#else
-#define __Pyx_PyType_AsAsync(obj) NULL
-#endif
-#ifndef CYTHON_RESTRICT
-  #if defined(__GNUC__)
-    #define CYTHON_RESTRICT __restrict__
-  #elif defined(_MSC_VER) && _MSC_VER >= 1400
-    #define CYTHON_RESTRICT __restrict
-  #elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
-    #define CYTHON_RESTRICT restrict
-  #else
-    #define CYTHON_RESTRICT
-  #endif
-#endif
-#define __Pyx_void_to_None(void_result) ((void)(void_result), Py_INCREF(Py_None), Py_None)
-
-#ifndef CYTHON_INLINE
-  #if defined(__GNUC__)
-    #define CYTHON_INLINE __inline__
-  #elif defined(_MSC_VER)
-    #define CYTHON_INLINE __inline
-  #elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
-    #define CYTHON_INLINE inline
-  #else
-    #define CYTHON_INLINE
-  #endif
-#endif
-
-#if defined(WIN32) || defined(MS_WINDOWS)
-  #define _USE_MATH_DEFINES
-#endif
-#include <math.h>
-#ifdef NAN
-#define __PYX_NAN() ((float) NAN)
-#else
-static CYTHON_INLINE float __PYX_NAN() {
-  float value;
-  memset(&value, 0xFF, sizeof(value));
-  return value;
-}
-#endif
-
-
-#if PY_MAJOR_VERSION >= 3
-  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_TrueDivide(x,y)
-  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceTrueDivide(x,y)
-#else
-  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_Divide(x,y)
-  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceDivide(x,y)
-#endif
-
-#ifndef __PYX_EXTERN_C
-  #ifdef __cplusplus
-    #define __PYX_EXTERN_C extern "C"
-  #else
-    #define __PYX_EXTERN_C extern
-  #endif
-#endif
-
-#define __PYX_HAVE__cNK_FEMeshUtils__MeshReaders
-#define __PYX_HAVE_API__cNK_FEMeshUtils__MeshReaders
-#ifdef _OPENMP
-#include <omp.h>
-#endif /* _OPENMP */
-
-#ifdef PYREX_WITHOUT_ASSERTIONS
-#define CYTHON_WITHOUT_ASSERTIONS
-#endif
-
-#ifndef CYTHON_UNUSED
-# if defined(__GNUC__)
-#   if !(defined(__cplusplus)) || (__GNUC__ > 3 || (__GNUC__ == 3 && __GNUC_MINOR__ >= 4))
-#     define CYTHON_UNUSED __attribute__ ((__unused__))
-#   else
-#     define CYTHON_UNUSED
-#   endif
-# elif defined(__ICC) || (defined(__INTEL_COMPILER) && !defined(_MSC_VER))
-#   define CYTHON_UNUSED __attribute__ ((__unused__))
-# else
-#   define CYTHON_UNUSED
-# endif
-#endif
-#ifndef CYTHON_NCP_UNUSED
-# if CYTHON_COMPILING_IN_CPYTHON
-#  define CYTHON_NCP_UNUSED
-# else
-#  define CYTHON_NCP_UNUSED CYTHON_UNUSED
-# endif
-#endif
-typedef struct {PyObject **p; char *s; const Py_ssize_t n; const char* encoding;
-                const char is_unicode; const char is_str; const char intern; } __Pyx_StringTabEntry;
-
-#define __PYX_DEFAULT_STRING_ENCODING_IS_ASCII 0
-#define __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT 0
-#define __PYX_DEFAULT_STRING_ENCODING ""
-#define __Pyx_PyObject_FromString __Pyx_PyBytes_FromString
-#define __Pyx_PyObject_FromStringAndSize __Pyx_PyBytes_FromStringAndSize
-#define __Pyx_uchar_cast(c) ((unsigned char)c)
-#define __Pyx_long_cast(x) ((long)x)
-#define __Pyx_fits_Py_ssize_t(v, type, is_signed)  (\
-    (sizeof(type) < sizeof(Py_ssize_t))  ||\
-    (sizeof(type) > sizeof(Py_ssize_t) &&\
-          likely(v < (type)PY_SSIZE_T_MAX ||\
-                 v == (type)PY_SSIZE_T_MAX)  &&\
-          (!is_signed || likely(v > (type)PY_SSIZE_T_MIN ||\
-                                v == (type)PY_SSIZE_T_MIN)))  ||\
-    (sizeof(type) == sizeof(Py_ssize_t) &&\
-          (is_signed || likely(v < (type)PY_SSIZE_T_MAX ||\
-                               v == (type)PY_SSIZE_T_MAX)))  )
-#if defined (__cplusplus) && __cplusplus >= 201103L
-    #include <cstdlib>
-    #define __Pyx_sst_abs(value) std::abs(value)
-#elif SIZEOF_INT >= SIZEOF_SIZE_T
-    #define __Pyx_sst_abs(value) abs(value)
-#elif SIZEOF_LONG >= SIZEOF_SIZE_T
-    #define __Pyx_sst_abs(value) labs(value)
-#elif defined (_MSC_VER) && defined (_M_X64)
-    #define __Pyx_sst_abs(value) _abs64(value)
-#elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
-    #define __Pyx_sst_abs(value) llabs(value)
-#elif defined (__GNUC__)
-    #define __Pyx_sst_abs(value) __builtin_llabs(value)
-#else
-    #define __Pyx_sst_abs(value) ((value<0) ? -value : value)
-#endif
-static CYTHON_INLINE char* __Pyx_PyObject_AsString(PyObject*);
-static CYTHON_INLINE char* __Pyx_PyObject_AsStringAndSize(PyObject*, Py_ssize_t* length);
-#define __Pyx_PyByteArray_FromString(s) PyByteArray_FromStringAndSize((const char*)s, strlen((const char*)s))
-#define __Pyx_PyByteArray_FromStringAndSize(s, l) PyByteArray_FromStringAndSize((const char*)s, l)
-#define __Pyx_PyBytes_FromString        PyBytes_FromString
-#define __Pyx_PyBytes_FromStringAndSize PyBytes_FromStringAndSize
-static CYTHON_INLINE PyObject* __Pyx_PyUnicode_FromString(const char*);
-#if PY_MAJOR_VERSION < 3
-    #define __Pyx_PyStr_FromString        __Pyx_PyBytes_FromString
-    #define __Pyx_PyStr_FromStringAndSize __Pyx_PyBytes_FromStringAndSize
-#else
-    #define __Pyx_PyStr_FromString        __Pyx_PyUnicode_FromString
-    #define __Pyx_PyStr_FromStringAndSize __Pyx_PyUnicode_FromStringAndSize
-#endif
-#define __Pyx_PyObject_AsSString(s)    ((signed char*) __Pyx_PyObject_AsString(s))
-#define __Pyx_PyObject_AsUString(s)    ((unsigned char*) __Pyx_PyObject_AsString(s))
-#define __Pyx_PyObject_FromCString(s)  __Pyx_PyObject_FromString((const char*)s)
-#define __Pyx_PyBytes_FromCString(s)   __Pyx_PyBytes_FromString((const char*)s)
-#define __Pyx_PyByteArray_FromCString(s)   __Pyx_PyByteArray_FromString((const char*)s)
-#define __Pyx_PyStr_FromCString(s)     __Pyx_PyStr_FromString((const char*)s)
-#define __Pyx_PyUnicode_FromCString(s) __Pyx_PyUnicode_FromString((const char*)s)
-#if PY_MAJOR_VERSION < 3
-static CYTHON_INLINE size_t __Pyx_Py_UNICODE_strlen(const Py_UNICODE *u)
-{
-    const Py_UNICODE *u_end = u;
-    while (*u_end++) ;
-    return (size_t)(u_end - u - 1);
-}
-#else
-#define __Pyx_Py_UNICODE_strlen Py_UNICODE_strlen
-#endif
-#define __Pyx_PyUnicode_FromUnicode(u)       PyUnicode_FromUnicode(u, __Pyx_Py_UNICODE_strlen(u))
-#define __Pyx_PyUnicode_FromUnicodeAndLength PyUnicode_FromUnicode
-#define __Pyx_PyUnicode_AsUnicode            PyUnicode_AsUnicode
-#define __Pyx_NewRef(obj) (Py_INCREF(obj), obj)
-#define __Pyx_Owned_Py_None(b) __Pyx_NewRef(Py_None)
-#define __Pyx_PyBool_FromLong(b) ((b) ? __Pyx_NewRef(Py_True) : __Pyx_NewRef(Py_False))
-static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject*);
-static CYTHON_INLINE PyObject* __Pyx_PyNumber_Int(PyObject* x);
-static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject*);
-static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t);
-#if CYTHON_COMPILING_IN_CPYTHON
-#define __pyx_PyFloat_AsDouble(x) (PyFloat_CheckExact(x) ? PyFloat_AS_DOUBLE(x) : PyFloat_AsDouble(x))
-#else
-#define __pyx_PyFloat_AsDouble(x) PyFloat_AsDouble(x)
-#endif
-#define __pyx_PyFloat_AsFloat(x) ((float) __pyx_PyFloat_AsDouble(x))
-#if PY_MAJOR_VERSION < 3 && __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
-static int __Pyx_sys_getdefaultencoding_not_ascii;
-static int __Pyx_init_sys_getdefaultencoding_params(void) {
-    PyObject* sys;
-    PyObject* default_encoding = NULL;
-    PyObject* ascii_chars_u = NULL;
-    PyObject* ascii_chars_b = NULL;
-    const char* default_encoding_c;
-    sys = PyImport_ImportModule("sys");
-    if (!sys) goto bad;
-    default_encoding = PyObject_CallMethod(sys, (char*) "getdefaultencoding", NULL);
-    Py_DECREF(sys);
-    if (!default_encoding) goto bad;
-    default_encoding_c = PyBytes_AsString(default_encoding);
-    if (!default_encoding_c) goto bad;
-    if (strcmp(default_encoding_c, "ascii") == 0) {
-        __Pyx_sys_getdefaultencoding_not_ascii = 0;
-    } else {
-        char ascii_chars[128];
-        int c;
-        for (c = 0; c < 128; c++) {
-            ascii_chars[c] = c;
-        }
-        __Pyx_sys_getdefaultencoding_not_ascii = 1;
-        ascii_chars_u = PyUnicode_DecodeASCII(ascii_chars, 128, NULL);
-        if (!ascii_chars_u) goto bad;
-        ascii_chars_b = PyUnicode_AsEncodedString(ascii_chars_u, default_encoding_c, NULL);
-        if (!ascii_chars_b || !PyBytes_Check(ascii_chars_b) || memcmp(ascii_chars, PyBytes_AS_STRING(ascii_chars_b), 128) != 0) {
-            PyErr_Format(
-                PyExc_ValueError,
-                "This module compiled with c_string_encoding=ascii, but default encoding '%.200s' is not a superset of ascii.",
-                default_encoding_c);
-            goto bad;
-        }
-        Py_DECREF(ascii_chars_u);
-        Py_DECREF(ascii_chars_b);
-    }
-    Py_DECREF(default_encoding);
-    return 0;
-bad:
-    Py_XDECREF(default_encoding);
-    Py_XDECREF(ascii_chars_u);
-    Py_XDECREF(ascii_chars_b);
-    return -1;
-}
-#endif
-#if __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT && PY_MAJOR_VERSION >= 3
-#define __Pyx_PyUnicode_FromStringAndSize(c_str, size) PyUnicode_DecodeUTF8(c_str, size, NULL)
-#else
-#define __Pyx_PyUnicode_FromStringAndSize(c_str, size) PyUnicode_Decode(c_str, size, __PYX_DEFAULT_STRING_ENCODING, NULL)
-#if __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
-static char* __PYX_DEFAULT_STRING_ENCODING;
-static int __Pyx_init_sys_getdefaultencoding_params(void) {
-    PyObject* sys;
-    PyObject* default_encoding = NULL;
-    char* default_encoding_c;
-    sys = PyImport_ImportModule("sys");
-    if (!sys) goto bad;
-    default_encoding = PyObject_CallMethod(sys, (char*) (const char*) "getdefaultencoding", NULL);
-    Py_DECREF(sys);
-    if (!default_encoding) goto bad;
-    default_encoding_c = PyBytes_AsString(default_encoding);
-    if (!default_encoding_c) goto bad;
-    __PYX_DEFAULT_STRING_ENCODING = (char*) malloc(strlen(default_encoding_c));
-    if (!__PYX_DEFAULT_STRING_ENCODING) goto bad;
-    strcpy(__PYX_DEFAULT_STRING_ENCODING, default_encoding_c);
-    Py_DECREF(default_encoding);
-    return 0;
-bad:
-    Py_XDECREF(default_encoding);
-    return -1;
-}
-#endif
-#endif
-
-
-/* Test for GCC > 2.95 */
-#if defined(__GNUC__)     && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))
-  #define likely(x)   __builtin_expect(!!(x), 1)
-  #define unlikely(x) __builtin_expect(!!(x), 0)
-#else /* !__GNUC__ or GCC < 2.95 */
-  #define likely(x)   (x)
-  #define unlikely(x) (x)
-#endif /* __GNUC__ */
-
-static PyObject *__pyx_m;
-static PyObject *__pyx_d;
-static PyObject *__pyx_b;
-static PyObject *__pyx_empty_tuple;
-static PyObject *__pyx_empty_bytes;
-static int __pyx_lineno;
-static int __pyx_clineno = 0;
-static const char * __pyx_cfilenm= __FILE__;
-static const char *__pyx_filename;
-
-
-static const char *__pyx_f[] = {
-  "cNK_FEMeshUtils\\MeshReaders.py",
-  "cNK_FEMeshUtils\\Element.pxd",
-  "cNK_FEMeshUtils\\Node.pxd",
-  "cNK_FEMeshUtils\\Material.pxd",
-  "cNK_FEMeshUtils\\Property.pxd",
-  "cNK_FEMeshUtils\\Part.pxd",
-  "cNK_FEMeshUtils\\Mesh.pxd",
-};
-
-/*--- Type declarations ---*/
-struct __pyx_obj_15cNK_FEMeshUtils_7Element_Element;
-struct __pyx_obj_15cNK_FEMeshUtils_4Node_Node;
-struct __pyx_obj_15cNK_FEMeshUtils_8Material_Material;
-struct __pyx_obj_15cNK_FEMeshUtils_8Property_Property;
-struct __pyx_obj_15cNK_FEMeshUtils_4Part_Part;
-struct __pyx_obj_15cNK_FEMeshUtils_4Mesh_Mesh;
-struct __pyx_obj_15cNK_FEMeshUtils_11MeshReaders_MeshReaders;
-
-/* "Element.pxd":2
- * #from Node cimport Node
- * cdef class Element:             # <<<<<<<<<<<<<<
- *     cdef public int ElemID,PartID
- *     cdef public double thickness
- */
-struct __pyx_obj_15cNK_FEMeshUtils_7Element_Element {
-  PyObject_HEAD
-  struct __pyx_vtabstruct_15cNK_FEMeshUtils_7Element_Element *__pyx_vtab;
-  int ElemID;
-  int PartID;
-  double thickness;
-  PyObject *Nodes;
-};
-
-
-/* "Node.pxd":1
- * cdef class Node:             # <<<<<<<<<<<<<<
- *     cdef public int NodeID
- *     cdef public double x,y,z,thickness
- */
-struct __pyx_obj_15cNK_FEMeshUtils_4Node_Node {
-  PyObject_HEAD
-  struct __pyx_vtabstruct_15cNK_FEMeshUtils_4Node_Node *__pyx_vtab;
-  int NodeID;
-  double x;
-  double y;
-  double z;
-  double thickness;
-};
-
-
-/* "Material.pxd":1
- * cdef class Material:             # <<<<<<<<<<<<<<
- *     cdef public int MatID
- *     cdef public double E,Rho
- */
-struct __pyx_obj_15cNK_FEMeshUtils_8Material_Material {
-  PyObject_HEAD
-  int MatID;
-  double E;
-  double Rho;
-};
-
-
-/* "Property.pxd":1
- * cdef class Property:             # <<<<<<<<<<<<<<
- *     cdef public double thickness
- *     cdef public int PropID
- */
-struct __pyx_obj_15cNK_FEMeshUtils_8Property_Property {
-  PyObject_HEAD
-  double thickness;
-  int PropID;
-};
-
-
-/* "Part.pxd":5
- * from Property cimport Property
- * # from libcpp cimport bool
- * cdef class Part:             # <<<<<<<<<<<<<<
- *     cdef public int PartID
- *     cdef public str title
- */
-struct __pyx_obj_15cNK_FEMeshUtils_4Part_Part {
-  PyObject_HEAD
-  struct __pyx_vtabstruct_15cNK_FEMeshUtils_4Part_Part *__pyx_vtab;
-  int PartID;
-  PyObject *title;
-  int nonUniformThickness;
-  struct __pyx_obj_15cNK_FEMeshUtils_8Material_Material *Mat;
-  struct __pyx_obj_15cNK_FEMeshUtils_8Property_Property *Prop;
-  PyObject *ElemObj;
-  PyObject *Elemlist;
-  PyObject *Nodelist;
-};
-
-
-/* "Mesh.pxd":4
- * from Node cimport Node
- * from Part cimport Part
- * cdef class Mesh:             # <<<<<<<<<<<<<<
- *     cdef public dict Nodelist, Nodalthickness, Elementalthickness, Elemlist, PartElemlist, Partlist, Matlist, Proplist, PartObjList
- *     cdef public list NUTProps
- */
-struct __pyx_obj_15cNK_FEMeshUtils_4Mesh_Mesh {
-  PyObject_HEAD
-  struct __pyx_vtabstruct_15cNK_FEMeshUtils_4Mesh_Mesh *__pyx_vtab;
-  PyObject *Nodelist;
-  PyObject *Nodalthickness;
-  PyObject *Elementalthickness;
-  PyObject *Elemlist;
-  PyObject *PartElemlist;
-  PyObject *Partlist;
-  PyObject *Matlist;
-  PyObject *Proplist;
-  PyObject *PartObjList;
-  PyObject *NUTProps;
-  PyObject *Meshfile;
-  PyObject *Meshformat;
-};
-
-
-/* "cNK_FEMeshUtils\MeshReaders.pxd":2
- * from Mesh cimport Mesh
- * cdef class MeshReaders:             # <<<<<<<<<<<<<<
- *     cpdef Mesh readDynaMesh(self, str file)
- *     cpdef Mesh readRadiossMesh(self, str file)
- */
-struct __pyx_obj_15cNK_FEMeshUtils_11MeshReaders_MeshReaders {
-  PyObject_HEAD
-  struct __pyx_vtabstruct_15cNK_FEMeshUtils_11MeshReaders_MeshReaders *__pyx_vtab;
-};
-
-
-
-/* "Element.pxd":2
- * #from Node cimport Node
- * cdef class Element:             # <<<<<<<<<<<<<<
- *     cdef public int ElemID,PartID
- *     cdef public double thickness
- */
-
-struct __pyx_vtabstruct_15cNK_FEMeshUtils_7Element_Element {
-  PyObject *(*setID)(struct __pyx_obj_15cNK_FEMeshUtils_7Element_Element *, int, int __pyx_skip_dispatch);
-  PyObject *(*setPartID)(struct __pyx_obj_15cNK_FEMeshUtils_7Element_Element *, int, int __pyx_skip_dispatch);
-  int (*getID)(struct __pyx_obj_15cNK_FEMeshUtils_7Element_Element *, int __pyx_skip_dispatch);
-  int (*getPartID)(struct __pyx_obj_15cNK_FEMeshUtils_7Element_Element *, int __pyx_skip_dispatch);
-  PyObject *(*getNodes)(struct __pyx_obj_15cNK_FEMeshUtils_7Element_Element *, int __pyx_skip_dispatch);
-  double (*getThickness)(struct __pyx_obj_15cNK_FEMeshUtils_7Element_Element *, int __pyx_skip_dispatch);
-  double (*getVolume)(struct __pyx_obj_15cNK_FEMeshUtils_7Element_Element *, int __pyx_skip_dispatch);
-};
-static struct __pyx_vtabstruct_15cNK_FEMeshUtils_7Element_Element *__pyx_vtabptr_15cNK_FEMeshUtils_7Element_Element;
-
-
-/* "Node.pxd":1
- * cdef class Node:             # <<<<<<<<<<<<<<
- *     cdef public int NodeID
- *     cdef public double x,y,z,thickness
- */
-
-struct __pyx_vtabstruct_15cNK_FEMeshUtils_4Node_Node {
-  PyObject *(*setCoord)(struct __pyx_obj_15cNK_FEMeshUtils_4Node_Node *, double, double, double, int __pyx_skip_dispatch);
-  PyObject *(*setThickness)(struct __pyx_obj_15cNK_FEMeshUtils_4Node_Node *, double, int __pyx_skip_dispatch);
-  int (*getID)(struct __pyx_obj_15cNK_FEMeshUtils_4Node_Node *, int __pyx_skip_dispatch);
-  PyObject *(*getCoord)(struct __pyx_obj_15cNK_FEMeshUtils_4Node_Node *, int __pyx_skip_dispatch);
-  double (*getThickness)(struct __pyx_obj_15cNK_FEMeshUtils_4Node_Node *, int __pyx_skip_dispatch);
-};
-static struct __pyx_vtabstruct_15cNK_FEMeshUtils_4Node_Node *__pyx_vtabptr_15cNK_FEMeshUtils_4Node_Node;
-
-
-/* "Part.pxd":5
- * from Property cimport Property
- * # from libcpp cimport bool
- * cdef class Part:             # <<<<<<<<<<<<<<
- *     cdef public int PartID
- *     cdef public str title
- */
-
-struct __pyx_vtabstruct_15cNK_FEMeshUtils_4Part_Part {
-  PyObject *(*addElem)(struct __pyx_obj_15cNK_FEMeshUtils_4Part_Part *, struct __pyx_obj_15cNK_FEMeshUtils_7Element_Element *, int __pyx_skip_dispatch);
-  PyObject *(*setNonUniformThickness)(struct __pyx_obj_15cNK_FEMeshUtils_4Part_Part *, int, int __pyx_skip_dispatch);
-  int (*isNonUniformThickness)(struct __pyx_obj_15cNK_FEMeshUtils_4Part_Part *, int __pyx_skip_dispatch);
-  int (*getNumElem)(struct __pyx_obj_15cNK_FEMeshUtils_4Part_Part *, int __pyx_skip_dispatch);
-  PyObject *(*getElemlist)(struct __pyx_obj_15cNK_FEMeshUtils_4Part_Part *, int __pyx_skip_dispatch);
-  PyObject *(*getNodelist)(struct __pyx_obj_15cNK_FEMeshUtils_4Part_Part *, int __pyx_skip_dispatch);
-  double (*getPartArea)(struct __pyx_obj_15cNK_FEMeshUtils_4Part_Part *, int __pyx_skip_dispatch);
-  double (*getPartVolume)(struct __pyx_obj_15cNK_FEMeshUtils_4Part_Part *, int __pyx_skip_dispatch);
-  double (*getPartMass)(struct __pyx_obj_15cNK_FEMeshUtils_4Part_Part *, int __pyx_skip_dispatch);
-  int (*getPartID)(struct __pyx_obj_15cNK_FEMeshUtils_4Part_Part *, int __pyx_skip_dispatch);
-  char (*getPartname)(struct __pyx_obj_15cNK_FEMeshUtils_4Part_Part *, int __pyx_skip_dispatch);
-};
-static struct __pyx_vtabstruct_15cNK_FEMeshUtils_4Part_Part *__pyx_vtabptr_15cNK_FEMeshUtils_4Part_Part;
-
-
-/* "Mesh.pxd":4
- * from Node cimport Node
- * from Part cimport Part
- * cdef class Mesh:             # <<<<<<<<<<<<<<
- *     cdef public dict Nodelist, Nodalthickness, Elementalthickness, Elemlist, PartElemlist, Partlist, Matlist, Proplist, PartObjList
- *     cdef public list NUTProps
- */
-
-struct __pyx_vtabstruct_15cNK_FEMeshUtils_4Mesh_Mesh {
-  PyObject *(*addNode)(struct __pyx_obj_15cNK_FEMeshUtils_4Mesh_Mesh *, int, double, double, double, int __pyx_skip_dispatch);
-  PyObject *(*addNodalThickness)(struct __pyx_obj_15cNK_FEMeshUtils_4Mesh_Mesh *, int, double, int __pyx_skip_dispatch);
-  PyObject *(*addElementalThickness)(struct __pyx_obj_15cNK_FEMeshUtils_4Mesh_Mesh *, int, double, int __pyx_skip_dispatch);
-  PyObject *(*addPart)(struct __pyx_obj_15cNK_FEMeshUtils_4Mesh_Mesh *, int, PyObject *, int, int, int __pyx_skip_dispatch);
-  PyObject *(*addMat)(struct __pyx_obj_15cNK_FEMeshUtils_4Mesh_Mesh *, int, double, double, int __pyx_skip_dispatch);
-  PyObject *(*addProp)(struct __pyx_obj_15cNK_FEMeshUtils_4Mesh_Mesh *, int, double, int __pyx_skip_dispatch);
-  double (*getNodalThickness)(struct __pyx_obj_15cNK_FEMeshUtils_4Mesh_Mesh *, int, int __pyx_skip_dispatch);
-  double (*getElementalThickness)(struct __pyx_obj_15cNK_FEMeshUtils_4Mesh_Mesh *, int, int __pyx_skip_dispatch);
-  PyObject *(*InitPartObj)(struct __pyx_obj_15cNK_FEMeshUtils_4Mesh_Mesh *, int, int __pyx_skip_dispatch);
-  PyObject *(*setMeshFile)(struct __pyx_obj_15cNK_FEMeshUtils_4Mesh_Mesh *, PyObject *, int __pyx_skip_dispatch);
-  PyObject *(*setMeshFormat)(struct __pyx_obj_15cNK_FEMeshUtils_4Mesh_Mesh *, PyObject *, int __pyx_skip_dispatch);
-  PyObject *(*getMeshFormat)(struct __pyx_obj_15cNK_FEMeshUtils_4Mesh_Mesh *, int __pyx_skip_dispatch);
-  PyObject *(*getMeshFile)(struct __pyx_obj_15cNK_FEMeshUtils_4Mesh_Mesh *, int __pyx_skip_dispatch);
-  PyObject *(*getNodelist)(struct __pyx_obj_15cNK_FEMeshUtils_4Mesh_Mesh *, int __pyx_skip_dispatch);
-  PyObject *(*getElemlist)(struct __pyx_obj_15cNK_FEMeshUtils_4Mesh_Mesh *, int __pyx_skip_dispatch);
-  double (*getMassByPartID)(struct __pyx_obj_15cNK_FEMeshUtils_4Mesh_Mesh *, int, int __pyx_skip_dispatch);
-  double (*getVolumeByPartID)(struct __pyx_obj_15cNK_FEMeshUtils_4Mesh_Mesh *, int, int __pyx_skip_dispatch);
-  double (*getAreaByPartID)(struct __pyx_obj_15cNK_FEMeshUtils_4Mesh_Mesh *, int, int __pyx_skip_dispatch);
-  double (*getAreaByElemID)(struct __pyx_obj_15cNK_FEMeshUtils_4Mesh_Mesh *, int, int __pyx_skip_dispatch);
-  double (*getVolumeByElemID)(struct __pyx_obj_15cNK_FEMeshUtils_4Mesh_Mesh *, int, int __pyx_skip_dispatch);
-  struct __pyx_obj_15cNK_FEMeshUtils_4Node_Node *(*getNodeObjByID)(struct __pyx_obj_15cNK_FEMeshUtils_4Mesh_Mesh *, int, int __pyx_skip_dispatch);
-  struct __pyx_obj_15cNK_FEMeshUtils_7Element_Element *(*getElemObjByID)(struct __pyx_obj_15cNK_FEMeshUtils_4Mesh_Mesh *, int, int __pyx_skip_dispatch);
-  PyObject *(*getNodeByID)(struct __pyx_obj_15cNK_FEMeshUtils_4Mesh_Mesh *, int, int __pyx_skip_dispatch);
-  PyObject *(*getNodesByElemID)(struct __pyx_obj_15cNK_FEMeshUtils_4Mesh_Mesh *, int, int __pyx_skip_dispatch);
-  PyObject *(*getElemByID)(struct __pyx_obj_15cNK_FEMeshUtils_4Mesh_Mesh *, int, int __pyx_skip_dispatch);
-  PyObject *(*getPartlistObj)(struct __pyx_obj_15cNK_FEMeshUtils_4Mesh_Mesh *, int __pyx_skip_dispatch);
-  struct __pyx_obj_15cNK_FEMeshUtils_4Part_Part *(*getPartByID)(struct __pyx_obj_15cNK_FEMeshUtils_4Mesh_Mesh *, int, int __pyx_skip_dispatch);
-  PyObject *(*getRectangleBounds)(struct __pyx_obj_15cNK_FEMeshUtils_4Mesh_Mesh *, int __pyx_skip_dispatch);
-};
-static struct __pyx_vtabstruct_15cNK_FEMeshUtils_4Mesh_Mesh *__pyx_vtabptr_15cNK_FEMeshUtils_4Mesh_Mesh;
-
-
-/* "cNK_FEMeshUtils\MeshReaders.py":11
- * from getpass import getuser
- * 
- * class MeshReaders:             # <<<<<<<<<<<<<<
- *     def readDynaMesh(self, file):
- *         nodesection = False
- */
-
-struct __pyx_vtabstruct_15cNK_FEMeshUtils_11MeshReaders_MeshReaders {
-  struct __pyx_obj_15cNK_FEMeshUtils_4Mesh_Mesh *(*readDynaMesh)(struct __pyx_obj_15cNK_FEMeshUtils_11MeshReaders_MeshReaders *, PyObject *, int __pyx_skip_dispatch);
-  struct __pyx_obj_15cNK_FEMeshUtils_4Mesh_Mesh *(*readRadiossMesh)(struct __pyx_obj_15cNK_FEMeshUtils_11MeshReaders_MeshReaders *, PyObject *, int __pyx_skip_dispatch);
-  PyObject *(*writeDynaMesh)(struct __pyx_obj_15cNK_FEMeshUtils_11MeshReaders_MeshReaders *, struct __pyx_obj_15cNK_FEMeshUtils_4Mesh_Mesh *, PyObject *, int __pyx_skip_dispatch);
-  PyObject *(*writeRadiossMesh)(struct __pyx_obj_15cNK_FEMeshUtils_11MeshReaders_MeshReaders *, struct __pyx_obj_15cNK_FEMeshUtils_4Mesh_Mesh *, PyObject *, int __pyx_skip_dispatch);
-};
-static struct __pyx_vtabstruct_15cNK_FEMeshUtils_11MeshReaders_MeshReaders *__pyx_vtabptr_15cNK_FEMeshUtils_11MeshReaders_MeshReaders;
-
-/* --- Runtime support code (head) --- */
-#ifndef CYTHON_REFNANNY
-  #define CYTHON_REFNANNY 0
-#endif
-#if CYTHON_REFNANNY
-  typedef struct {
-    void (*INCREF)(void*, PyObject*, int);
-    void (*DECREF)(void*, PyObject*, int);
-    void (*GOTREF)(void*, PyObject*, int);
-    void (*GIVEREF)(void*, PyObject*, int);
-    void* (*SetupContext)(const char*, int, const char*);
-    void (*FinishContext)(void**);
-  } __Pyx_RefNannyAPIStruct;
-  static __Pyx_RefNannyAPIStruct *__Pyx_RefNanny = NULL;
-  static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname);
-  #define __Pyx_RefNannyDeclarations void *__pyx_refnanny = NULL;
-#ifdef WITH_THREAD
-  #define __Pyx_RefNannySetupContext(name, acquire_gil)\
-          if (acquire_gil) {\
-              PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();\
-              __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__);\
-              PyGILState_Release(__pyx_gilstate_save);\
-          } else {\
-              __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__);\
-          }
-#else
-  #define __Pyx_RefNannySetupContext(name, acquire_gil)\
-          __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__)
-#endif
-  #define __Pyx_RefNannyFinishContext()\
-          __Pyx_RefNanny->FinishContext(&__pyx_refnanny)
-  #define __Pyx_INCREF(r)  __Pyx_RefNanny->INCREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
-  #define __Pyx_DECREF(r)  __Pyx_RefNanny->DECREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
-  #define __Pyx_GOTREF(r)  __Pyx_RefNanny->GOTREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
-  #define __Pyx_GIVEREF(r) __Pyx_RefNanny->GIVEREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
-  #define __Pyx_XINCREF(r)  do { if((r) != NULL) {__Pyx_INCREF(r); }} while(0)
-  #define __Pyx_XDECREF(r)  do { if((r) != NULL) {__Pyx_DECREF(r); }} while(0)
-  #define __Pyx_XGOTREF(r)  do { if((r) != NULL) {__Pyx_GOTREF(r); }} while(0)
-  #define __Pyx_XGIVEREF(r) do { if((r) != NULL) {__Pyx_GIVEREF(r);}} while(0)
-#else
-  #define __Pyx_RefNannyDeclarations
-  #define __Pyx_RefNannySetupContext(name, acquire_gil)
-  #define __Pyx_RefNannyFinishContext()
-  #define __Pyx_INCREF(r) Py_INCREF(r)
-  #define __Pyx_DECREF(r) Py_DECREF(r)
-  #define __Pyx_GOTREF(r)
-  #define __Pyx_GIVEREF(r)
-  #define __Pyx_XINCREF(r) Py_XINCREF(r)
-  #define __Pyx_XDECREF(r) Py_XDECREF(r)
-  #define __Pyx_XGOTREF(r)
-  #define __Pyx_XGIVEREF(r)
-#endif
-#define __Pyx_XDECREF_SET(r, v) do {\
-        PyObject *tmp = (PyObject *) r;\
-        r = v; __Pyx_XDECREF(tmp);\
-    } while (0)
-#define __Pyx_DECREF_SET(r, v) do {\
-        PyObject *tmp = (PyObject *) r;\
-        r = v; __Pyx_DECREF(tmp);\
-    } while (0)
-#define __Pyx_CLEAR(r)    do { PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);} while(0)
-#define __Pyx_XCLEAR(r)   do { if((r) != NULL) {PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);}} while(0)
-
-#if CYTHON_COMPILING_IN_CPYTHON
-static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name) {
-    PyTypeObject* tp = Py_TYPE(obj);
-    if (likely(tp->tp_getattro))
-        return tp->tp_getattro(obj, attr_name);
-#if PY_MAJOR_VERSION < 3
-    if (likely(tp->tp_getattr))
-        return tp->tp_getattr(obj, PyString_AS_STRING(attr_name));
-#endif
-    return PyObject_GetAttr(obj, attr_name);
-}
-#else
-#define __Pyx_PyObject_GetAttrStr(o,n) PyObject_GetAttr(o,n)
-#endif
-
-static PyObject *__Pyx_GetBuiltinName(PyObject *name);
-
-#if CYTHON_COMPILING_IN_CPYTHON
-static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw);
-#else
-#define __Pyx_PyObject_Call(func, arg, kw) PyObject_Call(func, arg, kw)
-#endif
-
-#if CYTHON_COMPILING_IN_CPYTHON
-static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg);
-#endif
-
-static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg);
-
-static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type);
-
-#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x02070000
-static CYTHON_INLINE PyObject* __Pyx_PyObject_LookupSpecial(PyObject* obj, PyObject* attr_name) {
-    PyObject *res;
-    PyTypeObject *tp = Py_TYPE(obj);
-#if PY_MAJOR_VERSION < 3
-    if (unlikely(PyInstance_Check(obj)))
-        return __Pyx_PyObject_GetAttrStr(obj, attr_name);
-#endif
-    res = _PyType_Lookup(tp, attr_name);
-    if (likely(res)) {
-        descrgetfunc f = Py_TYPE(res)->tp_descr_get;
-        if (!f) {
-            Py_INCREF(res);
-        } else {
-            res = f(res, obj, (PyObject *)tp);
-        }
-    } else {
-        PyErr_SetObject(PyExc_AttributeError, attr_name);
-    }
-    return res;
-}
-#else
-#define __Pyx_PyObject_LookupSpecial(o,n) __Pyx_PyObject_GetAttrStr(o,n)
-#endif
-
-#if CYTHON_COMPILING_IN_CPYTHON
-static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func);
-#else
-#define __Pyx_PyObject_CallNoArg(func) __Pyx_PyObject_Call(func, __pyx_empty_tuple, NULL)
-#endif
-
-#include <string.h>
-
-static CYTHON_INLINE int __Pyx_PyBytes_Equals(PyObject* s1, PyObject* s2, int equals);
-
-static CYTHON_INLINE int __Pyx_PyUnicode_Equals(PyObject* s1, PyObject* s2, int equals);
-
-#if PY_MAJOR_VERSION >= 3
-#define __Pyx_PyString_Equals __Pyx_PyUnicode_Equals
-#else
-#define __Pyx_PyString_Equals __Pyx_PyBytes_Equals
-#endif
-
-static CYTHON_INLINE int __Pyx_PySequence_ContainsTF(PyObject* item, PyObject* seq, int eq) {
-    int result = PySequence_Contains(seq, item);
-    return unlikely(result < 0) ? result : (result == (eq == Py_EQ));
-}
-
-static CYTHON_INLINE PyObject* __Pyx_PyObject_GetSlice(
-        PyObject* obj, Py_ssize_t cstart, Py_ssize_t cstop,
-        PyObject** py_start, PyObject** py_stop, PyObject** py_slice,
-        int has_cstart, int has_cstop, int wraparound);
-
-static double __Pyx__PyObject_AsDouble(PyObject* obj);
-#if CYTHON_COMPILING_IN_PYPY
-#define __Pyx_PyObject_AsDouble(obj)\
-(likely(PyFloat_CheckExact(obj)) ? PyFloat_AS_DOUBLE(obj) :\
- likely(PyInt_CheckExact(obj)) ?\
- PyFloat_AsDouble(obj) : __Pyx__PyObject_AsDouble(obj))
-#else
-#define __Pyx_PyObject_AsDouble(obj)\
-((likely(PyFloat_CheckExact(obj))) ?\
- PyFloat_AS_DOUBLE(obj) : __Pyx__PyObject_AsDouble(obj))
-#endif
-
-#if CYTHON_COMPILING_IN_CPYTHON
-static PyObject* __Pyx_PyInt_EqObjC(PyObject *op1, PyObject *op2, long intval, int inplace);
-#else
-#define __Pyx_PyInt_EqObjC(op1, op2, intval, inplace)\
-    PyObject_RichCompare(op1, op2, Py_EQ)
-    #endif
-
-#if CYTHON_COMPILING_IN_CPYTHON
-static PyObject* __Pyx_PyInt_AddObjC(PyObject *op1, PyObject *op2, long intval, int inplace);
-#else
-#define __Pyx_PyInt_AddObjC(op1, op2, intval, inplace)\
-    (inplace ? PyNumber_InPlaceAdd(op1, op2) : PyNumber_Add(op1, op2))
-#endif
-
-static CYTHON_INLINE void __Pyx_RaiseUnboundLocalError(const char *varname);
-
-static CYTHON_INLINE void __Pyx_ExceptionSave(PyObject **type, PyObject **value, PyObject **tb);
-static void __Pyx_ExceptionReset(PyObject *type, PyObject *value, PyObject *tb);
-
-static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb);
-
-static CYTHON_INLINE void __Pyx_ErrRestore(PyObject *type, PyObject *value, PyObject *tb);
-static CYTHON_INLINE void __Pyx_ErrFetch(PyObject **type, PyObject **value, PyObject **tb);
-
-static CYTHON_INLINE int __Pyx_ArgTypeTest(PyObject *obj, PyTypeObject *type, int none_allowed,
-    const char *name, int exact);
-
-#define __Pyx_GetItemInt(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
-    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
-    __Pyx_GetItemInt_Fast(o, (Py_ssize_t)i, is_list, wraparound, boundscheck) :\
-    (is_list ? (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL) :\
-               __Pyx_GetItemInt_Generic(o, to_py_func(i))))
-#define __Pyx_GetItemInt_List(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
-    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
-    __Pyx_GetItemInt_List_Fast(o, (Py_ssize_t)i, wraparound, boundscheck) :\
-    (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL))
-static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i,
-                                                              int wraparound, int boundscheck);
-#define __Pyx_GetItemInt_Tuple(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
-    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
-    __Pyx_GetItemInt_Tuple_Fast(o, (Py_ssize_t)i, wraparound, boundscheck) :\
-    (PyErr_SetString(PyExc_IndexError, "tuple index out of range"), (PyObject*)NULL))
-static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i,
-                                                              int wraparound, int boundscheck);
-static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j);
-static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i,
-                                                     int is_list, int wraparound, int boundscheck);
-
-static CYTHON_INLINE PyObject *__Pyx_GetModuleGlobalName(PyObject *name);
-
-#if PY_MAJOR_VERSION >= 3 && !CYTHON_COMPILING_IN_PYPY
-static PyObject *__Pyx_PyDict_GetItem(PyObject *d, PyObject* key) {
-    PyObject *value;
-    value = PyDict_GetItemWithError(d, key);
-    if (unlikely(!value)) {
-        if (!PyErr_Occurred()) {
-            PyObject* args = PyTuple_Pack(1, key);
-            if (likely(args))
-                PyErr_SetObject(PyExc_KeyError, args);
-            Py_XDECREF(args);
-        }
-        return NULL;
-    }
-    Py_INCREF(value);
-    return value;
-}
-#else
-    #define __Pyx_PyDict_GetItem(d, key) PyObject_GetItem(d, key)
-#endif
-
-static void __Pyx_RaiseArgtupleInvalid(const char* func_name, int exact,
-    Py_ssize_t num_min, Py_ssize_t num_max, Py_ssize_t num_found);
-
-static void __Pyx_RaiseDoubleKeywordsError(const char* func_name, PyObject* kw_name);
-
-static int __Pyx_ParseOptionalKeywords(PyObject *kwds, PyObject **argnames[],\
-    PyObject *kwds2, PyObject *values[], Py_ssize_t num_pos_args,\
-    const char* function_name);
-
-static CYTHON_INLINE PyObject* __Pyx_PyDict_Keys(PyObject* d);
-
-typedef struct {
-    PyObject *type;
-    PyObject **method_name;
-    PyCFunction func;
-    PyObject *method;
-    int flag;
-} __Pyx_CachedCFunction;
-
-static PyObject* __Pyx__CallUnboundCMethod0(__Pyx_CachedCFunction* cfunc, PyObject* self);
-#if CYTHON_COMPILING_IN_CPYTHON
-#define __Pyx_CallUnboundCMethod0(cfunc, self)\
-    ((likely((cfunc)->func)) ?\
-        (likely((cfunc)->flag == METH_NOARGS) ?  (*((cfunc)->func))(self, NULL) :\
-         (likely((cfunc)->flag == (METH_VARARGS | METH_KEYWORDS)) ?  ((*(PyCFunctionWithKeywords)(cfunc)->func)(self, __pyx_empty_tuple, NULL)) :\
-             ((cfunc)->flag == METH_VARARGS ?  (*((cfunc)->func))(self, __pyx_empty_tuple) : __Pyx__CallUnboundCMethod0(cfunc, self)))) :\
-        __Pyx__CallUnboundCMethod0(cfunc, self))
-#else
-#define __Pyx_CallUnboundCMethod0(cfunc, self)  __Pyx__CallUnboundCMethod0(cfunc, self)
-#endif
-
-static int __Pyx_SetVtable(PyObject *dict, void *vtable);
-
-static void* __Pyx_GetVtable(PyObject *dict);
-
-static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level);
-
-static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name);
-
-typedef struct {
-    int code_line;
-    PyCodeObject* code_object;
-} __Pyx_CodeObjectCacheEntry;
-struct __Pyx_CodeObjectCache {
-    int count;
-    int max_count;
-    __Pyx_CodeObjectCacheEntry* entries;
-};
-static struct __Pyx_CodeObjectCache __pyx_code_cache = {0,0,NULL};
-static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line);
-static PyCodeObject *__pyx_find_code_object(int code_line);
-static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object);
-
-static void __Pyx_AddTraceback(const char *funcname, int c_line,
-                               int py_line, const char *filename);
-
-static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *);
-
-static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value);
-
-static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *);
-
-static int __Pyx_check_binary_version(void);
-
-#if !defined(__Pyx_PyIdentifier_FromString)
-#if PY_MAJOR_VERSION < 3
-  #define __Pyx_PyIdentifier_FromString(s) PyString_FromString(s)
-#else
-  #define __Pyx_PyIdentifier_FromString(s) PyUnicode_FromString(s)
-#endif
-#endif
-
-static PyObject *__Pyx_ImportModule(const char *name);
-
-static PyTypeObject *__Pyx_ImportType(const char *module_name, const char *class_name, size_t size, int strict);
-
-static int __Pyx_InitStrings(__Pyx_StringTabEntry *t);
-
-static struct __pyx_obj_15cNK_FEMeshUtils_4Mesh_Mesh *__pyx_f_15cNK_FEMeshUtils_11MeshReaders_11MeshReaders_readDynaMesh(CYTHON_UNUSED struct __pyx_obj_15cNK_FEMeshUtils_11MeshReaders_MeshReaders *__pyx_v_self, PyObject *__pyx_v_file, int __pyx_skip_dispatch); /* proto*/
-static struct __pyx_obj_15cNK_FEMeshUtils_4Mesh_Mesh *__pyx_f_15cNK_FEMeshUtils_11MeshReaders_11MeshReaders_readRadiossMesh(CYTHON_UNUSED struct __pyx_obj_15cNK_FEMeshUtils_11MeshReaders_MeshReaders *__pyx_v_self, PyObject *__pyx_v_file, int __pyx_skip_dispatch); /* proto*/
-static PyObject *__pyx_f_15cNK_FEMeshUtils_11MeshReaders_11MeshReaders_writeDynaMesh(CYTHON_UNUSED struct __pyx_obj_15cNK_FEMeshUtils_11MeshReaders_MeshReaders *__pyx_v_self, struct __pyx_obj_15cNK_FEMeshUtils_4Mesh_Mesh *__pyx_v__Mesh, PyObject *__pyx_v_file, int __pyx_skip_dispatch); /* proto*/
-static PyObject *__pyx_f_15cNK_FEMeshUtils_11MeshReaders_11MeshReaders_writeRadiossMesh(CYTHON_UNUSED struct __pyx_obj_15cNK_FEMeshUtils_11MeshReaders_MeshReaders *__pyx_v_self, struct __pyx_obj_15cNK_FEMeshUtils_4Mesh_Mesh *__pyx_v__Mesh, PyObject *__pyx_v_file, int __pyx_skip_dispatch); /* proto*/
-
-/* Module declarations from 'cNK_FEMeshUtils.Element' */
-static PyTypeObject *__pyx_ptype_15cNK_FEMeshUtils_7Element_Element = 0;
-
-/* Module declarations from 'cNK_FEMeshUtils.Node' */
-static PyTypeObject *__pyx_ptype_15cNK_FEMeshUtils_4Node_Node = 0;
-
-/* Module declarations from 'cNK_FEMeshUtils.Material' */
-static PyTypeObject *__pyx_ptype_15cNK_FEMeshUtils_8Material_Material = 0;
-
-/* Module declarations from 'cNK_FEMeshUtils.Property' */
-static PyTypeObject *__pyx_ptype_15cNK_FEMeshUtils_8Property_Property = 0;
-
-/* Module declarations from 'cNK_FEMeshUtils.Part' */
-static PyTypeObject *__pyx_ptype_15cNK_FEMeshUtils_4Part_Part = 0;
-
-/* Module declarations from 'cNK_FEMeshUtils.Mesh' */
-static PyTypeObject *__pyx_ptype_15cNK_FEMeshUtils_4Mesh_Mesh = 0;
-
-/* Module declarations from 'cNK_FEMeshUtils.MeshReaders' */
-static PyTypeObject *__pyx_ptype_15cNK_FEMeshUtils_11MeshReaders_MeshReaders = 0;
-#define __Pyx_MODULE_NAME "cNK_FEMeshUtils.MeshReaders"
-int __pyx_module_is_main_cNK_FEMeshUtils__MeshReaders = 0;
-
-/* Implementation of 'cNK_FEMeshUtils.MeshReaders' */
-static PyObject *__pyx_builtin_open;
-static char __pyx_k_[] = "$";
-static char __pyx_k_r[] = "r";
-static char __pyx_k_w[] = "w";
-static char __pyx_k_8i[] = "%8i";
-static char __pyx_k__2[] = "*";
-static char __pyx_k_np[] = "np";
-static char __pyx_k_os[] = "os";
-static char __pyx_k_10i[] = "%10i";
-static char __pyx_k__38[] = "#";
-static char __pyx_k__39[] = "/";
-static char __pyx_k__51[] = "";
-static char __pyx_k__76[] = "\n";
-static char __pyx_k_dot[] = "dot";
-static char __pyx_k_eye[] = "eye";
-static char __pyx_k_now[] = "now";
-static char __pyx_k_Mesh[] = "_Mesh";
-static char __pyx_k_NODE[] = "*NODE";
-static char __pyx_k_PART[] = "*PART";
-static char __pyx_k_SH3N[] = "/SH3N";
-static char __pyx_k_User[] = "$ - User: ";
-static char __pyx_k_exit[] = "__exit__";
-static char __pyx_k_file[] = "file";
-static char __pyx_k_keys[] = "keys";
-static char __pyx_k_main[] = "__main__";
-static char __pyx_k_norm[] = "norm";
-static char __pyx_k_open[] = "open";
-static char __pyx_k_test[] = "__test__";
-static char __pyx_k_10_8f[] = "%10.8f";
-static char __pyx_k_16_8f[] = "%16.8f";
-static char __pyx_k_SHELL[] = "/SHELL";
-static char __pyx_k_close[] = "close";
-static char __pyx_k_cross[] = "cross";
-static char __pyx_k_enter[] = "__enter__";
-static char __pyx_k_expm3[] = "expm3";
-static char __pyx_k_numpy[] = "numpy";
-static char __pyx_k_split[] = "split";
-static char __pyx_k_strip[] = "strip";
-static char __pyx_k_write[] = "write";
-static char __pyx_k_16_10f[] = "%16.10f";
-static char __pyx_k_20_14f[] = "%20.14f";
-static char __pyx_k_Mesh_2[] = "Mesh";
-static char __pyx_k_NODE_2[] = "/NODE";
-static char __pyx_k_PART_2[] = "/PART";
-static char __pyx_k_User_2[] = "## - User: ";
-static char __pyx_k_import[] = "__import__";
-static char __pyx_k_LS_Dyna[] = "LS-Dyna";
-static char __pyx_k_Radioss[] = "Radioss";
-static char __pyx_k_addElem[] = "addElem";
-static char __pyx_k_getpass[] = "getpass";
-static char __pyx_k_getuser[] = "getuser";
-static char __pyx_k_datetime[] = "datetime";
-static char __pyx_k_strftime[] = "strftime";
-static char __pyx_k_Date_Time[] = "$ - Date/Time: ";
-static char __pyx_k_PROP_SHELL[] = "/PROP/SHELL";
-static char __pyx_k_pyx_vtable[] = "__pyx_vtable__";
-static char __pyx_k_subprocess[] = "subprocess";
-static char __pyx_k_Date_Time_2[] = "## - Date/Time: ";
-static char __pyx_k_Y_m_d_H_M_S[] = "%Y/%m/%d %H:%M:%S";
-static char __pyx_k_MAT_PLAS_TAB[] = "/MAT/PLAS_TAB";
-static char __pyx_k_readDynaMesh[] = "readDynaMesh";
-static char __pyx_k_scipy_linalg[] = "scipy.linalg";
-static char __pyx_k_ELEMENT_SHELL[] = "*ELEMENT_SHELL";
-static char __pyx_k_SECTION_SHELL[] = "*SECTION_SHELL";
-static char __pyx_k_writeDynaMesh[] = "writeDynaMesh";
-static char __pyx_k_ELEMENT_SHELL_2[] = "*ELEMENT_SHELL\n";
-static char __pyx_k_RADIOSS_STARTER[] = "#RADIOSS STARTER";
-static char __pyx_k_readRadiossMesh[] = "readRadiossMesh";
-static char __pyx_k_writeRadiossMesh[] = "writeRadiossMesh";
-static char __pyx_k_SECTION_SHELL_TITLE[] = "*SECTION_SHELL_TITLE";
-static char __pyx_k_ELEMENT_SHELL_THICKNESS[] = "*ELEMENT_SHELL_THICKNESS";
-static char __pyx_k_ELEMENT_SHELL_THICKNESS_2[] = "*ELEMENT_SHELL_THICKNESS\n";
-static char __pyx_k_Mubea_TRB_CAE_FE_Mesh_Handlers[] = "$ - Mubea TRB CAE - FE_Mesh_Handlers - writeDynaMesh\n";
-static char __pyx_k_MAT_PIECEWISE_LINEAR_PLASTICITY[] = "*MAT_PIECEWISE_LINEAR_PLASTICITY";
-static char __pyx_k_Mubea_TRB_CAE_FE_Mesh_Handlers_2[] = "## - Mubea TRB CAE - FE_Mesh_Handlers - writeRadiossMesh\n";
-static char __pyx_k_MAT_PIECEWISE_LINEAR_PLASTICITY_2[] = "*MAT_PIECEWISE_LINEAR_PLASTICITY_TITLE";
-static PyObject *__pyx_kp_s_;
-static PyObject *__pyx_kp_s_10_8f;
-static PyObject *__pyx_kp_s_10i;
-static PyObject *__pyx_kp_s_16_10f;
-static PyObject *__pyx_kp_s_16_8f;
-static PyObject *__pyx_kp_s_20_14f;
-static PyObject *__pyx_kp_s_8i;
-static PyObject *__pyx_kp_s_Date_Time;
-static PyObject *__pyx_kp_s_Date_Time_2;
-static PyObject *__pyx_kp_s_ELEMENT_SHELL;
-static PyObject *__pyx_kp_s_ELEMENT_SHELL_2;
-static PyObject *__pyx_kp_s_ELEMENT_SHELL_THICKNESS;
-static PyObject *__pyx_kp_s_ELEMENT_SHELL_THICKNESS_2;
-static PyObject *__pyx_kp_s_LS_Dyna;
-static PyObject *__pyx_kp_s_MAT_PIECEWISE_LINEAR_PLASTICITY;
-static PyObject *__pyx_kp_s_MAT_PIECEWISE_LINEAR_PLASTICITY_2;
-static PyObject *__pyx_kp_s_MAT_PLAS_TAB;
-static PyObject *__pyx_n_s_Mesh;
-static PyObject *__pyx_n_s_Mesh_2;
-static PyObject *__pyx_kp_s_Mubea_TRB_CAE_FE_Mesh_Handlers;
-static PyObject *__pyx_kp_s_Mubea_TRB_CAE_FE_Mesh_Handlers_2;
-static PyObject *__pyx_kp_s_NODE;
-static PyObject *__pyx_kp_s_NODE_2;
-static PyObject *__pyx_kp_s_PART;
-static PyObject *__pyx_kp_s_PART_2;
-static PyObject *__pyx_kp_s_PROP_SHELL;
-static PyObject *__pyx_kp_s_RADIOSS_STARTER;
-static PyObject *__pyx_n_s_Radioss;
-static PyObject *__pyx_kp_s_SECTION_SHELL;
-static PyObject *__pyx_kp_s_SECTION_SHELL_TITLE;
-static PyObject *__pyx_kp_s_SH3N;
-static PyObject *__pyx_kp_s_SHELL;
-static PyObject *__pyx_kp_s_User;
-static PyObject *__pyx_kp_s_User_2;
-static PyObject *__pyx_kp_s_Y_m_d_H_M_S;
-static PyObject *__pyx_kp_s__2;
-static PyObject *__pyx_kp_s__38;
-static PyObject *__pyx_kp_s__39;
-static PyObject *__pyx_kp_s__51;
-static PyObject *__pyx_kp_s__76;
-static PyObject *__pyx_n_s_addElem;
-static PyObject *__pyx_n_s_close;
-static PyObject *__pyx_n_s_cross;
-static PyObject *__pyx_n_s_datetime;
-static PyObject *__pyx_n_s_dot;
-static PyObject *__pyx_n_s_enter;
-static PyObject *__pyx_n_s_exit;
-static PyObject *__pyx_n_s_expm3;
-static PyObject *__pyx_n_s_eye;
-static PyObject *__pyx_n_s_file;
-static PyObject *__pyx_n_s_getpass;
-static PyObject *__pyx_n_s_getuser;
-static PyObject *__pyx_n_s_import;
-static PyObject *__pyx_n_s_keys;
-static PyObject *__pyx_n_s_main;
-static PyObject *__pyx_n_s_norm;
-static PyObject *__pyx_n_s_now;
-static PyObject *__pyx_n_s_np;
-static PyObject *__pyx_n_s_numpy;
-static PyObject *__pyx_n_s_open;
-static PyObject *__pyx_n_s_os;
-static PyObject *__pyx_n_s_pyx_vtable;
-static PyObject *__pyx_n_s_r;
-static PyObject *__pyx_n_s_readDynaMesh;
-static PyObject *__pyx_n_s_readRadiossMesh;
-static PyObject *__pyx_n_s_scipy_linalg;
-static PyObject *__pyx_n_s_split;
-static PyObject *__pyx_n_s_strftime;
-static PyObject *__pyx_n_s_strip;
-static PyObject *__pyx_n_s_subprocess;
-static PyObject *__pyx_n_s_test;
-static PyObject *__pyx_n_s_w;
-static PyObject *__pyx_n_s_write;
-static PyObject *__pyx_n_s_writeDynaMesh;
-static PyObject *__pyx_n_s_writeRadiossMesh;
-static PyObject *__pyx_pf_15cNK_FEMeshUtils_11MeshReaders_11MeshReaders_readDynaMesh(struct __pyx_obj_15cNK_FEMeshUtils_11MeshReaders_MeshReaders *__pyx_v_self, PyObject *__pyx_v_file); /* proto */
-static PyObject *__pyx_pf_15cNK_FEMeshUtils_11MeshReaders_11MeshReaders_2readRadiossMesh(struct __pyx_obj_15cNK_FEMeshUtils_11MeshReaders_MeshReaders *__pyx_v_self, PyObject *__pyx_v_file); /* proto */
-static PyObject *__pyx_pf_15cNK_FEMeshUtils_11MeshReaders_11MeshReaders_4writeDynaMesh(struct __pyx_obj_15cNK_FEMeshUtils_11MeshReaders_MeshReaders *__pyx_v_self, struct __pyx_obj_15cNK_FEMeshUtils_4Mesh_Mesh *__pyx_v__Mesh, PyObject *__pyx_v_file); /* proto */
-static PyObject *__pyx_pf_15cNK_FEMeshUtils_11MeshReaders_11MeshReaders_6writeRadiossMesh(struct __pyx_obj_15cNK_FEMeshUtils_11MeshReaders_MeshReaders *__pyx_v_self, struct __pyx_obj_15cNK_FEMeshUtils_4Mesh_Mesh *__pyx_v__Mesh, PyObject *__pyx_v_file); /* proto */
-static PyObject *__pyx_tp_new_15cNK_FEMeshUtils_11MeshReaders_MeshReaders(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
-static __Pyx_CachedCFunction __pyx_umethod_PyDict_Type_keys = {0, &__pyx_n_s_keys, 0, 0, 0};
-static PyObject *__pyx_int_0;
-static PyObject *__pyx_int_1;
-static PyObject *__pyx_int_2;
-static PyObject *__pyx_int_3;
-static PyObject *__pyx_int_5;
-static PyObject *__pyx_int_6;
-static PyObject *__pyx_int_8;
-static PyObject *__pyx_int_9;
-static PyObject *__pyx_int_10;
-static PyObject *__pyx_int_11;
-static PyObject *__pyx_int_13;
-static PyObject *__pyx_int_16;
-static PyObject *__pyx_int_17;
-static PyObject *__pyx_int_20;
-static PyObject *__pyx_int_21;
-static PyObject *__pyx_int_24;
-static PyObject *__pyx_int_25;
-static PyObject *__pyx_int_30;
-static PyObject *__pyx_int_31;
-static PyObject *__pyx_int_32;
-static PyObject *__pyx_int_33;
-static PyObject *__pyx_int_40;
-static PyObject *__pyx_int_41;
-static PyObject *__pyx_int_48;
-static PyObject *__pyx_int_49;
-static PyObject *__pyx_int_50;
-static PyObject *__pyx_int_51;
-static PyObject *__pyx_int_56;
-static PyObject *__pyx_int_64;
-static PyObject *__pyx_int_70;
-static PyObject *__pyx_int_90;
-static PyObject *__pyx_int_91;
-static PyObject *__pyx_int_100;
-static PyObject *__pyx_slice__3;
-static PyObject *__pyx_slice__4;
-static PyObject *__pyx_slice__5;
-static PyObject *__pyx_slice__6;
-static PyObject *__pyx_slice__7;
-static PyObject *__pyx_slice__8;
-static PyObject *__pyx_slice__9;
-static PyObject *__pyx_slice__10;
-static PyObject *__pyx_slice__11;
-static PyObject *__pyx_slice__12;
-static PyObject *__pyx_slice__13;
-static PyObject *__pyx_slice__14;
-static PyObject *__pyx_slice__15;
-static PyObject *__pyx_slice__16;
-static PyObject *__pyx_slice__17;
-static PyObject *__pyx_slice__18;
-static PyObject *__pyx_slice__19;
-static PyObject *__pyx_slice__20;
-static PyObject *__pyx_slice__21;
-static PyObject *__pyx_slice__22;
-static PyObject *__pyx_slice__23;
-static PyObject *__pyx_slice__24;
-static PyObject *__pyx_slice__25;
-static PyObject *__pyx_slice__26;
-static PyObject *__pyx_slice__27;
-static PyObject *__pyx_slice__28;
-static PyObject *__pyx_slice__29;
-static PyObject *__pyx_slice__30;
-static PyObject *__pyx_slice__31;
-static PyObject *__pyx_slice__32;
-static PyObject *__pyx_slice__33;
-static PyObject *__pyx_slice__34;
-static PyObject *__pyx_slice__35;
-static PyObject *__pyx_slice__37;
-static PyObject *__pyx_slice__40;
-static PyObject *__pyx_slice__41;
-static PyObject *__pyx_slice__42;
-static PyObject *__pyx_slice__43;
-static PyObject *__pyx_slice__44;
-static PyObject *__pyx_slice__46;
-static PyObject *__pyx_slice__47;
-static PyObject *__pyx_slice__48;
-static PyObject *__pyx_slice__49;
-static PyObject *__pyx_slice__50;
-static PyObject *__pyx_slice__52;
-static PyObject *__pyx_slice__53;
-static PyObject *__pyx_slice__54;
-static PyObject *__pyx_slice__56;
-static PyObject *__pyx_slice__57;
-static PyObject *__pyx_slice__58;
-static PyObject *__pyx_slice__59;
-static PyObject *__pyx_slice__60;
-static PyObject *__pyx_slice__61;
-static PyObject *__pyx_slice__62;
-static PyObject *__pyx_slice__64;
-static PyObject *__pyx_slice__65;
-static PyObject *__pyx_slice__66;
-static PyObject *__pyx_slice__68;
-static PyObject *__pyx_slice__69;
-static PyObject *__pyx_slice__70;
-static PyObject *__pyx_slice__72;
-static PyObject *__pyx_slice__77;
-static PyObject *__pyx_slice__79;
-static PyObject *__pyx_slice__80;
-static PyObject *__pyx_slice__81;
-static PyObject *__pyx_slice__82;
-static PyObject *__pyx_slice__84;
-static PyObject *__pyx_slice__88;
-static PyObject *__pyx_slice__89;
-static PyObject *__pyx_slice__90;
-static PyObject *__pyx_slice__91;
-static PyObject *__pyx_slice__93;
-static PyObject *__pyx_slice__95;
-static PyObject *__pyx_tuple__36;
-static PyObject *__pyx_tuple__45;
-static PyObject *__pyx_tuple__55;
-static PyObject *__pyx_tuple__63;
-static PyObject *__pyx_tuple__67;
-static PyObject *__pyx_tuple__71;
-static PyObject *__pyx_tuple__73;
-static PyObject *__pyx_tuple__74;
-static PyObject *__pyx_tuple__75;
-static PyObject *__pyx_tuple__78;
-static PyObject *__pyx_tuple__83;
-static PyObject *__pyx_tuple__85;
-static PyObject *__pyx_tuple__86;
-static PyObject *__pyx_tuple__87;
-static PyObject *__pyx_tuple__92;
-static PyObject *__pyx_tuple__94;
-static PyObject *__pyx_tuple__96;
-
-/* "cNK_FEMeshUtils\MeshReaders.py":12
- * 
- * class MeshReaders:
- *     def readDynaMesh(self, file):             # <<<<<<<<<<<<<<
- *         nodesection = False
- *         elemsection = False
- */
-
-static PyObject *__pyx_pw_15cNK_FEMeshUtils_11MeshReaders_11MeshReaders_1readDynaMesh(PyObject *__pyx_v_self, PyObject *__pyx_v_file); /*proto*/
-static struct __pyx_obj_15cNK_FEMeshUtils_4Mesh_Mesh *__pyx_f_15cNK_FEMeshUtils_11MeshReaders_11MeshReaders_readDynaMesh(CYTHON_UNUSED struct __pyx_obj_15cNK_FEMeshUtils_11MeshReaders_MeshReaders *__pyx_v_self, PyObject *__pyx_v_file, int __pyx_skip_dispatch) {
-  int __pyx_v_nodesection;
-  int __pyx_v_elemsection;
-  int __pyx_v_elemthicksection;
-  int __pyx_v_partsection;
-  int __pyx_v_matsection1;
-  int __pyx_v_matsection2;
-  int __pyx_v_propsection1;
-  int __pyx_v_propsection2;
-  PyObject *__pyx_v_i = NULL;
-  struct __pyx_obj_15cNK_FEMeshUtils_4Mesh_Mesh *__pyx_v__Mesh = NULL;
-  PyObject *__pyx_v_f = NULL;
-  PyObject *__pyx_v_line = NULL;
-  PyObject *__pyx_v__nodeID = NULL;
-  double __pyx_v__x;
-  double __pyx_v__y;
-  double __pyx_v__z;
-  PyObject *__pyx_v__elID = NULL;
-  PyObject *__pyx_v__partID = NULL;
-  PyObject *__pyx_v__n1 = NULL;
-  PyObject *__pyx_v__n2 = NULL;
-  PyObject *__pyx_v__n3 = NULL;
-  PyObject *__pyx_v__n4 = NULL;
-  PyObject *__pyx_v__title = NULL;
-  PyObject *__pyx_v__propID = NULL;
-  PyObject *__pyx_v__matID = NULL;
-  double __pyx_v__rho;
-  double __pyx_v__E;
-  CYTHON_UNUSED PyObject *__pyx_v_title = NULL;
-  double __pyx_v__thick;
-  struct __pyx_obj_15cNK_FEMeshUtils_4Mesh_Mesh *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
-  PyObject *__pyx_t_6 = NULL;
-  PyObject *__pyx_t_7 = NULL;
-  PyObject *__pyx_t_8 = NULL;
-  PyObject *__pyx_t_9 = NULL;
-  Py_ssize_t __pyx_t_10;
-  PyObject *(*__pyx_t_11)(PyObject *);
-  int __pyx_t_12;
-  int __pyx_t_13;
-  int __pyx_t_14;
-  int __pyx_t_15;
-  double __pyx_t_16;
-  int __pyx_t_17;
-  Py_ssize_t __pyx_t_18;
-  int __pyx_t_19;
-  int __pyx_t_20;
-  PyObject *__pyx_t_21 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("readDynaMesh", 0);
-  /* Check if called by wrapper */
-  if (unlikely(__pyx_skip_dispatch)) ;
-  /* Check if overridden in Python */
-  else if (unlikely(Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0)) {
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_readDynaMesh); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 12; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)__pyx_pw_15cNK_FEMeshUtils_11MeshReaders_11MeshReaders_1readDynaMesh)) {
-      __Pyx_XDECREF(((PyObject *)__pyx_r));
-      __Pyx_INCREF(__pyx_t_1);
-      __pyx_t_3 = __pyx_t_1; __pyx_t_4 = NULL;
-      if (CYTHON_COMPILING_IN_CPYTHON && unlikely(PyMethod_Check(__pyx_t_3))) {
-        __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
-        if (likely(__pyx_t_4)) {
-          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-          __Pyx_INCREF(__pyx_t_4);
-          __Pyx_INCREF(function);
-          __Pyx_DECREF_SET(__pyx_t_3, function);
-        }
-      }
-      if (!__pyx_t_4) {
-        __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_v_file); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 12; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __Pyx_GOTREF(__pyx_t_2);
-      } else {
-        __pyx_t_5 = PyTuple_New(1+1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 12; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __Pyx_GOTREF(__pyx_t_5);
-        __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_4); __pyx_t_4 = NULL;
-        __Pyx_INCREF(__pyx_v_file);
-        __Pyx_GIVEREF(__pyx_v_file);
-        PyTuple_SET_ITEM(__pyx_t_5, 0+1, __pyx_v_file);
-        __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_5, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 12; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __Pyx_GOTREF(__pyx_t_2);
-        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      }
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      if (!(likely(((__pyx_t_2) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_2, __pyx_ptype_15cNK_FEMeshUtils_4Mesh_Mesh))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 12; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __pyx_r = ((struct __pyx_obj_15cNK_FEMeshUtils_4Mesh_Mesh *)__pyx_t_2);
-      __pyx_t_2 = 0;
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      goto __pyx_L0;
-    }
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  }
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":13
- * class MeshReaders:
- *     def readDynaMesh(self, file):
- *         nodesection = False             # <<<<<<<<<<<<<<
- *         elemsection = False
- *         elemthicksection = False
- */
-  __pyx_v_nodesection = 0;
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":14
- *     def readDynaMesh(self, file):
- *         nodesection = False
- *         elemsection = False             # <<<<<<<<<<<<<<
- *         elemthicksection = False
- *         partsection = False
- */
-  __pyx_v_elemsection = 0;
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":15
- *         nodesection = False
- *         elemsection = False
- *         elemthicksection = False             # <<<<<<<<<<<<<<
- *         partsection = False
- *         matsection1 = False
- */
-  __pyx_v_elemthicksection = 0;
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":16
- *         elemsection = False
- *         elemthicksection = False
- *         partsection = False             # <<<<<<<<<<<<<<
- *         matsection1 = False
- *         matsection2 = False
- */
-  __pyx_v_partsection = 0;
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":17
- *         elemthicksection = False
- *         partsection = False
- *         matsection1 = False             # <<<<<<<<<<<<<<
- *         matsection2 = False
- *         propsection1 = False
- */
-  __pyx_v_matsection1 = 0;
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":18
- *         partsection = False
- *         matsection1 = False
- *         matsection2 = False             # <<<<<<<<<<<<<<
- *         propsection1 = False
- *         propsection2 = False
- */
-  __pyx_v_matsection2 = 0;
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":19
- *         matsection1 = False
- *         matsection2 = False
- *         propsection1 = False             # <<<<<<<<<<<<<<
- *         propsection2 = False
- * 
- */
-  __pyx_v_propsection1 = 0;
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":20
- *         matsection2 = False
- *         propsection1 = False
- *         propsection2 = False             # <<<<<<<<<<<<<<
- * 
- *         i=0
- */
-  __pyx_v_propsection2 = 0;
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":22
- *         propsection2 = False
- * 
- *         i=0             # <<<<<<<<<<<<<<
- *         # self.logger.info("LS-Dyna Reader Started: "+file)
- * 
- */
-  __Pyx_INCREF(__pyx_int_0);
-  __pyx_v_i = __pyx_int_0;
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":25
- *         # self.logger.info("LS-Dyna Reader Started: "+file)
- * 
- *         _Mesh=Mesh(file,"LS-Dyna")             # <<<<<<<<<<<<<<
- * 
- *         with open(file, "r") as f:
- */
-  __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 25; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_INCREF(__pyx_v_file);
-  __Pyx_GIVEREF(__pyx_v_file);
-  PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_file);
-  __Pyx_INCREF(__pyx_kp_s_LS_Dyna);
-  __Pyx_GIVEREF(__pyx_kp_s_LS_Dyna);
-  PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_kp_s_LS_Dyna);
-  __pyx_t_2 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_15cNK_FEMeshUtils_4Mesh_Mesh), __pyx_t_1, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 25; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_v__Mesh = ((struct __pyx_obj_15cNK_FEMeshUtils_4Mesh_Mesh *)__pyx_t_2);
-  __pyx_t_2 = 0;
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":27
- *         _Mesh=Mesh(file,"LS-Dyna")
- * 
- *         with open(file, "r") as f:             # <<<<<<<<<<<<<<
- *             for line in f:
- *                 # if "*KEYWORD" in line:
- */
-  /*with:*/ {
-    __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 27; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_INCREF(__pyx_v_file);
-    __Pyx_GIVEREF(__pyx_v_file);
-    PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_file);
-    __Pyx_INCREF(__pyx_n_s_r);
-    __Pyx_GIVEREF(__pyx_n_s_r);
-    PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_n_s_r);
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_open, __pyx_t_2, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 27; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __pyx_t_6 = __Pyx_PyObject_LookupSpecial(__pyx_t_1, __pyx_n_s_exit); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 27; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_6);
-    __pyx_t_3 = __Pyx_PyObject_LookupSpecial(__pyx_t_1, __pyx_n_s_enter); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 27; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_5 = NULL;
-    if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_3))) {
-      __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_3);
-      if (likely(__pyx_t_5)) {
-        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-        __Pyx_INCREF(__pyx_t_5);
-        __Pyx_INCREF(function);
-        __Pyx_DECREF_SET(__pyx_t_3, function);
-      }
-    }
-    if (__pyx_t_5) {
-      __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_5); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 27; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    } else {
-      __pyx_t_2 = __Pyx_PyObject_CallNoArg(__pyx_t_3); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 27; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    }
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __pyx_t_3 = __pyx_t_2;
-    __pyx_t_2 = 0;
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    /*try:*/ {
-      {
-        __Pyx_ExceptionSave(&__pyx_t_7, &__pyx_t_8, &__pyx_t_9);
-        __Pyx_XGOTREF(__pyx_t_7);
-        __Pyx_XGOTREF(__pyx_t_8);
-        __Pyx_XGOTREF(__pyx_t_9);
-        /*try:*/ {
-          __pyx_v_f = __pyx_t_3;
-          __pyx_t_3 = 0;
-
-          /* "cNK_FEMeshUtils\MeshReaders.py":28
- * 
- *         with open(file, "r") as f:
- *             for line in f:             # <<<<<<<<<<<<<<
- *                 # if "*KEYWORD" in line:
- *                     # self.logger.debug("*KEYWORD found")
- */
-          if (likely(PyList_CheckExact(__pyx_v_f)) || PyTuple_CheckExact(__pyx_v_f)) {
-            __pyx_t_3 = __pyx_v_f; __Pyx_INCREF(__pyx_t_3); __pyx_t_10 = 0;
-            __pyx_t_11 = NULL;
-          } else {
-            __pyx_t_10 = -1; __pyx_t_3 = PyObject_GetIter(__pyx_v_f); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 28; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __Pyx_GOTREF(__pyx_t_3);
-            __pyx_t_11 = Py_TYPE(__pyx_t_3)->tp_iternext; if (unlikely(!__pyx_t_11)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 28; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-          }
-          for (;;) {
-            if (likely(!__pyx_t_11)) {
-              if (likely(PyList_CheckExact(__pyx_t_3))) {
-                if (__pyx_t_10 >= PyList_GET_SIZE(__pyx_t_3)) break;
-                #if CYTHON_COMPILING_IN_CPYTHON
-                __pyx_t_1 = PyList_GET_ITEM(__pyx_t_3, __pyx_t_10); __Pyx_INCREF(__pyx_t_1); __pyx_t_10++; if (unlikely(0 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 28; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                #else
-                __pyx_t_1 = PySequence_ITEM(__pyx_t_3, __pyx_t_10); __pyx_t_10++; if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 28; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_1);
-                #endif
-              } else {
-                if (__pyx_t_10 >= PyTuple_GET_SIZE(__pyx_t_3)) break;
-                #if CYTHON_COMPILING_IN_CPYTHON
-                __pyx_t_1 = PyTuple_GET_ITEM(__pyx_t_3, __pyx_t_10); __Pyx_INCREF(__pyx_t_1); __pyx_t_10++; if (unlikely(0 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 28; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                #else
-                __pyx_t_1 = PySequence_ITEM(__pyx_t_3, __pyx_t_10); __pyx_t_10++; if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 28; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_1);
-                #endif
-              }
-            } else {
-              __pyx_t_1 = __pyx_t_11(__pyx_t_3);
-              if (unlikely(!__pyx_t_1)) {
-                PyObject* exc_type = PyErr_Occurred();
-                if (exc_type) {
-                  if (likely(exc_type == PyExc_StopIteration || PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
-                  else {__pyx_filename = __pyx_f[0]; __pyx_lineno = 28; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                }
-                break;
-              }
-              __Pyx_GOTREF(__pyx_t_1);
-            }
-            __Pyx_XDECREF_SET(__pyx_v_line, __pyx_t_1);
-            __pyx_t_1 = 0;
-
-            /* "cNK_FEMeshUtils\MeshReaders.py":32
- *                     # self.logger.debug("*KEYWORD found")
- * 
- *                 if line.strip() == "*NODE":             # <<<<<<<<<<<<<<
- *                     # self.logger.debug("*NODE keyword found")
- *                     nodesection = True
- */
-            __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_line, __pyx_n_s_strip); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 32; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __Pyx_GOTREF(__pyx_t_2);
-            __pyx_t_5 = NULL;
-            if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_2))) {
-              __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_2);
-              if (likely(__pyx_t_5)) {
-                PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
-                __Pyx_INCREF(__pyx_t_5);
-                __Pyx_INCREF(function);
-                __Pyx_DECREF_SET(__pyx_t_2, function);
-              }
-            }
-            if (__pyx_t_5) {
-              __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_5); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 32; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-            } else {
-              __pyx_t_1 = __Pyx_PyObject_CallNoArg(__pyx_t_2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 32; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            }
-            __Pyx_GOTREF(__pyx_t_1);
-            __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-            __pyx_t_12 = (__Pyx_PyString_Equals(__pyx_t_1, __pyx_kp_s_NODE, Py_EQ)); if (unlikely(__pyx_t_12 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 32; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-            if (__pyx_t_12) {
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":34
- *                 if line.strip() == "*NODE":
- *                     # self.logger.debug("*NODE keyword found")
- *                     nodesection = True             # <<<<<<<<<<<<<<
- *                 elif (nodesection == True) and (not("$" in line or "*" in line)):
- *                     _nodeID = int(line[0:8])
- */
-              __pyx_v_nodesection = 1;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":32
- *                     # self.logger.debug("*KEYWORD found")
- * 
- *                 if line.strip() == "*NODE":             # <<<<<<<<<<<<<<
- *                     # self.logger.debug("*NODE keyword found")
- *                     nodesection = True
- */
-              goto __pyx_L17;
-            }
-
-            /* "cNK_FEMeshUtils\MeshReaders.py":35
- *                     # self.logger.debug("*NODE keyword found")
- *                     nodesection = True
- *                 elif (nodesection == True) and (not("$" in line or "*" in line)):             # <<<<<<<<<<<<<<
- *                     _nodeID = int(line[0:8])
- *                     _x = float(line[9:24])
- */
-            __pyx_t_13 = ((__pyx_v_nodesection == 1) != 0);
-            if (__pyx_t_13) {
-            } else {
-              __pyx_t_12 = __pyx_t_13;
-              goto __pyx_L18_bool_binop_done;
-            }
-            __pyx_t_14 = (__Pyx_PySequence_ContainsTF(__pyx_kp_s_, __pyx_v_line, Py_EQ)); if (unlikely(__pyx_t_14 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 35; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __pyx_t_15 = (__pyx_t_14 != 0);
-            if (!__pyx_t_15) {
-            } else {
-              __pyx_t_13 = __pyx_t_15;
-              goto __pyx_L20_bool_binop_done;
-            }
-            __pyx_t_15 = (__Pyx_PySequence_ContainsTF(__pyx_kp_s__2, __pyx_v_line, Py_EQ)); if (unlikely(__pyx_t_15 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 35; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __pyx_t_14 = (__pyx_t_15 != 0);
-            __pyx_t_13 = __pyx_t_14;
-            __pyx_L20_bool_binop_done:;
-            __pyx_t_14 = ((!__pyx_t_13) != 0);
-            __pyx_t_12 = __pyx_t_14;
-            __pyx_L18_bool_binop_done:;
-            if (__pyx_t_12) {
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":36
- *                     nodesection = True
- *                 elif (nodesection == True) and (not("$" in line or "*" in line)):
- *                     _nodeID = int(line[0:8])             # <<<<<<<<<<<<<<
- *                     _x = float(line[9:24])
- *                     _y = float(line[25:40])
- */
-              __pyx_t_1 = __Pyx_PyObject_GetSlice(__pyx_v_line, 0, 8, NULL, NULL, &__pyx_slice__3, 1, 1, 1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 36; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_1);
-              __pyx_t_2 = PyNumber_Int(__pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 36; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_2);
-              __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-              __Pyx_XDECREF_SET(__pyx_v__nodeID, __pyx_t_2);
-              __pyx_t_2 = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":37
- *                 elif (nodesection == True) and (not("$" in line or "*" in line)):
- *                     _nodeID = int(line[0:8])
- *                     _x = float(line[9:24])             # <<<<<<<<<<<<<<
- *                     _y = float(line[25:40])
- *                     _z = float(line[41:56])
- */
-              __pyx_t_2 = __Pyx_PyObject_GetSlice(__pyx_v_line, 9, 24, NULL, NULL, &__pyx_slice__4, 1, 1, 1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 37; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_2);
-              __pyx_t_16 = __Pyx_PyObject_AsDouble(__pyx_t_2); if (unlikely(__pyx_t_16 == ((double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 37; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-              __pyx_v__x = __pyx_t_16;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":38
- *                     _nodeID = int(line[0:8])
- *                     _x = float(line[9:24])
- *                     _y = float(line[25:40])             # <<<<<<<<<<<<<<
- *                     _z = float(line[41:56])
- *                     _Mesh.addNode(_nodeID, _x, _y, _z)
- */
-              __pyx_t_2 = __Pyx_PyObject_GetSlice(__pyx_v_line, 25, 40, NULL, NULL, &__pyx_slice__5, 1, 1, 1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 38; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_2);
-              __pyx_t_16 = __Pyx_PyObject_AsDouble(__pyx_t_2); if (unlikely(__pyx_t_16 == ((double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 38; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-              __pyx_v__y = __pyx_t_16;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":39
- *                     _x = float(line[9:24])
- *                     _y = float(line[25:40])
- *                     _z = float(line[41:56])             # <<<<<<<<<<<<<<
- *                     _Mesh.addNode(_nodeID, _x, _y, _z)
- *                 elif "*" in line:
- */
-              __pyx_t_2 = __Pyx_PyObject_GetSlice(__pyx_v_line, 41, 56, NULL, NULL, &__pyx_slice__6, 1, 1, 1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 39; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_2);
-              __pyx_t_16 = __Pyx_PyObject_AsDouble(__pyx_t_2); if (unlikely(__pyx_t_16 == ((double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 39; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-              __pyx_v__z = __pyx_t_16;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":40
- *                     _y = float(line[25:40])
- *                     _z = float(line[41:56])
- *                     _Mesh.addNode(_nodeID, _x, _y, _z)             # <<<<<<<<<<<<<<
- *                 elif "*" in line:
- *                     nodesection = False
- */
-              __pyx_t_17 = __Pyx_PyInt_As_int(__pyx_v__nodeID); if (unlikely((__pyx_t_17 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 40; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __pyx_t_2 = ((struct __pyx_vtabstruct_15cNK_FEMeshUtils_4Mesh_Mesh *)__pyx_v__Mesh->__pyx_vtab)->addNode(__pyx_v__Mesh, __pyx_t_17, __pyx_v__x, __pyx_v__y, __pyx_v__z, 0); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 40; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_2);
-              __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":35
- *                     # self.logger.debug("*NODE keyword found")
- *                     nodesection = True
- *                 elif (nodesection == True) and (not("$" in line or "*" in line)):             # <<<<<<<<<<<<<<
- *                     _nodeID = int(line[0:8])
- *                     _x = float(line[9:24])
- */
-              goto __pyx_L17;
-            }
-
-            /* "cNK_FEMeshUtils\MeshReaders.py":41
- *                     _z = float(line[41:56])
- *                     _Mesh.addNode(_nodeID, _x, _y, _z)
- *                 elif "*" in line:             # <<<<<<<<<<<<<<
- *                     nodesection = False
- * 
- */
-            __pyx_t_12 = (__Pyx_PySequence_ContainsTF(__pyx_kp_s__2, __pyx_v_line, Py_EQ)); if (unlikely(__pyx_t_12 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 41; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __pyx_t_14 = (__pyx_t_12 != 0);
-            if (__pyx_t_14) {
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":42
- *                     _Mesh.addNode(_nodeID, _x, _y, _z)
- *                 elif "*" in line:
- *                     nodesection = False             # <<<<<<<<<<<<<<
- * 
- *                 if line.strip() == "*ELEMENT_SHELL":
- */
-              __pyx_v_nodesection = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":41
- *                     _z = float(line[41:56])
- *                     _Mesh.addNode(_nodeID, _x, _y, _z)
- *                 elif "*" in line:             # <<<<<<<<<<<<<<
- *                     nodesection = False
- * 
- */
-            }
-            __pyx_L17:;
-
-            /* "cNK_FEMeshUtils\MeshReaders.py":44
- *                     nodesection = False
- * 
- *                 if line.strip() == "*ELEMENT_SHELL":             # <<<<<<<<<<<<<<
- *                     # self.logger.debug("*ELEMENT_SHELL keyword found")
- *                     elemsection = True
- */
-            __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_line, __pyx_n_s_strip); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 44; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __Pyx_GOTREF(__pyx_t_1);
-            __pyx_t_5 = NULL;
-            if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_1))) {
-              __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_1);
-              if (likely(__pyx_t_5)) {
-                PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
-                __Pyx_INCREF(__pyx_t_5);
-                __Pyx_INCREF(function);
-                __Pyx_DECREF_SET(__pyx_t_1, function);
-              }
-            }
-            if (__pyx_t_5) {
-              __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_t_5); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 44; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-            } else {
-              __pyx_t_2 = __Pyx_PyObject_CallNoArg(__pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 44; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            }
-            __Pyx_GOTREF(__pyx_t_2);
-            __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-            __pyx_t_14 = (__Pyx_PyString_Equals(__pyx_t_2, __pyx_kp_s_ELEMENT_SHELL, Py_EQ)); if (unlikely(__pyx_t_14 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 44; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-            if (__pyx_t_14) {
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":46
- *                 if line.strip() == "*ELEMENT_SHELL":
- *                     # self.logger.debug("*ELEMENT_SHELL keyword found")
- *                     elemsection = True             # <<<<<<<<<<<<<<
- *                 elif (elemsection == True) and (not("$" in line or "*" in line)):
- *                     _elID = int(line[0:8])
- */
-              __pyx_v_elemsection = 1;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":44
- *                     nodesection = False
- * 
- *                 if line.strip() == "*ELEMENT_SHELL":             # <<<<<<<<<<<<<<
- *                     # self.logger.debug("*ELEMENT_SHELL keyword found")
- *                     elemsection = True
- */
-              goto __pyx_L22;
-            }
-
-            /* "cNK_FEMeshUtils\MeshReaders.py":47
- *                     # self.logger.debug("*ELEMENT_SHELL keyword found")
- *                     elemsection = True
- *                 elif (elemsection == True) and (not("$" in line or "*" in line)):             # <<<<<<<<<<<<<<
- *                     _elID = int(line[0:8])
- *                     _partID = int(line[9:16])
- */
-            __pyx_t_12 = ((__pyx_v_elemsection == 1) != 0);
-            if (__pyx_t_12) {
-            } else {
-              __pyx_t_14 = __pyx_t_12;
-              goto __pyx_L23_bool_binop_done;
-            }
-            __pyx_t_13 = (__Pyx_PySequence_ContainsTF(__pyx_kp_s_, __pyx_v_line, Py_EQ)); if (unlikely(__pyx_t_13 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 47; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __pyx_t_15 = (__pyx_t_13 != 0);
-            if (!__pyx_t_15) {
-            } else {
-              __pyx_t_12 = __pyx_t_15;
-              goto __pyx_L25_bool_binop_done;
-            }
-            __pyx_t_15 = (__Pyx_PySequence_ContainsTF(__pyx_kp_s__2, __pyx_v_line, Py_EQ)); if (unlikely(__pyx_t_15 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 47; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __pyx_t_13 = (__pyx_t_15 != 0);
-            __pyx_t_12 = __pyx_t_13;
-            __pyx_L25_bool_binop_done:;
-            __pyx_t_13 = ((!__pyx_t_12) != 0);
-            __pyx_t_14 = __pyx_t_13;
-            __pyx_L23_bool_binop_done:;
-            if (__pyx_t_14) {
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":48
- *                     elemsection = True
- *                 elif (elemsection == True) and (not("$" in line or "*" in line)):
- *                     _elID = int(line[0:8])             # <<<<<<<<<<<<<<
- *                     _partID = int(line[9:16])
- *                     _n1 = int(line[17:24])
- */
-              __pyx_t_2 = __Pyx_PyObject_GetSlice(__pyx_v_line, 0, 8, NULL, NULL, &__pyx_slice__7, 1, 1, 1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 48; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_2);
-              __pyx_t_1 = PyNumber_Int(__pyx_t_2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 48; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_1);
-              __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-              __Pyx_XDECREF_SET(__pyx_v__elID, __pyx_t_1);
-              __pyx_t_1 = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":49
- *                 elif (elemsection == True) and (not("$" in line or "*" in line)):
- *                     _elID = int(line[0:8])
- *                     _partID = int(line[9:16])             # <<<<<<<<<<<<<<
- *                     _n1 = int(line[17:24])
- *                     _n2 = int(line[25:32])
- */
-              __pyx_t_1 = __Pyx_PyObject_GetSlice(__pyx_v_line, 9, 16, NULL, NULL, &__pyx_slice__8, 1, 1, 1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 49; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_1);
-              __pyx_t_2 = PyNumber_Int(__pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 49; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_2);
-              __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-              __Pyx_XDECREF_SET(__pyx_v__partID, __pyx_t_2);
-              __pyx_t_2 = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":50
- *                     _elID = int(line[0:8])
- *                     _partID = int(line[9:16])
- *                     _n1 = int(line[17:24])             # <<<<<<<<<<<<<<
- *                     _n2 = int(line[25:32])
- *                     _n3 = int(line[33:40])
- */
-              __pyx_t_2 = __Pyx_PyObject_GetSlice(__pyx_v_line, 17, 24, NULL, NULL, &__pyx_slice__9, 1, 1, 1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 50; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_2);
-              __pyx_t_1 = PyNumber_Int(__pyx_t_2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 50; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_1);
-              __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-              __Pyx_XDECREF_SET(__pyx_v__n1, __pyx_t_1);
-              __pyx_t_1 = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":51
- *                     _partID = int(line[9:16])
- *                     _n1 = int(line[17:24])
- *                     _n2 = int(line[25:32])             # <<<<<<<<<<<<<<
- *                     _n3 = int(line[33:40])
- *                     _n4 = int(line[41:48])
- */
-              __pyx_t_1 = __Pyx_PyObject_GetSlice(__pyx_v_line, 25, 32, NULL, NULL, &__pyx_slice__10, 1, 1, 1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 51; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_1);
-              __pyx_t_2 = PyNumber_Int(__pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 51; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_2);
-              __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-              __Pyx_XDECREF_SET(__pyx_v__n2, __pyx_t_2);
-              __pyx_t_2 = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":52
- *                     _n1 = int(line[17:24])
- *                     _n2 = int(line[25:32])
- *                     _n3 = int(line[33:40])             # <<<<<<<<<<<<<<
- *                     _n4 = int(line[41:48])
- *                     _Mesh.addElem(_elID, _partID, _n1, _n2, _n3, _n4)
- */
-              __pyx_t_2 = __Pyx_PyObject_GetSlice(__pyx_v_line, 33, 40, NULL, NULL, &__pyx_slice__11, 1, 1, 1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 52; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_2);
-              __pyx_t_1 = PyNumber_Int(__pyx_t_2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 52; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_1);
-              __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-              __Pyx_XDECREF_SET(__pyx_v__n3, __pyx_t_1);
-              __pyx_t_1 = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":53
- *                     _n2 = int(line[25:32])
- *                     _n3 = int(line[33:40])
- *                     _n4 = int(line[41:48])             # <<<<<<<<<<<<<<
- *                     _Mesh.addElem(_elID, _partID, _n1, _n2, _n3, _n4)
- *                 elif "*" in line:
- */
-              __pyx_t_1 = __Pyx_PyObject_GetSlice(__pyx_v_line, 41, 48, NULL, NULL, &__pyx_slice__12, 1, 1, 1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 53; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_1);
-              __pyx_t_2 = PyNumber_Int(__pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 53; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_2);
-              __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-              __Pyx_XDECREF_SET(__pyx_v__n4, __pyx_t_2);
-              __pyx_t_2 = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":54
- *                     _n3 = int(line[33:40])
- *                     _n4 = int(line[41:48])
- *                     _Mesh.addElem(_elID, _partID, _n1, _n2, _n3, _n4)             # <<<<<<<<<<<<<<
- *                 elif "*" in line:
- *                     elemsection = False
- */
-              __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v__Mesh), __pyx_n_s_addElem); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 54; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_1);
-              __pyx_t_5 = NULL;
-              __pyx_t_18 = 0;
-              if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_1))) {
-                __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_1);
-                if (likely(__pyx_t_5)) {
-                  PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
-                  __Pyx_INCREF(__pyx_t_5);
-                  __Pyx_INCREF(function);
-                  __Pyx_DECREF_SET(__pyx_t_1, function);
-                  __pyx_t_18 = 1;
-                }
-              }
-              __pyx_t_4 = PyTuple_New(6+__pyx_t_18); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 54; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_4);
-              if (__pyx_t_5) {
-                __Pyx_GIVEREF(__pyx_t_5); PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_5); __pyx_t_5 = NULL;
-              }
-              __Pyx_INCREF(__pyx_v__elID);
-              __Pyx_GIVEREF(__pyx_v__elID);
-              PyTuple_SET_ITEM(__pyx_t_4, 0+__pyx_t_18, __pyx_v__elID);
-              __Pyx_INCREF(__pyx_v__partID);
-              __Pyx_GIVEREF(__pyx_v__partID);
-              PyTuple_SET_ITEM(__pyx_t_4, 1+__pyx_t_18, __pyx_v__partID);
-              __Pyx_INCREF(__pyx_v__n1);
-              __Pyx_GIVEREF(__pyx_v__n1);
-              PyTuple_SET_ITEM(__pyx_t_4, 2+__pyx_t_18, __pyx_v__n1);
-              __Pyx_INCREF(__pyx_v__n2);
-              __Pyx_GIVEREF(__pyx_v__n2);
-              PyTuple_SET_ITEM(__pyx_t_4, 3+__pyx_t_18, __pyx_v__n2);
-              __Pyx_INCREF(__pyx_v__n3);
-              __Pyx_GIVEREF(__pyx_v__n3);
-              PyTuple_SET_ITEM(__pyx_t_4, 4+__pyx_t_18, __pyx_v__n3);
-              __Pyx_INCREF(__pyx_v__n4);
-              __Pyx_GIVEREF(__pyx_v__n4);
-              PyTuple_SET_ITEM(__pyx_t_4, 5+__pyx_t_18, __pyx_v__n4);
-              __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_4, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 54; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_2);
-              __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-              __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-              __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":47
- *                     # self.logger.debug("*ELEMENT_SHELL keyword found")
- *                     elemsection = True
- *                 elif (elemsection == True) and (not("$" in line or "*" in line)):             # <<<<<<<<<<<<<<
- *                     _elID = int(line[0:8])
- *                     _partID = int(line[9:16])
- */
-              goto __pyx_L22;
-            }
-
-            /* "cNK_FEMeshUtils\MeshReaders.py":55
- *                     _n4 = int(line[41:48])
- *                     _Mesh.addElem(_elID, _partID, _n1, _n2, _n3, _n4)
- *                 elif "*" in line:             # <<<<<<<<<<<<<<
- *                     elemsection = False
- * 
- */
-            __pyx_t_14 = (__Pyx_PySequence_ContainsTF(__pyx_kp_s__2, __pyx_v_line, Py_EQ)); if (unlikely(__pyx_t_14 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 55; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __pyx_t_13 = (__pyx_t_14 != 0);
-            if (__pyx_t_13) {
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":56
- *                     _Mesh.addElem(_elID, _partID, _n1, _n2, _n3, _n4)
- *                 elif "*" in line:
- *                     elemsection = False             # <<<<<<<<<<<<<<
- * 
- *                 if line.strip() == "*ELEMENT_SHELL_THICKNESS":
- */
-              __pyx_v_elemsection = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":55
- *                     _n4 = int(line[41:48])
- *                     _Mesh.addElem(_elID, _partID, _n1, _n2, _n3, _n4)
- *                 elif "*" in line:             # <<<<<<<<<<<<<<
- *                     elemsection = False
- * 
- */
-            }
-            __pyx_L22:;
-
-            /* "cNK_FEMeshUtils\MeshReaders.py":58
- *                     elemsection = False
- * 
- *                 if line.strip() == "*ELEMENT_SHELL_THICKNESS":             # <<<<<<<<<<<<<<
- *                     # self.logger.debug("*ELEMENT_SHELL_THICKNESS keyword found")
- *                     elemthicksection = True
- */
-            __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_line, __pyx_n_s_strip); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 58; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __Pyx_GOTREF(__pyx_t_1);
-            __pyx_t_4 = NULL;
-            if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_1))) {
-              __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_1);
-              if (likely(__pyx_t_4)) {
-                PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
-                __Pyx_INCREF(__pyx_t_4);
-                __Pyx_INCREF(function);
-                __Pyx_DECREF_SET(__pyx_t_1, function);
-              }
-            }
-            if (__pyx_t_4) {
-              __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_t_4); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 58; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-            } else {
-              __pyx_t_2 = __Pyx_PyObject_CallNoArg(__pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 58; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            }
-            __Pyx_GOTREF(__pyx_t_2);
-            __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-            __pyx_t_13 = (__Pyx_PyString_Equals(__pyx_t_2, __pyx_kp_s_ELEMENT_SHELL_THICKNESS, Py_EQ)); if (unlikely(__pyx_t_13 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 58; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-            if (__pyx_t_13) {
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":60
- *                 if line.strip() == "*ELEMENT_SHELL_THICKNESS":
- *                     # self.logger.debug("*ELEMENT_SHELL_THICKNESS keyword found")
- *                     elemthicksection = True             # <<<<<<<<<<<<<<
- *                     i=0
- *                 elif (elemthicksection == True) and (not("$" in line or "*" in line)):
- */
-              __pyx_v_elemthicksection = 1;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":61
- *                     # self.logger.debug("*ELEMENT_SHELL_THICKNESS keyword found")
- *                     elemthicksection = True
- *                     i=0             # <<<<<<<<<<<<<<
- *                 elif (elemthicksection == True) and (not("$" in line or "*" in line)):
- *                     if i == 0:
- */
-              __Pyx_INCREF(__pyx_int_0);
-              __Pyx_DECREF_SET(__pyx_v_i, __pyx_int_0);
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":58
- *                     elemsection = False
- * 
- *                 if line.strip() == "*ELEMENT_SHELL_THICKNESS":             # <<<<<<<<<<<<<<
- *                     # self.logger.debug("*ELEMENT_SHELL_THICKNESS keyword found")
- *                     elemthicksection = True
- */
-              goto __pyx_L27;
-            }
-
-            /* "cNK_FEMeshUtils\MeshReaders.py":62
- *                     elemthicksection = True
- *                     i=0
- *                 elif (elemthicksection == True) and (not("$" in line or "*" in line)):             # <<<<<<<<<<<<<<
- *                     if i == 0:
- *                         _elID = int(line[0:8])
- */
-            __pyx_t_14 = ((__pyx_v_elemthicksection == 1) != 0);
-            if (__pyx_t_14) {
-            } else {
-              __pyx_t_13 = __pyx_t_14;
-              goto __pyx_L28_bool_binop_done;
-            }
-            __pyx_t_12 = (__Pyx_PySequence_ContainsTF(__pyx_kp_s_, __pyx_v_line, Py_EQ)); if (unlikely(__pyx_t_12 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 62; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __pyx_t_15 = (__pyx_t_12 != 0);
-            if (!__pyx_t_15) {
-            } else {
-              __pyx_t_14 = __pyx_t_15;
-              goto __pyx_L30_bool_binop_done;
-            }
-            __pyx_t_15 = (__Pyx_PySequence_ContainsTF(__pyx_kp_s__2, __pyx_v_line, Py_EQ)); if (unlikely(__pyx_t_15 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 62; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __pyx_t_12 = (__pyx_t_15 != 0);
-            __pyx_t_14 = __pyx_t_12;
-            __pyx_L30_bool_binop_done:;
-            __pyx_t_12 = ((!__pyx_t_14) != 0);
-            __pyx_t_13 = __pyx_t_12;
-            __pyx_L28_bool_binop_done:;
-            if (__pyx_t_13) {
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":63
- *                     i=0
- *                 elif (elemthicksection == True) and (not("$" in line or "*" in line)):
- *                     if i == 0:             # <<<<<<<<<<<<<<
- *                         _elID = int(line[0:8])
- *                         _partID = int(line[9:16])
- */
-              __pyx_t_2 = __Pyx_PyInt_EqObjC(__pyx_v_i, __pyx_int_0, 0, 0); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 63; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_2);
-              __pyx_t_13 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely(__pyx_t_13 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 63; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-              if (__pyx_t_13) {
-
-                /* "cNK_FEMeshUtils\MeshReaders.py":64
- *                 elif (elemthicksection == True) and (not("$" in line or "*" in line)):
- *                     if i == 0:
- *                         _elID = int(line[0:8])             # <<<<<<<<<<<<<<
- *                         _partID = int(line[9:16])
- *                         _n1 = int(line[17:24])
- */
-                __pyx_t_2 = __Pyx_PyObject_GetSlice(__pyx_v_line, 0, 8, NULL, NULL, &__pyx_slice__13, 1, 1, 1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 64; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_2);
-                __pyx_t_1 = PyNumber_Int(__pyx_t_2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 64; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_1);
-                __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-                __Pyx_XDECREF_SET(__pyx_v__elID, __pyx_t_1);
-                __pyx_t_1 = 0;
-
-                /* "cNK_FEMeshUtils\MeshReaders.py":65
- *                     if i == 0:
- *                         _elID = int(line[0:8])
- *                         _partID = int(line[9:16])             # <<<<<<<<<<<<<<
- *                         _n1 = int(line[17:24])
- *                         _n2 = int(line[25:32])
- */
-                __pyx_t_1 = __Pyx_PyObject_GetSlice(__pyx_v_line, 9, 16, NULL, NULL, &__pyx_slice__14, 1, 1, 1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 65; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_1);
-                __pyx_t_2 = PyNumber_Int(__pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 65; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_2);
-                __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-                __Pyx_XDECREF_SET(__pyx_v__partID, __pyx_t_2);
-                __pyx_t_2 = 0;
-
-                /* "cNK_FEMeshUtils\MeshReaders.py":66
- *                         _elID = int(line[0:8])
- *                         _partID = int(line[9:16])
- *                         _n1 = int(line[17:24])             # <<<<<<<<<<<<<<
- *                         _n2 = int(line[25:32])
- *                         _n3 = int(line[33:40])
- */
-                __pyx_t_2 = __Pyx_PyObject_GetSlice(__pyx_v_line, 17, 24, NULL, NULL, &__pyx_slice__15, 1, 1, 1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 66; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_2);
-                __pyx_t_1 = PyNumber_Int(__pyx_t_2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 66; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_1);
-                __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-                __Pyx_XDECREF_SET(__pyx_v__n1, __pyx_t_1);
-                __pyx_t_1 = 0;
-
-                /* "cNK_FEMeshUtils\MeshReaders.py":67
- *                         _partID = int(line[9:16])
- *                         _n1 = int(line[17:24])
- *                         _n2 = int(line[25:32])             # <<<<<<<<<<<<<<
- *                         _n3 = int(line[33:40])
- *                         _n4 = int(line[41:48])
- */
-                __pyx_t_1 = __Pyx_PyObject_GetSlice(__pyx_v_line, 25, 32, NULL, NULL, &__pyx_slice__16, 1, 1, 1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 67; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_1);
-                __pyx_t_2 = PyNumber_Int(__pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 67; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_2);
-                __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-                __Pyx_XDECREF_SET(__pyx_v__n2, __pyx_t_2);
-                __pyx_t_2 = 0;
-
-                /* "cNK_FEMeshUtils\MeshReaders.py":68
- *                         _n1 = int(line[17:24])
- *                         _n2 = int(line[25:32])
- *                         _n3 = int(line[33:40])             # <<<<<<<<<<<<<<
- *                         _n4 = int(line[41:48])
- *                         _Mesh.addElem(_elID, _partID, _n1, _n2, _n3, _n4)
- */
-                __pyx_t_2 = __Pyx_PyObject_GetSlice(__pyx_v_line, 33, 40, NULL, NULL, &__pyx_slice__17, 1, 1, 1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 68; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_2);
-                __pyx_t_1 = PyNumber_Int(__pyx_t_2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 68; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_1);
-                __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-                __Pyx_XDECREF_SET(__pyx_v__n3, __pyx_t_1);
-                __pyx_t_1 = 0;
-
-                /* "cNK_FEMeshUtils\MeshReaders.py":69
- *                         _n2 = int(line[25:32])
- *                         _n3 = int(line[33:40])
- *                         _n4 = int(line[41:48])             # <<<<<<<<<<<<<<
- *                         _Mesh.addElem(_elID, _partID, _n1, _n2, _n3, _n4)
- *                         i = i+1
- */
-                __pyx_t_1 = __Pyx_PyObject_GetSlice(__pyx_v_line, 41, 48, NULL, NULL, &__pyx_slice__18, 1, 1, 1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 69; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_1);
-                __pyx_t_2 = PyNumber_Int(__pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 69; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_2);
-                __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-                __Pyx_XDECREF_SET(__pyx_v__n4, __pyx_t_2);
-                __pyx_t_2 = 0;
-
-                /* "cNK_FEMeshUtils\MeshReaders.py":70
- *                         _n3 = int(line[33:40])
- *                         _n4 = int(line[41:48])
- *                         _Mesh.addElem(_elID, _partID, _n1, _n2, _n3, _n4)             # <<<<<<<<<<<<<<
- *                         i = i+1
- *                     elif i==1:
- */
-                __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v__Mesh), __pyx_n_s_addElem); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 70; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_1);
-                __pyx_t_4 = NULL;
-                __pyx_t_18 = 0;
-                if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_1))) {
-                  __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_1);
-                  if (likely(__pyx_t_4)) {
-                    PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
-                    __Pyx_INCREF(__pyx_t_4);
-                    __Pyx_INCREF(function);
-                    __Pyx_DECREF_SET(__pyx_t_1, function);
-                    __pyx_t_18 = 1;
-                  }
-                }
-                __pyx_t_5 = PyTuple_New(6+__pyx_t_18); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 70; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_5);
-                if (__pyx_t_4) {
-                  __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_4); __pyx_t_4 = NULL;
-                }
-                __Pyx_INCREF(__pyx_v__elID);
-                __Pyx_GIVEREF(__pyx_v__elID);
-                PyTuple_SET_ITEM(__pyx_t_5, 0+__pyx_t_18, __pyx_v__elID);
-                __Pyx_INCREF(__pyx_v__partID);
-                __Pyx_GIVEREF(__pyx_v__partID);
-                PyTuple_SET_ITEM(__pyx_t_5, 1+__pyx_t_18, __pyx_v__partID);
-                __Pyx_INCREF(__pyx_v__n1);
-                __Pyx_GIVEREF(__pyx_v__n1);
-                PyTuple_SET_ITEM(__pyx_t_5, 2+__pyx_t_18, __pyx_v__n1);
-                __Pyx_INCREF(__pyx_v__n2);
-                __Pyx_GIVEREF(__pyx_v__n2);
-                PyTuple_SET_ITEM(__pyx_t_5, 3+__pyx_t_18, __pyx_v__n2);
-                __Pyx_INCREF(__pyx_v__n3);
-                __Pyx_GIVEREF(__pyx_v__n3);
-                PyTuple_SET_ITEM(__pyx_t_5, 4+__pyx_t_18, __pyx_v__n3);
-                __Pyx_INCREF(__pyx_v__n4);
-                __Pyx_GIVEREF(__pyx_v__n4);
-                PyTuple_SET_ITEM(__pyx_t_5, 5+__pyx_t_18, __pyx_v__n4);
-                __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_5, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 70; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_2);
-                __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-                __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-                __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-                /* "cNK_FEMeshUtils\MeshReaders.py":71
- *                         _n4 = int(line[41:48])
- *                         _Mesh.addElem(_elID, _partID, _n1, _n2, _n3, _n4)
- *                         i = i+1             # <<<<<<<<<<<<<<
- *                     elif i==1:
- *                         _Mesh.addNodalThickness(_n1,float(line[0:16]))
- */
-                __pyx_t_2 = __Pyx_PyInt_AddObjC(__pyx_v_i, __pyx_int_1, 1, 0); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 71; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_2);
-                __Pyx_DECREF_SET(__pyx_v_i, __pyx_t_2);
-                __pyx_t_2 = 0;
-
-                /* "cNK_FEMeshUtils\MeshReaders.py":63
- *                     i=0
- *                 elif (elemthicksection == True) and (not("$" in line or "*" in line)):
- *                     if i == 0:             # <<<<<<<<<<<<<<
- *                         _elID = int(line[0:8])
- *                         _partID = int(line[9:16])
- */
-                goto __pyx_L32;
-              }
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":72
- *                         _Mesh.addElem(_elID, _partID, _n1, _n2, _n3, _n4)
- *                         i = i+1
- *                     elif i==1:             # <<<<<<<<<<<<<<
- *                         _Mesh.addNodalThickness(_n1,float(line[0:16]))
- *                         _Mesh.addNodalThickness(_n2,float(line[17:32]))
- */
-              __pyx_t_2 = __Pyx_PyInt_EqObjC(__pyx_v_i, __pyx_int_1, 1, 0); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 72; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_2);
-              __pyx_t_13 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely(__pyx_t_13 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 72; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-              if (__pyx_t_13) {
-
-                /* "cNK_FEMeshUtils\MeshReaders.py":73
- *                         i = i+1
- *                     elif i==1:
- *                         _Mesh.addNodalThickness(_n1,float(line[0:16]))             # <<<<<<<<<<<<<<
- *                         _Mesh.addNodalThickness(_n2,float(line[17:32]))
- *                         _Mesh.addNodalThickness(_n3,float(line[33:48]))
- */
-                if (unlikely(!__pyx_v__n1)) { __Pyx_RaiseUnboundLocalError("_n1"); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 73; __pyx_clineno = __LINE__; goto __pyx_L7_error;} }
-                __pyx_t_17 = __Pyx_PyInt_As_int(__pyx_v__n1); if (unlikely((__pyx_t_17 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 73; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __pyx_t_2 = __Pyx_PyObject_GetSlice(__pyx_v_line, 0, 16, NULL, NULL, &__pyx_slice__19, 1, 1, 1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 73; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_2);
-                __pyx_t_16 = __Pyx_PyObject_AsDouble(__pyx_t_2); if (unlikely(__pyx_t_16 == ((double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 73; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-                __pyx_t_2 = ((struct __pyx_vtabstruct_15cNK_FEMeshUtils_4Mesh_Mesh *)__pyx_v__Mesh->__pyx_vtab)->addNodalThickness(__pyx_v__Mesh, __pyx_t_17, __pyx_t_16, 0); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 73; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_2);
-                __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-                /* "cNK_FEMeshUtils\MeshReaders.py":74
- *                     elif i==1:
- *                         _Mesh.addNodalThickness(_n1,float(line[0:16]))
- *                         _Mesh.addNodalThickness(_n2,float(line[17:32]))             # <<<<<<<<<<<<<<
- *                         _Mesh.addNodalThickness(_n3,float(line[33:48]))
- *                         _Mesh.addNodalThickness(_n4,float(line[49:64]))
- */
-                if (unlikely(!__pyx_v__n2)) { __Pyx_RaiseUnboundLocalError("_n2"); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 74; __pyx_clineno = __LINE__; goto __pyx_L7_error;} }
-                __pyx_t_17 = __Pyx_PyInt_As_int(__pyx_v__n2); if (unlikely((__pyx_t_17 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 74; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __pyx_t_2 = __Pyx_PyObject_GetSlice(__pyx_v_line, 17, 32, NULL, NULL, &__pyx_slice__20, 1, 1, 1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 74; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_2);
-                __pyx_t_16 = __Pyx_PyObject_AsDouble(__pyx_t_2); if (unlikely(__pyx_t_16 == ((double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 74; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-                __pyx_t_2 = ((struct __pyx_vtabstruct_15cNK_FEMeshUtils_4Mesh_Mesh *)__pyx_v__Mesh->__pyx_vtab)->addNodalThickness(__pyx_v__Mesh, __pyx_t_17, __pyx_t_16, 0); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 74; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_2);
-                __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-                /* "cNK_FEMeshUtils\MeshReaders.py":75
- *                         _Mesh.addNodalThickness(_n1,float(line[0:16]))
- *                         _Mesh.addNodalThickness(_n2,float(line[17:32]))
- *                         _Mesh.addNodalThickness(_n3,float(line[33:48]))             # <<<<<<<<<<<<<<
- *                         _Mesh.addNodalThickness(_n4,float(line[49:64]))
- *                         i = 0
- */
-                if (unlikely(!__pyx_v__n3)) { __Pyx_RaiseUnboundLocalError("_n3"); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 75; __pyx_clineno = __LINE__; goto __pyx_L7_error;} }
-                __pyx_t_17 = __Pyx_PyInt_As_int(__pyx_v__n3); if (unlikely((__pyx_t_17 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 75; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __pyx_t_2 = __Pyx_PyObject_GetSlice(__pyx_v_line, 33, 48, NULL, NULL, &__pyx_slice__21, 1, 1, 1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 75; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_2);
-                __pyx_t_16 = __Pyx_PyObject_AsDouble(__pyx_t_2); if (unlikely(__pyx_t_16 == ((double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 75; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-                __pyx_t_2 = ((struct __pyx_vtabstruct_15cNK_FEMeshUtils_4Mesh_Mesh *)__pyx_v__Mesh->__pyx_vtab)->addNodalThickness(__pyx_v__Mesh, __pyx_t_17, __pyx_t_16, 0); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 75; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_2);
-                __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-                /* "cNK_FEMeshUtils\MeshReaders.py":76
- *                         _Mesh.addNodalThickness(_n2,float(line[17:32]))
- *                         _Mesh.addNodalThickness(_n3,float(line[33:48]))
- *                         _Mesh.addNodalThickness(_n4,float(line[49:64]))             # <<<<<<<<<<<<<<
- *                         i = 0
- *                 elif "*" in line:
- */
-                if (unlikely(!__pyx_v__n4)) { __Pyx_RaiseUnboundLocalError("_n4"); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 76; __pyx_clineno = __LINE__; goto __pyx_L7_error;} }
-                __pyx_t_17 = __Pyx_PyInt_As_int(__pyx_v__n4); if (unlikely((__pyx_t_17 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 76; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __pyx_t_2 = __Pyx_PyObject_GetSlice(__pyx_v_line, 49, 64, NULL, NULL, &__pyx_slice__22, 1, 1, 1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 76; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_2);
-                __pyx_t_16 = __Pyx_PyObject_AsDouble(__pyx_t_2); if (unlikely(__pyx_t_16 == ((double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 76; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-                __pyx_t_2 = ((struct __pyx_vtabstruct_15cNK_FEMeshUtils_4Mesh_Mesh *)__pyx_v__Mesh->__pyx_vtab)->addNodalThickness(__pyx_v__Mesh, __pyx_t_17, __pyx_t_16, 0); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 76; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_2);
-                __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-                /* "cNK_FEMeshUtils\MeshReaders.py":77
- *                         _Mesh.addNodalThickness(_n3,float(line[33:48]))
- *                         _Mesh.addNodalThickness(_n4,float(line[49:64]))
- *                         i = 0             # <<<<<<<<<<<<<<
- *                 elif "*" in line:
- *                     elemthicksection = False
- */
-                __Pyx_INCREF(__pyx_int_0);
-                __Pyx_DECREF_SET(__pyx_v_i, __pyx_int_0);
-
-                /* "cNK_FEMeshUtils\MeshReaders.py":72
- *                         _Mesh.addElem(_elID, _partID, _n1, _n2, _n3, _n4)
- *                         i = i+1
- *                     elif i==1:             # <<<<<<<<<<<<<<
- *                         _Mesh.addNodalThickness(_n1,float(line[0:16]))
- *                         _Mesh.addNodalThickness(_n2,float(line[17:32]))
- */
-              }
-              __pyx_L32:;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":62
- *                     elemthicksection = True
- *                     i=0
- *                 elif (elemthicksection == True) and (not("$" in line or "*" in line)):             # <<<<<<<<<<<<<<
- *                     if i == 0:
- *                         _elID = int(line[0:8])
- */
-              goto __pyx_L27;
-            }
-
-            /* "cNK_FEMeshUtils\MeshReaders.py":78
- *                         _Mesh.addNodalThickness(_n4,float(line[49:64]))
- *                         i = 0
- *                 elif "*" in line:             # <<<<<<<<<<<<<<
- *                     elemthicksection = False
- * 
- */
-            __pyx_t_13 = (__Pyx_PySequence_ContainsTF(__pyx_kp_s__2, __pyx_v_line, Py_EQ)); if (unlikely(__pyx_t_13 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 78; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __pyx_t_12 = (__pyx_t_13 != 0);
-            if (__pyx_t_12) {
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":79
- *                         i = 0
- *                 elif "*" in line:
- *                     elemthicksection = False             # <<<<<<<<<<<<<<
- * 
- *                 if line.strip() == "*PART":
- */
-              __pyx_v_elemthicksection = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":78
- *                         _Mesh.addNodalThickness(_n4,float(line[49:64]))
- *                         i = 0
- *                 elif "*" in line:             # <<<<<<<<<<<<<<
- *                     elemthicksection = False
- * 
- */
-            }
-            __pyx_L27:;
-
-            /* "cNK_FEMeshUtils\MeshReaders.py":81
- *                     elemthicksection = False
- * 
- *                 if line.strip() == "*PART":             # <<<<<<<<<<<<<<
- *                     # self.logger.debug("*PART Keyword Found")
- *                     partsection = True
- */
-            __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_line, __pyx_n_s_strip); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 81; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __Pyx_GOTREF(__pyx_t_1);
-            __pyx_t_5 = NULL;
-            if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_1))) {
-              __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_1);
-              if (likely(__pyx_t_5)) {
-                PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
-                __Pyx_INCREF(__pyx_t_5);
-                __Pyx_INCREF(function);
-                __Pyx_DECREF_SET(__pyx_t_1, function);
-              }
-            }
-            if (__pyx_t_5) {
-              __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_t_5); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 81; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-            } else {
-              __pyx_t_2 = __Pyx_PyObject_CallNoArg(__pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 81; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            }
-            __Pyx_GOTREF(__pyx_t_2);
-            __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-            __pyx_t_12 = (__Pyx_PyString_Equals(__pyx_t_2, __pyx_kp_s_PART, Py_EQ)); if (unlikely(__pyx_t_12 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 81; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-            if (__pyx_t_12) {
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":83
- *                 if line.strip() == "*PART":
- *                     # self.logger.debug("*PART Keyword Found")
- *                     partsection = True             # <<<<<<<<<<<<<<
- *                     i=0
- *                 elif (partsection == True) and (not("$" in line or "*" in line)):
- */
-              __pyx_v_partsection = 1;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":84
- *                     # self.logger.debug("*PART Keyword Found")
- *                     partsection = True
- *                     i=0             # <<<<<<<<<<<<<<
- *                 elif (partsection == True) and (not("$" in line or "*" in line)):
- *                     if i == 0: _title=line.strip()
- */
-              __Pyx_INCREF(__pyx_int_0);
-              __Pyx_DECREF_SET(__pyx_v_i, __pyx_int_0);
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":81
- *                     elemthicksection = False
- * 
- *                 if line.strip() == "*PART":             # <<<<<<<<<<<<<<
- *                     # self.logger.debug("*PART Keyword Found")
- *                     partsection = True
- */
-              goto __pyx_L33;
-            }
-
-            /* "cNK_FEMeshUtils\MeshReaders.py":85
- *                     partsection = True
- *                     i=0
- *                 elif (partsection == True) and (not("$" in line or "*" in line)):             # <<<<<<<<<<<<<<
- *                     if i == 0: _title=line.strip()
- *                     if i == 1:
- */
-            __pyx_t_13 = ((__pyx_v_partsection == 1) != 0);
-            if (__pyx_t_13) {
-            } else {
-              __pyx_t_12 = __pyx_t_13;
-              goto __pyx_L34_bool_binop_done;
-            }
-            __pyx_t_14 = (__Pyx_PySequence_ContainsTF(__pyx_kp_s_, __pyx_v_line, Py_EQ)); if (unlikely(__pyx_t_14 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 85; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __pyx_t_15 = (__pyx_t_14 != 0);
-            if (!__pyx_t_15) {
-            } else {
-              __pyx_t_13 = __pyx_t_15;
-              goto __pyx_L36_bool_binop_done;
-            }
-            __pyx_t_15 = (__Pyx_PySequence_ContainsTF(__pyx_kp_s__2, __pyx_v_line, Py_EQ)); if (unlikely(__pyx_t_15 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 85; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __pyx_t_14 = (__pyx_t_15 != 0);
-            __pyx_t_13 = __pyx_t_14;
-            __pyx_L36_bool_binop_done:;
-            __pyx_t_14 = ((!__pyx_t_13) != 0);
-            __pyx_t_12 = __pyx_t_14;
-            __pyx_L34_bool_binop_done:;
-            if (__pyx_t_12) {
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":86
- *                     i=0
- *                 elif (partsection == True) and (not("$" in line or "*" in line)):
- *                     if i == 0: _title=line.strip()             # <<<<<<<<<<<<<<
- *                     if i == 1:
- * 
- */
-              __pyx_t_2 = __Pyx_PyInt_EqObjC(__pyx_v_i, __pyx_int_0, 0, 0); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 86; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_2);
-              __pyx_t_12 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely(__pyx_t_12 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 86; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-              if (__pyx_t_12) {
-                __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_line, __pyx_n_s_strip); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 86; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_1);
-                __pyx_t_5 = NULL;
-                if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_1))) {
-                  __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_1);
-                  if (likely(__pyx_t_5)) {
-                    PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
-                    __Pyx_INCREF(__pyx_t_5);
-                    __Pyx_INCREF(function);
-                    __Pyx_DECREF_SET(__pyx_t_1, function);
-                  }
-                }
-                if (__pyx_t_5) {
-                  __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_t_5); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 86; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-                } else {
-                  __pyx_t_2 = __Pyx_PyObject_CallNoArg(__pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 86; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                }
-                __Pyx_GOTREF(__pyx_t_2);
-                __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-                __Pyx_XDECREF_SET(__pyx_v__title, __pyx_t_2);
-                __pyx_t_2 = 0;
-              }
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":87
- *                 elif (partsection == True) and (not("$" in line or "*" in line)):
- *                     if i == 0: _title=line.strip()
- *                     if i == 1:             # <<<<<<<<<<<<<<
- * 
- *                         _partID=int(line[0:10])
- */
-              __pyx_t_2 = __Pyx_PyInt_EqObjC(__pyx_v_i, __pyx_int_1, 1, 0); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 87; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_2);
-              __pyx_t_12 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely(__pyx_t_12 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 87; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-              if (__pyx_t_12) {
-
-                /* "cNK_FEMeshUtils\MeshReaders.py":89
- *                     if i == 1:
- * 
- *                         _partID=int(line[0:10])             # <<<<<<<<<<<<<<
- *                         _propID=int(line[11:20])
- *                         _matID=int(line[21:30])
- */
-                __pyx_t_2 = __Pyx_PyObject_GetSlice(__pyx_v_line, 0, 10, NULL, NULL, &__pyx_slice__23, 1, 1, 1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 89; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_2);
-                __pyx_t_1 = PyNumber_Int(__pyx_t_2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 89; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_1);
-                __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-                __Pyx_XDECREF_SET(__pyx_v__partID, __pyx_t_1);
-                __pyx_t_1 = 0;
-
-                /* "cNK_FEMeshUtils\MeshReaders.py":90
- * 
- *                         _partID=int(line[0:10])
- *                         _propID=int(line[11:20])             # <<<<<<<<<<<<<<
- *                         _matID=int(line[21:30])
- *                         _Mesh.addPart(_partID, _title, _propID, _matID)
- */
-                __pyx_t_1 = __Pyx_PyObject_GetSlice(__pyx_v_line, 11, 20, NULL, NULL, &__pyx_slice__24, 1, 1, 1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 90; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_1);
-                __pyx_t_2 = PyNumber_Int(__pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 90; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_2);
-                __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-                __Pyx_XDECREF_SET(__pyx_v__propID, __pyx_t_2);
-                __pyx_t_2 = 0;
-
-                /* "cNK_FEMeshUtils\MeshReaders.py":91
- *                         _partID=int(line[0:10])
- *                         _propID=int(line[11:20])
- *                         _matID=int(line[21:30])             # <<<<<<<<<<<<<<
- *                         _Mesh.addPart(_partID, _title, _propID, _matID)
- *                     i=i+1
- */
-                __pyx_t_2 = __Pyx_PyObject_GetSlice(__pyx_v_line, 21, 30, NULL, NULL, &__pyx_slice__25, 1, 1, 1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 91; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_2);
-                __pyx_t_1 = PyNumber_Int(__pyx_t_2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 91; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_1);
-                __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-                __Pyx_XDECREF_SET(__pyx_v__matID, __pyx_t_1);
-                __pyx_t_1 = 0;
-
-                /* "cNK_FEMeshUtils\MeshReaders.py":92
- *                         _propID=int(line[11:20])
- *                         _matID=int(line[21:30])
- *                         _Mesh.addPart(_partID, _title, _propID, _matID)             # <<<<<<<<<<<<<<
- *                     i=i+1
- *                 elif "*" in line:
- */
-                __pyx_t_17 = __Pyx_PyInt_As_int(__pyx_v__partID); if (unlikely((__pyx_t_17 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 92; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                if (unlikely(!__pyx_v__title)) { __Pyx_RaiseUnboundLocalError("_title"); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 92; __pyx_clineno = __LINE__; goto __pyx_L7_error;} }
-                if (!(likely(PyString_CheckExact(__pyx_v__title))||((__pyx_v__title) == Py_None)||(PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "str", Py_TYPE(__pyx_v__title)->tp_name), 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 92; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __pyx_t_19 = __Pyx_PyInt_As_int(__pyx_v__propID); if (unlikely((__pyx_t_19 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 92; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __pyx_t_20 = __Pyx_PyInt_As_int(__pyx_v__matID); if (unlikely((__pyx_t_20 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 92; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __pyx_t_1 = ((struct __pyx_vtabstruct_15cNK_FEMeshUtils_4Mesh_Mesh *)__pyx_v__Mesh->__pyx_vtab)->addPart(__pyx_v__Mesh, __pyx_t_17, ((PyObject*)__pyx_v__title), __pyx_t_19, __pyx_t_20, 0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 92; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_1);
-                __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-                /* "cNK_FEMeshUtils\MeshReaders.py":87
- *                 elif (partsection == True) and (not("$" in line or "*" in line)):
- *                     if i == 0: _title=line.strip()
- *                     if i == 1:             # <<<<<<<<<<<<<<
- * 
- *                         _partID=int(line[0:10])
- */
-              }
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":93
- *                         _matID=int(line[21:30])
- *                         _Mesh.addPart(_partID, _title, _propID, _matID)
- *                     i=i+1             # <<<<<<<<<<<<<<
- *                 elif "*" in line:
- *                     partsection = False
- */
-              __pyx_t_1 = __Pyx_PyInt_AddObjC(__pyx_v_i, __pyx_int_1, 1, 0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 93; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_1);
-              __Pyx_DECREF_SET(__pyx_v_i, __pyx_t_1);
-              __pyx_t_1 = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":85
- *                     partsection = True
- *                     i=0
- *                 elif (partsection == True) and (not("$" in line or "*" in line)):             # <<<<<<<<<<<<<<
- *                     if i == 0: _title=line.strip()
- *                     if i == 1:
- */
-              goto __pyx_L33;
-            }
-
-            /* "cNK_FEMeshUtils\MeshReaders.py":94
- *                         _Mesh.addPart(_partID, _title, _propID, _matID)
- *                     i=i+1
- *                 elif "*" in line:             # <<<<<<<<<<<<<<
- *                     partsection = False
- * 
- */
-            __pyx_t_12 = (__Pyx_PySequence_ContainsTF(__pyx_kp_s__2, __pyx_v_line, Py_EQ)); if (unlikely(__pyx_t_12 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 94; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __pyx_t_14 = (__pyx_t_12 != 0);
-            if (__pyx_t_14) {
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":95
- *                     i=i+1
- *                 elif "*" in line:
- *                     partsection = False             # <<<<<<<<<<<<<<
- * 
- * 
- */
-              __pyx_v_partsection = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":94
- *                         _Mesh.addPart(_partID, _title, _propID, _matID)
- *                     i=i+1
- *                 elif "*" in line:             # <<<<<<<<<<<<<<
- *                     partsection = False
- * 
- */
-            }
-            __pyx_L33:;
-
-            /* "cNK_FEMeshUtils\MeshReaders.py":98
- * 
- * 
- *                 if line.strip() == "*MAT_PIECEWISE_LINEAR_PLASTICITY" :             # <<<<<<<<<<<<<<
- *                     # self.logger.debug("*MAT_PIECEWISE_LINEAR_PLASTICITY Keyword Found")
- *                     matsection1 = True
- */
-            __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_line, __pyx_n_s_strip); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 98; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __Pyx_GOTREF(__pyx_t_2);
-            __pyx_t_5 = NULL;
-            if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_2))) {
-              __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_2);
-              if (likely(__pyx_t_5)) {
-                PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
-                __Pyx_INCREF(__pyx_t_5);
-                __Pyx_INCREF(function);
-                __Pyx_DECREF_SET(__pyx_t_2, function);
-              }
-            }
-            if (__pyx_t_5) {
-              __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_5); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 98; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-            } else {
-              __pyx_t_1 = __Pyx_PyObject_CallNoArg(__pyx_t_2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 98; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            }
-            __Pyx_GOTREF(__pyx_t_1);
-            __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-            __pyx_t_14 = (__Pyx_PyString_Equals(__pyx_t_1, __pyx_kp_s_MAT_PIECEWISE_LINEAR_PLASTICITY, Py_EQ)); if (unlikely(__pyx_t_14 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 98; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-            if (__pyx_t_14) {
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":100
- *                 if line.strip() == "*MAT_PIECEWISE_LINEAR_PLASTICITY" :
- *                     # self.logger.debug("*MAT_PIECEWISE_LINEAR_PLASTICITY Keyword Found")
- *                     matsection1 = True             # <<<<<<<<<<<<<<
- *                     i=0
- *                 elif (matsection1 == True) and (not("$" in line or "*" in line)):
- */
-              __pyx_v_matsection1 = 1;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":101
- *                     # self.logger.debug("*MAT_PIECEWISE_LINEAR_PLASTICITY Keyword Found")
- *                     matsection1 = True
- *                     i=0             # <<<<<<<<<<<<<<
- *                 elif (matsection1 == True) and (not("$" in line or "*" in line)):
- *                     if i == 0:
- */
-              __Pyx_INCREF(__pyx_int_0);
-              __Pyx_DECREF_SET(__pyx_v_i, __pyx_int_0);
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":98
- * 
- * 
- *                 if line.strip() == "*MAT_PIECEWISE_LINEAR_PLASTICITY" :             # <<<<<<<<<<<<<<
- *                     # self.logger.debug("*MAT_PIECEWISE_LINEAR_PLASTICITY Keyword Found")
- *                     matsection1 = True
- */
-              goto __pyx_L40;
-            }
-
-            /* "cNK_FEMeshUtils\MeshReaders.py":102
- *                     matsection1 = True
- *                     i=0
- *                 elif (matsection1 == True) and (not("$" in line or "*" in line)):             # <<<<<<<<<<<<<<
- *                     if i == 0:
- *                         _matID=int(line[0:10])
- */
-            __pyx_t_12 = ((__pyx_v_matsection1 == 1) != 0);
-            if (__pyx_t_12) {
-            } else {
-              __pyx_t_14 = __pyx_t_12;
-              goto __pyx_L41_bool_binop_done;
-            }
-            __pyx_t_13 = (__Pyx_PySequence_ContainsTF(__pyx_kp_s_, __pyx_v_line, Py_EQ)); if (unlikely(__pyx_t_13 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 102; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __pyx_t_15 = (__pyx_t_13 != 0);
-            if (!__pyx_t_15) {
-            } else {
-              __pyx_t_12 = __pyx_t_15;
-              goto __pyx_L43_bool_binop_done;
-            }
-            __pyx_t_15 = (__Pyx_PySequence_ContainsTF(__pyx_kp_s__2, __pyx_v_line, Py_EQ)); if (unlikely(__pyx_t_15 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 102; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __pyx_t_13 = (__pyx_t_15 != 0);
-            __pyx_t_12 = __pyx_t_13;
-            __pyx_L43_bool_binop_done:;
-            __pyx_t_13 = ((!__pyx_t_12) != 0);
-            __pyx_t_14 = __pyx_t_13;
-            __pyx_L41_bool_binop_done:;
-            if (__pyx_t_14) {
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":103
- *                     i=0
- *                 elif (matsection1 == True) and (not("$" in line or "*" in line)):
- *                     if i == 0:             # <<<<<<<<<<<<<<
- *                         _matID=int(line[0:10])
- *                         _rho=float(line[11:20])
- */
-              __pyx_t_1 = __Pyx_PyInt_EqObjC(__pyx_v_i, __pyx_int_0, 0, 0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 103; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_1);
-              __pyx_t_14 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_14 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 103; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-              if (__pyx_t_14) {
-
-                /* "cNK_FEMeshUtils\MeshReaders.py":104
- *                 elif (matsection1 == True) and (not("$" in line or "*" in line)):
- *                     if i == 0:
- *                         _matID=int(line[0:10])             # <<<<<<<<<<<<<<
- *                         _rho=float(line[11:20])
- *                         _E=float(line[21:30])
- */
-                __pyx_t_1 = __Pyx_PyObject_GetSlice(__pyx_v_line, 0, 10, NULL, NULL, &__pyx_slice__26, 1, 1, 1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 104; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_1);
-                __pyx_t_2 = PyNumber_Int(__pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 104; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_2);
-                __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-                __Pyx_XDECREF_SET(__pyx_v__matID, __pyx_t_2);
-                __pyx_t_2 = 0;
-
-                /* "cNK_FEMeshUtils\MeshReaders.py":105
- *                     if i == 0:
- *                         _matID=int(line[0:10])
- *                         _rho=float(line[11:20])             # <<<<<<<<<<<<<<
- *                         _E=float(line[21:30])
- *                         _Mesh.addMat(_matID, _rho, _E)
- */
-                __pyx_t_2 = __Pyx_PyObject_GetSlice(__pyx_v_line, 11, 20, NULL, NULL, &__pyx_slice__27, 1, 1, 1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 105; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_2);
-                __pyx_t_16 = __Pyx_PyObject_AsDouble(__pyx_t_2); if (unlikely(__pyx_t_16 == ((double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 105; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-                __pyx_v__rho = __pyx_t_16;
-
-                /* "cNK_FEMeshUtils\MeshReaders.py":106
- *                         _matID=int(line[0:10])
- *                         _rho=float(line[11:20])
- *                         _E=float(line[21:30])             # <<<<<<<<<<<<<<
- *                         _Mesh.addMat(_matID, _rho, _E)
- *                     i=i+1
- */
-                __pyx_t_2 = __Pyx_PyObject_GetSlice(__pyx_v_line, 21, 30, NULL, NULL, &__pyx_slice__28, 1, 1, 1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 106; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_2);
-                __pyx_t_16 = __Pyx_PyObject_AsDouble(__pyx_t_2); if (unlikely(__pyx_t_16 == ((double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 106; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-                __pyx_v__E = __pyx_t_16;
-
-                /* "cNK_FEMeshUtils\MeshReaders.py":107
- *                         _rho=float(line[11:20])
- *                         _E=float(line[21:30])
- *                         _Mesh.addMat(_matID, _rho, _E)             # <<<<<<<<<<<<<<
- *                     i=i+1
- *                 elif "*" in line:
- */
-                __pyx_t_20 = __Pyx_PyInt_As_int(__pyx_v__matID); if (unlikely((__pyx_t_20 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 107; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __pyx_t_2 = ((struct __pyx_vtabstruct_15cNK_FEMeshUtils_4Mesh_Mesh *)__pyx_v__Mesh->__pyx_vtab)->addMat(__pyx_v__Mesh, __pyx_t_20, __pyx_v__rho, __pyx_v__E, 0); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 107; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_2);
-                __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-                /* "cNK_FEMeshUtils\MeshReaders.py":103
- *                     i=0
- *                 elif (matsection1 == True) and (not("$" in line or "*" in line)):
- *                     if i == 0:             # <<<<<<<<<<<<<<
- *                         _matID=int(line[0:10])
- *                         _rho=float(line[11:20])
- */
-              }
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":108
- *                         _E=float(line[21:30])
- *                         _Mesh.addMat(_matID, _rho, _E)
- *                     i=i+1             # <<<<<<<<<<<<<<
- *                 elif "*" in line:
- *                     matsection1 = False
- */
-              __pyx_t_2 = __Pyx_PyInt_AddObjC(__pyx_v_i, __pyx_int_1, 1, 0); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 108; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_2);
-              __Pyx_DECREF_SET(__pyx_v_i, __pyx_t_2);
-              __pyx_t_2 = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":102
- *                     matsection1 = True
- *                     i=0
- *                 elif (matsection1 == True) and (not("$" in line or "*" in line)):             # <<<<<<<<<<<<<<
- *                     if i == 0:
- *                         _matID=int(line[0:10])
- */
-              goto __pyx_L40;
-            }
-
-            /* "cNK_FEMeshUtils\MeshReaders.py":109
- *                         _Mesh.addMat(_matID, _rho, _E)
- *                     i=i+1
- *                 elif "*" in line:             # <<<<<<<<<<<<<<
- *                     matsection1 = False
- * 
- */
-            __pyx_t_14 = (__Pyx_PySequence_ContainsTF(__pyx_kp_s__2, __pyx_v_line, Py_EQ)); if (unlikely(__pyx_t_14 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 109; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __pyx_t_13 = (__pyx_t_14 != 0);
-            if (__pyx_t_13) {
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":110
- *                     i=i+1
- *                 elif "*" in line:
- *                     matsection1 = False             # <<<<<<<<<<<<<<
- * 
- *                 if line.strip() == "*MAT_PIECEWISE_LINEAR_PLASTICITY_TITLE" :
- */
-              __pyx_v_matsection1 = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":109
- *                         _Mesh.addMat(_matID, _rho, _E)
- *                     i=i+1
- *                 elif "*" in line:             # <<<<<<<<<<<<<<
- *                     matsection1 = False
- * 
- */
-            }
-            __pyx_L40:;
-
-            /* "cNK_FEMeshUtils\MeshReaders.py":112
- *                     matsection1 = False
- * 
- *                 if line.strip() == "*MAT_PIECEWISE_LINEAR_PLASTICITY_TITLE" :             # <<<<<<<<<<<<<<
- *                     # self.logger.debug("*MAT_PIECEWISE_LINEAR_PLASTICITY_TITLE Keyword Found")
- *                     matsection2 = True
- */
-            __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_line, __pyx_n_s_strip); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 112; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __Pyx_GOTREF(__pyx_t_1);
-            __pyx_t_5 = NULL;
-            if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_1))) {
-              __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_1);
-              if (likely(__pyx_t_5)) {
-                PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
-                __Pyx_INCREF(__pyx_t_5);
-                __Pyx_INCREF(function);
-                __Pyx_DECREF_SET(__pyx_t_1, function);
-              }
-            }
-            if (__pyx_t_5) {
-              __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_t_5); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 112; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-            } else {
-              __pyx_t_2 = __Pyx_PyObject_CallNoArg(__pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 112; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            }
-            __Pyx_GOTREF(__pyx_t_2);
-            __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-            __pyx_t_13 = (__Pyx_PyString_Equals(__pyx_t_2, __pyx_kp_s_MAT_PIECEWISE_LINEAR_PLASTICITY_2, Py_EQ)); if (unlikely(__pyx_t_13 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 112; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-            if (__pyx_t_13) {
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":114
- *                 if line.strip() == "*MAT_PIECEWISE_LINEAR_PLASTICITY_TITLE" :
- *                     # self.logger.debug("*MAT_PIECEWISE_LINEAR_PLASTICITY_TITLE Keyword Found")
- *                     matsection2 = True             # <<<<<<<<<<<<<<
- *                     i=0
- *                 elif (matsection2 == True) and (not("$" in line or "*" in line)):
- */
-              __pyx_v_matsection2 = 1;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":115
- *                     # self.logger.debug("*MAT_PIECEWISE_LINEAR_PLASTICITY_TITLE Keyword Found")
- *                     matsection2 = True
- *                     i=0             # <<<<<<<<<<<<<<
- *                 elif (matsection2 == True) and (not("$" in line or "*" in line)):
- *                     if i == 0: title=line.strip()
- */
-              __Pyx_INCREF(__pyx_int_0);
-              __Pyx_DECREF_SET(__pyx_v_i, __pyx_int_0);
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":112
- *                     matsection1 = False
- * 
- *                 if line.strip() == "*MAT_PIECEWISE_LINEAR_PLASTICITY_TITLE" :             # <<<<<<<<<<<<<<
- *                     # self.logger.debug("*MAT_PIECEWISE_LINEAR_PLASTICITY_TITLE Keyword Found")
- *                     matsection2 = True
- */
-              goto __pyx_L46;
-            }
-
-            /* "cNK_FEMeshUtils\MeshReaders.py":116
- *                     matsection2 = True
- *                     i=0
- *                 elif (matsection2 == True) and (not("$" in line or "*" in line)):             # <<<<<<<<<<<<<<
- *                     if i == 0: title=line.strip()
- *                     if i == 1:
- */
-            __pyx_t_14 = ((__pyx_v_matsection2 == 1) != 0);
-            if (__pyx_t_14) {
-            } else {
-              __pyx_t_13 = __pyx_t_14;
-              goto __pyx_L47_bool_binop_done;
-            }
-            __pyx_t_12 = (__Pyx_PySequence_ContainsTF(__pyx_kp_s_, __pyx_v_line, Py_EQ)); if (unlikely(__pyx_t_12 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 116; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __pyx_t_15 = (__pyx_t_12 != 0);
-            if (!__pyx_t_15) {
-            } else {
-              __pyx_t_14 = __pyx_t_15;
-              goto __pyx_L49_bool_binop_done;
-            }
-            __pyx_t_15 = (__Pyx_PySequence_ContainsTF(__pyx_kp_s__2, __pyx_v_line, Py_EQ)); if (unlikely(__pyx_t_15 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 116; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __pyx_t_12 = (__pyx_t_15 != 0);
-            __pyx_t_14 = __pyx_t_12;
-            __pyx_L49_bool_binop_done:;
-            __pyx_t_12 = ((!__pyx_t_14) != 0);
-            __pyx_t_13 = __pyx_t_12;
-            __pyx_L47_bool_binop_done:;
-            if (__pyx_t_13) {
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":117
- *                     i=0
- *                 elif (matsection2 == True) and (not("$" in line or "*" in line)):
- *                     if i == 0: title=line.strip()             # <<<<<<<<<<<<<<
- *                     if i == 1:
- *                         _matID=int(line[0:10])
- */
-              __pyx_t_2 = __Pyx_PyInt_EqObjC(__pyx_v_i, __pyx_int_0, 0, 0); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 117; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_2);
-              __pyx_t_13 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely(__pyx_t_13 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 117; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-              if (__pyx_t_13) {
-                __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_line, __pyx_n_s_strip); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 117; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_1);
-                __pyx_t_5 = NULL;
-                if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_1))) {
-                  __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_1);
-                  if (likely(__pyx_t_5)) {
-                    PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
-                    __Pyx_INCREF(__pyx_t_5);
-                    __Pyx_INCREF(function);
-                    __Pyx_DECREF_SET(__pyx_t_1, function);
-                  }
-                }
-                if (__pyx_t_5) {
-                  __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_t_5); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 117; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-                } else {
-                  __pyx_t_2 = __Pyx_PyObject_CallNoArg(__pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 117; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                }
-                __Pyx_GOTREF(__pyx_t_2);
-                __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-                __Pyx_XDECREF_SET(__pyx_v_title, __pyx_t_2);
-                __pyx_t_2 = 0;
-              }
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":118
- *                 elif (matsection2 == True) and (not("$" in line or "*" in line)):
- *                     if i == 0: title=line.strip()
- *                     if i == 1:             # <<<<<<<<<<<<<<
- *                         _matID=int(line[0:10])
- *                         _rho=float(line[11:20])
- */
-              __pyx_t_2 = __Pyx_PyInt_EqObjC(__pyx_v_i, __pyx_int_1, 1, 0); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 118; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_2);
-              __pyx_t_13 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely(__pyx_t_13 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 118; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-              if (__pyx_t_13) {
-
-                /* "cNK_FEMeshUtils\MeshReaders.py":119
- *                     if i == 0: title=line.strip()
- *                     if i == 1:
- *                         _matID=int(line[0:10])             # <<<<<<<<<<<<<<
- *                         _rho=float(line[11:20])
- *                         _E=float(line[21:30])
- */
-                __pyx_t_2 = __Pyx_PyObject_GetSlice(__pyx_v_line, 0, 10, NULL, NULL, &__pyx_slice__29, 1, 1, 1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 119; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_2);
-                __pyx_t_1 = PyNumber_Int(__pyx_t_2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 119; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_1);
-                __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-                __Pyx_XDECREF_SET(__pyx_v__matID, __pyx_t_1);
-                __pyx_t_1 = 0;
-
-                /* "cNK_FEMeshUtils\MeshReaders.py":120
- *                     if i == 1:
- *                         _matID=int(line[0:10])
- *                         _rho=float(line[11:20])             # <<<<<<<<<<<<<<
- *                         _E=float(line[21:30])
- *                         _Mesh.addMat(_matID, _rho, _E)
- */
-                __pyx_t_1 = __Pyx_PyObject_GetSlice(__pyx_v_line, 11, 20, NULL, NULL, &__pyx_slice__30, 1, 1, 1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 120; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_1);
-                __pyx_t_16 = __Pyx_PyObject_AsDouble(__pyx_t_1); if (unlikely(__pyx_t_16 == ((double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 120; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-                __pyx_v__rho = __pyx_t_16;
-
-                /* "cNK_FEMeshUtils\MeshReaders.py":121
- *                         _matID=int(line[0:10])
- *                         _rho=float(line[11:20])
- *                         _E=float(line[21:30])             # <<<<<<<<<<<<<<
- *                         _Mesh.addMat(_matID, _rho, _E)
- *                     i=i+1
- */
-                __pyx_t_1 = __Pyx_PyObject_GetSlice(__pyx_v_line, 21, 30, NULL, NULL, &__pyx_slice__31, 1, 1, 1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 121; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_1);
-                __pyx_t_16 = __Pyx_PyObject_AsDouble(__pyx_t_1); if (unlikely(__pyx_t_16 == ((double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 121; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-                __pyx_v__E = __pyx_t_16;
-
-                /* "cNK_FEMeshUtils\MeshReaders.py":122
- *                         _rho=float(line[11:20])
- *                         _E=float(line[21:30])
- *                         _Mesh.addMat(_matID, _rho, _E)             # <<<<<<<<<<<<<<
- *                     i=i+1
- *                 elif "*" in line:
- */
-                __pyx_t_20 = __Pyx_PyInt_As_int(__pyx_v__matID); if (unlikely((__pyx_t_20 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 122; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __pyx_t_1 = ((struct __pyx_vtabstruct_15cNK_FEMeshUtils_4Mesh_Mesh *)__pyx_v__Mesh->__pyx_vtab)->addMat(__pyx_v__Mesh, __pyx_t_20, __pyx_v__rho, __pyx_v__E, 0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 122; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_1);
-                __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-                /* "cNK_FEMeshUtils\MeshReaders.py":118
- *                 elif (matsection2 == True) and (not("$" in line or "*" in line)):
- *                     if i == 0: title=line.strip()
- *                     if i == 1:             # <<<<<<<<<<<<<<
- *                         _matID=int(line[0:10])
- *                         _rho=float(line[11:20])
- */
-              }
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":123
- *                         _E=float(line[21:30])
- *                         _Mesh.addMat(_matID, _rho, _E)
- *                     i=i+1             # <<<<<<<<<<<<<<
- *                 elif "*" in line:
- *                     matsection2 = False
- */
-              __pyx_t_1 = __Pyx_PyInt_AddObjC(__pyx_v_i, __pyx_int_1, 1, 0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 123; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_1);
-              __Pyx_DECREF_SET(__pyx_v_i, __pyx_t_1);
-              __pyx_t_1 = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":116
- *                     matsection2 = True
- *                     i=0
- *                 elif (matsection2 == True) and (not("$" in line or "*" in line)):             # <<<<<<<<<<<<<<
- *                     if i == 0: title=line.strip()
- *                     if i == 1:
- */
-              goto __pyx_L46;
-            }
-
-            /* "cNK_FEMeshUtils\MeshReaders.py":124
- *                         _Mesh.addMat(_matID, _rho, _E)
- *                     i=i+1
- *                 elif "*" in line:             # <<<<<<<<<<<<<<
- *                     matsection2 = False
- * 
- */
-            __pyx_t_13 = (__Pyx_PySequence_ContainsTF(__pyx_kp_s__2, __pyx_v_line, Py_EQ)); if (unlikely(__pyx_t_13 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 124; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __pyx_t_12 = (__pyx_t_13 != 0);
-            if (__pyx_t_12) {
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":125
- *                     i=i+1
- *                 elif "*" in line:
- *                     matsection2 = False             # <<<<<<<<<<<<<<
- * 
- *                 if line.strip() == "*SECTION_SHELL":
- */
-              __pyx_v_matsection2 = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":124
- *                         _Mesh.addMat(_matID, _rho, _E)
- *                     i=i+1
- *                 elif "*" in line:             # <<<<<<<<<<<<<<
- *                     matsection2 = False
- * 
- */
-            }
-            __pyx_L46:;
-
-            /* "cNK_FEMeshUtils\MeshReaders.py":127
- *                     matsection2 = False
- * 
- *                 if line.strip() == "*SECTION_SHELL":             # <<<<<<<<<<<<<<
- *                     # self.logger.debug("*SECTION_SHELL Keyword Found")
- *                     propsection1 = True
- */
-            __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_line, __pyx_n_s_strip); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 127; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __Pyx_GOTREF(__pyx_t_2);
-            __pyx_t_5 = NULL;
-            if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_2))) {
-              __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_2);
-              if (likely(__pyx_t_5)) {
-                PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
-                __Pyx_INCREF(__pyx_t_5);
-                __Pyx_INCREF(function);
-                __Pyx_DECREF_SET(__pyx_t_2, function);
-              }
-            }
-            if (__pyx_t_5) {
-              __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_5); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 127; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-            } else {
-              __pyx_t_1 = __Pyx_PyObject_CallNoArg(__pyx_t_2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 127; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            }
-            __Pyx_GOTREF(__pyx_t_1);
-            __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-            __pyx_t_12 = (__Pyx_PyString_Equals(__pyx_t_1, __pyx_kp_s_SECTION_SHELL, Py_EQ)); if (unlikely(__pyx_t_12 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 127; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-            if (__pyx_t_12) {
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":129
- *                 if line.strip() == "*SECTION_SHELL":
- *                     # self.logger.debug("*SECTION_SHELL Keyword Found")
- *                     propsection1 = True             # <<<<<<<<<<<<<<
- *                     i=0
- *                 elif (propsection1 == True) and (not("$" in line or "*" in line)):
- */
-              __pyx_v_propsection1 = 1;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":130
- *                     # self.logger.debug("*SECTION_SHELL Keyword Found")
- *                     propsection1 = True
- *                     i=0             # <<<<<<<<<<<<<<
- *                 elif (propsection1 == True) and (not("$" in line or "*" in line)):
- *                     if i == 0:
- */
-              __Pyx_INCREF(__pyx_int_0);
-              __Pyx_DECREF_SET(__pyx_v_i, __pyx_int_0);
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":127
- *                     matsection2 = False
- * 
- *                 if line.strip() == "*SECTION_SHELL":             # <<<<<<<<<<<<<<
- *                     # self.logger.debug("*SECTION_SHELL Keyword Found")
- *                     propsection1 = True
- */
-              goto __pyx_L53;
-            }
-
-            /* "cNK_FEMeshUtils\MeshReaders.py":131
- *                     propsection1 = True
- *                     i=0
- *                 elif (propsection1 == True) and (not("$" in line or "*" in line)):             # <<<<<<<<<<<<<<
- *                     if i == 0:
- *                         _propID=int(line[0:10])
- */
-            __pyx_t_13 = ((__pyx_v_propsection1 == 1) != 0);
-            if (__pyx_t_13) {
-            } else {
-              __pyx_t_12 = __pyx_t_13;
-              goto __pyx_L54_bool_binop_done;
-            }
-            __pyx_t_14 = (__Pyx_PySequence_ContainsTF(__pyx_kp_s_, __pyx_v_line, Py_EQ)); if (unlikely(__pyx_t_14 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 131; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __pyx_t_15 = (__pyx_t_14 != 0);
-            if (!__pyx_t_15) {
-            } else {
-              __pyx_t_13 = __pyx_t_15;
-              goto __pyx_L56_bool_binop_done;
-            }
-            __pyx_t_15 = (__Pyx_PySequence_ContainsTF(__pyx_kp_s__2, __pyx_v_line, Py_EQ)); if (unlikely(__pyx_t_15 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 131; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __pyx_t_14 = (__pyx_t_15 != 0);
-            __pyx_t_13 = __pyx_t_14;
-            __pyx_L56_bool_binop_done:;
-            __pyx_t_14 = ((!__pyx_t_13) != 0);
-            __pyx_t_12 = __pyx_t_14;
-            __pyx_L54_bool_binop_done:;
-            if (__pyx_t_12) {
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":132
- *                     i=0
- *                 elif (propsection1 == True) and (not("$" in line or "*" in line)):
- *                     if i == 0:             # <<<<<<<<<<<<<<
- *                         _propID=int(line[0:10])
- *                     if i == 1:
- */
-              __pyx_t_1 = __Pyx_PyInt_EqObjC(__pyx_v_i, __pyx_int_0, 0, 0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 132; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_1);
-              __pyx_t_12 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_12 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 132; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-              if (__pyx_t_12) {
-
-                /* "cNK_FEMeshUtils\MeshReaders.py":133
- *                 elif (propsection1 == True) and (not("$" in line or "*" in line)):
- *                     if i == 0:
- *                         _propID=int(line[0:10])             # <<<<<<<<<<<<<<
- *                     if i == 1:
- *                         _thick=float(line[0:10])
- */
-                __pyx_t_1 = __Pyx_PyObject_GetSlice(__pyx_v_line, 0, 10, NULL, NULL, &__pyx_slice__32, 1, 1, 1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 133; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_1);
-                __pyx_t_2 = PyNumber_Int(__pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 133; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_2);
-                __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-                __Pyx_XDECREF_SET(__pyx_v__propID, __pyx_t_2);
-                __pyx_t_2 = 0;
-
-                /* "cNK_FEMeshUtils\MeshReaders.py":132
- *                     i=0
- *                 elif (propsection1 == True) and (not("$" in line or "*" in line)):
- *                     if i == 0:             # <<<<<<<<<<<<<<
- *                         _propID=int(line[0:10])
- *                     if i == 1:
- */
-              }
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":134
- *                     if i == 0:
- *                         _propID=int(line[0:10])
- *                     if i == 1:             # <<<<<<<<<<<<<<
- *                         _thick=float(line[0:10])
- *                         _Mesh.addProp(_propID, _thick)
- */
-              __pyx_t_2 = __Pyx_PyInt_EqObjC(__pyx_v_i, __pyx_int_1, 1, 0); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 134; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_2);
-              __pyx_t_12 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely(__pyx_t_12 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 134; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-              if (__pyx_t_12) {
-
-                /* "cNK_FEMeshUtils\MeshReaders.py":135
- *                         _propID=int(line[0:10])
- *                     if i == 1:
- *                         _thick=float(line[0:10])             # <<<<<<<<<<<<<<
- *                         _Mesh.addProp(_propID, _thick)
- *                     i=i+1
- */
-                __pyx_t_2 = __Pyx_PyObject_GetSlice(__pyx_v_line, 0, 10, NULL, NULL, &__pyx_slice__33, 1, 1, 1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 135; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_2);
-                __pyx_t_16 = __Pyx_PyObject_AsDouble(__pyx_t_2); if (unlikely(__pyx_t_16 == ((double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 135; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-                __pyx_v__thick = __pyx_t_16;
-
-                /* "cNK_FEMeshUtils\MeshReaders.py":136
- *                     if i == 1:
- *                         _thick=float(line[0:10])
- *                         _Mesh.addProp(_propID, _thick)             # <<<<<<<<<<<<<<
- *                     i=i+1
- *                 elif "*" in line:
- */
-                if (unlikely(!__pyx_v__propID)) { __Pyx_RaiseUnboundLocalError("_propID"); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 136; __pyx_clineno = __LINE__; goto __pyx_L7_error;} }
-                __pyx_t_20 = __Pyx_PyInt_As_int(__pyx_v__propID); if (unlikely((__pyx_t_20 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 136; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __pyx_t_2 = ((struct __pyx_vtabstruct_15cNK_FEMeshUtils_4Mesh_Mesh *)__pyx_v__Mesh->__pyx_vtab)->addProp(__pyx_v__Mesh, __pyx_t_20, __pyx_v__thick, 0); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 136; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_2);
-                __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-                /* "cNK_FEMeshUtils\MeshReaders.py":134
- *                     if i == 0:
- *                         _propID=int(line[0:10])
- *                     if i == 1:             # <<<<<<<<<<<<<<
- *                         _thick=float(line[0:10])
- *                         _Mesh.addProp(_propID, _thick)
- */
-              }
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":137
- *                         _thick=float(line[0:10])
- *                         _Mesh.addProp(_propID, _thick)
- *                     i=i+1             # <<<<<<<<<<<<<<
- *                 elif "*" in line:
- *                     propsection1 = False
- */
-              __pyx_t_2 = __Pyx_PyInt_AddObjC(__pyx_v_i, __pyx_int_1, 1, 0); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 137; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_2);
-              __Pyx_DECREF_SET(__pyx_v_i, __pyx_t_2);
-              __pyx_t_2 = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":131
- *                     propsection1 = True
- *                     i=0
- *                 elif (propsection1 == True) and (not("$" in line or "*" in line)):             # <<<<<<<<<<<<<<
- *                     if i == 0:
- *                         _propID=int(line[0:10])
- */
-              goto __pyx_L53;
-            }
-
-            /* "cNK_FEMeshUtils\MeshReaders.py":138
- *                         _Mesh.addProp(_propID, _thick)
- *                     i=i+1
- *                 elif "*" in line:             # <<<<<<<<<<<<<<
- *                     propsection1 = False
- * 
- */
-            __pyx_t_12 = (__Pyx_PySequence_ContainsTF(__pyx_kp_s__2, __pyx_v_line, Py_EQ)); if (unlikely(__pyx_t_12 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 138; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __pyx_t_14 = (__pyx_t_12 != 0);
-            if (__pyx_t_14) {
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":139
- *                     i=i+1
- *                 elif "*" in line:
- *                     propsection1 = False             # <<<<<<<<<<<<<<
- * 
- *                 if line.strip() == "*SECTION_SHELL_TITLE":
- */
-              __pyx_v_propsection1 = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":138
- *                         _Mesh.addProp(_propID, _thick)
- *                     i=i+1
- *                 elif "*" in line:             # <<<<<<<<<<<<<<
- *                     propsection1 = False
- * 
- */
-            }
-            __pyx_L53:;
-
-            /* "cNK_FEMeshUtils\MeshReaders.py":141
- *                     propsection1 = False
- * 
- *                 if line.strip() == "*SECTION_SHELL_TITLE":             # <<<<<<<<<<<<<<
- *                     # # self.logger.debug("*SECTION_SHELL_TITLE Keyword Found")
- *                     propsection2 = True
- */
-            __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_line, __pyx_n_s_strip); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 141; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __Pyx_GOTREF(__pyx_t_1);
-            __pyx_t_5 = NULL;
-            if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_1))) {
-              __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_1);
-              if (likely(__pyx_t_5)) {
-                PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
-                __Pyx_INCREF(__pyx_t_5);
-                __Pyx_INCREF(function);
-                __Pyx_DECREF_SET(__pyx_t_1, function);
-              }
-            }
-            if (__pyx_t_5) {
-              __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_t_5); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 141; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-            } else {
-              __pyx_t_2 = __Pyx_PyObject_CallNoArg(__pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 141; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            }
-            __Pyx_GOTREF(__pyx_t_2);
-            __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-            __pyx_t_14 = (__Pyx_PyString_Equals(__pyx_t_2, __pyx_kp_s_SECTION_SHELL_TITLE, Py_EQ)); if (unlikely(__pyx_t_14 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 141; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-            if (__pyx_t_14) {
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":143
- *                 if line.strip() == "*SECTION_SHELL_TITLE":
- *                     # # self.logger.debug("*SECTION_SHELL_TITLE Keyword Found")
- *                     propsection2 = True             # <<<<<<<<<<<<<<
- *                     i=0
- *                 elif (propsection2 == True) and (not("$" in line or "*" in line)):
- */
-              __pyx_v_propsection2 = 1;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":144
- *                     # # self.logger.debug("*SECTION_SHELL_TITLE Keyword Found")
- *                     propsection2 = True
- *                     i=0             # <<<<<<<<<<<<<<
- *                 elif (propsection2 == True) and (not("$" in line or "*" in line)):
- *                     if i == 0: _title=line.strip()
- */
-              __Pyx_INCREF(__pyx_int_0);
-              __Pyx_DECREF_SET(__pyx_v_i, __pyx_int_0);
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":141
- *                     propsection1 = False
- * 
- *                 if line.strip() == "*SECTION_SHELL_TITLE":             # <<<<<<<<<<<<<<
- *                     # # self.logger.debug("*SECTION_SHELL_TITLE Keyword Found")
- *                     propsection2 = True
- */
-              goto __pyx_L60;
-            }
-
-            /* "cNK_FEMeshUtils\MeshReaders.py":145
- *                     propsection2 = True
- *                     i=0
- *                 elif (propsection2 == True) and (not("$" in line or "*" in line)):             # <<<<<<<<<<<<<<
- *                     if i == 0: _title=line.strip()
- *                     if i == 1: _propID=int(line[0:10])
- */
-            __pyx_t_12 = ((__pyx_v_propsection2 == 1) != 0);
-            if (__pyx_t_12) {
-            } else {
-              __pyx_t_14 = __pyx_t_12;
-              goto __pyx_L61_bool_binop_done;
-            }
-            __pyx_t_13 = (__Pyx_PySequence_ContainsTF(__pyx_kp_s_, __pyx_v_line, Py_EQ)); if (unlikely(__pyx_t_13 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 145; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __pyx_t_15 = (__pyx_t_13 != 0);
-            if (!__pyx_t_15) {
-            } else {
-              __pyx_t_12 = __pyx_t_15;
-              goto __pyx_L63_bool_binop_done;
-            }
-            __pyx_t_15 = (__Pyx_PySequence_ContainsTF(__pyx_kp_s__2, __pyx_v_line, Py_EQ)); if (unlikely(__pyx_t_15 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 145; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __pyx_t_13 = (__pyx_t_15 != 0);
-            __pyx_t_12 = __pyx_t_13;
-            __pyx_L63_bool_binop_done:;
-            __pyx_t_13 = ((!__pyx_t_12) != 0);
-            __pyx_t_14 = __pyx_t_13;
-            __pyx_L61_bool_binop_done:;
-            if (__pyx_t_14) {
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":146
- *                     i=0
- *                 elif (propsection2 == True) and (not("$" in line or "*" in line)):
- *                     if i == 0: _title=line.strip()             # <<<<<<<<<<<<<<
- *                     if i == 1: _propID=int(line[0:10])
- *                     if i == 2:
- */
-              __pyx_t_2 = __Pyx_PyInt_EqObjC(__pyx_v_i, __pyx_int_0, 0, 0); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 146; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_2);
-              __pyx_t_14 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely(__pyx_t_14 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 146; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-              if (__pyx_t_14) {
-                __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_line, __pyx_n_s_strip); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 146; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_1);
-                __pyx_t_5 = NULL;
-                if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_1))) {
-                  __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_1);
-                  if (likely(__pyx_t_5)) {
-                    PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
-                    __Pyx_INCREF(__pyx_t_5);
-                    __Pyx_INCREF(function);
-                    __Pyx_DECREF_SET(__pyx_t_1, function);
-                  }
-                }
-                if (__pyx_t_5) {
-                  __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_t_5); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 146; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-                } else {
-                  __pyx_t_2 = __Pyx_PyObject_CallNoArg(__pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 146; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                }
-                __Pyx_GOTREF(__pyx_t_2);
-                __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-                __Pyx_XDECREF_SET(__pyx_v__title, __pyx_t_2);
-                __pyx_t_2 = 0;
-              }
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":147
- *                 elif (propsection2 == True) and (not("$" in line or "*" in line)):
- *                     if i == 0: _title=line.strip()
- *                     if i == 1: _propID=int(line[0:10])             # <<<<<<<<<<<<<<
- *                     if i == 2:
- *                         _thick=float(line[0:10])
- */
-              __pyx_t_2 = __Pyx_PyInt_EqObjC(__pyx_v_i, __pyx_int_1, 1, 0); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 147; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_2);
-              __pyx_t_14 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely(__pyx_t_14 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 147; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-              if (__pyx_t_14) {
-                __pyx_t_2 = __Pyx_PyObject_GetSlice(__pyx_v_line, 0, 10, NULL, NULL, &__pyx_slice__34, 1, 1, 1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 147; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_2);
-                __pyx_t_1 = PyNumber_Int(__pyx_t_2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 147; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_1);
-                __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-                __Pyx_XDECREF_SET(__pyx_v__propID, __pyx_t_1);
-                __pyx_t_1 = 0;
-              }
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":148
- *                     if i == 0: _title=line.strip()
- *                     if i == 1: _propID=int(line[0:10])
- *                     if i == 2:             # <<<<<<<<<<<<<<
- *                         _thick=float(line[0:10])
- *                         _Mesh.addProp(_propID, _thick)
- */
-              __pyx_t_1 = __Pyx_PyInt_EqObjC(__pyx_v_i, __pyx_int_2, 2, 0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 148; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_1);
-              __pyx_t_14 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_14 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 148; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-              if (__pyx_t_14) {
-
-                /* "cNK_FEMeshUtils\MeshReaders.py":149
- *                     if i == 1: _propID=int(line[0:10])
- *                     if i == 2:
- *                         _thick=float(line[0:10])             # <<<<<<<<<<<<<<
- *                         _Mesh.addProp(_propID, _thick)
- *                     i=i+1
- */
-                __pyx_t_1 = __Pyx_PyObject_GetSlice(__pyx_v_line, 0, 10, NULL, NULL, &__pyx_slice__35, 1, 1, 1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 149; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_1);
-                __pyx_t_16 = __Pyx_PyObject_AsDouble(__pyx_t_1); if (unlikely(__pyx_t_16 == ((double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 149; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-                __pyx_v__thick = __pyx_t_16;
-
-                /* "cNK_FEMeshUtils\MeshReaders.py":150
- *                     if i == 2:
- *                         _thick=float(line[0:10])
- *                         _Mesh.addProp(_propID, _thick)             # <<<<<<<<<<<<<<
- *                     i=i+1
- *                 elif "*" in line:
- */
-                if (unlikely(!__pyx_v__propID)) { __Pyx_RaiseUnboundLocalError("_propID"); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 150; __pyx_clineno = __LINE__; goto __pyx_L7_error;} }
-                __pyx_t_20 = __Pyx_PyInt_As_int(__pyx_v__propID); if (unlikely((__pyx_t_20 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 150; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __pyx_t_1 = ((struct __pyx_vtabstruct_15cNK_FEMeshUtils_4Mesh_Mesh *)__pyx_v__Mesh->__pyx_vtab)->addProp(__pyx_v__Mesh, __pyx_t_20, __pyx_v__thick, 0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 150; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_1);
-                __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-                /* "cNK_FEMeshUtils\MeshReaders.py":148
- *                     if i == 0: _title=line.strip()
- *                     if i == 1: _propID=int(line[0:10])
- *                     if i == 2:             # <<<<<<<<<<<<<<
- *                         _thick=float(line[0:10])
- *                         _Mesh.addProp(_propID, _thick)
- */
-              }
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":151
- *                         _thick=float(line[0:10])
- *                         _Mesh.addProp(_propID, _thick)
- *                     i=i+1             # <<<<<<<<<<<<<<
- *                 elif "*" in line:
- *                     propsection2 = False
- */
-              __pyx_t_1 = __Pyx_PyInt_AddObjC(__pyx_v_i, __pyx_int_1, 1, 0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 151; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_1);
-              __Pyx_DECREF_SET(__pyx_v_i, __pyx_t_1);
-              __pyx_t_1 = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":145
- *                     propsection2 = True
- *                     i=0
- *                 elif (propsection2 == True) and (not("$" in line or "*" in line)):             # <<<<<<<<<<<<<<
- *                     if i == 0: _title=line.strip()
- *                     if i == 1: _propID=int(line[0:10])
- */
-              goto __pyx_L60;
-            }
-
-            /* "cNK_FEMeshUtils\MeshReaders.py":152
- *                         _Mesh.addProp(_propID, _thick)
- *                     i=i+1
- *                 elif "*" in line:             # <<<<<<<<<<<<<<
- *                     propsection2 = False
- *         # self.logger.info("LS-Dyna Mesh successfully read")
- */
-            __pyx_t_14 = (__Pyx_PySequence_ContainsTF(__pyx_kp_s__2, __pyx_v_line, Py_EQ)); if (unlikely(__pyx_t_14 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 152; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __pyx_t_13 = (__pyx_t_14 != 0);
-            if (__pyx_t_13) {
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":153
- *                     i=i+1
- *                 elif "*" in line:
- *                     propsection2 = False             # <<<<<<<<<<<<<<
- *         # self.logger.info("LS-Dyna Mesh successfully read")
- *         # self.logger.info("Number of Nodes: "+str(len(_Mesh.Nodelist)))
- */
-              __pyx_v_propsection2 = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":152
- *                         _Mesh.addProp(_propID, _thick)
- *                     i=i+1
- *                 elif "*" in line:             # <<<<<<<<<<<<<<
- *                     propsection2 = False
- *         # self.logger.info("LS-Dyna Mesh successfully read")
- */
-            }
-            __pyx_L60:;
-
-            /* "cNK_FEMeshUtils\MeshReaders.py":28
- * 
- *         with open(file, "r") as f:
- *             for line in f:             # <<<<<<<<<<<<<<
- *                 # if "*KEYWORD" in line:
- *                     # self.logger.debug("*KEYWORD found")
- */
-          }
-          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-
-          /* "cNK_FEMeshUtils\MeshReaders.py":27
- *         _Mesh=Mesh(file,"LS-Dyna")
- * 
- *         with open(file, "r") as f:             # <<<<<<<<<<<<<<
- *             for line in f:
- *                 # if "*KEYWORD" in line:
- */
-        }
-        __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
-        __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
-        __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
-        goto __pyx_L14_try_end;
-        __pyx_L7_error:;
-        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-        __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-        __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-        __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
-        __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-        /*except:*/ {
-          __Pyx_AddTraceback("cNK_FEMeshUtils.MeshReaders.MeshReaders.readDynaMesh", __pyx_clineno, __pyx_lineno, __pyx_filename);
-          if (__Pyx_GetException(&__pyx_t_3, &__pyx_t_1, &__pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 27; __pyx_clineno = __LINE__; goto __pyx_L9_except_error;}
-          __Pyx_GOTREF(__pyx_t_3);
-          __Pyx_GOTREF(__pyx_t_1);
-          __Pyx_GOTREF(__pyx_t_2);
-          __pyx_t_5 = PyTuple_Pack(3, __pyx_t_3, __pyx_t_1, __pyx_t_2); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 27; __pyx_clineno = __LINE__; goto __pyx_L9_except_error;}
-          __Pyx_GOTREF(__pyx_t_5);
-          __pyx_t_21 = __Pyx_PyObject_Call(__pyx_t_6, __pyx_t_5, NULL);
-          __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-          __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-          if (unlikely(!__pyx_t_21)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 27; __pyx_clineno = __LINE__; goto __pyx_L9_except_error;}
-          __Pyx_GOTREF(__pyx_t_21);
-          __pyx_t_13 = __Pyx_PyObject_IsTrue(__pyx_t_21);
-          __Pyx_DECREF(__pyx_t_21); __pyx_t_21 = 0;
-          if (__pyx_t_13 < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 27; __pyx_clineno = __LINE__; goto __pyx_L9_except_error;}
-          __pyx_t_14 = ((!(__pyx_t_13 != 0)) != 0);
-          if (__pyx_t_14) {
-            __Pyx_GIVEREF(__pyx_t_3);
-            __Pyx_GIVEREF(__pyx_t_1);
-            __Pyx_XGIVEREF(__pyx_t_2);
-            __Pyx_ErrRestore(__pyx_t_3, __pyx_t_1, __pyx_t_2);
-            __pyx_t_3 = 0; __pyx_t_1 = 0; __pyx_t_2 = 0; 
-            {__pyx_filename = __pyx_f[0]; __pyx_lineno = 27; __pyx_clineno = __LINE__; goto __pyx_L9_except_error;}
-          }
-          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-          __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-          __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-          goto __pyx_L8_exception_handled;
-        }
-        __pyx_L9_except_error:;
-        __Pyx_XGIVEREF(__pyx_t_7);
-        __Pyx_XGIVEREF(__pyx_t_8);
-        __Pyx_XGIVEREF(__pyx_t_9);
-        __Pyx_ExceptionReset(__pyx_t_7, __pyx_t_8, __pyx_t_9);
-        goto __pyx_L1_error;
-        __pyx_L8_exception_handled:;
-        __Pyx_XGIVEREF(__pyx_t_7);
-        __Pyx_XGIVEREF(__pyx_t_8);
-        __Pyx_XGIVEREF(__pyx_t_9);
-        __Pyx_ExceptionReset(__pyx_t_7, __pyx_t_8, __pyx_t_9);
-        __pyx_L14_try_end:;
-      }
-    }
-    /*finally:*/ {
-      /*normal exit:*/{
-        if (__pyx_t_6) {
-          __pyx_t_9 = __Pyx_PyObject_Call(__pyx_t_6, __pyx_tuple__36, NULL);
-          __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-          if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 27; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-          __Pyx_GOTREF(__pyx_t_9);
-          __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-        }
-        goto __pyx_L6;
-      }
-      __pyx_L6:;
-    }
-    goto __pyx_L71;
-    __pyx_L3_error:;
-    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    goto __pyx_L1_error;
-    __pyx_L71:;
-  }
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":162
- *         # self.logger.info("Number of EThck: "+str(len(_Mesh.Elementalthickness)))
- *         # self.logger.info("Number of NThck: "+str(len(_Mesh.Nodalthickness)))
- *         return _Mesh             # <<<<<<<<<<<<<<
- * 
- *     def readRadiossMesh(self, file):
- */
-  __Pyx_XDECREF(((PyObject *)__pyx_r));
-  __Pyx_INCREF(((PyObject *)__pyx_v__Mesh));
-  __pyx_r = __pyx_v__Mesh;
-  goto __pyx_L0;
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":12
- * 
- * class MeshReaders:
- *     def readDynaMesh(self, file):             # <<<<<<<<<<<<<<
- *         nodesection = False
- *         elemsection = False
- */
-
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_AddTraceback("cNK_FEMeshUtils.MeshReaders.MeshReaders.readDynaMesh", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_i);
-  __Pyx_XDECREF((PyObject *)__pyx_v__Mesh);
-  __Pyx_XDECREF(__pyx_v_f);
-  __Pyx_XDECREF(__pyx_v_line);
-  __Pyx_XDECREF(__pyx_v__nodeID);
-  __Pyx_XDECREF(__pyx_v__elID);
-  __Pyx_XDECREF(__pyx_v__partID);
-  __Pyx_XDECREF(__pyx_v__n1);
-  __Pyx_XDECREF(__pyx_v__n2);
-  __Pyx_XDECREF(__pyx_v__n3);
-  __Pyx_XDECREF(__pyx_v__n4);
-  __Pyx_XDECREF(__pyx_v__title);
-  __Pyx_XDECREF(__pyx_v__propID);
-  __Pyx_XDECREF(__pyx_v__matID);
-  __Pyx_XDECREF(__pyx_v_title);
-  __Pyx_XGIVEREF((PyObject *)__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* Python wrapper */
-static PyObject *__pyx_pw_15cNK_FEMeshUtils_11MeshReaders_11MeshReaders_1readDynaMesh(PyObject *__pyx_v_self, PyObject *__pyx_v_file); /*proto*/
-static PyObject *__pyx_pw_15cNK_FEMeshUtils_11MeshReaders_11MeshReaders_1readDynaMesh(PyObject *__pyx_v_self, PyObject *__pyx_v_file) {
-  CYTHON_UNUSED int __pyx_lineno = 0;
-  CYTHON_UNUSED const char *__pyx_filename = NULL;
-  CYTHON_UNUSED int __pyx_clineno = 0;
-  PyObject *__pyx_r = 0;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("readDynaMesh (wrapper)", 0);
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_file), (&PyString_Type), 1, "file", 1))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 12; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_r = __pyx_pf_15cNK_FEMeshUtils_11MeshReaders_11MeshReaders_readDynaMesh(((struct __pyx_obj_15cNK_FEMeshUtils_11MeshReaders_MeshReaders *)__pyx_v_self), ((PyObject*)__pyx_v_file));
-
-  /* function exit code */
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-static PyObject *__pyx_pf_15cNK_FEMeshUtils_11MeshReaders_11MeshReaders_readDynaMesh(struct __pyx_obj_15cNK_FEMeshUtils_11MeshReaders_MeshReaders *__pyx_v_self, PyObject *__pyx_v_file) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("readDynaMesh", 0);
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = ((PyObject *)__pyx_f_15cNK_FEMeshUtils_11MeshReaders_11MeshReaders_readDynaMesh(__pyx_v_self, __pyx_v_file, 1)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 12; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("cNK_FEMeshUtils.MeshReaders.MeshReaders.readDynaMesh", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "cNK_FEMeshUtils\MeshReaders.py":164
- *         return _Mesh
- * 
- *     def readRadiossMesh(self, file):             # <<<<<<<<<<<<<<
- *         nodesection = False
- *         SH3Nsection = False
- */
-
-static PyObject *__pyx_pw_15cNK_FEMeshUtils_11MeshReaders_11MeshReaders_3readRadiossMesh(PyObject *__pyx_v_self, PyObject *__pyx_v_file); /*proto*/
-static struct __pyx_obj_15cNK_FEMeshUtils_4Mesh_Mesh *__pyx_f_15cNK_FEMeshUtils_11MeshReaders_11MeshReaders_readRadiossMesh(CYTHON_UNUSED struct __pyx_obj_15cNK_FEMeshUtils_11MeshReaders_MeshReaders *__pyx_v_self, PyObject *__pyx_v_file, int __pyx_skip_dispatch) {
-  int __pyx_v_nodesection;
-  int __pyx_v_SH3Nsection;
-  int __pyx_v_SHELLsection;
-  int __pyx_v_partsection;
-  int __pyx_v_matsection;
-  int __pyx_v_propsection;
-  PyObject *__pyx_v_i = NULL;
-  struct __pyx_obj_15cNK_FEMeshUtils_4Mesh_Mesh *__pyx_v__Mesh = NULL;
-  PyObject *__pyx_v_f = NULL;
-  PyObject *__pyx_v_line = NULL;
-  PyObject *__pyx_v__nodeID = NULL;
-  double __pyx_v__x;
-  double __pyx_v__y;
-  double __pyx_v__z;
-  PyObject *__pyx_v__partid = NULL;
-  PyObject *__pyx_v__elID = NULL;
-  PyObject *__pyx_v__n1 = NULL;
-  PyObject *__pyx_v__n2 = NULL;
-  PyObject *__pyx_v__n3 = NULL;
-  PyObject *__pyx_v__n4 = NULL;
-  double __pyx_v__elthick;
-  PyObject *__pyx_v__title = NULL;
-  PyObject *__pyx_v__propID = NULL;
-  PyObject *__pyx_v__matID = NULL;
-  double __pyx_v__rho;
-  double __pyx_v__E;
-  double __pyx_v__thick;
-  struct __pyx_obj_15cNK_FEMeshUtils_4Mesh_Mesh *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
-  PyObject *__pyx_t_6 = NULL;
-  PyObject *__pyx_t_7 = NULL;
-  PyObject *__pyx_t_8 = NULL;
-  PyObject *__pyx_t_9 = NULL;
-  Py_ssize_t __pyx_t_10;
-  PyObject *(*__pyx_t_11)(PyObject *);
-  int __pyx_t_12;
-  int __pyx_t_13;
-  int __pyx_t_14;
-  int __pyx_t_15;
-  double __pyx_t_16;
-  int __pyx_t_17;
-  Py_ssize_t __pyx_t_18;
-  PyObject *__pyx_t_19 = NULL;
-  PyObject *__pyx_t_20 = NULL;
-  PyObject *__pyx_t_21 = NULL;
-  int __pyx_t_22;
-  int __pyx_t_23;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("readRadiossMesh", 0);
-  /* Check if called by wrapper */
-  if (unlikely(__pyx_skip_dispatch)) ;
-  /* Check if overridden in Python */
-  else if (unlikely(Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0)) {
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_readRadiossMesh); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 164; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)__pyx_pw_15cNK_FEMeshUtils_11MeshReaders_11MeshReaders_3readRadiossMesh)) {
-      __Pyx_XDECREF(((PyObject *)__pyx_r));
-      __Pyx_INCREF(__pyx_t_1);
-      __pyx_t_3 = __pyx_t_1; __pyx_t_4 = NULL;
-      if (CYTHON_COMPILING_IN_CPYTHON && unlikely(PyMethod_Check(__pyx_t_3))) {
-        __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
-        if (likely(__pyx_t_4)) {
-          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-          __Pyx_INCREF(__pyx_t_4);
-          __Pyx_INCREF(function);
-          __Pyx_DECREF_SET(__pyx_t_3, function);
-        }
-      }
-      if (!__pyx_t_4) {
-        __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_v_file); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 164; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __Pyx_GOTREF(__pyx_t_2);
-      } else {
-        __pyx_t_5 = PyTuple_New(1+1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 164; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __Pyx_GOTREF(__pyx_t_5);
-        __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_4); __pyx_t_4 = NULL;
-        __Pyx_INCREF(__pyx_v_file);
-        __Pyx_GIVEREF(__pyx_v_file);
-        PyTuple_SET_ITEM(__pyx_t_5, 0+1, __pyx_v_file);
-        __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_5, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 164; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __Pyx_GOTREF(__pyx_t_2);
-        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      }
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      if (!(likely(((__pyx_t_2) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_2, __pyx_ptype_15cNK_FEMeshUtils_4Mesh_Mesh))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 164; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __pyx_r = ((struct __pyx_obj_15cNK_FEMeshUtils_4Mesh_Mesh *)__pyx_t_2);
-      __pyx_t_2 = 0;
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      goto __pyx_L0;
-    }
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  }
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":165
- * 
- *     def readRadiossMesh(self, file):
- *         nodesection = False             # <<<<<<<<<<<<<<
- *         SH3Nsection = False
- *         SHELLsection = False
- */
-  __pyx_v_nodesection = 0;
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":166
- *     def readRadiossMesh(self, file):
- *         nodesection = False
- *         SH3Nsection = False             # <<<<<<<<<<<<<<
- *         SHELLsection = False
- *         partsection = False
- */
-  __pyx_v_SH3Nsection = 0;
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":167
- *         nodesection = False
- *         SH3Nsection = False
- *         SHELLsection = False             # <<<<<<<<<<<<<<
- *         partsection = False
- *         matsection = False
- */
-  __pyx_v_SHELLsection = 0;
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":168
- *         SH3Nsection = False
- *         SHELLsection = False
- *         partsection = False             # <<<<<<<<<<<<<<
- *         matsection = False
- *         propsection = False
- */
-  __pyx_v_partsection = 0;
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":169
- *         SHELLsection = False
- *         partsection = False
- *         matsection = False             # <<<<<<<<<<<<<<
- *         propsection = False
- * 
- */
-  __pyx_v_matsection = 0;
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":170
- *         partsection = False
- *         matsection = False
- *         propsection = False             # <<<<<<<<<<<<<<
- * 
- *         i=0
- */
-  __pyx_v_propsection = 0;
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":172
- *         propsection = False
- * 
- *         i=0             # <<<<<<<<<<<<<<
- *         # self.logger.info("Radioss Reader Started: "+file)
- * 
- */
-  __Pyx_INCREF(__pyx_int_0);
-  __pyx_v_i = __pyx_int_0;
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":175
- *         # self.logger.info("Radioss Reader Started: "+file)
- * 
- *         _Mesh=Mesh(file,"Radioss")             # <<<<<<<<<<<<<<
- * 
- *         with open(file, "r") as f:
- */
-  __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 175; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_INCREF(__pyx_v_file);
-  __Pyx_GIVEREF(__pyx_v_file);
-  PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_file);
-  __Pyx_INCREF(__pyx_n_s_Radioss);
-  __Pyx_GIVEREF(__pyx_n_s_Radioss);
-  PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_n_s_Radioss);
-  __pyx_t_2 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_15cNK_FEMeshUtils_4Mesh_Mesh), __pyx_t_1, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 175; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_v__Mesh = ((struct __pyx_obj_15cNK_FEMeshUtils_4Mesh_Mesh *)__pyx_t_2);
-  __pyx_t_2 = 0;
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":177
- *         _Mesh=Mesh(file,"Radioss")
- * 
- *         with open(file, "r") as f:             # <<<<<<<<<<<<<<
- *             for line in f:
- *                 # if "#RADIOSS STARTER" in line:
- */
-  /*with:*/ {
-    __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 177; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_INCREF(__pyx_v_file);
-    __Pyx_GIVEREF(__pyx_v_file);
-    PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_file);
-    __Pyx_INCREF(__pyx_n_s_r);
-    __Pyx_GIVEREF(__pyx_n_s_r);
-    PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_n_s_r);
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_open, __pyx_t_2, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 177; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __pyx_t_6 = __Pyx_PyObject_LookupSpecial(__pyx_t_1, __pyx_n_s_exit); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 177; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_6);
-    __pyx_t_3 = __Pyx_PyObject_LookupSpecial(__pyx_t_1, __pyx_n_s_enter); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 177; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_5 = NULL;
-    if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_3))) {
-      __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_3);
-      if (likely(__pyx_t_5)) {
-        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-        __Pyx_INCREF(__pyx_t_5);
-        __Pyx_INCREF(function);
-        __Pyx_DECREF_SET(__pyx_t_3, function);
-      }
-    }
-    if (__pyx_t_5) {
-      __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_5); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 177; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    } else {
-      __pyx_t_2 = __Pyx_PyObject_CallNoArg(__pyx_t_3); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 177; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    }
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __pyx_t_3 = __pyx_t_2;
-    __pyx_t_2 = 0;
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    /*try:*/ {
-      {
-        __Pyx_ExceptionSave(&__pyx_t_7, &__pyx_t_8, &__pyx_t_9);
-        __Pyx_XGOTREF(__pyx_t_7);
-        __Pyx_XGOTREF(__pyx_t_8);
-        __Pyx_XGOTREF(__pyx_t_9);
-        /*try:*/ {
-          __pyx_v_f = __pyx_t_3;
-          __pyx_t_3 = 0;
-
-          /* "cNK_FEMeshUtils\MeshReaders.py":178
- * 
- *         with open(file, "r") as f:
- *             for line in f:             # <<<<<<<<<<<<<<
- *                 # if "#RADIOSS STARTER" in line:
- *                     # self.logger.debug("#RADIOSS STARTER found")
- */
-          if (likely(PyList_CheckExact(__pyx_v_f)) || PyTuple_CheckExact(__pyx_v_f)) {
-            __pyx_t_3 = __pyx_v_f; __Pyx_INCREF(__pyx_t_3); __pyx_t_10 = 0;
-            __pyx_t_11 = NULL;
-          } else {
-            __pyx_t_10 = -1; __pyx_t_3 = PyObject_GetIter(__pyx_v_f); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 178; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __Pyx_GOTREF(__pyx_t_3);
-            __pyx_t_11 = Py_TYPE(__pyx_t_3)->tp_iternext; if (unlikely(!__pyx_t_11)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 178; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-          }
-          for (;;) {
-            if (likely(!__pyx_t_11)) {
-              if (likely(PyList_CheckExact(__pyx_t_3))) {
-                if (__pyx_t_10 >= PyList_GET_SIZE(__pyx_t_3)) break;
-                #if CYTHON_COMPILING_IN_CPYTHON
-                __pyx_t_1 = PyList_GET_ITEM(__pyx_t_3, __pyx_t_10); __Pyx_INCREF(__pyx_t_1); __pyx_t_10++; if (unlikely(0 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 178; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                #else
-                __pyx_t_1 = PySequence_ITEM(__pyx_t_3, __pyx_t_10); __pyx_t_10++; if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 178; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_1);
-                #endif
-              } else {
-                if (__pyx_t_10 >= PyTuple_GET_SIZE(__pyx_t_3)) break;
-                #if CYTHON_COMPILING_IN_CPYTHON
-                __pyx_t_1 = PyTuple_GET_ITEM(__pyx_t_3, __pyx_t_10); __Pyx_INCREF(__pyx_t_1); __pyx_t_10++; if (unlikely(0 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 178; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                #else
-                __pyx_t_1 = PySequence_ITEM(__pyx_t_3, __pyx_t_10); __pyx_t_10++; if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 178; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_1);
-                #endif
-              }
-            } else {
-              __pyx_t_1 = __pyx_t_11(__pyx_t_3);
-              if (unlikely(!__pyx_t_1)) {
-                PyObject* exc_type = PyErr_Occurred();
-                if (exc_type) {
-                  if (likely(exc_type == PyExc_StopIteration || PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
-                  else {__pyx_filename = __pyx_f[0]; __pyx_lineno = 178; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                }
-                break;
-              }
-              __Pyx_GOTREF(__pyx_t_1);
-            }
-            __Pyx_XDECREF_SET(__pyx_v_line, __pyx_t_1);
-            __pyx_t_1 = 0;
-
-            /* "cNK_FEMeshUtils\MeshReaders.py":182
- *                     # self.logger.debug("#RADIOSS STARTER found")
- * 
- *                 if "/NODE" in line[0:5]:             # <<<<<<<<<<<<<<
- *                     # self.logger.debug("/NODE keyword found")
- *                     nodesection = True
- */
-            __pyx_t_1 = __Pyx_PyObject_GetSlice(__pyx_v_line, 0, 5, NULL, NULL, &__pyx_slice__37, 1, 1, 1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 182; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __Pyx_GOTREF(__pyx_t_1);
-            __pyx_t_12 = (__Pyx_PySequence_ContainsTF(__pyx_kp_s_NODE_2, __pyx_t_1, Py_EQ)); if (unlikely(__pyx_t_12 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 182; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-            __pyx_t_13 = (__pyx_t_12 != 0);
-            if (__pyx_t_13) {
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":184
- *                 if "/NODE" in line[0:5]:
- *                     # self.logger.debug("/NODE keyword found")
- *                     nodesection = True             # <<<<<<<<<<<<<<
- *                 elif (nodesection == True) and (not("#" in line or "/" in line)):
- *                     _nodeID = int(line[0:10])
- */
-              __pyx_v_nodesection = 1;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":182
- *                     # self.logger.debug("#RADIOSS STARTER found")
- * 
- *                 if "/NODE" in line[0:5]:             # <<<<<<<<<<<<<<
- *                     # self.logger.debug("/NODE keyword found")
- *                     nodesection = True
- */
-              goto __pyx_L17;
-            }
-
-            /* "cNK_FEMeshUtils\MeshReaders.py":185
- *                     # self.logger.debug("/NODE keyword found")
- *                     nodesection = True
- *                 elif (nodesection == True) and (not("#" in line or "/" in line)):             # <<<<<<<<<<<<<<
- *                     _nodeID = int(line[0:10])
- *                     _x = float(line[11:30])
- */
-            __pyx_t_12 = ((__pyx_v_nodesection == 1) != 0);
-            if (__pyx_t_12) {
-            } else {
-              __pyx_t_13 = __pyx_t_12;
-              goto __pyx_L18_bool_binop_done;
-            }
-            __pyx_t_14 = (__Pyx_PySequence_ContainsTF(__pyx_kp_s__38, __pyx_v_line, Py_EQ)); if (unlikely(__pyx_t_14 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 185; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __pyx_t_15 = (__pyx_t_14 != 0);
-            if (!__pyx_t_15) {
-            } else {
-              __pyx_t_12 = __pyx_t_15;
-              goto __pyx_L20_bool_binop_done;
-            }
-            __pyx_t_15 = (__Pyx_PySequence_ContainsTF(__pyx_kp_s__39, __pyx_v_line, Py_EQ)); if (unlikely(__pyx_t_15 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 185; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __pyx_t_14 = (__pyx_t_15 != 0);
-            __pyx_t_12 = __pyx_t_14;
-            __pyx_L20_bool_binop_done:;
-            __pyx_t_14 = ((!__pyx_t_12) != 0);
-            __pyx_t_13 = __pyx_t_14;
-            __pyx_L18_bool_binop_done:;
-            if (__pyx_t_13) {
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":186
- *                     nodesection = True
- *                 elif (nodesection == True) and (not("#" in line or "/" in line)):
- *                     _nodeID = int(line[0:10])             # <<<<<<<<<<<<<<
- *                     _x = float(line[11:30])
- *                     _y = float(line[31:50])
- */
-              __pyx_t_1 = __Pyx_PyObject_GetSlice(__pyx_v_line, 0, 10, NULL, NULL, &__pyx_slice__40, 1, 1, 1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 186; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_1);
-              __pyx_t_2 = PyNumber_Int(__pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 186; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_2);
-              __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-              __Pyx_XDECREF_SET(__pyx_v__nodeID, __pyx_t_2);
-              __pyx_t_2 = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":187
- *                 elif (nodesection == True) and (not("#" in line or "/" in line)):
- *                     _nodeID = int(line[0:10])
- *                     _x = float(line[11:30])             # <<<<<<<<<<<<<<
- *                     _y = float(line[31:50])
- *                     _z = float(line[51:70])
- */
-              __pyx_t_2 = __Pyx_PyObject_GetSlice(__pyx_v_line, 11, 30, NULL, NULL, &__pyx_slice__41, 1, 1, 1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 187; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_2);
-              __pyx_t_16 = __Pyx_PyObject_AsDouble(__pyx_t_2); if (unlikely(__pyx_t_16 == ((double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 187; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-              __pyx_v__x = __pyx_t_16;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":188
- *                     _nodeID = int(line[0:10])
- *                     _x = float(line[11:30])
- *                     _y = float(line[31:50])             # <<<<<<<<<<<<<<
- *                     _z = float(line[51:70])
- *                     _Mesh.addNode(_nodeID, _x, _y, _z)
- */
-              __pyx_t_2 = __Pyx_PyObject_GetSlice(__pyx_v_line, 31, 50, NULL, NULL, &__pyx_slice__42, 1, 1, 1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 188; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_2);
-              __pyx_t_16 = __Pyx_PyObject_AsDouble(__pyx_t_2); if (unlikely(__pyx_t_16 == ((double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 188; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-              __pyx_v__y = __pyx_t_16;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":189
- *                     _x = float(line[11:30])
- *                     _y = float(line[31:50])
- *                     _z = float(line[51:70])             # <<<<<<<<<<<<<<
- *                     _Mesh.addNode(_nodeID, _x, _y, _z)
- *                 elif nodesection and "/" in line:
- */
-              __pyx_t_2 = __Pyx_PyObject_GetSlice(__pyx_v_line, 51, 70, NULL, NULL, &__pyx_slice__43, 1, 1, 1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 189; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_2);
-              __pyx_t_16 = __Pyx_PyObject_AsDouble(__pyx_t_2); if (unlikely(__pyx_t_16 == ((double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 189; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-              __pyx_v__z = __pyx_t_16;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":190
- *                     _y = float(line[31:50])
- *                     _z = float(line[51:70])
- *                     _Mesh.addNode(_nodeID, _x, _y, _z)             # <<<<<<<<<<<<<<
- *                 elif nodesection and "/" in line:
- *                     nodesection = False
- */
-              __pyx_t_17 = __Pyx_PyInt_As_int(__pyx_v__nodeID); if (unlikely((__pyx_t_17 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 190; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __pyx_t_2 = ((struct __pyx_vtabstruct_15cNK_FEMeshUtils_4Mesh_Mesh *)__pyx_v__Mesh->__pyx_vtab)->addNode(__pyx_v__Mesh, __pyx_t_17, __pyx_v__x, __pyx_v__y, __pyx_v__z, 0); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 190; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_2);
-              __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":185
- *                     # self.logger.debug("/NODE keyword found")
- *                     nodesection = True
- *                 elif (nodesection == True) and (not("#" in line or "/" in line)):             # <<<<<<<<<<<<<<
- *                     _nodeID = int(line[0:10])
- *                     _x = float(line[11:30])
- */
-              goto __pyx_L17;
-            }
-
-            /* "cNK_FEMeshUtils\MeshReaders.py":191
- *                     _z = float(line[51:70])
- *                     _Mesh.addNode(_nodeID, _x, _y, _z)
- *                 elif nodesection and "/" in line:             # <<<<<<<<<<<<<<
- *                     nodesection = False
- * 
- */
-            __pyx_t_14 = (__pyx_v_nodesection != 0);
-            if (__pyx_t_14) {
-            } else {
-              __pyx_t_13 = __pyx_t_14;
-              goto __pyx_L22_bool_binop_done;
-            }
-            __pyx_t_14 = (__Pyx_PySequence_ContainsTF(__pyx_kp_s__39, __pyx_v_line, Py_EQ)); if (unlikely(__pyx_t_14 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 191; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __pyx_t_12 = (__pyx_t_14 != 0);
-            __pyx_t_13 = __pyx_t_12;
-            __pyx_L22_bool_binop_done:;
-            if (__pyx_t_13) {
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":192
- *                     _Mesh.addNode(_nodeID, _x, _y, _z)
- *                 elif nodesection and "/" in line:
- *                     nodesection = False             # <<<<<<<<<<<<<<
- * 
- *                 if "/SH3N" in line[0:5]:
- */
-              __pyx_v_nodesection = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":191
- *                     _z = float(line[51:70])
- *                     _Mesh.addNode(_nodeID, _x, _y, _z)
- *                 elif nodesection and "/" in line:             # <<<<<<<<<<<<<<
- *                     nodesection = False
- * 
- */
-            }
-            __pyx_L17:;
-
-            /* "cNK_FEMeshUtils\MeshReaders.py":194
- *                     nodesection = False
- * 
- *                 if "/SH3N" in line[0:5]:             # <<<<<<<<<<<<<<
- *                     # self.logger.debug("/SH3N keyword found")
- *                     _partid=int(line.strip().split("/")[-1])
- */
-            __pyx_t_2 = __Pyx_PyObject_GetSlice(__pyx_v_line, 0, 5, NULL, NULL, &__pyx_slice__44, 1, 1, 1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 194; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __Pyx_GOTREF(__pyx_t_2);
-            __pyx_t_13 = (__Pyx_PySequence_ContainsTF(__pyx_kp_s_SH3N, __pyx_t_2, Py_EQ)); if (unlikely(__pyx_t_13 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 194; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-            __pyx_t_12 = (__pyx_t_13 != 0);
-            if (__pyx_t_12) {
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":196
- *                 if "/SH3N" in line[0:5]:
- *                     # self.logger.debug("/SH3N keyword found")
- *                     _partid=int(line.strip().split("/")[-1])             # <<<<<<<<<<<<<<
- *                     SH3Nsection = True
- *                 elif (SH3Nsection == True) and (not("#" in line or "/" in line)):
- */
-              __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_line, __pyx_n_s_strip); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 196; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_1);
-              __pyx_t_5 = NULL;
-              if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_1))) {
-                __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_1);
-                if (likely(__pyx_t_5)) {
-                  PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
-                  __Pyx_INCREF(__pyx_t_5);
-                  __Pyx_INCREF(function);
-                  __Pyx_DECREF_SET(__pyx_t_1, function);
-                }
-              }
-              if (__pyx_t_5) {
-                __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_t_5); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 196; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-              } else {
-                __pyx_t_2 = __Pyx_PyObject_CallNoArg(__pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 196; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              }
-              __Pyx_GOTREF(__pyx_t_2);
-              __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-              __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_split); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 196; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_1);
-              __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-              __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_tuple__45, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 196; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_2);
-              __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-              __pyx_t_1 = __Pyx_GetItemInt(__pyx_t_2, -1L, long, 1, __Pyx_PyInt_From_long, 0, 1, 1); if (unlikely(__pyx_t_1 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 196; __pyx_clineno = __LINE__; goto __pyx_L7_error;};
-              __Pyx_GOTREF(__pyx_t_1);
-              __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-              __pyx_t_2 = PyNumber_Int(__pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 196; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_2);
-              __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-              __Pyx_XDECREF_SET(__pyx_v__partid, __pyx_t_2);
-              __pyx_t_2 = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":197
- *                     # self.logger.debug("/SH3N keyword found")
- *                     _partid=int(line.strip().split("/")[-1])
- *                     SH3Nsection = True             # <<<<<<<<<<<<<<
- *                 elif (SH3Nsection == True) and (not("#" in line or "/" in line)):
- *                     #print [line[0:10], partid, line[11:20], line[21:30], line[31:40]]
- */
-              __pyx_v_SH3Nsection = 1;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":194
- *                     nodesection = False
- * 
- *                 if "/SH3N" in line[0:5]:             # <<<<<<<<<<<<<<
- *                     # self.logger.debug("/SH3N keyword found")
- *                     _partid=int(line.strip().split("/")[-1])
- */
-              goto __pyx_L24;
-            }
-
-            /* "cNK_FEMeshUtils\MeshReaders.py":198
- *                     _partid=int(line.strip().split("/")[-1])
- *                     SH3Nsection = True
- *                 elif (SH3Nsection == True) and (not("#" in line or "/" in line)):             # <<<<<<<<<<<<<<
- *                     #print [line[0:10], partid, line[11:20], line[21:30], line[31:40]]
- *                     _elID = int(line[0:10])
- */
-            __pyx_t_13 = ((__pyx_v_SH3Nsection == 1) != 0);
-            if (__pyx_t_13) {
-            } else {
-              __pyx_t_12 = __pyx_t_13;
-              goto __pyx_L25_bool_binop_done;
-            }
-            __pyx_t_14 = (__Pyx_PySequence_ContainsTF(__pyx_kp_s__38, __pyx_v_line, Py_EQ)); if (unlikely(__pyx_t_14 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 198; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __pyx_t_15 = (__pyx_t_14 != 0);
-            if (!__pyx_t_15) {
-            } else {
-              __pyx_t_13 = __pyx_t_15;
-              goto __pyx_L27_bool_binop_done;
-            }
-            __pyx_t_15 = (__Pyx_PySequence_ContainsTF(__pyx_kp_s__39, __pyx_v_line, Py_EQ)); if (unlikely(__pyx_t_15 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 198; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __pyx_t_14 = (__pyx_t_15 != 0);
-            __pyx_t_13 = __pyx_t_14;
-            __pyx_L27_bool_binop_done:;
-            __pyx_t_14 = ((!__pyx_t_13) != 0);
-            __pyx_t_12 = __pyx_t_14;
-            __pyx_L25_bool_binop_done:;
-            if (__pyx_t_12) {
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":200
- *                 elif (SH3Nsection == True) and (not("#" in line or "/" in line)):
- *                     #print [line[0:10], partid, line[11:20], line[21:30], line[31:40]]
- *                     _elID = int(line[0:10])             # <<<<<<<<<<<<<<
- *                     _n1 = int(line[11:20])
- *                     _n2 = int(line[21:30])
- */
-              __pyx_t_2 = __Pyx_PyObject_GetSlice(__pyx_v_line, 0, 10, NULL, NULL, &__pyx_slice__46, 1, 1, 1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 200; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_2);
-              __pyx_t_1 = PyNumber_Int(__pyx_t_2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 200; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_1);
-              __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-              __Pyx_XDECREF_SET(__pyx_v__elID, __pyx_t_1);
-              __pyx_t_1 = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":201
- *                     #print [line[0:10], partid, line[11:20], line[21:30], line[31:40]]
- *                     _elID = int(line[0:10])
- *                     _n1 = int(line[11:20])             # <<<<<<<<<<<<<<
- *                     _n2 = int(line[21:30])
- *                     _n3 = int(line[31:40])
- */
-              __pyx_t_1 = __Pyx_PyObject_GetSlice(__pyx_v_line, 11, 20, NULL, NULL, &__pyx_slice__47, 1, 1, 1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 201; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_1);
-              __pyx_t_2 = PyNumber_Int(__pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 201; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_2);
-              __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-              __Pyx_XDECREF_SET(__pyx_v__n1, __pyx_t_2);
-              __pyx_t_2 = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":202
- *                     _elID = int(line[0:10])
- *                     _n1 = int(line[11:20])
- *                     _n2 = int(line[21:30])             # <<<<<<<<<<<<<<
- *                     _n3 = int(line[31:40])
- *                     _Mesh.addElem(_elID, _partid, _n1, _n2, _n3)
- */
-              __pyx_t_2 = __Pyx_PyObject_GetSlice(__pyx_v_line, 21, 30, NULL, NULL, &__pyx_slice__48, 1, 1, 1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 202; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_2);
-              __pyx_t_1 = PyNumber_Int(__pyx_t_2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 202; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_1);
-              __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-              __Pyx_XDECREF_SET(__pyx_v__n2, __pyx_t_1);
-              __pyx_t_1 = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":203
- *                     _n1 = int(line[11:20])
- *                     _n2 = int(line[21:30])
- *                     _n3 = int(line[31:40])             # <<<<<<<<<<<<<<
- *                     _Mesh.addElem(_elID, _partid, _n1, _n2, _n3)
- *                     if line[91:100].strip() != "": _Mesh.addElementalThickness(line[0:10],line[91:100])
- */
-              __pyx_t_1 = __Pyx_PyObject_GetSlice(__pyx_v_line, 31, 40, NULL, NULL, &__pyx_slice__49, 1, 1, 1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 203; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_1);
-              __pyx_t_2 = PyNumber_Int(__pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 203; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_2);
-              __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-              __Pyx_XDECREF_SET(__pyx_v__n3, __pyx_t_2);
-              __pyx_t_2 = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":204
- *                     _n2 = int(line[21:30])
- *                     _n3 = int(line[31:40])
- *                     _Mesh.addElem(_elID, _partid, _n1, _n2, _n3)             # <<<<<<<<<<<<<<
- *                     if line[91:100].strip() != "": _Mesh.addElementalThickness(line[0:10],line[91:100])
- *                 elif SH3Nsection and "/" in line:
- */
-              __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v__Mesh), __pyx_n_s_addElem); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 204; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_1);
-              if (unlikely(!__pyx_v__partid)) { __Pyx_RaiseUnboundLocalError("_partid"); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 204; __pyx_clineno = __LINE__; goto __pyx_L7_error;} }
-              __pyx_t_5 = NULL;
-              __pyx_t_18 = 0;
-              if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_1))) {
-                __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_1);
-                if (likely(__pyx_t_5)) {
-                  PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
-                  __Pyx_INCREF(__pyx_t_5);
-                  __Pyx_INCREF(function);
-                  __Pyx_DECREF_SET(__pyx_t_1, function);
-                  __pyx_t_18 = 1;
-                }
-              }
-              __pyx_t_4 = PyTuple_New(5+__pyx_t_18); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 204; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_4);
-              if (__pyx_t_5) {
-                __Pyx_GIVEREF(__pyx_t_5); PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_5); __pyx_t_5 = NULL;
-              }
-              __Pyx_INCREF(__pyx_v__elID);
-              __Pyx_GIVEREF(__pyx_v__elID);
-              PyTuple_SET_ITEM(__pyx_t_4, 0+__pyx_t_18, __pyx_v__elID);
-              __Pyx_INCREF(__pyx_v__partid);
-              __Pyx_GIVEREF(__pyx_v__partid);
-              PyTuple_SET_ITEM(__pyx_t_4, 1+__pyx_t_18, __pyx_v__partid);
-              __Pyx_INCREF(__pyx_v__n1);
-              __Pyx_GIVEREF(__pyx_v__n1);
-              PyTuple_SET_ITEM(__pyx_t_4, 2+__pyx_t_18, __pyx_v__n1);
-              __Pyx_INCREF(__pyx_v__n2);
-              __Pyx_GIVEREF(__pyx_v__n2);
-              PyTuple_SET_ITEM(__pyx_t_4, 3+__pyx_t_18, __pyx_v__n2);
-              __Pyx_INCREF(__pyx_v__n3);
-              __Pyx_GIVEREF(__pyx_v__n3);
-              PyTuple_SET_ITEM(__pyx_t_4, 4+__pyx_t_18, __pyx_v__n3);
-              __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_4, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 204; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_2);
-              __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-              __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-              __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":205
- *                     _n3 = int(line[31:40])
- *                     _Mesh.addElem(_elID, _partid, _n1, _n2, _n3)
- *                     if line[91:100].strip() != "": _Mesh.addElementalThickness(line[0:10],line[91:100])             # <<<<<<<<<<<<<<
- *                 elif SH3Nsection and "/" in line:
- *                     SH3Nsection = False
- */
-              __pyx_t_1 = __Pyx_PyObject_GetSlice(__pyx_v_line, 91, 0x64, NULL, NULL, &__pyx_slice__50, 1, 1, 1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 205; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_1);
-              __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_strip); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 205; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_4);
-              __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-              __pyx_t_1 = NULL;
-              if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_4))) {
-                __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_4);
-                if (likely(__pyx_t_1)) {
-                  PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
-                  __Pyx_INCREF(__pyx_t_1);
-                  __Pyx_INCREF(function);
-                  __Pyx_DECREF_SET(__pyx_t_4, function);
-                }
-              }
-              if (__pyx_t_1) {
-                __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 205; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-              } else {
-                __pyx_t_2 = __Pyx_PyObject_CallNoArg(__pyx_t_4); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 205; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              }
-              __Pyx_GOTREF(__pyx_t_2);
-              __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-              __pyx_t_12 = (__Pyx_PyString_Equals(__pyx_t_2, __pyx_kp_s__51, Py_NE)); if (unlikely(__pyx_t_12 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 205; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-              if (__pyx_t_12) {
-                __pyx_t_2 = __Pyx_PyObject_GetSlice(__pyx_v_line, 0, 10, NULL, NULL, &__pyx_slice__52, 1, 1, 1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 205; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_2);
-                __pyx_t_17 = __Pyx_PyInt_As_int(__pyx_t_2); if (unlikely((__pyx_t_17 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 205; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-                __pyx_t_2 = __Pyx_PyObject_GetSlice(__pyx_v_line, 91, 0x64, NULL, NULL, &__pyx_slice__53, 1, 1, 1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 205; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_2);
-                __pyx_t_16 = __pyx_PyFloat_AsDouble(__pyx_t_2); if (unlikely((__pyx_t_16 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 205; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-                __pyx_t_2 = ((struct __pyx_vtabstruct_15cNK_FEMeshUtils_4Mesh_Mesh *)__pyx_v__Mesh->__pyx_vtab)->addElementalThickness(__pyx_v__Mesh, __pyx_t_17, __pyx_t_16, 0); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 205; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_2);
-                __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-              }
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":198
- *                     _partid=int(line.strip().split("/")[-1])
- *                     SH3Nsection = True
- *                 elif (SH3Nsection == True) and (not("#" in line or "/" in line)):             # <<<<<<<<<<<<<<
- *                     #print [line[0:10], partid, line[11:20], line[21:30], line[31:40]]
- *                     _elID = int(line[0:10])
- */
-              goto __pyx_L24;
-            }
-
-            /* "cNK_FEMeshUtils\MeshReaders.py":206
- *                     _Mesh.addElem(_elID, _partid, _n1, _n2, _n3)
- *                     if line[91:100].strip() != "": _Mesh.addElementalThickness(line[0:10],line[91:100])
- *                 elif SH3Nsection and "/" in line:             # <<<<<<<<<<<<<<
- *                     SH3Nsection = False
- * 
- */
-            __pyx_t_14 = (__pyx_v_SH3Nsection != 0);
-            if (__pyx_t_14) {
-            } else {
-              __pyx_t_12 = __pyx_t_14;
-              goto __pyx_L30_bool_binop_done;
-            }
-            __pyx_t_14 = (__Pyx_PySequence_ContainsTF(__pyx_kp_s__39, __pyx_v_line, Py_EQ)); if (unlikely(__pyx_t_14 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 206; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __pyx_t_13 = (__pyx_t_14 != 0);
-            __pyx_t_12 = __pyx_t_13;
-            __pyx_L30_bool_binop_done:;
-            if (__pyx_t_12) {
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":207
- *                     if line[91:100].strip() != "": _Mesh.addElementalThickness(line[0:10],line[91:100])
- *                 elif SH3Nsection and "/" in line:
- *                     SH3Nsection = False             # <<<<<<<<<<<<<<
- * 
- *                 if "/SHELL" in line[0:6]:
- */
-              __pyx_v_SH3Nsection = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":206
- *                     _Mesh.addElem(_elID, _partid, _n1, _n2, _n3)
- *                     if line[91:100].strip() != "": _Mesh.addElementalThickness(line[0:10],line[91:100])
- *                 elif SH3Nsection and "/" in line:             # <<<<<<<<<<<<<<
- *                     SH3Nsection = False
- * 
- */
-            }
-            __pyx_L24:;
-
-            /* "cNK_FEMeshUtils\MeshReaders.py":209
- *                     SH3Nsection = False
- * 
- *                 if "/SHELL" in line[0:6]:             # <<<<<<<<<<<<<<
- *                     # self.logger.debug("/SHELL keyword found")
- *                     _partid=int(line.strip().split("/")[-1])
- */
-            __pyx_t_2 = __Pyx_PyObject_GetSlice(__pyx_v_line, 0, 6, NULL, NULL, &__pyx_slice__54, 1, 1, 1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 209; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __Pyx_GOTREF(__pyx_t_2);
-            __pyx_t_12 = (__Pyx_PySequence_ContainsTF(__pyx_kp_s_SHELL, __pyx_t_2, Py_EQ)); if (unlikely(__pyx_t_12 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 209; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-            __pyx_t_13 = (__pyx_t_12 != 0);
-            if (__pyx_t_13) {
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":211
- *                 if "/SHELL" in line[0:6]:
- *                     # self.logger.debug("/SHELL keyword found")
- *                     _partid=int(line.strip().split("/")[-1])             # <<<<<<<<<<<<<<
- *                     SHELLsection = True
- *                 elif (SHELLsection == True) and (not("#" in line or "/" in line)):
- */
-              __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_line, __pyx_n_s_strip); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 211; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_4);
-              __pyx_t_1 = NULL;
-              if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_4))) {
-                __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_4);
-                if (likely(__pyx_t_1)) {
-                  PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
-                  __Pyx_INCREF(__pyx_t_1);
-                  __Pyx_INCREF(function);
-                  __Pyx_DECREF_SET(__pyx_t_4, function);
-                }
-              }
-              if (__pyx_t_1) {
-                __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 211; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-              } else {
-                __pyx_t_2 = __Pyx_PyObject_CallNoArg(__pyx_t_4); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 211; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              }
-              __Pyx_GOTREF(__pyx_t_2);
-              __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-              __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_split); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 211; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_4);
-              __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-              __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_tuple__55, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 211; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_2);
-              __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-              __pyx_t_4 = __Pyx_GetItemInt(__pyx_t_2, -1L, long, 1, __Pyx_PyInt_From_long, 0, 1, 1); if (unlikely(__pyx_t_4 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 211; __pyx_clineno = __LINE__; goto __pyx_L7_error;};
-              __Pyx_GOTREF(__pyx_t_4);
-              __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-              __pyx_t_2 = PyNumber_Int(__pyx_t_4); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 211; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_2);
-              __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-              __Pyx_XDECREF_SET(__pyx_v__partid, __pyx_t_2);
-              __pyx_t_2 = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":212
- *                     # self.logger.debug("/SHELL keyword found")
- *                     _partid=int(line.strip().split("/")[-1])
- *                     SHELLsection = True             # <<<<<<<<<<<<<<
- *                 elif (SHELLsection == True) and (not("#" in line or "/" in line)):
- *                     #print [line[0:10], partid, line[11:20], line[21:30], line[31:40], line[41:50]]
- */
-              __pyx_v_SHELLsection = 1;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":209
- *                     SH3Nsection = False
- * 
- *                 if "/SHELL" in line[0:6]:             # <<<<<<<<<<<<<<
- *                     # self.logger.debug("/SHELL keyword found")
- *                     _partid=int(line.strip().split("/")[-1])
- */
-              goto __pyx_L32;
-            }
-
-            /* "cNK_FEMeshUtils\MeshReaders.py":213
- *                     _partid=int(line.strip().split("/")[-1])
- *                     SHELLsection = True
- *                 elif (SHELLsection == True) and (not("#" in line or "/" in line)):             # <<<<<<<<<<<<<<
- *                     #print [line[0:10], partid, line[11:20], line[21:30], line[31:40], line[41:50]]
- * 
- */
-            __pyx_t_12 = ((__pyx_v_SHELLsection == 1) != 0);
-            if (__pyx_t_12) {
-            } else {
-              __pyx_t_13 = __pyx_t_12;
-              goto __pyx_L33_bool_binop_done;
-            }
-            __pyx_t_14 = (__Pyx_PySequence_ContainsTF(__pyx_kp_s__38, __pyx_v_line, Py_EQ)); if (unlikely(__pyx_t_14 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 213; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __pyx_t_15 = (__pyx_t_14 != 0);
-            if (!__pyx_t_15) {
-            } else {
-              __pyx_t_12 = __pyx_t_15;
-              goto __pyx_L35_bool_binop_done;
-            }
-            __pyx_t_15 = (__Pyx_PySequence_ContainsTF(__pyx_kp_s__39, __pyx_v_line, Py_EQ)); if (unlikely(__pyx_t_15 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 213; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __pyx_t_14 = (__pyx_t_15 != 0);
-            __pyx_t_12 = __pyx_t_14;
-            __pyx_L35_bool_binop_done:;
-            __pyx_t_14 = ((!__pyx_t_12) != 0);
-            __pyx_t_13 = __pyx_t_14;
-            __pyx_L33_bool_binop_done:;
-            if (__pyx_t_13) {
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":216
- *                     #print [line[0:10], partid, line[11:20], line[21:30], line[31:40], line[41:50]]
- * 
- *                     _elID = int(line[0:10])             # <<<<<<<<<<<<<<
- *                     _n1 = int(line[11:20])
- *                     _n2 = int(line[21:30])
- */
-              __pyx_t_2 = __Pyx_PyObject_GetSlice(__pyx_v_line, 0, 10, NULL, NULL, &__pyx_slice__56, 1, 1, 1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 216; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_2);
-              __pyx_t_4 = PyNumber_Int(__pyx_t_2); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 216; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_4);
-              __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-              __Pyx_XDECREF_SET(__pyx_v__elID, __pyx_t_4);
-              __pyx_t_4 = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":217
- * 
- *                     _elID = int(line[0:10])
- *                     _n1 = int(line[11:20])             # <<<<<<<<<<<<<<
- *                     _n2 = int(line[21:30])
- *                     _n3 = int(line[31:40])
- */
-              __pyx_t_4 = __Pyx_PyObject_GetSlice(__pyx_v_line, 11, 20, NULL, NULL, &__pyx_slice__57, 1, 1, 1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 217; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_4);
-              __pyx_t_2 = PyNumber_Int(__pyx_t_4); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 217; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_2);
-              __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-              __Pyx_XDECREF_SET(__pyx_v__n1, __pyx_t_2);
-              __pyx_t_2 = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":218
- *                     _elID = int(line[0:10])
- *                     _n1 = int(line[11:20])
- *                     _n2 = int(line[21:30])             # <<<<<<<<<<<<<<
- *                     _n3 = int(line[31:40])
- *                     _n4 = int(line[41:50])
- */
-              __pyx_t_2 = __Pyx_PyObject_GetSlice(__pyx_v_line, 21, 30, NULL, NULL, &__pyx_slice__58, 1, 1, 1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 218; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_2);
-              __pyx_t_4 = PyNumber_Int(__pyx_t_2); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 218; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_4);
-              __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-              __Pyx_XDECREF_SET(__pyx_v__n2, __pyx_t_4);
-              __pyx_t_4 = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":219
- *                     _n1 = int(line[11:20])
- *                     _n2 = int(line[21:30])
- *                     _n3 = int(line[31:40])             # <<<<<<<<<<<<<<
- *                     _n4 = int(line[41:50])
- *                     _Mesh.addElem(_elID, _partid, _n1, _n2, _n3, _n4)
- */
-              __pyx_t_4 = __Pyx_PyObject_GetSlice(__pyx_v_line, 31, 40, NULL, NULL, &__pyx_slice__59, 1, 1, 1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 219; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_4);
-              __pyx_t_2 = PyNumber_Int(__pyx_t_4); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 219; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_2);
-              __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-              __Pyx_XDECREF_SET(__pyx_v__n3, __pyx_t_2);
-              __pyx_t_2 = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":220
- *                     _n2 = int(line[21:30])
- *                     _n3 = int(line[31:40])
- *                     _n4 = int(line[41:50])             # <<<<<<<<<<<<<<
- *                     _Mesh.addElem(_elID, _partid, _n1, _n2, _n3, _n4)
- * 
- */
-              __pyx_t_2 = __Pyx_PyObject_GetSlice(__pyx_v_line, 41, 50, NULL, NULL, &__pyx_slice__60, 1, 1, 1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 220; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_2);
-              __pyx_t_4 = PyNumber_Int(__pyx_t_2); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 220; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_4);
-              __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-              __Pyx_XDECREF_SET(__pyx_v__n4, __pyx_t_4);
-              __pyx_t_4 = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":221
- *                     _n3 = int(line[31:40])
- *                     _n4 = int(line[41:50])
- *                     _Mesh.addElem(_elID, _partid, _n1, _n2, _n3, _n4)             # <<<<<<<<<<<<<<
- * 
- *                     try:
- */
-              __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v__Mesh), __pyx_n_s_addElem); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 221; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_2);
-              if (unlikely(!__pyx_v__partid)) { __Pyx_RaiseUnboundLocalError("_partid"); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 221; __pyx_clineno = __LINE__; goto __pyx_L7_error;} }
-              __pyx_t_1 = NULL;
-              __pyx_t_18 = 0;
-              if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_2))) {
-                __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_2);
-                if (likely(__pyx_t_1)) {
-                  PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
-                  __Pyx_INCREF(__pyx_t_1);
-                  __Pyx_INCREF(function);
-                  __Pyx_DECREF_SET(__pyx_t_2, function);
-                  __pyx_t_18 = 1;
-                }
-              }
-              __pyx_t_5 = PyTuple_New(6+__pyx_t_18); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 221; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_5);
-              if (__pyx_t_1) {
-                __Pyx_GIVEREF(__pyx_t_1); PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_1); __pyx_t_1 = NULL;
-              }
-              __Pyx_INCREF(__pyx_v__elID);
-              __Pyx_GIVEREF(__pyx_v__elID);
-              PyTuple_SET_ITEM(__pyx_t_5, 0+__pyx_t_18, __pyx_v__elID);
-              __Pyx_INCREF(__pyx_v__partid);
-              __Pyx_GIVEREF(__pyx_v__partid);
-              PyTuple_SET_ITEM(__pyx_t_5, 1+__pyx_t_18, __pyx_v__partid);
-              __Pyx_INCREF(__pyx_v__n1);
-              __Pyx_GIVEREF(__pyx_v__n1);
-              PyTuple_SET_ITEM(__pyx_t_5, 2+__pyx_t_18, __pyx_v__n1);
-              __Pyx_INCREF(__pyx_v__n2);
-              __Pyx_GIVEREF(__pyx_v__n2);
-              PyTuple_SET_ITEM(__pyx_t_5, 3+__pyx_t_18, __pyx_v__n2);
-              __Pyx_INCREF(__pyx_v__n3);
-              __Pyx_GIVEREF(__pyx_v__n3);
-              PyTuple_SET_ITEM(__pyx_t_5, 4+__pyx_t_18, __pyx_v__n3);
-              __Pyx_INCREF(__pyx_v__n4);
-              __Pyx_GIVEREF(__pyx_v__n4);
-              PyTuple_SET_ITEM(__pyx_t_5, 5+__pyx_t_18, __pyx_v__n4);
-              __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_5, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 221; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_4);
-              __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-              __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-              __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":223
- *                     _Mesh.addElem(_elID, _partid, _n1, _n2, _n3, _n4)
- * 
- *                     try:             # <<<<<<<<<<<<<<
- *                         _elthick = float(line[91:100].strip())
- *                         if _elthick != 0.0 :
- */
-              {
-                __Pyx_ExceptionSave(&__pyx_t_19, &__pyx_t_20, &__pyx_t_21);
-                __Pyx_XGOTREF(__pyx_t_19);
-                __Pyx_XGOTREF(__pyx_t_20);
-                __Pyx_XGOTREF(__pyx_t_21);
-                /*try:*/ {
-
-                  /* "cNK_FEMeshUtils\MeshReaders.py":224
- * 
- *                     try:
- *                         _elthick = float(line[91:100].strip())             # <<<<<<<<<<<<<<
- *                         if _elthick != 0.0 :
- *                             _Mesh.addElementalThickness(_elID,_elthick)
- */
-                  __pyx_t_2 = __Pyx_PyObject_GetSlice(__pyx_v_line, 91, 0x64, NULL, NULL, &__pyx_slice__61, 1, 1, 1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 224; __pyx_clineno = __LINE__; goto __pyx_L37_error;}
-                  __Pyx_GOTREF(__pyx_t_2);
-                  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_strip); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 224; __pyx_clineno = __LINE__; goto __pyx_L37_error;}
-                  __Pyx_GOTREF(__pyx_t_5);
-                  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-                  __pyx_t_2 = NULL;
-                  if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_5))) {
-                    __pyx_t_2 = PyMethod_GET_SELF(__pyx_t_5);
-                    if (likely(__pyx_t_2)) {
-                      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
-                      __Pyx_INCREF(__pyx_t_2);
-                      __Pyx_INCREF(function);
-                      __Pyx_DECREF_SET(__pyx_t_5, function);
-                    }
-                  }
-                  if (__pyx_t_2) {
-                    __pyx_t_4 = __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_2); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 224; __pyx_clineno = __LINE__; goto __pyx_L37_error;}
-                    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-                  } else {
-                    __pyx_t_4 = __Pyx_PyObject_CallNoArg(__pyx_t_5); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 224; __pyx_clineno = __LINE__; goto __pyx_L37_error;}
-                  }
-                  __Pyx_GOTREF(__pyx_t_4);
-                  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-                  __pyx_t_16 = __Pyx_PyObject_AsDouble(__pyx_t_4); if (unlikely(__pyx_t_16 == ((double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 224; __pyx_clineno = __LINE__; goto __pyx_L37_error;}
-                  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-                  __pyx_v__elthick = __pyx_t_16;
-
-                  /* "cNK_FEMeshUtils\MeshReaders.py":225
- *                     try:
- *                         _elthick = float(line[91:100].strip())
- *                         if _elthick != 0.0 :             # <<<<<<<<<<<<<<
- *                             _Mesh.addElementalThickness(_elID,_elthick)
- *                     except:
- */
-                  __pyx_t_13 = ((__pyx_v__elthick != 0.0) != 0);
-                  if (__pyx_t_13) {
-
-                    /* "cNK_FEMeshUtils\MeshReaders.py":226
- *                         _elthick = float(line[91:100].strip())
- *                         if _elthick != 0.0 :
- *                             _Mesh.addElementalThickness(_elID,_elthick)             # <<<<<<<<<<<<<<
- *                     except:
- *                         pass
- */
-                    __pyx_t_17 = __Pyx_PyInt_As_int(__pyx_v__elID); if (unlikely((__pyx_t_17 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 226; __pyx_clineno = __LINE__; goto __pyx_L37_error;}
-                    __pyx_t_4 = ((struct __pyx_vtabstruct_15cNK_FEMeshUtils_4Mesh_Mesh *)__pyx_v__Mesh->__pyx_vtab)->addElementalThickness(__pyx_v__Mesh, __pyx_t_17, __pyx_v__elthick, 0); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 226; __pyx_clineno = __LINE__; goto __pyx_L37_error;}
-                    __Pyx_GOTREF(__pyx_t_4);
-                    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-
-                    /* "cNK_FEMeshUtils\MeshReaders.py":225
- *                     try:
- *                         _elthick = float(line[91:100].strip())
- *                         if _elthick != 0.0 :             # <<<<<<<<<<<<<<
- *                             _Mesh.addElementalThickness(_elID,_elthick)
- *                     except:
- */
-                  }
-
-                  /* "cNK_FEMeshUtils\MeshReaders.py":223
- *                     _Mesh.addElem(_elID, _partid, _n1, _n2, _n3, _n4)
- * 
- *                     try:             # <<<<<<<<<<<<<<
- *                         _elthick = float(line[91:100].strip())
- *                         if _elthick != 0.0 :
- */
-                }
-                __Pyx_XDECREF(__pyx_t_19); __pyx_t_19 = 0;
-                __Pyx_XDECREF(__pyx_t_20); __pyx_t_20 = 0;
-                __Pyx_XDECREF(__pyx_t_21); __pyx_t_21 = 0;
-                goto __pyx_L44_try_end;
-                __pyx_L37_error:;
-                __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
-                __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-                __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-                __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-
-                /* "cNK_FEMeshUtils\MeshReaders.py":227
- *                         if _elthick != 0.0 :
- *                             _Mesh.addElementalThickness(_elID,_elthick)
- *                     except:             # <<<<<<<<<<<<<<
- *                         pass
- *                 elif SHELLsection and "/" in line:
- */
-                /*except:*/ {
-                  PyErr_Restore(0,0,0);
-                  goto __pyx_L38_exception_handled;
-                }
-                __pyx_L38_exception_handled:;
-                __Pyx_XGIVEREF(__pyx_t_19);
-                __Pyx_XGIVEREF(__pyx_t_20);
-                __Pyx_XGIVEREF(__pyx_t_21);
-                __Pyx_ExceptionReset(__pyx_t_19, __pyx_t_20, __pyx_t_21);
-                __pyx_L44_try_end:;
-              }
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":213
- *                     _partid=int(line.strip().split("/")[-1])
- *                     SHELLsection = True
- *                 elif (SHELLsection == True) and (not("#" in line or "/" in line)):             # <<<<<<<<<<<<<<
- *                     #print [line[0:10], partid, line[11:20], line[21:30], line[31:40], line[41:50]]
- * 
- */
-              goto __pyx_L32;
-            }
-
-            /* "cNK_FEMeshUtils\MeshReaders.py":229
- *                     except:
- *                         pass
- *                 elif SHELLsection and "/" in line:             # <<<<<<<<<<<<<<
- *                     SHELLsection = False
- * 
- */
-            __pyx_t_14 = (__pyx_v_SHELLsection != 0);
-            if (__pyx_t_14) {
-            } else {
-              __pyx_t_13 = __pyx_t_14;
-              goto __pyx_L46_bool_binop_done;
-            }
-            __pyx_t_14 = (__Pyx_PySequence_ContainsTF(__pyx_kp_s__39, __pyx_v_line, Py_EQ)); if (unlikely(__pyx_t_14 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 229; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __pyx_t_12 = (__pyx_t_14 != 0);
-            __pyx_t_13 = __pyx_t_12;
-            __pyx_L46_bool_binop_done:;
-            if (__pyx_t_13) {
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":230
- *                         pass
- *                 elif SHELLsection and "/" in line:
- *                     SHELLsection = False             # <<<<<<<<<<<<<<
- * 
- *                 if "/PART" in line[0:5]:
- */
-              __pyx_v_SHELLsection = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":229
- *                     except:
- *                         pass
- *                 elif SHELLsection and "/" in line:             # <<<<<<<<<<<<<<
- *                     SHELLsection = False
- * 
- */
-            }
-            __pyx_L32:;
-
-            /* "cNK_FEMeshUtils\MeshReaders.py":232
- *                     SHELLsection = False
- * 
- *                 if "/PART" in line[0:5]:             # <<<<<<<<<<<<<<
- *                     # self.logger.debug("/PART Keyword Found")
- *                     _partid=int(line.strip().split("/")[-1])
- */
-            __pyx_t_4 = __Pyx_PyObject_GetSlice(__pyx_v_line, 0, 5, NULL, NULL, &__pyx_slice__62, 1, 1, 1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 232; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __Pyx_GOTREF(__pyx_t_4);
-            __pyx_t_13 = (__Pyx_PySequence_ContainsTF(__pyx_kp_s_PART_2, __pyx_t_4, Py_EQ)); if (unlikely(__pyx_t_13 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 232; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-            __pyx_t_12 = (__pyx_t_13 != 0);
-            if (__pyx_t_12) {
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":234
- *                 if "/PART" in line[0:5]:
- *                     # self.logger.debug("/PART Keyword Found")
- *                     _partid=int(line.strip().split("/")[-1])             # <<<<<<<<<<<<<<
- *                     partsection = True
- *                     i=0
- */
-              __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_line, __pyx_n_s_strip); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 234; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_5);
-              __pyx_t_2 = NULL;
-              if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_5))) {
-                __pyx_t_2 = PyMethod_GET_SELF(__pyx_t_5);
-                if (likely(__pyx_t_2)) {
-                  PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
-                  __Pyx_INCREF(__pyx_t_2);
-                  __Pyx_INCREF(function);
-                  __Pyx_DECREF_SET(__pyx_t_5, function);
-                }
-              }
-              if (__pyx_t_2) {
-                __pyx_t_4 = __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_2); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 234; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-              } else {
-                __pyx_t_4 = __Pyx_PyObject_CallNoArg(__pyx_t_5); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 234; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              }
-              __Pyx_GOTREF(__pyx_t_4);
-              __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-              __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_split); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 234; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_5);
-              __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-              __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_tuple__63, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 234; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_4);
-              __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-              __pyx_t_5 = __Pyx_GetItemInt(__pyx_t_4, -1L, long, 1, __Pyx_PyInt_From_long, 0, 1, 1); if (unlikely(__pyx_t_5 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 234; __pyx_clineno = __LINE__; goto __pyx_L7_error;};
-              __Pyx_GOTREF(__pyx_t_5);
-              __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-              __pyx_t_4 = PyNumber_Int(__pyx_t_5); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 234; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_4);
-              __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-              __Pyx_XDECREF_SET(__pyx_v__partid, __pyx_t_4);
-              __pyx_t_4 = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":235
- *                     # self.logger.debug("/PART Keyword Found")
- *                     _partid=int(line.strip().split("/")[-1])
- *                     partsection = True             # <<<<<<<<<<<<<<
- *                     i=0
- *                 elif (partsection == True) and (not("#" in line or "/" in line)):
- */
-              __pyx_v_partsection = 1;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":236
- *                     _partid=int(line.strip().split("/")[-1])
- *                     partsection = True
- *                     i=0             # <<<<<<<<<<<<<<
- *                 elif (partsection == True) and (not("#" in line or "/" in line)):
- *                     if i == 0: _title=line.strip()
- */
-              __Pyx_INCREF(__pyx_int_0);
-              __Pyx_DECREF_SET(__pyx_v_i, __pyx_int_0);
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":232
- *                     SHELLsection = False
- * 
- *                 if "/PART" in line[0:5]:             # <<<<<<<<<<<<<<
- *                     # self.logger.debug("/PART Keyword Found")
- *                     _partid=int(line.strip().split("/")[-1])
- */
-              goto __pyx_L48;
-            }
-
-            /* "cNK_FEMeshUtils\MeshReaders.py":237
- *                     partsection = True
- *                     i=0
- *                 elif (partsection == True) and (not("#" in line or "/" in line)):             # <<<<<<<<<<<<<<
- *                     if i == 0: _title=line.strip()
- *                     elif i == 1:
- */
-            __pyx_t_13 = ((__pyx_v_partsection == 1) != 0);
-            if (__pyx_t_13) {
-            } else {
-              __pyx_t_12 = __pyx_t_13;
-              goto __pyx_L49_bool_binop_done;
-            }
-            __pyx_t_14 = (__Pyx_PySequence_ContainsTF(__pyx_kp_s__38, __pyx_v_line, Py_EQ)); if (unlikely(__pyx_t_14 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 237; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __pyx_t_15 = (__pyx_t_14 != 0);
-            if (!__pyx_t_15) {
-            } else {
-              __pyx_t_13 = __pyx_t_15;
-              goto __pyx_L51_bool_binop_done;
-            }
-            __pyx_t_15 = (__Pyx_PySequence_ContainsTF(__pyx_kp_s__39, __pyx_v_line, Py_EQ)); if (unlikely(__pyx_t_15 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 237; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __pyx_t_14 = (__pyx_t_15 != 0);
-            __pyx_t_13 = __pyx_t_14;
-            __pyx_L51_bool_binop_done:;
-            __pyx_t_14 = ((!__pyx_t_13) != 0);
-            __pyx_t_12 = __pyx_t_14;
-            __pyx_L49_bool_binop_done:;
-            if (__pyx_t_12) {
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":238
- *                     i=0
- *                 elif (partsection == True) and (not("#" in line or "/" in line)):
- *                     if i == 0: _title=line.strip()             # <<<<<<<<<<<<<<
- *                     elif i == 1:
- *                         _propID=int(line[0:10])
- */
-              __pyx_t_4 = __Pyx_PyInt_EqObjC(__pyx_v_i, __pyx_int_0, 0, 0); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 238; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_4);
-              __pyx_t_12 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_12 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 238; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-              if (__pyx_t_12) {
-                __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_line, __pyx_n_s_strip); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 238; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_5);
-                __pyx_t_2 = NULL;
-                if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_5))) {
-                  __pyx_t_2 = PyMethod_GET_SELF(__pyx_t_5);
-                  if (likely(__pyx_t_2)) {
-                    PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
-                    __Pyx_INCREF(__pyx_t_2);
-                    __Pyx_INCREF(function);
-                    __Pyx_DECREF_SET(__pyx_t_5, function);
-                  }
-                }
-                if (__pyx_t_2) {
-                  __pyx_t_4 = __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_2); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 238; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-                } else {
-                  __pyx_t_4 = __Pyx_PyObject_CallNoArg(__pyx_t_5); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 238; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                }
-                __Pyx_GOTREF(__pyx_t_4);
-                __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-                __Pyx_XDECREF_SET(__pyx_v__title, __pyx_t_4);
-                __pyx_t_4 = 0;
-                goto __pyx_L53;
-              }
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":239
- *                 elif (partsection == True) and (not("#" in line or "/" in line)):
- *                     if i == 0: _title=line.strip()
- *                     elif i == 1:             # <<<<<<<<<<<<<<
- *                         _propID=int(line[0:10])
- *                         _matID=int(line[11:20])
- */
-              __pyx_t_4 = __Pyx_PyInt_EqObjC(__pyx_v_i, __pyx_int_1, 1, 0); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 239; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_4);
-              __pyx_t_12 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_12 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 239; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-              if (__pyx_t_12) {
-
-                /* "cNK_FEMeshUtils\MeshReaders.py":240
- *                     if i == 0: _title=line.strip()
- *                     elif i == 1:
- *                         _propID=int(line[0:10])             # <<<<<<<<<<<<<<
- *                         _matID=int(line[11:20])
- *                         _Mesh.addPart(_partid, _title, _propID, _matID)
- */
-                __pyx_t_4 = __Pyx_PyObject_GetSlice(__pyx_v_line, 0, 10, NULL, NULL, &__pyx_slice__64, 1, 1, 1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 240; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_4);
-                __pyx_t_5 = PyNumber_Int(__pyx_t_4); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 240; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_5);
-                __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-                __Pyx_XDECREF_SET(__pyx_v__propID, __pyx_t_5);
-                __pyx_t_5 = 0;
-
-                /* "cNK_FEMeshUtils\MeshReaders.py":241
- *                     elif i == 1:
- *                         _propID=int(line[0:10])
- *                         _matID=int(line[11:20])             # <<<<<<<<<<<<<<
- *                         _Mesh.addPart(_partid, _title, _propID, _matID)
- *                     i=i+1
- */
-                __pyx_t_5 = __Pyx_PyObject_GetSlice(__pyx_v_line, 11, 20, NULL, NULL, &__pyx_slice__65, 1, 1, 1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 241; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_5);
-                __pyx_t_4 = PyNumber_Int(__pyx_t_5); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 241; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_4);
-                __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-                __Pyx_XDECREF_SET(__pyx_v__matID, __pyx_t_4);
-                __pyx_t_4 = 0;
-
-                /* "cNK_FEMeshUtils\MeshReaders.py":242
- *                         _propID=int(line[0:10])
- *                         _matID=int(line[11:20])
- *                         _Mesh.addPart(_partid, _title, _propID, _matID)             # <<<<<<<<<<<<<<
- *                     i=i+1
- *                 elif partsection and "/" in line:
- */
-                if (unlikely(!__pyx_v__partid)) { __Pyx_RaiseUnboundLocalError("_partid"); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 242; __pyx_clineno = __LINE__; goto __pyx_L7_error;} }
-                __pyx_t_17 = __Pyx_PyInt_As_int(__pyx_v__partid); if (unlikely((__pyx_t_17 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 242; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                if (unlikely(!__pyx_v__title)) { __Pyx_RaiseUnboundLocalError("_title"); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 242; __pyx_clineno = __LINE__; goto __pyx_L7_error;} }
-                if (!(likely(PyString_CheckExact(__pyx_v__title))||((__pyx_v__title) == Py_None)||(PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "str", Py_TYPE(__pyx_v__title)->tp_name), 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 242; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __pyx_t_22 = __Pyx_PyInt_As_int(__pyx_v__propID); if (unlikely((__pyx_t_22 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 242; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __pyx_t_23 = __Pyx_PyInt_As_int(__pyx_v__matID); if (unlikely((__pyx_t_23 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 242; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __pyx_t_4 = ((struct __pyx_vtabstruct_15cNK_FEMeshUtils_4Mesh_Mesh *)__pyx_v__Mesh->__pyx_vtab)->addPart(__pyx_v__Mesh, __pyx_t_17, ((PyObject*)__pyx_v__title), __pyx_t_22, __pyx_t_23, 0); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 242; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_4);
-                __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-
-                /* "cNK_FEMeshUtils\MeshReaders.py":239
- *                 elif (partsection == True) and (not("#" in line or "/" in line)):
- *                     if i == 0: _title=line.strip()
- *                     elif i == 1:             # <<<<<<<<<<<<<<
- *                         _propID=int(line[0:10])
- *                         _matID=int(line[11:20])
- */
-              }
-              __pyx_L53:;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":243
- *                         _matID=int(line[11:20])
- *                         _Mesh.addPart(_partid, _title, _propID, _matID)
- *                     i=i+1             # <<<<<<<<<<<<<<
- *                 elif partsection and "/" in line:
- *                     partsection = False
- */
-              __pyx_t_4 = __Pyx_PyInt_AddObjC(__pyx_v_i, __pyx_int_1, 1, 0); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 243; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_4);
-              __Pyx_DECREF_SET(__pyx_v_i, __pyx_t_4);
-              __pyx_t_4 = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":237
- *                     partsection = True
- *                     i=0
- *                 elif (partsection == True) and (not("#" in line or "/" in line)):             # <<<<<<<<<<<<<<
- *                     if i == 0: _title=line.strip()
- *                     elif i == 1:
- */
-              goto __pyx_L48;
-            }
-
-            /* "cNK_FEMeshUtils\MeshReaders.py":244
- *                         _Mesh.addPart(_partid, _title, _propID, _matID)
- *                     i=i+1
- *                 elif partsection and "/" in line:             # <<<<<<<<<<<<<<
- *                     partsection = False
- * 
- */
-            __pyx_t_14 = (__pyx_v_partsection != 0);
-            if (__pyx_t_14) {
-            } else {
-              __pyx_t_12 = __pyx_t_14;
-              goto __pyx_L54_bool_binop_done;
-            }
-            __pyx_t_14 = (__Pyx_PySequence_ContainsTF(__pyx_kp_s__39, __pyx_v_line, Py_EQ)); if (unlikely(__pyx_t_14 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 244; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __pyx_t_13 = (__pyx_t_14 != 0);
-            __pyx_t_12 = __pyx_t_13;
-            __pyx_L54_bool_binop_done:;
-            if (__pyx_t_12) {
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":245
- *                     i=i+1
- *                 elif partsection and "/" in line:
- *                     partsection = False             # <<<<<<<<<<<<<<
- * 
- *                 if "/MAT/PLAS_TAB" in line[0:13]:
- */
-              __pyx_v_partsection = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":244
- *                         _Mesh.addPart(_partid, _title, _propID, _matID)
- *                     i=i+1
- *                 elif partsection and "/" in line:             # <<<<<<<<<<<<<<
- *                     partsection = False
- * 
- */
-            }
-            __pyx_L48:;
-
-            /* "cNK_FEMeshUtils\MeshReaders.py":247
- *                     partsection = False
- * 
- *                 if "/MAT/PLAS_TAB" in line[0:13]:             # <<<<<<<<<<<<<<
- *                     # self.logger.debug("/MAT/PLAS_TAB Keyword Found")
- *                     _matID=int(line.strip().split("/")[-1])
- */
-            __pyx_t_4 = __Pyx_PyObject_GetSlice(__pyx_v_line, 0, 13, NULL, NULL, &__pyx_slice__66, 1, 1, 1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 247; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __Pyx_GOTREF(__pyx_t_4);
-            __pyx_t_12 = (__Pyx_PySequence_ContainsTF(__pyx_kp_s_MAT_PLAS_TAB, __pyx_t_4, Py_EQ)); if (unlikely(__pyx_t_12 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 247; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-            __pyx_t_13 = (__pyx_t_12 != 0);
-            if (__pyx_t_13) {
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":249
- *                 if "/MAT/PLAS_TAB" in line[0:13]:
- *                     # self.logger.debug("/MAT/PLAS_TAB Keyword Found")
- *                     _matID=int(line.strip().split("/")[-1])             # <<<<<<<<<<<<<<
- *                     matsection = True
- *                     i=0
- */
-              __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_line, __pyx_n_s_strip); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 249; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_5);
-              __pyx_t_2 = NULL;
-              if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_5))) {
-                __pyx_t_2 = PyMethod_GET_SELF(__pyx_t_5);
-                if (likely(__pyx_t_2)) {
-                  PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
-                  __Pyx_INCREF(__pyx_t_2);
-                  __Pyx_INCREF(function);
-                  __Pyx_DECREF_SET(__pyx_t_5, function);
-                }
-              }
-              if (__pyx_t_2) {
-                __pyx_t_4 = __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_2); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 249; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-              } else {
-                __pyx_t_4 = __Pyx_PyObject_CallNoArg(__pyx_t_5); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 249; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              }
-              __Pyx_GOTREF(__pyx_t_4);
-              __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-              __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_split); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 249; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_5);
-              __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-              __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_tuple__67, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 249; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_4);
-              __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-              __pyx_t_5 = __Pyx_GetItemInt(__pyx_t_4, -1L, long, 1, __Pyx_PyInt_From_long, 0, 1, 1); if (unlikely(__pyx_t_5 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 249; __pyx_clineno = __LINE__; goto __pyx_L7_error;};
-              __Pyx_GOTREF(__pyx_t_5);
-              __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-              __pyx_t_4 = PyNumber_Int(__pyx_t_5); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 249; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_4);
-              __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-              __Pyx_XDECREF_SET(__pyx_v__matID, __pyx_t_4);
-              __pyx_t_4 = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":250
- *                     # self.logger.debug("/MAT/PLAS_TAB Keyword Found")
- *                     _matID=int(line.strip().split("/")[-1])
- *                     matsection = True             # <<<<<<<<<<<<<<
- *                     i=0
- *                 elif (matsection == True) and (not("#" in line or "/" in line)):
- */
-              __pyx_v_matsection = 1;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":251
- *                     _matID=int(line.strip().split("/")[-1])
- *                     matsection = True
- *                     i=0             # <<<<<<<<<<<<<<
- *                 elif (matsection == True) and (not("#" in line or "/" in line)):
- *                     if i == 0:
- */
-              __Pyx_INCREF(__pyx_int_0);
-              __Pyx_DECREF_SET(__pyx_v_i, __pyx_int_0);
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":247
- *                     partsection = False
- * 
- *                 if "/MAT/PLAS_TAB" in line[0:13]:             # <<<<<<<<<<<<<<
- *                     # self.logger.debug("/MAT/PLAS_TAB Keyword Found")
- *                     _matID=int(line.strip().split("/")[-1])
- */
-              goto __pyx_L56;
-            }
-
-            /* "cNK_FEMeshUtils\MeshReaders.py":252
- *                     matsection = True
- *                     i=0
- *                 elif (matsection == True) and (not("#" in line or "/" in line)):             # <<<<<<<<<<<<<<
- *                     if i == 0:
- *                         _title=line.strip()
- */
-            __pyx_t_12 = ((__pyx_v_matsection == 1) != 0);
-            if (__pyx_t_12) {
-            } else {
-              __pyx_t_13 = __pyx_t_12;
-              goto __pyx_L57_bool_binop_done;
-            }
-            __pyx_t_14 = (__Pyx_PySequence_ContainsTF(__pyx_kp_s__38, __pyx_v_line, Py_EQ)); if (unlikely(__pyx_t_14 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 252; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __pyx_t_15 = (__pyx_t_14 != 0);
-            if (!__pyx_t_15) {
-            } else {
-              __pyx_t_12 = __pyx_t_15;
-              goto __pyx_L59_bool_binop_done;
-            }
-            __pyx_t_15 = (__Pyx_PySequence_ContainsTF(__pyx_kp_s__39, __pyx_v_line, Py_EQ)); if (unlikely(__pyx_t_15 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 252; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __pyx_t_14 = (__pyx_t_15 != 0);
-            __pyx_t_12 = __pyx_t_14;
-            __pyx_L59_bool_binop_done:;
-            __pyx_t_14 = ((!__pyx_t_12) != 0);
-            __pyx_t_13 = __pyx_t_14;
-            __pyx_L57_bool_binop_done:;
-            if (__pyx_t_13) {
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":253
- *                     i=0
- *                 elif (matsection == True) and (not("#" in line or "/" in line)):
- *                     if i == 0:             # <<<<<<<<<<<<<<
- *                         _title=line.strip()
- *                     elif i == 1:
- */
-              __pyx_t_4 = __Pyx_PyInt_EqObjC(__pyx_v_i, __pyx_int_0, 0, 0); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 253; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_4);
-              __pyx_t_13 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_13 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 253; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-              if (__pyx_t_13) {
-
-                /* "cNK_FEMeshUtils\MeshReaders.py":254
- *                 elif (matsection == True) and (not("#" in line or "/" in line)):
- *                     if i == 0:
- *                         _title=line.strip()             # <<<<<<<<<<<<<<
- *                     elif i == 1:
- *                         _rho=float(line[0:20])
- */
-                __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_line, __pyx_n_s_strip); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 254; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_5);
-                __pyx_t_2 = NULL;
-                if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_5))) {
-                  __pyx_t_2 = PyMethod_GET_SELF(__pyx_t_5);
-                  if (likely(__pyx_t_2)) {
-                    PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
-                    __Pyx_INCREF(__pyx_t_2);
-                    __Pyx_INCREF(function);
-                    __Pyx_DECREF_SET(__pyx_t_5, function);
-                  }
-                }
-                if (__pyx_t_2) {
-                  __pyx_t_4 = __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_2); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 254; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-                } else {
-                  __pyx_t_4 = __Pyx_PyObject_CallNoArg(__pyx_t_5); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 254; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                }
-                __Pyx_GOTREF(__pyx_t_4);
-                __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-                __Pyx_XDECREF_SET(__pyx_v__title, __pyx_t_4);
-                __pyx_t_4 = 0;
-
-                /* "cNK_FEMeshUtils\MeshReaders.py":253
- *                     i=0
- *                 elif (matsection == True) and (not("#" in line or "/" in line)):
- *                     if i == 0:             # <<<<<<<<<<<<<<
- *                         _title=line.strip()
- *                     elif i == 1:
- */
-                goto __pyx_L61;
-              }
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":255
- *                     if i == 0:
- *                         _title=line.strip()
- *                     elif i == 1:             # <<<<<<<<<<<<<<
- *                         _rho=float(line[0:20])
- *                     elif i == 2:
- */
-              __pyx_t_4 = __Pyx_PyInt_EqObjC(__pyx_v_i, __pyx_int_1, 1, 0); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 255; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_4);
-              __pyx_t_13 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_13 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 255; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-              if (__pyx_t_13) {
-
-                /* "cNK_FEMeshUtils\MeshReaders.py":256
- *                         _title=line.strip()
- *                     elif i == 1:
- *                         _rho=float(line[0:20])             # <<<<<<<<<<<<<<
- *                     elif i == 2:
- *                         _E=float(line[0:20])
- */
-                __pyx_t_4 = __Pyx_PyObject_GetSlice(__pyx_v_line, 0, 20, NULL, NULL, &__pyx_slice__68, 1, 1, 1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 256; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_4);
-                __pyx_t_16 = __Pyx_PyObject_AsDouble(__pyx_t_4); if (unlikely(__pyx_t_16 == ((double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 256; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-                __pyx_v__rho = __pyx_t_16;
-
-                /* "cNK_FEMeshUtils\MeshReaders.py":255
- *                     if i == 0:
- *                         _title=line.strip()
- *                     elif i == 1:             # <<<<<<<<<<<<<<
- *                         _rho=float(line[0:20])
- *                     elif i == 2:
- */
-                goto __pyx_L61;
-              }
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":257
- *                     elif i == 1:
- *                         _rho=float(line[0:20])
- *                     elif i == 2:             # <<<<<<<<<<<<<<
- *                         _E=float(line[0:20])
- *                         _Mesh.addMat(_matID, _rho, _E)
- */
-              __pyx_t_4 = __Pyx_PyInt_EqObjC(__pyx_v_i, __pyx_int_2, 2, 0); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 257; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_4);
-              __pyx_t_13 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_13 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 257; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-              if (__pyx_t_13) {
-
-                /* "cNK_FEMeshUtils\MeshReaders.py":258
- *                         _rho=float(line[0:20])
- *                     elif i == 2:
- *                         _E=float(line[0:20])             # <<<<<<<<<<<<<<
- *                         _Mesh.addMat(_matID, _rho, _E)
- *                     i=i+1
- */
-                __pyx_t_4 = __Pyx_PyObject_GetSlice(__pyx_v_line, 0, 20, NULL, NULL, &__pyx_slice__69, 1, 1, 1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 258; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_4);
-                __pyx_t_16 = __Pyx_PyObject_AsDouble(__pyx_t_4); if (unlikely(__pyx_t_16 == ((double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 258; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-                __pyx_v__E = __pyx_t_16;
-
-                /* "cNK_FEMeshUtils\MeshReaders.py":259
- *                     elif i == 2:
- *                         _E=float(line[0:20])
- *                         _Mesh.addMat(_matID, _rho, _E)             # <<<<<<<<<<<<<<
- *                     i=i+1
- *                 elif matsection and "/" in line:
- */
-                if (unlikely(!__pyx_v__matID)) { __Pyx_RaiseUnboundLocalError("_matID"); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 259; __pyx_clineno = __LINE__; goto __pyx_L7_error;} }
-                __pyx_t_23 = __Pyx_PyInt_As_int(__pyx_v__matID); if (unlikely((__pyx_t_23 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 259; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __pyx_t_4 = ((struct __pyx_vtabstruct_15cNK_FEMeshUtils_4Mesh_Mesh *)__pyx_v__Mesh->__pyx_vtab)->addMat(__pyx_v__Mesh, __pyx_t_23, __pyx_v__rho, __pyx_v__E, 0); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 259; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_4);
-                __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-
-                /* "cNK_FEMeshUtils\MeshReaders.py":257
- *                     elif i == 1:
- *                         _rho=float(line[0:20])
- *                     elif i == 2:             # <<<<<<<<<<<<<<
- *                         _E=float(line[0:20])
- *                         _Mesh.addMat(_matID, _rho, _E)
- */
-              }
-              __pyx_L61:;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":260
- *                         _E=float(line[0:20])
- *                         _Mesh.addMat(_matID, _rho, _E)
- *                     i=i+1             # <<<<<<<<<<<<<<
- *                 elif matsection and "/" in line:
- *                     matsection = False
- */
-              __pyx_t_4 = __Pyx_PyInt_AddObjC(__pyx_v_i, __pyx_int_1, 1, 0); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 260; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_4);
-              __Pyx_DECREF_SET(__pyx_v_i, __pyx_t_4);
-              __pyx_t_4 = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":252
- *                     matsection = True
- *                     i=0
- *                 elif (matsection == True) and (not("#" in line or "/" in line)):             # <<<<<<<<<<<<<<
- *                     if i == 0:
- *                         _title=line.strip()
- */
-              goto __pyx_L56;
-            }
-
-            /* "cNK_FEMeshUtils\MeshReaders.py":261
- *                         _Mesh.addMat(_matID, _rho, _E)
- *                     i=i+1
- *                 elif matsection and "/" in line:             # <<<<<<<<<<<<<<
- *                     matsection = False
- * 
- */
-            __pyx_t_14 = (__pyx_v_matsection != 0);
-            if (__pyx_t_14) {
-            } else {
-              __pyx_t_13 = __pyx_t_14;
-              goto __pyx_L62_bool_binop_done;
-            }
-            __pyx_t_14 = (__Pyx_PySequence_ContainsTF(__pyx_kp_s__39, __pyx_v_line, Py_EQ)); if (unlikely(__pyx_t_14 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 261; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __pyx_t_12 = (__pyx_t_14 != 0);
-            __pyx_t_13 = __pyx_t_12;
-            __pyx_L62_bool_binop_done:;
-            if (__pyx_t_13) {
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":262
- *                     i=i+1
- *                 elif matsection and "/" in line:
- *                     matsection = False             # <<<<<<<<<<<<<<
- * 
- *                 if "/PROP/SHELL" in line[0:11]:
- */
-              __pyx_v_matsection = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":261
- *                         _Mesh.addMat(_matID, _rho, _E)
- *                     i=i+1
- *                 elif matsection and "/" in line:             # <<<<<<<<<<<<<<
- *                     matsection = False
- * 
- */
-            }
-            __pyx_L56:;
-
-            /* "cNK_FEMeshUtils\MeshReaders.py":264
- *                     matsection = False
- * 
- *                 if "/PROP/SHELL" in line[0:11]:             # <<<<<<<<<<<<<<
- *                     # self.logger.debug("/PROP/SHELL Keyword Found")
- *                     _propID=float(line.strip().split("/")[-1])
- */
-            __pyx_t_4 = __Pyx_PyObject_GetSlice(__pyx_v_line, 0, 11, NULL, NULL, &__pyx_slice__70, 1, 1, 1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 264; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __Pyx_GOTREF(__pyx_t_4);
-            __pyx_t_13 = (__Pyx_PySequence_ContainsTF(__pyx_kp_s_PROP_SHELL, __pyx_t_4, Py_EQ)); if (unlikely(__pyx_t_13 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 264; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-            __pyx_t_12 = (__pyx_t_13 != 0);
-            if (__pyx_t_12) {
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":266
- *                 if "/PROP/SHELL" in line[0:11]:
- *                     # self.logger.debug("/PROP/SHELL Keyword Found")
- *                     _propID=float(line.strip().split("/")[-1])             # <<<<<<<<<<<<<<
- *                     propsection = True
- *                     i=0
- */
-              __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_line, __pyx_n_s_strip); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 266; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_5);
-              __pyx_t_2 = NULL;
-              if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_5))) {
-                __pyx_t_2 = PyMethod_GET_SELF(__pyx_t_5);
-                if (likely(__pyx_t_2)) {
-                  PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
-                  __Pyx_INCREF(__pyx_t_2);
-                  __Pyx_INCREF(function);
-                  __Pyx_DECREF_SET(__pyx_t_5, function);
-                }
-              }
-              if (__pyx_t_2) {
-                __pyx_t_4 = __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_2); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 266; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-              } else {
-                __pyx_t_4 = __Pyx_PyObject_CallNoArg(__pyx_t_5); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 266; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              }
-              __Pyx_GOTREF(__pyx_t_4);
-              __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-              __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_split); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 266; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_5);
-              __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-              __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_tuple__71, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 266; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_4);
-              __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-              __pyx_t_5 = __Pyx_GetItemInt(__pyx_t_4, -1L, long, 1, __Pyx_PyInt_From_long, 0, 1, 1); if (unlikely(__pyx_t_5 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 266; __pyx_clineno = __LINE__; goto __pyx_L7_error;};
-              __Pyx_GOTREF(__pyx_t_5);
-              __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-              __pyx_t_16 = __Pyx_PyObject_AsDouble(__pyx_t_5); if (unlikely(__pyx_t_16 == ((double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 266; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-              __pyx_t_5 = PyFloat_FromDouble(__pyx_t_16); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 266; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_5);
-              __Pyx_XDECREF_SET(__pyx_v__propID, __pyx_t_5);
-              __pyx_t_5 = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":267
- *                     # self.logger.debug("/PROP/SHELL Keyword Found")
- *                     _propID=float(line.strip().split("/")[-1])
- *                     propsection = True             # <<<<<<<<<<<<<<
- *                     i=0
- *                 elif (propsection == True) and (not("#" in line or "/" in line)):
- */
-              __pyx_v_propsection = 1;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":268
- *                     _propID=float(line.strip().split("/")[-1])
- *                     propsection = True
- *                     i=0             # <<<<<<<<<<<<<<
- *                 elif (propsection == True) and (not("#" in line or "/" in line)):
- *                     if i == 0:
- */
-              __Pyx_INCREF(__pyx_int_0);
-              __Pyx_DECREF_SET(__pyx_v_i, __pyx_int_0);
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":264
- *                     matsection = False
- * 
- *                 if "/PROP/SHELL" in line[0:11]:             # <<<<<<<<<<<<<<
- *                     # self.logger.debug("/PROP/SHELL Keyword Found")
- *                     _propID=float(line.strip().split("/")[-1])
- */
-              goto __pyx_L64;
-            }
-
-            /* "cNK_FEMeshUtils\MeshReaders.py":269
- *                     propsection = True
- *                     i=0
- *                 elif (propsection == True) and (not("#" in line or "/" in line)):             # <<<<<<<<<<<<<<
- *                     if i == 0:
- *                         _title=line.strip()
- */
-            __pyx_t_13 = ((__pyx_v_propsection == 1) != 0);
-            if (__pyx_t_13) {
-            } else {
-              __pyx_t_12 = __pyx_t_13;
-              goto __pyx_L65_bool_binop_done;
-            }
-            __pyx_t_14 = (__Pyx_PySequence_ContainsTF(__pyx_kp_s__38, __pyx_v_line, Py_EQ)); if (unlikely(__pyx_t_14 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 269; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __pyx_t_15 = (__pyx_t_14 != 0);
-            if (!__pyx_t_15) {
-            } else {
-              __pyx_t_13 = __pyx_t_15;
-              goto __pyx_L67_bool_binop_done;
-            }
-            __pyx_t_15 = (__Pyx_PySequence_ContainsTF(__pyx_kp_s__39, __pyx_v_line, Py_EQ)); if (unlikely(__pyx_t_15 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 269; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __pyx_t_14 = (__pyx_t_15 != 0);
-            __pyx_t_13 = __pyx_t_14;
-            __pyx_L67_bool_binop_done:;
-            __pyx_t_14 = ((!__pyx_t_13) != 0);
-            __pyx_t_12 = __pyx_t_14;
-            __pyx_L65_bool_binop_done:;
-            if (__pyx_t_12) {
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":270
- *                     i=0
- *                 elif (propsection == True) and (not("#" in line or "/" in line)):
- *                     if i == 0:             # <<<<<<<<<<<<<<
- *                         _title=line.strip()
- *                     elif i == 3:
- */
-              __pyx_t_5 = __Pyx_PyInt_EqObjC(__pyx_v_i, __pyx_int_0, 0, 0); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 270; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_5);
-              __pyx_t_12 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_12 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 270; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-              if (__pyx_t_12) {
-
-                /* "cNK_FEMeshUtils\MeshReaders.py":271
- *                 elif (propsection == True) and (not("#" in line or "/" in line)):
- *                     if i == 0:
- *                         _title=line.strip()             # <<<<<<<<<<<<<<
- *                     elif i == 3:
- *                         _thick=float(line[21:40])
- */
-                __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_line, __pyx_n_s_strip); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 271; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_4);
-                __pyx_t_2 = NULL;
-                if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_4))) {
-                  __pyx_t_2 = PyMethod_GET_SELF(__pyx_t_4);
-                  if (likely(__pyx_t_2)) {
-                    PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
-                    __Pyx_INCREF(__pyx_t_2);
-                    __Pyx_INCREF(function);
-                    __Pyx_DECREF_SET(__pyx_t_4, function);
-                  }
-                }
-                if (__pyx_t_2) {
-                  __pyx_t_5 = __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_2); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 271; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-                } else {
-                  __pyx_t_5 = __Pyx_PyObject_CallNoArg(__pyx_t_4); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 271; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                }
-                __Pyx_GOTREF(__pyx_t_5);
-                __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-                __Pyx_XDECREF_SET(__pyx_v__title, __pyx_t_5);
-                __pyx_t_5 = 0;
-
-                /* "cNK_FEMeshUtils\MeshReaders.py":270
- *                     i=0
- *                 elif (propsection == True) and (not("#" in line or "/" in line)):
- *                     if i == 0:             # <<<<<<<<<<<<<<
- *                         _title=line.strip()
- *                     elif i == 3:
- */
-                goto __pyx_L69;
-              }
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":272
- *                     if i == 0:
- *                         _title=line.strip()
- *                     elif i == 3:             # <<<<<<<<<<<<<<
- *                         _thick=float(line[21:40])
- *                         _Mesh.addProp(_propID, _thick)
- */
-              __pyx_t_5 = __Pyx_PyInt_EqObjC(__pyx_v_i, __pyx_int_3, 3, 0); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 272; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_5);
-              __pyx_t_12 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_12 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 272; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-              if (__pyx_t_12) {
-
-                /* "cNK_FEMeshUtils\MeshReaders.py":273
- *                         _title=line.strip()
- *                     elif i == 3:
- *                         _thick=float(line[21:40])             # <<<<<<<<<<<<<<
- *                         _Mesh.addProp(_propID, _thick)
- *                     i=i+1
- */
-                __pyx_t_5 = __Pyx_PyObject_GetSlice(__pyx_v_line, 21, 40, NULL, NULL, &__pyx_slice__72, 1, 1, 1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_5);
-                __pyx_t_16 = __Pyx_PyObject_AsDouble(__pyx_t_5); if (unlikely(__pyx_t_16 == ((double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-                __pyx_v__thick = __pyx_t_16;
-
-                /* "cNK_FEMeshUtils\MeshReaders.py":274
- *                     elif i == 3:
- *                         _thick=float(line[21:40])
- *                         _Mesh.addProp(_propID, _thick)             # <<<<<<<<<<<<<<
- *                     i=i+1
- *                 elif propsection and "/" in line:
- */
-                if (unlikely(!__pyx_v__propID)) { __Pyx_RaiseUnboundLocalError("_propID"); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 274; __pyx_clineno = __LINE__; goto __pyx_L7_error;} }
-                __pyx_t_23 = __Pyx_PyInt_As_int(__pyx_v__propID); if (unlikely((__pyx_t_23 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 274; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __pyx_t_5 = ((struct __pyx_vtabstruct_15cNK_FEMeshUtils_4Mesh_Mesh *)__pyx_v__Mesh->__pyx_vtab)->addProp(__pyx_v__Mesh, __pyx_t_23, __pyx_v__thick, 0); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 274; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_5);
-                __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-
-                /* "cNK_FEMeshUtils\MeshReaders.py":272
- *                     if i == 0:
- *                         _title=line.strip()
- *                     elif i == 3:             # <<<<<<<<<<<<<<
- *                         _thick=float(line[21:40])
- *                         _Mesh.addProp(_propID, _thick)
- */
-              }
-              __pyx_L69:;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":275
- *                         _thick=float(line[21:40])
- *                         _Mesh.addProp(_propID, _thick)
- *                     i=i+1             # <<<<<<<<<<<<<<
- *                 elif propsection and "/" in line:
- *                     propsection = False
- */
-              __pyx_t_5 = __Pyx_PyInt_AddObjC(__pyx_v_i, __pyx_int_1, 1, 0); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 275; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_5);
-              __Pyx_DECREF_SET(__pyx_v_i, __pyx_t_5);
-              __pyx_t_5 = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":269
- *                     propsection = True
- *                     i=0
- *                 elif (propsection == True) and (not("#" in line or "/" in line)):             # <<<<<<<<<<<<<<
- *                     if i == 0:
- *                         _title=line.strip()
- */
-              goto __pyx_L64;
-            }
-
-            /* "cNK_FEMeshUtils\MeshReaders.py":276
- *                         _Mesh.addProp(_propID, _thick)
- *                     i=i+1
- *                 elif propsection and "/" in line:             # <<<<<<<<<<<<<<
- *                     propsection = False
- * 
- */
-            __pyx_t_14 = (__pyx_v_propsection != 0);
-            if (__pyx_t_14) {
-            } else {
-              __pyx_t_12 = __pyx_t_14;
-              goto __pyx_L70_bool_binop_done;
-            }
-            __pyx_t_14 = (__Pyx_PySequence_ContainsTF(__pyx_kp_s__39, __pyx_v_line, Py_EQ)); if (unlikely(__pyx_t_14 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 276; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __pyx_t_13 = (__pyx_t_14 != 0);
-            __pyx_t_12 = __pyx_t_13;
-            __pyx_L70_bool_binop_done:;
-            if (__pyx_t_12) {
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":277
- *                     i=i+1
- *                 elif propsection and "/" in line:
- *                     propsection = False             # <<<<<<<<<<<<<<
- * 
- *         # self.logger.info("Radioss Mesh successfully read")
- */
-              __pyx_v_propsection = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":276
- *                         _Mesh.addProp(_propID, _thick)
- *                     i=i+1
- *                 elif propsection and "/" in line:             # <<<<<<<<<<<<<<
- *                     propsection = False
- * 
- */
-            }
-            __pyx_L64:;
-
-            /* "cNK_FEMeshUtils\MeshReaders.py":178
- * 
- *         with open(file, "r") as f:
- *             for line in f:             # <<<<<<<<<<<<<<
- *                 # if "#RADIOSS STARTER" in line:
- *                     # self.logger.debug("#RADIOSS STARTER found")
- */
-          }
-          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-
-          /* "cNK_FEMeshUtils\MeshReaders.py":177
- *         _Mesh=Mesh(file,"Radioss")
- * 
- *         with open(file, "r") as f:             # <<<<<<<<<<<<<<
- *             for line in f:
- *                 # if "#RADIOSS STARTER" in line:
- */
-        }
-        __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
-        __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
-        __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
-        goto __pyx_L14_try_end;
-        __pyx_L7_error:;
-        __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
-        __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-        __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-        __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-        /*except:*/ {
-          __Pyx_AddTraceback("cNK_FEMeshUtils.MeshReaders.MeshReaders.readRadiossMesh", __pyx_clineno, __pyx_lineno, __pyx_filename);
-          if (__Pyx_GetException(&__pyx_t_3, &__pyx_t_5, &__pyx_t_4) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 177; __pyx_clineno = __LINE__; goto __pyx_L9_except_error;}
-          __Pyx_GOTREF(__pyx_t_3);
-          __Pyx_GOTREF(__pyx_t_5);
-          __Pyx_GOTREF(__pyx_t_4);
-          __pyx_t_2 = PyTuple_Pack(3, __pyx_t_3, __pyx_t_5, __pyx_t_4); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 177; __pyx_clineno = __LINE__; goto __pyx_L9_except_error;}
-          __Pyx_GOTREF(__pyx_t_2);
-          __pyx_t_21 = __Pyx_PyObject_Call(__pyx_t_6, __pyx_t_2, NULL);
-          __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-          __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-          if (unlikely(!__pyx_t_21)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 177; __pyx_clineno = __LINE__; goto __pyx_L9_except_error;}
-          __Pyx_GOTREF(__pyx_t_21);
-          __pyx_t_12 = __Pyx_PyObject_IsTrue(__pyx_t_21);
-          __Pyx_DECREF(__pyx_t_21); __pyx_t_21 = 0;
-          if (__pyx_t_12 < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 177; __pyx_clineno = __LINE__; goto __pyx_L9_except_error;}
-          __pyx_t_13 = ((!(__pyx_t_12 != 0)) != 0);
-          if (__pyx_t_13) {
-            __Pyx_GIVEREF(__pyx_t_3);
-            __Pyx_GIVEREF(__pyx_t_5);
-            __Pyx_XGIVEREF(__pyx_t_4);
-            __Pyx_ErrRestore(__pyx_t_3, __pyx_t_5, __pyx_t_4);
-            __pyx_t_3 = 0; __pyx_t_5 = 0; __pyx_t_4 = 0; 
-            {__pyx_filename = __pyx_f[0]; __pyx_lineno = 177; __pyx_clineno = __LINE__; goto __pyx_L9_except_error;}
-          }
-          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-          __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-          __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-          goto __pyx_L8_exception_handled;
-        }
-        __pyx_L9_except_error:;
-        __Pyx_XGIVEREF(__pyx_t_7);
-        __Pyx_XGIVEREF(__pyx_t_8);
-        __Pyx_XGIVEREF(__pyx_t_9);
-        __Pyx_ExceptionReset(__pyx_t_7, __pyx_t_8, __pyx_t_9);
-        goto __pyx_L1_error;
-        __pyx_L8_exception_handled:;
-        __Pyx_XGIVEREF(__pyx_t_7);
-        __Pyx_XGIVEREF(__pyx_t_8);
-        __Pyx_XGIVEREF(__pyx_t_9);
-        __Pyx_ExceptionReset(__pyx_t_7, __pyx_t_8, __pyx_t_9);
-        __pyx_L14_try_end:;
-      }
-    }
-    /*finally:*/ {
-      /*normal exit:*/{
-        if (__pyx_t_6) {
-          __pyx_t_9 = __Pyx_PyObject_Call(__pyx_t_6, __pyx_tuple__73, NULL);
-          __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-          if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 177; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-          __Pyx_GOTREF(__pyx_t_9);
-          __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-        }
-        goto __pyx_L6;
-      }
-      __pyx_L6:;
-    }
-    goto __pyx_L75;
-    __pyx_L3_error:;
-    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    goto __pyx_L1_error;
-    __pyx_L75:;
-  }
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":288
- *         # self.logger.info("Number of NThck: "+str(len(_Mesh.Nodalthickness)))
- * 
- *         return _Mesh             # <<<<<<<<<<<<<<
- * 
- *     def writeDynaMesh(self, _Mesh, file):
- */
-  __Pyx_XDECREF(((PyObject *)__pyx_r));
-  __Pyx_INCREF(((PyObject *)__pyx_v__Mesh));
-  __pyx_r = __pyx_v__Mesh;
-  goto __pyx_L0;
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":164
- *         return _Mesh
- * 
- *     def readRadiossMesh(self, file):             # <<<<<<<<<<<<<<
- *         nodesection = False
- *         SH3Nsection = False
- */
-
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_AddTraceback("cNK_FEMeshUtils.MeshReaders.MeshReaders.readRadiossMesh", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_i);
-  __Pyx_XDECREF((PyObject *)__pyx_v__Mesh);
-  __Pyx_XDECREF(__pyx_v_f);
-  __Pyx_XDECREF(__pyx_v_line);
-  __Pyx_XDECREF(__pyx_v__nodeID);
-  __Pyx_XDECREF(__pyx_v__partid);
-  __Pyx_XDECREF(__pyx_v__elID);
-  __Pyx_XDECREF(__pyx_v__n1);
-  __Pyx_XDECREF(__pyx_v__n2);
-  __Pyx_XDECREF(__pyx_v__n3);
-  __Pyx_XDECREF(__pyx_v__n4);
-  __Pyx_XDECREF(__pyx_v__title);
-  __Pyx_XDECREF(__pyx_v__propID);
-  __Pyx_XDECREF(__pyx_v__matID);
-  __Pyx_XGIVEREF((PyObject *)__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* Python wrapper */
-static PyObject *__pyx_pw_15cNK_FEMeshUtils_11MeshReaders_11MeshReaders_3readRadiossMesh(PyObject *__pyx_v_self, PyObject *__pyx_v_file); /*proto*/
-static PyObject *__pyx_pw_15cNK_FEMeshUtils_11MeshReaders_11MeshReaders_3readRadiossMesh(PyObject *__pyx_v_self, PyObject *__pyx_v_file) {
-  CYTHON_UNUSED int __pyx_lineno = 0;
-  CYTHON_UNUSED const char *__pyx_filename = NULL;
-  CYTHON_UNUSED int __pyx_clineno = 0;
-  PyObject *__pyx_r = 0;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("readRadiossMesh (wrapper)", 0);
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_file), (&PyString_Type), 1, "file", 1))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 164; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_r = __pyx_pf_15cNK_FEMeshUtils_11MeshReaders_11MeshReaders_2readRadiossMesh(((struct __pyx_obj_15cNK_FEMeshUtils_11MeshReaders_MeshReaders *)__pyx_v_self), ((PyObject*)__pyx_v_file));
-
-  /* function exit code */
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-static PyObject *__pyx_pf_15cNK_FEMeshUtils_11MeshReaders_11MeshReaders_2readRadiossMesh(struct __pyx_obj_15cNK_FEMeshUtils_11MeshReaders_MeshReaders *__pyx_v_self, PyObject *__pyx_v_file) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("readRadiossMesh", 0);
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = ((PyObject *)__pyx_f_15cNK_FEMeshUtils_11MeshReaders_11MeshReaders_readRadiossMesh(__pyx_v_self, __pyx_v_file, 1)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 164; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("cNK_FEMeshUtils.MeshReaders.MeshReaders.readRadiossMesh", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "cNK_FEMeshUtils\MeshReaders.py":290
- *         return _Mesh
- * 
- *     def writeDynaMesh(self, _Mesh, file):             # <<<<<<<<<<<<<<
- *         elemsection = False
- *         elemthicksection = False
- */
-
-static PyObject *__pyx_pw_15cNK_FEMeshUtils_11MeshReaders_11MeshReaders_5writeDynaMesh(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_f_15cNK_FEMeshUtils_11MeshReaders_11MeshReaders_writeDynaMesh(CYTHON_UNUSED struct __pyx_obj_15cNK_FEMeshUtils_11MeshReaders_MeshReaders *__pyx_v_self, struct __pyx_obj_15cNK_FEMeshUtils_4Mesh_Mesh *__pyx_v__Mesh, PyObject *__pyx_v_file, int __pyx_skip_dispatch) {
-  int __pyx_v_elemsection;
-  int __pyx_v_elemthicksection;
-  int __pyx_v_elemshellthicknesswritten;
-  int __pyx_v_elemshellwritten;
-  int __pyx_v_nodesection;
-  PyObject *__pyx_v_i = NULL;
-  PyObject *__pyx_v_ofile = NULL;
-  PyObject *__pyx_v_f = NULL;
-  PyObject *__pyx_v_line = NULL;
-  double __pyx_v_n1;
-  double __pyx_v_n2;
-  double __pyx_v_n3;
-  double __pyx_v_n4;
-  PyObject *__pyx_v_s = NULL;
-  PyObject *__pyx_v_nid = NULL;
-  double __pyx_v_x;
-  double __pyx_v_y;
-  double __pyx_v_z;
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  Py_ssize_t __pyx_t_5;
-  PyObject *__pyx_t_6 = NULL;
-  PyObject *__pyx_t_7 = NULL;
-  PyObject *__pyx_t_8 = NULL;
-  PyObject *__pyx_t_9 = NULL;
-  PyObject *__pyx_t_10 = NULL;
-  PyObject *(*__pyx_t_11)(PyObject *);
-  int __pyx_t_12;
-  int __pyx_t_13;
-  int __pyx_t_14;
-  int __pyx_t_15;
-  int __pyx_t_16;
-  double __pyx_t_17;
-  PyObject *__pyx_t_18 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("writeDynaMesh", 0);
-  /* Check if called by wrapper */
-  if (unlikely(__pyx_skip_dispatch)) ;
-  /* Check if overridden in Python */
-  else if (unlikely(Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0)) {
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_writeDynaMesh); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 290; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)__pyx_pw_15cNK_FEMeshUtils_11MeshReaders_11MeshReaders_5writeDynaMesh)) {
-      __Pyx_XDECREF(__pyx_r);
-      __Pyx_INCREF(__pyx_t_1);
-      __pyx_t_3 = __pyx_t_1; __pyx_t_4 = NULL;
-      __pyx_t_5 = 0;
-      if (CYTHON_COMPILING_IN_CPYTHON && unlikely(PyMethod_Check(__pyx_t_3))) {
-        __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
-        if (likely(__pyx_t_4)) {
-          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-          __Pyx_INCREF(__pyx_t_4);
-          __Pyx_INCREF(function);
-          __Pyx_DECREF_SET(__pyx_t_3, function);
-          __pyx_t_5 = 1;
-        }
-      }
-      __pyx_t_6 = PyTuple_New(2+__pyx_t_5); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 290; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_6);
-      if (__pyx_t_4) {
-        __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_4); __pyx_t_4 = NULL;
-      }
-      __Pyx_INCREF(((PyObject *)__pyx_v__Mesh));
-      __Pyx_GIVEREF(((PyObject *)__pyx_v__Mesh));
-      PyTuple_SET_ITEM(__pyx_t_6, 0+__pyx_t_5, ((PyObject *)__pyx_v__Mesh));
-      __Pyx_INCREF(__pyx_v_file);
-      __Pyx_GIVEREF(__pyx_v_file);
-      PyTuple_SET_ITEM(__pyx_t_6, 1+__pyx_t_5, __pyx_v_file);
-      __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_6, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 290; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_r = __pyx_t_2;
-      __pyx_t_2 = 0;
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      goto __pyx_L0;
-    }
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  }
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":291
- * 
- *     def writeDynaMesh(self, _Mesh, file):
- *         elemsection = False             # <<<<<<<<<<<<<<
- *         elemthicksection = False
- *         elemshellthicknesswritten = False
- */
-  __pyx_v_elemsection = 0;
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":292
- *     def writeDynaMesh(self, _Mesh, file):
- *         elemsection = False
- *         elemthicksection = False             # <<<<<<<<<<<<<<
- *         elemshellthicknesswritten = False
- *         elemshellwritten = False
- */
-  __pyx_v_elemthicksection = 0;
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":293
- *         elemsection = False
- *         elemthicksection = False
- *         elemshellthicknesswritten = False             # <<<<<<<<<<<<<<
- *         elemshellwritten = False
- *         nodesection = False
- */
-  __pyx_v_elemshellthicknesswritten = 0;
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":294
- *         elemthicksection = False
- *         elemshellthicknesswritten = False
- *         elemshellwritten = False             # <<<<<<<<<<<<<<
- *         nodesection = False
- *         i=0
- */
-  __pyx_v_elemshellwritten = 0;
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":295
- *         elemshellthicknesswritten = False
- *         elemshellwritten = False
- *         nodesection = False             # <<<<<<<<<<<<<<
- *         i=0
- * 
- */
-  __pyx_v_nodesection = 0;
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":296
- *         elemshellwritten = False
- *         nodesection = False
- *         i=0             # <<<<<<<<<<<<<<
- * 
- *         ofile=open(file, "w")
- */
-  __Pyx_INCREF(__pyx_int_0);
-  __pyx_v_i = __pyx_int_0;
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":298
- *         i=0
- * 
- *         ofile=open(file, "w")             # <<<<<<<<<<<<<<
- *         ofile.write("$ - Mubea TRB CAE - FE_Mesh_Handlers - writeDynaMesh\n")
- *         ofile.write("$ - Date/Time: "+datetime.now().strftime('%Y/%m/%d %H:%M:%S')+"\n")
- */
-  __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 298; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_INCREF(__pyx_v_file);
-  __Pyx_GIVEREF(__pyx_v_file);
-  PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_file);
-  __Pyx_INCREF(__pyx_n_s_w);
-  __Pyx_GIVEREF(__pyx_n_s_w);
-  PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_n_s_w);
-  __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_open, __pyx_t_1, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 298; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_v_ofile = __pyx_t_2;
-  __pyx_t_2 = 0;
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":299
- * 
- *         ofile=open(file, "w")
- *         ofile.write("$ - Mubea TRB CAE - FE_Mesh_Handlers - writeDynaMesh\n")             # <<<<<<<<<<<<<<
- *         ofile.write("$ - Date/Time: "+datetime.now().strftime('%Y/%m/%d %H:%M:%S')+"\n")
- *         ofile.write("$ - User: "+getuser()+"\n")
- */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_ofile, __pyx_n_s_write); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 299; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_tuple__74, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 299; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":300
- *         ofile=open(file, "w")
- *         ofile.write("$ - Mubea TRB CAE - FE_Mesh_Handlers - writeDynaMesh\n")
- *         ofile.write("$ - Date/Time: "+datetime.now().strftime('%Y/%m/%d %H:%M:%S')+"\n")             # <<<<<<<<<<<<<<
- *         ofile.write("$ - User: "+getuser()+"\n")
- * 
- */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_ofile, __pyx_n_s_write); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 300; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_6 = __Pyx_GetModuleGlobalName(__pyx_n_s_datetime); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 300; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_6);
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_now); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 300; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  __pyx_t_6 = NULL;
-  if (CYTHON_COMPILING_IN_CPYTHON && unlikely(PyMethod_Check(__pyx_t_4))) {
-    __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_4);
-    if (likely(__pyx_t_6)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
-      __Pyx_INCREF(__pyx_t_6);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_4, function);
-    }
-  }
-  if (__pyx_t_6) {
-    __pyx_t_3 = __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_6); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 300; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  } else {
-    __pyx_t_3 = __Pyx_PyObject_CallNoArg(__pyx_t_4); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 300; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  }
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_strftime); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 300; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_tuple__75, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 300; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_t_4 = PyNumber_Add(__pyx_kp_s_Date_Time, __pyx_t_3); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 300; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_3 = PyNumber_Add(__pyx_t_4, __pyx_kp_s__76); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 300; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_t_4 = NULL;
-  if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_2))) {
-    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_2);
-    if (likely(__pyx_t_4)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
-      __Pyx_INCREF(__pyx_t_4);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_2, function);
-    }
-  }
-  if (!__pyx_t_4) {
-    __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_3); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 300; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __Pyx_GOTREF(__pyx_t_1);
-  } else {
-    __pyx_t_6 = PyTuple_New(1+1); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 300; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_6);
-    __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_4); __pyx_t_4 = NULL;
-    __Pyx_GIVEREF(__pyx_t_3);
-    PyTuple_SET_ITEM(__pyx_t_6, 0+1, __pyx_t_3);
-    __pyx_t_3 = 0;
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_6, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 300; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  }
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":301
- *         ofile.write("$ - Mubea TRB CAE - FE_Mesh_Handlers - writeDynaMesh\n")
- *         ofile.write("$ - Date/Time: "+datetime.now().strftime('%Y/%m/%d %H:%M:%S')+"\n")
- *         ofile.write("$ - User: "+getuser()+"\n")             # <<<<<<<<<<<<<<
- * 
- *         # self.logger.info("LS-Dyna Mesh will be written to: "+ file)
- */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_ofile, __pyx_n_s_write); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 301; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_GetModuleGlobalName(__pyx_n_s_getuser); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 301; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_4 = NULL;
-  if (CYTHON_COMPILING_IN_CPYTHON && unlikely(PyMethod_Check(__pyx_t_3))) {
-    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
-    if (likely(__pyx_t_4)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-      __Pyx_INCREF(__pyx_t_4);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_3, function);
-    }
-  }
-  if (__pyx_t_4) {
-    __pyx_t_6 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 301; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  } else {
-    __pyx_t_6 = __Pyx_PyObject_CallNoArg(__pyx_t_3); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 301; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  }
-  __Pyx_GOTREF(__pyx_t_6);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_3 = PyNumber_Add(__pyx_kp_s_User, __pyx_t_6); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 301; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  __pyx_t_6 = PyNumber_Add(__pyx_t_3, __pyx_kp_s__76); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 301; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_6);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_3 = NULL;
-  if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_2))) {
-    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
-    if (likely(__pyx_t_3)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
-      __Pyx_INCREF(__pyx_t_3);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_2, function);
-    }
-  }
-  if (!__pyx_t_3) {
-    __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_6); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 301; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    __Pyx_GOTREF(__pyx_t_1);
-  } else {
-    __pyx_t_4 = PyTuple_New(1+1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 301; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_GIVEREF(__pyx_t_3); PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_3); __pyx_t_3 = NULL;
-    __Pyx_GIVEREF(__pyx_t_6);
-    PyTuple_SET_ITEM(__pyx_t_4, 0+1, __pyx_t_6);
-    __pyx_t_6 = 0;
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_4, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 301; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  }
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":305
- *         # self.logger.info("LS-Dyna Mesh will be written to: "+ file)
- *         # self.logger.info("Baseline Input is taken from: "+ _Mesh.getMeshFile())
- *         with open(_Mesh.getMeshFile(), "r") as f:             # <<<<<<<<<<<<<<
- *             for line in f:
- *                 if (elemsection == True) and (not("$" in line or "*" in line)):
- */
-  /*with:*/ {
-    __pyx_t_1 = ((struct __pyx_vtabstruct_15cNK_FEMeshUtils_4Mesh_Mesh *)__pyx_v__Mesh->__pyx_vtab)->getMeshFile(__pyx_v__Mesh, 0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 305; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 305; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_GIVEREF(__pyx_t_1);
-    PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_1);
-    __Pyx_INCREF(__pyx_n_s_r);
-    __Pyx_GIVEREF(__pyx_n_s_r);
-    PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_n_s_r);
-    __pyx_t_1 = 0;
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_open, __pyx_t_2, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 305; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __pyx_t_7 = __Pyx_PyObject_LookupSpecial(__pyx_t_1, __pyx_n_s_exit); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 305; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_7);
-    __pyx_t_4 = __Pyx_PyObject_LookupSpecial(__pyx_t_1, __pyx_n_s_enter); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 305; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_6 = NULL;
-    if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_4))) {
-      __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_4);
-      if (likely(__pyx_t_6)) {
-        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
-        __Pyx_INCREF(__pyx_t_6);
-        __Pyx_INCREF(function);
-        __Pyx_DECREF_SET(__pyx_t_4, function);
-      }
-    }
-    if (__pyx_t_6) {
-      __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_6); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 305; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    } else {
-      __pyx_t_2 = __Pyx_PyObject_CallNoArg(__pyx_t_4); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 305; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    }
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __pyx_t_4 = __pyx_t_2;
-    __pyx_t_2 = 0;
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    /*try:*/ {
-      {
-        __Pyx_ExceptionSave(&__pyx_t_8, &__pyx_t_9, &__pyx_t_10);
-        __Pyx_XGOTREF(__pyx_t_8);
-        __Pyx_XGOTREF(__pyx_t_9);
-        __Pyx_XGOTREF(__pyx_t_10);
-        /*try:*/ {
-          __pyx_v_f = __pyx_t_4;
-          __pyx_t_4 = 0;
-
-          /* "cNK_FEMeshUtils\MeshReaders.py":306
- *         # self.logger.info("Baseline Input is taken from: "+ _Mesh.getMeshFile())
- *         with open(_Mesh.getMeshFile(), "r") as f:
- *             for line in f:             # <<<<<<<<<<<<<<
- *                 if (elemsection == True) and (not("$" in line or "*" in line)):
- *                     if (int(line[9:16]) in _Mesh.NUTProps):
- */
-          if (likely(PyList_CheckExact(__pyx_v_f)) || PyTuple_CheckExact(__pyx_v_f)) {
-            __pyx_t_4 = __pyx_v_f; __Pyx_INCREF(__pyx_t_4); __pyx_t_5 = 0;
-            __pyx_t_11 = NULL;
-          } else {
-            __pyx_t_5 = -1; __pyx_t_4 = PyObject_GetIter(__pyx_v_f); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 306; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __Pyx_GOTREF(__pyx_t_4);
-            __pyx_t_11 = Py_TYPE(__pyx_t_4)->tp_iternext; if (unlikely(!__pyx_t_11)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 306; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-          }
-          for (;;) {
-            if (likely(!__pyx_t_11)) {
-              if (likely(PyList_CheckExact(__pyx_t_4))) {
-                if (__pyx_t_5 >= PyList_GET_SIZE(__pyx_t_4)) break;
-                #if CYTHON_COMPILING_IN_CPYTHON
-                __pyx_t_1 = PyList_GET_ITEM(__pyx_t_4, __pyx_t_5); __Pyx_INCREF(__pyx_t_1); __pyx_t_5++; if (unlikely(0 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 306; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                #else
-                __pyx_t_1 = PySequence_ITEM(__pyx_t_4, __pyx_t_5); __pyx_t_5++; if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 306; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_1);
-                #endif
-              } else {
-                if (__pyx_t_5 >= PyTuple_GET_SIZE(__pyx_t_4)) break;
-                #if CYTHON_COMPILING_IN_CPYTHON
-                __pyx_t_1 = PyTuple_GET_ITEM(__pyx_t_4, __pyx_t_5); __Pyx_INCREF(__pyx_t_1); __pyx_t_5++; if (unlikely(0 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 306; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                #else
-                __pyx_t_1 = PySequence_ITEM(__pyx_t_4, __pyx_t_5); __pyx_t_5++; if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 306; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_1);
-                #endif
-              }
-            } else {
-              __pyx_t_1 = __pyx_t_11(__pyx_t_4);
-              if (unlikely(!__pyx_t_1)) {
-                PyObject* exc_type = PyErr_Occurred();
-                if (exc_type) {
-                  if (likely(exc_type == PyExc_StopIteration || PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
-                  else {__pyx_filename = __pyx_f[0]; __pyx_lineno = 306; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                }
-                break;
-              }
-              __Pyx_GOTREF(__pyx_t_1);
-            }
-            __Pyx_XDECREF_SET(__pyx_v_line, __pyx_t_1);
-            __pyx_t_1 = 0;
-
-            /* "cNK_FEMeshUtils\MeshReaders.py":307
- *         with open(_Mesh.getMeshFile(), "r") as f:
- *             for line in f:
- *                 if (elemsection == True) and (not("$" in line or "*" in line)):             # <<<<<<<<<<<<<<
- *                     if (int(line[9:16]) in _Mesh.NUTProps):
- *                         if not elemshellthicknesswritten:
- */
-            __pyx_t_13 = ((__pyx_v_elemsection == 1) != 0);
-            if (__pyx_t_13) {
-            } else {
-              __pyx_t_12 = __pyx_t_13;
-              goto __pyx_L18_bool_binop_done;
-            }
-            __pyx_t_14 = (__Pyx_PySequence_ContainsTF(__pyx_kp_s_, __pyx_v_line, Py_EQ)); if (unlikely(__pyx_t_14 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 307; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __pyx_t_15 = (__pyx_t_14 != 0);
-            if (!__pyx_t_15) {
-            } else {
-              __pyx_t_13 = __pyx_t_15;
-              goto __pyx_L20_bool_binop_done;
-            }
-            __pyx_t_15 = (__Pyx_PySequence_ContainsTF(__pyx_kp_s__2, __pyx_v_line, Py_EQ)); if (unlikely(__pyx_t_15 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 307; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __pyx_t_14 = (__pyx_t_15 != 0);
-            __pyx_t_13 = __pyx_t_14;
-            __pyx_L20_bool_binop_done:;
-            __pyx_t_14 = ((!__pyx_t_13) != 0);
-            __pyx_t_12 = __pyx_t_14;
-            __pyx_L18_bool_binop_done:;
-            if (__pyx_t_12) {
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":308
- *             for line in f:
- *                 if (elemsection == True) and (not("$" in line or "*" in line)):
- *                     if (int(line[9:16]) in _Mesh.NUTProps):             # <<<<<<<<<<<<<<
- *                         if not elemshellthicknesswritten:
- *                             ofile.write("*ELEMENT_SHELL_THICKNESS\n")
- */
-              __pyx_t_1 = __Pyx_PyObject_GetSlice(__pyx_v_line, 9, 16, NULL, NULL, &__pyx_slice__77, 1, 1, 1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 308; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_1);
-              __pyx_t_2 = PyNumber_Int(__pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 308; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_2);
-              __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-              __pyx_t_12 = (__Pyx_PySequence_ContainsTF(__pyx_t_2, __pyx_v__Mesh->NUTProps, Py_EQ)); if (unlikely(__pyx_t_12 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 308; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-              __pyx_t_14 = (__pyx_t_12 != 0);
-              if (__pyx_t_14) {
-
-                /* "cNK_FEMeshUtils\MeshReaders.py":309
- *                 if (elemsection == True) and (not("$" in line or "*" in line)):
- *                     if (int(line[9:16]) in _Mesh.NUTProps):
- *                         if not elemshellthicknesswritten:             # <<<<<<<<<<<<<<
- *                             ofile.write("*ELEMENT_SHELL_THICKNESS\n")
- *                             elemshellthicknesswritten=True
- */
-                __pyx_t_14 = ((!(__pyx_v_elemshellthicknesswritten != 0)) != 0);
-                if (__pyx_t_14) {
-
-                  /* "cNK_FEMeshUtils\MeshReaders.py":310
- *                     if (int(line[9:16]) in _Mesh.NUTProps):
- *                         if not elemshellthicknesswritten:
- *                             ofile.write("*ELEMENT_SHELL_THICKNESS\n")             # <<<<<<<<<<<<<<
- *                             elemshellthicknesswritten=True
- *                             elemthicksection=True
- */
-                  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_ofile, __pyx_n_s_write); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 310; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                  __Pyx_GOTREF(__pyx_t_2);
-                  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_tuple__78, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 310; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                  __Pyx_GOTREF(__pyx_t_1);
-                  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-                  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-                  /* "cNK_FEMeshUtils\MeshReaders.py":311
- *                         if not elemshellthicknesswritten:
- *                             ofile.write("*ELEMENT_SHELL_THICKNESS\n")
- *                             elemshellthicknesswritten=True             # <<<<<<<<<<<<<<
- *                             elemthicksection=True
- *                             elemshellwritten=False
- */
-                  __pyx_v_elemshellthicknesswritten = 1;
-
-                  /* "cNK_FEMeshUtils\MeshReaders.py":312
- *                             ofile.write("*ELEMENT_SHELL_THICKNESS\n")
- *                             elemshellthicknesswritten=True
- *                             elemthicksection=True             # <<<<<<<<<<<<<<
- *                             elemshellwritten=False
- *                         ofile.write(line)
- */
-                  __pyx_v_elemthicksection = 1;
-
-                  /* "cNK_FEMeshUtils\MeshReaders.py":313
- *                             elemshellthicknesswritten=True
- *                             elemthicksection=True
- *                             elemshellwritten=False             # <<<<<<<<<<<<<<
- *                         ofile.write(line)
- *                         #elem=_Mesh.getElemObjByID(int(line[0:8]))
- */
-                  __pyx_v_elemshellwritten = 0;
-
-                  /* "cNK_FEMeshUtils\MeshReaders.py":309
- *                 if (elemsection == True) and (not("$" in line or "*" in line)):
- *                     if (int(line[9:16]) in _Mesh.NUTProps):
- *                         if not elemshellthicknesswritten:             # <<<<<<<<<<<<<<
- *                             ofile.write("*ELEMENT_SHELL_THICKNESS\n")
- *                             elemshellthicknesswritten=True
- */
-                }
-
-                /* "cNK_FEMeshUtils\MeshReaders.py":314
- *                             elemthicksection=True
- *                             elemshellwritten=False
- *                         ofile.write(line)             # <<<<<<<<<<<<<<
- *                         #elem=_Mesh.getElemObjByID(int(line[0:8]))
- *                         #numbernodes=len(set(_Mesh.getElemlist()[int(line[0:8]][1:]))
- */
-                __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_ofile, __pyx_n_s_write); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 314; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_2);
-                __pyx_t_6 = NULL;
-                if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_2))) {
-                  __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_2);
-                  if (likely(__pyx_t_6)) {
-                    PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
-                    __Pyx_INCREF(__pyx_t_6);
-                    __Pyx_INCREF(function);
-                    __Pyx_DECREF_SET(__pyx_t_2, function);
-                  }
-                }
-                if (!__pyx_t_6) {
-                  __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_v_line); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 314; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                  __Pyx_GOTREF(__pyx_t_1);
-                } else {
-                  __pyx_t_3 = PyTuple_New(1+1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 314; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                  __Pyx_GOTREF(__pyx_t_3);
-                  __Pyx_GIVEREF(__pyx_t_6); PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_6); __pyx_t_6 = NULL;
-                  __Pyx_INCREF(__pyx_v_line);
-                  __Pyx_GIVEREF(__pyx_v_line);
-                  PyTuple_SET_ITEM(__pyx_t_3, 0+1, __pyx_v_line);
-                  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_3, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 314; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                  __Pyx_GOTREF(__pyx_t_1);
-                  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-                }
-                __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-                __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-                /* "cNK_FEMeshUtils\MeshReaders.py":317
- *                         #elem=_Mesh.getElemObjByID(int(line[0:8]))
- *                         #numbernodes=len(set(_Mesh.getElemlist()[int(line[0:8]][1:]))
- *                         n1=_Mesh.getNodalThickness(int(line[17:24]))             # <<<<<<<<<<<<<<
- *                         n2=_Mesh.getNodalThickness(int(line[25:32]))
- *                         n3=_Mesh.getNodalThickness(int(line[33:40]))
- */
-                __pyx_t_1 = __Pyx_PyObject_GetSlice(__pyx_v_line, 17, 24, NULL, NULL, &__pyx_slice__79, 1, 1, 1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 317; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_1);
-                __pyx_t_2 = PyNumber_Int(__pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 317; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_2);
-                __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-                __pyx_t_16 = __Pyx_PyInt_As_int(__pyx_t_2); if (unlikely((__pyx_t_16 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 317; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-                __pyx_v_n1 = ((struct __pyx_vtabstruct_15cNK_FEMeshUtils_4Mesh_Mesh *)__pyx_v__Mesh->__pyx_vtab)->getNodalThickness(__pyx_v__Mesh, __pyx_t_16, 0);
-
-                /* "cNK_FEMeshUtils\MeshReaders.py":318
- *                         #numbernodes=len(set(_Mesh.getElemlist()[int(line[0:8]][1:]))
- *                         n1=_Mesh.getNodalThickness(int(line[17:24]))
- *                         n2=_Mesh.getNodalThickness(int(line[25:32]))             # <<<<<<<<<<<<<<
- *                         n3=_Mesh.getNodalThickness(int(line[33:40]))
- *                         n4=_Mesh.getNodalThickness(int(line[41:48]))
- */
-                __pyx_t_2 = __Pyx_PyObject_GetSlice(__pyx_v_line, 25, 32, NULL, NULL, &__pyx_slice__80, 1, 1, 1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 318; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_2);
-                __pyx_t_1 = PyNumber_Int(__pyx_t_2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 318; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_1);
-                __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-                __pyx_t_16 = __Pyx_PyInt_As_int(__pyx_t_1); if (unlikely((__pyx_t_16 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 318; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-                __pyx_v_n2 = ((struct __pyx_vtabstruct_15cNK_FEMeshUtils_4Mesh_Mesh *)__pyx_v__Mesh->__pyx_vtab)->getNodalThickness(__pyx_v__Mesh, __pyx_t_16, 0);
-
-                /* "cNK_FEMeshUtils\MeshReaders.py":319
- *                         n1=_Mesh.getNodalThickness(int(line[17:24]))
- *                         n2=_Mesh.getNodalThickness(int(line[25:32]))
- *                         n3=_Mesh.getNodalThickness(int(line[33:40]))             # <<<<<<<<<<<<<<
- *                         n4=_Mesh.getNodalThickness(int(line[41:48]))
- *                         s= "%16.8f"%n1+"%16.8f"%n2+"%16.8f"%n3+"%16.8f"%n4+"\n"
- */
-                __pyx_t_1 = __Pyx_PyObject_GetSlice(__pyx_v_line, 33, 40, NULL, NULL, &__pyx_slice__81, 1, 1, 1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 319; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_1);
-                __pyx_t_2 = PyNumber_Int(__pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 319; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_2);
-                __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-                __pyx_t_16 = __Pyx_PyInt_As_int(__pyx_t_2); if (unlikely((__pyx_t_16 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 319; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-                __pyx_v_n3 = ((struct __pyx_vtabstruct_15cNK_FEMeshUtils_4Mesh_Mesh *)__pyx_v__Mesh->__pyx_vtab)->getNodalThickness(__pyx_v__Mesh, __pyx_t_16, 0);
-
-                /* "cNK_FEMeshUtils\MeshReaders.py":320
- *                         n2=_Mesh.getNodalThickness(int(line[25:32]))
- *                         n3=_Mesh.getNodalThickness(int(line[33:40]))
- *                         n4=_Mesh.getNodalThickness(int(line[41:48]))             # <<<<<<<<<<<<<<
- *                         s= "%16.8f"%n1+"%16.8f"%n2+"%16.8f"%n3+"%16.8f"%n4+"\n"
- *                         ofile.write(s)
- */
-                __pyx_t_2 = __Pyx_PyObject_GetSlice(__pyx_v_line, 41, 48, NULL, NULL, &__pyx_slice__82, 1, 1, 1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 320; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_2);
-                __pyx_t_1 = PyNumber_Int(__pyx_t_2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 320; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_1);
-                __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-                __pyx_t_16 = __Pyx_PyInt_As_int(__pyx_t_1); if (unlikely((__pyx_t_16 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 320; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-                __pyx_v_n4 = ((struct __pyx_vtabstruct_15cNK_FEMeshUtils_4Mesh_Mesh *)__pyx_v__Mesh->__pyx_vtab)->getNodalThickness(__pyx_v__Mesh, __pyx_t_16, 0);
-
-                /* "cNK_FEMeshUtils\MeshReaders.py":321
- *                         n3=_Mesh.getNodalThickness(int(line[33:40]))
- *                         n4=_Mesh.getNodalThickness(int(line[41:48]))
- *                         s= "%16.8f"%n1+"%16.8f"%n2+"%16.8f"%n3+"%16.8f"%n4+"\n"             # <<<<<<<<<<<<<<
- *                         ofile.write(s)
- *                         i=i+1
- */
-                __pyx_t_1 = PyFloat_FromDouble(__pyx_v_n1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 321; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_1);
-                __pyx_t_2 = __Pyx_PyString_Format(__pyx_kp_s_16_8f, __pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 321; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_2);
-                __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-                __pyx_t_1 = PyFloat_FromDouble(__pyx_v_n2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 321; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_1);
-                __pyx_t_3 = __Pyx_PyString_Format(__pyx_kp_s_16_8f, __pyx_t_1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 321; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_3);
-                __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-                __pyx_t_1 = PyNumber_Add(__pyx_t_2, __pyx_t_3); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 321; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_1);
-                __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-                __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-                __pyx_t_3 = PyFloat_FromDouble(__pyx_v_n3); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 321; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_3);
-                __pyx_t_2 = __Pyx_PyString_Format(__pyx_kp_s_16_8f, __pyx_t_3); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 321; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_2);
-                __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-                __pyx_t_3 = PyNumber_Add(__pyx_t_1, __pyx_t_2); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 321; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_3);
-                __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-                __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-                __pyx_t_2 = PyFloat_FromDouble(__pyx_v_n4); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 321; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_2);
-                __pyx_t_1 = __Pyx_PyString_Format(__pyx_kp_s_16_8f, __pyx_t_2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 321; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_1);
-                __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-                __pyx_t_2 = PyNumber_Add(__pyx_t_3, __pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 321; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_2);
-                __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-                __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-                __pyx_t_1 = PyNumber_Add(__pyx_t_2, __pyx_kp_s__76); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 321; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_1);
-                __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-                __Pyx_XDECREF_SET(__pyx_v_s, __pyx_t_1);
-                __pyx_t_1 = 0;
-
-                /* "cNK_FEMeshUtils\MeshReaders.py":322
- *                         n4=_Mesh.getNodalThickness(int(line[41:48]))
- *                         s= "%16.8f"%n1+"%16.8f"%n2+"%16.8f"%n3+"%16.8f"%n4+"\n"
- *                         ofile.write(s)             # <<<<<<<<<<<<<<
- *                         i=i+1
- *                     else:
- */
-                __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_ofile, __pyx_n_s_write); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 322; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_2);
-                __pyx_t_3 = NULL;
-                if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_2))) {
-                  __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
-                  if (likely(__pyx_t_3)) {
-                    PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
-                    __Pyx_INCREF(__pyx_t_3);
-                    __Pyx_INCREF(function);
-                    __Pyx_DECREF_SET(__pyx_t_2, function);
-                  }
-                }
-                if (!__pyx_t_3) {
-                  __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_v_s); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 322; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                  __Pyx_GOTREF(__pyx_t_1);
-                } else {
-                  __pyx_t_6 = PyTuple_New(1+1); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 322; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                  __Pyx_GOTREF(__pyx_t_6);
-                  __Pyx_GIVEREF(__pyx_t_3); PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_3); __pyx_t_3 = NULL;
-                  __Pyx_INCREF(__pyx_v_s);
-                  __Pyx_GIVEREF(__pyx_v_s);
-                  PyTuple_SET_ITEM(__pyx_t_6, 0+1, __pyx_v_s);
-                  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_6, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 322; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                  __Pyx_GOTREF(__pyx_t_1);
-                  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-                }
-                __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-                __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-                /* "cNK_FEMeshUtils\MeshReaders.py":323
- *                         s= "%16.8f"%n1+"%16.8f"%n2+"%16.8f"%n3+"%16.8f"%n4+"\n"
- *                         ofile.write(s)
- *                         i=i+1             # <<<<<<<<<<<<<<
- *                     else:
- *                         if not elemshellwritten:
- */
-                __pyx_t_1 = __Pyx_PyInt_AddObjC(__pyx_v_i, __pyx_int_1, 1, 0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 323; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_1);
-                __Pyx_DECREF_SET(__pyx_v_i, __pyx_t_1);
-                __pyx_t_1 = 0;
-
-                /* "cNK_FEMeshUtils\MeshReaders.py":308
- *             for line in f:
- *                 if (elemsection == True) and (not("$" in line or "*" in line)):
- *                     if (int(line[9:16]) in _Mesh.NUTProps):             # <<<<<<<<<<<<<<
- *                         if not elemshellthicknesswritten:
- *                             ofile.write("*ELEMENT_SHELL_THICKNESS\n")
- */
-                goto __pyx_L22;
-              }
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":325
- *                         i=i+1
- *                     else:
- *                         if not elemshellwritten:             # <<<<<<<<<<<<<<
- *                             ofile.write("*ELEMENT_SHELL\n")
- *                             elemthicksection=False
- */
-              /*else*/ {
-                __pyx_t_14 = ((!(__pyx_v_elemshellwritten != 0)) != 0);
-                if (__pyx_t_14) {
-
-                  /* "cNK_FEMeshUtils\MeshReaders.py":326
- *                     else:
- *                         if not elemshellwritten:
- *                             ofile.write("*ELEMENT_SHELL\n")             # <<<<<<<<<<<<<<
- *                             elemthicksection=False
- *                             elemshellwritten=True
- */
-                  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_ofile, __pyx_n_s_write); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 326; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                  __Pyx_GOTREF(__pyx_t_1);
-                  __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_tuple__83, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 326; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                  __Pyx_GOTREF(__pyx_t_2);
-                  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-                  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-                  /* "cNK_FEMeshUtils\MeshReaders.py":327
- *                         if not elemshellwritten:
- *                             ofile.write("*ELEMENT_SHELL\n")
- *                             elemthicksection=False             # <<<<<<<<<<<<<<
- *                             elemshellwritten=True
- *                             elemsection=True
- */
-                  __pyx_v_elemthicksection = 0;
-
-                  /* "cNK_FEMeshUtils\MeshReaders.py":328
- *                             ofile.write("*ELEMENT_SHELL\n")
- *                             elemthicksection=False
- *                             elemshellwritten=True             # <<<<<<<<<<<<<<
- *                             elemsection=True
- *                             elemshellthicknesswritten=False
- */
-                  __pyx_v_elemshellwritten = 1;
-
-                  /* "cNK_FEMeshUtils\MeshReaders.py":329
- *                             elemthicksection=False
- *                             elemshellwritten=True
- *                             elemsection=True             # <<<<<<<<<<<<<<
- *                             elemshellthicknesswritten=False
- *                         ofile.write(line)
- */
-                  __pyx_v_elemsection = 1;
-
-                  /* "cNK_FEMeshUtils\MeshReaders.py":330
- *                             elemshellwritten=True
- *                             elemsection=True
- *                             elemshellthicknesswritten=False             # <<<<<<<<<<<<<<
- *                         ofile.write(line)
- *                 elif (elemthicksection) and (not("$" in line or "*" in line)):
- */
-                  __pyx_v_elemshellthicknesswritten = 0;
-
-                  /* "cNK_FEMeshUtils\MeshReaders.py":325
- *                         i=i+1
- *                     else:
- *                         if not elemshellwritten:             # <<<<<<<<<<<<<<
- *                             ofile.write("*ELEMENT_SHELL\n")
- *                             elemthicksection=False
- */
-                }
-
-                /* "cNK_FEMeshUtils\MeshReaders.py":331
- *                             elemsection=True
- *                             elemshellthicknesswritten=False
- *                         ofile.write(line)             # <<<<<<<<<<<<<<
- *                 elif (elemthicksection) and (not("$" in line or "*" in line)):
- *                     ofile.write(line)
- */
-                __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_ofile, __pyx_n_s_write); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 331; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_1);
-                __pyx_t_6 = NULL;
-                if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_1))) {
-                  __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_1);
-                  if (likely(__pyx_t_6)) {
-                    PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
-                    __Pyx_INCREF(__pyx_t_6);
-                    __Pyx_INCREF(function);
-                    __Pyx_DECREF_SET(__pyx_t_1, function);
-                  }
-                }
-                if (!__pyx_t_6) {
-                  __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_v_line); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 331; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                  __Pyx_GOTREF(__pyx_t_2);
-                } else {
-                  __pyx_t_3 = PyTuple_New(1+1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 331; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                  __Pyx_GOTREF(__pyx_t_3);
-                  __Pyx_GIVEREF(__pyx_t_6); PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_6); __pyx_t_6 = NULL;
-                  __Pyx_INCREF(__pyx_v_line);
-                  __Pyx_GIVEREF(__pyx_v_line);
-                  PyTuple_SET_ITEM(__pyx_t_3, 0+1, __pyx_v_line);
-                  __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_3, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 331; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                  __Pyx_GOTREF(__pyx_t_2);
-                  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-                }
-                __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-                __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-              }
-              __pyx_L22:;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":307
- *         with open(_Mesh.getMeshFile(), "r") as f:
- *             for line in f:
- *                 if (elemsection == True) and (not("$" in line or "*" in line)):             # <<<<<<<<<<<<<<
- *                     if (int(line[9:16]) in _Mesh.NUTProps):
- *                         if not elemshellthicknesswritten:
- */
-              goto __pyx_L17;
-            }
-
-            /* "cNK_FEMeshUtils\MeshReaders.py":332
- *                             elemshellthicknesswritten=False
- *                         ofile.write(line)
- *                 elif (elemthicksection) and (not("$" in line or "*" in line)):             # <<<<<<<<<<<<<<
- *                     ofile.write(line)
- *                     #
- */
-            __pyx_t_12 = (__pyx_v_elemthicksection != 0);
-            if (__pyx_t_12) {
-            } else {
-              __pyx_t_14 = __pyx_t_12;
-              goto __pyx_L25_bool_binop_done;
-            }
-            __pyx_t_13 = (__Pyx_PySequence_ContainsTF(__pyx_kp_s_, __pyx_v_line, Py_EQ)); if (unlikely(__pyx_t_13 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 332; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __pyx_t_15 = (__pyx_t_13 != 0);
-            if (!__pyx_t_15) {
-            } else {
-              __pyx_t_12 = __pyx_t_15;
-              goto __pyx_L27_bool_binop_done;
-            }
-            __pyx_t_15 = (__Pyx_PySequence_ContainsTF(__pyx_kp_s__2, __pyx_v_line, Py_EQ)); if (unlikely(__pyx_t_15 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 332; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __pyx_t_13 = (__pyx_t_15 != 0);
-            __pyx_t_12 = __pyx_t_13;
-            __pyx_L27_bool_binop_done:;
-            __pyx_t_13 = ((!__pyx_t_12) != 0);
-            __pyx_t_14 = __pyx_t_13;
-            __pyx_L25_bool_binop_done:;
-            if (__pyx_t_14) {
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":333
- *                         ofile.write(line)
- *                 elif (elemthicksection) and (not("$" in line or "*" in line)):
- *                     ofile.write(line)             # <<<<<<<<<<<<<<
- *                     #
- *                 elif nodesection and (not("$" in line or "*" in line)):
- */
-              __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_ofile, __pyx_n_s_write); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 333; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_1);
-              __pyx_t_3 = NULL;
-              if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_1))) {
-                __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_1);
-                if (likely(__pyx_t_3)) {
-                  PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
-                  __Pyx_INCREF(__pyx_t_3);
-                  __Pyx_INCREF(function);
-                  __Pyx_DECREF_SET(__pyx_t_1, function);
-                }
-              }
-              if (!__pyx_t_3) {
-                __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_v_line); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 333; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_2);
-              } else {
-                __pyx_t_6 = PyTuple_New(1+1); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 333; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_6);
-                __Pyx_GIVEREF(__pyx_t_3); PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_3); __pyx_t_3 = NULL;
-                __Pyx_INCREF(__pyx_v_line);
-                __Pyx_GIVEREF(__pyx_v_line);
-                PyTuple_SET_ITEM(__pyx_t_6, 0+1, __pyx_v_line);
-                __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_6, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 333; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_2);
-                __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-              }
-              __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-              __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":332
- *                             elemshellthicknesswritten=False
- *                         ofile.write(line)
- *                 elif (elemthicksection) and (not("$" in line or "*" in line)):             # <<<<<<<<<<<<<<
- *                     ofile.write(line)
- *                     #
- */
-              goto __pyx_L17;
-            }
-
-            /* "cNK_FEMeshUtils\MeshReaders.py":335
- *                     ofile.write(line)
- *                     #
- *                 elif nodesection and (not("$" in line or "*" in line)):             # <<<<<<<<<<<<<<
- *                     nid=int(line[0:8])
- *                     x=float(_Mesh.Nodelist[nid][0])
- */
-            __pyx_t_13 = (__pyx_v_nodesection != 0);
-            if (__pyx_t_13) {
-            } else {
-              __pyx_t_14 = __pyx_t_13;
-              goto __pyx_L29_bool_binop_done;
-            }
-            __pyx_t_12 = (__Pyx_PySequence_ContainsTF(__pyx_kp_s_, __pyx_v_line, Py_EQ)); if (unlikely(__pyx_t_12 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 335; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __pyx_t_15 = (__pyx_t_12 != 0);
-            if (!__pyx_t_15) {
-            } else {
-              __pyx_t_13 = __pyx_t_15;
-              goto __pyx_L31_bool_binop_done;
-            }
-            __pyx_t_15 = (__Pyx_PySequence_ContainsTF(__pyx_kp_s__2, __pyx_v_line, Py_EQ)); if (unlikely(__pyx_t_15 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 335; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __pyx_t_12 = (__pyx_t_15 != 0);
-            __pyx_t_13 = __pyx_t_12;
-            __pyx_L31_bool_binop_done:;
-            __pyx_t_12 = ((!__pyx_t_13) != 0);
-            __pyx_t_14 = __pyx_t_12;
-            __pyx_L29_bool_binop_done:;
-            if (__pyx_t_14) {
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":336
- *                     #
- *                 elif nodesection and (not("$" in line or "*" in line)):
- *                     nid=int(line[0:8])             # <<<<<<<<<<<<<<
- *                     x=float(_Mesh.Nodelist[nid][0])
- *                     y=float(_Mesh.Nodelist[nid][1])
- */
-              __pyx_t_2 = __Pyx_PyObject_GetSlice(__pyx_v_line, 0, 8, NULL, NULL, &__pyx_slice__84, 1, 1, 1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 336; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_2);
-              __pyx_t_1 = PyNumber_Int(__pyx_t_2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 336; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_1);
-              __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-              __Pyx_XDECREF_SET(__pyx_v_nid, __pyx_t_1);
-              __pyx_t_1 = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":337
- *                 elif nodesection and (not("$" in line or "*" in line)):
- *                     nid=int(line[0:8])
- *                     x=float(_Mesh.Nodelist[nid][0])             # <<<<<<<<<<<<<<
- *                     y=float(_Mesh.Nodelist[nid][1])
- *                     z=float(_Mesh.Nodelist[nid][2])
- */
-              if (unlikely(__pyx_v__Mesh->Nodelist == Py_None)) {
-                PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-                {__pyx_filename = __pyx_f[0]; __pyx_lineno = 337; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              }
-              __pyx_t_1 = __Pyx_PyDict_GetItem(__pyx_v__Mesh->Nodelist, __pyx_v_nid); if (unlikely(__pyx_t_1 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 337; __pyx_clineno = __LINE__; goto __pyx_L7_error;};
-              __Pyx_GOTREF(__pyx_t_1);
-              __pyx_t_2 = __Pyx_GetItemInt(__pyx_t_1, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(__pyx_t_2 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 337; __pyx_clineno = __LINE__; goto __pyx_L7_error;};
-              __Pyx_GOTREF(__pyx_t_2);
-              __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-              __pyx_t_17 = __Pyx_PyObject_AsDouble(__pyx_t_2); if (unlikely(__pyx_t_17 == ((double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 337; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-              __pyx_v_x = __pyx_t_17;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":338
- *                     nid=int(line[0:8])
- *                     x=float(_Mesh.Nodelist[nid][0])
- *                     y=float(_Mesh.Nodelist[nid][1])             # <<<<<<<<<<<<<<
- *                     z=float(_Mesh.Nodelist[nid][2])
- *                     s= "%8i"%nid+"%16.10f"%x+"%16.10f"%y+"%16.10f"%z+"\n"
- */
-              if (unlikely(__pyx_v__Mesh->Nodelist == Py_None)) {
-                PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-                {__pyx_filename = __pyx_f[0]; __pyx_lineno = 338; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              }
-              __pyx_t_2 = __Pyx_PyDict_GetItem(__pyx_v__Mesh->Nodelist, __pyx_v_nid); if (unlikely(__pyx_t_2 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 338; __pyx_clineno = __LINE__; goto __pyx_L7_error;};
-              __Pyx_GOTREF(__pyx_t_2);
-              __pyx_t_1 = __Pyx_GetItemInt(__pyx_t_2, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(__pyx_t_1 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 338; __pyx_clineno = __LINE__; goto __pyx_L7_error;};
-              __Pyx_GOTREF(__pyx_t_1);
-              __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-              __pyx_t_17 = __Pyx_PyObject_AsDouble(__pyx_t_1); if (unlikely(__pyx_t_17 == ((double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 338; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-              __pyx_v_y = __pyx_t_17;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":339
- *                     x=float(_Mesh.Nodelist[nid][0])
- *                     y=float(_Mesh.Nodelist[nid][1])
- *                     z=float(_Mesh.Nodelist[nid][2])             # <<<<<<<<<<<<<<
- *                     s= "%8i"%nid+"%16.10f"%x+"%16.10f"%y+"%16.10f"%z+"\n"
- *                     ofile.write(s)
- */
-              if (unlikely(__pyx_v__Mesh->Nodelist == Py_None)) {
-                PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-                {__pyx_filename = __pyx_f[0]; __pyx_lineno = 339; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              }
-              __pyx_t_1 = __Pyx_PyDict_GetItem(__pyx_v__Mesh->Nodelist, __pyx_v_nid); if (unlikely(__pyx_t_1 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 339; __pyx_clineno = __LINE__; goto __pyx_L7_error;};
-              __Pyx_GOTREF(__pyx_t_1);
-              __pyx_t_2 = __Pyx_GetItemInt(__pyx_t_1, 2, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(__pyx_t_2 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 339; __pyx_clineno = __LINE__; goto __pyx_L7_error;};
-              __Pyx_GOTREF(__pyx_t_2);
-              __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-              __pyx_t_17 = __Pyx_PyObject_AsDouble(__pyx_t_2); if (unlikely(__pyx_t_17 == ((double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 339; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-              __pyx_v_z = __pyx_t_17;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":340
- *                     y=float(_Mesh.Nodelist[nid][1])
- *                     z=float(_Mesh.Nodelist[nid][2])
- *                     s= "%8i"%nid+"%16.10f"%x+"%16.10f"%y+"%16.10f"%z+"\n"             # <<<<<<<<<<<<<<
- *                     ofile.write(s)
- *                 elif line.strip() == "*ELEMENT_SHELL":
- */
-              __pyx_t_2 = __Pyx_PyString_Format(__pyx_kp_s_8i, __pyx_v_nid); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 340; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_2);
-              __pyx_t_1 = PyFloat_FromDouble(__pyx_v_x); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 340; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_1);
-              __pyx_t_6 = __Pyx_PyString_Format(__pyx_kp_s_16_10f, __pyx_t_1); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 340; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_6);
-              __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-              __pyx_t_1 = PyNumber_Add(__pyx_t_2, __pyx_t_6); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 340; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_1);
-              __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-              __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-              __pyx_t_6 = PyFloat_FromDouble(__pyx_v_y); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 340; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_6);
-              __pyx_t_2 = __Pyx_PyString_Format(__pyx_kp_s_16_10f, __pyx_t_6); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 340; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_2);
-              __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-              __pyx_t_6 = PyNumber_Add(__pyx_t_1, __pyx_t_2); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 340; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_6);
-              __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-              __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-              __pyx_t_2 = PyFloat_FromDouble(__pyx_v_z); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 340; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_2);
-              __pyx_t_1 = __Pyx_PyString_Format(__pyx_kp_s_16_10f, __pyx_t_2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 340; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_1);
-              __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-              __pyx_t_2 = PyNumber_Add(__pyx_t_6, __pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 340; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_2);
-              __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-              __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-              __pyx_t_1 = PyNumber_Add(__pyx_t_2, __pyx_kp_s__76); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 340; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_1);
-              __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-              __Pyx_XDECREF_SET(__pyx_v_s, __pyx_t_1);
-              __pyx_t_1 = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":341
- *                     z=float(_Mesh.Nodelist[nid][2])
- *                     s= "%8i"%nid+"%16.10f"%x+"%16.10f"%y+"%16.10f"%z+"\n"
- *                     ofile.write(s)             # <<<<<<<<<<<<<<
- *                 elif line.strip() == "*ELEMENT_SHELL":
- *                     # self.logger.debug("*ELEMENT_SHELL found")
- */
-              __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_ofile, __pyx_n_s_write); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 341; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_2);
-              __pyx_t_6 = NULL;
-              if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_2))) {
-                __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_2);
-                if (likely(__pyx_t_6)) {
-                  PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
-                  __Pyx_INCREF(__pyx_t_6);
-                  __Pyx_INCREF(function);
-                  __Pyx_DECREF_SET(__pyx_t_2, function);
-                }
-              }
-              if (!__pyx_t_6) {
-                __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_v_s); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 341; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_1);
-              } else {
-                __pyx_t_3 = PyTuple_New(1+1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 341; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_3);
-                __Pyx_GIVEREF(__pyx_t_6); PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_6); __pyx_t_6 = NULL;
-                __Pyx_INCREF(__pyx_v_s);
-                __Pyx_GIVEREF(__pyx_v_s);
-                PyTuple_SET_ITEM(__pyx_t_3, 0+1, __pyx_v_s);
-                __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_3, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 341; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_1);
-                __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-              }
-              __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-              __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":335
- *                     ofile.write(line)
- *                     #
- *                 elif nodesection and (not("$" in line or "*" in line)):             # <<<<<<<<<<<<<<
- *                     nid=int(line[0:8])
- *                     x=float(_Mesh.Nodelist[nid][0])
- */
-              goto __pyx_L17;
-            }
-
-            /* "cNK_FEMeshUtils\MeshReaders.py":342
- *                     s= "%8i"%nid+"%16.10f"%x+"%16.10f"%y+"%16.10f"%z+"\n"
- *                     ofile.write(s)
- *                 elif line.strip() == "*ELEMENT_SHELL":             # <<<<<<<<<<<<<<
- *                     # self.logger.debug("*ELEMENT_SHELL found")
- *                     elemsection = True
- */
-            __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_line, __pyx_n_s_strip); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 342; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __Pyx_GOTREF(__pyx_t_2);
-            __pyx_t_3 = NULL;
-            if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_2))) {
-              __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
-              if (likely(__pyx_t_3)) {
-                PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
-                __Pyx_INCREF(__pyx_t_3);
-                __Pyx_INCREF(function);
-                __Pyx_DECREF_SET(__pyx_t_2, function);
-              }
-            }
-            if (__pyx_t_3) {
-              __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_3); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 342; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-            } else {
-              __pyx_t_1 = __Pyx_PyObject_CallNoArg(__pyx_t_2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 342; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            }
-            __Pyx_GOTREF(__pyx_t_1);
-            __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-            __pyx_t_14 = (__Pyx_PyString_Equals(__pyx_t_1, __pyx_kp_s_ELEMENT_SHELL, Py_EQ)); if (unlikely(__pyx_t_14 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 342; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-            if (__pyx_t_14) {
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":344
- *                 elif line.strip() == "*ELEMENT_SHELL":
- *                     # self.logger.debug("*ELEMENT_SHELL found")
- *                     elemsection = True             # <<<<<<<<<<<<<<
- *                     elemthicksection = False
- *                     elemshellthicknesswritten = False
- */
-              __pyx_v_elemsection = 1;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":345
- *                     # self.logger.debug("*ELEMENT_SHELL found")
- *                     elemsection = True
- *                     elemthicksection = False             # <<<<<<<<<<<<<<
- *                     elemshellthicknesswritten = False
- *                     elemshellwritten = True
- */
-              __pyx_v_elemthicksection = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":346
- *                     elemsection = True
- *                     elemthicksection = False
- *                     elemshellthicknesswritten = False             # <<<<<<<<<<<<<<
- *                     elemshellwritten = True
- *                     nodesection = False
- */
-              __pyx_v_elemshellthicknesswritten = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":347
- *                     elemthicksection = False
- *                     elemshellthicknesswritten = False
- *                     elemshellwritten = True             # <<<<<<<<<<<<<<
- *                     nodesection = False
- *                     # self.logger.debug("state variables [elemsection,elemshellwritten,elemthicksection,elemshellthicknesswritten,nodesection]"+str([elemsection,elemshellwritten,elemthicksection,elemshellthicknesswritten,nodesection]))
- */
-              __pyx_v_elemshellwritten = 1;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":348
- *                     elemshellthicknesswritten = False
- *                     elemshellwritten = True
- *                     nodesection = False             # <<<<<<<<<<<<<<
- *                     # self.logger.debug("state variables [elemsection,elemshellwritten,elemthicksection,elemshellthicknesswritten,nodesection]"+str([elemsection,elemshellwritten,elemthicksection,elemshellthicknesswritten,nodesection]))
- *                     ofile.write(line)
- */
-              __pyx_v_nodesection = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":350
- *                     nodesection = False
- *                     # self.logger.debug("state variables [elemsection,elemshellwritten,elemthicksection,elemshellthicknesswritten,nodesection]"+str([elemsection,elemshellwritten,elemthicksection,elemshellthicknesswritten,nodesection]))
- *                     ofile.write(line)             # <<<<<<<<<<<<<<
- *                 elif line.strip() == "*ELEMENT_SHELL_THICKNESS":
- *                     i=0
- */
-              __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_ofile, __pyx_n_s_write); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 350; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_2);
-              __pyx_t_3 = NULL;
-              if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_2))) {
-                __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
-                if (likely(__pyx_t_3)) {
-                  PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
-                  __Pyx_INCREF(__pyx_t_3);
-                  __Pyx_INCREF(function);
-                  __Pyx_DECREF_SET(__pyx_t_2, function);
-                }
-              }
-              if (!__pyx_t_3) {
-                __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_v_line); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 350; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_1);
-              } else {
-                __pyx_t_6 = PyTuple_New(1+1); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 350; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_6);
-                __Pyx_GIVEREF(__pyx_t_3); PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_3); __pyx_t_3 = NULL;
-                __Pyx_INCREF(__pyx_v_line);
-                __Pyx_GIVEREF(__pyx_v_line);
-                PyTuple_SET_ITEM(__pyx_t_6, 0+1, __pyx_v_line);
-                __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_6, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 350; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_1);
-                __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-              }
-              __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-              __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":342
- *                     s= "%8i"%nid+"%16.10f"%x+"%16.10f"%y+"%16.10f"%z+"\n"
- *                     ofile.write(s)
- *                 elif line.strip() == "*ELEMENT_SHELL":             # <<<<<<<<<<<<<<
- *                     # self.logger.debug("*ELEMENT_SHELL found")
- *                     elemsection = True
- */
-              goto __pyx_L17;
-            }
-
-            /* "cNK_FEMeshUtils\MeshReaders.py":351
- *                     # self.logger.debug("state variables [elemsection,elemshellwritten,elemthicksection,elemshellthicknesswritten,nodesection]"+str([elemsection,elemshellwritten,elemthicksection,elemshellthicknesswritten,nodesection]))
- *                     ofile.write(line)
- *                 elif line.strip() == "*ELEMENT_SHELL_THICKNESS":             # <<<<<<<<<<<<<<
- *                     i=0
- *                     # self.logger.debug("*ELEMENT_SHELL_THICKNESS found")
- */
-            __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_line, __pyx_n_s_strip); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 351; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __Pyx_GOTREF(__pyx_t_2);
-            __pyx_t_6 = NULL;
-            if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_2))) {
-              __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_2);
-              if (likely(__pyx_t_6)) {
-                PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
-                __Pyx_INCREF(__pyx_t_6);
-                __Pyx_INCREF(function);
-                __Pyx_DECREF_SET(__pyx_t_2, function);
-              }
-            }
-            if (__pyx_t_6) {
-              __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_6); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 351; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-            } else {
-              __pyx_t_1 = __Pyx_PyObject_CallNoArg(__pyx_t_2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 351; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            }
-            __Pyx_GOTREF(__pyx_t_1);
-            __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-            __pyx_t_14 = (__Pyx_PyString_Equals(__pyx_t_1, __pyx_kp_s_ELEMENT_SHELL_THICKNESS, Py_EQ)); if (unlikely(__pyx_t_14 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 351; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-            if (__pyx_t_14) {
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":352
- *                     ofile.write(line)
- *                 elif line.strip() == "*ELEMENT_SHELL_THICKNESS":
- *                     i=0             # <<<<<<<<<<<<<<
- *                     # self.logger.debug("*ELEMENT_SHELL_THICKNESS found")
- *                     elemsection = False
- */
-              __Pyx_INCREF(__pyx_int_0);
-              __Pyx_DECREF_SET(__pyx_v_i, __pyx_int_0);
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":354
- *                     i=0
- *                     # self.logger.debug("*ELEMENT_SHELL_THICKNESS found")
- *                     elemsection = False             # <<<<<<<<<<<<<<
- *                     elemthicksection = True
- *                     elemshellthicknesswritten = True
- */
-              __pyx_v_elemsection = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":355
- *                     # self.logger.debug("*ELEMENT_SHELL_THICKNESS found")
- *                     elemsection = False
- *                     elemthicksection = True             # <<<<<<<<<<<<<<
- *                     elemshellthicknesswritten = True
- *                     elemshellwritten = False
- */
-              __pyx_v_elemthicksection = 1;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":356
- *                     elemsection = False
- *                     elemthicksection = True
- *                     elemshellthicknesswritten = True             # <<<<<<<<<<<<<<
- *                     elemshellwritten = False
- *                     nodesection = False
- */
-              __pyx_v_elemshellthicknesswritten = 1;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":357
- *                     elemthicksection = True
- *                     elemshellthicknesswritten = True
- *                     elemshellwritten = False             # <<<<<<<<<<<<<<
- *                     nodesection = False
- *                     # self.logger.debug("state variables [elemsection,elemshellwritten,elemthicksection,elemshellthicknesswritten,nodesection]"+str([elemsection,elemshellwritten,elemthicksection,elemshellthicknesswritten,nodesection]))
- */
-              __pyx_v_elemshellwritten = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":358
- *                     elemshellthicknesswritten = True
- *                     elemshellwritten = False
- *                     nodesection = False             # <<<<<<<<<<<<<<
- *                     # self.logger.debug("state variables [elemsection,elemshellwritten,elemthicksection,elemshellthicknesswritten,nodesection]"+str([elemsection,elemshellwritten,elemthicksection,elemshellthicknesswritten,nodesection]))
- *                     ofile.write(line)
- */
-              __pyx_v_nodesection = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":360
- *                     nodesection = False
- *                     # self.logger.debug("state variables [elemsection,elemshellwritten,elemthicksection,elemshellthicknesswritten,nodesection]"+str([elemsection,elemshellwritten,elemthicksection,elemshellthicknesswritten,nodesection]))
- *                     ofile.write(line)             # <<<<<<<<<<<<<<
- *                 elif line.strip() == "*NODE":
- *                     # self.logger.debug("*NODE found")
- */
-              __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_ofile, __pyx_n_s_write); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 360; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_2);
-              __pyx_t_6 = NULL;
-              if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_2))) {
-                __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_2);
-                if (likely(__pyx_t_6)) {
-                  PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
-                  __Pyx_INCREF(__pyx_t_6);
-                  __Pyx_INCREF(function);
-                  __Pyx_DECREF_SET(__pyx_t_2, function);
-                }
-              }
-              if (!__pyx_t_6) {
-                __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_v_line); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 360; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_1);
-              } else {
-                __pyx_t_3 = PyTuple_New(1+1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 360; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_3);
-                __Pyx_GIVEREF(__pyx_t_6); PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_6); __pyx_t_6 = NULL;
-                __Pyx_INCREF(__pyx_v_line);
-                __Pyx_GIVEREF(__pyx_v_line);
-                PyTuple_SET_ITEM(__pyx_t_3, 0+1, __pyx_v_line);
-                __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_3, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 360; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_1);
-                __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-              }
-              __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-              __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":351
- *                     # self.logger.debug("state variables [elemsection,elemshellwritten,elemthicksection,elemshellthicknesswritten,nodesection]"+str([elemsection,elemshellwritten,elemthicksection,elemshellthicknesswritten,nodesection]))
- *                     ofile.write(line)
- *                 elif line.strip() == "*ELEMENT_SHELL_THICKNESS":             # <<<<<<<<<<<<<<
- *                     i=0
- *                     # self.logger.debug("*ELEMENT_SHELL_THICKNESS found")
- */
-              goto __pyx_L17;
-            }
-
-            /* "cNK_FEMeshUtils\MeshReaders.py":361
- *                     # self.logger.debug("state variables [elemsection,elemshellwritten,elemthicksection,elemshellthicknesswritten,nodesection]"+str([elemsection,elemshellwritten,elemthicksection,elemshellthicknesswritten,nodesection]))
- *                     ofile.write(line)
- *                 elif line.strip() == "*NODE":             # <<<<<<<<<<<<<<
- *                     # self.logger.debug("*NODE found")
- *                     elemsection = False
- */
-            __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_line, __pyx_n_s_strip); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 361; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __Pyx_GOTREF(__pyx_t_2);
-            __pyx_t_3 = NULL;
-            if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_2))) {
-              __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
-              if (likely(__pyx_t_3)) {
-                PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
-                __Pyx_INCREF(__pyx_t_3);
-                __Pyx_INCREF(function);
-                __Pyx_DECREF_SET(__pyx_t_2, function);
-              }
-            }
-            if (__pyx_t_3) {
-              __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_3); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 361; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-            } else {
-              __pyx_t_1 = __Pyx_PyObject_CallNoArg(__pyx_t_2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 361; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            }
-            __Pyx_GOTREF(__pyx_t_1);
-            __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-            __pyx_t_14 = (__Pyx_PyString_Equals(__pyx_t_1, __pyx_kp_s_NODE, Py_EQ)); if (unlikely(__pyx_t_14 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 361; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-            if (__pyx_t_14) {
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":363
- *                 elif line.strip() == "*NODE":
- *                     # self.logger.debug("*NODE found")
- *                     elemsection = False             # <<<<<<<<<<<<<<
- *                     elemthicksection = False
- *                     elemshellthicknesswritten = False
- */
-              __pyx_v_elemsection = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":364
- *                     # self.logger.debug("*NODE found")
- *                     elemsection = False
- *                     elemthicksection = False             # <<<<<<<<<<<<<<
- *                     elemshellthicknesswritten = False
- *                     elemshellwritten = False
- */
-              __pyx_v_elemthicksection = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":365
- *                     elemsection = False
- *                     elemthicksection = False
- *                     elemshellthicknesswritten = False             # <<<<<<<<<<<<<<
- *                     elemshellwritten = False
- *                     nodesection = True
- */
-              __pyx_v_elemshellthicknesswritten = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":366
- *                     elemthicksection = False
- *                     elemshellthicknesswritten = False
- *                     elemshellwritten = False             # <<<<<<<<<<<<<<
- *                     nodesection = True
- *                     # self.logger.debug("state variables [elemsection,elemshellwritten,elemthicksection,elemshellthicknesswritten,nodesection]"+str([elemsection,elemshellwritten,elemthicksection,elemshellthicknesswritten,nodesection]))
- */
-              __pyx_v_elemshellwritten = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":367
- *                     elemshellthicknesswritten = False
- *                     elemshellwritten = False
- *                     nodesection = True             # <<<<<<<<<<<<<<
- *                     # self.logger.debug("state variables [elemsection,elemshellwritten,elemthicksection,elemshellthicknesswritten,nodesection]"+str([elemsection,elemshellwritten,elemthicksection,elemshellthicknesswritten,nodesection]))
- *                     ofile.write(line)
- */
-              __pyx_v_nodesection = 1;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":369
- *                     nodesection = True
- *                     # self.logger.debug("state variables [elemsection,elemshellwritten,elemthicksection,elemshellthicknesswritten,nodesection]"+str([elemsection,elemshellwritten,elemthicksection,elemshellthicknesswritten,nodesection]))
- *                     ofile.write(line)             # <<<<<<<<<<<<<<
- *                 elif "*" in line and not "*ELEMENT_SHELL" in line and not "*NODE" in line:
- *                     elemsection = False
- */
-              __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_ofile, __pyx_n_s_write); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 369; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_2);
-              __pyx_t_3 = NULL;
-              if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_2))) {
-                __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
-                if (likely(__pyx_t_3)) {
-                  PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
-                  __Pyx_INCREF(__pyx_t_3);
-                  __Pyx_INCREF(function);
-                  __Pyx_DECREF_SET(__pyx_t_2, function);
-                }
-              }
-              if (!__pyx_t_3) {
-                __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_v_line); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 369; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_1);
-              } else {
-                __pyx_t_6 = PyTuple_New(1+1); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 369; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_6);
-                __Pyx_GIVEREF(__pyx_t_3); PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_3); __pyx_t_3 = NULL;
-                __Pyx_INCREF(__pyx_v_line);
-                __Pyx_GIVEREF(__pyx_v_line);
-                PyTuple_SET_ITEM(__pyx_t_6, 0+1, __pyx_v_line);
-                __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_6, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 369; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_1);
-                __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-              }
-              __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-              __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":361
- *                     # self.logger.debug("state variables [elemsection,elemshellwritten,elemthicksection,elemshellthicknesswritten,nodesection]"+str([elemsection,elemshellwritten,elemthicksection,elemshellthicknesswritten,nodesection]))
- *                     ofile.write(line)
- *                 elif line.strip() == "*NODE":             # <<<<<<<<<<<<<<
- *                     # self.logger.debug("*NODE found")
- *                     elemsection = False
- */
-              goto __pyx_L17;
-            }
-
-            /* "cNK_FEMeshUtils\MeshReaders.py":370
- *                     # self.logger.debug("state variables [elemsection,elemshellwritten,elemthicksection,elemshellthicknesswritten,nodesection]"+str([elemsection,elemshellwritten,elemthicksection,elemshellthicknesswritten,nodesection]))
- *                     ofile.write(line)
- *                 elif "*" in line and not "*ELEMENT_SHELL" in line and not "*NODE" in line:             # <<<<<<<<<<<<<<
- *                     elemsection = False
- *                     nodesection = False
- */
-            __pyx_t_12 = (__Pyx_PySequence_ContainsTF(__pyx_kp_s__2, __pyx_v_line, Py_EQ)); if (unlikely(__pyx_t_12 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 370; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __pyx_t_13 = (__pyx_t_12 != 0);
-            if (__pyx_t_13) {
-            } else {
-              __pyx_t_14 = __pyx_t_13;
-              goto __pyx_L33_bool_binop_done;
-            }
-            __pyx_t_13 = (__Pyx_PySequence_ContainsTF(__pyx_kp_s_ELEMENT_SHELL, __pyx_v_line, Py_NE)); if (unlikely(__pyx_t_13 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 370; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __pyx_t_12 = (__pyx_t_13 != 0);
-            if (__pyx_t_12) {
-            } else {
-              __pyx_t_14 = __pyx_t_12;
-              goto __pyx_L33_bool_binop_done;
-            }
-            __pyx_t_12 = (__Pyx_PySequence_ContainsTF(__pyx_kp_s_NODE, __pyx_v_line, Py_NE)); if (unlikely(__pyx_t_12 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 370; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __pyx_t_13 = (__pyx_t_12 != 0);
-            __pyx_t_14 = __pyx_t_13;
-            __pyx_L33_bool_binop_done:;
-            if (__pyx_t_14) {
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":371
- *                     ofile.write(line)
- *                 elif "*" in line and not "*ELEMENT_SHELL" in line and not "*NODE" in line:
- *                     elemsection = False             # <<<<<<<<<<<<<<
- *                     nodesection = False
- *                     ofile.write(line)
- */
-              __pyx_v_elemsection = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":372
- *                 elif "*" in line and not "*ELEMENT_SHELL" in line and not "*NODE" in line:
- *                     elemsection = False
- *                     nodesection = False             # <<<<<<<<<<<<<<
- *                     ofile.write(line)
- *                 else:
- */
-              __pyx_v_nodesection = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":373
- *                     elemsection = False
- *                     nodesection = False
- *                     ofile.write(line)             # <<<<<<<<<<<<<<
- *                 else:
- *                     ofile.write(line)
- */
-              __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_ofile, __pyx_n_s_write); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 373; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_2);
-              __pyx_t_6 = NULL;
-              if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_2))) {
-                __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_2);
-                if (likely(__pyx_t_6)) {
-                  PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
-                  __Pyx_INCREF(__pyx_t_6);
-                  __Pyx_INCREF(function);
-                  __Pyx_DECREF_SET(__pyx_t_2, function);
-                }
-              }
-              if (!__pyx_t_6) {
-                __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_v_line); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 373; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_1);
-              } else {
-                __pyx_t_3 = PyTuple_New(1+1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 373; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_3);
-                __Pyx_GIVEREF(__pyx_t_6); PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_6); __pyx_t_6 = NULL;
-                __Pyx_INCREF(__pyx_v_line);
-                __Pyx_GIVEREF(__pyx_v_line);
-                PyTuple_SET_ITEM(__pyx_t_3, 0+1, __pyx_v_line);
-                __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_3, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 373; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_1);
-                __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-              }
-              __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-              __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":370
- *                     # self.logger.debug("state variables [elemsection,elemshellwritten,elemthicksection,elemshellthicknesswritten,nodesection]"+str([elemsection,elemshellwritten,elemthicksection,elemshellthicknesswritten,nodesection]))
- *                     ofile.write(line)
- *                 elif "*" in line and not "*ELEMENT_SHELL" in line and not "*NODE" in line:             # <<<<<<<<<<<<<<
- *                     elemsection = False
- *                     nodesection = False
- */
-              goto __pyx_L17;
-            }
-
-            /* "cNK_FEMeshUtils\MeshReaders.py":375
- *                     ofile.write(line)
- *                 else:
- *                     ofile.write(line)             # <<<<<<<<<<<<<<
- *         ofile.close
- *         # self.logger.info('Writing to LS-Dyna Mesh file completed')
- */
-            /*else*/ {
-              __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_ofile, __pyx_n_s_write); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 375; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_2);
-              __pyx_t_3 = NULL;
-              if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_2))) {
-                __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
-                if (likely(__pyx_t_3)) {
-                  PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
-                  __Pyx_INCREF(__pyx_t_3);
-                  __Pyx_INCREF(function);
-                  __Pyx_DECREF_SET(__pyx_t_2, function);
-                }
-              }
-              if (!__pyx_t_3) {
-                __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_v_line); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 375; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_1);
-              } else {
-                __pyx_t_6 = PyTuple_New(1+1); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 375; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_6);
-                __Pyx_GIVEREF(__pyx_t_3); PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_3); __pyx_t_3 = NULL;
-                __Pyx_INCREF(__pyx_v_line);
-                __Pyx_GIVEREF(__pyx_v_line);
-                PyTuple_SET_ITEM(__pyx_t_6, 0+1, __pyx_v_line);
-                __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_6, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 375; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_1);
-                __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-              }
-              __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-              __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-            }
-            __pyx_L17:;
-
-            /* "cNK_FEMeshUtils\MeshReaders.py":306
- *         # self.logger.info("Baseline Input is taken from: "+ _Mesh.getMeshFile())
- *         with open(_Mesh.getMeshFile(), "r") as f:
- *             for line in f:             # <<<<<<<<<<<<<<
- *                 if (elemsection == True) and (not("$" in line or "*" in line)):
- *                     if (int(line[9:16]) in _Mesh.NUTProps):
- */
-          }
-          __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-
-          /* "cNK_FEMeshUtils\MeshReaders.py":305
- *         # self.logger.info("LS-Dyna Mesh will be written to: "+ file)
- *         # self.logger.info("Baseline Input is taken from: "+ _Mesh.getMeshFile())
- *         with open(_Mesh.getMeshFile(), "r") as f:             # <<<<<<<<<<<<<<
- *             for line in f:
- *                 if (elemsection == True) and (not("$" in line or "*" in line)):
- */
-        }
-        __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
-        __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
-        __Pyx_XDECREF(__pyx_t_10); __pyx_t_10 = 0;
-        goto __pyx_L14_try_end;
-        __pyx_L7_error:;
-        __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-        __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
-        __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-        __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
-        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-        /*except:*/ {
-          __Pyx_AddTraceback("cNK_FEMeshUtils.MeshReaders.MeshReaders.writeDynaMesh", __pyx_clineno, __pyx_lineno, __pyx_filename);
-          if (__Pyx_GetException(&__pyx_t_4, &__pyx_t_1, &__pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 305; __pyx_clineno = __LINE__; goto __pyx_L9_except_error;}
-          __Pyx_GOTREF(__pyx_t_4);
-          __Pyx_GOTREF(__pyx_t_1);
-          __Pyx_GOTREF(__pyx_t_2);
-          __pyx_t_6 = PyTuple_Pack(3, __pyx_t_4, __pyx_t_1, __pyx_t_2); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 305; __pyx_clineno = __LINE__; goto __pyx_L9_except_error;}
-          __Pyx_GOTREF(__pyx_t_6);
-          __pyx_t_18 = __Pyx_PyObject_Call(__pyx_t_7, __pyx_t_6, NULL);
-          __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-          __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-          if (unlikely(!__pyx_t_18)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 305; __pyx_clineno = __LINE__; goto __pyx_L9_except_error;}
-          __Pyx_GOTREF(__pyx_t_18);
-          __pyx_t_14 = __Pyx_PyObject_IsTrue(__pyx_t_18);
-          __Pyx_DECREF(__pyx_t_18); __pyx_t_18 = 0;
-          if (__pyx_t_14 < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 305; __pyx_clineno = __LINE__; goto __pyx_L9_except_error;}
-          __pyx_t_13 = ((!(__pyx_t_14 != 0)) != 0);
-          if (__pyx_t_13) {
-            __Pyx_GIVEREF(__pyx_t_4);
-            __Pyx_GIVEREF(__pyx_t_1);
-            __Pyx_XGIVEREF(__pyx_t_2);
-            __Pyx_ErrRestore(__pyx_t_4, __pyx_t_1, __pyx_t_2);
-            __pyx_t_4 = 0; __pyx_t_1 = 0; __pyx_t_2 = 0; 
-            {__pyx_filename = __pyx_f[0]; __pyx_lineno = 305; __pyx_clineno = __LINE__; goto __pyx_L9_except_error;}
-          }
-          __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-          __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-          __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-          goto __pyx_L8_exception_handled;
-        }
-        __pyx_L9_except_error:;
-        __Pyx_XGIVEREF(__pyx_t_8);
-        __Pyx_XGIVEREF(__pyx_t_9);
-        __Pyx_XGIVEREF(__pyx_t_10);
-        __Pyx_ExceptionReset(__pyx_t_8, __pyx_t_9, __pyx_t_10);
-        goto __pyx_L1_error;
-        __pyx_L8_exception_handled:;
-        __Pyx_XGIVEREF(__pyx_t_8);
-        __Pyx_XGIVEREF(__pyx_t_9);
-        __Pyx_XGIVEREF(__pyx_t_10);
-        __Pyx_ExceptionReset(__pyx_t_8, __pyx_t_9, __pyx_t_10);
-        __pyx_L14_try_end:;
-      }
-    }
-    /*finally:*/ {
-      /*normal exit:*/{
-        if (__pyx_t_7) {
-          __pyx_t_10 = __Pyx_PyObject_Call(__pyx_t_7, __pyx_tuple__85, NULL);
-          __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-          if (unlikely(!__pyx_t_10)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 305; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-          __Pyx_GOTREF(__pyx_t_10);
-          __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
-        }
-        goto __pyx_L6;
-      }
-      __pyx_L6:;
-    }
-    goto __pyx_L39;
-    __pyx_L3_error:;
-    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-    goto __pyx_L1_error;
-    __pyx_L39:;
-  }
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":376
- *                 else:
- *                     ofile.write(line)
- *         ofile.close             # <<<<<<<<<<<<<<
- *         # self.logger.info('Writing to LS-Dyna Mesh file completed')
- * 
- */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_ofile, __pyx_n_s_close); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 376; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":290
- *         return _Mesh
- * 
- *     def writeDynaMesh(self, _Mesh, file):             # <<<<<<<<<<<<<<
- *         elemsection = False
- *         elemthicksection = False
- */
-
-  /* function exit code */
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_6);
-  __Pyx_AddTraceback("cNK_FEMeshUtils.MeshReaders.MeshReaders.writeDynaMesh", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_i);
-  __Pyx_XDECREF(__pyx_v_ofile);
-  __Pyx_XDECREF(__pyx_v_f);
-  __Pyx_XDECREF(__pyx_v_line);
-  __Pyx_XDECREF(__pyx_v_s);
-  __Pyx_XDECREF(__pyx_v_nid);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* Python wrapper */
-static PyObject *__pyx_pw_15cNK_FEMeshUtils_11MeshReaders_11MeshReaders_5writeDynaMesh(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_pw_15cNK_FEMeshUtils_11MeshReaders_11MeshReaders_5writeDynaMesh(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  struct __pyx_obj_15cNK_FEMeshUtils_4Mesh_Mesh *__pyx_v__Mesh = 0;
-  PyObject *__pyx_v_file = 0;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  PyObject *__pyx_r = 0;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("writeDynaMesh (wrapper)", 0);
-  {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_Mesh,&__pyx_n_s_file,0};
-    PyObject* values[2] = {0,0};
-    if (unlikely(__pyx_kwds)) {
-      Py_ssize_t kw_args;
-      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
-      switch (pos_args) {
-        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = PyDict_Size(__pyx_kwds);
-      switch (pos_args) {
-        case  0:
-        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_Mesh)) != 0)) kw_args--;
-        else goto __pyx_L5_argtuple_error;
-        case  1:
-        if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_file)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("writeDynaMesh", 1, 2, 2, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 290; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-        }
-      }
-      if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "writeDynaMesh") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 290; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      }
-    } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
-      goto __pyx_L5_argtuple_error;
-    } else {
-      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-    }
-    __pyx_v__Mesh = ((struct __pyx_obj_15cNK_FEMeshUtils_4Mesh_Mesh *)values[0]);
-    __pyx_v_file = ((PyObject*)values[1]);
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("writeDynaMesh", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 290; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("cNK_FEMeshUtils.MeshReaders.MeshReaders.writeDynaMesh", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v__Mesh), __pyx_ptype_15cNK_FEMeshUtils_4Mesh_Mesh, 1, "_Mesh", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 290; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_file), (&PyString_Type), 1, "file", 1))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 290; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_r = __pyx_pf_15cNK_FEMeshUtils_11MeshReaders_11MeshReaders_4writeDynaMesh(((struct __pyx_obj_15cNK_FEMeshUtils_11MeshReaders_MeshReaders *)__pyx_v_self), __pyx_v__Mesh, __pyx_v_file);
-
-  /* function exit code */
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-static PyObject *__pyx_pf_15cNK_FEMeshUtils_11MeshReaders_11MeshReaders_4writeDynaMesh(struct __pyx_obj_15cNK_FEMeshUtils_11MeshReaders_MeshReaders *__pyx_v_self, struct __pyx_obj_15cNK_FEMeshUtils_4Mesh_Mesh *__pyx_v__Mesh, PyObject *__pyx_v_file) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("writeDynaMesh", 0);
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_f_15cNK_FEMeshUtils_11MeshReaders_11MeshReaders_writeDynaMesh(__pyx_v_self, __pyx_v__Mesh, __pyx_v_file, 1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 290; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("cNK_FEMeshUtils.MeshReaders.MeshReaders.writeDynaMesh", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "cNK_FEMeshUtils\MeshReaders.py":379
- *         # self.logger.info('Writing to LS-Dyna Mesh file completed')
- * 
- *     def writeRadiossMesh(self, _Mesh, file):             # <<<<<<<<<<<<<<
- *         nodesection = False
- *         SH3Nsection = False
- */
-
-static PyObject *__pyx_pw_15cNK_FEMeshUtils_11MeshReaders_11MeshReaders_7writeRadiossMesh(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_f_15cNK_FEMeshUtils_11MeshReaders_11MeshReaders_writeRadiossMesh(CYTHON_UNUSED struct __pyx_obj_15cNK_FEMeshUtils_11MeshReaders_MeshReaders *__pyx_v_self, struct __pyx_obj_15cNK_FEMeshUtils_4Mesh_Mesh *__pyx_v__Mesh, PyObject *__pyx_v_file, int __pyx_skip_dispatch) {
-  int __pyx_v_nodesection;
-  int __pyx_v_SH3Nsection;
-  int __pyx_v_SHELLsection;
-  CYTHON_UNUSED int __pyx_v_partsection;
-  CYTHON_UNUSED int __pyx_v_matsection;
-  CYTHON_UNUSED int __pyx_v_propsection;
-  int __pyx_v_elemthick;
-  PyObject *__pyx_v_partid = NULL;
-  CYTHON_UNUSED long __pyx_v_i;
-  PyObject *__pyx_v_ofile = NULL;
-  PyObject *__pyx_v_f = NULL;
-  PyObject *__pyx_v_line = NULL;
-  PyObject *__pyx_v_elemid = NULL;
-  double __pyx_v_thick;
-  PyObject *__pyx_v_nid = NULL;
-  double __pyx_v_x;
-  double __pyx_v_y;
-  double __pyx_v_z;
-  PyObject *__pyx_v_s = NULL;
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  Py_ssize_t __pyx_t_5;
-  PyObject *__pyx_t_6 = NULL;
-  PyObject *__pyx_t_7 = NULL;
-  PyObject *__pyx_t_8 = NULL;
-  PyObject *__pyx_t_9 = NULL;
-  PyObject *__pyx_t_10 = NULL;
-  int __pyx_t_11;
-  PyObject *(*__pyx_t_12)(PyObject *);
-  int __pyx_t_13;
-  PyObject *__pyx_t_14 = NULL;
-  int __pyx_t_15;
-  int __pyx_t_16;
-  int __pyx_t_17;
-  double __pyx_t_18;
-  PyObject *__pyx_t_19 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("writeRadiossMesh", 0);
-  /* Check if called by wrapper */
-  if (unlikely(__pyx_skip_dispatch)) ;
-  /* Check if overridden in Python */
-  else if (unlikely(Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0)) {
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_writeRadiossMesh); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 379; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)__pyx_pw_15cNK_FEMeshUtils_11MeshReaders_11MeshReaders_7writeRadiossMesh)) {
-      __Pyx_XDECREF(__pyx_r);
-      __Pyx_INCREF(__pyx_t_1);
-      __pyx_t_3 = __pyx_t_1; __pyx_t_4 = NULL;
-      __pyx_t_5 = 0;
-      if (CYTHON_COMPILING_IN_CPYTHON && unlikely(PyMethod_Check(__pyx_t_3))) {
-        __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
-        if (likely(__pyx_t_4)) {
-          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-          __Pyx_INCREF(__pyx_t_4);
-          __Pyx_INCREF(function);
-          __Pyx_DECREF_SET(__pyx_t_3, function);
-          __pyx_t_5 = 1;
-        }
-      }
-      __pyx_t_6 = PyTuple_New(2+__pyx_t_5); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 379; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_6);
-      if (__pyx_t_4) {
-        __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_4); __pyx_t_4 = NULL;
-      }
-      __Pyx_INCREF(((PyObject *)__pyx_v__Mesh));
-      __Pyx_GIVEREF(((PyObject *)__pyx_v__Mesh));
-      PyTuple_SET_ITEM(__pyx_t_6, 0+__pyx_t_5, ((PyObject *)__pyx_v__Mesh));
-      __Pyx_INCREF(__pyx_v_file);
-      __Pyx_GIVEREF(__pyx_v_file);
-      PyTuple_SET_ITEM(__pyx_t_6, 1+__pyx_t_5, __pyx_v_file);
-      __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_6, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 379; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_r = __pyx_t_2;
-      __pyx_t_2 = 0;
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      goto __pyx_L0;
-    }
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  }
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":380
- * 
- *     def writeRadiossMesh(self, _Mesh, file):
- *         nodesection = False             # <<<<<<<<<<<<<<
- *         SH3Nsection = False
- *         SHELLsection = False
- */
-  __pyx_v_nodesection = 0;
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":381
- *     def writeRadiossMesh(self, _Mesh, file):
- *         nodesection = False
- *         SH3Nsection = False             # <<<<<<<<<<<<<<
- *         SHELLsection = False
- *         partsection = False
- */
-  __pyx_v_SH3Nsection = 0;
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":382
- *         nodesection = False
- *         SH3Nsection = False
- *         SHELLsection = False             # <<<<<<<<<<<<<<
- *         partsection = False
- *         matsection = False
- */
-  __pyx_v_SHELLsection = 0;
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":383
- *         SH3Nsection = False
- *         SHELLsection = False
- *         partsection = False             # <<<<<<<<<<<<<<
- *         matsection = False
- *         propsection = False
- */
-  __pyx_v_partsection = 0;
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":384
- *         SHELLsection = False
- *         partsection = False
- *         matsection = False             # <<<<<<<<<<<<<<
- *         propsection = False
- * 
- */
-  __pyx_v_matsection = 0;
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":385
- *         partsection = False
- *         matsection = False
- *         propsection = False             # <<<<<<<<<<<<<<
- * 
- *         elemthick=False
- */
-  __pyx_v_propsection = 0;
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":387
- *         propsection = False
- * 
- *         elemthick=False             # <<<<<<<<<<<<<<
- *         partid = 0
- *         i=0
- */
-  __pyx_v_elemthick = 0;
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":388
- * 
- *         elemthick=False
- *         partid = 0             # <<<<<<<<<<<<<<
- *         i=0
- * 
- */
-  __Pyx_INCREF(__pyx_int_0);
-  __pyx_v_partid = __pyx_int_0;
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":389
- *         elemthick=False
- *         partid = 0
- *         i=0             # <<<<<<<<<<<<<<
- * 
- *         ofile=open(file, "w")
- */
-  __pyx_v_i = 0;
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":391
- *         i=0
- * 
- *         ofile=open(file, "w")             # <<<<<<<<<<<<<<
- *         # self.logger.info("Radioss Mesh will be written to: "+ file)
- *         # self.logger.info("Baseline Input is taken from: "+ _Mesh.getMeshFile())
- */
-  __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 391; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_INCREF(__pyx_v_file);
-  __Pyx_GIVEREF(__pyx_v_file);
-  PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_file);
-  __Pyx_INCREF(__pyx_n_s_w);
-  __Pyx_GIVEREF(__pyx_n_s_w);
-  PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_n_s_w);
-  __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_open, __pyx_t_1, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 391; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_v_ofile = __pyx_t_2;
-  __pyx_t_2 = 0;
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":394
- *         # self.logger.info("Radioss Mesh will be written to: "+ file)
- *         # self.logger.info("Baseline Input is taken from: "+ _Mesh.getMeshFile())
- *         with open(_Mesh.getMeshFile(), "r") as f:             # <<<<<<<<<<<<<<
- *             if len(_Mesh.Elementalthickness.keys())!=0: elemthick=True
- *             for line in f:
- */
-  /*with:*/ {
-    __pyx_t_2 = ((struct __pyx_vtabstruct_15cNK_FEMeshUtils_4Mesh_Mesh *)__pyx_v__Mesh->__pyx_vtab)->getMeshFile(__pyx_v__Mesh, 0); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 394; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 394; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_GIVEREF(__pyx_t_2);
-    PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_2);
-    __Pyx_INCREF(__pyx_n_s_r);
-    __Pyx_GIVEREF(__pyx_n_s_r);
-    PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_n_s_r);
-    __pyx_t_2 = 0;
-    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_open, __pyx_t_1, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 394; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_t_7 = __Pyx_PyObject_LookupSpecial(__pyx_t_2, __pyx_n_s_exit); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 394; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_7);
-    __pyx_t_3 = __Pyx_PyObject_LookupSpecial(__pyx_t_2, __pyx_n_s_enter); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 394; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_6 = NULL;
-    if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_3))) {
-      __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_3);
-      if (likely(__pyx_t_6)) {
-        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-        __Pyx_INCREF(__pyx_t_6);
-        __Pyx_INCREF(function);
-        __Pyx_DECREF_SET(__pyx_t_3, function);
-      }
-    }
-    if (__pyx_t_6) {
-      __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_6); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 394; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    } else {
-      __pyx_t_1 = __Pyx_PyObject_CallNoArg(__pyx_t_3); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 394; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    }
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __pyx_t_3 = __pyx_t_1;
-    __pyx_t_1 = 0;
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    /*try:*/ {
-      {
-        __Pyx_ExceptionSave(&__pyx_t_8, &__pyx_t_9, &__pyx_t_10);
-        __Pyx_XGOTREF(__pyx_t_8);
-        __Pyx_XGOTREF(__pyx_t_9);
-        __Pyx_XGOTREF(__pyx_t_10);
-        /*try:*/ {
-          __pyx_v_f = __pyx_t_3;
-          __pyx_t_3 = 0;
-
-          /* "cNK_FEMeshUtils\MeshReaders.py":395
- *         # self.logger.info("Baseline Input is taken from: "+ _Mesh.getMeshFile())
- *         with open(_Mesh.getMeshFile(), "r") as f:
- *             if len(_Mesh.Elementalthickness.keys())!=0: elemthick=True             # <<<<<<<<<<<<<<
- *             for line in f:
- *                 if "#RADIOSS STARTER" in line:
- */
-          if (unlikely(__pyx_v__Mesh->Elementalthickness == Py_None)) {
-            PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%s'", "keys");
-            {__pyx_filename = __pyx_f[0]; __pyx_lineno = 395; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-          }
-          __pyx_t_3 = __Pyx_PyDict_Keys(__pyx_v__Mesh->Elementalthickness); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 395; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-          __Pyx_GOTREF(__pyx_t_3);
-          __pyx_t_5 = PyObject_Length(__pyx_t_3); if (unlikely(__pyx_t_5 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 395; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-          __pyx_t_11 = ((__pyx_t_5 != 0) != 0);
-          if (__pyx_t_11) {
-            __pyx_v_elemthick = 1;
-          }
-
-          /* "cNK_FEMeshUtils\MeshReaders.py":396
- *         with open(_Mesh.getMeshFile(), "r") as f:
- *             if len(_Mesh.Elementalthickness.keys())!=0: elemthick=True
- *             for line in f:             # <<<<<<<<<<<<<<
- *                 if "#RADIOSS STARTER" in line:
- *                     ofile.write(line)
- */
-          if (likely(PyList_CheckExact(__pyx_v_f)) || PyTuple_CheckExact(__pyx_v_f)) {
-            __pyx_t_3 = __pyx_v_f; __Pyx_INCREF(__pyx_t_3); __pyx_t_5 = 0;
-            __pyx_t_12 = NULL;
-          } else {
-            __pyx_t_5 = -1; __pyx_t_3 = PyObject_GetIter(__pyx_v_f); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 396; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __Pyx_GOTREF(__pyx_t_3);
-            __pyx_t_12 = Py_TYPE(__pyx_t_3)->tp_iternext; if (unlikely(!__pyx_t_12)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 396; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-          }
-          for (;;) {
-            if (likely(!__pyx_t_12)) {
-              if (likely(PyList_CheckExact(__pyx_t_3))) {
-                if (__pyx_t_5 >= PyList_GET_SIZE(__pyx_t_3)) break;
-                #if CYTHON_COMPILING_IN_CPYTHON
-                __pyx_t_2 = PyList_GET_ITEM(__pyx_t_3, __pyx_t_5); __Pyx_INCREF(__pyx_t_2); __pyx_t_5++; if (unlikely(0 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 396; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                #else
-                __pyx_t_2 = PySequence_ITEM(__pyx_t_3, __pyx_t_5); __pyx_t_5++; if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 396; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_2);
-                #endif
-              } else {
-                if (__pyx_t_5 >= PyTuple_GET_SIZE(__pyx_t_3)) break;
-                #if CYTHON_COMPILING_IN_CPYTHON
-                __pyx_t_2 = PyTuple_GET_ITEM(__pyx_t_3, __pyx_t_5); __Pyx_INCREF(__pyx_t_2); __pyx_t_5++; if (unlikely(0 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 396; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                #else
-                __pyx_t_2 = PySequence_ITEM(__pyx_t_3, __pyx_t_5); __pyx_t_5++; if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 396; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_2);
-                #endif
-              }
-            } else {
-              __pyx_t_2 = __pyx_t_12(__pyx_t_3);
-              if (unlikely(!__pyx_t_2)) {
-                PyObject* exc_type = PyErr_Occurred();
-                if (exc_type) {
-                  if (likely(exc_type == PyExc_StopIteration || PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
-                  else {__pyx_filename = __pyx_f[0]; __pyx_lineno = 396; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                }
-                break;
-              }
-              __Pyx_GOTREF(__pyx_t_2);
-            }
-            __Pyx_XDECREF_SET(__pyx_v_line, __pyx_t_2);
-            __pyx_t_2 = 0;
-
-            /* "cNK_FEMeshUtils\MeshReaders.py":397
- *             if len(_Mesh.Elementalthickness.keys())!=0: elemthick=True
- *             for line in f:
- *                 if "#RADIOSS STARTER" in line:             # <<<<<<<<<<<<<<
- *                     ofile.write(line)
- *                     ofile.write("## - Mubea TRB CAE - FE_Mesh_Handlers - writeRadiossMesh\n")
- */
-            __pyx_t_11 = (__Pyx_PySequence_ContainsTF(__pyx_kp_s_RADIOSS_STARTER, __pyx_v_line, Py_EQ)); if (unlikely(__pyx_t_11 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 397; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __pyx_t_13 = (__pyx_t_11 != 0);
-            if (__pyx_t_13) {
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":398
- *             for line in f:
- *                 if "#RADIOSS STARTER" in line:
- *                     ofile.write(line)             # <<<<<<<<<<<<<<
- *                     ofile.write("## - Mubea TRB CAE - FE_Mesh_Handlers - writeRadiossMesh\n")
- *                     ofile.write("## - Date/Time: "+datetime.now().strftime('%Y/%m/%d %H:%M:%S')+"\n")
- */
-              __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_ofile, __pyx_n_s_write); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 398; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_1);
-              __pyx_t_6 = NULL;
-              if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_1))) {
-                __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_1);
-                if (likely(__pyx_t_6)) {
-                  PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
-                  __Pyx_INCREF(__pyx_t_6);
-                  __Pyx_INCREF(function);
-                  __Pyx_DECREF_SET(__pyx_t_1, function);
-                }
-              }
-              if (!__pyx_t_6) {
-                __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_v_line); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 398; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_2);
-              } else {
-                __pyx_t_4 = PyTuple_New(1+1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 398; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_4);
-                __Pyx_GIVEREF(__pyx_t_6); PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_6); __pyx_t_6 = NULL;
-                __Pyx_INCREF(__pyx_v_line);
-                __Pyx_GIVEREF(__pyx_v_line);
-                PyTuple_SET_ITEM(__pyx_t_4, 0+1, __pyx_v_line);
-                __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_4, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 398; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_2);
-                __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-              }
-              __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-              __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":399
- *                 if "#RADIOSS STARTER" in line:
- *                     ofile.write(line)
- *                     ofile.write("## - Mubea TRB CAE - FE_Mesh_Handlers - writeRadiossMesh\n")             # <<<<<<<<<<<<<<
- *                     ofile.write("## - Date/Time: "+datetime.now().strftime('%Y/%m/%d %H:%M:%S')+"\n")
- *                     ofile.write("## - User: "+getuser()+"\n")
- */
-              __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_ofile, __pyx_n_s_write); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 399; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_2);
-              __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_tuple__86, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 399; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_1);
-              __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-              __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":400
- *                     ofile.write(line)
- *                     ofile.write("## - Mubea TRB CAE - FE_Mesh_Handlers - writeRadiossMesh\n")
- *                     ofile.write("## - Date/Time: "+datetime.now().strftime('%Y/%m/%d %H:%M:%S')+"\n")             # <<<<<<<<<<<<<<
- *                     ofile.write("## - User: "+getuser()+"\n")
- *                 elif ((SH3Nsection == True) or (SHELLsection == True)) and (not("#" in line or "/" in line)):
- */
-              __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_ofile, __pyx_n_s_write); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 400; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_2);
-              __pyx_t_6 = __Pyx_GetModuleGlobalName(__pyx_n_s_datetime); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 400; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_6);
-              __pyx_t_14 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_now); if (unlikely(!__pyx_t_14)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 400; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_14);
-              __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-              __pyx_t_6 = NULL;
-              if (CYTHON_COMPILING_IN_CPYTHON && unlikely(PyMethod_Check(__pyx_t_14))) {
-                __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_14);
-                if (likely(__pyx_t_6)) {
-                  PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_14);
-                  __Pyx_INCREF(__pyx_t_6);
-                  __Pyx_INCREF(function);
-                  __Pyx_DECREF_SET(__pyx_t_14, function);
-                }
-              }
-              if (__pyx_t_6) {
-                __pyx_t_4 = __Pyx_PyObject_CallOneArg(__pyx_t_14, __pyx_t_6); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 400; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-              } else {
-                __pyx_t_4 = __Pyx_PyObject_CallNoArg(__pyx_t_14); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 400; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              }
-              __Pyx_GOTREF(__pyx_t_4);
-              __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
-              __pyx_t_14 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_strftime); if (unlikely(!__pyx_t_14)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 400; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_14);
-              __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-              __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_14, __pyx_tuple__87, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 400; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_4);
-              __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
-              __pyx_t_14 = PyNumber_Add(__pyx_kp_s_Date_Time_2, __pyx_t_4); if (unlikely(!__pyx_t_14)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 400; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_14);
-              __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-              __pyx_t_4 = PyNumber_Add(__pyx_t_14, __pyx_kp_s__76); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 400; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_4);
-              __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
-              __pyx_t_14 = NULL;
-              if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_2))) {
-                __pyx_t_14 = PyMethod_GET_SELF(__pyx_t_2);
-                if (likely(__pyx_t_14)) {
-                  PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
-                  __Pyx_INCREF(__pyx_t_14);
-                  __Pyx_INCREF(function);
-                  __Pyx_DECREF_SET(__pyx_t_2, function);
-                }
-              }
-              if (!__pyx_t_14) {
-                __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_4); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 400; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-                __Pyx_GOTREF(__pyx_t_1);
-              } else {
-                __pyx_t_6 = PyTuple_New(1+1); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 400; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_6);
-                __Pyx_GIVEREF(__pyx_t_14); PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_14); __pyx_t_14 = NULL;
-                __Pyx_GIVEREF(__pyx_t_4);
-                PyTuple_SET_ITEM(__pyx_t_6, 0+1, __pyx_t_4);
-                __pyx_t_4 = 0;
-                __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_6, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 400; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_1);
-                __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-              }
-              __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-              __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":401
- *                     ofile.write("## - Mubea TRB CAE - FE_Mesh_Handlers - writeRadiossMesh\n")
- *                     ofile.write("## - Date/Time: "+datetime.now().strftime('%Y/%m/%d %H:%M:%S')+"\n")
- *                     ofile.write("## - User: "+getuser()+"\n")             # <<<<<<<<<<<<<<
- *                 elif ((SH3Nsection == True) or (SHELLsection == True)) and (not("#" in line or "/" in line)):
- *                     elemid=int(line[0:10])
- */
-              __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_ofile, __pyx_n_s_write); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 401; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_2);
-              __pyx_t_4 = __Pyx_GetModuleGlobalName(__pyx_n_s_getuser); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 401; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_4);
-              __pyx_t_14 = NULL;
-              if (CYTHON_COMPILING_IN_CPYTHON && unlikely(PyMethod_Check(__pyx_t_4))) {
-                __pyx_t_14 = PyMethod_GET_SELF(__pyx_t_4);
-                if (likely(__pyx_t_14)) {
-                  PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
-                  __Pyx_INCREF(__pyx_t_14);
-                  __Pyx_INCREF(function);
-                  __Pyx_DECREF_SET(__pyx_t_4, function);
-                }
-              }
-              if (__pyx_t_14) {
-                __pyx_t_6 = __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_14); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 401; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
-              } else {
-                __pyx_t_6 = __Pyx_PyObject_CallNoArg(__pyx_t_4); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 401; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              }
-              __Pyx_GOTREF(__pyx_t_6);
-              __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-              __pyx_t_4 = PyNumber_Add(__pyx_kp_s_User_2, __pyx_t_6); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 401; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_4);
-              __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-              __pyx_t_6 = PyNumber_Add(__pyx_t_4, __pyx_kp_s__76); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 401; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_6);
-              __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-              __pyx_t_4 = NULL;
-              if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_2))) {
-                __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_2);
-                if (likely(__pyx_t_4)) {
-                  PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
-                  __Pyx_INCREF(__pyx_t_4);
-                  __Pyx_INCREF(function);
-                  __Pyx_DECREF_SET(__pyx_t_2, function);
-                }
-              }
-              if (!__pyx_t_4) {
-                __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_6); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 401; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-                __Pyx_GOTREF(__pyx_t_1);
-              } else {
-                __pyx_t_14 = PyTuple_New(1+1); if (unlikely(!__pyx_t_14)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 401; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_14);
-                __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_14, 0, __pyx_t_4); __pyx_t_4 = NULL;
-                __Pyx_GIVEREF(__pyx_t_6);
-                PyTuple_SET_ITEM(__pyx_t_14, 0+1, __pyx_t_6);
-                __pyx_t_6 = 0;
-                __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_14, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 401; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_1);
-                __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
-              }
-              __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-              __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":397
- *             if len(_Mesh.Elementalthickness.keys())!=0: elemthick=True
- *             for line in f:
- *                 if "#RADIOSS STARTER" in line:             # <<<<<<<<<<<<<<
- *                     ofile.write(line)
- *                     ofile.write("## - Mubea TRB CAE - FE_Mesh_Handlers - writeRadiossMesh\n")
- */
-              goto __pyx_L18;
-            }
-
-            /* "cNK_FEMeshUtils\MeshReaders.py":402
- *                     ofile.write("## - Date/Time: "+datetime.now().strftime('%Y/%m/%d %H:%M:%S')+"\n")
- *                     ofile.write("## - User: "+getuser()+"\n")
- *                 elif ((SH3Nsection == True) or (SHELLsection == True)) and (not("#" in line or "/" in line)):             # <<<<<<<<<<<<<<
- *                     elemid=int(line[0:10])
- *                     if elemthick:
- */
-            __pyx_t_11 = ((__pyx_v_SH3Nsection == 1) != 0);
-            if (!__pyx_t_11) {
-            } else {
-              goto __pyx_L20_next_and;
-            }
-            __pyx_t_11 = ((__pyx_v_SHELLsection == 1) != 0);
-            if (__pyx_t_11) {
-            } else {
-              __pyx_t_13 = __pyx_t_11;
-              goto __pyx_L19_bool_binop_done;
-            }
-            __pyx_L20_next_and:;
-            __pyx_t_15 = (__Pyx_PySequence_ContainsTF(__pyx_kp_s__38, __pyx_v_line, Py_EQ)); if (unlikely(__pyx_t_15 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 402; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __pyx_t_16 = (__pyx_t_15 != 0);
-            if (!__pyx_t_16) {
-            } else {
-              __pyx_t_11 = __pyx_t_16;
-              goto __pyx_L22_bool_binop_done;
-            }
-            __pyx_t_16 = (__Pyx_PySequence_ContainsTF(__pyx_kp_s__39, __pyx_v_line, Py_EQ)); if (unlikely(__pyx_t_16 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 402; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __pyx_t_15 = (__pyx_t_16 != 0);
-            __pyx_t_11 = __pyx_t_15;
-            __pyx_L22_bool_binop_done:;
-            __pyx_t_15 = ((!__pyx_t_11) != 0);
-            __pyx_t_13 = __pyx_t_15;
-            __pyx_L19_bool_binop_done:;
-            if (__pyx_t_13) {
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":403
- *                     ofile.write("## - User: "+getuser()+"\n")
- *                 elif ((SH3Nsection == True) or (SHELLsection == True)) and (not("#" in line or "/" in line)):
- *                     elemid=int(line[0:10])             # <<<<<<<<<<<<<<
- *                     if elemthick:
- *                         if int(partid) in _Mesh.NUTProps:
- */
-              __pyx_t_1 = __Pyx_PyObject_GetSlice(__pyx_v_line, 0, 10, NULL, NULL, &__pyx_slice__88, 1, 1, 1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 403; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_1);
-              __pyx_t_2 = PyNumber_Int(__pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 403; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_2);
-              __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-              __Pyx_XDECREF_SET(__pyx_v_elemid, __pyx_t_2);
-              __pyx_t_2 = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":404
- *                 elif ((SH3Nsection == True) or (SHELLsection == True)) and (not("#" in line or "/" in line)):
- *                     elemid=int(line[0:10])
- *                     if elemthick:             # <<<<<<<<<<<<<<
- *                         if int(partid) in _Mesh.NUTProps:
- *                             thick = _Mesh.getElementalThickness(elemid)
- */
-              __pyx_t_13 = (__pyx_v_elemthick != 0);
-              if (__pyx_t_13) {
-
-                /* "cNK_FEMeshUtils\MeshReaders.py":405
- *                     elemid=int(line[0:10])
- *                     if elemthick:
- *                         if int(partid) in _Mesh.NUTProps:             # <<<<<<<<<<<<<<
- *                             thick = _Mesh.getElementalThickness(elemid)
- *                         else: thick = 0.0
- */
-                __pyx_t_2 = PyNumber_Int(__pyx_v_partid); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 405; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_2);
-                __pyx_t_13 = (__Pyx_PySequence_ContainsTF(__pyx_t_2, __pyx_v__Mesh->NUTProps, Py_EQ)); if (unlikely(__pyx_t_13 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 405; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-                __pyx_t_15 = (__pyx_t_13 != 0);
-                if (__pyx_t_15) {
-
-                  /* "cNK_FEMeshUtils\MeshReaders.py":406
- *                     if elemthick:
- *                         if int(partid) in _Mesh.NUTProps:
- *                             thick = _Mesh.getElementalThickness(elemid)             # <<<<<<<<<<<<<<
- *                         else: thick = 0.0
- *                     else:
- */
-                  __pyx_t_17 = __Pyx_PyInt_As_int(__pyx_v_elemid); if (unlikely((__pyx_t_17 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 406; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                  __pyx_v_thick = ((struct __pyx_vtabstruct_15cNK_FEMeshUtils_4Mesh_Mesh *)__pyx_v__Mesh->__pyx_vtab)->getElementalThickness(__pyx_v__Mesh, __pyx_t_17, 0);
-
-                  /* "cNK_FEMeshUtils\MeshReaders.py":405
- *                     elemid=int(line[0:10])
- *                     if elemthick:
- *                         if int(partid) in _Mesh.NUTProps:             # <<<<<<<<<<<<<<
- *                             thick = _Mesh.getElementalThickness(elemid)
- *                         else: thick = 0.0
- */
-                  goto __pyx_L25;
-                }
-
-                /* "cNK_FEMeshUtils\MeshReaders.py":407
- *                         if int(partid) in _Mesh.NUTProps:
- *                             thick = _Mesh.getElementalThickness(elemid)
- *                         else: thick = 0.0             # <<<<<<<<<<<<<<
- *                     else:
- *                         thick = 0.0
- */
-                /*else*/ {
-                  __pyx_v_thick = 0.0;
-                }
-                __pyx_L25:;
-
-                /* "cNK_FEMeshUtils\MeshReaders.py":404
- *                 elif ((SH3Nsection == True) or (SHELLsection == True)) and (not("#" in line or "/" in line)):
- *                     elemid=int(line[0:10])
- *                     if elemthick:             # <<<<<<<<<<<<<<
- *                         if int(partid) in _Mesh.NUTProps:
- *                             thick = _Mesh.getElementalThickness(elemid)
- */
-                goto __pyx_L24;
-              }
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":409
- *                         else: thick = 0.0
- *                     else:
- *                         thick = 0.0             # <<<<<<<<<<<<<<
- *                     ofile.write(line[0:90]+"%10.8f"%thick+"\n")
- *                 elif nodesection and (not("#" in line or "/" in line)):
- */
-              /*else*/ {
-                __pyx_v_thick = 0.0;
-              }
-              __pyx_L24:;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":410
- *                     else:
- *                         thick = 0.0
- *                     ofile.write(line[0:90]+"%10.8f"%thick+"\n")             # <<<<<<<<<<<<<<
- *                 elif nodesection and (not("#" in line or "/" in line)):
- *                     nid=int(line[0:10])
- */
-              __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_ofile, __pyx_n_s_write); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 410; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_1);
-              __pyx_t_14 = __Pyx_PyObject_GetSlice(__pyx_v_line, 0, 90, NULL, NULL, &__pyx_slice__89, 1, 1, 1); if (unlikely(!__pyx_t_14)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 410; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_14);
-              __pyx_t_6 = PyFloat_FromDouble(__pyx_v_thick); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 410; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_6);
-              __pyx_t_4 = __Pyx_PyString_Format(__pyx_kp_s_10_8f, __pyx_t_6); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 410; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_4);
-              __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-              __pyx_t_6 = PyNumber_Add(__pyx_t_14, __pyx_t_4); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 410; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_6);
-              __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
-              __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-              __pyx_t_4 = PyNumber_Add(__pyx_t_6, __pyx_kp_s__76); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 410; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_4);
-              __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-              __pyx_t_6 = NULL;
-              if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_1))) {
-                __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_1);
-                if (likely(__pyx_t_6)) {
-                  PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
-                  __Pyx_INCREF(__pyx_t_6);
-                  __Pyx_INCREF(function);
-                  __Pyx_DECREF_SET(__pyx_t_1, function);
-                }
-              }
-              if (!__pyx_t_6) {
-                __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_t_4); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 410; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-                __Pyx_GOTREF(__pyx_t_2);
-              } else {
-                __pyx_t_14 = PyTuple_New(1+1); if (unlikely(!__pyx_t_14)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 410; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_14);
-                __Pyx_GIVEREF(__pyx_t_6); PyTuple_SET_ITEM(__pyx_t_14, 0, __pyx_t_6); __pyx_t_6 = NULL;
-                __Pyx_GIVEREF(__pyx_t_4);
-                PyTuple_SET_ITEM(__pyx_t_14, 0+1, __pyx_t_4);
-                __pyx_t_4 = 0;
-                __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_14, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 410; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_2);
-                __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
-              }
-              __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-              __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":402
- *                     ofile.write("## - Date/Time: "+datetime.now().strftime('%Y/%m/%d %H:%M:%S')+"\n")
- *                     ofile.write("## - User: "+getuser()+"\n")
- *                 elif ((SH3Nsection == True) or (SHELLsection == True)) and (not("#" in line or "/" in line)):             # <<<<<<<<<<<<<<
- *                     elemid=int(line[0:10])
- *                     if elemthick:
- */
-              goto __pyx_L18;
-            }
-
-            /* "cNK_FEMeshUtils\MeshReaders.py":411
- *                         thick = 0.0
- *                     ofile.write(line[0:90]+"%10.8f"%thick+"\n")
- *                 elif nodesection and (not("#" in line or "/" in line)):             # <<<<<<<<<<<<<<
- *                     nid=int(line[0:10])
- *                     x=float(_Mesh.Nodelist[nid][0])
- */
-            __pyx_t_13 = (__pyx_v_nodesection != 0);
-            if (__pyx_t_13) {
-            } else {
-              __pyx_t_15 = __pyx_t_13;
-              goto __pyx_L26_bool_binop_done;
-            }
-            __pyx_t_11 = (__Pyx_PySequence_ContainsTF(__pyx_kp_s__38, __pyx_v_line, Py_EQ)); if (unlikely(__pyx_t_11 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 411; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __pyx_t_16 = (__pyx_t_11 != 0);
-            if (!__pyx_t_16) {
-            } else {
-              __pyx_t_13 = __pyx_t_16;
-              goto __pyx_L28_bool_binop_done;
-            }
-            __pyx_t_16 = (__Pyx_PySequence_ContainsTF(__pyx_kp_s__39, __pyx_v_line, Py_EQ)); if (unlikely(__pyx_t_16 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 411; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __pyx_t_11 = (__pyx_t_16 != 0);
-            __pyx_t_13 = __pyx_t_11;
-            __pyx_L28_bool_binop_done:;
-            __pyx_t_11 = ((!__pyx_t_13) != 0);
-            __pyx_t_15 = __pyx_t_11;
-            __pyx_L26_bool_binop_done:;
-            if (__pyx_t_15) {
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":412
- *                     ofile.write(line[0:90]+"%10.8f"%thick+"\n")
- *                 elif nodesection and (not("#" in line or "/" in line)):
- *                     nid=int(line[0:10])             # <<<<<<<<<<<<<<
- *                     x=float(_Mesh.Nodelist[nid][0])
- *                     y=float(_Mesh.Nodelist[nid][1])
- */
-              __pyx_t_2 = __Pyx_PyObject_GetSlice(__pyx_v_line, 0, 10, NULL, NULL, &__pyx_slice__90, 1, 1, 1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 412; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_2);
-              __pyx_t_1 = PyNumber_Int(__pyx_t_2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 412; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_1);
-              __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-              __Pyx_XDECREF_SET(__pyx_v_nid, __pyx_t_1);
-              __pyx_t_1 = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":413
- *                 elif nodesection and (not("#" in line or "/" in line)):
- *                     nid=int(line[0:10])
- *                     x=float(_Mesh.Nodelist[nid][0])             # <<<<<<<<<<<<<<
- *                     y=float(_Mesh.Nodelist[nid][1])
- *                     z=float(_Mesh.Nodelist[nid][2])
- */
-              if (unlikely(__pyx_v__Mesh->Nodelist == Py_None)) {
-                PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-                {__pyx_filename = __pyx_f[0]; __pyx_lineno = 413; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              }
-              __pyx_t_1 = __Pyx_PyDict_GetItem(__pyx_v__Mesh->Nodelist, __pyx_v_nid); if (unlikely(__pyx_t_1 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 413; __pyx_clineno = __LINE__; goto __pyx_L7_error;};
-              __Pyx_GOTREF(__pyx_t_1);
-              __pyx_t_2 = __Pyx_GetItemInt(__pyx_t_1, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(__pyx_t_2 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 413; __pyx_clineno = __LINE__; goto __pyx_L7_error;};
-              __Pyx_GOTREF(__pyx_t_2);
-              __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-              __pyx_t_18 = __Pyx_PyObject_AsDouble(__pyx_t_2); if (unlikely(__pyx_t_18 == ((double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 413; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-              __pyx_v_x = __pyx_t_18;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":414
- *                     nid=int(line[0:10])
- *                     x=float(_Mesh.Nodelist[nid][0])
- *                     y=float(_Mesh.Nodelist[nid][1])             # <<<<<<<<<<<<<<
- *                     z=float(_Mesh.Nodelist[nid][2])
- *                     s= "%10i"%nid+"%20.14f"%x+"%20.14f"%y+"%20.14f"%z+"\n"
- */
-              if (unlikely(__pyx_v__Mesh->Nodelist == Py_None)) {
-                PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-                {__pyx_filename = __pyx_f[0]; __pyx_lineno = 414; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              }
-              __pyx_t_2 = __Pyx_PyDict_GetItem(__pyx_v__Mesh->Nodelist, __pyx_v_nid); if (unlikely(__pyx_t_2 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 414; __pyx_clineno = __LINE__; goto __pyx_L7_error;};
-              __Pyx_GOTREF(__pyx_t_2);
-              __pyx_t_1 = __Pyx_GetItemInt(__pyx_t_2, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(__pyx_t_1 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 414; __pyx_clineno = __LINE__; goto __pyx_L7_error;};
-              __Pyx_GOTREF(__pyx_t_1);
-              __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-              __pyx_t_18 = __Pyx_PyObject_AsDouble(__pyx_t_1); if (unlikely(__pyx_t_18 == ((double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 414; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-              __pyx_v_y = __pyx_t_18;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":415
- *                     x=float(_Mesh.Nodelist[nid][0])
- *                     y=float(_Mesh.Nodelist[nid][1])
- *                     z=float(_Mesh.Nodelist[nid][2])             # <<<<<<<<<<<<<<
- *                     s= "%10i"%nid+"%20.14f"%x+"%20.14f"%y+"%20.14f"%z+"\n"
- *                     ofile.write(s)
- */
-              if (unlikely(__pyx_v__Mesh->Nodelist == Py_None)) {
-                PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-                {__pyx_filename = __pyx_f[0]; __pyx_lineno = 415; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              }
-              __pyx_t_1 = __Pyx_PyDict_GetItem(__pyx_v__Mesh->Nodelist, __pyx_v_nid); if (unlikely(__pyx_t_1 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 415; __pyx_clineno = __LINE__; goto __pyx_L7_error;};
-              __Pyx_GOTREF(__pyx_t_1);
-              __pyx_t_2 = __Pyx_GetItemInt(__pyx_t_1, 2, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(__pyx_t_2 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 415; __pyx_clineno = __LINE__; goto __pyx_L7_error;};
-              __Pyx_GOTREF(__pyx_t_2);
-              __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-              __pyx_t_18 = __Pyx_PyObject_AsDouble(__pyx_t_2); if (unlikely(__pyx_t_18 == ((double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 415; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-              __pyx_v_z = __pyx_t_18;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":416
- *                     y=float(_Mesh.Nodelist[nid][1])
- *                     z=float(_Mesh.Nodelist[nid][2])
- *                     s= "%10i"%nid+"%20.14f"%x+"%20.14f"%y+"%20.14f"%z+"\n"             # <<<<<<<<<<<<<<
- *                     ofile.write(s)
- *                 elif "/SH3N" in line[0:5]:
- */
-              __pyx_t_2 = __Pyx_PyString_Format(__pyx_kp_s_10i, __pyx_v_nid); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 416; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_2);
-              __pyx_t_1 = PyFloat_FromDouble(__pyx_v_x); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 416; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_1);
-              __pyx_t_14 = __Pyx_PyString_Format(__pyx_kp_s_20_14f, __pyx_t_1); if (unlikely(!__pyx_t_14)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 416; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_14);
-              __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-              __pyx_t_1 = PyNumber_Add(__pyx_t_2, __pyx_t_14); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 416; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_1);
-              __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-              __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
-              __pyx_t_14 = PyFloat_FromDouble(__pyx_v_y); if (unlikely(!__pyx_t_14)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 416; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_14);
-              __pyx_t_2 = __Pyx_PyString_Format(__pyx_kp_s_20_14f, __pyx_t_14); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 416; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_2);
-              __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
-              __pyx_t_14 = PyNumber_Add(__pyx_t_1, __pyx_t_2); if (unlikely(!__pyx_t_14)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 416; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_14);
-              __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-              __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-              __pyx_t_2 = PyFloat_FromDouble(__pyx_v_z); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 416; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_2);
-              __pyx_t_1 = __Pyx_PyString_Format(__pyx_kp_s_20_14f, __pyx_t_2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 416; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_1);
-              __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-              __pyx_t_2 = PyNumber_Add(__pyx_t_14, __pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 416; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_2);
-              __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
-              __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-              __pyx_t_1 = PyNumber_Add(__pyx_t_2, __pyx_kp_s__76); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 416; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_1);
-              __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-              __Pyx_XDECREF_SET(__pyx_v_s, ((PyObject*)__pyx_t_1));
-              __pyx_t_1 = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":417
- *                     z=float(_Mesh.Nodelist[nid][2])
- *                     s= "%10i"%nid+"%20.14f"%x+"%20.14f"%y+"%20.14f"%z+"\n"
- *                     ofile.write(s)             # <<<<<<<<<<<<<<
- *                 elif "/SH3N" in line[0:5]:
- *                     # self.logger.debug("/SH3N found")
- */
-              __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_ofile, __pyx_n_s_write); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 417; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_2);
-              __pyx_t_14 = NULL;
-              if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_2))) {
-                __pyx_t_14 = PyMethod_GET_SELF(__pyx_t_2);
-                if (likely(__pyx_t_14)) {
-                  PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
-                  __Pyx_INCREF(__pyx_t_14);
-                  __Pyx_INCREF(function);
-                  __Pyx_DECREF_SET(__pyx_t_2, function);
-                }
-              }
-              if (!__pyx_t_14) {
-                __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_v_s); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 417; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_1);
-              } else {
-                __pyx_t_4 = PyTuple_New(1+1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 417; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_4);
-                __Pyx_GIVEREF(__pyx_t_14); PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_14); __pyx_t_14 = NULL;
-                __Pyx_INCREF(__pyx_v_s);
-                __Pyx_GIVEREF(__pyx_v_s);
-                PyTuple_SET_ITEM(__pyx_t_4, 0+1, __pyx_v_s);
-                __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_4, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 417; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_1);
-                __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-              }
-              __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-              __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":411
- *                         thick = 0.0
- *                     ofile.write(line[0:90]+"%10.8f"%thick+"\n")
- *                 elif nodesection and (not("#" in line or "/" in line)):             # <<<<<<<<<<<<<<
- *                     nid=int(line[0:10])
- *                     x=float(_Mesh.Nodelist[nid][0])
- */
-              goto __pyx_L18;
-            }
-
-            /* "cNK_FEMeshUtils\MeshReaders.py":418
- *                     s= "%10i"%nid+"%20.14f"%x+"%20.14f"%y+"%20.14f"%z+"\n"
- *                     ofile.write(s)
- *                 elif "/SH3N" in line[0:5]:             # <<<<<<<<<<<<<<
- *                     # self.logger.debug("/SH3N found")
- *                     partid=line.strip().split("/")[2]
- */
-            __pyx_t_1 = __Pyx_PyObject_GetSlice(__pyx_v_line, 0, 5, NULL, NULL, &__pyx_slice__91, 1, 1, 1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 418; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __Pyx_GOTREF(__pyx_t_1);
-            __pyx_t_15 = (__Pyx_PySequence_ContainsTF(__pyx_kp_s_SH3N, __pyx_t_1, Py_EQ)); if (unlikely(__pyx_t_15 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 418; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-            __pyx_t_11 = (__pyx_t_15 != 0);
-            if (__pyx_t_11) {
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":420
- *                 elif "/SH3N" in line[0:5]:
- *                     # self.logger.debug("/SH3N found")
- *                     partid=line.strip().split("/")[2]             # <<<<<<<<<<<<<<
- *                     SH3Nsection = True
- *                     SHELLsection = False
- */
-              __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_line, __pyx_n_s_strip); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 420; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_2);
-              __pyx_t_4 = NULL;
-              if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_2))) {
-                __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_2);
-                if (likely(__pyx_t_4)) {
-                  PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
-                  __Pyx_INCREF(__pyx_t_4);
-                  __Pyx_INCREF(function);
-                  __Pyx_DECREF_SET(__pyx_t_2, function);
-                }
-              }
-              if (__pyx_t_4) {
-                __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_4); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 420; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-              } else {
-                __pyx_t_1 = __Pyx_PyObject_CallNoArg(__pyx_t_2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 420; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              }
-              __Pyx_GOTREF(__pyx_t_1);
-              __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-              __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_split); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 420; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_2);
-              __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-              __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_tuple__92, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 420; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_1);
-              __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-              __pyx_t_2 = __Pyx_GetItemInt(__pyx_t_1, 2, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(__pyx_t_2 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 420; __pyx_clineno = __LINE__; goto __pyx_L7_error;};
-              __Pyx_GOTREF(__pyx_t_2);
-              __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-              __Pyx_DECREF_SET(__pyx_v_partid, __pyx_t_2);
-              __pyx_t_2 = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":421
- *                     # self.logger.debug("/SH3N found")
- *                     partid=line.strip().split("/")[2]
- *                     SH3Nsection = True             # <<<<<<<<<<<<<<
- *                     SHELLsection = False
- *                     nodesection = False
- */
-              __pyx_v_SH3Nsection = 1;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":422
- *                     partid=line.strip().split("/")[2]
- *                     SH3Nsection = True
- *                     SHELLsection = False             # <<<<<<<<<<<<<<
- *                     nodesection = False
- *                     ofile.write(line)
- */
-              __pyx_v_SHELLsection = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":423
- *                     SH3Nsection = True
- *                     SHELLsection = False
- *                     nodesection = False             # <<<<<<<<<<<<<<
- *                     ofile.write(line)
- *                 elif "/SHELL" in line[0:6]:
- */
-              __pyx_v_nodesection = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":424
- *                     SHELLsection = False
- *                     nodesection = False
- *                     ofile.write(line)             # <<<<<<<<<<<<<<
- *                 elif "/SHELL" in line[0:6]:
- *                     i=0
- */
-              __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_ofile, __pyx_n_s_write); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 424; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_1);
-              __pyx_t_4 = NULL;
-              if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_1))) {
-                __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_1);
-                if (likely(__pyx_t_4)) {
-                  PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
-                  __Pyx_INCREF(__pyx_t_4);
-                  __Pyx_INCREF(function);
-                  __Pyx_DECREF_SET(__pyx_t_1, function);
-                }
-              }
-              if (!__pyx_t_4) {
-                __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_v_line); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 424; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_2);
-              } else {
-                __pyx_t_14 = PyTuple_New(1+1); if (unlikely(!__pyx_t_14)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 424; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_14);
-                __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_14, 0, __pyx_t_4); __pyx_t_4 = NULL;
-                __Pyx_INCREF(__pyx_v_line);
-                __Pyx_GIVEREF(__pyx_v_line);
-                PyTuple_SET_ITEM(__pyx_t_14, 0+1, __pyx_v_line);
-                __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_14, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 424; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_2);
-                __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
-              }
-              __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-              __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":418
- *                     s= "%10i"%nid+"%20.14f"%x+"%20.14f"%y+"%20.14f"%z+"\n"
- *                     ofile.write(s)
- *                 elif "/SH3N" in line[0:5]:             # <<<<<<<<<<<<<<
- *                     # self.logger.debug("/SH3N found")
- *                     partid=line.strip().split("/")[2]
- */
-              goto __pyx_L18;
-            }
-
-            /* "cNK_FEMeshUtils\MeshReaders.py":425
- *                     nodesection = False
- *                     ofile.write(line)
- *                 elif "/SHELL" in line[0:6]:             # <<<<<<<<<<<<<<
- *                     i=0
- *                     # self.logger.debug("/SHELL found")
- */
-            __pyx_t_2 = __Pyx_PyObject_GetSlice(__pyx_v_line, 0, 6, NULL, NULL, &__pyx_slice__93, 1, 1, 1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 425; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __Pyx_GOTREF(__pyx_t_2);
-            __pyx_t_11 = (__Pyx_PySequence_ContainsTF(__pyx_kp_s_SHELL, __pyx_t_2, Py_EQ)); if (unlikely(__pyx_t_11 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 425; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-            __pyx_t_15 = (__pyx_t_11 != 0);
-            if (__pyx_t_15) {
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":426
- *                     ofile.write(line)
- *                 elif "/SHELL" in line[0:6]:
- *                     i=0             # <<<<<<<<<<<<<<
- *                     # self.logger.debug("/SHELL found")
- *                     partid=line.strip().split("/")[2]
- */
-              __pyx_v_i = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":428
- *                     i=0
- *                     # self.logger.debug("/SHELL found")
- *                     partid=line.strip().split("/")[2]             # <<<<<<<<<<<<<<
- *                     SH3Nsection = False
- *                     SHELLsection = True
- */
-              __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_line, __pyx_n_s_strip); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 428; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_1);
-              __pyx_t_14 = NULL;
-              if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_1))) {
-                __pyx_t_14 = PyMethod_GET_SELF(__pyx_t_1);
-                if (likely(__pyx_t_14)) {
-                  PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
-                  __Pyx_INCREF(__pyx_t_14);
-                  __Pyx_INCREF(function);
-                  __Pyx_DECREF_SET(__pyx_t_1, function);
-                }
-              }
-              if (__pyx_t_14) {
-                __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_t_14); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 428; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
-              } else {
-                __pyx_t_2 = __Pyx_PyObject_CallNoArg(__pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 428; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              }
-              __Pyx_GOTREF(__pyx_t_2);
-              __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-              __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_split); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 428; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_1);
-              __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-              __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_tuple__94, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 428; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_2);
-              __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-              __pyx_t_1 = __Pyx_GetItemInt(__pyx_t_2, 2, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(__pyx_t_1 == NULL)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 428; __pyx_clineno = __LINE__; goto __pyx_L7_error;};
-              __Pyx_GOTREF(__pyx_t_1);
-              __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-              __Pyx_DECREF_SET(__pyx_v_partid, __pyx_t_1);
-              __pyx_t_1 = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":429
- *                     # self.logger.debug("/SHELL found")
- *                     partid=line.strip().split("/")[2]
- *                     SH3Nsection = False             # <<<<<<<<<<<<<<
- *                     SHELLsection = True
- *                     nodesection = False
- */
-              __pyx_v_SH3Nsection = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":430
- *                     partid=line.strip().split("/")[2]
- *                     SH3Nsection = False
- *                     SHELLsection = True             # <<<<<<<<<<<<<<
- *                     nodesection = False
- *                     ofile.write(line)
- */
-              __pyx_v_SHELLsection = 1;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":431
- *                     SH3Nsection = False
- *                     SHELLsection = True
- *                     nodesection = False             # <<<<<<<<<<<<<<
- *                     ofile.write(line)
- *                 elif "/NODE" in line[0:5]:
- */
-              __pyx_v_nodesection = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":432
- *                     SHELLsection = True
- *                     nodesection = False
- *                     ofile.write(line)             # <<<<<<<<<<<<<<
- *                 elif "/NODE" in line[0:5]:
- *                     # self.logger.debug("/NODE found")
- */
-              __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_ofile, __pyx_n_s_write); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 432; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_2);
-              __pyx_t_14 = NULL;
-              if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_2))) {
-                __pyx_t_14 = PyMethod_GET_SELF(__pyx_t_2);
-                if (likely(__pyx_t_14)) {
-                  PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
-                  __Pyx_INCREF(__pyx_t_14);
-                  __Pyx_INCREF(function);
-                  __Pyx_DECREF_SET(__pyx_t_2, function);
-                }
-              }
-              if (!__pyx_t_14) {
-                __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_v_line); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 432; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_1);
-              } else {
-                __pyx_t_4 = PyTuple_New(1+1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 432; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_4);
-                __Pyx_GIVEREF(__pyx_t_14); PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_14); __pyx_t_14 = NULL;
-                __Pyx_INCREF(__pyx_v_line);
-                __Pyx_GIVEREF(__pyx_v_line);
-                PyTuple_SET_ITEM(__pyx_t_4, 0+1, __pyx_v_line);
-                __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_4, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 432; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_1);
-                __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-              }
-              __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-              __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":425
- *                     nodesection = False
- *                     ofile.write(line)
- *                 elif "/SHELL" in line[0:6]:             # <<<<<<<<<<<<<<
- *                     i=0
- *                     # self.logger.debug("/SHELL found")
- */
-              goto __pyx_L18;
-            }
-
-            /* "cNK_FEMeshUtils\MeshReaders.py":433
- *                     nodesection = False
- *                     ofile.write(line)
- *                 elif "/NODE" in line[0:5]:             # <<<<<<<<<<<<<<
- *                     # self.logger.debug("/NODE found")
- *                     SH3Nsection = False
- */
-            __pyx_t_1 = __Pyx_PyObject_GetSlice(__pyx_v_line, 0, 5, NULL, NULL, &__pyx_slice__95, 1, 1, 1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 433; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __Pyx_GOTREF(__pyx_t_1);
-            __pyx_t_15 = (__Pyx_PySequence_ContainsTF(__pyx_kp_s_NODE_2, __pyx_t_1, Py_EQ)); if (unlikely(__pyx_t_15 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 433; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-            __pyx_t_11 = (__pyx_t_15 != 0);
-            if (__pyx_t_11) {
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":435
- *                 elif "/NODE" in line[0:5]:
- *                     # self.logger.debug("/NODE found")
- *                     SH3Nsection = False             # <<<<<<<<<<<<<<
- *                     SHELLsection = False
- *                     nodesection = True
- */
-              __pyx_v_SH3Nsection = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":436
- *                     # self.logger.debug("/NODE found")
- *                     SH3Nsection = False
- *                     SHELLsection = False             # <<<<<<<<<<<<<<
- *                     nodesection = True
- *                     ofile.write(line)
- */
-              __pyx_v_SHELLsection = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":437
- *                     SH3Nsection = False
- *                     SHELLsection = False
- *                     nodesection = True             # <<<<<<<<<<<<<<
- *                     ofile.write(line)
- *                 elif "/" in line:
- */
-              __pyx_v_nodesection = 1;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":438
- *                     SHELLsection = False
- *                     nodesection = True
- *                     ofile.write(line)             # <<<<<<<<<<<<<<
- *                 elif "/" in line:
- *                     SH3Nsection = False
- */
-              __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_ofile, __pyx_n_s_write); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 438; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_2);
-              __pyx_t_4 = NULL;
-              if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_2))) {
-                __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_2);
-                if (likely(__pyx_t_4)) {
-                  PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
-                  __Pyx_INCREF(__pyx_t_4);
-                  __Pyx_INCREF(function);
-                  __Pyx_DECREF_SET(__pyx_t_2, function);
-                }
-              }
-              if (!__pyx_t_4) {
-                __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_v_line); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 438; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_1);
-              } else {
-                __pyx_t_14 = PyTuple_New(1+1); if (unlikely(!__pyx_t_14)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 438; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_14);
-                __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_14, 0, __pyx_t_4); __pyx_t_4 = NULL;
-                __Pyx_INCREF(__pyx_v_line);
-                __Pyx_GIVEREF(__pyx_v_line);
-                PyTuple_SET_ITEM(__pyx_t_14, 0+1, __pyx_v_line);
-                __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_14, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 438; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_1);
-                __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
-              }
-              __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-              __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":433
- *                     nodesection = False
- *                     ofile.write(line)
- *                 elif "/NODE" in line[0:5]:             # <<<<<<<<<<<<<<
- *                     # self.logger.debug("/NODE found")
- *                     SH3Nsection = False
- */
-              goto __pyx_L18;
-            }
-
-            /* "cNK_FEMeshUtils\MeshReaders.py":439
- *                     nodesection = True
- *                     ofile.write(line)
- *                 elif "/" in line:             # <<<<<<<<<<<<<<
- *                     SH3Nsection = False
- *                     SHELLsection = False
- */
-            __pyx_t_11 = (__Pyx_PySequence_ContainsTF(__pyx_kp_s__39, __pyx_v_line, Py_EQ)); if (unlikely(__pyx_t_11 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 439; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-            __pyx_t_15 = (__pyx_t_11 != 0);
-            if (__pyx_t_15) {
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":440
- *                     ofile.write(line)
- *                 elif "/" in line:
- *                     SH3Nsection = False             # <<<<<<<<<<<<<<
- *                     SHELLsection = False
- *                     nodesection = False
- */
-              __pyx_v_SH3Nsection = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":441
- *                 elif "/" in line:
- *                     SH3Nsection = False
- *                     SHELLsection = False             # <<<<<<<<<<<<<<
- *                     nodesection = False
- *                     ofile.write(line)
- */
-              __pyx_v_SHELLsection = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":442
- *                     SH3Nsection = False
- *                     SHELLsection = False
- *                     nodesection = False             # <<<<<<<<<<<<<<
- *                     ofile.write(line)
- *                 else:
- */
-              __pyx_v_nodesection = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":443
- *                     SHELLsection = False
- *                     nodesection = False
- *                     ofile.write(line)             # <<<<<<<<<<<<<<
- *                 else:
- *                     ofile.write(line)
- */
-              __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_ofile, __pyx_n_s_write); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 443; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_2);
-              __pyx_t_14 = NULL;
-              if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_2))) {
-                __pyx_t_14 = PyMethod_GET_SELF(__pyx_t_2);
-                if (likely(__pyx_t_14)) {
-                  PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
-                  __Pyx_INCREF(__pyx_t_14);
-                  __Pyx_INCREF(function);
-                  __Pyx_DECREF_SET(__pyx_t_2, function);
-                }
-              }
-              if (!__pyx_t_14) {
-                __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_v_line); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 443; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_1);
-              } else {
-                __pyx_t_4 = PyTuple_New(1+1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 443; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_4);
-                __Pyx_GIVEREF(__pyx_t_14); PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_14); __pyx_t_14 = NULL;
-                __Pyx_INCREF(__pyx_v_line);
-                __Pyx_GIVEREF(__pyx_v_line);
-                PyTuple_SET_ITEM(__pyx_t_4, 0+1, __pyx_v_line);
-                __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_4, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 443; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_1);
-                __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-              }
-              __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-              __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-              /* "cNK_FEMeshUtils\MeshReaders.py":439
- *                     nodesection = True
- *                     ofile.write(line)
- *                 elif "/" in line:             # <<<<<<<<<<<<<<
- *                     SH3Nsection = False
- *                     SHELLsection = False
- */
-              goto __pyx_L18;
-            }
-
-            /* "cNK_FEMeshUtils\MeshReaders.py":445
- *                     ofile.write(line)
- *                 else:
- *                     ofile.write(line)             # <<<<<<<<<<<<<<
- *         ofile.close
- *         # self.logger.info('Writing Radioss Mesh file completed')
- */
-            /*else*/ {
-              __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_ofile, __pyx_n_s_write); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 445; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              __Pyx_GOTREF(__pyx_t_2);
-              __pyx_t_4 = NULL;
-              if (CYTHON_COMPILING_IN_CPYTHON && likely(PyMethod_Check(__pyx_t_2))) {
-                __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_2);
-                if (likely(__pyx_t_4)) {
-                  PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
-                  __Pyx_INCREF(__pyx_t_4);
-                  __Pyx_INCREF(function);
-                  __Pyx_DECREF_SET(__pyx_t_2, function);
-                }
-              }
-              if (!__pyx_t_4) {
-                __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_v_line); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 445; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_1);
-              } else {
-                __pyx_t_14 = PyTuple_New(1+1); if (unlikely(!__pyx_t_14)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 445; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_14);
-                __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_14, 0, __pyx_t_4); __pyx_t_4 = NULL;
-                __Pyx_INCREF(__pyx_v_line);
-                __Pyx_GIVEREF(__pyx_v_line);
-                PyTuple_SET_ITEM(__pyx_t_14, 0+1, __pyx_v_line);
-                __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_14, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 445; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-                __Pyx_GOTREF(__pyx_t_1);
-                __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
-              }
-              __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-              __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-            }
-            __pyx_L18:;
-
-            /* "cNK_FEMeshUtils\MeshReaders.py":396
- *         with open(_Mesh.getMeshFile(), "r") as f:
- *             if len(_Mesh.Elementalthickness.keys())!=0: elemthick=True
- *             for line in f:             # <<<<<<<<<<<<<<
- *                 if "#RADIOSS STARTER" in line:
- *                     ofile.write(line)
- */
-          }
-          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-
-          /* "cNK_FEMeshUtils\MeshReaders.py":394
- *         # self.logger.info("Radioss Mesh will be written to: "+ file)
- *         # self.logger.info("Baseline Input is taken from: "+ _Mesh.getMeshFile())
- *         with open(_Mesh.getMeshFile(), "r") as f:             # <<<<<<<<<<<<<<
- *             if len(_Mesh.Elementalthickness.keys())!=0: elemthick=True
- *             for line in f:
- */
-        }
-        __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
-        __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
-        __Pyx_XDECREF(__pyx_t_10); __pyx_t_10 = 0;
-        goto __pyx_L14_try_end;
-        __pyx_L7_error:;
-        __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
-        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-        __Pyx_XDECREF(__pyx_t_14); __pyx_t_14 = 0;
-        __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-        __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
-        __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-        /*except:*/ {
-          __Pyx_AddTraceback("cNK_FEMeshUtils.MeshReaders.MeshReaders.writeRadiossMesh", __pyx_clineno, __pyx_lineno, __pyx_filename);
-          if (__Pyx_GetException(&__pyx_t_3, &__pyx_t_1, &__pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 394; __pyx_clineno = __LINE__; goto __pyx_L9_except_error;}
-          __Pyx_GOTREF(__pyx_t_3);
-          __Pyx_GOTREF(__pyx_t_1);
-          __Pyx_GOTREF(__pyx_t_2);
-          __pyx_t_14 = PyTuple_Pack(3, __pyx_t_3, __pyx_t_1, __pyx_t_2); if (unlikely(!__pyx_t_14)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 394; __pyx_clineno = __LINE__; goto __pyx_L9_except_error;}
-          __Pyx_GOTREF(__pyx_t_14);
-          __pyx_t_19 = __Pyx_PyObject_Call(__pyx_t_7, __pyx_t_14, NULL);
-          __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-          __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
-          if (unlikely(!__pyx_t_19)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 394; __pyx_clineno = __LINE__; goto __pyx_L9_except_error;}
-          __Pyx_GOTREF(__pyx_t_19);
-          __pyx_t_15 = __Pyx_PyObject_IsTrue(__pyx_t_19);
-          __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
-          if (__pyx_t_15 < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 394; __pyx_clineno = __LINE__; goto __pyx_L9_except_error;}
-          __pyx_t_11 = ((!(__pyx_t_15 != 0)) != 0);
-          if (__pyx_t_11) {
-            __Pyx_GIVEREF(__pyx_t_3);
-            __Pyx_GIVEREF(__pyx_t_1);
-            __Pyx_XGIVEREF(__pyx_t_2);
-            __Pyx_ErrRestore(__pyx_t_3, __pyx_t_1, __pyx_t_2);
-            __pyx_t_3 = 0; __pyx_t_1 = 0; __pyx_t_2 = 0; 
-            {__pyx_filename = __pyx_f[0]; __pyx_lineno = 394; __pyx_clineno = __LINE__; goto __pyx_L9_except_error;}
-          }
-          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-          __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-          __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-          goto __pyx_L8_exception_handled;
-        }
-        __pyx_L9_except_error:;
-        __Pyx_XGIVEREF(__pyx_t_8);
-        __Pyx_XGIVEREF(__pyx_t_9);
-        __Pyx_XGIVEREF(__pyx_t_10);
-        __Pyx_ExceptionReset(__pyx_t_8, __pyx_t_9, __pyx_t_10);
-        goto __pyx_L1_error;
-        __pyx_L8_exception_handled:;
-        __Pyx_XGIVEREF(__pyx_t_8);
-        __Pyx_XGIVEREF(__pyx_t_9);
-        __Pyx_XGIVEREF(__pyx_t_10);
-        __Pyx_ExceptionReset(__pyx_t_8, __pyx_t_9, __pyx_t_10);
-        __pyx_L14_try_end:;
-      }
-    }
-    /*finally:*/ {
-      /*normal exit:*/{
-        if (__pyx_t_7) {
-          __pyx_t_10 = __Pyx_PyObject_Call(__pyx_t_7, __pyx_tuple__96, NULL);
-          __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-          if (unlikely(!__pyx_t_10)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 394; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-          __Pyx_GOTREF(__pyx_t_10);
-          __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
-        }
-        goto __pyx_L6;
-      }
-      __pyx_L6:;
-    }
-    goto __pyx_L33;
-    __pyx_L3_error:;
-    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-    goto __pyx_L1_error;
-    __pyx_L33:;
-  }
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":446
- *                 else:
- *                     ofile.write(line)
- *         ofile.close             # <<<<<<<<<<<<<<
- *         # self.logger.info('Writing Radioss Mesh file completed')
- */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_ofile, __pyx_n_s_close); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 446; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":379
- *         # self.logger.info('Writing to LS-Dyna Mesh file completed')
- * 
- *     def writeRadiossMesh(self, _Mesh, file):             # <<<<<<<<<<<<<<
- *         nodesection = False
- *         SH3Nsection = False
- */
-
-  /* function exit code */
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_6);
-  __Pyx_XDECREF(__pyx_t_14);
-  __Pyx_AddTraceback("cNK_FEMeshUtils.MeshReaders.MeshReaders.writeRadiossMesh", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_partid);
-  __Pyx_XDECREF(__pyx_v_ofile);
-  __Pyx_XDECREF(__pyx_v_f);
-  __Pyx_XDECREF(__pyx_v_line);
-  __Pyx_XDECREF(__pyx_v_elemid);
-  __Pyx_XDECREF(__pyx_v_nid);
-  __Pyx_XDECREF(__pyx_v_s);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* Python wrapper */
-static PyObject *__pyx_pw_15cNK_FEMeshUtils_11MeshReaders_11MeshReaders_7writeRadiossMesh(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_pw_15cNK_FEMeshUtils_11MeshReaders_11MeshReaders_7writeRadiossMesh(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  struct __pyx_obj_15cNK_FEMeshUtils_4Mesh_Mesh *__pyx_v__Mesh = 0;
-  PyObject *__pyx_v_file = 0;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  PyObject *__pyx_r = 0;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("writeRadiossMesh (wrapper)", 0);
-  {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_Mesh,&__pyx_n_s_file,0};
-    PyObject* values[2] = {0,0};
-    if (unlikely(__pyx_kwds)) {
-      Py_ssize_t kw_args;
-      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
-      switch (pos_args) {
-        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = PyDict_Size(__pyx_kwds);
-      switch (pos_args) {
-        case  0:
-        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_Mesh)) != 0)) kw_args--;
-        else goto __pyx_L5_argtuple_error;
-        case  1:
-        if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_file)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("writeRadiossMesh", 1, 2, 2, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 379; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-        }
-      }
-      if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "writeRadiossMesh") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 379; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      }
-    } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
-      goto __pyx_L5_argtuple_error;
-    } else {
-      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-    }
-    __pyx_v__Mesh = ((struct __pyx_obj_15cNK_FEMeshUtils_4Mesh_Mesh *)values[0]);
-    __pyx_v_file = ((PyObject*)values[1]);
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("writeRadiossMesh", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 379; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("cNK_FEMeshUtils.MeshReaders.MeshReaders.writeRadiossMesh", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v__Mesh), __pyx_ptype_15cNK_FEMeshUtils_4Mesh_Mesh, 1, "_Mesh", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 379; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_file), (&PyString_Type), 1, "file", 1))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 379; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_r = __pyx_pf_15cNK_FEMeshUtils_11MeshReaders_11MeshReaders_6writeRadiossMesh(((struct __pyx_obj_15cNK_FEMeshUtils_11MeshReaders_MeshReaders *)__pyx_v_self), __pyx_v__Mesh, __pyx_v_file);
-
-  /* function exit code */
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-static PyObject *__pyx_pf_15cNK_FEMeshUtils_11MeshReaders_11MeshReaders_6writeRadiossMesh(struct __pyx_obj_15cNK_FEMeshUtils_11MeshReaders_MeshReaders *__pyx_v_self, struct __pyx_obj_15cNK_FEMeshUtils_4Mesh_Mesh *__pyx_v__Mesh, PyObject *__pyx_v_file) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("writeRadiossMesh", 0);
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_f_15cNK_FEMeshUtils_11MeshReaders_11MeshReaders_writeRadiossMesh(__pyx_v_self, __pyx_v__Mesh, __pyx_v_file, 1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 379; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("cNK_FEMeshUtils.MeshReaders.MeshReaders.writeRadiossMesh", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-static struct __pyx_vtabstruct_15cNK_FEMeshUtils_11MeshReaders_MeshReaders __pyx_vtable_15cNK_FEMeshUtils_11MeshReaders_MeshReaders;
-
-static PyObject *__pyx_tp_new_15cNK_FEMeshUtils_11MeshReaders_MeshReaders(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
-  struct __pyx_obj_15cNK_FEMeshUtils_11MeshReaders_MeshReaders *p;
-  PyObject *o;
-  if (likely((t->tp_flags & Py_TPFLAGS_IS_ABSTRACT) == 0)) {
-    o = (*t->tp_alloc)(t, 0);
-  } else {
-    o = (PyObject *) PyBaseObject_Type.tp_new(t, __pyx_empty_tuple, 0);
-  }
-  if (unlikely(!o)) return 0;
-  p = ((struct __pyx_obj_15cNK_FEMeshUtils_11MeshReaders_MeshReaders *)o);
-  p->__pyx_vtab = __pyx_vtabptr_15cNK_FEMeshUtils_11MeshReaders_MeshReaders;
-  return o;
-}
-
-static void __pyx_tp_dealloc_15cNK_FEMeshUtils_11MeshReaders_MeshReaders(PyObject *o) {
-  #if PY_VERSION_HEX >= 0x030400a1
-  if (unlikely(Py_TYPE(o)->tp_finalize) && (!PyType_IS_GC(Py_TYPE(o)) || !_PyGC_FINALIZED(o))) {
-    if (PyObject_CallFinalizerFromDealloc(o)) return;
-  }
-  #endif
-  (*Py_TYPE(o)->tp_free)(o);
-}
-
-static PyMethodDef __pyx_methods_15cNK_FEMeshUtils_11MeshReaders_MeshReaders[] = {
-  {"readDynaMesh", (PyCFunction)__pyx_pw_15cNK_FEMeshUtils_11MeshReaders_11MeshReaders_1readDynaMesh, METH_O, 0},
-  {"readRadiossMesh", (PyCFunction)__pyx_pw_15cNK_FEMeshUtils_11MeshReaders_11MeshReaders_3readRadiossMesh, METH_O, 0},
-  {"writeDynaMesh", (PyCFunction)__pyx_pw_15cNK_FEMeshUtils_11MeshReaders_11MeshReaders_5writeDynaMesh, METH_VARARGS|METH_KEYWORDS, 0},
-  {"writeRadiossMesh", (PyCFunction)__pyx_pw_15cNK_FEMeshUtils_11MeshReaders_11MeshReaders_7writeRadiossMesh, METH_VARARGS|METH_KEYWORDS, 0},
-  {0, 0, 0, 0}
-};
-
-static PyTypeObject __pyx_type_15cNK_FEMeshUtils_11MeshReaders_MeshReaders = {
-  PyVarObject_HEAD_INIT(0, 0)
-  "cNK_FEMeshUtils.MeshReaders.MeshReaders", /*tp_name*/
-  sizeof(struct __pyx_obj_15cNK_FEMeshUtils_11MeshReaders_MeshReaders), /*tp_basicsize*/
-  0, /*tp_itemsize*/
-  __pyx_tp_dealloc_15cNK_FEMeshUtils_11MeshReaders_MeshReaders, /*tp_dealloc*/
-  0, /*tp_print*/
-  0, /*tp_getattr*/
-  0, /*tp_setattr*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*tp_compare*/
-  #endif
-  #if PY_MAJOR_VERSION >= 3
-  0, /*tp_as_async*/
-  #endif
-  0, /*tp_repr*/
-  0, /*tp_as_number*/
-  0, /*tp_as_sequence*/
-  0, /*tp_as_mapping*/
-  0, /*tp_hash*/
-  0, /*tp_call*/
-  0, /*tp_str*/
-  0, /*tp_getattro*/
-  0, /*tp_setattro*/
-  0, /*tp_as_buffer*/
-  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE, /*tp_flags*/
-  0, /*tp_doc*/
-  0, /*tp_traverse*/
-  0, /*tp_clear*/
-  0, /*tp_richcompare*/
-  0, /*tp_weaklistoffset*/
-  0, /*tp_iter*/
-  0, /*tp_iternext*/
-  __pyx_methods_15cNK_FEMeshUtils_11MeshReaders_MeshReaders, /*tp_methods*/
-  0, /*tp_members*/
-  0, /*tp_getset*/
-  0, /*tp_base*/
-  0, /*tp_dict*/
-  0, /*tp_descr_get*/
-  0, /*tp_descr_set*/
-  0, /*tp_dictoffset*/
-  0, /*tp_init*/
-  0, /*tp_alloc*/
-  __pyx_tp_new_15cNK_FEMeshUtils_11MeshReaders_MeshReaders, /*tp_new*/
-  0, /*tp_free*/
-  0, /*tp_is_gc*/
-  0, /*tp_bases*/
-  0, /*tp_mro*/
-  0, /*tp_cache*/
-  0, /*tp_subclasses*/
-  0, /*tp_weaklist*/
-  0, /*tp_del*/
-  0, /*tp_version_tag*/
-  #if PY_VERSION_HEX >= 0x030400a1
-  0, /*tp_finalize*/
-  #endif
-};
-
-static PyMethodDef __pyx_methods[] = {
-  {0, 0, 0, 0}
-};
-
-#if PY_MAJOR_VERSION >= 3
-static struct PyModuleDef __pyx_moduledef = {
-  #if PY_VERSION_HEX < 0x03020000
-    { PyObject_HEAD_INIT(NULL) NULL, 0, NULL },
-  #else
-    PyModuleDef_HEAD_INIT,
-  #endif
-    "MeshReaders",
-    0, /* m_doc */
-    -1, /* m_size */
-    __pyx_methods /* m_methods */,
-    NULL, /* m_reload */
-    NULL, /* m_traverse */
-    NULL, /* m_clear */
-    NULL /* m_free */
-};
-#endif
-
-static __Pyx_StringTabEntry __pyx_string_tab[] = {
-  {&__pyx_kp_s_, __pyx_k_, sizeof(__pyx_k_), 0, 0, 1, 0},
-  {&__pyx_kp_s_10_8f, __pyx_k_10_8f, sizeof(__pyx_k_10_8f), 0, 0, 1, 0},
-  {&__pyx_kp_s_10i, __pyx_k_10i, sizeof(__pyx_k_10i), 0, 0, 1, 0},
-  {&__pyx_kp_s_16_10f, __pyx_k_16_10f, sizeof(__pyx_k_16_10f), 0, 0, 1, 0},
-  {&__pyx_kp_s_16_8f, __pyx_k_16_8f, sizeof(__pyx_k_16_8f), 0, 0, 1, 0},
-  {&__pyx_kp_s_20_14f, __pyx_k_20_14f, sizeof(__pyx_k_20_14f), 0, 0, 1, 0},
-  {&__pyx_kp_s_8i, __pyx_k_8i, sizeof(__pyx_k_8i), 0, 0, 1, 0},
-  {&__pyx_kp_s_Date_Time, __pyx_k_Date_Time, sizeof(__pyx_k_Date_Time), 0, 0, 1, 0},
-  {&__pyx_kp_s_Date_Time_2, __pyx_k_Date_Time_2, sizeof(__pyx_k_Date_Time_2), 0, 0, 1, 0},
-  {&__pyx_kp_s_ELEMENT_SHELL, __pyx_k_ELEMENT_SHELL, sizeof(__pyx_k_ELEMENT_SHELL), 0, 0, 1, 0},
-  {&__pyx_kp_s_ELEMENT_SHELL_2, __pyx_k_ELEMENT_SHELL_2, sizeof(__pyx_k_ELEMENT_SHELL_2), 0, 0, 1, 0},
-  {&__pyx_kp_s_ELEMENT_SHELL_THICKNESS, __pyx_k_ELEMENT_SHELL_THICKNESS, sizeof(__pyx_k_ELEMENT_SHELL_THICKNESS), 0, 0, 1, 0},
-  {&__pyx_kp_s_ELEMENT_SHELL_THICKNESS_2, __pyx_k_ELEMENT_SHELL_THICKNESS_2, sizeof(__pyx_k_ELEMENT_SHELL_THICKNESS_2), 0, 0, 1, 0},
-  {&__pyx_kp_s_LS_Dyna, __pyx_k_LS_Dyna, sizeof(__pyx_k_LS_Dyna), 0, 0, 1, 0},
-  {&__pyx_kp_s_MAT_PIECEWISE_LINEAR_PLASTICITY, __pyx_k_MAT_PIECEWISE_LINEAR_PLASTICITY, sizeof(__pyx_k_MAT_PIECEWISE_LINEAR_PLASTICITY), 0, 0, 1, 0},
-  {&__pyx_kp_s_MAT_PIECEWISE_LINEAR_PLASTICITY_2, __pyx_k_MAT_PIECEWISE_LINEAR_PLASTICITY_2, sizeof(__pyx_k_MAT_PIECEWISE_LINEAR_PLASTICITY_2), 0, 0, 1, 0},
-  {&__pyx_kp_s_MAT_PLAS_TAB, __pyx_k_MAT_PLAS_TAB, sizeof(__pyx_k_MAT_PLAS_TAB), 0, 0, 1, 0},
-  {&__pyx_n_s_Mesh, __pyx_k_Mesh, sizeof(__pyx_k_Mesh), 0, 0, 1, 1},
-  {&__pyx_n_s_Mesh_2, __pyx_k_Mesh_2, sizeof(__pyx_k_Mesh_2), 0, 0, 1, 1},
-  {&__pyx_kp_s_Mubea_TRB_CAE_FE_Mesh_Handlers, __pyx_k_Mubea_TRB_CAE_FE_Mesh_Handlers, sizeof(__pyx_k_Mubea_TRB_CAE_FE_Mesh_Handlers), 0, 0, 1, 0},
-  {&__pyx_kp_s_Mubea_TRB_CAE_FE_Mesh_Handlers_2, __pyx_k_Mubea_TRB_CAE_FE_Mesh_Handlers_2, sizeof(__pyx_k_Mubea_TRB_CAE_FE_Mesh_Handlers_2), 0, 0, 1, 0},
-  {&__pyx_kp_s_NODE, __pyx_k_NODE, sizeof(__pyx_k_NODE), 0, 0, 1, 0},
-  {&__pyx_kp_s_NODE_2, __pyx_k_NODE_2, sizeof(__pyx_k_NODE_2), 0, 0, 1, 0},
-  {&__pyx_kp_s_PART, __pyx_k_PART, sizeof(__pyx_k_PART), 0, 0, 1, 0},
-  {&__pyx_kp_s_PART_2, __pyx_k_PART_2, sizeof(__pyx_k_PART_2), 0, 0, 1, 0},
-  {&__pyx_kp_s_PROP_SHELL, __pyx_k_PROP_SHELL, sizeof(__pyx_k_PROP_SHELL), 0, 0, 1, 0},
-  {&__pyx_kp_s_RADIOSS_STARTER, __pyx_k_RADIOSS_STARTER, sizeof(__pyx_k_RADIOSS_STARTER), 0, 0, 1, 0},
-  {&__pyx_n_s_Radioss, __pyx_k_Radioss, sizeof(__pyx_k_Radioss), 0, 0, 1, 1},
-  {&__pyx_kp_s_SECTION_SHELL, __pyx_k_SECTION_SHELL, sizeof(__pyx_k_SECTION_SHELL), 0, 0, 1, 0},
-  {&__pyx_kp_s_SECTION_SHELL_TITLE, __pyx_k_SECTION_SHELL_TITLE, sizeof(__pyx_k_SECTION_SHELL_TITLE), 0, 0, 1, 0},
-  {&__pyx_kp_s_SH3N, __pyx_k_SH3N, sizeof(__pyx_k_SH3N), 0, 0, 1, 0},
-  {&__pyx_kp_s_SHELL, __pyx_k_SHELL, sizeof(__pyx_k_SHELL), 0, 0, 1, 0},
-  {&__pyx_kp_s_User, __pyx_k_User, sizeof(__pyx_k_User), 0, 0, 1, 0},
-  {&__pyx_kp_s_User_2, __pyx_k_User_2, sizeof(__pyx_k_User_2), 0, 0, 1, 0},
-  {&__pyx_kp_s_Y_m_d_H_M_S, __pyx_k_Y_m_d_H_M_S, sizeof(__pyx_k_Y_m_d_H_M_S), 0, 0, 1, 0},
-  {&__pyx_kp_s__2, __pyx_k__2, sizeof(__pyx_k__2), 0, 0, 1, 0},
-  {&__pyx_kp_s__38, __pyx_k__38, sizeof(__pyx_k__38), 0, 0, 1, 0},
-  {&__pyx_kp_s__39, __pyx_k__39, sizeof(__pyx_k__39), 0, 0, 1, 0},
-  {&__pyx_kp_s__51, __pyx_k__51, sizeof(__pyx_k__51), 0, 0, 1, 0},
-  {&__pyx_kp_s__76, __pyx_k__76, sizeof(__pyx_k__76), 0, 0, 1, 0},
-  {&__pyx_n_s_addElem, __pyx_k_addElem, sizeof(__pyx_k_addElem), 0, 0, 1, 1},
-  {&__pyx_n_s_close, __pyx_k_close, sizeof(__pyx_k_close), 0, 0, 1, 1},
-  {&__pyx_n_s_cross, __pyx_k_cross, sizeof(__pyx_k_cross), 0, 0, 1, 1},
-  {&__pyx_n_s_datetime, __pyx_k_datetime, sizeof(__pyx_k_datetime), 0, 0, 1, 1},
-  {&__pyx_n_s_dot, __pyx_k_dot, sizeof(__pyx_k_dot), 0, 0, 1, 1},
-  {&__pyx_n_s_enter, __pyx_k_enter, sizeof(__pyx_k_enter), 0, 0, 1, 1},
-  {&__pyx_n_s_exit, __pyx_k_exit, sizeof(__pyx_k_exit), 0, 0, 1, 1},
-  {&__pyx_n_s_expm3, __pyx_k_expm3, sizeof(__pyx_k_expm3), 0, 0, 1, 1},
-  {&__pyx_n_s_eye, __pyx_k_eye, sizeof(__pyx_k_eye), 0, 0, 1, 1},
-  {&__pyx_n_s_file, __pyx_k_file, sizeof(__pyx_k_file), 0, 0, 1, 1},
-  {&__pyx_n_s_getpass, __pyx_k_getpass, sizeof(__pyx_k_getpass), 0, 0, 1, 1},
-  {&__pyx_n_s_getuser, __pyx_k_getuser, sizeof(__pyx_k_getuser), 0, 0, 1, 1},
-  {&__pyx_n_s_import, __pyx_k_import, sizeof(__pyx_k_import), 0, 0, 1, 1},
-  {&__pyx_n_s_keys, __pyx_k_keys, sizeof(__pyx_k_keys), 0, 0, 1, 1},
-  {&__pyx_n_s_main, __pyx_k_main, sizeof(__pyx_k_main), 0, 0, 1, 1},
-  {&__pyx_n_s_norm, __pyx_k_norm, sizeof(__pyx_k_norm), 0, 0, 1, 1},
-  {&__pyx_n_s_now, __pyx_k_now, sizeof(__pyx_k_now), 0, 0, 1, 1},
-  {&__pyx_n_s_np, __pyx_k_np, sizeof(__pyx_k_np), 0, 0, 1, 1},
-  {&__pyx_n_s_numpy, __pyx_k_numpy, sizeof(__pyx_k_numpy), 0, 0, 1, 1},
-  {&__pyx_n_s_open, __pyx_k_open, sizeof(__pyx_k_open), 0, 0, 1, 1},
-  {&__pyx_n_s_os, __pyx_k_os, sizeof(__pyx_k_os), 0, 0, 1, 1},
-  {&__pyx_n_s_pyx_vtable, __pyx_k_pyx_vtable, sizeof(__pyx_k_pyx_vtable), 0, 0, 1, 1},
-  {&__pyx_n_s_r, __pyx_k_r, sizeof(__pyx_k_r), 0, 0, 1, 1},
-  {&__pyx_n_s_readDynaMesh, __pyx_k_readDynaMesh, sizeof(__pyx_k_readDynaMesh), 0, 0, 1, 1},
-  {&__pyx_n_s_readRadiossMesh, __pyx_k_readRadiossMesh, sizeof(__pyx_k_readRadiossMesh), 0, 0, 1, 1},
-  {&__pyx_n_s_scipy_linalg, __pyx_k_scipy_linalg, sizeof(__pyx_k_scipy_linalg), 0, 0, 1, 1},
-  {&__pyx_n_s_split, __pyx_k_split, sizeof(__pyx_k_split), 0, 0, 1, 1},
-  {&__pyx_n_s_strftime, __pyx_k_strftime, sizeof(__pyx_k_strftime), 0, 0, 1, 1},
-  {&__pyx_n_s_strip, __pyx_k_strip, sizeof(__pyx_k_strip), 0, 0, 1, 1},
-  {&__pyx_n_s_subprocess, __pyx_k_subprocess, sizeof(__pyx_k_subprocess), 0, 0, 1, 1},
-  {&__pyx_n_s_test, __pyx_k_test, sizeof(__pyx_k_test), 0, 0, 1, 1},
-  {&__pyx_n_s_w, __pyx_k_w, sizeof(__pyx_k_w), 0, 0, 1, 1},
-  {&__pyx_n_s_write, __pyx_k_write, sizeof(__pyx_k_write), 0, 0, 1, 1},
-  {&__pyx_n_s_writeDynaMesh, __pyx_k_writeDynaMesh, sizeof(__pyx_k_writeDynaMesh), 0, 0, 1, 1},
-  {&__pyx_n_s_writeRadiossMesh, __pyx_k_writeRadiossMesh, sizeof(__pyx_k_writeRadiossMesh), 0, 0, 1, 1},
-  {0, 0, 0, 0, 0, 0, 0}
-};
-static int __Pyx_InitCachedBuiltins(void) {
-  __pyx_builtin_open = __Pyx_GetBuiltinName(__pyx_n_s_open); if (!__pyx_builtin_open) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 27; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  return 0;
-  __pyx_L1_error:;
-  return -1;
-}
-
-static int __Pyx_InitCachedConstants(void) {
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":36
- *                     nodesection = True
- *                 elif (nodesection == True) and (not("$" in line or "*" in line)):
- *                     _nodeID = int(line[0:8])             # <<<<<<<<<<<<<<
- *                     _x = float(line[9:24])
- *                     _y = float(line[25:40])
- */
-  __pyx_slice__3 = PySlice_New(__pyx_int_0, __pyx_int_8, Py_None); if (unlikely(!__pyx_slice__3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 36; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_slice__3);
-  __Pyx_GIVEREF(__pyx_slice__3);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":37
- *                 elif (nodesection == True) and (not("$" in line or "*" in line)):
- *                     _nodeID = int(line[0:8])
- *                     _x = float(line[9:24])             # <<<<<<<<<<<<<<
- *                     _y = float(line[25:40])
- *                     _z = float(line[41:56])
- */
-  __pyx_slice__4 = PySlice_New(__pyx_int_9, __pyx_int_24, Py_None); if (unlikely(!__pyx_slice__4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 37; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_slice__4);
-  __Pyx_GIVEREF(__pyx_slice__4);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":38
- *                     _nodeID = int(line[0:8])
- *                     _x = float(line[9:24])
- *                     _y = float(line[25:40])             # <<<<<<<<<<<<<<
- *                     _z = float(line[41:56])
- *                     _Mesh.addNode(_nodeID, _x, _y, _z)
- */
-  __pyx_slice__5 = PySlice_New(__pyx_int_25, __pyx_int_40, Py_None); if (unlikely(!__pyx_slice__5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 38; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_slice__5);
-  __Pyx_GIVEREF(__pyx_slice__5);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":39
- *                     _x = float(line[9:24])
- *                     _y = float(line[25:40])
- *                     _z = float(line[41:56])             # <<<<<<<<<<<<<<
- *                     _Mesh.addNode(_nodeID, _x, _y, _z)
- *                 elif "*" in line:
- */
-  __pyx_slice__6 = PySlice_New(__pyx_int_41, __pyx_int_56, Py_None); if (unlikely(!__pyx_slice__6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 39; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_slice__6);
-  __Pyx_GIVEREF(__pyx_slice__6);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":48
- *                     elemsection = True
- *                 elif (elemsection == True) and (not("$" in line or "*" in line)):
- *                     _elID = int(line[0:8])             # <<<<<<<<<<<<<<
- *                     _partID = int(line[9:16])
- *                     _n1 = int(line[17:24])
- */
-  __pyx_slice__7 = PySlice_New(__pyx_int_0, __pyx_int_8, Py_None); if (unlikely(!__pyx_slice__7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 48; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_slice__7);
-  __Pyx_GIVEREF(__pyx_slice__7);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":49
- *                 elif (elemsection == True) and (not("$" in line or "*" in line)):
- *                     _elID = int(line[0:8])
- *                     _partID = int(line[9:16])             # <<<<<<<<<<<<<<
- *                     _n1 = int(line[17:24])
- *                     _n2 = int(line[25:32])
- */
-  __pyx_slice__8 = PySlice_New(__pyx_int_9, __pyx_int_16, Py_None); if (unlikely(!__pyx_slice__8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 49; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_slice__8);
-  __Pyx_GIVEREF(__pyx_slice__8);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":50
- *                     _elID = int(line[0:8])
- *                     _partID = int(line[9:16])
- *                     _n1 = int(line[17:24])             # <<<<<<<<<<<<<<
- *                     _n2 = int(line[25:32])
- *                     _n3 = int(line[33:40])
- */
-  __pyx_slice__9 = PySlice_New(__pyx_int_17, __pyx_int_24, Py_None); if (unlikely(!__pyx_slice__9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 50; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_slice__9);
-  __Pyx_GIVEREF(__pyx_slice__9);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":51
- *                     _partID = int(line[9:16])
- *                     _n1 = int(line[17:24])
- *                     _n2 = int(line[25:32])             # <<<<<<<<<<<<<<
- *                     _n3 = int(line[33:40])
- *                     _n4 = int(line[41:48])
- */
-  __pyx_slice__10 = PySlice_New(__pyx_int_25, __pyx_int_32, Py_None); if (unlikely(!__pyx_slice__10)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 51; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_slice__10);
-  __Pyx_GIVEREF(__pyx_slice__10);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":52
- *                     _n1 = int(line[17:24])
- *                     _n2 = int(line[25:32])
- *                     _n3 = int(line[33:40])             # <<<<<<<<<<<<<<
- *                     _n4 = int(line[41:48])
- *                     _Mesh.addElem(_elID, _partID, _n1, _n2, _n3, _n4)
- */
-  __pyx_slice__11 = PySlice_New(__pyx_int_33, __pyx_int_40, Py_None); if (unlikely(!__pyx_slice__11)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 52; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_slice__11);
-  __Pyx_GIVEREF(__pyx_slice__11);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":53
- *                     _n2 = int(line[25:32])
- *                     _n3 = int(line[33:40])
- *                     _n4 = int(line[41:48])             # <<<<<<<<<<<<<<
- *                     _Mesh.addElem(_elID, _partID, _n1, _n2, _n3, _n4)
- *                 elif "*" in line:
- */
-  __pyx_slice__12 = PySlice_New(__pyx_int_41, __pyx_int_48, Py_None); if (unlikely(!__pyx_slice__12)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 53; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_slice__12);
-  __Pyx_GIVEREF(__pyx_slice__12);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":64
- *                 elif (elemthicksection == True) and (not("$" in line or "*" in line)):
- *                     if i == 0:
- *                         _elID = int(line[0:8])             # <<<<<<<<<<<<<<
- *                         _partID = int(line[9:16])
- *                         _n1 = int(line[17:24])
- */
-  __pyx_slice__13 = PySlice_New(__pyx_int_0, __pyx_int_8, Py_None); if (unlikely(!__pyx_slice__13)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 64; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_slice__13);
-  __Pyx_GIVEREF(__pyx_slice__13);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":65
- *                     if i == 0:
- *                         _elID = int(line[0:8])
- *                         _partID = int(line[9:16])             # <<<<<<<<<<<<<<
- *                         _n1 = int(line[17:24])
- *                         _n2 = int(line[25:32])
- */
-  __pyx_slice__14 = PySlice_New(__pyx_int_9, __pyx_int_16, Py_None); if (unlikely(!__pyx_slice__14)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 65; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_slice__14);
-  __Pyx_GIVEREF(__pyx_slice__14);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":66
- *                         _elID = int(line[0:8])
- *                         _partID = int(line[9:16])
- *                         _n1 = int(line[17:24])             # <<<<<<<<<<<<<<
- *                         _n2 = int(line[25:32])
- *                         _n3 = int(line[33:40])
- */
-  __pyx_slice__15 = PySlice_New(__pyx_int_17, __pyx_int_24, Py_None); if (unlikely(!__pyx_slice__15)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 66; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_slice__15);
-  __Pyx_GIVEREF(__pyx_slice__15);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":67
- *                         _partID = int(line[9:16])
- *                         _n1 = int(line[17:24])
- *                         _n2 = int(line[25:32])             # <<<<<<<<<<<<<<
- *                         _n3 = int(line[33:40])
- *                         _n4 = int(line[41:48])
- */
-  __pyx_slice__16 = PySlice_New(__pyx_int_25, __pyx_int_32, Py_None); if (unlikely(!__pyx_slice__16)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 67; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_slice__16);
-  __Pyx_GIVEREF(__pyx_slice__16);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":68
- *                         _n1 = int(line[17:24])
- *                         _n2 = int(line[25:32])
- *                         _n3 = int(line[33:40])             # <<<<<<<<<<<<<<
- *                         _n4 = int(line[41:48])
- *                         _Mesh.addElem(_elID, _partID, _n1, _n2, _n3, _n4)
- */
-  __pyx_slice__17 = PySlice_New(__pyx_int_33, __pyx_int_40, Py_None); if (unlikely(!__pyx_slice__17)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 68; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_slice__17);
-  __Pyx_GIVEREF(__pyx_slice__17);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":69
- *                         _n2 = int(line[25:32])
- *                         _n3 = int(line[33:40])
- *                         _n4 = int(line[41:48])             # <<<<<<<<<<<<<<
- *                         _Mesh.addElem(_elID, _partID, _n1, _n2, _n3, _n4)
- *                         i = i+1
- */
-  __pyx_slice__18 = PySlice_New(__pyx_int_41, __pyx_int_48, Py_None); if (unlikely(!__pyx_slice__18)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 69; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_slice__18);
-  __Pyx_GIVEREF(__pyx_slice__18);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":73
- *                         i = i+1
- *                     elif i==1:
- *                         _Mesh.addNodalThickness(_n1,float(line[0:16]))             # <<<<<<<<<<<<<<
- *                         _Mesh.addNodalThickness(_n2,float(line[17:32]))
- *                         _Mesh.addNodalThickness(_n3,float(line[33:48]))
- */
-  __pyx_slice__19 = PySlice_New(__pyx_int_0, __pyx_int_16, Py_None); if (unlikely(!__pyx_slice__19)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 73; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_slice__19);
-  __Pyx_GIVEREF(__pyx_slice__19);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":74
- *                     elif i==1:
- *                         _Mesh.addNodalThickness(_n1,float(line[0:16]))
- *                         _Mesh.addNodalThickness(_n2,float(line[17:32]))             # <<<<<<<<<<<<<<
- *                         _Mesh.addNodalThickness(_n3,float(line[33:48]))
- *                         _Mesh.addNodalThickness(_n4,float(line[49:64]))
- */
-  __pyx_slice__20 = PySlice_New(__pyx_int_17, __pyx_int_32, Py_None); if (unlikely(!__pyx_slice__20)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 74; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_slice__20);
-  __Pyx_GIVEREF(__pyx_slice__20);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":75
- *                         _Mesh.addNodalThickness(_n1,float(line[0:16]))
- *                         _Mesh.addNodalThickness(_n2,float(line[17:32]))
- *                         _Mesh.addNodalThickness(_n3,float(line[33:48]))             # <<<<<<<<<<<<<<
- *                         _Mesh.addNodalThickness(_n4,float(line[49:64]))
- *                         i = 0
- */
-  __pyx_slice__21 = PySlice_New(__pyx_int_33, __pyx_int_48, Py_None); if (unlikely(!__pyx_slice__21)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 75; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_slice__21);
-  __Pyx_GIVEREF(__pyx_slice__21);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":76
- *                         _Mesh.addNodalThickness(_n2,float(line[17:32]))
- *                         _Mesh.addNodalThickness(_n3,float(line[33:48]))
- *                         _Mesh.addNodalThickness(_n4,float(line[49:64]))             # <<<<<<<<<<<<<<
- *                         i = 0
- *                 elif "*" in line:
- */
-  __pyx_slice__22 = PySlice_New(__pyx_int_49, __pyx_int_64, Py_None); if (unlikely(!__pyx_slice__22)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 76; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_slice__22);
-  __Pyx_GIVEREF(__pyx_slice__22);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":89
- *                     if i == 1:
- * 
- *                         _partID=int(line[0:10])             # <<<<<<<<<<<<<<
- *                         _propID=int(line[11:20])
- *                         _matID=int(line[21:30])
- */
-  __pyx_slice__23 = PySlice_New(__pyx_int_0, __pyx_int_10, Py_None); if (unlikely(!__pyx_slice__23)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 89; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_slice__23);
-  __Pyx_GIVEREF(__pyx_slice__23);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":90
- * 
- *                         _partID=int(line[0:10])
- *                         _propID=int(line[11:20])             # <<<<<<<<<<<<<<
- *                         _matID=int(line[21:30])
- *                         _Mesh.addPart(_partID, _title, _propID, _matID)
- */
-  __pyx_slice__24 = PySlice_New(__pyx_int_11, __pyx_int_20, Py_None); if (unlikely(!__pyx_slice__24)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 90; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_slice__24);
-  __Pyx_GIVEREF(__pyx_slice__24);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":91
- *                         _partID=int(line[0:10])
- *                         _propID=int(line[11:20])
- *                         _matID=int(line[21:30])             # <<<<<<<<<<<<<<
- *                         _Mesh.addPart(_partID, _title, _propID, _matID)
- *                     i=i+1
- */
-  __pyx_slice__25 = PySlice_New(__pyx_int_21, __pyx_int_30, Py_None); if (unlikely(!__pyx_slice__25)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 91; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_slice__25);
-  __Pyx_GIVEREF(__pyx_slice__25);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":104
- *                 elif (matsection1 == True) and (not("$" in line or "*" in line)):
- *                     if i == 0:
- *                         _matID=int(line[0:10])             # <<<<<<<<<<<<<<
- *                         _rho=float(line[11:20])
- *                         _E=float(line[21:30])
- */
-  __pyx_slice__26 = PySlice_New(__pyx_int_0, __pyx_int_10, Py_None); if (unlikely(!__pyx_slice__26)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 104; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_slice__26);
-  __Pyx_GIVEREF(__pyx_slice__26);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":105
- *                     if i == 0:
- *                         _matID=int(line[0:10])
- *                         _rho=float(line[11:20])             # <<<<<<<<<<<<<<
- *                         _E=float(line[21:30])
- *                         _Mesh.addMat(_matID, _rho, _E)
- */
-  __pyx_slice__27 = PySlice_New(__pyx_int_11, __pyx_int_20, Py_None); if (unlikely(!__pyx_slice__27)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 105; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_slice__27);
-  __Pyx_GIVEREF(__pyx_slice__27);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":106
- *                         _matID=int(line[0:10])
- *                         _rho=float(line[11:20])
- *                         _E=float(line[21:30])             # <<<<<<<<<<<<<<
- *                         _Mesh.addMat(_matID, _rho, _E)
- *                     i=i+1
- */
-  __pyx_slice__28 = PySlice_New(__pyx_int_21, __pyx_int_30, Py_None); if (unlikely(!__pyx_slice__28)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 106; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_slice__28);
-  __Pyx_GIVEREF(__pyx_slice__28);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":119
- *                     if i == 0: title=line.strip()
- *                     if i == 1:
- *                         _matID=int(line[0:10])             # <<<<<<<<<<<<<<
- *                         _rho=float(line[11:20])
- *                         _E=float(line[21:30])
- */
-  __pyx_slice__29 = PySlice_New(__pyx_int_0, __pyx_int_10, Py_None); if (unlikely(!__pyx_slice__29)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 119; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_slice__29);
-  __Pyx_GIVEREF(__pyx_slice__29);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":120
- *                     if i == 1:
- *                         _matID=int(line[0:10])
- *                         _rho=float(line[11:20])             # <<<<<<<<<<<<<<
- *                         _E=float(line[21:30])
- *                         _Mesh.addMat(_matID, _rho, _E)
- */
-  __pyx_slice__30 = PySlice_New(__pyx_int_11, __pyx_int_20, Py_None); if (unlikely(!__pyx_slice__30)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 120; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_slice__30);
-  __Pyx_GIVEREF(__pyx_slice__30);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":121
- *                         _matID=int(line[0:10])
- *                         _rho=float(line[11:20])
- *                         _E=float(line[21:30])             # <<<<<<<<<<<<<<
- *                         _Mesh.addMat(_matID, _rho, _E)
- *                     i=i+1
- */
-  __pyx_slice__31 = PySlice_New(__pyx_int_21, __pyx_int_30, Py_None); if (unlikely(!__pyx_slice__31)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 121; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_slice__31);
-  __Pyx_GIVEREF(__pyx_slice__31);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":133
- *                 elif (propsection1 == True) and (not("$" in line or "*" in line)):
- *                     if i == 0:
- *                         _propID=int(line[0:10])             # <<<<<<<<<<<<<<
- *                     if i == 1:
- *                         _thick=float(line[0:10])
- */
-  __pyx_slice__32 = PySlice_New(__pyx_int_0, __pyx_int_10, Py_None); if (unlikely(!__pyx_slice__32)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 133; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_slice__32);
-  __Pyx_GIVEREF(__pyx_slice__32);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":135
- *                         _propID=int(line[0:10])
- *                     if i == 1:
- *                         _thick=float(line[0:10])             # <<<<<<<<<<<<<<
- *                         _Mesh.addProp(_propID, _thick)
- *                     i=i+1
- */
-  __pyx_slice__33 = PySlice_New(__pyx_int_0, __pyx_int_10, Py_None); if (unlikely(!__pyx_slice__33)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 135; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_slice__33);
-  __Pyx_GIVEREF(__pyx_slice__33);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":147
- *                 elif (propsection2 == True) and (not("$" in line or "*" in line)):
- *                     if i == 0: _title=line.strip()
- *                     if i == 1: _propID=int(line[0:10])             # <<<<<<<<<<<<<<
- *                     if i == 2:
- *                         _thick=float(line[0:10])
- */
-  __pyx_slice__34 = PySlice_New(__pyx_int_0, __pyx_int_10, Py_None); if (unlikely(!__pyx_slice__34)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 147; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_slice__34);
-  __Pyx_GIVEREF(__pyx_slice__34);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":149
- *                     if i == 1: _propID=int(line[0:10])
- *                     if i == 2:
- *                         _thick=float(line[0:10])             # <<<<<<<<<<<<<<
- *                         _Mesh.addProp(_propID, _thick)
- *                     i=i+1
- */
-  __pyx_slice__35 = PySlice_New(__pyx_int_0, __pyx_int_10, Py_None); if (unlikely(!__pyx_slice__35)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 149; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_slice__35);
-  __Pyx_GIVEREF(__pyx_slice__35);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":27
- *         _Mesh=Mesh(file,"LS-Dyna")
- * 
- *         with open(file, "r") as f:             # <<<<<<<<<<<<<<
- *             for line in f:
- *                 # if "*KEYWORD" in line:
- */
-  __pyx_tuple__36 = PyTuple_Pack(3, Py_None, Py_None, Py_None); if (unlikely(!__pyx_tuple__36)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 27; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_tuple__36);
-  __Pyx_GIVEREF(__pyx_tuple__36);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":182
- *                     # self.logger.debug("#RADIOSS STARTER found")
- * 
- *                 if "/NODE" in line[0:5]:             # <<<<<<<<<<<<<<
- *                     # self.logger.debug("/NODE keyword found")
- *                     nodesection = True
- */
-  __pyx_slice__37 = PySlice_New(__pyx_int_0, __pyx_int_5, Py_None); if (unlikely(!__pyx_slice__37)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 182; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_slice__37);
-  __Pyx_GIVEREF(__pyx_slice__37);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":186
- *                     nodesection = True
- *                 elif (nodesection == True) and (not("#" in line or "/" in line)):
- *                     _nodeID = int(line[0:10])             # <<<<<<<<<<<<<<
- *                     _x = float(line[11:30])
- *                     _y = float(line[31:50])
- */
-  __pyx_slice__40 = PySlice_New(__pyx_int_0, __pyx_int_10, Py_None); if (unlikely(!__pyx_slice__40)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 186; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_slice__40);
-  __Pyx_GIVEREF(__pyx_slice__40);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":187
- *                 elif (nodesection == True) and (not("#" in line or "/" in line)):
- *                     _nodeID = int(line[0:10])
- *                     _x = float(line[11:30])             # <<<<<<<<<<<<<<
- *                     _y = float(line[31:50])
- *                     _z = float(line[51:70])
- */
-  __pyx_slice__41 = PySlice_New(__pyx_int_11, __pyx_int_30, Py_None); if (unlikely(!__pyx_slice__41)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 187; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_slice__41);
-  __Pyx_GIVEREF(__pyx_slice__41);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":188
- *                     _nodeID = int(line[0:10])
- *                     _x = float(line[11:30])
- *                     _y = float(line[31:50])             # <<<<<<<<<<<<<<
- *                     _z = float(line[51:70])
- *                     _Mesh.addNode(_nodeID, _x, _y, _z)
- */
-  __pyx_slice__42 = PySlice_New(__pyx_int_31, __pyx_int_50, Py_None); if (unlikely(!__pyx_slice__42)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 188; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_slice__42);
-  __Pyx_GIVEREF(__pyx_slice__42);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":189
- *                     _x = float(line[11:30])
- *                     _y = float(line[31:50])
- *                     _z = float(line[51:70])             # <<<<<<<<<<<<<<
- *                     _Mesh.addNode(_nodeID, _x, _y, _z)
- *                 elif nodesection and "/" in line:
- */
-  __pyx_slice__43 = PySlice_New(__pyx_int_51, __pyx_int_70, Py_None); if (unlikely(!__pyx_slice__43)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 189; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_slice__43);
-  __Pyx_GIVEREF(__pyx_slice__43);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":194
- *                     nodesection = False
- * 
- *                 if "/SH3N" in line[0:5]:             # <<<<<<<<<<<<<<
- *                     # self.logger.debug("/SH3N keyword found")
- *                     _partid=int(line.strip().split("/")[-1])
- */
-  __pyx_slice__44 = PySlice_New(__pyx_int_0, __pyx_int_5, Py_None); if (unlikely(!__pyx_slice__44)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 194; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_slice__44);
-  __Pyx_GIVEREF(__pyx_slice__44);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":196
- *                 if "/SH3N" in line[0:5]:
- *                     # self.logger.debug("/SH3N keyword found")
- *                     _partid=int(line.strip().split("/")[-1])             # <<<<<<<<<<<<<<
- *                     SH3Nsection = True
- *                 elif (SH3Nsection == True) and (not("#" in line or "/" in line)):
- */
-  __pyx_tuple__45 = PyTuple_Pack(1, __pyx_kp_s__39); if (unlikely(!__pyx_tuple__45)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 196; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_tuple__45);
-  __Pyx_GIVEREF(__pyx_tuple__45);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":200
- *                 elif (SH3Nsection == True) and (not("#" in line or "/" in line)):
- *                     #print [line[0:10], partid, line[11:20], line[21:30], line[31:40]]
- *                     _elID = int(line[0:10])             # <<<<<<<<<<<<<<
- *                     _n1 = int(line[11:20])
- *                     _n2 = int(line[21:30])
- */
-  __pyx_slice__46 = PySlice_New(__pyx_int_0, __pyx_int_10, Py_None); if (unlikely(!__pyx_slice__46)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 200; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_slice__46);
-  __Pyx_GIVEREF(__pyx_slice__46);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":201
- *                     #print [line[0:10], partid, line[11:20], line[21:30], line[31:40]]
- *                     _elID = int(line[0:10])
- *                     _n1 = int(line[11:20])             # <<<<<<<<<<<<<<
- *                     _n2 = int(line[21:30])
- *                     _n3 = int(line[31:40])
- */
-  __pyx_slice__47 = PySlice_New(__pyx_int_11, __pyx_int_20, Py_None); if (unlikely(!__pyx_slice__47)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 201; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_slice__47);
-  __Pyx_GIVEREF(__pyx_slice__47);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":202
- *                     _elID = int(line[0:10])
- *                     _n1 = int(line[11:20])
- *                     _n2 = int(line[21:30])             # <<<<<<<<<<<<<<
- *                     _n3 = int(line[31:40])
- *                     _Mesh.addElem(_elID, _partid, _n1, _n2, _n3)
- */
-  __pyx_slice__48 = PySlice_New(__pyx_int_21, __pyx_int_30, Py_None); if (unlikely(!__pyx_slice__48)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 202; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_slice__48);
-  __Pyx_GIVEREF(__pyx_slice__48);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":203
- *                     _n1 = int(line[11:20])
- *                     _n2 = int(line[21:30])
- *                     _n3 = int(line[31:40])             # <<<<<<<<<<<<<<
- *                     _Mesh.addElem(_elID, _partid, _n1, _n2, _n3)
- *                     if line[91:100].strip() != "": _Mesh.addElementalThickness(line[0:10],line[91:100])
- */
-  __pyx_slice__49 = PySlice_New(__pyx_int_31, __pyx_int_40, Py_None); if (unlikely(!__pyx_slice__49)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 203; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_slice__49);
-  __Pyx_GIVEREF(__pyx_slice__49);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":205
- *                     _n3 = int(line[31:40])
- *                     _Mesh.addElem(_elID, _partid, _n1, _n2, _n3)
- *                     if line[91:100].strip() != "": _Mesh.addElementalThickness(line[0:10],line[91:100])             # <<<<<<<<<<<<<<
- *                 elif SH3Nsection and "/" in line:
- *                     SH3Nsection = False
- */
-  __pyx_slice__50 = PySlice_New(__pyx_int_91, __pyx_int_100, Py_None); if (unlikely(!__pyx_slice__50)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 205; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_slice__50);
-  __Pyx_GIVEREF(__pyx_slice__50);
-  __pyx_slice__52 = PySlice_New(__pyx_int_0, __pyx_int_10, Py_None); if (unlikely(!__pyx_slice__52)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 205; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_slice__52);
-  __Pyx_GIVEREF(__pyx_slice__52);
-  __pyx_slice__53 = PySlice_New(__pyx_int_91, __pyx_int_100, Py_None); if (unlikely(!__pyx_slice__53)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 205; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_slice__53);
-  __Pyx_GIVEREF(__pyx_slice__53);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":209
- *                     SH3Nsection = False
- * 
- *                 if "/SHELL" in line[0:6]:             # <<<<<<<<<<<<<<
- *                     # self.logger.debug("/SHELL keyword found")
- *                     _partid=int(line.strip().split("/")[-1])
- */
-  __pyx_slice__54 = PySlice_New(__pyx_int_0, __pyx_int_6, Py_None); if (unlikely(!__pyx_slice__54)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 209; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_slice__54);
-  __Pyx_GIVEREF(__pyx_slice__54);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":211
- *                 if "/SHELL" in line[0:6]:
- *                     # self.logger.debug("/SHELL keyword found")
- *                     _partid=int(line.strip().split("/")[-1])             # <<<<<<<<<<<<<<
- *                     SHELLsection = True
- *                 elif (SHELLsection == True) and (not("#" in line or "/" in line)):
- */
-  __pyx_tuple__55 = PyTuple_Pack(1, __pyx_kp_s__39); if (unlikely(!__pyx_tuple__55)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 211; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_tuple__55);
-  __Pyx_GIVEREF(__pyx_tuple__55);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":216
- *                     #print [line[0:10], partid, line[11:20], line[21:30], line[31:40], line[41:50]]
- * 
- *                     _elID = int(line[0:10])             # <<<<<<<<<<<<<<
- *                     _n1 = int(line[11:20])
- *                     _n2 = int(line[21:30])
- */
-  __pyx_slice__56 = PySlice_New(__pyx_int_0, __pyx_int_10, Py_None); if (unlikely(!__pyx_slice__56)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 216; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_slice__56);
-  __Pyx_GIVEREF(__pyx_slice__56);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":217
- * 
- *                     _elID = int(line[0:10])
- *                     _n1 = int(line[11:20])             # <<<<<<<<<<<<<<
- *                     _n2 = int(line[21:30])
- *                     _n3 = int(line[31:40])
- */
-  __pyx_slice__57 = PySlice_New(__pyx_int_11, __pyx_int_20, Py_None); if (unlikely(!__pyx_slice__57)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 217; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_slice__57);
-  __Pyx_GIVEREF(__pyx_slice__57);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":218
- *                     _elID = int(line[0:10])
- *                     _n1 = int(line[11:20])
- *                     _n2 = int(line[21:30])             # <<<<<<<<<<<<<<
- *                     _n3 = int(line[31:40])
- *                     _n4 = int(line[41:50])
- */
-  __pyx_slice__58 = PySlice_New(__pyx_int_21, __pyx_int_30, Py_None); if (unlikely(!__pyx_slice__58)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 218; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_slice__58);
-  __Pyx_GIVEREF(__pyx_slice__58);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":219
- *                     _n1 = int(line[11:20])
- *                     _n2 = int(line[21:30])
- *                     _n3 = int(line[31:40])             # <<<<<<<<<<<<<<
- *                     _n4 = int(line[41:50])
- *                     _Mesh.addElem(_elID, _partid, _n1, _n2, _n3, _n4)
- */
-  __pyx_slice__59 = PySlice_New(__pyx_int_31, __pyx_int_40, Py_None); if (unlikely(!__pyx_slice__59)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 219; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_slice__59);
-  __Pyx_GIVEREF(__pyx_slice__59);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":220
- *                     _n2 = int(line[21:30])
- *                     _n3 = int(line[31:40])
- *                     _n4 = int(line[41:50])             # <<<<<<<<<<<<<<
- *                     _Mesh.addElem(_elID, _partid, _n1, _n2, _n3, _n4)
- * 
- */
-  __pyx_slice__60 = PySlice_New(__pyx_int_41, __pyx_int_50, Py_None); if (unlikely(!__pyx_slice__60)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 220; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_slice__60);
-  __Pyx_GIVEREF(__pyx_slice__60);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":224
- * 
- *                     try:
- *                         _elthick = float(line[91:100].strip())             # <<<<<<<<<<<<<<
- *                         if _elthick != 0.0 :
- *                             _Mesh.addElementalThickness(_elID,_elthick)
- */
-  __pyx_slice__61 = PySlice_New(__pyx_int_91, __pyx_int_100, Py_None); if (unlikely(!__pyx_slice__61)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 224; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_slice__61);
-  __Pyx_GIVEREF(__pyx_slice__61);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":232
- *                     SHELLsection = False
- * 
- *                 if "/PART" in line[0:5]:             # <<<<<<<<<<<<<<
- *                     # self.logger.debug("/PART Keyword Found")
- *                     _partid=int(line.strip().split("/")[-1])
- */
-  __pyx_slice__62 = PySlice_New(__pyx_int_0, __pyx_int_5, Py_None); if (unlikely(!__pyx_slice__62)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 232; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_slice__62);
-  __Pyx_GIVEREF(__pyx_slice__62);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":234
- *                 if "/PART" in line[0:5]:
- *                     # self.logger.debug("/PART Keyword Found")
- *                     _partid=int(line.strip().split("/")[-1])             # <<<<<<<<<<<<<<
- *                     partsection = True
- *                     i=0
- */
-  __pyx_tuple__63 = PyTuple_Pack(1, __pyx_kp_s__39); if (unlikely(!__pyx_tuple__63)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 234; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_tuple__63);
-  __Pyx_GIVEREF(__pyx_tuple__63);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":240
- *                     if i == 0: _title=line.strip()
- *                     elif i == 1:
- *                         _propID=int(line[0:10])             # <<<<<<<<<<<<<<
- *                         _matID=int(line[11:20])
- *                         _Mesh.addPart(_partid, _title, _propID, _matID)
- */
-  __pyx_slice__64 = PySlice_New(__pyx_int_0, __pyx_int_10, Py_None); if (unlikely(!__pyx_slice__64)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 240; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_slice__64);
-  __Pyx_GIVEREF(__pyx_slice__64);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":241
- *                     elif i == 1:
- *                         _propID=int(line[0:10])
- *                         _matID=int(line[11:20])             # <<<<<<<<<<<<<<
- *                         _Mesh.addPart(_partid, _title, _propID, _matID)
- *                     i=i+1
- */
-  __pyx_slice__65 = PySlice_New(__pyx_int_11, __pyx_int_20, Py_None); if (unlikely(!__pyx_slice__65)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 241; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_slice__65);
-  __Pyx_GIVEREF(__pyx_slice__65);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":247
- *                     partsection = False
- * 
- *                 if "/MAT/PLAS_TAB" in line[0:13]:             # <<<<<<<<<<<<<<
- *                     # self.logger.debug("/MAT/PLAS_TAB Keyword Found")
- *                     _matID=int(line.strip().split("/")[-1])
- */
-  __pyx_slice__66 = PySlice_New(__pyx_int_0, __pyx_int_13, Py_None); if (unlikely(!__pyx_slice__66)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 247; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_slice__66);
-  __Pyx_GIVEREF(__pyx_slice__66);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":249
- *                 if "/MAT/PLAS_TAB" in line[0:13]:
- *                     # self.logger.debug("/MAT/PLAS_TAB Keyword Found")
- *                     _matID=int(line.strip().split("/")[-1])             # <<<<<<<<<<<<<<
- *                     matsection = True
- *                     i=0
- */
-  __pyx_tuple__67 = PyTuple_Pack(1, __pyx_kp_s__39); if (unlikely(!__pyx_tuple__67)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 249; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_tuple__67);
-  __Pyx_GIVEREF(__pyx_tuple__67);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":256
- *                         _title=line.strip()
- *                     elif i == 1:
- *                         _rho=float(line[0:20])             # <<<<<<<<<<<<<<
- *                     elif i == 2:
- *                         _E=float(line[0:20])
- */
-  __pyx_slice__68 = PySlice_New(__pyx_int_0, __pyx_int_20, Py_None); if (unlikely(!__pyx_slice__68)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 256; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_slice__68);
-  __Pyx_GIVEREF(__pyx_slice__68);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":258
- *                         _rho=float(line[0:20])
- *                     elif i == 2:
- *                         _E=float(line[0:20])             # <<<<<<<<<<<<<<
- *                         _Mesh.addMat(_matID, _rho, _E)
- *                     i=i+1
- */
-  __pyx_slice__69 = PySlice_New(__pyx_int_0, __pyx_int_20, Py_None); if (unlikely(!__pyx_slice__69)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 258; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_slice__69);
-  __Pyx_GIVEREF(__pyx_slice__69);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":264
- *                     matsection = False
- * 
- *                 if "/PROP/SHELL" in line[0:11]:             # <<<<<<<<<<<<<<
- *                     # self.logger.debug("/PROP/SHELL Keyword Found")
- *                     _propID=float(line.strip().split("/")[-1])
- */
-  __pyx_slice__70 = PySlice_New(__pyx_int_0, __pyx_int_11, Py_None); if (unlikely(!__pyx_slice__70)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 264; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_slice__70);
-  __Pyx_GIVEREF(__pyx_slice__70);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":266
- *                 if "/PROP/SHELL" in line[0:11]:
- *                     # self.logger.debug("/PROP/SHELL Keyword Found")
- *                     _propID=float(line.strip().split("/")[-1])             # <<<<<<<<<<<<<<
- *                     propsection = True
- *                     i=0
- */
-  __pyx_tuple__71 = PyTuple_Pack(1, __pyx_kp_s__39); if (unlikely(!__pyx_tuple__71)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 266; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_tuple__71);
-  __Pyx_GIVEREF(__pyx_tuple__71);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":273
- *                         _title=line.strip()
- *                     elif i == 3:
- *                         _thick=float(line[21:40])             # <<<<<<<<<<<<<<
- *                         _Mesh.addProp(_propID, _thick)
- *                     i=i+1
- */
-  __pyx_slice__72 = PySlice_New(__pyx_int_21, __pyx_int_40, Py_None); if (unlikely(!__pyx_slice__72)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_slice__72);
-  __Pyx_GIVEREF(__pyx_slice__72);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":177
- *         _Mesh=Mesh(file,"Radioss")
- * 
- *         with open(file, "r") as f:             # <<<<<<<<<<<<<<
- *             for line in f:
- *                 # if "#RADIOSS STARTER" in line:
- */
-  __pyx_tuple__73 = PyTuple_Pack(3, Py_None, Py_None, Py_None); if (unlikely(!__pyx_tuple__73)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 177; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_tuple__73);
-  __Pyx_GIVEREF(__pyx_tuple__73);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":299
- * 
- *         ofile=open(file, "w")
- *         ofile.write("$ - Mubea TRB CAE - FE_Mesh_Handlers - writeDynaMesh\n")             # <<<<<<<<<<<<<<
- *         ofile.write("$ - Date/Time: "+datetime.now().strftime('%Y/%m/%d %H:%M:%S')+"\n")
- *         ofile.write("$ - User: "+getuser()+"\n")
- */
-  __pyx_tuple__74 = PyTuple_Pack(1, __pyx_kp_s_Mubea_TRB_CAE_FE_Mesh_Handlers); if (unlikely(!__pyx_tuple__74)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 299; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_tuple__74);
-  __Pyx_GIVEREF(__pyx_tuple__74);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":300
- *         ofile=open(file, "w")
- *         ofile.write("$ - Mubea TRB CAE - FE_Mesh_Handlers - writeDynaMesh\n")
- *         ofile.write("$ - Date/Time: "+datetime.now().strftime('%Y/%m/%d %H:%M:%S')+"\n")             # <<<<<<<<<<<<<<
- *         ofile.write("$ - User: "+getuser()+"\n")
- * 
- */
-  __pyx_tuple__75 = PyTuple_Pack(1, __pyx_kp_s_Y_m_d_H_M_S); if (unlikely(!__pyx_tuple__75)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 300; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_tuple__75);
-  __Pyx_GIVEREF(__pyx_tuple__75);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":308
- *             for line in f:
- *                 if (elemsection == True) and (not("$" in line or "*" in line)):
- *                     if (int(line[9:16]) in _Mesh.NUTProps):             # <<<<<<<<<<<<<<
- *                         if not elemshellthicknesswritten:
- *                             ofile.write("*ELEMENT_SHELL_THICKNESS\n")
- */
-  __pyx_slice__77 = PySlice_New(__pyx_int_9, __pyx_int_16, Py_None); if (unlikely(!__pyx_slice__77)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 308; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_slice__77);
-  __Pyx_GIVEREF(__pyx_slice__77);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":310
- *                     if (int(line[9:16]) in _Mesh.NUTProps):
- *                         if not elemshellthicknesswritten:
- *                             ofile.write("*ELEMENT_SHELL_THICKNESS\n")             # <<<<<<<<<<<<<<
- *                             elemshellthicknesswritten=True
- *                             elemthicksection=True
- */
-  __pyx_tuple__78 = PyTuple_Pack(1, __pyx_kp_s_ELEMENT_SHELL_THICKNESS_2); if (unlikely(!__pyx_tuple__78)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 310; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_tuple__78);
-  __Pyx_GIVEREF(__pyx_tuple__78);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":317
- *                         #elem=_Mesh.getElemObjByID(int(line[0:8]))
- *                         #numbernodes=len(set(_Mesh.getElemlist()[int(line[0:8]][1:]))
- *                         n1=_Mesh.getNodalThickness(int(line[17:24]))             # <<<<<<<<<<<<<<
- *                         n2=_Mesh.getNodalThickness(int(line[25:32]))
- *                         n3=_Mesh.getNodalThickness(int(line[33:40]))
- */
-  __pyx_slice__79 = PySlice_New(__pyx_int_17, __pyx_int_24, Py_None); if (unlikely(!__pyx_slice__79)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 317; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_slice__79);
-  __Pyx_GIVEREF(__pyx_slice__79);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":318
- *                         #numbernodes=len(set(_Mesh.getElemlist()[int(line[0:8]][1:]))
- *                         n1=_Mesh.getNodalThickness(int(line[17:24]))
- *                         n2=_Mesh.getNodalThickness(int(line[25:32]))             # <<<<<<<<<<<<<<
- *                         n3=_Mesh.getNodalThickness(int(line[33:40]))
- *                         n4=_Mesh.getNodalThickness(int(line[41:48]))
- */
-  __pyx_slice__80 = PySlice_New(__pyx_int_25, __pyx_int_32, Py_None); if (unlikely(!__pyx_slice__80)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 318; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_slice__80);
-  __Pyx_GIVEREF(__pyx_slice__80);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":319
- *                         n1=_Mesh.getNodalThickness(int(line[17:24]))
- *                         n2=_Mesh.getNodalThickness(int(line[25:32]))
- *                         n3=_Mesh.getNodalThickness(int(line[33:40]))             # <<<<<<<<<<<<<<
- *                         n4=_Mesh.getNodalThickness(int(line[41:48]))
- *                         s= "%16.8f"%n1+"%16.8f"%n2+"%16.8f"%n3+"%16.8f"%n4+"\n"
- */
-  __pyx_slice__81 = PySlice_New(__pyx_int_33, __pyx_int_40, Py_None); if (unlikely(!__pyx_slice__81)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 319; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_slice__81);
-  __Pyx_GIVEREF(__pyx_slice__81);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":320
- *                         n2=_Mesh.getNodalThickness(int(line[25:32]))
- *                         n3=_Mesh.getNodalThickness(int(line[33:40]))
- *                         n4=_Mesh.getNodalThickness(int(line[41:48]))             # <<<<<<<<<<<<<<
- *                         s= "%16.8f"%n1+"%16.8f"%n2+"%16.8f"%n3+"%16.8f"%n4+"\n"
- *                         ofile.write(s)
- */
-  __pyx_slice__82 = PySlice_New(__pyx_int_41, __pyx_int_48, Py_None); if (unlikely(!__pyx_slice__82)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 320; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_slice__82);
-  __Pyx_GIVEREF(__pyx_slice__82);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":326
- *                     else:
- *                         if not elemshellwritten:
- *                             ofile.write("*ELEMENT_SHELL\n")             # <<<<<<<<<<<<<<
- *                             elemthicksection=False
- *                             elemshellwritten=True
- */
-  __pyx_tuple__83 = PyTuple_Pack(1, __pyx_kp_s_ELEMENT_SHELL_2); if (unlikely(!__pyx_tuple__83)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 326; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_tuple__83);
-  __Pyx_GIVEREF(__pyx_tuple__83);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":336
- *                     #
- *                 elif nodesection and (not("$" in line or "*" in line)):
- *                     nid=int(line[0:8])             # <<<<<<<<<<<<<<
- *                     x=float(_Mesh.Nodelist[nid][0])
- *                     y=float(_Mesh.Nodelist[nid][1])
- */
-  __pyx_slice__84 = PySlice_New(__pyx_int_0, __pyx_int_8, Py_None); if (unlikely(!__pyx_slice__84)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 336; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_slice__84);
-  __Pyx_GIVEREF(__pyx_slice__84);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":305
- *         # self.logger.info("LS-Dyna Mesh will be written to: "+ file)
- *         # self.logger.info("Baseline Input is taken from: "+ _Mesh.getMeshFile())
- *         with open(_Mesh.getMeshFile(), "r") as f:             # <<<<<<<<<<<<<<
- *             for line in f:
- *                 if (elemsection == True) and (not("$" in line or "*" in line)):
- */
-  __pyx_tuple__85 = PyTuple_Pack(3, Py_None, Py_None, Py_None); if (unlikely(!__pyx_tuple__85)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 305; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_tuple__85);
-  __Pyx_GIVEREF(__pyx_tuple__85);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":399
- *                 if "#RADIOSS STARTER" in line:
- *                     ofile.write(line)
- *                     ofile.write("## - Mubea TRB CAE - FE_Mesh_Handlers - writeRadiossMesh\n")             # <<<<<<<<<<<<<<
- *                     ofile.write("## - Date/Time: "+datetime.now().strftime('%Y/%m/%d %H:%M:%S')+"\n")
- *                     ofile.write("## - User: "+getuser()+"\n")
- */
-  __pyx_tuple__86 = PyTuple_Pack(1, __pyx_kp_s_Mubea_TRB_CAE_FE_Mesh_Handlers_2); if (unlikely(!__pyx_tuple__86)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 399; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_tuple__86);
-  __Pyx_GIVEREF(__pyx_tuple__86);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":400
- *                     ofile.write(line)
- *                     ofile.write("## - Mubea TRB CAE - FE_Mesh_Handlers - writeRadiossMesh\n")
- *                     ofile.write("## - Date/Time: "+datetime.now().strftime('%Y/%m/%d %H:%M:%S')+"\n")             # <<<<<<<<<<<<<<
- *                     ofile.write("## - User: "+getuser()+"\n")
- *                 elif ((SH3Nsection == True) or (SHELLsection == True)) and (not("#" in line or "/" in line)):
- */
-  __pyx_tuple__87 = PyTuple_Pack(1, __pyx_kp_s_Y_m_d_H_M_S); if (unlikely(!__pyx_tuple__87)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 400; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_tuple__87);
-  __Pyx_GIVEREF(__pyx_tuple__87);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":403
- *                     ofile.write("## - User: "+getuser()+"\n")
- *                 elif ((SH3Nsection == True) or (SHELLsection == True)) and (not("#" in line or "/" in line)):
- *                     elemid=int(line[0:10])             # <<<<<<<<<<<<<<
- *                     if elemthick:
- *                         if int(partid) in _Mesh.NUTProps:
- */
-  __pyx_slice__88 = PySlice_New(__pyx_int_0, __pyx_int_10, Py_None); if (unlikely(!__pyx_slice__88)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 403; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_slice__88);
-  __Pyx_GIVEREF(__pyx_slice__88);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":410
- *                     else:
- *                         thick = 0.0
- *                     ofile.write(line[0:90]+"%10.8f"%thick+"\n")             # <<<<<<<<<<<<<<
- *                 elif nodesection and (not("#" in line or "/" in line)):
- *                     nid=int(line[0:10])
- */
-  __pyx_slice__89 = PySlice_New(__pyx_int_0, __pyx_int_90, Py_None); if (unlikely(!__pyx_slice__89)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 410; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_slice__89);
-  __Pyx_GIVEREF(__pyx_slice__89);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":412
- *                     ofile.write(line[0:90]+"%10.8f"%thick+"\n")
- *                 elif nodesection and (not("#" in line or "/" in line)):
- *                     nid=int(line[0:10])             # <<<<<<<<<<<<<<
- *                     x=float(_Mesh.Nodelist[nid][0])
- *                     y=float(_Mesh.Nodelist[nid][1])
- */
-  __pyx_slice__90 = PySlice_New(__pyx_int_0, __pyx_int_10, Py_None); if (unlikely(!__pyx_slice__90)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 412; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_slice__90);
-  __Pyx_GIVEREF(__pyx_slice__90);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":418
- *                     s= "%10i"%nid+"%20.14f"%x+"%20.14f"%y+"%20.14f"%z+"\n"
- *                     ofile.write(s)
- *                 elif "/SH3N" in line[0:5]:             # <<<<<<<<<<<<<<
- *                     # self.logger.debug("/SH3N found")
- *                     partid=line.strip().split("/")[2]
- */
-  __pyx_slice__91 = PySlice_New(__pyx_int_0, __pyx_int_5, Py_None); if (unlikely(!__pyx_slice__91)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 418; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_slice__91);
-  __Pyx_GIVEREF(__pyx_slice__91);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":420
- *                 elif "/SH3N" in line[0:5]:
- *                     # self.logger.debug("/SH3N found")
- *                     partid=line.strip().split("/")[2]             # <<<<<<<<<<<<<<
- *                     SH3Nsection = True
- *                     SHELLsection = False
- */
-  __pyx_tuple__92 = PyTuple_Pack(1, __pyx_kp_s__39); if (unlikely(!__pyx_tuple__92)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 420; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_tuple__92);
-  __Pyx_GIVEREF(__pyx_tuple__92);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":425
- *                     nodesection = False
- *                     ofile.write(line)
- *                 elif "/SHELL" in line[0:6]:             # <<<<<<<<<<<<<<
- *                     i=0
- *                     # self.logger.debug("/SHELL found")
- */
-  __pyx_slice__93 = PySlice_New(__pyx_int_0, __pyx_int_6, Py_None); if (unlikely(!__pyx_slice__93)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 425; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_slice__93);
-  __Pyx_GIVEREF(__pyx_slice__93);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":428
- *                     i=0
- *                     # self.logger.debug("/SHELL found")
- *                     partid=line.strip().split("/")[2]             # <<<<<<<<<<<<<<
- *                     SH3Nsection = False
- *                     SHELLsection = True
- */
-  __pyx_tuple__94 = PyTuple_Pack(1, __pyx_kp_s__39); if (unlikely(!__pyx_tuple__94)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 428; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_tuple__94);
-  __Pyx_GIVEREF(__pyx_tuple__94);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":433
- *                     nodesection = False
- *                     ofile.write(line)
- *                 elif "/NODE" in line[0:5]:             # <<<<<<<<<<<<<<
- *                     # self.logger.debug("/NODE found")
- *                     SH3Nsection = False
- */
-  __pyx_slice__95 = PySlice_New(__pyx_int_0, __pyx_int_5, Py_None); if (unlikely(!__pyx_slice__95)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 433; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_slice__95);
-  __Pyx_GIVEREF(__pyx_slice__95);
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":394
- *         # self.logger.info("Radioss Mesh will be written to: "+ file)
- *         # self.logger.info("Baseline Input is taken from: "+ _Mesh.getMeshFile())
- *         with open(_Mesh.getMeshFile(), "r") as f:             # <<<<<<<<<<<<<<
- *             if len(_Mesh.Elementalthickness.keys())!=0: elemthick=True
- *             for line in f:
- */
-  __pyx_tuple__96 = PyTuple_Pack(3, Py_None, Py_None, Py_None); if (unlikely(!__pyx_tuple__96)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 394; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_tuple__96);
-  __Pyx_GIVEREF(__pyx_tuple__96);
-  __Pyx_RefNannyFinishContext();
-  return 0;
-  __pyx_L1_error:;
-  __Pyx_RefNannyFinishContext();
-  return -1;
-}
-
-static int __Pyx_InitGlobals(void) {
-  __pyx_umethod_PyDict_Type_keys.type = (PyObject*)&PyDict_Type;
-  if (__Pyx_InitStrings(__pyx_string_tab) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  __pyx_int_0 = PyInt_FromLong(0); if (unlikely(!__pyx_int_0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_int_1 = PyInt_FromLong(1); if (unlikely(!__pyx_int_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_int_2 = PyInt_FromLong(2); if (unlikely(!__pyx_int_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_int_3 = PyInt_FromLong(3); if (unlikely(!__pyx_int_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_int_5 = PyInt_FromLong(5); if (unlikely(!__pyx_int_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_int_6 = PyInt_FromLong(6); if (unlikely(!__pyx_int_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_int_8 = PyInt_FromLong(8); if (unlikely(!__pyx_int_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_int_9 = PyInt_FromLong(9); if (unlikely(!__pyx_int_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_int_10 = PyInt_FromLong(10); if (unlikely(!__pyx_int_10)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_int_11 = PyInt_FromLong(11); if (unlikely(!__pyx_int_11)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_int_13 = PyInt_FromLong(13); if (unlikely(!__pyx_int_13)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_int_16 = PyInt_FromLong(16); if (unlikely(!__pyx_int_16)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_int_17 = PyInt_FromLong(17); if (unlikely(!__pyx_int_17)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_int_20 = PyInt_FromLong(20); if (unlikely(!__pyx_int_20)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_int_21 = PyInt_FromLong(21); if (unlikely(!__pyx_int_21)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_int_24 = PyInt_FromLong(24); if (unlikely(!__pyx_int_24)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_int_25 = PyInt_FromLong(25); if (unlikely(!__pyx_int_25)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_int_30 = PyInt_FromLong(30); if (unlikely(!__pyx_int_30)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_int_31 = PyInt_FromLong(31); if (unlikely(!__pyx_int_31)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_int_32 = PyInt_FromLong(32); if (unlikely(!__pyx_int_32)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_int_33 = PyInt_FromLong(33); if (unlikely(!__pyx_int_33)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_int_40 = PyInt_FromLong(40); if (unlikely(!__pyx_int_40)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_int_41 = PyInt_FromLong(41); if (unlikely(!__pyx_int_41)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_int_48 = PyInt_FromLong(48); if (unlikely(!__pyx_int_48)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_int_49 = PyInt_FromLong(49); if (unlikely(!__pyx_int_49)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_int_50 = PyInt_FromLong(50); if (unlikely(!__pyx_int_50)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_int_51 = PyInt_FromLong(51); if (unlikely(!__pyx_int_51)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_int_56 = PyInt_FromLong(56); if (unlikely(!__pyx_int_56)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_int_64 = PyInt_FromLong(64); if (unlikely(!__pyx_int_64)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_int_70 = PyInt_FromLong(70); if (unlikely(!__pyx_int_70)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_int_90 = PyInt_FromLong(90); if (unlikely(!__pyx_int_90)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_int_91 = PyInt_FromLong(91); if (unlikely(!__pyx_int_91)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_int_100 = PyInt_FromLong(100); if (unlikely(!__pyx_int_100)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  return 0;
-  __pyx_L1_error:;
-  return -1;
-}
-
-#if PY_MAJOR_VERSION < 3
-PyMODINIT_FUNC initMeshReaders(void); /*proto*/
-PyMODINIT_FUNC initMeshReaders(void)
-#else
-PyMODINIT_FUNC PyInit_MeshReaders(void); /*proto*/
-PyMODINIT_FUNC PyInit_MeshReaders(void)
-#endif
-{
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannyDeclarations
-  #if CYTHON_REFNANNY
-  __Pyx_RefNanny = __Pyx_RefNannyImportAPI("refnanny");
-  if (!__Pyx_RefNanny) {
-      PyErr_Clear();
-      __Pyx_RefNanny = __Pyx_RefNannyImportAPI("Cython.Runtime.refnanny");
-      if (!__Pyx_RefNanny)
-          Py_FatalError("failed to import 'refnanny' module");
-  }
-  #endif
-  __Pyx_RefNannySetupContext("PyMODINIT_FUNC PyInit_MeshReaders(void)", 0);
-  if (__Pyx_check_binary_version() < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_empty_tuple = PyTuple_New(0); if (unlikely(!__pyx_empty_tuple)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_empty_bytes = PyBytes_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_bytes)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  #ifdef __Pyx_CyFunction_USED
-  if (__pyx_CyFunction_init() < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  #endif
-  #ifdef __Pyx_FusedFunction_USED
-  if (__pyx_FusedFunction_init() < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  #endif
-  #ifdef __Pyx_Coroutine_USED
-  if (__pyx_Coroutine_init() < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  #endif
-  #ifdef __Pyx_Generator_USED
-  if (__pyx_Generator_init() < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  #endif
-  #ifdef __Pyx_StopAsyncIteration_USED
-  if (__pyx_StopAsyncIteration_init() < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  #endif
-  /*--- Library function declarations ---*/
-  /*--- Threads initialization code ---*/
-  #if defined(__PYX_FORCE_INIT_THREADS) && __PYX_FORCE_INIT_THREADS
-  #ifdef WITH_THREAD /* Python build with threading support? */
-  PyEval_InitThreads();
-  #endif
-  #endif
-  /*--- Module creation code ---*/
-  #if PY_MAJOR_VERSION < 3
-  __pyx_m = Py_InitModule4("MeshReaders", __pyx_methods, 0, 0, PYTHON_API_VERSION); Py_XINCREF(__pyx_m);
-  #else
-  __pyx_m = PyModule_Create(&__pyx_moduledef);
-  #endif
-  if (unlikely(!__pyx_m)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_d = PyModule_GetDict(__pyx_m); if (unlikely(!__pyx_d)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_INCREF(__pyx_d);
-  __pyx_b = PyImport_AddModule(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_b)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  #if CYTHON_COMPILING_IN_PYPY
-  Py_INCREF(__pyx_b);
-  #endif
-  if (PyObject_SetAttrString(__pyx_m, "__builtins__", __pyx_b) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  /*--- Initialize various global constants etc. ---*/
-  if (__Pyx_InitGlobals() < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  #if PY_MAJOR_VERSION < 3 && (__PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT)
-  if (__Pyx_init_sys_getdefaultencoding_params() < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  #endif
-  if (__pyx_module_is_main_cNK_FEMeshUtils__MeshReaders) {
-    if (PyObject_SetAttrString(__pyx_m, "__name__", __pyx_n_s_main) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  }
-  #if PY_MAJOR_VERSION >= 3
-  {
-    PyObject *modules = PyImport_GetModuleDict(); if (unlikely(!modules)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    if (!PyDict_GetItemString(modules, "cNK_FEMeshUtils.MeshReaders")) {
-      if (unlikely(PyDict_SetItemString(modules, "cNK_FEMeshUtils.MeshReaders", __pyx_m) < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    }
-  }
-  #endif
-  /*--- Builtin init code ---*/
-  if (__Pyx_InitCachedBuiltins() < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  /*--- Constants init code ---*/
-  if (__Pyx_InitCachedConstants() < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  /*--- Global init code ---*/
-  /*--- Variable export code ---*/
-  /*--- Function export code ---*/
-  /*--- Type init code ---*/
-  __pyx_vtabptr_15cNK_FEMeshUtils_11MeshReaders_MeshReaders = &__pyx_vtable_15cNK_FEMeshUtils_11MeshReaders_MeshReaders;
-  __pyx_vtable_15cNK_FEMeshUtils_11MeshReaders_MeshReaders.readDynaMesh = (struct __pyx_obj_15cNK_FEMeshUtils_4Mesh_Mesh *(*)(struct __pyx_obj_15cNK_FEMeshUtils_11MeshReaders_MeshReaders *, PyObject *, int __pyx_skip_dispatch))__pyx_f_15cNK_FEMeshUtils_11MeshReaders_11MeshReaders_readDynaMesh;
-  __pyx_vtable_15cNK_FEMeshUtils_11MeshReaders_MeshReaders.readRadiossMesh = (struct __pyx_obj_15cNK_FEMeshUtils_4Mesh_Mesh *(*)(struct __pyx_obj_15cNK_FEMeshUtils_11MeshReaders_MeshReaders *, PyObject *, int __pyx_skip_dispatch))__pyx_f_15cNK_FEMeshUtils_11MeshReaders_11MeshReaders_readRadiossMesh;
-  __pyx_vtable_15cNK_FEMeshUtils_11MeshReaders_MeshReaders.writeDynaMesh = (PyObject *(*)(struct __pyx_obj_15cNK_FEMeshUtils_11MeshReaders_MeshReaders *, struct __pyx_obj_15cNK_FEMeshUtils_4Mesh_Mesh *, PyObject *, int __pyx_skip_dispatch))__pyx_f_15cNK_FEMeshUtils_11MeshReaders_11MeshReaders_writeDynaMesh;
-  __pyx_vtable_15cNK_FEMeshUtils_11MeshReaders_MeshReaders.writeRadiossMesh = (PyObject *(*)(struct __pyx_obj_15cNK_FEMeshUtils_11MeshReaders_MeshReaders *, struct __pyx_obj_15cNK_FEMeshUtils_4Mesh_Mesh *, PyObject *, int __pyx_skip_dispatch))__pyx_f_15cNK_FEMeshUtils_11MeshReaders_11MeshReaders_writeRadiossMesh;
-  if (PyType_Ready(&__pyx_type_15cNK_FEMeshUtils_11MeshReaders_MeshReaders) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 11; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_type_15cNK_FEMeshUtils_11MeshReaders_MeshReaders.tp_print = 0;
-  if (__Pyx_SetVtable(__pyx_type_15cNK_FEMeshUtils_11MeshReaders_MeshReaders.tp_dict, __pyx_vtabptr_15cNK_FEMeshUtils_11MeshReaders_MeshReaders) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 11; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (PyObject_SetAttrString(__pyx_m, "MeshReaders", (PyObject *)&__pyx_type_15cNK_FEMeshUtils_11MeshReaders_MeshReaders) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 11; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_ptype_15cNK_FEMeshUtils_11MeshReaders_MeshReaders = &__pyx_type_15cNK_FEMeshUtils_11MeshReaders_MeshReaders;
-  /*--- Type import code ---*/
-  __pyx_ptype_15cNK_FEMeshUtils_7Element_Element = __Pyx_ImportType("cNK_FEMeshUtils.Element", "Element", sizeof(struct __pyx_obj_15cNK_FEMeshUtils_7Element_Element), 1); if (unlikely(!__pyx_ptype_15cNK_FEMeshUtils_7Element_Element)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 2; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_vtabptr_15cNK_FEMeshUtils_7Element_Element = (struct __pyx_vtabstruct_15cNK_FEMeshUtils_7Element_Element*)__Pyx_GetVtable(__pyx_ptype_15cNK_FEMeshUtils_7Element_Element->tp_dict); if (unlikely(!__pyx_vtabptr_15cNK_FEMeshUtils_7Element_Element)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 2; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_ptype_15cNK_FEMeshUtils_4Node_Node = __Pyx_ImportType("cNK_FEMeshUtils.Node", "Node", sizeof(struct __pyx_obj_15cNK_FEMeshUtils_4Node_Node), 1); if (unlikely(!__pyx_ptype_15cNK_FEMeshUtils_4Node_Node)) {__pyx_filename = __pyx_f[2]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_vtabptr_15cNK_FEMeshUtils_4Node_Node = (struct __pyx_vtabstruct_15cNK_FEMeshUtils_4Node_Node*)__Pyx_GetVtable(__pyx_ptype_15cNK_FEMeshUtils_4Node_Node->tp_dict); if (unlikely(!__pyx_vtabptr_15cNK_FEMeshUtils_4Node_Node)) {__pyx_filename = __pyx_f[2]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_ptype_15cNK_FEMeshUtils_8Material_Material = __Pyx_ImportType("cNK_FEMeshUtils.Material", "Material", sizeof(struct __pyx_obj_15cNK_FEMeshUtils_8Material_Material), 1); if (unlikely(!__pyx_ptype_15cNK_FEMeshUtils_8Material_Material)) {__pyx_filename = __pyx_f[3]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_ptype_15cNK_FEMeshUtils_8Property_Property = __Pyx_ImportType("cNK_FEMeshUtils.Property", "Property", sizeof(struct __pyx_obj_15cNK_FEMeshUtils_8Property_Property), 1); if (unlikely(!__pyx_ptype_15cNK_FEMeshUtils_8Property_Property)) {__pyx_filename = __pyx_f[4]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_ptype_15cNK_FEMeshUtils_4Part_Part = __Pyx_ImportType("cNK_FEMeshUtils.Part", "Part", sizeof(struct __pyx_obj_15cNK_FEMeshUtils_4Part_Part), 1); if (unlikely(!__pyx_ptype_15cNK_FEMeshUtils_4Part_Part)) {__pyx_filename = __pyx_f[5]; __pyx_lineno = 5; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_vtabptr_15cNK_FEMeshUtils_4Part_Part = (struct __pyx_vtabstruct_15cNK_FEMeshUtils_4Part_Part*)__Pyx_GetVtable(__pyx_ptype_15cNK_FEMeshUtils_4Part_Part->tp_dict); if (unlikely(!__pyx_vtabptr_15cNK_FEMeshUtils_4Part_Part)) {__pyx_filename = __pyx_f[5]; __pyx_lineno = 5; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_ptype_15cNK_FEMeshUtils_4Mesh_Mesh = __Pyx_ImportType("cNK_FEMeshUtils.Mesh", "Mesh", sizeof(struct __pyx_obj_15cNK_FEMeshUtils_4Mesh_Mesh), 1); if (unlikely(!__pyx_ptype_15cNK_FEMeshUtils_4Mesh_Mesh)) {__pyx_filename = __pyx_f[6]; __pyx_lineno = 4; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_vtabptr_15cNK_FEMeshUtils_4Mesh_Mesh = (struct __pyx_vtabstruct_15cNK_FEMeshUtils_4Mesh_Mesh*)__Pyx_GetVtable(__pyx_ptype_15cNK_FEMeshUtils_4Mesh_Mesh->tp_dict); if (unlikely(!__pyx_vtabptr_15cNK_FEMeshUtils_4Mesh_Mesh)) {__pyx_filename = __pyx_f[6]; __pyx_lineno = 4; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  /*--- Variable import code ---*/
-  /*--- Function import code ---*/
-  /*--- Execution code ---*/
-  #if defined(__Pyx_Generator_USED) || defined(__Pyx_Coroutine_USED)
-  if (__Pyx_patch_abc() < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  #endif
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":1
- * import subprocess             # <<<<<<<<<<<<<<
- * # import logging
- * from Mesh import Mesh as Mesh
- */
-  __pyx_t_1 = __Pyx_Import(__pyx_n_s_subprocess, 0, -1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_subprocess, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":3
- * import subprocess
- * # import logging
- * from Mesh import Mesh as Mesh             # <<<<<<<<<<<<<<
- * import os
- * import numpy as np
- */
-  __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 3; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_INCREF(__pyx_n_s_Mesh_2);
-  __Pyx_GIVEREF(__pyx_n_s_Mesh_2);
-  PyList_SET_ITEM(__pyx_t_1, 0, __pyx_n_s_Mesh_2);
-  __pyx_t_2 = __Pyx_Import(__pyx_n_s_Mesh_2, __pyx_t_1, -1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 3; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":4
- * # import logging
- * from Mesh import Mesh as Mesh
- * import os             # <<<<<<<<<<<<<<
- * import numpy as np
- * from datetime import datetime
- */
-  __pyx_t_2 = __Pyx_Import(__pyx_n_s_os, 0, -1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 4; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_os, __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 4; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":5
- * from Mesh import Mesh as Mesh
- * import os
- * import numpy as np             # <<<<<<<<<<<<<<
- * from datetime import datetime
- * from numpy import cross, eye, dot
- */
-  __pyx_t_2 = __Pyx_Import(__pyx_n_s_numpy, 0, -1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 5; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_np, __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 5; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":6
- * import os
- * import numpy as np
- * from datetime import datetime             # <<<<<<<<<<<<<<
- * from numpy import cross, eye, dot
- * from scipy.linalg import expm3, norm
- */
-  __pyx_t_2 = PyList_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 6; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_INCREF(__pyx_n_s_datetime);
-  __Pyx_GIVEREF(__pyx_n_s_datetime);
-  PyList_SET_ITEM(__pyx_t_2, 0, __pyx_n_s_datetime);
-  __pyx_t_1 = __Pyx_Import(__pyx_n_s_datetime, __pyx_t_2, -1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 6; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_ImportFrom(__pyx_t_1, __pyx_n_s_datetime); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 6; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_datetime, __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 6; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":7
- * import numpy as np
- * from datetime import datetime
- * from numpy import cross, eye, dot             # <<<<<<<<<<<<<<
- * from scipy.linalg import expm3, norm
- * from getpass import getuser
- */
-  __pyx_t_1 = PyList_New(3); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 7; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_INCREF(__pyx_n_s_cross);
-  __Pyx_GIVEREF(__pyx_n_s_cross);
-  PyList_SET_ITEM(__pyx_t_1, 0, __pyx_n_s_cross);
-  __Pyx_INCREF(__pyx_n_s_eye);
-  __Pyx_GIVEREF(__pyx_n_s_eye);
-  PyList_SET_ITEM(__pyx_t_1, 1, __pyx_n_s_eye);
-  __Pyx_INCREF(__pyx_n_s_dot);
-  __Pyx_GIVEREF(__pyx_n_s_dot);
-  PyList_SET_ITEM(__pyx_t_1, 2, __pyx_n_s_dot);
-  __pyx_t_2 = __Pyx_Import(__pyx_n_s_numpy, __pyx_t_1, -1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 7; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_2, __pyx_n_s_cross); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 7; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_cross, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 7; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_2, __pyx_n_s_eye); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 7; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_eye, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 7; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_2, __pyx_n_s_dot); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 7; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_dot, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 7; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":8
- * from datetime import datetime
- * from numpy import cross, eye, dot
- * from scipy.linalg import expm3, norm             # <<<<<<<<<<<<<<
- * from getpass import getuser
- * 
- */
-  __pyx_t_2 = PyList_New(2); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 8; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_INCREF(__pyx_n_s_expm3);
-  __Pyx_GIVEREF(__pyx_n_s_expm3);
-  PyList_SET_ITEM(__pyx_t_2, 0, __pyx_n_s_expm3);
-  __Pyx_INCREF(__pyx_n_s_norm);
-  __Pyx_GIVEREF(__pyx_n_s_norm);
-  PyList_SET_ITEM(__pyx_t_2, 1, __pyx_n_s_norm);
-  __pyx_t_1 = __Pyx_Import(__pyx_n_s_scipy_linalg, __pyx_t_2, -1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 8; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_ImportFrom(__pyx_t_1, __pyx_n_s_expm3); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 8; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_expm3, __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 8; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_ImportFrom(__pyx_t_1, __pyx_n_s_norm); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 8; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_norm, __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 8; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":9
- * from numpy import cross, eye, dot
- * from scipy.linalg import expm3, norm
- * from getpass import getuser             # <<<<<<<<<<<<<<
- * 
- * class MeshReaders:
- */
-  __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 9; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_INCREF(__pyx_n_s_getuser);
-  __Pyx_GIVEREF(__pyx_n_s_getuser);
-  PyList_SET_ITEM(__pyx_t_1, 0, __pyx_n_s_getuser);
-  __pyx_t_2 = __Pyx_Import(__pyx_n_s_getpass, __pyx_t_1, -1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 9; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_2, __pyx_n_s_getuser); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 9; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_getuser, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 9; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-  /* "cNK_FEMeshUtils\MeshReaders.py":1
- * import subprocess             # <<<<<<<<<<<<<<
- * # import logging
- * from Mesh import Mesh as Mesh
- */
-  __pyx_t_2 = PyDict_New(); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_test, __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-  /*--- Wrapped vars code ---*/
-
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  if (__pyx_m) {
-    if (__pyx_d) {
-      __Pyx_AddTraceback("init cNK_FEMeshUtils.MeshReaders", __pyx_clineno, __pyx_lineno, __pyx_filename);
-    }
-    Py_DECREF(__pyx_m); __pyx_m = 0;
-  } else if (!PyErr_Occurred()) {
-    PyErr_SetString(PyExc_ImportError, "init cNK_FEMeshUtils.MeshReaders");
-  }
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  #if PY_MAJOR_VERSION < 3
-  return;
-  #else
-  return __pyx_m;
-  #endif
-}
-
-/* --- Runtime support code --- */
-#if CYTHON_REFNANNY
-static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname) {
-    PyObject *m = NULL, *p = NULL;
-    void *r = NULL;
-    m = PyImport_ImportModule((char *)modname);
-    if (!m) goto end;
-    p = PyObject_GetAttrString(m, (char *)"RefNannyAPI");
-    if (!p) goto end;
-    r = PyLong_AsVoidPtr(p);
-end:
-    Py_XDECREF(p);
-    Py_XDECREF(m);
-    return (__Pyx_RefNannyAPIStruct *)r;
-}
-#endif
-
-static PyObject *__Pyx_GetBuiltinName(PyObject *name) {
-    PyObject* result = __Pyx_PyObject_GetAttrStr(__pyx_b, name);
-    if (unlikely(!result)) {
-        PyErr_Format(PyExc_NameError,
-#if PY_MAJOR_VERSION >= 3
-            "name '%U' is not defined", name);
-#else
-            "name '%.200s' is not defined", PyString_AS_STRING(name));
-#endif
-    }
-    return result;
-}
-
-#if CYTHON_COMPILING_IN_CPYTHON
-static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw) {
-    PyObject *result;
-    ternaryfunc call = func->ob_type->tp_call;
-    if (unlikely(!call))
-        return PyObject_Call(func, arg, kw);
-    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
-        return NULL;
-    result = (*call)(func, arg, kw);
-    Py_LeaveRecursiveCall();
-    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
-        PyErr_SetString(
-            PyExc_SystemError,
-            "NULL result without error in PyObject_Call");
-    }
-    return result;
-}
-#endif
-
-#if CYTHON_COMPILING_IN_CPYTHON
-static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg) {
-    PyObject *self, *result;
-    PyCFunction cfunc;
-    cfunc = PyCFunction_GET_FUNCTION(func);
-    self = PyCFunction_GET_SELF(func);
-    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
-        return NULL;
-    result = cfunc(self, arg);
-    Py_LeaveRecursiveCall();
-    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
-        PyErr_SetString(
-            PyExc_SystemError,
-            "NULL result without error in PyObject_Call");
-    }
-    return result;
-}
-#endif
-
-#if CYTHON_COMPILING_IN_CPYTHON
-static PyObject* __Pyx__PyObject_CallOneArg(PyObject *func, PyObject *arg) {
-    PyObject *result;
-    PyObject *args = PyTuple_New(1);
-    if (unlikely(!args)) return NULL;
-    Py_INCREF(arg);
-    PyTuple_SET_ITEM(args, 0, arg);
-    result = __Pyx_PyObject_Call(func, args, NULL);
-    Py_DECREF(args);
-    return result;
-}
-static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg) {
-#ifdef __Pyx_CyFunction_USED
-    if (likely(PyCFunction_Check(func) || PyObject_TypeCheck(func, __pyx_CyFunctionType))) {
-#else
-    if (likely(PyCFunction_Check(func))) {
-#endif
-        if (likely(PyCFunction_GET_FLAGS(func) & METH_O)) {
-            return __Pyx_PyObject_CallMethO(func, arg);
-        }
-    }
-    return __Pyx__PyObject_CallOneArg(func, arg);
-}
-#else
-static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg) {
-    PyObject *result;
-    PyObject *args = PyTuple_Pack(1, arg);
-    if (unlikely(!args)) return NULL;
-    result = __Pyx_PyObject_Call(func, args, NULL);
-    Py_DECREF(args);
-    return result;
-}
-#endif
-
-static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type) {
-    if (unlikely(!type)) {
-        PyErr_SetString(PyExc_SystemError, "Missing type object");
-        return 0;
-    }
-    if (likely(PyObject_TypeCheck(obj, type)))
-        return 1;
-    PyErr_Format(PyExc_TypeError, "Cannot convert %.200s to %.200s",
-                 Py_TYPE(obj)->tp_name, type->tp_name);
-    return 0;
-}
-
-#if CYTHON_COMPILING_IN_CPYTHON
-static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func) {
-#ifdef __Pyx_CyFunction_USED
-    if (likely(PyCFunction_Check(func) || PyObject_TypeCheck(func, __pyx_CyFunctionType))) {
-#else
-    if (likely(PyCFunction_Check(func))) {
-#endif
-        if (likely(PyCFunction_GET_FLAGS(func) & METH_NOARGS)) {
-            return __Pyx_PyObject_CallMethO(func, NULL);
-        }
-    }
-    return __Pyx_PyObject_Call(func, __pyx_empty_tuple, NULL);
-}
-#endif
-
-static CYTHON_INLINE int __Pyx_PyBytes_Equals(PyObject* s1, PyObject* s2, int equals) {
-#if CYTHON_COMPILING_IN_PYPY
-    return PyObject_RichCompareBool(s1, s2, equals);
-#else
-    if (s1 == s2) {
-        return (equals == Py_EQ);
-    } else if (PyBytes_CheckExact(s1) & PyBytes_CheckExact(s2)) {
-        const char *ps1, *ps2;
-        Py_ssize_t length = PyBytes_GET_SIZE(s1);
-        if (length != PyBytes_GET_SIZE(s2))
-            return (equals == Py_NE);
-        ps1 = PyBytes_AS_STRING(s1);
-        ps2 = PyBytes_AS_STRING(s2);
-        if (ps1[0] != ps2[0]) {
-            return (equals == Py_NE);
-        } else if (length == 1) {
-            return (equals == Py_EQ);
-        } else {
-            int result = memcmp(ps1, ps2, (size_t)length);
-            return (equals == Py_EQ) ? (result == 0) : (result != 0);
-        }
-    } else if ((s1 == Py_None) & PyBytes_CheckExact(s2)) {
-        return (equals == Py_NE);
-    } else if ((s2 == Py_None) & PyBytes_CheckExact(s1)) {
-        return (equals == Py_NE);
-    } else {
-        int result;
-        PyObject* py_result = PyObject_RichCompare(s1, s2, equals);
-        if (!py_result)
-            return -1;
-        result = __Pyx_PyObject_IsTrue(py_result);
-        Py_DECREF(py_result);
-        return result;
-    }
-#endif
-}
-
-static CYTHON_INLINE int __Pyx_PyUnicode_Equals(PyObject* s1, PyObject* s2, int equals) {
-#if CYTHON_COMPILING_IN_PYPY
-    return PyObject_RichCompareBool(s1, s2, equals);
-#else
-#if PY_MAJOR_VERSION < 3
-    PyObject* owned_ref = NULL;
-#endif
-    int s1_is_unicode, s2_is_unicode;
-    if (s1 == s2) {
-        goto return_eq;
-    }
-    s1_is_unicode = PyUnicode_CheckExact(s1);
-    s2_is_unicode = PyUnicode_CheckExact(s2);
-#if PY_MAJOR_VERSION < 3
-    if ((s1_is_unicode & (!s2_is_unicode)) && PyString_CheckExact(s2)) {
-        owned_ref = PyUnicode_FromObject(s2);
-        if (unlikely(!owned_ref))
-            return -1;
-        s2 = owned_ref;
-        s2_is_unicode = 1;
-    } else if ((s2_is_unicode & (!s1_is_unicode)) && PyString_CheckExact(s1)) {
-        owned_ref = PyUnicode_FromObject(s1);
-        if (unlikely(!owned_ref))
-            return -1;
-        s1 = owned_ref;
-        s1_is_unicode = 1;
-    } else if (((!s2_is_unicode) & (!s1_is_unicode))) {
-        return __Pyx_PyBytes_Equals(s1, s2, equals);
-    }
-#endif
-    if (s1_is_unicode & s2_is_unicode) {
-        Py_ssize_t length;
-        int kind;
-        void *data1, *data2;
-        if (unlikely(__Pyx_PyUnicode_READY(s1) < 0) || unlikely(__Pyx_PyUnicode_READY(s2) < 0))
-            return -1;
-        length = __Pyx_PyUnicode_GET_LENGTH(s1);
-        if (length != __Pyx_PyUnicode_GET_LENGTH(s2)) {
-            goto return_ne;
-        }
-        kind = __Pyx_PyUnicode_KIND(s1);
-        if (kind != __Pyx_PyUnicode_KIND(s2)) {
-            goto return_ne;
-        }
-        data1 = __Pyx_PyUnicode_DATA(s1);
-        data2 = __Pyx_PyUnicode_DATA(s2);
-        if (__Pyx_PyUnicode_READ(kind, data1, 0) != __Pyx_PyUnicode_READ(kind, data2, 0)) {
-            goto return_ne;
-        } else if (length == 1) {
-            goto return_eq;
-        } else {
-            int result = memcmp(data1, data2, (size_t)(length * kind));
-            #if PY_MAJOR_VERSION < 3
-            Py_XDECREF(owned_ref);
-            #endif
-            return (equals == Py_EQ) ? (result == 0) : (result != 0);
-        }
-    } else if ((s1 == Py_None) & s2_is_unicode) {
-        goto return_ne;
-    } else if ((s2 == Py_None) & s1_is_unicode) {
-        goto return_ne;
-    } else {
-        int result;
-        PyObject* py_result = PyObject_RichCompare(s1, s2, equals);
-        if (!py_result)
-            return -1;
-        result = __Pyx_PyObject_IsTrue(py_result);
-        Py_DECREF(py_result);
-        return result;
-    }
-return_eq:
-    #if PY_MAJOR_VERSION < 3
-    Py_XDECREF(owned_ref);
-    #endif
-    return (equals == Py_EQ);
-return_ne:
-    #if PY_MAJOR_VERSION < 3
-    Py_XDECREF(owned_ref);
-    #endif
-    return (equals == Py_NE);
-#endif
-}
-
-static CYTHON_INLINE PyObject* __Pyx_PyObject_GetSlice(PyObject* obj,
-        Py_ssize_t cstart, Py_ssize_t cstop,
-        PyObject** _py_start, PyObject** _py_stop, PyObject** _py_slice,
-        int has_cstart, int has_cstop, CYTHON_UNUSED int wraparound) {
-#if CYTHON_COMPILING_IN_CPYTHON
-    PyMappingMethods* mp;
-#if PY_MAJOR_VERSION < 3
-    PySequenceMethods* ms = Py_TYPE(obj)->tp_as_sequence;
-    if (likely(ms && ms->sq_slice)) {
-        if (!has_cstart) {
-            if (_py_start && (*_py_start != Py_None)) {
-                cstart = __Pyx_PyIndex_AsSsize_t(*_py_start);
-                if ((cstart == (Py_ssize_t)-1) && PyErr_Occurred()) goto bad;
-            } else
-                cstart = 0;
-        }
-        if (!has_cstop) {
-            if (_py_stop && (*_py_stop != Py_None)) {
-                cstop = __Pyx_PyIndex_AsSsize_t(*_py_stop);
-                if ((cstop == (Py_ssize_t)-1) && PyErr_Occurred()) goto bad;
-            } else
-                cstop = PY_SSIZE_T_MAX;
-        }
-        if (wraparound && unlikely((cstart < 0) | (cstop < 0)) && likely(ms->sq_length)) {
-            Py_ssize_t l = ms->sq_length(obj);
-            if (likely(l >= 0)) {
-                if (cstop < 0) {
-                    cstop += l;
-                    if (cstop < 0) cstop = 0;
-                }
-                if (cstart < 0) {
-                    cstart += l;
-                    if (cstart < 0) cstart = 0;
-                }
-            } else {
-                if (PyErr_ExceptionMatches(PyExc_OverflowError))
-                    PyErr_Clear();
-                else
-                    goto bad;
-            }
-        }
-        return ms->sq_slice(obj, cstart, cstop);
-    }
-#endif
-    mp = Py_TYPE(obj)->tp_as_mapping;
-    if (likely(mp && mp->mp_subscript))
-#endif
-    {
-        PyObject* result;
-        PyObject *py_slice, *py_start, *py_stop;
-        if (_py_slice) {
-            py_slice = *_py_slice;
-        } else {
-            PyObject* owned_start = NULL;
-            PyObject* owned_stop = NULL;
-            if (_py_start) {
-                py_start = *_py_start;
-            } else {
-                if (has_cstart) {
-                    owned_start = py_start = PyInt_FromSsize_t(cstart);
-                    if (unlikely(!py_start)) goto bad;
-                } else
-                    py_start = Py_None;
-            }
-            if (_py_stop) {
-                py_stop = *_py_stop;
-            } else {
-                if (has_cstop) {
-                    owned_stop = py_stop = PyInt_FromSsize_t(cstop);
-                    if (unlikely(!py_stop)) {
-                        Py_XDECREF(owned_start);
-                        goto bad;
-                    }
-                } else
-                    py_stop = Py_None;
-            }
-            py_slice = PySlice_New(py_start, py_stop, Py_None);
-            Py_XDECREF(owned_start);
-            Py_XDECREF(owned_stop);
-            if (unlikely(!py_slice)) goto bad;
-        }
-#if CYTHON_COMPILING_IN_CPYTHON
-        result = mp->mp_subscript(obj, py_slice);
-#else
-        result = PyObject_GetItem(obj, py_slice);
-#endif
-        if (!_py_slice) {
-            Py_DECREF(py_slice);
-        }
-        return result;
-    }
-    PyErr_Format(PyExc_TypeError,
-        "'%.200s' object is unsliceable", Py_TYPE(obj)->tp_name);
-bad:
-    return NULL;
-}
-
-static double __Pyx__PyObject_AsDouble(PyObject* obj) {
-    PyObject* float_value;
-#if CYTHON_COMPILING_IN_PYPY
-    float_value = PyNumber_Float(obj);  if (0) goto bad;
-#else
-    PyNumberMethods *nb = Py_TYPE(obj)->tp_as_number;
-    if (likely(nb) && likely(nb->nb_float)) {
-        float_value = nb->nb_float(obj);
-        if (likely(float_value) && unlikely(!PyFloat_Check(float_value))) {
-            PyErr_Format(PyExc_TypeError,
-                "__float__ returned non-float (type %.200s)",
-                Py_TYPE(float_value)->tp_name);
-            Py_DECREF(float_value);
-            goto bad;
-        }
-    } else if (PyUnicode_CheckExact(obj) || PyBytes_CheckExact(obj)) {
-#if PY_MAJOR_VERSION >= 3
-        float_value = PyFloat_FromString(obj);
-#else
-        float_value = PyFloat_FromString(obj, 0);
-#endif
-    } else {
-        PyObject* args = PyTuple_New(1);
-        if (unlikely(!args)) goto bad;
-        PyTuple_SET_ITEM(args, 0, obj);
-        float_value = PyObject_Call((PyObject*)&PyFloat_Type, args, 0);
-        PyTuple_SET_ITEM(args, 0, 0);
-        Py_DECREF(args);
-    }
-#endif
-    if (likely(float_value)) {
-        double value = PyFloat_AS_DOUBLE(float_value);
-        Py_DECREF(float_value);
-        return value;
-    }
-bad:
-    return (double)-1;
-}
-
-#if CYTHON_USE_PYLONG_INTERNALS
-  #include "longintrepr.h"
-#endif
-
-#if CYTHON_COMPILING_IN_CPYTHON
-static PyObject* __Pyx_PyInt_EqObjC(PyObject *op1, PyObject *op2, CYTHON_UNUSED long intval, CYTHON_UNUSED int inplace) {
-    if (op1 == op2) {
-        Py_RETURN_TRUE;
-    }
-    #if PY_MAJOR_VERSION < 3
-    if (likely(PyInt_CheckExact(op1))) {
-        const long b = intval;
-        long a = PyInt_AS_LONG(op1);
-        if (a == b) {
-            Py_RETURN_TRUE;
-        } else {
-            Py_RETURN_FALSE;
-        }
-    }
-    #endif
-    #if CYTHON_USE_PYLONG_INTERNALS && PY_MAJOR_VERSION >= 3
-    if (likely(PyLong_CheckExact(op1))) {
-        const long b = intval;
-        long a;
-        const digit* digits = ((PyLongObject*)op1)->ob_digit;
-        const Py_ssize_t size = Py_SIZE(op1);
-        if (likely(__Pyx_sst_abs(size) <= 1)) {
-            a = likely(size) ? digits[0] : 0;
-            if (size == -1) a = -a;
-        } else {
-            switch (size) {
-                case -2:
-                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
-                        a = -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
-                        break;
-                    }
-                case 2:
-                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
-                        a = (long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
-                        break;
-                    }
-                case -3:
-                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
-                        a = -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
-                        break;
-                    }
-                case 3:
-                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
-                        a = (long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
-                        break;
-                    }
-                case -4:
-                    if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
-                        a = -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
-                        break;
-                    }
-                case 4:
-                    if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
-                        a = (long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
-                        break;
-                    }
-                #if PyLong_SHIFT < 30 && PyLong_SHIFT != 15
-                default: return PyLong_Type.tp_richcompare(op1, op2, Py_EQ);
-                #else
-                default: Py_RETURN_FALSE;
-                #endif
-            }
-        }
-            if (a == b) {
-                Py_RETURN_TRUE;
-            } else {
-                Py_RETURN_FALSE;
-            }
-    }
-    #endif
-    if (PyFloat_CheckExact(op1)) {
-        const long b = intval;
-        double a = PyFloat_AS_DOUBLE(op1);
-            if ((double)a == (double)b) {
-                Py_RETURN_TRUE;
-            } else {
-                Py_RETURN_FALSE;
-            }
-    }
-    return PyObject_RichCompare(op1, op2, Py_EQ);
-}
-#endif
-
-#if CYTHON_COMPILING_IN_CPYTHON
-static PyObject* __Pyx_PyInt_AddObjC(PyObject *op1, PyObject *op2, CYTHON_UNUSED long intval, CYTHON_UNUSED int inplace) {
-    #if PY_MAJOR_VERSION < 3
-    if (likely(PyInt_CheckExact(op1))) {
-        const long b = intval;
-        long x;
-        long a = PyInt_AS_LONG(op1);
-            x = (long)((unsigned long)a + b);
-            if (likely((x^a) >= 0 || (x^b) >= 0))
-                return PyInt_FromLong(x);
-            return PyLong_Type.tp_as_number->nb_add(op1, op2);
-    }
-    #endif
-    #if CYTHON_USE_PYLONG_INTERNALS && PY_MAJOR_VERSION >= 3
-    if (likely(PyLong_CheckExact(op1))) {
-        const long b = intval;
-        long a, x;
-        const PY_LONG_LONG llb = intval;
-        PY_LONG_LONG lla, llx;
-        const digit* digits = ((PyLongObject*)op1)->ob_digit;
-        const Py_ssize_t size = Py_SIZE(op1);
-        if (likely(__Pyx_sst_abs(size) <= 1)) {
-            a = likely(size) ? digits[0] : 0;
-            if (size == -1) a = -a;
-        } else {
-            switch (size) {
-                case -2:
-                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
-                        a = -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
-                        break;
-                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT) {
-                        lla = -(PY_LONG_LONG) (((((unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
-                        goto long_long;
-                    }
-                case 2:
-                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
-                        a = (long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
-                        break;
-                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT) {
-                        lla = (PY_LONG_LONG) (((((unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
-                        goto long_long;
-                    }
-                case -3:
-                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
-                        a = -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
-                        break;
-                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT) {
-                        lla = -(PY_LONG_LONG) (((((((unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
-                        goto long_long;
-                    }
-                case 3:
-                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
-                        a = (long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
-                        break;
-                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT) {
-                        lla = (PY_LONG_LONG) (((((((unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
-                        goto long_long;
-                    }
-                case -4:
-                    if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
-                        a = -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
-                        break;
-                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 4 * PyLong_SHIFT) {
-                        lla = -(PY_LONG_LONG) (((((((((unsigned PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
-                        goto long_long;
-                    }
-                case 4:
-                    if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
-                        a = (long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
-                        break;
-                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 4 * PyLong_SHIFT) {
-                        lla = (PY_LONG_LONG) (((((((((unsigned PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
-                        goto long_long;
-                    }
-                default: return PyLong_Type.tp_as_number->nb_add(op1, op2);
-            }
-        }
-                x = a + b;
-            return PyLong_FromLong(x);
-        long_long:
-                llx = lla + llb;
-            return PyLong_FromLongLong(llx);
-    }
-    #endif
-    if (PyFloat_CheckExact(op1)) {
-        const long b = intval;
-        double a = PyFloat_AS_DOUBLE(op1);
-            double result;
-            PyFPE_START_PROTECT("add", return NULL)
-            result = ((double)a) + (double)b;
-            PyFPE_END_PROTECT(result)
-            return PyFloat_FromDouble(result);
-    }
-    return (inplace ? PyNumber_InPlaceAdd : PyNumber_Add)(op1, op2);
-}
-#endif
-
-static CYTHON_INLINE void __Pyx_RaiseUnboundLocalError(const char *varname) {
-    PyErr_Format(PyExc_UnboundLocalError, "local variable '%s' referenced before assignment", varname);
-}
-
-static CYTHON_INLINE void __Pyx_ExceptionSave(PyObject **type, PyObject **value, PyObject **tb) {
-#if CYTHON_COMPILING_IN_CPYTHON
-    PyThreadState *tstate = PyThreadState_GET();
-    *type = tstate->exc_type;
-    *value = tstate->exc_value;
-    *tb = tstate->exc_traceback;
-    Py_XINCREF(*type);
-    Py_XINCREF(*value);
-    Py_XINCREF(*tb);
-#else
-    PyErr_GetExcInfo(type, value, tb);
-#endif
-}
-static void __Pyx_ExceptionReset(PyObject *type, PyObject *value, PyObject *tb) {
-#if CYTHON_COMPILING_IN_CPYTHON
-    PyObject *tmp_type, *tmp_value, *tmp_tb;
-    PyThreadState *tstate = PyThreadState_GET();
-    tmp_type = tstate->exc_type;
-    tmp_value = tstate->exc_value;
-    tmp_tb = tstate->exc_traceback;
-    tstate->exc_type = type;
-    tstate->exc_value = value;
-    tstate->exc_traceback = tb;
-    Py_XDECREF(tmp_type);
-    Py_XDECREF(tmp_value);
-    Py_XDECREF(tmp_tb);
-#else
-    PyErr_SetExcInfo(type, value, tb);
-#endif
-}
-
-static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb) {
-    PyObject *local_type, *local_value, *local_tb;
-#if CYTHON_COMPILING_IN_CPYTHON
-    PyObject *tmp_type, *tmp_value, *tmp_tb;
-    PyThreadState *tstate = PyThreadState_GET();
-    local_type = tstate->curexc_type;
-    local_value = tstate->curexc_value;
-    local_tb = tstate->curexc_traceback;
-    tstate->curexc_type = 0;
-    tstate->curexc_value = 0;
-    tstate->curexc_traceback = 0;
-#else
-    PyErr_Fetch(&local_type, &local_value, &local_tb);
-#endif
-    PyErr_NormalizeException(&local_type, &local_value, &local_tb);
-#if CYTHON_COMPILING_IN_CPYTHON
-    if (unlikely(tstate->curexc_type))
-#else
-    if (unlikely(PyErr_Occurred()))
-#endif
-        goto bad;
-    #if PY_MAJOR_VERSION >= 3
-    if (local_tb) {
-        if (unlikely(PyException_SetTraceback(local_value, local_tb) < 0))
-            goto bad;
-    }
-    #endif
-    Py_XINCREF(local_tb);
-    Py_XINCREF(local_type);
-    Py_XINCREF(local_value);
-    *type = local_type;
-    *value = local_value;
-    *tb = local_tb;
-#if CYTHON_COMPILING_IN_CPYTHON
-    tmp_type = tstate->exc_type;
-    tmp_value = tstate->exc_value;
-    tmp_tb = tstate->exc_traceback;
-    tstate->exc_type = local_type;
-    tstate->exc_value = local_value;
-    tstate->exc_traceback = local_tb;
-    Py_XDECREF(tmp_type);
-    Py_XDECREF(tmp_value);
-    Py_XDECREF(tmp_tb);
-#else
-    PyErr_SetExcInfo(local_type, local_value, local_tb);
-#endif
-    return 0;
-bad:
-    *type = 0;
-    *value = 0;
-    *tb = 0;
-    Py_XDECREF(local_type);
-    Py_XDECREF(local_value);
-    Py_XDECREF(local_tb);
-    return -1;
-}
-
-static CYTHON_INLINE void __Pyx_ErrRestore(PyObject *type, PyObject *value, PyObject *tb) {
-#if CYTHON_COMPILING_IN_CPYTHON
-    PyObject *tmp_type, *tmp_value, *tmp_tb;
-    PyThreadState *tstate = PyThreadState_GET();
-    tmp_type = tstate->curexc_type;
-    tmp_value = tstate->curexc_value;
-    tmp_tb = tstate->curexc_traceback;
-    tstate->curexc_type = type;
-    tstate->curexc_value = value;
-    tstate->curexc_traceback = tb;
-    Py_XDECREF(tmp_type);
-    Py_XDECREF(tmp_value);
-    Py_XDECREF(tmp_tb);
-#else
-    PyErr_Restore(type, value, tb);
-#endif
-}
-static CYTHON_INLINE void __Pyx_ErrFetch(PyObject **type, PyObject **value, PyObject **tb) {
-#if CYTHON_COMPILING_IN_CPYTHON
-    PyThreadState *tstate = PyThreadState_GET();
-    *type = tstate->curexc_type;
-    *value = tstate->curexc_value;
-    *tb = tstate->curexc_traceback;
-    tstate->curexc_type = 0;
-    tstate->curexc_value = 0;
-    tstate->curexc_traceback = 0;
-#else
-    PyErr_Fetch(type, value, tb);
-#endif
-}
-
-static void __Pyx_RaiseArgumentTypeInvalid(const char* name, PyObject *obj, PyTypeObject *type) {
-    PyErr_Format(PyExc_TypeError,
-        "Argument '%.200s' has incorrect type (expected %.200s, got %.200s)",
-        name, type->tp_name, Py_TYPE(obj)->tp_name);
-}
-static CYTHON_INLINE int __Pyx_ArgTypeTest(PyObject *obj, PyTypeObject *type, int none_allowed,
-    const char *name, int exact)
-{
-    if (unlikely(!type)) {
-        PyErr_SetString(PyExc_SystemError, "Missing type object");
-        return 0;
-    }
-    if (none_allowed && obj == Py_None) return 1;
-    else if (exact) {
-        if (likely(Py_TYPE(obj) == type)) return 1;
-        #if PY_MAJOR_VERSION == 2
-        else if ((type == &PyBaseString_Type) && likely(__Pyx_PyBaseString_CheckExact(obj))) return 1;
-        #endif
-    }
-    else {
-        if (likely(PyObject_TypeCheck(obj, type))) return 1;
-    }
-    __Pyx_RaiseArgumentTypeInvalid(name, obj, type);
-    return 0;
-}
-
-static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j) {
-    PyObject *r;
-    if (!j) return NULL;
-    r = PyObject_GetItem(o, j);
-    Py_DECREF(j);
-    return r;
-}
-static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i,
-                                                              CYTHON_NCP_UNUSED int wraparound,
-                                                              CYTHON_NCP_UNUSED int boundscheck) {
-#if CYTHON_COMPILING_IN_CPYTHON
-    if (wraparound & unlikely(i < 0)) i += PyList_GET_SIZE(o);
-    if ((!boundscheck) || likely((0 <= i) & (i < PyList_GET_SIZE(o)))) {
-        PyObject *r = PyList_GET_ITEM(o, i);
-        Py_INCREF(r);
-        return r;
-    }
-    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
-#else
-    return PySequence_GetItem(o, i);
-#endif
-}
-static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i,
-                                                              CYTHON_NCP_UNUSED int wraparound,
-                                                              CYTHON_NCP_UNUSED int boundscheck) {
-#if CYTHON_COMPILING_IN_CPYTHON
-    if (wraparound & unlikely(i < 0)) i += PyTuple_GET_SIZE(o);
-    if ((!boundscheck) || likely((0 <= i) & (i < PyTuple_GET_SIZE(o)))) {
-        PyObject *r = PyTuple_GET_ITEM(o, i);
-        Py_INCREF(r);
-        return r;
-    }
-    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
-#else
-    return PySequence_GetItem(o, i);
-#endif
-}
-static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i, int is_list,
-                                                     CYTHON_NCP_UNUSED int wraparound,
-                                                     CYTHON_NCP_UNUSED int boundscheck) {
-#if CYTHON_COMPILING_IN_CPYTHON
-    if (is_list || PyList_CheckExact(o)) {
-        Py_ssize_t n = ((!wraparound) | likely(i >= 0)) ? i : i + PyList_GET_SIZE(o);
-        if ((!boundscheck) || (likely((n >= 0) & (n < PyList_GET_SIZE(o))))) {
-            PyObject *r = PyList_GET_ITEM(o, n);
-            Py_INCREF(r);
-            return r;
-        }
-    }
-    else if (PyTuple_CheckExact(o)) {
-        Py_ssize_t n = ((!wraparound) | likely(i >= 0)) ? i : i + PyTuple_GET_SIZE(o);
-        if ((!boundscheck) || likely((n >= 0) & (n < PyTuple_GET_SIZE(o)))) {
-            PyObject *r = PyTuple_GET_ITEM(o, n);
-            Py_INCREF(r);
-            return r;
-        }
-    } else {
-        PySequenceMethods *m = Py_TYPE(o)->tp_as_sequence;
-        if (likely(m && m->sq_item)) {
-            if (wraparound && unlikely(i < 0) && likely(m->sq_length)) {
-                Py_ssize_t l = m->sq_length(o);
-                if (likely(l >= 0)) {
-                    i += l;
-                } else {
-                    if (PyErr_ExceptionMatches(PyExc_OverflowError))
-                        PyErr_Clear();
-                    else
-                        return NULL;
-                }
-            }
-            return m->sq_item(o, i);
-        }
-    }
-#else
-    if (is_list || PySequence_Check(o)) {
-        return PySequence_GetItem(o, i);
-    }
-#endif
-    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
-}
-
-static CYTHON_INLINE PyObject *__Pyx_GetModuleGlobalName(PyObject *name) {
-    PyObject *result;
-#if CYTHON_COMPILING_IN_CPYTHON
-    result = PyDict_GetItem(__pyx_d, name);
-    if (likely(result)) {
-        Py_INCREF(result);
-    } else {
-#else
-    result = PyObject_GetItem(__pyx_d, name);
-    if (!result) {
-        PyErr_Clear();
-#endif
-        result = __Pyx_GetBuiltinName(name);
-    }
-    return result;
-}
-
-static void __Pyx_RaiseArgtupleInvalid(
-    const char* func_name,
-    int exact,
-    Py_ssize_t num_min,
-    Py_ssize_t num_max,
-    Py_ssize_t num_found)
-{
-    Py_ssize_t num_expected;
-    const char *more_or_less;
-    if (num_found < num_min) {
-        num_expected = num_min;
-        more_or_less = "at least";
-    } else {
-        num_expected = num_max;
-        more_or_less = "at most";
-    }
-    if (exact) {
-        more_or_less = "exactly";
-    }
-    PyErr_Format(PyExc_TypeError,
-                 "%.200s() takes %.8s %" CYTHON_FORMAT_SSIZE_T "d positional argument%.1s (%" CYTHON_FORMAT_SSIZE_T "d given)",
-                 func_name, more_or_less, num_expected,
-                 (num_expected == 1) ? "" : "s", num_found);
-}
-
-static void __Pyx_RaiseDoubleKeywordsError(
-    const char* func_name,
-    PyObject* kw_name)
-{
-    PyErr_Format(PyExc_TypeError,
-        #if PY_MAJOR_VERSION >= 3
-        "%s() got multiple values for keyword argument '%U'", func_name, kw_name);
-        #else
-        "%s() got multiple values for keyword argument '%s'", func_name,
-        PyString_AsString(kw_name));
-        #endif
-}
-
-static int __Pyx_ParseOptionalKeywords(
-    PyObject *kwds,
-    PyObject **argnames[],
-    PyObject *kwds2,
-    PyObject *values[],
-    Py_ssize_t num_pos_args,
-    const char* function_name)
-{
-    PyObject *key = 0, *value = 0;
-    Py_ssize_t pos = 0;
-    PyObject*** name;
-    PyObject*** first_kw_arg = argnames + num_pos_args;
-    while (PyDict_Next(kwds, &pos, &key, &value)) {
-        name = first_kw_arg;
-        while (*name && (**name != key)) name++;
-        if (*name) {
-            values[name-argnames] = value;
-            continue;
-        }
-        name = first_kw_arg;
-        #if PY_MAJOR_VERSION < 3
-        if (likely(PyString_CheckExact(key)) || likely(PyString_Check(key))) {
-            while (*name) {
-                if ((CYTHON_COMPILING_IN_PYPY || PyString_GET_SIZE(**name) == PyString_GET_SIZE(key))
-                        && _PyString_Eq(**name, key)) {
-                    values[name-argnames] = value;
-                    break;
-                }
-                name++;
-            }
-            if (*name) continue;
-            else {
-                PyObject*** argname = argnames;
-                while (argname != first_kw_arg) {
-                    if ((**argname == key) || (
-                            (CYTHON_COMPILING_IN_PYPY || PyString_GET_SIZE(**argname) == PyString_GET_SIZE(key))
-                             && _PyString_Eq(**argname, key))) {
-                        goto arg_passed_twice;
-                    }
-                    argname++;
-                }
-            }
-        } else
-        #endif
-        if (likely(PyUnicode_Check(key))) {
-            while (*name) {
-                int cmp = (**name == key) ? 0 :
-                #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
-                    (PyUnicode_GET_SIZE(**name) != PyUnicode_GET_SIZE(key)) ? 1 :
-                #endif
-                    PyUnicode_Compare(**name, key);
-                if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
-                if (cmp == 0) {
-                    values[name-argnames] = value;
-                    break;
-                }
-                name++;
-            }
-            if (*name) continue;
-            else {
-                PyObject*** argname = argnames;
-                while (argname != first_kw_arg) {
-                    int cmp = (**argname == key) ? 0 :
-                    #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
-                        (PyUnicode_GET_SIZE(**argname) != PyUnicode_GET_SIZE(key)) ? 1 :
-                    #endif
-                        PyUnicode_Compare(**argname, key);
-                    if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
-                    if (cmp == 0) goto arg_passed_twice;
-                    argname++;
-                }
-            }
-        } else
-            goto invalid_keyword_type;
-        if (kwds2) {
-            if (unlikely(PyDict_SetItem(kwds2, key, value))) goto bad;
-        } else {
-            goto invalid_keyword;
-        }
-    }
-    return 0;
-arg_passed_twice:
-    __Pyx_RaiseDoubleKeywordsError(function_name, key);
-    goto bad;
-invalid_keyword_type:
-    PyErr_Format(PyExc_TypeError,
-        "%.200s() keywords must be strings", function_name);
-    goto bad;
-invalid_keyword:
-    PyErr_Format(PyExc_TypeError,
-    #if PY_MAJOR_VERSION < 3
-        "%.200s() got an unexpected keyword argument '%.200s'",
-        function_name, PyString_AsString(key));
-    #else
-        "%s() got an unexpected keyword argument '%U'",
-        function_name, key);
-    #endif
-bad:
-    return -1;
-}
-
-static int __Pyx_TryUnpackUnboundCMethod(__Pyx_CachedCFunction* target) {
-    PyObject *method;
-    method = __Pyx_PyObject_GetAttrStr(target->type, *target->method_name);
-    if (unlikely(!method))
-        return -1;
-    target->method = method;
-#if CYTHON_COMPILING_IN_CPYTHON
-    #if PY_MAJOR_VERSION >= 3
-    if (likely(PyObject_TypeCheck(method, &PyMethodDescr_Type)))
-    #endif
-    {
-        PyMethodDescrObject *descr = (PyMethodDescrObject*) method;
-        target->func = descr->d_method->ml_meth;
-        target->flag = descr->d_method->ml_flags & (METH_VARARGS | METH_KEYWORDS | METH_O | METH_NOARGS);
-    }
-#endif
-    return 0;
-}
-
-static PyObject* __Pyx__CallUnboundCMethod0(__Pyx_CachedCFunction* cfunc, PyObject* self) {
-    PyObject *args, *result = NULL;
-    if (unlikely(!cfunc->method) && unlikely(__Pyx_TryUnpackUnboundCMethod(cfunc) < 0)) return NULL;
-#if CYTHON_COMPILING_IN_CPYTHON
-    args = PyTuple_New(1);
-    if (unlikely(!args)) goto bad;
-    Py_INCREF(self);
-    PyTuple_SET_ITEM(args, 0, self);
-#else
-    args = PyTuple_Pack(1, self);
-    if (unlikely(!args)) goto bad;
-#endif
-    result = __Pyx_PyObject_Call(cfunc->method, args, NULL);
-    Py_DECREF(args);
-bad:
-    return result;
-}
-
-static CYTHON_INLINE PyObject* __Pyx_PyDict_Keys(PyObject* d) {
-    if (PY_MAJOR_VERSION >= 3)
-        return __Pyx_CallUnboundCMethod0(&__pyx_umethod_PyDict_Type_keys, d);
-    else
-        return PyDict_Keys(d);
-}
-
-static int __Pyx_SetVtable(PyObject *dict, void *vtable) {
-#if PY_VERSION_HEX >= 0x02070000
-    PyObject *ob = PyCapsule_New(vtable, 0, 0);
-#else
-    PyObject *ob = PyCObject_FromVoidPtr(vtable, 0);
-#endif
-    if (!ob)
-        goto bad;
-    if (PyDict_SetItem(dict, __pyx_n_s_pyx_vtable, ob) < 0)
-        goto bad;
-    Py_DECREF(ob);
-    return 0;
-bad:
-    Py_XDECREF(ob);
-    return -1;
-}
-
-static void* __Pyx_GetVtable(PyObject *dict) {
-    void* ptr;
-    PyObject *ob = PyObject_GetItem(dict, __pyx_n_s_pyx_vtable);
-    if (!ob)
-        goto bad;
-#if PY_VERSION_HEX >= 0x02070000
-    ptr = PyCapsule_GetPointer(ob, 0);
-#else
-    ptr = PyCObject_AsVoidPtr(ob);
-#endif
-    if (!ptr && !PyErr_Occurred())
-        PyErr_SetString(PyExc_RuntimeError, "invalid vtable found for imported type");
-    Py_DECREF(ob);
-    return ptr;
-bad:
-    Py_XDECREF(ob);
-    return NULL;
-}
-
-static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level) {
-    PyObject *empty_list = 0;
-    PyObject *module = 0;
-    PyObject *global_dict = 0;
-    PyObject *empty_dict = 0;
-    PyObject *list;
-    #if PY_VERSION_HEX < 0x03030000
-    PyObject *py_import;
-    py_import = __Pyx_PyObject_GetAttrStr(__pyx_b, __pyx_n_s_import);
-    if (!py_import)
-        goto bad;
-    #endif
-    if (from_list)
-        list = from_list;
-    else {
-        empty_list = PyList_New(0);
-        if (!empty_list)
-            goto bad;
-        list = empty_list;
-    }
-    global_dict = PyModule_GetDict(__pyx_m);
-    if (!global_dict)
-        goto bad;
-    empty_dict = PyDict_New();
-    if (!empty_dict)
-        goto bad;
-    {
-        #if PY_MAJOR_VERSION >= 3
-        if (level == -1) {
-            if (strchr(__Pyx_MODULE_NAME, '.')) {
-                #if PY_VERSION_HEX < 0x03030000
-                PyObject *py_level = PyInt_FromLong(1);
-                if (!py_level)
-                    goto bad;
-                module = PyObject_CallFunctionObjArgs(py_import,
-                    name, global_dict, empty_dict, list, py_level, NULL);
-                Py_DECREF(py_level);
-                #else
-                module = PyImport_ImportModuleLevelObject(
-                    name, global_dict, empty_dict, list, 1);
-                #endif
-                if (!module) {
-                    if (!PyErr_ExceptionMatches(PyExc_ImportError))
-                        goto bad;
-                    PyErr_Clear();
-                }
-            }
-            level = 0;
-        }
-        #endif
-        if (!module) {
-            #if PY_VERSION_HEX < 0x03030000
-            PyObject *py_level = PyInt_FromLong(level);
-            if (!py_level)
-                goto bad;
-            module = PyObject_CallFunctionObjArgs(py_import,
-                name, global_dict, empty_dict, list, py_level, NULL);
-            Py_DECREF(py_level);
-            #else
-            module = PyImport_ImportModuleLevelObject(
-                name, global_dict, empty_dict, list, level);
-            #endif
-        }
-    }
-bad:
-    #if PY_VERSION_HEX < 0x03030000
-    Py_XDECREF(py_import);
-    #endif
-    Py_XDECREF(empty_list);
-    Py_XDECREF(empty_dict);
-    return module;
-}
-
-static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name) {
-    PyObject* value = __Pyx_PyObject_GetAttrStr(module, name);
-    if (unlikely(!value) && PyErr_ExceptionMatches(PyExc_AttributeError)) {
-        PyErr_Format(PyExc_ImportError,
-        #if PY_MAJOR_VERSION < 3
-            "cannot import name %.230s", PyString_AS_STRING(name));
-        #else
-            "cannot import name %S", name);
-        #endif
-    }
-    return value;
-}
-
-static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line) {
-    int start = 0, mid = 0, end = count - 1;
-    if (end >= 0 && code_line > entries[end].code_line) {
-        return count;
-    }
-    while (start < end) {
-        mid = start + (end - start) / 2;
-        if (code_line < entries[mid].code_line) {
-            end = mid;
-        } else if (code_line > entries[mid].code_line) {
-             start = mid + 1;
-        } else {
-            return mid;
-        }
-    }
-    if (code_line <= entries[mid].code_line) {
-        return mid;
-    } else {
-        return mid + 1;
-    }
-}
-static PyCodeObject *__pyx_find_code_object(int code_line) {
-    PyCodeObject* code_object;
-    int pos;
-    if (unlikely(!code_line) || unlikely(!__pyx_code_cache.entries)) {
-        return NULL;
-    }
-    pos = __pyx_bisect_code_objects(__pyx_code_cache.entries, __pyx_code_cache.count, code_line);
-    if (unlikely(pos >= __pyx_code_cache.count) || unlikely(__pyx_code_cache.entries[pos].code_line != code_line)) {
-        return NULL;
-    }
-    code_object = __pyx_code_cache.entries[pos].code_object;
-    Py_INCREF(code_object);
-    return code_object;
-}
-static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object) {
-    int pos, i;
-    __Pyx_CodeObjectCacheEntry* entries = __pyx_code_cache.entries;
-    if (unlikely(!code_line)) {
-        return;
-    }
-    if (unlikely(!entries)) {
-        entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Malloc(64*sizeof(__Pyx_CodeObjectCacheEntry));
-        if (likely(entries)) {
-            __pyx_code_cache.entries = entries;
-            __pyx_code_cache.max_count = 64;
-            __pyx_code_cache.count = 1;
-            entries[0].code_line = code_line;
-            entries[0].code_object = code_object;
-            Py_INCREF(code_object);
-        }
-        return;
-    }
-    pos = __pyx_bisect_code_objects(__pyx_code_cache.entries, __pyx_code_cache.count, code_line);
-    if ((pos < __pyx_code_cache.count) && unlikely(__pyx_code_cache.entries[pos].code_line == code_line)) {
-        PyCodeObject* tmp = entries[pos].code_object;
-        entries[pos].code_object = code_object;
-        Py_DECREF(tmp);
-        return;
-    }
-    if (__pyx_code_cache.count == __pyx_code_cache.max_count) {
-        int new_max = __pyx_code_cache.max_count + 64;
-        entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Realloc(
-            __pyx_code_cache.entries, (size_t)new_max*sizeof(__Pyx_CodeObjectCacheEntry));
-        if (unlikely(!entries)) {
-            return;
-        }
-        __pyx_code_cache.entries = entries;
-        __pyx_code_cache.max_count = new_max;
-    }
-    for (i=__pyx_code_cache.count; i>pos; i--) {
-        entries[i] = entries[i-1];
-    }
-    entries[pos].code_line = code_line;
-    entries[pos].code_object = code_object;
-    __pyx_code_cache.count++;
-    Py_INCREF(code_object);
-}
-
-#include "compile.h"
-#include "frameobject.h"
-#include "traceback.h"
-static PyCodeObject* __Pyx_CreateCodeObjectForTraceback(
-            const char *funcname, int c_line,
-            int py_line, const char *filename) {
-    PyCodeObject *py_code = 0;
-    PyObject *py_srcfile = 0;
-    PyObject *py_funcname = 0;
-    #if PY_MAJOR_VERSION < 3
-    py_srcfile = PyString_FromString(filename);
-    #else
-    py_srcfile = PyUnicode_FromString(filename);
-    #endif
-    if (!py_srcfile) goto bad;
-    if (c_line) {
-        #if PY_MAJOR_VERSION < 3
-        py_funcname = PyString_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
-        #else
-        py_funcname = PyUnicode_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
-        #endif
-    }
-    else {
-        #if PY_MAJOR_VERSION < 3
-        py_funcname = PyString_FromString(funcname);
-        #else
-        py_funcname = PyUnicode_FromString(funcname);
-        #endif
-    }
-    if (!py_funcname) goto bad;
-    py_code = __Pyx_PyCode_New(
-        0,
-        0,
-        0,
-        0,
-        0,
-        __pyx_empty_bytes, /*PyObject *code,*/
-        __pyx_empty_tuple, /*PyObject *consts,*/
-        __pyx_empty_tuple, /*PyObject *names,*/
-        __pyx_empty_tuple, /*PyObject *varnames,*/
-        __pyx_empty_tuple, /*PyObject *freevars,*/
-        __pyx_empty_tuple, /*PyObject *cellvars,*/
-        py_srcfile,   /*PyObject *filename,*/
-        py_funcname,  /*PyObject *name,*/
-        py_line,
-        __pyx_empty_bytes  /*PyObject *lnotab*/
-    );
-    Py_DECREF(py_srcfile);
-    Py_DECREF(py_funcname);
-    return py_code;
-bad:
-    Py_XDECREF(py_srcfile);
-    Py_XDECREF(py_funcname);
-    return NULL;
-}
-static void __Pyx_AddTraceback(const char *funcname, int c_line,
-                               int py_line, const char *filename) {
-    PyCodeObject *py_code = 0;
-    PyFrameObject *py_frame = 0;
-    py_code = __pyx_find_code_object(c_line ? c_line : py_line);
-    if (!py_code) {
-        py_code = __Pyx_CreateCodeObjectForTraceback(
-            funcname, c_line, py_line, filename);
-        if (!py_code) goto bad;
-        __pyx_insert_code_object(c_line ? c_line : py_line, py_code);
-    }
-    py_frame = PyFrame_New(
-        PyThreadState_GET(), /*PyThreadState *tstate,*/
-        py_code,             /*PyCodeObject *code,*/
-        __pyx_d,      /*PyObject *globals,*/
-        0                    /*PyObject *locals*/
-    );
-    if (!py_frame) goto bad;
-    py_frame->f_lineno = py_line;
-    PyTraceBack_Here(py_frame);
-bad:
-    Py_XDECREF(py_code);
-    Py_XDECREF(py_frame);
-}
-
-#define __PYX_VERIFY_RETURN_INT(target_type, func_type, func_value)\
-    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 0)
-#define __PYX_VERIFY_RETURN_INT_EXC(target_type, func_type, func_value)\
-    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 1)
-#define __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, exc)\
-    {\
-        func_type value = func_value;\
-        if (sizeof(target_type) < sizeof(func_type)) {\
-            if (unlikely(value != (func_type) (target_type) value)) {\
-                func_type zero = 0;\
-                if (exc && unlikely(value == (func_type)-1 && PyErr_Occurred()))\
-                    return (target_type) -1;\
-                if (is_unsigned && unlikely(value < zero))\
-                    goto raise_neg_overflow;\
-                else\
-                    goto raise_overflow;\
-            }\
-        }\
-        return (target_type) value;\
-    }
-
-static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
-    const int neg_one = (int) -1, const_zero = (int) 0;
-    const int is_unsigned = neg_one > const_zero;
-#if PY_MAJOR_VERSION < 3
-    if (likely(PyInt_Check(x))) {
-        if (sizeof(int) < sizeof(long)) {
-            __PYX_VERIFY_RETURN_INT(int, long, PyInt_AS_LONG(x))
-        } else {
-            long val = PyInt_AS_LONG(x);
-            if (is_unsigned && unlikely(val < 0)) {
-                goto raise_neg_overflow;
-            }
-            return (int) val;
-        }
-    } else
-#endif
-    if (likely(PyLong_Check(x))) {
-        if (is_unsigned) {
-#if CYTHON_USE_PYLONG_INTERNALS
-            const digit* digits = ((PyLongObject*)x)->ob_digit;
-            switch (Py_SIZE(x)) {
-                case  0: return (int) 0;
-                case  1: __PYX_VERIFY_RETURN_INT(int, digit, digits[0])
-                case 2:
-                    if (8 * sizeof(int) > 1 * PyLong_SHIFT) {
-                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(int) >= 2 * PyLong_SHIFT) {
-                            return (int) (((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
-                        }
-                    }
-                    break;
-                case 3:
-                    if (8 * sizeof(int) > 2 * PyLong_SHIFT) {
-                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(int) >= 3 * PyLong_SHIFT) {
-                            return (int) (((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
-                        }
-                    }
-                    break;
-                case 4:
-                    if (8 * sizeof(int) > 3 * PyLong_SHIFT) {
-                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(int) >= 4 * PyLong_SHIFT) {
-                            return (int) (((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
-                        }
-                    }
-                    break;
-            }
-#endif
-#if CYTHON_COMPILING_IN_CPYTHON
-            if (unlikely(Py_SIZE(x) < 0)) {
-                goto raise_neg_overflow;
-            }
-#else
-            {
-                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
-                if (unlikely(result < 0))
-                    return (int) -1;
-                if (unlikely(result == 1))
-                    goto raise_neg_overflow;
-            }
-#endif
-            if (sizeof(int) <= sizeof(unsigned long)) {
-                __PYX_VERIFY_RETURN_INT_EXC(int, unsigned long, PyLong_AsUnsignedLong(x))
-            } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
-                __PYX_VERIFY_RETURN_INT_EXC(int, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
-            }
-        } else {
-#if CYTHON_USE_PYLONG_INTERNALS
-            const digit* digits = ((PyLongObject*)x)->ob_digit;
-            switch (Py_SIZE(x)) {
-                case  0: return (int) 0;
-                case -1: __PYX_VERIFY_RETURN_INT(int, sdigit, -(sdigit) digits[0])
-                case  1: __PYX_VERIFY_RETURN_INT(int,  digit, +digits[0])
-                case -2:
-                    if (8 * sizeof(int) - 1 > 1 * PyLong_SHIFT) {
-                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
-                            return (int) (((int)-1)*(((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
-                        }
-                    }
-                    break;
-                case 2:
-                    if (8 * sizeof(int) > 1 * PyLong_SHIFT) {
-                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
-                            return (int) ((((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
-                        }
-                    }
-                    break;
-                case -3:
-                    if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
-                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
-                            return (int) (((int)-1)*(((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
-                        }
-                    }
-                    break;
-                case 3:
-                    if (8 * sizeof(int) > 2 * PyLong_SHIFT) {
-                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
-                            return (int) ((((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
-                        }
-                    }
-                    break;
-                case -4:
-                    if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
-                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(int) - 1 > 4 * PyLong_SHIFT) {
-                            return (int) (((int)-1)*(((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
-                        }
-                    }
-                    break;
-                case 4:
-                    if (8 * sizeof(int) > 3 * PyLong_SHIFT) {
-                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(int) - 1 > 4 * PyLong_SHIFT) {
-                            return (int) ((((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
-                        }
-                    }
-                    break;
-            }
-#endif
-            if (sizeof(int) <= sizeof(long)) {
-                __PYX_VERIFY_RETURN_INT_EXC(int, long, PyLong_AsLong(x))
-            } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
-                __PYX_VERIFY_RETURN_INT_EXC(int, PY_LONG_LONG, PyLong_AsLongLong(x))
-            }
-        }
-        {
-#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
-            PyErr_SetString(PyExc_RuntimeError,
-                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
-#else
-            int val;
-            PyObject *v = __Pyx_PyNumber_Int(x);
- #if PY_MAJOR_VERSION < 3
-            if (likely(v) && !PyLong_Check(v)) {
-                PyObject *tmp = v;
-                v = PyNumber_Long(tmp);
-                Py_DECREF(tmp);
-            }
- #endif
-            if (likely(v)) {
-                int one = 1; int is_little = (int)*(unsigned char *)&one;
-                unsigned char *bytes = (unsigned char *)&val;
-                int ret = _PyLong_AsByteArray((PyLongObject *)v,
-                                              bytes, sizeof(val),
-                                              is_little, !is_unsigned);
-                Py_DECREF(v);
-                if (likely(!ret))
-                    return val;
-            }
-#endif
-            return (int) -1;
-        }
-    } else {
-        int val;
-        PyObject *tmp = __Pyx_PyNumber_Int(x);
-        if (!tmp) return (int) -1;
-        val = __Pyx_PyInt_As_int(tmp);
-        Py_DECREF(tmp);
-        return val;
-    }
-raise_overflow:
-    PyErr_SetString(PyExc_OverflowError,
-        "value too large to convert to int");
-    return (int) -1;
-raise_neg_overflow:
-    PyErr_SetString(PyExc_OverflowError,
-        "can't convert negative value to int");
-    return (int) -1;
-}
-
-static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
-    const long neg_one = (long) -1, const_zero = (long) 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (is_unsigned) {
-        if (sizeof(long) < sizeof(long)) {
-            return PyInt_FromLong((long) value);
-        } else if (sizeof(long) <= sizeof(unsigned long)) {
-            return PyLong_FromUnsignedLong((unsigned long) value);
-        } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
-            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
-        }
-    } else {
-        if (sizeof(long) <= sizeof(long)) {
-            return PyInt_FromLong((long) value);
-        } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
-            return PyLong_FromLongLong((PY_LONG_LONG) value);
-        }
-    }
-    {
-        int one = 1; int little = (int)*(unsigned char *)&one;
-        unsigned char *bytes = (unsigned char *)&value;
-        return _PyLong_FromByteArray(bytes, sizeof(long),
-                                     little, !is_unsigned);
-    }
-}
-
-static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
-    const long neg_one = (long) -1, const_zero = (long) 0;
-    const int is_unsigned = neg_one > const_zero;
-#if PY_MAJOR_VERSION < 3
-    if (likely(PyInt_Check(x))) {
-        if (sizeof(long) < sizeof(long)) {
-            __PYX_VERIFY_RETURN_INT(long, long, PyInt_AS_LONG(x))
-        } else {
-            long val = PyInt_AS_LONG(x);
-            if (is_unsigned && unlikely(val < 0)) {
-                goto raise_neg_overflow;
-            }
-            return (long) val;
-        }
-    } else
-#endif
-    if (likely(PyLong_Check(x))) {
-        if (is_unsigned) {
-#if CYTHON_USE_PYLONG_INTERNALS
-            const digit* digits = ((PyLongObject*)x)->ob_digit;
-            switch (Py_SIZE(x)) {
-                case  0: return (long) 0;
-                case  1: __PYX_VERIFY_RETURN_INT(long, digit, digits[0])
-                case 2:
-                    if (8 * sizeof(long) > 1 * PyLong_SHIFT) {
-                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(long) >= 2 * PyLong_SHIFT) {
-                            return (long) (((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
-                        }
-                    }
-                    break;
-                case 3:
-                    if (8 * sizeof(long) > 2 * PyLong_SHIFT) {
-                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(long) >= 3 * PyLong_SHIFT) {
-                            return (long) (((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
-                        }
-                    }
-                    break;
-                case 4:
-                    if (8 * sizeof(long) > 3 * PyLong_SHIFT) {
-                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(long) >= 4 * PyLong_SHIFT) {
-                            return (long) (((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
-                        }
-                    }
-                    break;
-            }
-#endif
-#if CYTHON_COMPILING_IN_CPYTHON
-            if (unlikely(Py_SIZE(x) < 0)) {
-                goto raise_neg_overflow;
-            }
-#else
-            {
-                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
-                if (unlikely(result < 0))
-                    return (long) -1;
-                if (unlikely(result == 1))
-                    goto raise_neg_overflow;
-            }
-#endif
-            if (sizeof(long) <= sizeof(unsigned long)) {
-                __PYX_VERIFY_RETURN_INT_EXC(long, unsigned long, PyLong_AsUnsignedLong(x))
-            } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
-                __PYX_VERIFY_RETURN_INT_EXC(long, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
-            }
-        } else {
-#if CYTHON_USE_PYLONG_INTERNALS
-            const digit* digits = ((PyLongObject*)x)->ob_digit;
-            switch (Py_SIZE(x)) {
-                case  0: return (long) 0;
-                case -1: __PYX_VERIFY_RETURN_INT(long, sdigit, -(sdigit) digits[0])
-                case  1: __PYX_VERIFY_RETURN_INT(long,  digit, +digits[0])
-                case -2:
-                    if (8 * sizeof(long) - 1 > 1 * PyLong_SHIFT) {
-                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
-                            return (long) (((long)-1)*(((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
-                        }
-                    }
-                    break;
-                case 2:
-                    if (8 * sizeof(long) > 1 * PyLong_SHIFT) {
-                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
-                            return (long) ((((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
-                        }
-                    }
-                    break;
-                case -3:
-                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
-                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
-                            return (long) (((long)-1)*(((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
-                        }
-                    }
-                    break;
-                case 3:
-                    if (8 * sizeof(long) > 2 * PyLong_SHIFT) {
-                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
-                            return (long) ((((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
-                        }
-                    }
-                    break;
-                case -4:
-                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
-                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
-                            return (long) (((long)-1)*(((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
-                        }
-                    }
-                    break;
-                case 4:
-                    if (8 * sizeof(long) > 3 * PyLong_SHIFT) {
-                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
-                            return (long) ((((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
-                        }
-                    }
-                    break;
-            }
-#endif
-            if (sizeof(long) <= sizeof(long)) {
-                __PYX_VERIFY_RETURN_INT_EXC(long, long, PyLong_AsLong(x))
-            } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
-                __PYX_VERIFY_RETURN_INT_EXC(long, PY_LONG_LONG, PyLong_AsLongLong(x))
-            }
-        }
-        {
-#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
-            PyErr_SetString(PyExc_RuntimeError,
-                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
-#else
-            long val;
-            PyObject *v = __Pyx_PyNumber_Int(x);
- #if PY_MAJOR_VERSION < 3
-            if (likely(v) && !PyLong_Check(v)) {
-                PyObject *tmp = v;
-                v = PyNumber_Long(tmp);
-                Py_DECREF(tmp);
-            }
- #endif
-            if (likely(v)) {
-                int one = 1; int is_little = (int)*(unsigned char *)&one;
-                unsigned char *bytes = (unsigned char *)&val;
-                int ret = _PyLong_AsByteArray((PyLongObject *)v,
-                                              bytes, sizeof(val),
-                                              is_little, !is_unsigned);
-                Py_DECREF(v);
-                if (likely(!ret))
-                    return val;
-            }
-#endif
-            return (long) -1;
-        }
-    } else {
-        long val;
-        PyObject *tmp = __Pyx_PyNumber_Int(x);
-        if (!tmp) return (long) -1;
-        val = __Pyx_PyInt_As_long(tmp);
-        Py_DECREF(tmp);
-        return val;
-    }
-raise_overflow:
-    PyErr_SetString(PyExc_OverflowError,
-        "value too large to convert to long");
-    return (long) -1;
-raise_neg_overflow:
-    PyErr_SetString(PyExc_OverflowError,
-        "can't convert negative value to long");
-    return (long) -1;
-}
-
-static int __Pyx_check_binary_version(void) {
-    char ctversion[4], rtversion[4];
-    PyOS_snprintf(ctversion, 4, "%d.%d", PY_MAJOR_VERSION, PY_MINOR_VERSION);
-    PyOS_snprintf(rtversion, 4, "%s", Py_GetVersion());
-    if (ctversion[0] != rtversion[0] || ctversion[2] != rtversion[2]) {
-        char message[200];
-        PyOS_snprintf(message, sizeof(message),
-                      "compiletime version %s of module '%.100s' "
-                      "does not match runtime version %s",
-                      ctversion, __Pyx_MODULE_NAME, rtversion);
-        return PyErr_WarnEx(NULL, message, 1);
-    }
-    return 0;
-}
-
-#ifndef __PYX_HAVE_RT_ImportModule
-#define __PYX_HAVE_RT_ImportModule
-static PyObject *__Pyx_ImportModule(const char *name) {
-    PyObject *py_name = 0;
-    PyObject *py_module = 0;
-    py_name = __Pyx_PyIdentifier_FromString(name);
-    if (!py_name)
-        goto bad;
-    py_module = PyImport_Import(py_name);
-    Py_DECREF(py_name);
-    return py_module;
-bad:
-    Py_XDECREF(py_name);
-    return 0;
-}
-#endif
-
-#ifndef __PYX_HAVE_RT_ImportType
-#define __PYX_HAVE_RT_ImportType
-static PyTypeObject *__Pyx_ImportType(const char *module_name, const char *class_name,
-    size_t size, int strict)
-{
-    PyObject *py_module = 0;
-    PyObject *result = 0;
-    PyObject *py_name = 0;
-    char warning[200];
-    Py_ssize_t basicsize;
-#ifdef Py_LIMITED_API
-    PyObject *py_basicsize;
-#endif
-    py_module = __Pyx_ImportModule(module_name);
-    if (!py_module)
-        goto bad;
-    py_name = __Pyx_PyIdentifier_FromString(class_name);
-    if (!py_name)
-        goto bad;
-    result = PyObject_GetAttr(py_module, py_name);
-    Py_DECREF(py_name);
-    py_name = 0;
-    Py_DECREF(py_module);
-    py_module = 0;
-    if (!result)
-        goto bad;
-    if (!PyType_Check(result)) {
-        PyErr_Format(PyExc_TypeError,
-            "%.200s.%.200s is not a type object",
-            module_name, class_name);
-        goto bad;
-    }
-#ifndef Py_LIMITED_API
-    basicsize = ((PyTypeObject *)result)->tp_basicsize;
-#else
-    py_basicsize = PyObject_GetAttrString(result, "__basicsize__");
-    if (!py_basicsize)
-        goto bad;
-    basicsize = PyLong_AsSsize_t(py_basicsize);
-    Py_DECREF(py_basicsize);
-    py_basicsize = 0;
-    if (basicsize == (Py_ssize_t)-1 && PyErr_Occurred())
-        goto bad;
-#endif
-    if (!strict && (size_t)basicsize > size) {
-        PyOS_snprintf(warning, sizeof(warning),
-            "%s.%s size changed, may indicate binary incompatibility",
-            module_name, class_name);
-        if (PyErr_WarnEx(NULL, warning, 0) < 0) goto bad;
-    }
-    else if ((size_t)basicsize != size) {
-        PyErr_Format(PyExc_ValueError,
-            "%.200s.%.200s has the wrong size, try recompiling",
-            module_name, class_name);
-        goto bad;
-    }
-    return (PyTypeObject *)result;
-bad:
-    Py_XDECREF(py_module);
-    Py_XDECREF(result);
-    return NULL;
-}
-#endif
-
-static int __Pyx_InitStrings(__Pyx_StringTabEntry *t) {
-    while (t->p) {
-        #if PY_MAJOR_VERSION < 3
-        if (t->is_unicode) {
-            *t->p = PyUnicode_DecodeUTF8(t->s, t->n - 1, NULL);
-        } else if (t->intern) {
-            *t->p = PyString_InternFromString(t->s);
-        } else {
-            *t->p = PyString_FromStringAndSize(t->s, t->n - 1);
-        }
-        #else
-        if (t->is_unicode | t->is_str) {
-            if (t->intern) {
-                *t->p = PyUnicode_InternFromString(t->s);
-            } else if (t->encoding) {
-                *t->p = PyUnicode_Decode(t->s, t->n - 1, t->encoding, NULL);
-            } else {
-                *t->p = PyUnicode_FromStringAndSize(t->s, t->n - 1);
-            }
-        } else {
-            *t->p = PyBytes_FromStringAndSize(t->s, t->n - 1);
-        }
-        #endif
-        if (!*t->p)
-            return -1;
-        ++t;
-    }
-    return 0;
-}
-
-static CYTHON_INLINE PyObject* __Pyx_PyUnicode_FromString(const char* c_str) {
-    return __Pyx_PyUnicode_FromStringAndSize(c_str, (Py_ssize_t)strlen(c_str));
-}
-static CYTHON_INLINE char* __Pyx_PyObject_AsString(PyObject* o) {
-    Py_ssize_t ignore;
-    return __Pyx_PyObject_AsStringAndSize(o, &ignore);
-}
-static CYTHON_INLINE char* __Pyx_PyObject_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
-#if CYTHON_COMPILING_IN_CPYTHON && (__PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT)
-    if (
-#if PY_MAJOR_VERSION < 3 && __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
-            __Pyx_sys_getdefaultencoding_not_ascii &&
-#endif
-            PyUnicode_Check(o)) {
-#if PY_VERSION_HEX < 0x03030000
-        char* defenc_c;
-        PyObject* defenc = _PyUnicode_AsDefaultEncodedString(o, NULL);
-        if (!defenc) return NULL;
-        defenc_c = PyBytes_AS_STRING(defenc);
-#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
-        {
-            char* end = defenc_c + PyBytes_GET_SIZE(defenc);
-            char* c;
-            for (c = defenc_c; c < end; c++) {
-                if ((unsigned char) (*c) >= 128) {
-                    PyUnicode_AsASCIIString(o);
-                    return NULL;
-                }
-            }
-        }
-#endif
-        *length = PyBytes_GET_SIZE(defenc);
-        return defenc_c;
-#else
-        if (__Pyx_PyUnicode_READY(o) == -1) return NULL;
-#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
-        if (PyUnicode_IS_ASCII(o)) {
-            *length = PyUnicode_GET_LENGTH(o);
-            return PyUnicode_AsUTF8(o);
-        } else {
-            PyUnicode_AsASCIIString(o);
-            return NULL;
-        }
-#else
-        return PyUnicode_AsUTF8AndSize(o, length);
-#endif
-#endif
-    } else
-#endif
-#if (!CYTHON_COMPILING_IN_PYPY) || (defined(PyByteArray_AS_STRING) && defined(PyByteArray_GET_SIZE))
-    if (PyByteArray_Check(o)) {
-        *length = PyByteArray_GET_SIZE(o);
-        return PyByteArray_AS_STRING(o);
-    } else
-#endif
-    {
-        char* result;
-        int r = PyBytes_AsStringAndSize(o, &result, length);
-        if (unlikely(r < 0)) {
-            return NULL;
-        } else {
-            return result;
-        }
-    }
-}
-static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject* x) {
-   int is_true = x == Py_True;
-   if (is_true | (x == Py_False) | (x == Py_None)) return is_true;
-   else return PyObject_IsTrue(x);
-}
-static CYTHON_INLINE PyObject* __Pyx_PyNumber_Int(PyObject* x) {
-  PyNumberMethods *m;
-  const char *name = NULL;
-  PyObject *res = NULL;
-#if PY_MAJOR_VERSION < 3
-  if (PyInt_Check(x) || PyLong_Check(x))
-#else
-  if (PyLong_Check(x))
-#endif
-    return __Pyx_NewRef(x);
-  m = Py_TYPE(x)->tp_as_number;
-#if PY_MAJOR_VERSION < 3
-  if (m && m->nb_int) {
-    name = "int";
-    res = PyNumber_Int(x);
-  }
-  else if (m && m->nb_long) {
-    name = "long";
-    res = PyNumber_Long(x);
-  }
-#else
-  if (m && m->nb_int) {
-    name = "int";
-    res = PyNumber_Long(x);
-  }
-#endif
-  if (res) {
-#if PY_MAJOR_VERSION < 3
-    if (!PyInt_Check(res) && !PyLong_Check(res)) {
-#else
-    if (!PyLong_Check(res)) {
-#endif
-      PyErr_Format(PyExc_TypeError,
-                   "__%.4s__ returned non-%.4s (type %.200s)",
-                   name, name, Py_TYPE(res)->tp_name);
-      Py_DECREF(res);
-      return NULL;
-    }
-  }
-  else if (!PyErr_Occurred()) {
-    PyErr_SetString(PyExc_TypeError,
-                    "an integer is required");
-  }
-  return res;
-}
-static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject* b) {
-  Py_ssize_t ival;
-  PyObject *x;
-#if PY_MAJOR_VERSION < 3
-  if (likely(PyInt_CheckExact(b))) {
-    if (sizeof(Py_ssize_t) >= sizeof(long))
-        return PyInt_AS_LONG(b);
-    else
-        return PyInt_AsSsize_t(x);
-  }
-#endif
-  if (likely(PyLong_CheckExact(b))) {
-    #if CYTHON_USE_PYLONG_INTERNALS
-    const digit* digits = ((PyLongObject*)b)->ob_digit;
-    const Py_ssize_t size = Py_SIZE(b);
-    if (likely(__Pyx_sst_abs(size) <= 1)) {
-        ival = likely(size) ? digits[0] : 0;
-        if (size == -1) ival = -ival;
-        return ival;
-    } else {
-      switch (size) {
-         case 2:
-           if (8 * sizeof(Py_ssize_t) > 2 * PyLong_SHIFT) {
-             return (Py_ssize_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
-           }
-           break;
-         case -2:
-           if (8 * sizeof(Py_ssize_t) > 2 * PyLong_SHIFT) {
-             return -(Py_ssize_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
-           }
-           break;
-         case 3:
-           if (8 * sizeof(Py_ssize_t) > 3 * PyLong_SHIFT) {
-             return (Py_ssize_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
-           }
-           break;
-         case -3:
-           if (8 * sizeof(Py_ssize_t) > 3 * PyLong_SHIFT) {
-             return -(Py_ssize_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
-           }
-           break;
-         case 4:
-           if (8 * sizeof(Py_ssize_t) > 4 * PyLong_SHIFT) {
-             return (Py_ssize_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
-           }
-           break;
-         case -4:
-           if (8 * sizeof(Py_ssize_t) > 4 * PyLong_SHIFT) {
-             return -(Py_ssize_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
-           }
-           break;
-      }
-    }
-    #endif
-    return PyLong_AsSsize_t(b);
-  }
-  x = PyNumber_Index(b);
-  if (!x) return -1;
-  ival = PyInt_AsSsize_t(x);
-  Py_DECREF(x);
-  return ival;
-}
-static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t ival) {
-    return PyInt_FromSize_t(ival);
-}
-
-
-#endif /* Py_PYTHON_H */
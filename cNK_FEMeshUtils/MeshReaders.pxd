@@ -1,6 +1,6 @@
 from Mesh cimport Mesh
 cdef class MeshReaders:
-    cpdef Mesh readDynaMesh(self, str file)
-    cpdef Mesh readRadiossMesh(self, str file)
-    cpdef writeDynaMesh(self, Mesh _Mesh, str file)
-    cpdef writeRadiossMesh(self, Mesh _Mesh, str file)
+    cpdef Mesh readDynaMesh(self, str file, bint columnar=*, str engine=*, bint mapped=*, int workers=*, bint cache=*, object parts=*, bint includes=*)
+    cpdef Mesh readRadiossMesh(self, str file, bint columnar=*, int workers=*, bint cache=*, object parts=*, str engine=*, bint mapped=*)
+    cpdef writeDynaMesh(self, Mesh _Mesh, str file, str engine=*, bint delta=*)
+    cpdef writeRadiossMesh(self, Mesh _Mesh, str file, bint delta=*)
@@ -0,0 +1,36 @@
+from ColumnTable import ColumnTable as ColumnTable
+import numpy as np
+class NodeTable(ColumnTable):
+
+    # Columnar node storage, stands in for the Nodelist dictionary
+    # {NodeID: [x, y, z]}.
+
+    def __init__(self, NodeIDs=None, Coords=None):
+        ColumnTable.__init__(self, [("Coords", np.float64, 3)])
+        if NodeIDs is not None:
+            self.extend(NodeIDs, Coords)
+
+    def append(self, NodeID, x, y, z):
+        row=self.newRow(NodeID)
+        self.Coords[row]=(x, y, z)
+
+    def extend(self, NodeIDs, Coords):
+        rows=self.newRows(NodeIDs)
+        self.Coords[rows]=Coords
+
+    def setCoords(self, NodeIDs, Coords):
+        # Overwrites the coordinates of existing nodes in place
+        rows=self.getRows(NodeIDs)
+        if (rows<0).any():
+            self.extend(NodeIDs, Coords)
+        else:
+            self.Coords[rows]=Coords
+
+    def getCoords(self):
+        return self.getColumn("Coords")
+
+    def getValue(self, row):
+        return self.Coords[row].tolist()
+
+    def __setitem__(self, NodeID, coord):
+        self.append(NodeID, coord[0], coord[1], coord[2])
@@ -17,8 +17,8 @@ cdef class Part:
     cpdef bint isNonUniformThickness(self)
     # cpdef list of Element getElemObj(self)
     cpdef int getNumElem(self)
-    cpdef list getElemlist(self)
-    cpdef list getNodelist(self)
+    cpdef dict getElemlist(self)
+    cpdef dict getNodelist(self)
     cpdef double getPartArea(self)
     cpdef double getPartVolume(self)
     cpdef double getPartMass(self)
@@ -1,4 +1,6 @@
-class Part:
+class Part(object):
+    __slots__ = ('nonUniformThickness', 'PartID', 'Mat', 'Prop', 'title', 'ElemObj', 'Elemlist', 'Nodelist')
+
     def __init__(self, PartID, title, Mat, Prop):
         self.nonUniformThickness=False
         self.PartID=PartID
@@ -35,12 +37,14 @@ class Part:
         return Area
 
     def getPartVolume(self):
+        # Element thicknesses are resolved by the Mesh (elemental, nodal,
+        # property) like for PartView, elements without one use the property
         Volume=0.0
-        if self.isNonUniformThickness():
-            for elem in self.ElemObj:
+        for elem in self.ElemObj:
+            if elem.thickness>0.0:
                 Volume=Volume+elem.getVolume()
-        else:
-            Volume = self.Prop.thickness*self.getPartArea()
+            else:
+                Volume=Volume+elem.getArea()*self.Prop.thickness
         return Volume
 
     def getPartMass(self):
@@ -0,0 +1,71 @@
+from Material import Material as Material
+from Property import Property as Property
+import numpy as np
+class PartView(object):
+
+    # Lightweight stand in for Part, returned by Mesh.getPartByID for parts
+    # whose objects have not been initialized. Part quantities are computed
+    # from the element rows of the part in the mesh arrays. Element and Node
+    # objects are only created when a caller asks for them.
+    __slots__ = ('Mesh', 'PartID', 'title', 'Mat', 'Prop', 'nonUniformThickness')
+
+    def __init__(self, Mesh, PartID):
+        title, propid, thickness, matid, rho, e = Mesh.getPartData(PartID)
+        self.Mesh=Mesh
+        self.PartID=PartID
+        self.title=title
+        self.Mat=Material(matid, rho, e)
+        self.Prop=Property(propid, thickness)
+        self.nonUniformThickness=PartID in Mesh.NUTProps
+
+    def getRows(self):
+        return self.Mesh.getElemTable().getPartRows(self.PartID)
+
+    def getNumElem(self):
+        return len(self.getRows())
+
+    def getElemIDs(self):
+        return self.Mesh.getElemTable().getIDs()[self.getRows()]
+
+    def getNodeIDs(self):
+        return np.unique(self.Mesh.getElemTable().getConn()[self.getRows()])
+
+    def getNodelist(self):
+        Nodelist={}
+        for NodeID in self.getNodeIDs().tolist():
+            Nodelist[NodeID]=self.Mesh.getNodeObj(NodeID)
+        return Nodelist
+
+    def getPart(self):
+        # The full Part object, initialized on first use
+        if self.PartID in self.Mesh.PartObjList:
+            return self.Mesh.PartObjList[self.PartID]
+        return self.Mesh.InitPartObj(self.PartID)
+
+    def getElemObj(self):
+        return self.getPart().getElemObj()
+
+    def getElemlist(self):
+        return self.getPart().getElemlist()
+
+    def getPartArea(self):
+        return float(self.Mesh.getElemAreas(self.getRows()).sum())
+
+    def getPartVolume(self):
+        rows=self.getRows()
+        return float((self.Mesh.getElemAreas(rows)*self.Mesh.getElemThicknesses(rows)).sum())
+
+    def getPartMass(self):
+        return self.Mat.Rho*self.getPartVolume()
+
+    def getPartID(self):
+        return self.PartID
+
+    def getPartname(self):
+        return self.title
+
+    def setNonUniformThickness(self, nonUniformThickness):
+        self.nonUniformThickness=nonUniformThickness
+
+    def isNonUniformThickness(self):
+        return self.nonUniformThickness
@@ -1,4 +1,6 @@
-class Property:
+class Property(object):
+    __slots__ = ('PropID', 'thickness')
+
     def __init__(self, PropID, thickness):
         self.PropID=PropID
         self.thickness=thickness
@@ -0,0 +1,29 @@
+from KeywordIndex import KeywordIndex as KeywordIndex
+from BatchCollector import BatchCollector as BatchCollector
+import FixedWidth as FixedWidth
+import ParallelReader as ParallelReader
+
+# Streaming reading of LS-Dyna and Radioss decks.
+# The deck is gone through in file order without building a Mesh: the
+# section parsers add to a BatchCollector and its typed batches are yielded
+# after every small block and every piece (FixedWidth.STREAMBYTES) of the
+# node and shell blocks, so the memory used does not grow with the deck.
+
+def iterMesh(file, Meshformat):
+    keychar, commentchar, large = ParallelReader.Formats[Meshformat]
+    collector=BatchCollector(Meshformat)
+    index=KeywordIndex(file, keychar, commentchar)
+    data=index.map()
+    index.build(data)
+    for i, keyword in enumerate(index.getKeywords()):
+        block=ParallelReader.blockType(Meshformat, keyword)
+        start, end = index.getRange(i)
+        if block is None:
+            ParallelReader.parseLines(collector, index, data, index.getLine(i), start, end)
+            for batch in collector.getBatches():
+                yield batch
+            continue
+        for starts, ends in FixedWidth.iterDataLines(data, start, end, commentchar, large[block], None, False):
+            ParallelReader.parseDataLines(collector, index, data, index.getLine(i), starts, ends)
+            for batch in collector.getBatches():
+                yield batch
@@ -0,0 +1,76 @@
+from Adjacency import Adjacency as Adjacency
+import numpy as np
+
+# Vectorized topology kernels building Adjacency (CSR) tables from the
+# element connectivity. Connectivity always has four columns, trias repeat
+# their third node: their edge (n3, n3) is dropped as degenerate and
+# (n3, n1) closes the triangle, so quads and trias need no special cases.
+
+EDGES=np.array([[0, 1], [1, 2], [2, 3], [3, 0]])
+
+def fromPairs(keys, values, Keys=None):
+    # Adjacency of (key, value) pairs without duplicates. Keys (sorted,
+    # containing all keys) adds keys without neighbours.
+    keys=np.asarray(keys, dtype=np.int64)
+    values=np.asarray(values, dtype=np.int64)
+    order=np.lexsort((values, keys))
+    keys=keys[order]
+    values=values[order]
+    keep=np.ones(len(keys), dtype=bool)
+    keep[1:]=(np.diff(keys)!=0)|(np.diff(values)!=0)
+    keys=keys[keep]
+    values=values[keep]
+    if Keys is None:
+        Keys=np.unique(keys)
+    Offsets=np.append(np.searchsorted(keys, Keys), len(keys)).astype(np.int64)
+    return Adjacency(Keys, Offsets, values)
+
+def edges(ElemIDs, Conn):
+    # (ElemID, lower NodeID, higher NodeID) of all non degenerate element edges
+    first=Conn[:, EDGES[:, 0]]
+    second=Conn[:, EDGES[:, 1]]
+    valid=first!=second
+    ElemIDs=np.repeat(ElemIDs, 4).reshape(-1, 4)
+    return ElemIDs[valid], np.minimum(first, second)[valid], np.maximum(first, second)[valid]
+
+def nodeElems(ElemIDs, Conn):
+    # Node ID -> IDs of the elements using the node
+    return fromPairs(Conn.ravel(), np.repeat(ElemIDs, 4))
+
+def elemNeighbours(ElemIDs, Conn):
+    # Element ID -> IDs of the elements sharing an edge with it. Every
+    # element is a key, elements without neighbours have an empty row.
+    elems, lower, higher = edges(ElemIDs, Conn)
+    order=np.lexsort((elems, higher, lower))
+    elems=elems[order]
+    lower=lower[order]
+    higher=higher[order]
+    # Elements of an edge are consecutive, pair every element with the
+    # following ones of the same edge (two for manifold edges)
+    keys=[]
+    values=[]
+    d=1
+    while d<len(elems):
+        same=np.flatnonzero((lower[d:]==lower[:-d])&(higher[d:]==higher[:-d]))
+        if len(same)==0:
+            break
+        keys.extend([elems[same], elems[same+d]])
+        values.extend([elems[same+d], elems[same]])
+        d=d+1
+    if len(keys)==0:
+        return fromPairs([], [], np.unique(ElemIDs))
+    keys=np.concatenate(keys)
+    values=np.concatenate(values)
+    other=keys!=values
+    return fromPairs(keys[other], values[other], np.unique(ElemIDs))
+
+def nodeNeighbours(ElemIDs, Conn):
+    # Node ID -> IDs of the nodes connected to it by an element edge
+    elems, lower, higher = edges(ElemIDs, Conn)
+    return fromPairs(np.concatenate((lower, higher)), np.concatenate((higher, lower)), np.unique(Conn))
+
+Builders={
+    "NodeElems": nodeElems,
+    "ElemNeighbours": elemNeighbours,
+    "NodeNeighbours": nodeNeighbours,
+}
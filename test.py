@@ -12,7 +12,8 @@ Mesh.InitAllObj()
 print "InitAllObj Done: {0}".format(time.time() - start_time)
 start_time = time.time()
 
-for PartID,PartObj in Mesh.getPartlistObj().iteritems():
-    print "PartId: {0}, Mass: {1}".format(PartID,PartObj.getPartMass())
-    
+MassProps = Mesh.getMassProperties()
+for PartID,Mass in zip(MassProps['PartID'],MassProps['PartMass']):
+    print "PartId: {0}, Mass: {1}".format(PartID,Mass)
+
 print "PrintMasses Done: {0}".format(time.time() - start_time)
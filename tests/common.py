@@ -0,0 +1,99 @@
+import importlib
+import os
+import shutil
+import tempfile
+import unittest
+import numpy as np
+from benchmarks import synthetic
+
+# Shared fixtures of the tests: small synthetic decks in a temporary
+# directory and a comparison of mesh contents which does not depend on the
+# storage (dictionaries or columnar tables) or the reading order.
+# NK_PACKAGE=cNK_FEMeshUtils runs the tests against the compiled package.
+
+Package=importlib.import_module(os.environ.get("NK_PACKAGE", "NK_FEMeshUtils"))
+
+def module(name):
+    # Module of the package under test, e.g. module("Reducers")
+    return importlib.import_module(Package.__name__+"."+name)
+
+def meshContent(_Mesh):
+    # Nodes, elements, thicknesses and cards as sorted arrays and dictionaries
+    Nodes=_Mesh.getNodeTable()
+    Elems=_Mesh.getElemTable()
+    NodeOrder=np.argsort(Nodes.getIDs())
+    ElemOrder=np.argsort(Elems.getIDs())
+    return {'NodeIDs': Nodes.getIDs()[NodeOrder], 'Coords': Nodes.getCoords()[NodeOrder],
+            'ElemIDs': Elems.getIDs()[ElemOrder], 'PartIDs': Elems.getPartIDs()[ElemOrder],
+            'Conn': Elems.getConn()[ElemOrder],
+            'Nodalthickness': dict(_Mesh.Nodalthickness), 'Elementalthickness': dict(_Mesh.Elementalthickness),
+            'Partlist': dict(_Mesh.Partlist), 'Matlist': dict(_Mesh.Matlist), 'Proplist': dict(_Mesh.Proplist)}
+
+class DeckTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.directory=tempfile.mkdtemp()
+        self.Reader=Package.MeshReaders()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def path(self, name):
+        return os.path.join(self.directory, name)
+
+    def writeFile(self, name, text):
+        with open(self.path(name), "wb") as f:
+            f.write(text)
+        return self.path(name)
+
+    def readFile(self, file):
+        with open(file, "rb") as f:
+            return f.read()
+
+    def disableMap(self):
+        # Memory mapping fails until the end of the test (mapped=False reads)
+        KeywordIndex=module("KeywordIndex").KeywordIndex
+        original=KeywordIndex.map
+        def map(index):
+            raise AssertionError("memory mapped "+index.file)
+        KeywordIndex.map=map
+        self.addCleanup(setattr, KeywordIndex, "map", original)
+
+    def dynaDeck(self, name="deck.k", nparts=3, nx=6, ny=4, triaevery=5, trbparts=(2,)):
+        synthetic.writeDynaDeck(self.path(name), nparts, nx, ny, triaevery, trbparts)
+        return self.path(name)
+
+    def radiossDeck(self, name="deck.rad", nparts=3, nx=6, ny=4, triaevery=5, thickparts=(2,)):
+        synthetic.writeRadiossDeck(self.path(name), nparts, nx, ny, triaevery, thickparts)
+        return self.path(name)
+
+    def assertSameMesh(self, a, b):
+        a=meshContent(a)
+        b=meshContent(b)
+        for key in ('NodeIDs', 'Coords', 'ElemIDs', 'PartIDs', 'Conn'):
+            self.assertEqual(a[key].shape, b[key].shape, key)
+            self.assertTrue(np.array_equal(a[key], b[key]), key)
+        for key in ('Nodalthickness', 'Elementalthickness', 'Partlist', 'Matlist', 'Proplist'):
+            self.assertEqual(a[key], b[key], key)
+
+    def assertSameMassProperties(self, a, b):
+        a=a.getMassProperties()
+        b=b.getMassProperties()
+        self.assertTrue(np.array_equal(a['PartID'], b['PartID']))
+        for key in ('PartArea', 'PartVolume', 'PartMass'):
+            self.assertTrue(np.allclose(a[key], b[key], rtol=1e-12, atol=0.0), key)
+
+    def assertParts(self, full, _Mesh, parts):
+        # _Mesh holds the shells of parts and their nodes, like full
+        full=meshContent(full)
+        partial=meshContent(_Mesh)
+        rows=np.in1d(full['PartIDs'], parts)
+        NodeIDs=np.unique(full['Conn'][rows])
+        self.assertTrue(np.array_equal(partial['ElemIDs'], full['ElemIDs'][rows]))
+        self.assertTrue(np.array_equal(partial['Conn'], full['Conn'][rows]))
+        self.assertTrue(np.array_equal(partial['NodeIDs'], NodeIDs))
+        self.assertTrue(np.array_equal(partial['Coords'], full['Coords'][np.in1d(full['NodeIDs'], NodeIDs)]))
+        self.assertEqual(sorted(partial['Partlist'].keys()), sorted(parts))
+        self.assertEqual(partial['Nodalthickness'], dict((NodeID, value) for NodeID, value in full['Nodalthickness'].items() if NodeID in NodeIDs))
+        ElemIDs=set(full['ElemIDs'][rows].tolist())
+        self.assertEqual(partial['Elementalthickness'], dict((ElemID, value) for ElemID, value in full['Elementalthickness'].items() if ElemID in ElemIDs))
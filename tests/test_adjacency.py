@@ -0,0 +1,66 @@
+import numpy as np
+from tests.common import DeckTestCase
+
+class AdjacencyTest(DeckTestCase):
+
+    def bruteForce(self, _Mesh, parts=None):
+        # Node -> elements, element -> edge neighbours and node -> edge
+        # neighbours from the element connectivity, one element at a time
+        Elems=_Mesh.getElemTable()
+        NodeElems={}
+        ElemEdges={}
+        NodeNeighbours={}
+        for ElemID, PartID, Conn in zip(Elems.getIDs().tolist(), Elems.getPartIDs().tolist(), Elems.getConn().tolist()):
+            if parts is not None and not PartID in parts:
+                continue
+            edges=set()
+            for k in xrange(4):
+                a, b = Conn[k], Conn[(k+1)%4]
+                if a!=b:
+                    edges.add((min(a, b), max(a, b)))
+                    NodeNeighbours.setdefault(a, set()).add(b)
+                    NodeNeighbours.setdefault(b, set()).add(a)
+            ElemEdges[ElemID]=edges
+            for NodeID in Conn:
+                NodeElems.setdefault(NodeID, set()).add(ElemID)
+        ElemNeighbours=dict((ElemID, set([other for other in ElemEdges if other!=ElemID and ElemEdges[other]&edges]))
+                            for ElemID, edges in ElemEdges.items())
+        return NodeElems, ElemNeighbours, NodeNeighbours
+
+    def assertTable(self, table, expected):
+        self.assertEqual(table.getKeys().tolist(), sorted(expected.keys()))
+        self.assertEqual(table.getCounts().tolist(), [len(expected[key]) for key in sorted(expected.keys())])
+        for key, values in expected.items():
+            self.assertEqual(table.getRow(key).tolist(), sorted(values))
+        keys=sorted(expected.keys())[::3]
+        self.assertEqual(table.getRows(keys+[-5]).tolist(), sorted(set().union(*[expected[key] for key in keys])))
+        self.assertEqual(len(table.getRow(-5)), 0)
+
+    def testTables(self):
+        deck=self.dynaDeck()
+        for columnar in (False, True):
+            _Mesh=self.Reader.readDynaMesh(deck, columnar)
+            NodeElems, ElemNeighbours, NodeNeighbours = self.bruteForce(_Mesh)
+            self.assertTable(_Mesh.getNodeElems(), NodeElems)
+            self.assertTable(_Mesh.getElemNeighbours(), ElemNeighbours)
+            self.assertTable(_Mesh.getNodeNeighbours(), NodeNeighbours)
+            self.assertTrue(_Mesh.getNodeElems() is _Mesh.getNodeElems())
+
+    def testParts(self):
+        _Mesh=self.Reader.readDynaMesh(self.dynaDeck())
+        for parts in ([2], [1, 3]):
+            NodeElems, ElemNeighbours, NodeNeighbours = self.bruteForce(_Mesh, parts)
+            self.assertTable(_Mesh.getNodeElems(parts), NodeElems)
+            self.assertTable(_Mesh.getElemNeighbours(parts), ElemNeighbours)
+            self.assertTable(_Mesh.getNodeNeighbours(parts), NodeNeighbours)
+        self.assertTrue(_Mesh.getNodeElems(2) is _Mesh.getNodeElems([2]))
+
+    def testUpdatedElements(self):
+        # Added elements are part of the tables built afterwards
+        _Mesh=self.Reader.readDynaMesh(self.dynaDeck())
+        _Mesh.getNodeElems()
+        NodeIDs=_Mesh.getNodeTable().getIDs()[:3].tolist()
+        _Mesh.addElem(90001, 1, NodeIDs[0], NodeIDs[1], NodeIDs[2])
+        self.assertTrue(90001 in _Mesh.getNodeElems().getRow(NodeIDs[0]))
+        NodeElems, ElemNeighbours, NodeNeighbours = self.bruteForce(_Mesh)
+        self.assertTable(_Mesh.getElemNeighbours(), ElemNeighbours)
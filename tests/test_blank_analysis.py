@@ -0,0 +1,66 @@
+import numpy as np
+import unittest
+from tests.common import Package, module
+
+# Rotation of the test parts out of the global axes
+ROTATION=np.array([[np.cos(0.4), -np.sin(0.4), 0.0], [np.sin(0.4), np.cos(0.4), 0.0], [0.0, 0.0, 1.0]]).dot(
+    np.array([[1.0, 0.0, 0.0], [0.0, np.cos(0.7), -np.sin(0.7)], [0.0, np.sin(0.7), np.cos(0.7)]]))
+OFFSET=np.array([5.0, -3.0, 12.0])
+
+class BlankAnalysisTest(unittest.TestCase):
+
+    def setUp(self):
+        # Part 1: 10 x 4 rectangle of quads, part 2: right triangle with the
+        # legs 6 and 8 of two trias, both rotated and moved
+        self.Mesh=Package.Mesh("", "LS-Dyna")
+        points=[(x, y) for y in xrange(0, 5, 2) for x in xrange(0, 11, 2)]+[(20.0, 0.0), (26.0, 0.0), (20.0, 8.0), (23.0, 0.0)]
+        for NodeID, (x, y) in enumerate(points):
+            x, y, z = ROTATION.dot([x, y, 0.0])+OFFSET
+            self.Mesh.addNode(NodeID+1, x, y, z)
+        ElemID=1
+        for j in xrange(2):
+            for i in xrange(5):
+                n1=j*6+i+1
+                self.Mesh.addElem(ElemID, 1, n1, n1+1, n1+7, n1+6)
+                ElemID=ElemID+1
+        self.Mesh.addElem(ElemID, 2, 19, 22, 21)
+        self.Mesh.addElem(ElemID+1, 2, 22, 20, 21)
+        for PartID in (1, 2):
+            self.Mesh.addPart(PartID, "Part", 1, 1)
+        self.Mesh.addProp(1, 1.5)
+        self.Mesh.addMat(1, 7.85E-9, 210000.0)
+
+    def testOrientedBounds(self):
+        bounds=self.Mesh.getOrientedBounds(1)
+        self.assertTrue(np.allclose(bounds['Extents'], [10.0, 4.0, 0.0], atol=1e-9))
+        self.assertTrue(np.isclose(bounds['Area'], 40.0))
+        self.assertTrue(np.allclose(bounds['Center'], ROTATION.dot([5.0, 2.0, 0.0])+OFFSET))
+        # Length along the rotated x axis, normal along the rotated z axis
+        self.assertTrue(np.isclose(abs(bounds['Axes'][0].dot(ROTATION[:, 0])), 1.0))
+        self.assertTrue(np.isclose(abs(bounds['Axes'][2].dot(ROTATION[:, 2])), 1.0))
+        self.assertTrue(np.allclose(bounds['Axes'].dot(bounds['Axes'].T), np.eye(3)))
+        self.assertTrue(np.isclose(self.Mesh.getOrientedBounds(2)['Area'], 48.0))
+        self.assertRaises(KeyError, self.Mesh.getOrientedBounds, 9)
+
+    def testAnalyzeParts(self):
+        result=module("BlankAnalysis").analyzeParts(self.Mesh)
+        self.assertEqual(result['PartID'].tolist(), [1, 2])
+        self.assertTrue(np.allclose(result['PartArea'], [40.0, 24.0]))
+        self.assertTrue(np.allclose(result['HullArea'], [40.0, 24.0]))
+        self.assertTrue(np.allclose(result['BlankArea'], [40.0, 48.0]))
+        self.assertTrue(np.allclose(result['Scrap'], [0.0, 24.0], atol=1e-9))
+        self.assertTrue(np.allclose(result['Utilization'], [1.0, 0.5]))
+        self.assertTrue(np.allclose([result['BlankLength'][0], result['BlankWidth'][0]], [10.0, 4.0]))
+        self.assertTrue((result['BlankLength']>=result['BlankWidth']).all())
+
+    def testAnglesAndMargin(self):
+        BlankAnalysis=module("BlankAnalysis")
+        exact=BlankAnalysis.analyzePart(self.Mesh, 1)
+        sampled=BlankAnalysis.analyzePart(self.Mesh, 1, angles=np.linspace(0.0, np.pi, 721))
+        self.assertTrue(sampled['BlankArea']>=exact['BlankArea']-1e-9)
+        self.assertTrue(np.isclose(sampled['BlankArea'], exact['BlankArea'], rtol=1e-3))
+        single=BlankAnalysis.analyzePart(self.Mesh, 1, angles=[exact['BlankAngle']+np.pi/4])
+        self.assertTrue(single['BlankArea']>exact['BlankArea'])
+        margin=BlankAnalysis.analyzePart(self.Mesh, 1, margin=1.0)
+        self.assertTrue(np.isclose(margin['BlankArea'], 12.0*6.0))
+        self.assertRaises(KeyError, BlankAnalysis.analyzeParts, self.Mesh, [9])
@@ -0,0 +1,92 @@
+import numpy as np
+from tests.common import DeckTestCase
+
+# Small hand written deck in the fixed width layout of the line reader
+DECK="""*KEYWORD
+$ comment
+*NODE
+       1             0.0             0.0             0.0
+       2             1.0             0.0             0.0
+       3             1.0             1.0             0.0
+       4             0.0             1.0             0.0
+       5             2.0             0.0             0.0
+*ELEMENT_SHELL
+       1       1       1       2       3       4
+       2       1       2       5       3       3
+*PART
+Part 1
+         1         1      1001
+*SECTION_SHELL
+         1
+     1.000
+*MAT_PIECEWISE_LINEAR_PLASTICITY
+      1001 7.850e-09  210000.0
+*END
+"""
+
+class BlockReaderTest(DeckTestCase):
+
+    def testDynaSameAsLineReader(self):
+        deck=self.dynaDeck()
+        reference=self.Reader.readDynaMesh(deck, engine="line")
+        for columnar in (False, True):
+            for mapped in (True, False):
+                _Mesh=self.Reader.readDynaMesh(deck, columnar, mapped=mapped)
+                self.assertSameMesh(reference, _Mesh)
+                self.assertSameMassProperties(reference, _Mesh)
+
+    def testRadiossSameAsLineReader(self):
+        deck=self.radiossDeck()
+        reference=self.Reader.readRadiossMesh(deck, engine="line")
+        for columnar in (False, True):
+            for mapped in (True, False):
+                _Mesh=self.Reader.readRadiossMesh(deck, columnar, mapped=mapped)
+                self.assertSameMesh(reference, _Mesh)
+                self.assertSameMassProperties(reference, _Mesh)
+
+    def testCrlfDeck(self):
+        reference=self.Reader.readDynaMesh(self.writeFile("deck.k", DECK), engine="line")
+        _Mesh=self.Reader.readDynaMesh(self.writeFile("crlf.k", DECK.replace("\n", "\r\n")))
+        self.assertSameMesh(reference, _Mesh)
+
+    def testBlankLinesInEntityBlocks(self):
+        # Blank lines are no node or element 0
+        reference=self.Reader.readDynaMesh(self.writeFile("deck.k", DECK), engine="line")
+        deck=DECK.replace("*ELEMENT_SHELL\n", "        \n*ELEMENT_SHELL\n        \t\n").replace("*PART\n", "   \n*PART\n")
+        for mapped in (True, False):
+            _Mesh=self.Reader.readDynaMesh(self.writeFile("blank.k", deck), mapped=mapped)
+            self.assertSameMesh(reference, _Mesh)
+            self.assertFalse(0 in _Mesh.getNodeTable().getIDs())
+            self.assertFalse(0 in _Mesh.getElemTable().getIDs())
+
+    def testBlankTitle(self):
+        # A blank title line is a card of *PART
+        deck=DECK.replace("Part 1\n", "     \n")
+        for engine in ("line", "block"):
+            _Mesh=self.Reader.readDynaMesh(self.writeFile("title.k", deck), engine=engine)
+            self.assertEqual(_Mesh.Partlist[1][1:], [1, 1001])
+            self.assertEqual(_Mesh.Partlist[1][0].strip(), "")
+
+    def testLowerCaseKeywords(self):
+        reference=self.Reader.readDynaMesh(self.writeFile("deck.k", DECK))
+        _Mesh=self.Reader.readDynaMesh(self.writeFile("lower.k", DECK.replace("*NODE", "*node").replace("*ELEMENT_SHELL", "*element_shell")))
+        self.assertSameMesh(reference, _Mesh)
+
+    def testFormatFlags(self):
+        # Long (+) and large ID (%) format blocks are rejected, "-" is the standard format
+        reference=self.Reader.readDynaMesh(self.writeFile("deck.k", DECK))
+        _Mesh=self.Reader.readDynaMesh(self.writeFile("standard.k", DECK.replace("*NODE\n", "*NODE -\n")))
+        self.assertSameMesh(reference, _Mesh)
+        for flag in (" +", " %", "+"):
+            deck=self.writeFile("long.k", DECK.replace("*NODE\n", "*NODE"+flag+"\n"))
+            self.assertRaises(ValueError, self.Reader.readDynaMesh, deck)
+            self.assertRaises(ValueError, self.Reader.readDynaMesh, deck, parts=[1])
+            self.assertRaises(ValueError, list, self.Reader.iterDynaMesh(deck))
+
+    def testUnknownEngine(self):
+        deck=self.writeFile("deck.k", DECK)
+        radioss=self.radiossDeck()
+        for engine in ("lines", "Block", None):
+            self.assertRaises(ValueError, self.Reader.readDynaMesh, deck, engine=engine)
+            self.assertRaises(ValueError, self.Reader.readDynaMesh, deck, engine=engine, cache=True)
+            self.assertRaises(ValueError, self.Reader.readRadiossMesh, radioss, engine=engine)
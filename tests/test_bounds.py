@@ -0,0 +1,67 @@
+import numpy as np
+from tests.common import DeckTestCase
+
+class BoundsTest(DeckTestCase):
+
+    def bruteForce(self, _Mesh):
+        # Element and part boxes from the node coordinates of every element
+        Nodes=_Mesh.getNodeTable()
+        Elems=_Mesh.getElemTable()
+        Corners=Nodes.getCoords()[Nodes.getRows(Elems.getConn())]
+        Parts={}
+        for PartID, corners in zip(Elems.getPartIDs().tolist(), Corners):
+            Parts.setdefault(PartID, []).append(corners)
+        Parts=dict((PartID, (np.min(corners, axis=(0, 1)), np.max(corners, axis=(0, 1)))) for PartID, corners in Parts.items())
+        return Corners.min(axis=1), Corners.max(axis=1), Parts
+
+    def assertBounds(self, _Mesh):
+        Lower, Upper, Parts = self.bruteForce(_Mesh)
+        ElemLower, ElemUpper = _Mesh.getElemBounds()
+        self.assertTrue(np.array_equal(ElemLower, Lower))
+        self.assertTrue(np.array_equal(ElemUpper, Upper))
+        for PartID, (lower, upper) in Parts.items():
+            self.assertEqual(_Mesh.getPartBounds(PartID), [lower[0], upper[0], lower[1], upper[1], lower[2], upper[2]])
+        Coords=_Mesh.getNodeTable().getCoords()
+        self.assertEqual(_Mesh.getRectangleBounds(), [Coords[:, 0].min(), Coords[:, 0].max(), Coords[:, 1].min(),
+                                                      Coords[:, 1].max(), Coords[:, 2].min(), Coords[:, 2].max()])
+
+    def testBounds(self):
+        deck=self.dynaDeck()
+        for columnar in (False, True):
+            self.assertBounds(self.Reader.readDynaMesh(deck, columnar))
+
+    def testUpdateBounds(self):
+        # Boxes updated by setNodes equal boxes recomputed from scratch
+        deck=self.dynaDeck()
+        for columnar in (False, True):
+            _Mesh=self.Reader.readDynaMesh(deck, columnar)
+            _Mesh.getBounds()
+            NodeIDs=_Mesh.getNodeTable().getIDs()
+            Coords=_Mesh.getNodeTable().getCoords()
+            # one node inside the mesh box, one beyond it and one boundary node moved inwards
+            inner=np.argsort(np.abs(Coords-Coords.mean(axis=0)).sum(axis=1))[0]
+            outer=np.argmax(Coords[:, 0])
+            _Mesh.setNodes(NodeIDs[[inner]], Coords[[inner]]+[0.3, -0.2, 0.1])
+            _Mesh.setNodes(NodeIDs[[0]], Coords[[0]]+[-50.0, 0.0, 20.0])
+            _Mesh.setNodes(NodeIDs[[outer]], Coords[[outer]]-[5.0, 0.0, 0.0])
+            Bounds=dict((key, value.copy()) for key, value in _Mesh.getBounds().items())
+            _Mesh.Bounds=None
+            for key, value in _Mesh.getBounds().items():
+                self.assertTrue(np.array_equal(Bounds[key], value), key)
+            self.assertBounds(_Mesh)
+
+    def testMissingNodes(self):
+        # Elements with missing nodes do not break the mesh box and are
+        # skipped by the element and part boxes
+        _Mesh=self.Reader.readDynaMesh(self.dynaDeck())
+        _Mesh.Elemlist[999999]=[1, 1, 2, 3, 888888]
+        _Mesh.getRectangleBounds()
+        _Mesh=self.Reader.readDynaMesh(self.dynaDeck())
+        reference=_Mesh.getRectangleBounds()
+        PartBounds=_Mesh.getPartBounds(1)
+        _Mesh.Elemlist[999999]=[1, 1, 2, 3, 888888]
+        _Mesh.updateArrays()
+        self.assertEqual(_Mesh.getRectangleBounds(), reference)
+        self.assertEqual(_Mesh.getPartBounds(1), PartBounds)
+        row=_Mesh.getElemTable().getRows(np.array([999999]))
+        self.assertTrue(np.isnan(_Mesh.getElemBounds(row)[0]).all())
@@ -0,0 +1,69 @@
+import numpy as np
+from tests.common import DeckTestCase
+
+class BulkWriterTest(DeckTestCase):
+
+    def write(self, _Mesh, engine):
+        # Written deck without the Date/Time and User header lines
+        file=self.path(engine+".k")
+        self.Reader.writeDynaMesh(_Mesh, file, engine)
+        lines=self.readFile(file).splitlines(True)
+        return "".join(lines[:1]+lines[3:])
+
+    def testSameAsLineWriter(self):
+        deck=self.dynaDeck(nparts=4, trbparts=(2,))
+        for columnar in (False, True):
+            # Part 1 starts the *ELEMENT_SHELL block after a comment line
+            for parts in ([], [1], [1, 3], [4]):
+                _Mesh=self.Reader.readDynaMesh(deck, columnar)
+                Nodes=_Mesh.getNodeTable()
+                _Mesh.setNodalThicknesses(Nodes.getIDs(), 1.0+0.01*(Nodes.getIDs()%7))
+                _Mesh.setNode(int(Nodes.getIDs()[3]), 1.5, -2.25, 3.0)
+                _Mesh.NUTProps=parts
+                self.assertEqual(self.write(_Mesh, "block"), self.write(_Mesh, "line"))
+
+    def testCommentLinesBeforeThicknessBlock(self):
+        deck=self.dynaDeck(nparts=2, trbparts=())
+        _Mesh=self.Reader.readDynaMesh(deck)
+        _Mesh.setNodalThicknesses(_Mesh.getNodeTable().getIDs(), np.full(len(_Mesh.Nodelist), 1.2))
+        _Mesh.NUTProps=[1]
+        text=self.write(_Mesh, "block")
+        self.assertTrue("*ELEMENT_SHELL\n$#   eid     pid      n1      n2      n3      n4\n*ELEMENT_SHELL_THICKNESS\n" in text)
+
+    def testLowercaseKeywords(self):
+        # Keywords are matched like the readers match them
+        deck=self.dynaDeck(nparts=2)
+        deck=self.writeFile("lower.k", self.readFile(deck).replace("*NODE\n", "*node\n"))
+        _Mesh=self.Reader.readDynaMesh(deck)
+        NodeID=int(_Mesh.getNodeTable().getIDs()[0])
+        _Mesh.setNode(NodeID, 1.5, -2.25, 3.0)
+        self.Reader.writeDynaMesh(_Mesh, self.path("out.k"))
+        written=self.Reader.readDynaMesh(self.path("out.k"))
+        self.assertSameMesh(_Mesh, written)
+
+    def testCachesKept(self):
+        deck=self.dynaDeck(nparts=2)
+        _Mesh=self.Reader.readDynaMesh(deck)
+        Nodes=_Mesh.getNodeTable()
+        Elems=_Mesh.getElemTable()
+        thicknesses=_Mesh.getElemThicknesses()
+        self.Reader.writeDynaMesh(_Mesh, self.path("out.k"))
+        self.assertTrue(_Mesh.getNodeTable() is Nodes)
+        self.assertTrue(_Mesh.getElemTable() is Elems)
+        self.assertTrue(_Mesh.getElemThicknesses() is thicknesses)
+
+    def testModifiedNodelist(self):
+        # Direct Nodelist changes are written without updateArrays
+        _Mesh=self.Reader.readDynaMesh(self.dynaDeck(nparts=2))
+        _Mesh.getNodeTable()
+        NodeID=sorted(_Mesh.Nodelist.keys())[0]
+        _Mesh.Nodelist[NodeID]=[4.0, 5.0, 6.0]
+        self.Reader.writeDynaMesh(_Mesh, self.path("out.k"))
+        written=self.Reader.readDynaMesh(self.path("out.k"))
+        self.assertTrue(np.allclose(written.Nodelist[NodeID], [4.0, 5.0, 6.0]))
+
+    def testNodesWithoutNodalThickness(self):
+        # Both writers use 0.0 for nodes without nodal thickness
+        _Mesh=self.Reader.readDynaMesh(self.dynaDeck(nparts=2, trbparts=()))
+        _Mesh.NUTProps=[1]
+        self.assertEqual(self.write(_Mesh, "block"), self.write(_Mesh, "line"))
@@ -0,0 +1,80 @@
+import cPickle
+import numpy as np
+import os
+import time
+from tests.common import DeckTestCase, module
+
+Unpickled=[]
+
+def unpickled():
+    Unpickled.append(True)
+
+class Payload(object):
+
+    # Calls unpickled when it is unpickled
+    def __reduce__(self):
+        return (unpickled, ())
+
+class CacheTest(DeckTestCase):
+
+    def testDyna(self):
+        deck=self.dynaDeck()
+        reference=self.Reader.readDynaMesh(deck)
+        for columnar in (False, True):
+            first=self.Reader.readDynaMesh(deck, columnar, cache=True)
+            self.assertTrue(os.path.isfile(module("MeshCache").cacheFile(deck)))
+            cached=self.Reader.readDynaMesh(deck, columnar, cache=True)
+            self.assertEqual(cached.isColumnar(), columnar)
+            self.assertSameMesh(reference, first)
+            self.assertSameMesh(reference, cached)
+            self.assertSameMassProperties(reference, cached)
+
+    def testRadioss(self):
+        deck=self.radiossDeck()
+        reference=self.Reader.readRadiossMesh(deck)
+        self.Reader.readRadiossMesh(deck, cache=True)
+        self.assertSameMesh(reference, self.Reader.readRadiossMesh(deck, cache=True))
+
+    def testChangedDeck(self):
+        deck=self.dynaDeck()
+        self.Reader.readDynaMesh(deck, cache=True)
+        self.dynaDeck(nparts=2)
+        os.utime(deck, (time.time()+10, time.time()+10))
+        self.assertSameMesh(self.Reader.readDynaMesh(deck), self.Reader.readDynaMesh(deck, cache=True))
+
+    def testTables(self):
+        # Card tables come back with their types (Radioss property IDs are floats)
+        deck=self.radiossDeck()
+        reference=self.Reader.readRadiossMesh(deck)
+        reference.NUTProps=[2]
+        module("MeshCache").save(reference)
+        cached=self.Reader.readRadiossMesh(deck, cache=True)
+        for name in ('Partlist', 'Matlist', 'Proplist'):
+            table=getattr(reference, name)
+            loaded=getattr(cached, name)
+            self.assertEqual(loaded, table)
+            for ID in table:
+                self.assertEqual([type(value) for value in [ID]+loaded[ID]], [type(value) for value in [ID]+table[ID]])
+        self.assertEqual(cached.NUTProps, [2])
+
+    def testIncludes(self):
+        deck=self.dynaDeck()
+        text=self.readFile(deck)
+        cards=text.index("*PART\n")
+        self.writeFile("cards.k", "*KEYWORD\n"+text[cards:])
+        master=self.writeFile("master.k", text[:cards]+"*INCLUDE\ncards.k\n*END\n")
+        reference=self.Reader.readDynaMesh(master, cache=True)
+        cached=self.Reader.readDynaMesh(master, cache=True)
+        self.assertSameMesh(reference, cached)
+        self.assertEqual(cached.Includes, reference.Includes)
+        self.assertEqual(cached.getSourceFile("Parts", 1), self.path("cards.k"))
+        self.assertEqual(cached.getSourceFile("Nodes", 1), master)
+
+    def testPickledContentIgnored(self):
+        # Pickle bytes in a cache file are never loaded, the deck is read instead
+        deck=self.dynaDeck()
+        payload=np.frombuffer(cPickle.dumps(Payload(), 2), dtype=np.uint8)
+        with open(module("MeshCache").cacheFile(deck), "wb") as f:
+            np.savez(f, Key=payload, Tables=payload)
+        self.assertSameMesh(self.Reader.readDynaMesh(deck), self.Reader.readDynaMesh(deck, cache=True))
+        self.assertEqual(Unpickled, [])
@@ -0,0 +1,41 @@
+import numpy as np
+from tests.common import DeckTestCase
+
+class ColumnarTest(DeckTestCase):
+
+    def testDynaLineReader(self):
+        deck=self.dynaDeck()
+        legacy=self.Reader.readDynaMesh(deck, engine="line")
+        columnar=self.Reader.readDynaMesh(deck, True, engine="line")
+        self.assertFalse(legacy.columnar)
+        self.assertTrue(columnar.columnar)
+        self.assertSameMesh(legacy, columnar)
+        self.assertSameMassProperties(legacy, columnar)
+
+    def testRadiossLineReader(self):
+        deck=self.radiossDeck()
+        legacy=self.Reader.readRadiossMesh(deck, engine="line")
+        columnar=self.Reader.readRadiossMesh(deck, True, engine="line")
+        self.assertSameMesh(legacy, columnar)
+        self.assertSameMassProperties(legacy, columnar)
+
+    def testDictionaryInterface(self):
+        # Nodelist/Elemlist of the columnar mesh behave like the dictionaries
+        deck=self.dynaDeck()
+        legacy=self.Reader.readDynaMesh(deck, engine="line")
+        columnar=self.Reader.readDynaMesh(deck, True, engine="line")
+        self.assertEqual(len(legacy.Nodelist), len(columnar.Nodelist))
+        for NodeID in legacy.Nodelist.keys():
+            self.assertEqual(legacy.Nodelist[NodeID], columnar.Nodelist[NodeID])
+        for ElemID in legacy.Elemlist.keys():
+            self.assertEqual(legacy.Elemlist[ElemID], columnar.Elemlist[ElemID])
+
+    def testAddMethods(self):
+        deck=self.dynaDeck()
+        for _Mesh in (self.Reader.readDynaMesh(deck, engine="line"), self.Reader.readDynaMesh(deck, True, engine="line")):
+            _Mesh.addNode(9001, 1.0, 2.0, 3.0)
+            _Mesh.addNode(9002, 2.0, 2.0, 3.0)
+            _Mesh.addNode(9003, 2.0, 3.0, 3.0)
+            _Mesh.addElem(9001, 1, 9001, 9002, 9003)
+            self.assertEqual(list(_Mesh.getNodeTable().getCoords()[_Mesh.getNodeTable().getRows([9002])][0]), [2.0, 2.0, 3.0])
+            self.assertTrue(np.isclose(_Mesh.getAreaByElemID(9001), 0.5))
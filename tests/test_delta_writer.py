@@ -0,0 +1,68 @@
+import numpy as np
+from tests.common import DeckTestCase
+
+class DeltaWriterTest(DeckTestCase):
+
+    def testUnchangedMesh(self):
+        # Nothing changed: the source deck after the header lines
+        deck=self.dynaDeck()
+        _Mesh=self.Reader.readDynaMesh(deck)
+        self.Reader.writeDynaMesh(_Mesh, self.path("out.k"), delta=True)
+        lines=self.readFile(self.path("out.k")).splitlines(True)
+        self.assertEqual("".join(lines[3:]), self.readFile(deck))
+
+    def testDynaEdits(self):
+        deck=self.dynaDeck(nparts=3, trbparts=(2,))
+        for columnar in (False, True):
+            _Mesh=self.Reader.readDynaMesh(deck, columnar)
+            Elems=_Mesh.getElemTable()
+            NodeIDs=_Mesh.getNodeTable().getIDs()
+            _Mesh.setNode(int(NodeIDs[0]), 1.5, -2.25, 3.0)
+            _Mesh.setNode(int(NodeIDs[-1]), -7.0, 8.5, 0.125)
+            for PartID in (1, 2):
+                row=np.flatnonzero(Elems.getPartIDs()==PartID)[0]
+                Conn=Elems.getConn()[row].tolist()
+                _Mesh.setElem(int(Elems.getIDs()[row]), PartID, Conn[1], Conn[2], Conn[3], Conn[0])
+            TRBNodes=np.unique(Elems.getConn()[Elems.getPartIDs()==2])[:5]
+            _Mesh.setNodalThicknesses(TRBNodes, np.full(len(TRBNodes), 1.75))
+            # A second write only has to look at the cached line tables
+            for name in ("first.k", "second.k"):
+                self.Reader.writeDynaMesh(_Mesh, self.path(name), delta=True)
+                self.assertSameMesh(_Mesh, self.Reader.readDynaMesh(self.path(name)))
+
+    def testSameAsFullWrite(self):
+        # Re-read delta and full writes of the same edits agree
+        _Mesh=self.Reader.readDynaMesh(self.dynaDeck())
+        NodeIDs=_Mesh.getNodeTable().getIDs()
+        _Mesh.setNodes(NodeIDs[::7], _Mesh.getNodeTable().getCoords()[::7]+0.5)
+        self.Reader.writeDynaMesh(_Mesh, self.path("delta.k"), delta=True)
+        self.Reader.writeDynaMesh(_Mesh, self.path("full.k"))
+        self.assertSameMesh(self.Reader.readDynaMesh(self.path("delta.k")), self.Reader.readDynaMesh(self.path("full.k")))
+
+    def testRadiossEdits(self):
+        deck=self.radiossDeck(nparts=3, thickparts=(2,))
+        _Mesh=self.Reader.readRadiossMesh(deck)
+        Elems=_Mesh.getElemTable()
+        _Mesh.setNode(int(_Mesh.getNodeTable().getIDs()[2]), 1.5, -2.25, 3.0)
+        row=np.flatnonzero((Elems.getPartIDs()==1)&(Elems.getNumNodes()==4))[0]
+        Conn=Elems.getConn()[row].tolist()
+        _Mesh.setElem(int(Elems.getIDs()[row]), 1, Conn[1], Conn[2], Conn[3], Conn[0])
+        row=np.flatnonzero((Elems.getPartIDs()==1)&(Elems.getNumNodes()==3))[0]
+        Conn=Elems.getConn()[row].tolist()
+        _Mesh.setElem(int(Elems.getIDs()[row]), 1, Conn[1], Conn[2], Conn[0])
+        ElemIDs=Elems.getIDs()[Elems.getPartIDs()==2][:4]
+        _Mesh.setElementalThicknesses(ElemIDs, np.full(len(ElemIDs), 1.5))
+        self.Reader.writeRadiossMesh(_Mesh, self.path("out.rad"), delta=True)
+        self.assertSameMesh(_Mesh, self.Reader.readRadiossMesh(self.path("out.rad")))
+
+    def testNodesWithoutNodalThickness(self):
+        # A TRB element moved onto nodes without nodal thickness gets 0.0 cards
+        _Mesh=self.Reader.readDynaMesh(self.dynaDeck(nparts=2, trbparts=(2,)))
+        Elems=_Mesh.getElemTable()
+        ElemID=int(Elems.getIDs()[Elems.getPartIDs()==2][0])
+        Conn=Elems.getConn()[(Elems.getPartIDs()==1)&(Elems.getNumNodes()==4)][0].tolist()
+        _Mesh.setElem(ElemID, 2, *Conn)
+        self.Reader.writeDynaMesh(_Mesh, self.path("out.k"), delta=True)
+        written=self.Reader.readDynaMesh(self.path("out.k"))
+        self.assertEqual(written.Elemlist[ElemID], [2]+Conn)
+        self.assertEqual([written.getNodalThickness(NodeID) for NodeID in Conn], [0.0]*4)
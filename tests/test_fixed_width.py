@@ -0,0 +1,30 @@
+import numpy as np
+from tests.common import DeckTestCase, module
+
+class FixedWidthTest(DeckTestCase):
+
+    def testOneLineBlockWithBlankFields(self):
+        # A single line is viewed in place in the memory map, the blank fields
+        # must not be filled in there
+        text="*KEYWORD\n*NODE\n%8i%16s%16s%16s\n*END\n" % (1, "", "1.0", "")
+        deck=self.writeFile("node.k", text)
+        for mapped in (True, False):
+            _Mesh=self.Reader.readDynaMesh(deck, mapped=mapped)
+            self.assertEqual(_Mesh.Nodelist[1], [0.0, 1.0, 0.0])
+        self.assertEqual(self.readFile(deck), text)
+
+    def testOneLineRadiossBlocks(self):
+        text="#RADIOSS STARTER\n/NODE\n%10i%20s%20s%20s\n/SH3N/1\n%10i%10i%10i%10i\n/END\n" % (1, "", "2.0", "", 1, 1, 1, 1)
+        deck=self.writeFile("node.rad", text)
+        for mapped in (True, False):
+            _Mesh=self.Reader.readRadiossMesh(deck, mapped=mapped)
+            self.assertEqual(_Mesh.Nodelist[1], [0.0, 2.0, 0.0])
+            self.assertEqual(_Mesh.Elemlist[1], [1, 1, 1, 1])
+
+    def testFieldStrings(self):
+        FixedWidth=module("FixedWidth")
+        data=np.frombuffer("   1.5        \n", dtype=np.uint8)
+        chars=FixedWidth.charMatrix(data, np.array([0]), np.array([14]), 14)
+        self.assertEqual(FixedWidth.parseFloats(chars[:, 0:7]).tolist(), [1.5])
+        self.assertEqual(FixedWidth.parseFloats(chars[:, 7:14]).tolist(), [0.0])
+        self.assertEqual(FixedWidth.parseInts(chars[:, 7:14]).tolist(), [0])
@@ -0,0 +1,38 @@
+from tests.common import DeckTestCase
+
+class IncludeReaderTest(DeckTestCase):
+
+    def includeDeck(self):
+        # The synthetic deck split into a master file with the nodes and the
+        # cards and an include file with the shells
+        text=self.readFile(self.dynaDeck(nparts=4, trbparts=(2,)))
+        shells=text.index("*ELEMENT_SHELL\n")
+        cards=text.index("*PART\n")
+        self.writeFile("shells.k", "*KEYWORD\n"+text[shells:cards]+"*END\n")
+        return self.writeFile("master.k", text[:shells]+"*INCLUDE\nshells.k\n"+text[cards:])
+
+    def testSameAsSingleFile(self):
+        master=self.includeDeck()
+        full=self.Reader.readDynaMesh(self.path("deck.k"))
+        for workers in (1, 2):
+            _Mesh=self.Reader.readDynaMesh(master, True, workers=workers)
+            self.assertSameMesh(full, _Mesh)
+            self.assertEqual(len(_Mesh.Includes), 2)
+
+    def testParts(self):
+        # The shells of the include file with their nodes from the master file
+        master=self.includeDeck()
+        full=self.Reader.readDynaMesh(self.path("deck.k"))
+        for parts in ([1], [2, 4]):
+            for columnar in (False, True):
+                _Mesh=self.Reader.readDynaMesh(master, columnar, parts=parts)
+                self.assertParts(full, _Mesh, parts)
+                self.assertEqual(len(_Mesh.Includes), 2)
+
+    def testNotMapped(self):
+        master=self.includeDeck()
+        full=self.Reader.readDynaMesh(self.path("deck.k"))
+        self.disableMap()
+        for workers in (1, 2):
+            self.assertSameMesh(full, self.Reader.readDynaMesh(master, workers=workers, mapped=False))
+        self.assertParts(full, self.Reader.readDynaMesh(master, parts=[2], mapped=False), [2])
@@ -0,0 +1,61 @@
+import numpy as np
+from tests.common import DeckTestCase, Package
+
+class InitObjectsTest(DeckTestCase):
+
+    def assertParts(self, _Mesh, PartIDs):
+        # Part objects hold exactly the elements of their part with their
+        # nodes, element type and resolved thickness
+        Elems=_Mesh.getElemTable()
+        thick=_Mesh.getElemThicknesses()
+        for PartID in PartIDs:
+            part=_Mesh.PartObjList[PartID]
+            rows=Elems.getPartRows(PartID)
+            self.assertEqual(sorted(part.getElemlist().keys()), sorted(Elems.getIDs()[rows].tolist()))
+            self.assertEqual(part.getNumElem(), len(rows))
+            for row in rows.tolist():
+                elem=part.getElemlist()[int(Elems.getIDs()[row])]
+                NumNodes=int(Elems.getNumNodes()[row])
+                self.assertTrue(isinstance(elem, Package.Tria if NumNodes==3 else Package.Quad))
+                self.assertEqual([node.getID() for node in elem.getNodes()], Elems.getConn()[row][:NumNodes].tolist())
+                self.assertEqual(elem.getPartID(), PartID)
+                self.assertEqual(elem.getThickness(), thick[row])
+            self.assertEqual(sorted(part.getNodelist().keys()), np.unique(Elems.getConn()[rows]).tolist())
+
+    def testInitAllObj(self):
+        deck=self.dynaDeck()
+        for columnar in (False, True):
+            _Mesh=self.Reader.readDynaMesh(deck, columnar)
+            _Mesh.InitAllObj()
+            self.assertEqual(sorted(_Mesh.PartObjList.keys()), sorted(_Mesh.Partlist.keys()))
+            self.assertParts(_Mesh, _Mesh.Partlist.keys())
+            self.assertEqual(len(_Mesh.ElemObjList), len(_Mesh.Elemlist))
+
+    def testInitPartObjs(self):
+        # Initializing parts again replaces their objects, other parts are kept
+        _Mesh=self.Reader.readDynaMesh(self.dynaDeck())
+        parts=_Mesh.InitPartObjs([1, 3])
+        self.assertEqual(sorted(parts.keys()), [1, 3])
+        self.assertParts(_Mesh, [1, 3])
+        first=_Mesh.PartObjList[1]
+        part=_Mesh.InitPartObj(3)
+        self.assertTrue(_Mesh.PartObjList[3] is part)
+        self.assertTrue(_Mesh.PartObjList[1] is first)
+        self.assertEqual(len(_Mesh.ElemObjList), first.getNumElem()+part.getNumElem())
+        self.assertParts(_Mesh, [1, 3])
+
+    def testSameAsPartView(self):
+        deck=self.radiossDeck()
+        _Mesh=self.Reader.readRadiossMesh(deck)
+        _Mesh.InitAllObj()
+        for PartID in _Mesh.Partlist.keys():
+            part=_Mesh.PartObjList[PartID]
+            view=Package.PartView(_Mesh, PartID)
+            self.assertTrue(np.isclose(part.getPartArea(), view.getPartArea(), rtol=1e-12))
+            self.assertTrue(np.isclose(part.getPartVolume(), view.getPartVolume(), rtol=1e-12))
+
+    def testMissingEntities(self):
+        _Mesh=Package.Mesh("", "LS-Dyna")
+        self.assertRaises(Exception, _Mesh.InitAllObj)
+        _Mesh.addNode(1, 0.0, 0.0, 0.0)
+        self.assertRaises(Exception, _Mesh.InitAllObj)
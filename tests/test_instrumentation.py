@@ -0,0 +1,50 @@
+from tests.common import DeckTestCase, Package, module
+
+class InstrumentationTest(DeckTestCase):
+
+    def setUp(self):
+        DeckTestCase.setUp(self)
+        self.minchunk=module("ParallelReader").MINCHUNK
+        module("ParallelReader").MINCHUNK=7
+
+    def tearDown(self):
+        module("ParallelReader").MINCHUNK=self.minchunk
+        DeckTestCase.tearDown(self)
+
+    def sections(self, metrics):
+        # Blocks, lines and bytes per operation and keyword
+        return dict(((section['operation'], section['keyword']), (section['blocks'], section['lines'], section['bytes']))
+                    for section in metrics.getSections())
+
+    def testOperations(self):
+        deck=self.dynaDeck()
+        with Package.Metrics() as metrics:
+            _Mesh=self.Reader.readDynaMesh(deck)
+            _Mesh.InitAllObj()
+            self.Reader.writeDynaMesh(_Mesh, self.path("out.k"))
+        operations=metrics.getOperations()
+        self.assertEqual([data['operation'] for data in operations], ["readDynaMesh", "InitAllObj", "writeDynaMesh"])
+        self.assertEqual(operations[0]['counts']['Elems'], len(_Mesh.Elemlist))
+        self.assertEqual(operations[0]['bytes'], len(self.readFile(deck)))
+        self.assertTrue("Operation" in metrics.report())
+        # Nothing is reported after the collector was disabled
+        self.Reader.readDynaMesh(deck)
+        self.assertEqual(len(metrics.getOperations()), 3)
+
+    def testSections(self):
+        deck=self.dynaDeck()
+        with Package.Metrics() as metrics:
+            _Mesh=self.Reader.readDynaMesh(deck)
+        sections=self.sections(metrics)
+        self.assertEqual(sections[("readDynaMesh", "*NODE")][1], len(_Mesh.Nodelist))
+        self.assertEqual(sections[("readDynaMesh", "*ELEMENT_SHELL")][0], 1)
+
+    def testParallelSections(self):
+        # The workers report the same blocks, lines and bytes as one process
+        for deck, read in ((self.dynaDeck(), self.Reader.readDynaMesh), (self.radiossDeck(), self.Reader.readRadiossMesh)):
+            with Package.Metrics() as sequential:
+                read(deck)
+            with Package.Metrics() as parallel:
+                read(deck, workers=2)
+            self.assertTrue(len(sequential.getSections())>0)
+            self.assertEqual(self.sections(parallel), self.sections(sequential))
@@ -0,0 +1,43 @@
+import numpy as np
+from tests.common import DeckTestCase
+
+class NodeObjectsTest(DeckTestCase):
+
+    def testOneObjectPerNode(self):
+        deck=self.dynaDeck()
+        for columnar in (False, True):
+            _Mesh=self.Reader.readDynaMesh(deck, columnar)
+            _Mesh.InitAllObj()
+            self.assertEqual(sorted(_Mesh.NodeObjList.keys()), np.unique(_Mesh.getElemTable().getConn()).tolist())
+            users={}
+            for part in _Mesh.PartObjList.values():
+                for elem in part.getElemObj():
+                    for node in elem.getNodes():
+                        self.assertTrue(node is _Mesh.NodeObjList[node.getID()])
+                        users.setdefault(node.getID(), set()).add(elem.getID())
+                for NodeID, node in part.getNodelist().items():
+                    self.assertTrue(node is _Mesh.NodeObjList[NodeID])
+            # Nodes of several elements exist once
+            self.assertTrue(max([len(elems) for elems in users.values()])>1)
+            self.assertTrue(_Mesh.getNodeObj(1) is _Mesh.NodeObjList[1])
+
+    def testNodeValues(self):
+        _Mesh=self.Reader.readDynaMesh(self.dynaDeck())
+        _Mesh.InitAllObj()
+        for NodeID, node in _Mesh.NodeObjList.items():
+            self.assertEqual(node.getCoord(), list(_Mesh.Nodelist[NodeID]))
+            self.assertEqual(node.getThickness(), _Mesh.getNodalThickness(NodeID))
+
+    def testChangesSeenByAllElements(self):
+        # Moved nodes and new nodal thicknesses reach every element using them
+        _Mesh=self.Reader.readDynaMesh(self.dynaDeck())
+        _Mesh.InitAllObj()
+        NodeElems=_Mesh.getNodeElems()
+        NodeID=int(NodeElems.getKeys()[np.argmax(NodeElems.getCounts())])
+        _Mesh.setNodes([NodeID], [[1.0, 2.0, 3.0]])
+        _Mesh.setNodalThicknesses([NodeID], [2.5])
+        for ElemID in NodeElems.getRow(NodeID).tolist():
+            node=[node for node in _Mesh.getElemObjByID(ElemID).getNodes() if node.getID()==NodeID][0]
+            self.assertEqual(node.getCoord(), [1.0, 2.0, 3.0])
+            self.assertEqual(node.getThickness(), 2.5)
+            self.assertTrue(np.isclose(_Mesh.getElemObjByID(ElemID).getArea(), _Mesh.getAreaByElemID(ElemID), rtol=1e-12))
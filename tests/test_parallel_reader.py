@@ -0,0 +1,44 @@
+from tests.common import DeckTestCase, module
+from tests.test_block_reader import DECK
+
+class ParallelReaderTest(DeckTestCase):
+
+    def setUp(self):
+        DeckTestCase.setUp(self)
+        # Small tasks, so that every large block is split between the workers
+        self.minchunk=module("ParallelReader").MINCHUNK
+        module("ParallelReader").MINCHUNK=7
+
+    def tearDown(self):
+        module("ParallelReader").MINCHUNK=self.minchunk
+        DeckTestCase.tearDown(self)
+
+    def testDyna(self):
+        deck=self.dynaDeck()
+        reference=self.Reader.readDynaMesh(deck, engine="line")
+        for columnar in (False, True):
+            _Mesh=self.Reader.readDynaMesh(deck, columnar, workers=2)
+            self.assertSameMesh(reference, _Mesh)
+            self.assertSameMassProperties(reference, _Mesh)
+
+    def testRadioss(self):
+        deck=self.radiossDeck()
+        reference=self.Reader.readRadiossMesh(deck, engine="line")
+        for columnar in (False, True):
+            _Mesh=self.Reader.readRadiossMesh(deck, columnar, workers=2)
+            self.assertSameMesh(reference, _Mesh)
+
+    def testBlankLines(self):
+        reference=self.Reader.readDynaMesh(self.writeFile("deck.k", DECK), engine="line")
+        deck=self.writeFile("blank.k", DECK.replace("*ELEMENT_SHELL\n", "        \n*ELEMENT_SHELL\n"))
+        self.assertSameMesh(reference, self.Reader.readDynaMesh(deck, workers=2))
+
+    def testNotMapped(self):
+        # mapped=False reads the deck and the worker ranges into memory
+        deck=self.dynaDeck()
+        reference=self.Reader.readDynaMesh(deck)
+        radioss=self.radiossDeck()
+        RadiossReference=self.Reader.readRadiossMesh(radioss)
+        self.disableMap()
+        self.assertSameMesh(reference, self.Reader.readDynaMesh(deck, workers=2, mapped=False))
+        self.assertSameMesh(RadiossReference, self.Reader.readRadiossMesh(radioss, workers=2, mapped=False))
@@ -0,0 +1,24 @@
+from tests.common import DeckTestCase
+
+class PartialReaderTest(DeckTestCase):
+
+    def testDyna(self):
+        deck=self.dynaDeck(nparts=4, trbparts=(2,))
+        full=self.Reader.readDynaMesh(deck)
+        for parts in ([1], [2, 4], [1, 2, 3, 4]):
+            for columnar in (False, True):
+                self.assertParts(full, self.Reader.readDynaMesh(deck, columnar, parts=parts), parts)
+
+    def testRadioss(self):
+        deck=self.radiossDeck(nparts=4, thickparts=(2,))
+        full=self.Reader.readRadiossMesh(deck)
+        for parts in ([1], [2, 4]):
+            self.assertParts(full, self.Reader.readRadiossMesh(deck, parts=parts), parts)
+
+    def testRadiossShellsWithoutPartID(self):
+        # Shell blocks without part ID are ignored by the full and the partial read
+        deck=self.radiossDeck(nparts=2)
+        text=self.readFile(deck).replace("/PART/1\n", "/SHELL\n         1         1         2         3         4\n/PART/1\n")
+        deck=self.writeFile("noid.rad", text)
+        full=self.Reader.readRadiossMesh(deck)
+        self.assertParts(full, self.Reader.readRadiossMesh(deck, parts=[1]), [1])
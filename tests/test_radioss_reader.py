@@ -0,0 +1,60 @@
+from tests.common import DeckTestCase, module
+
+# Small hand written Radioss deck: a quad with elemental thickness, one
+# with a thickness field which is no number, a tria with thickness
+DECK="""#RADIOSS STARTER
+/BEGIN
+Deck
+/NODE
+#   NODID                   X                   Y                   Z
+         1                 0.0                 0.0                 0.0
+         2                 1.0                 0.0                 0.0
+         3                 1.0                 1.0                 0.0
+         4                 0.0                 1.0                 0.0
+         5                 2.0                 0.0                 0.0
+         6                 2.0                 1.0                 0.0
+/SHELL/1
+#  shell_ID     node_ID1  node_ID2  node_ID3  node_ID4
+         1         1         2         3         4                                            1.2500
+         2         2         5         6         3                                               abc
+/SH3N/1
+         3         1         2         4                                                      0.7500
+/PART/1
+Part 1
+         1      1001
+/PROP/SHELL/1
+Property
+#
+         0         0
+                   0
+                                1.0000
+/MAT/PLAS_TAB/1001
+Material
+        7.850000e-09
+        2.100000e+05
+/END
+"""
+
+class RadiossReaderTest(DeckTestCase):
+
+    def testSameAsLineReader(self):
+        deck=self.writeFile("deck.rad", DECK)
+        reference=self.Reader.readRadiossMesh(deck, engine="line")
+        self.assertEqual(reference.Elementalthickness, {1: 1.25, 3: 0.75})
+        for columnar in (False, True):
+            for workers in (1, 2):
+                _Mesh=self.Reader.readRadiossMesh(deck, columnar, workers=workers)
+                self.assertSameMesh(reference, _Mesh)
+                self.assertSameMassProperties(reference, _Mesh)
+
+    def testCrlfDeck(self):
+        reference=self.Reader.readRadiossMesh(self.writeFile("deck.rad", DECK))
+        _Mesh=self.Reader.readRadiossMesh(self.writeFile("crlf.rad", DECK.replace("\n", "\r\n")))
+        self.assertSameMesh(reference, _Mesh)
+
+    def testSplitKeyword(self):
+        RadiossSections=module("RadiossSections")
+        self.assertEqual(RadiossSections.splitKeyword("/SHELL/3"), ("/SHELL", 3))
+        self.assertEqual(RadiossSections.splitKeyword("/PROP/SHELL/12"), ("/PROP/SHELL", 12))
+        self.assertEqual(RadiossSections.splitKeyword("/NODE"), ("/NODE", None))
+        self.assertEqual(RadiossSections.splitKeyword("/SHELL"), ("/SHELL", None))
@@ -0,0 +1,57 @@
+import numpy as np
+from tests.common import DeckTestCase
+
+class RegistryTest(DeckTestCase):
+
+    def scan(self, _Mesh, ElemID):
+        # Element object of ElemID searched through all Part objects
+        for part in _Mesh.PartObjList.values():
+            if ElemID in part.getElemlist():
+                return part.getElemlist()[ElemID]
+        return None
+
+    def testLookups(self):
+        deck=self.dynaDeck()
+        for columnar in (False, True):
+            _Mesh=self.Reader.readDynaMesh(deck, columnar)
+            ElemIDs=_Mesh.getElemTable().getIDs()
+            NodeIDs=_Mesh.getNodeTable().getIDs()
+            self.assertEqual(_Mesh.getElemObjByID(int(ElemIDs[0])), None)
+            self.assertEqual(_Mesh.getNodeObjByID(int(NodeIDs[0])), None)
+            _Mesh.InitPartObj(2)
+            for ElemID in ElemIDs.tolist():
+                self.assertTrue(_Mesh.getElemObjByID(ElemID) is self.scan(_Mesh, ElemID))
+            PartNodes=_Mesh.PartObjList[2].getNodelist()
+            for NodeID in NodeIDs.tolist():
+                self.assertTrue(_Mesh.getNodeObjByID(NodeID) is PartNodes.get(NodeID))
+            _Mesh.InitAllObj()
+            for ElemID in ElemIDs.tolist():
+                self.assertTrue(_Mesh.getElemObjByID(ElemID) is self.scan(_Mesh, ElemID))
+            self.assertEqual(_Mesh.getElemObjByID(-1), None)
+
+    def testBatchLookups(self):
+        _Mesh=self.Reader.readDynaMesh(self.dynaDeck())
+        _Mesh.InitAllObj()
+        ElemIDs=_Mesh.getElemTable().getIDs()[::5]
+        NodeIDs=_Mesh.getNodeTable().getIDs()[::7]
+        for IDs in (ElemIDs, ElemIDs.tolist()):
+            elems=_Mesh.getElemObjsByID(IDs)
+            self.assertEqual([elem.getID() for elem in elems], ElemIDs.tolist())
+        self.assertEqual([node.getID() for node in _Mesh.getNodeObjsByID(NodeIDs)], NodeIDs.tolist())
+        self.assertEqual(_Mesh.getElemObjsByID(np.array([-1, ElemIDs[0]]))[0], None)
+
+    def testReinitializedPart(self):
+        # Objects of a re-initialized part replace the old ones, elements
+        # moved to another part are not found through their old part
+        _Mesh=self.Reader.readDynaMesh(self.dynaDeck())
+        _Mesh.InitAllObj()
+        ElemIDs=sorted(_Mesh.PartObjList[1].getElemlist().keys())
+        old=_Mesh.getElemObjByID(ElemIDs[0])
+        _Mesh.setElem(ElemIDs[1], 3, *_Mesh.Elemlist[ElemIDs[1]][1:])
+        _Mesh.InitPartObj(1)
+        self.assertFalse(_Mesh.getElemObjByID(ElemIDs[0]) is old)
+        self.assertTrue(_Mesh.getElemObjByID(ElemIDs[0]) is self.scan(_Mesh, ElemIDs[0]))
+        self.assertEqual(_Mesh.getElemObjByID(ElemIDs[1]), None)
+        _Mesh.InitPartObj(3)
+        self.assertEqual(_Mesh.getElemObjByID(ElemIDs[1]).getPartID(), 3)
+        self.assertEqual(len(_Mesh.ElemObjList), len(_Mesh.Elemlist))
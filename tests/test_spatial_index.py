@@ -0,0 +1,69 @@
+import numpy as np
+from tests.common import DeckTestCase, module
+
+class SpatialIndexTest(DeckTestCase):
+
+    def setUp(self):
+        DeckTestCase.setUp(self)
+        self.Mesh=self.Reader.readDynaMesh(self.dynaDeck())
+        self.NodeIDs=self.Mesh.getNodeTable().getIDs()
+        self.Coords=self.Mesh.getNodeTable().getCoords()
+        lower=self.Coords.min(axis=0)
+        upper=self.Coords.max(axis=0)
+        self.points=np.random.RandomState(0).uniform(lower-1.0, upper+1.0, (40, 3))
+
+    def distances(self, point):
+        return np.sqrt(((self.Coords-point)**2).sum(axis=1))
+
+    def testNearest(self):
+        index=self.Mesh.getSpatialIndex()
+        nearest=index.getNearest(self.points)
+        for point, NodeID in zip(self.points, nearest.tolist()):
+            dist=self.distances(point)
+            self.assertTrue(np.isclose(dist[self.NodeIDs==NodeID][0], dist.min()))
+        self.assertEqual(index.getNearest(self.points[0]).tolist(), nearest[:1].tolist())
+        self.assertTrue(np.allclose(index.getDistances(self.points), [self.distances(point).min() for point in self.points]))
+        # No node within maxdist
+        self.assertEqual(index.getNearest(self.Coords.max(axis=0)+100.0, maxdist=1.0).tolist(), [-1])
+
+    def testKNearest(self):
+        index=self.Mesh.getSpatialIndex()
+        for point, IDs in zip(self.points, index.getKNearest(self.points, 3)):
+            dist=self.distances(point)
+            rows=[self.NodeIDs.tolist().index(NodeID) for NodeID in IDs.tolist()]
+            self.assertTrue(np.allclose(dist[rows], np.sort(dist)[:3]))
+        IDs=index.getKNearest(self.points[0], len(self.NodeIDs)+2)
+        self.assertEqual(IDs[0, -2:].tolist(), [-1, -1])
+
+    def testInRadius(self):
+        index=self.Mesh.getSpatialIndex()
+        radius=4.0
+        found=index.getInRadius(self.points, radius)
+        self.assertEqual(len(found), len(self.points))
+        for point, IDs in zip(self.points, found):
+            self.assertEqual(IDs.tolist(), np.sort(self.NodeIDs[self.distances(point)<=radius]).tolist())
+        self.assertTrue(sum([len(IDs) for IDs in found])>0)
+        self.assertEqual(index.getInRadius(self.points[0], radius).tolist(), found[0].tolist())
+
+    def testInBox(self):
+        index=self.Mesh.getSpatialIndex()
+        lower=self.points
+        upper=self.points+[8.0, 5.0, 2.0]
+        found=index.getInBox(lower, upper)
+        for low, up, IDs in zip(lower, upper, found):
+            inside=((self.Coords>=low)&(self.Coords<=up)).all(axis=1)
+            self.assertEqual(IDs.tolist(), np.sort(self.NodeIDs[inside]).tolist())
+        self.assertTrue(sum([len(IDs) for IDs in found])>0)
+        # Bounds are included
+        self.assertTrue(self.NodeIDs[0] in index.getInBox(self.Coords[0], self.Coords[0]))
+
+    def testRebuiltAfterChanges(self):
+        index=self.Mesh.getSpatialIndex()
+        self.assertTrue(self.Mesh.getSpatialIndex() is index)
+        self.Mesh.setNodes(self.NodeIDs[:1], [[1000.0, 1000.0, 1000.0]])
+        self.assertEqual(self.Mesh.getSpatialIndex().getNearest([999.0, 999.0, 999.0]).tolist(), self.NodeIDs[:1].tolist())
+
+    def testEmpty(self):
+        index=module("SpatialIndex").SpatialIndex(np.zeros(0), np.zeros((0, 3)))
+        self.assertEqual(index.getNearest(self.points[:2]).tolist(), [-1, -1])
+        self.assertEqual(len(index.getInRadius(self.points[0], 1.0)), 0)
@@ -0,0 +1,78 @@
+import numpy as np
+from tests.common import DeckTestCase, Package, meshContent, module
+
+class StreamReaderTest(DeckTestCase):
+
+    def setUp(self):
+        DeckTestCase.setUp(self)
+        # Small pieces, so that the large blocks are streamed in several batches
+        self.streambytes=module("FixedWidth").STREAMBYTES
+        module("FixedWidth").STREAMBYTES=300
+
+    def tearDown(self):
+        module("FixedWidth").STREAMBYTES=self.streambytes
+        DeckTestCase.tearDown(self)
+
+    def collect(self, batches):
+        # Mesh built from the batches
+        _Mesh=Package.Mesh("", "", True)
+        count={}
+        for kind, batch in batches:
+            count[kind]=count.get(kind, 0)+1
+            if kind=="Nodes":
+                _Mesh.addNodes(batch['NodeIDs'], batch['Coords'])
+            elif kind=="Shells":
+                _Mesh.addElems(batch['ElemIDs'], batch['PartIDs'], batch['Conn'], batch['NumNodes'])
+                defined=batch['Thickness']!=0.0
+                _Mesh.addElementalThicknesses(batch['ElemIDs'][defined], batch['Thickness'][defined])
+            elif kind=="NodalThickness":
+                _Mesh.addNodalThicknesses(batch['NodalThicknessIDs'], batch['NodalThickness'])
+            elif kind=="ElementalThickness":
+                _Mesh.addElementalThicknesses(batch['ElementalThicknessIDs'], batch['ElementalThickness'])
+            elif kind=="Parts":
+                for PartID, title, PropID, MatID in zip(batch['PartIDs'].tolist(), batch['Titles'], batch['PropIDs'].tolist(), batch['MatIDs'].tolist()):
+                    _Mesh.addPart(PartID, title, PropID, MatID)
+            elif kind=="Materials":
+                for MatID, Rho, E in zip(batch['MatIDs'].tolist(), batch['Rho'].tolist(), batch['E'].tolist()):
+                    _Mesh.addMat(MatID, Rho, E)
+            elif kind=="Properties":
+                for PropID, Thickness in zip(batch['PropIDs'].tolist(), batch['Thickness'].tolist()):
+                    _Mesh.addProp(PropID, Thickness)
+        return _Mesh, count
+
+    def testDyna(self):
+        deck=self.dynaDeck()
+        _Mesh, count = self.collect(self.Reader.iterDynaMesh(deck))
+        self.assertTrue(count["Nodes"]>1 and count["Shells"]>1)
+        self.assertSameMesh(self.Reader.readDynaMesh(deck, engine="line"), _Mesh)
+
+    def testRadioss(self):
+        deck=self.radiossDeck()
+        _Mesh, count = self.collect(self.Reader.iterRadiossMesh(deck))
+        self.assertTrue(count["Nodes"]>1)
+        self.assertSameMesh(self.Reader.readRadiossMesh(deck, engine="line"), _Mesh)
+
+    def testCountNodesInBox(self):
+        deck=self.dynaDeck()
+        Coords=meshContent(self.Reader.readDynaMesh(deck))['Coords']
+        lower=[10.0, 0.0, -1.0]
+        upper=[25.0, 3.0, 1.0]
+        expected=int(((Coords>=lower)&(Coords<=upper)).all(axis=1).sum())
+        self.assertTrue(expected>0)
+        self.assertEqual(module("Reducers").countNodesInBox(self.Reader.iterDynaMesh(deck), lower, upper), expected)
+
+    def testElementalThicknessBatches(self):
+        # Thicknesses of collected shells go into their Shells batch (the last
+        # value of an element wins), the others into an ElementalThickness batch
+        collector=module("BatchCollector").BatchCollector("Radioss")
+        collector.addElems([1, 2, 3], 1, [[1, 2, 3, 4]]*3)
+        collector.addElem(5, 1, 1, 2, 3)
+        collector.addElementalThicknesses([3, 9, 1], [0.5, 0.7, 0.8])
+        collector.addElementalThickness(3, 0.6)
+        collector.addElementalThickness(5, 1.2)
+        batches=collector.getBatches()
+        self.assertEqual([kind for kind, batch in batches], ["Shells", "Shells", "ElementalThickness"])
+        self.assertEqual([batch['Thickness'].tolist() for kind, batch in batches[0:2]], [[0.8, 0.0, 0.6], [1.2]])
+        self.assertEqual(batches[2][1]['ElementalThicknessIDs'].tolist(), [9])
+        self.assertEqual(batches[2][1]['ElementalThickness'].tolist(), [0.7])
+        self.assertEqual(collector.getBatches(), [])
@@ -0,0 +1,73 @@
+import numpy as np
+from tests.common import DeckTestCase, module
+
+class ThicknessTest(DeckTestCase):
+
+    def assertSameMasses(self, _Mesh, batches):
+        # Mesh, stream Reducers, PartView and Part agree on every part
+        props=_Mesh.getMassProperties()
+        reduced=module("Reducers").partMassProperties(batches)
+        self.assertTrue(np.array_equal(props['PartID'], reduced['PartID']))
+        self.assertTrue(np.allclose(props['PartVolume'], reduced['PartVolume'], rtol=1e-12, atol=0.0))
+        self.assertTrue(np.allclose(props['PartMass'], reduced['PartMass'], rtol=1e-12, atol=0.0))
+        for PartID, volume, mass in zip(props['PartID'].tolist(), props['PartVolume'].tolist(), props['PartMass'].tolist()):
+            view=_Mesh.getPartByID(PartID)
+            self.assertFalse(PartID in _Mesh.PartObjList)
+            part=_Mesh.InitPartObj(PartID)
+            for obj in (view, part, _Mesh.getPartByID(PartID)):
+                self.assertAlmostEqual(obj.getPartVolume()/volume, 1.0, places=12)
+                self.assertAlmostEqual(obj.getPartMass()/mass, 1.0, places=12)
+
+    def testDynaNodalThickness(self):
+        # Part 2 is a TRB part with nodal thicknesses of its own
+        deck=self.dynaDeck(nparts=3, trbparts=(2,))
+        _Mesh=self.Reader.readDynaMesh(deck)
+        self.assertTrue(len(_Mesh.Nodalthickness)>0)
+        self.assertSameMasses(_Mesh, self.Reader.iterDynaMesh(deck))
+
+    def testStreamedInPieces(self):
+        # Shells and nodal thicknesses in alternating batches
+        FixedWidth=module("FixedWidth")
+        streambytes=FixedWidth.STREAMBYTES
+        FixedWidth.STREAMBYTES=300
+        try:
+            deck=self.dynaDeck(nparts=3, trbparts=(2, 3))
+            self.assertSameMasses(self.Reader.readDynaMesh(deck), self.Reader.iterDynaMesh(deck))
+        finally:
+            FixedWidth.STREAMBYTES=streambytes
+
+    def testRadiossElementalThickness(self):
+        deck=self.radiossDeck(nparts=3, thickparts=(2,))
+        _Mesh=self.Reader.readRadiossMesh(deck)
+        self.assertTrue(len(_Mesh.Elementalthickness)>0)
+        self.assertSameMasses(_Mesh, self.Reader.iterRadiossMesh(deck))
+
+    def testPrecedence(self):
+        # Elemental before nodal (all nodes > 0) before property
+        _Mesh=self.Reader.readDynaMesh(self.dynaDeck(nparts=2, trbparts=()))
+        Elems=_Mesh.getElemTable()
+        Conn=Elems.getConn()
+        first=Elems.getPartRows(1)[0]
+        second=Elems.getPartRows(2)[0]
+        # No node in common with the other two
+        third=[row for row in Elems.getPartRows(1).tolist() if not np.in1d(Conn[row], Conn[first]).any()][0]
+        NodeIDs=np.unique(Conn[[first, second]])
+        _Mesh.setNodalThicknesses(NodeIDs, np.full(len(NodeIDs), 2.0))
+        _Mesh.setNodalThicknesses(Conn[third, :1], [3.0])
+        _Mesh.setElementalThicknesses([int(Elems.getIDs()[first])], [1.5])
+        thick=_Mesh.getElemThicknesses([first, second, third])
+        self.assertEqual(thick[0], 1.5)
+        self.assertEqual(thick[1], 2.0)
+        self.assertEqual(thick[2], _Mesh.getPartData(1)[2])
+
+    def testElementObjectsFollowChanges(self):
+        # Thickness changes after InitPartObj reach Part like PartView
+        _Mesh=self.Reader.readDynaMesh(self.dynaDeck(nparts=2, trbparts=()))
+        part=_Mesh.InitPartObj(1)
+        ElemIDs=[elem.getID() for elem in part.getElemObj()][:5]
+        _Mesh.setElementalThicknesses(ElemIDs, np.full(len(ElemIDs), 2.5))
+        NodeIDs=np.unique(_Mesh.getElemTable().getConn()[_Mesh.getElemTable().getPartRows(1)][-3:])
+        _Mesh.setNodalThicknesses(NodeIDs, np.full(len(NodeIDs), 1.25))
+        view=module("PartView").PartView(_Mesh, 1)
+        self.assertAlmostEqual(part.getPartVolume()/view.getPartVolume(), 1.0, places=12)
+        self.assertAlmostEqual(part.getPartVolume()/_Mesh.getVolumeByPartID(1), 1.0, places=12)